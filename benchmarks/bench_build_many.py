@@ -0,0 +1,39 @@
+"""
+Measures how `DFTemplate.build_many` scales with the number of worker processes.
+
+Usage: python benchmarks/bench_build_many.py [template_count] [blocks_per_template]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dfpyre import DFTemplate
+from synthetic import make_template
+
+
+def main():
+    template_count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    blocks_per_template = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    templates = [make_template(blocks_per_template, f'bench_{i}') for i in range(template_count)]
+
+    start = time.perf_counter()
+    for template in templates:
+        template.build()
+    serial_time = time.perf_counter() - start
+    print(f'{"serial build()":<20} {serial_time:8.3f} s')
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({w for w in (1, 2, 4, 8, 16, 32) if w < cpu_count} | {cpu_count})
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = DFTemplate.build_many(templates, workers=workers)
+        elapsed = time.perf_counter() - start
+        failed = sum(not r.ok for r in results)
+        print(f'{f"{workers} worker(s)":<20} {elapsed:8.3f} s   speedup {serial_time/elapsed:5.2f}x   failed {failed}')
+
+
+if __name__ == '__main__':
+    main()
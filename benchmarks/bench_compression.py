@@ -0,0 +1,35 @@
+"""
+Compares encoded size against encoding time for each gzip backend and compression level.
+
+Usage: python benchmarks/bench_compression.py [block_count]
+"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dfpyre.util.util import df_encode, GZIP_BACKENDS
+from synthetic import make_template
+
+
+def main():
+    block_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    template = make_template(block_count)
+    json_string = json.dumps({'blocks': [b.build() for b in template.codeblocks]}, separators=(',', ':'))
+    print(f'{block_count} blocks, {len(json_string)} bytes of json')
+
+    for backend in GZIP_BACKENDS:
+        for level in range(1, 10):
+            runs = 5
+            start = time.perf_counter()
+            for _ in range(runs):
+                encoded = df_encode(json_string, level, backend)
+            elapsed = (time.perf_counter() - start) / runs
+            print(f'{backend:<8} level {level}   {elapsed*1000:8.2f} ms   {len(encoded):>9} bytes')
+
+
+if __name__ == '__main__':
+    main()
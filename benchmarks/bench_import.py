@@ -0,0 +1,60 @@
+"""
+Measures the cold import time of `dfpyre`.
+
+Compares imports with and without the actiondump cache, and the cost of
+importing all action classes versus only the ones a script uses.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import statistics
+
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+IMPORT_STATEMENTS = {
+    'import dfpyre': 'import dfpyre',
+    'import 2 classes': 'from dfpyre import PlayerEvent, PlayerAction',
+    'import *': 'from dfpyre import *',
+}
+
+
+def time_import(statement: str, env: dict[str, str], runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], env=env, cwd=REPO_ROOT, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label: str, times: list[float]):
+    print(f'{label:<36} median {statistics.median(times)*1000:8.1f} ms   min {min(times)*1000:8.1f} ms')
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    cache_dir = tempfile.mkdtemp(prefix='dfpyre-bench-')
+    try:
+        base_env = os.environ.copy()
+        base_env['DFPYRE_CACHE_DIR'] = cache_dir
+
+        no_cache_env = base_env.copy()
+        no_cache_env['DFPYRE_NO_CACHE'] = '1'
+        report('without cache', time_import('import dfpyre', no_cache_env, runs))
+
+        report('cache build (first run)', time_import('import dfpyre', base_env, 1))
+        for label, statement in IMPORT_STATEMENTS.items():
+            report(f'with cache, {label}', time_import(statement, base_env, runs))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
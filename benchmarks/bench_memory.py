@@ -0,0 +1,88 @@
+"""
+Measures the memory used by each code item type, compared to the same type with a `__dict__`,
+and the memory and garbage collection time of a synthetic template as a list of codeblocks
+and as a columnar template.
+
+Usage: python benchmarks/bench_memory.py [item_count] [block_count]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dfpyre import *
+from synthetic import make_template
+
+
+# The constructor arguments of the `i`th item of each type
+ITEM_ARGS: dict[type, Callable[[int], tuple]] = {
+    String: lambda i: (f'string {i}',),
+    Text: lambda i: (f'text {i}',),
+    Number: lambda i: (i,),
+    Variable: lambda i: (f'var {i}', 'line'),
+    Location: lambda i: (i, 64, i),
+    Vector: lambda i: (0, 1, i),
+    Sound: lambda i: ('Pling', 1.0 + i),
+    Potion: lambda i: ('Speed', i),
+    GameValue: lambda i: ('Location', f'target {i}'),
+    Parameter: lambda i: (f'param {i}', ParameterType.NUMBER),
+}
+
+
+def measure(make_objects: Callable[[], object]) -> int:
+    """
+    Returns the number of bytes still allocated by `make_objects` once it returns.
+    """
+    tracemalloc.start()
+    objects = make_objects()
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return allocated_bytes
+
+
+def get_item_bytes(item_class: type, item_args: Callable[[int], tuple], item_count: int) -> float:
+    # The arguments are made outside of the measurement, so only the items are counted
+    args = [item_args(i) for i in range(item_count)]
+    return measure(lambda: [item_class(*a) for a in args]) / item_count
+
+
+def get_gc_time(template: DFTemplate) -> float:
+    """
+    Returns the time taken by a full garbage collection while `template` is alive.
+    """
+    start = time.perf_counter()
+    gc.collect()
+    return time.perf_counter() - start
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    block_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    print(f'{"item":<12} {"slots":>10} {"__dict__":>10} {"saved":>8}')
+    for item_class, item_args in ITEM_ARGS.items():
+        dict_item_class = type(item_class.__name__, (item_class,), {})  # Subclass without __slots__, so it has a __dict__
+        slots_bytes = get_item_bytes(item_class, item_args, item_count)
+        dict_bytes = get_item_bytes(dict_item_class, item_args, item_count)
+        print(f'{item_class.__name__:<12} {slots_bytes:8.1f} B {dict_bytes:8.1f} B {1 - slots_bytes/dict_bytes:7.1%}')
+
+    print(f'\n{"template of " + str(block_count) + " blocks":<28} {"memory":>9} {"per block":>11} {"gc time":>10}')
+    template_kinds = {
+        'DFTemplate': lambda: make_template(block_count),
+        'ColumnarTemplate': lambda: make_template(block_count).to_columnar(),
+    }
+    for name, make_objects in template_kinds.items():
+        template_bytes = measure(make_objects)
+        gc_time = get_gc_time(template := make_objects())
+        print(f'{name:<28} {template_bytes / 1e6:6.1f} MB {template_bytes / block_count:8.1f} B {gc_time*1e3:7.1f} ms')
+        del template
+
+
+if __name__ == '__main__':
+    main()
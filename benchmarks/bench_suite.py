@@ -0,0 +1,260 @@
+"""
+Runs the benchmark suite over synthetic templates of 100 to 100k blocks.
+
+Results can be saved as a baseline in `benchmarks/baselines/` and compared
+against later runs, so regressions in any hot path show up.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 100 1000 ...] [--only build from_code ...]
+                                     [--save NAME] [--compare NAME]
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+from dataclasses import dataclass
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dfpyre import *
+from synthetic import make_template
+
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+# Each benchmark is repeated until it has run for this many seconds, within the round limits
+MIN_BENCH_TIME = 1.0
+MAX_ROUNDS = 100
+
+# A result this many times slower than its baseline is reported as a regression
+REGRESSION_THRESHOLD = 1.25
+
+SLICE_TARGET_LENGTH = 50
+
+
+@dataclass
+class BenchmarkCase:
+    run: Callable[[], object]
+    before_round: Callable[[], object]|None = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    make_case: Callable[[int], BenchmarkCase]
+    sized: bool = True
+
+
+def invalidate_all(template: DFTemplate):
+    for codeblock in template.codeblocks:
+        codeblock.invalidate()
+
+
+def bench_build(size: int) -> BenchmarkCase:
+    template = make_template(size)
+    return BenchmarkCase(template.build, lambda: invalidate_all(template))
+
+
+def bench_build_cached(size: int) -> BenchmarkCase:
+    template = make_template(size)
+    template.build()
+    return BenchmarkCase(template.build)
+
+
+def bench_build_columnar(size: int) -> BenchmarkCase:
+    template = make_template(size).to_columnar()
+    return BenchmarkCase(template.build)
+
+
+def bench_structure_hash(size: int) -> BenchmarkCase:
+    template = make_template(size)
+    return BenchmarkCase(template.get_structure_hash, lambda: invalidate_all(template))
+
+
+def bench_from_code(size: int) -> BenchmarkCase:
+    template_code = make_template(size).build()
+    return BenchmarkCase(lambda: DFTemplate.from_code(template_code))
+
+
+def bench_iter_blocks(size: int) -> BenchmarkCase:
+    template_code = make_template(size).build()
+    return BenchmarkCase(lambda: sum(1 for _ in DFTemplate.iter_blocks(template_code)))
+
+
+def bench_generate_script(size: int) -> BenchmarkCase:
+    template = make_template(size)
+    return BenchmarkCase(template.generate_script)
+
+
+def make_sliceable_template(size: int) -> DFTemplate:
+    """
+    Returns a synthetic template without the group of blocks that `make_template` cut off at the end.
+    The slicer rejects a template whose brackets are cut off, so the slice benchmarks end at the last closed bracket.
+    """
+    template = make_template(size)
+    depth = 0
+    end_index = 1
+    for i, codeblock in enumerate(template.codeblocks):
+        if codeblock.type == 'bracket':
+            depth += 1 if codeblock.data['direct'] == 'open' else -1
+            if depth == 0:
+                end_index = i + 1
+    template.codeblocks = template.codeblocks[:end_index]
+    return template
+
+
+def bench_slice_template(size: int) -> BenchmarkCase:
+    template = make_sliceable_template(size)
+    return BenchmarkCase(lambda: template.slice(SLICE_TARGET_LENGTH))
+
+
+def bench_slice_min_functions(size: int) -> BenchmarkCase:
+    template = make_sliceable_template(size)
+    return BenchmarkCase(lambda: template.slice(SLICE_TARGET_LENGTH, 'min_functions'))
+
+
+def bench_codeblock_tags(size: int) -> BenchmarkCase:
+    codeblocks = [
+        PlayerAction.SendMessage('hi', alignment_mode='Centered') if i % 2 else SetVariable.String('$i text', ['a', 'b'], text_value_merging='Add spaces')
+        for i in range(size)
+    ]
+    return BenchmarkCase(lambda: [c.build() for c in codeblocks])
+
+
+def bench_item_format(size: int) -> BenchmarkCase:
+    item_kinds = [
+        lambda i: String(f'string {i}'),
+        lambda i: Text(f'&atext {i}'),
+        lambda i: Number(i),
+        lambda i: Variable(f'var {i}', 'line'),
+        lambda i: Location(i, 64, i),
+        lambda i: Sound('Pling'),
+        lambda i: Vector(0, 1, 0),
+        lambda i: GameValue('Location'),
+        lambda i: Item('diamond', 1 + i % 64),
+    ]
+    items = [item_kinds[i % len(item_kinds)](i) for i in range(size)]
+    return BenchmarkCase(lambda: [item.format(i % 27) for i, item in enumerate(items)])
+
+
+def bench_cold_import(_) -> BenchmarkCase:
+    command = [sys.executable, '-c', 'import dfpyre']
+    return BenchmarkCase(lambda: subprocess.run(command, cwd=REPO_ROOT, check=True))
+
+
+BENCHMARKS = [
+    Benchmark('build', bench_build),
+    Benchmark('build_cached', bench_build_cached),
+    Benchmark('build_columnar', bench_build_columnar),
+    Benchmark('structure_hash', bench_structure_hash),
+    Benchmark('from_code', bench_from_code),
+    Benchmark('iter_blocks', bench_iter_blocks),
+    Benchmark('generate_script', bench_generate_script),
+    Benchmark('slice_template', bench_slice_template),
+    Benchmark('slice_min_functions', bench_slice_min_functions),
+    Benchmark('codeblock_tags', bench_codeblock_tags),
+    Benchmark('item_format', bench_item_format),
+    Benchmark('cold_import', bench_cold_import, sized=False),
+]
+
+
+def time_case(case: BenchmarkCase) -> list[float]:
+    times = []
+    total_time = 0.0
+    while len(times) < MAX_ROUNDS and total_time < MIN_BENCH_TIME:
+        if case.before_round is not None:
+            case.before_round()
+        start = time.perf_counter()
+        case.run()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        total_time += elapsed
+    return times
+
+
+def run_benchmarks(benchmarks: list[Benchmark], sizes: list[int]) -> dict[str, dict[str, float]]:
+    results = {}
+    for benchmark in benchmarks:
+        for size in (sizes if benchmark.sized else [None]):
+            key = f'{benchmark.name}[{size}]' if benchmark.sized else benchmark.name
+            times = time_case(benchmark.make_case(size))
+            results[key] = {'min': min(times), 'median': statistics.median(times), 'rounds': len(times)}
+            print(f'{key:<28} min {format_time(min(times))}   median {format_time(statistics.median(times))}   rounds {len(times)}', flush=True)
+    return results
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f'{seconds*1e6:8.1f} us'
+    if seconds < 1:
+        return f'{seconds*1e3:8.1f} ms'
+    return f'{seconds:8.2f} s '
+
+
+def get_baseline_path(name: str) -> str:
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+def save_baseline(name: str, results: dict[str, dict[str, float]]):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    baseline = {
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(), 'processor': platform.processor()},
+        'results': results,
+    }
+    with open(get_baseline_path(name), 'w') as f:
+        json.dump(baseline, f, indent=2)
+    print(f'Saved baseline to {get_baseline_path(name)}')
+
+
+def compare_baseline(name: str, results: dict[str, dict[str, float]]) -> int:
+    """
+    Prints the change of each result against a baseline.
+
+    :return: The number of regressions.
+    """
+    with open(get_baseline_path(name)) as f:
+        baseline_results = json.load(f)['results']
+
+    regression_count = 0
+    print(f'\nCompared to baseline "{name}" (min times):')
+    for key, result in results.items():
+        baseline_result = baseline_results.get(key)
+        if baseline_result is None:
+            continue
+        ratio = result['min'] / baseline_result['min']
+        is_regression = ratio > REGRESSION_THRESHOLD
+        regression_count += is_regression
+        print(f'{key:<28} {format_time(baseline_result["min"])} -> {format_time(result["min"])}   {ratio:5.2f}x{"   REGRESSION" if is_regression else ""}')
+    return regression_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs the dfpyre benchmark suite.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Template sizes in blocks.')
+    parser.add_argument('--only', nargs='+', choices=[b.name for b in BENCHMARKS], help='Only run these benchmarks.')
+    parser.add_argument('--save', metavar='NAME', help='Save the results as a baseline with this name.')
+    parser.add_argument('--compare', metavar='NAME', help='Compare the results against the baseline with this name.')
+    args = parser.parse_args()
+
+    benchmarks = [b for b in BENCHMARKS if args.only is None or b.name in args.only]
+    results = run_benchmarks(benchmarks, args.sizes)
+    if args.save:
+        save_baseline(args.save, results)
+    if args.compare:
+        regression_count = compare_baseline(args.compare, results)
+        if regression_count:
+            print(f'{regression_count} regression(s) found.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Synthetic templates used by the benchmarks.
+"""
+
+from dfpyre import *
+from dfpyre.util.util import flatten
+
+
+def make_codeblocks(block_count: int) -> list:
+    """
+    Returns a list of roughly `block_count` codeblocks with a mix of
+    actions, conditionals, repeats and item types.
+    """
+    codeblocks = []
+    i = 0
+    while len(codeblocks) < block_count:
+        codeblocks += flatten([
+            SetVariable.Assign(f'$i value{i % 50}', i),
+            PlayerAction.SendMessage(['Hello ', '$i value', Text('&aworld')], alignment_mode='Centered'),
+            IfVariable.Equals(f'$i value{i % 50}', i, codeblocks=[
+                PlayerAction.GiveItems(Item('diamond', 2)),
+                GameAction.SetBlock(Item('stone'), Location(1, 2, 3)),
+            ]),
+            Repeat.Multiple('$i j', 10, codeblocks=[
+                EntityAction.Heal(Number(i)),
+                Control.Wait(1),
+            ]),
+        ])
+        i += 1
+    return codeblocks[:block_count]
+
+
+def make_template(block_count: int, name: str='bench') -> DFTemplate:
+    return Function(name, codeblocks=make_codeblocks(block_count - 1))
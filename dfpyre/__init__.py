@@ -1,3 +1,28 @@
+from typing import TYPE_CHECKING
+from dfpyre.core import template as _template
 from dfpyre.core.template import *
-from dfpyre.export.action_classes import *
-from dfpyre.export.block_functions import *
\ No newline at end of file
+from dfpyre.core import columnar as _columnar
+from dfpyre.core.columnar import *
+from dfpyre.tool import table as _table
+from dfpyre.tool.table import *
+from dfpyre.export import block_functions as _block_functions
+from dfpyre.export.block_functions import *
+from dfpyre.export import action_classes as _action_classes
+
+if TYPE_CHECKING:
+    from dfpyre.export.action_classes import *
+
+# Action classes are only imported when they are first accessed.
+# `from dfpyre import *` still resolves all of them, so import the classes
+# you need by name to get the faster startup.
+__all__ = _template.__all__ + _columnar.__all__ + _table.__all__ + _block_functions.__all__ + _action_classes.__all__
+
+
+def __getattr__(name: str):
+    if name in _action_classes.__all__:
+        return getattr(_action_classes, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,417 @@
+"""
+Runs a directory of pyre scripts and writes the codes of the templates they make into a manifest.
+
+Usage:
+    python -m dfpyre.build SCRIPTS_DIR [-m MANIFEST] [-j WORKERS] [--force]
+
+dfpyre is imported once, then the scripts are run in a pool of worker processes that are forked from
+the main process where possible, so they share the loaded actiondump and action classes.
+Scripts whose source has not changed since the last build are skipped.
+
+The templates of a script are the ones it sends, with `build_and_send`, a CodeClient connection or a
+template item (nothing is actually sent), followed by any templates, or lists of templates, left in its global variables.
+Files starting with an underscore are treated as helper modules and are not run.
+Pyre's settings, and anything a script monkeypatches in dfpyre, are restored after each script.
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import runpy
+import hashlib
+import argparse
+import traceback
+import multiprocessing
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+from dfpyre.util.util import DEFAULT_COMPRESSION_LEVEL
+from dfpyre.util.cache import BuildCache, write_atomic
+from dfpyre.core.template import DFTemplate, set_build_cache, get_build_cache
+from dfpyre.core.items import Item, set_string_conversion, get_string_conversion
+from dfpyre.core.codeclient import CodeClientConnection, AsyncCodeClientConnection
+from dfpyre.core.actiondump import ACTION_DATA
+from dfpyre.export import action_classes
+
+
+__all__ = ['ScriptBuildResult', 'find_scripts', 'run_script', 'build_scripts', 'load_manifest', 'save_manifest']
+
+
+DEFAULT_MANIFEST_PATH = 'templates.json'
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ScriptBuildResult:
+    """
+    The templates made by a single script in `build_scripts`.
+    """
+    script: str  # The path of the script relative to the scripts directory
+    source_hash: str
+    templates: list[dict[str, str]] = field(default_factory=list)  # The name and code of each template
+    run_time: float = 0.0
+    skipped: bool = False
+    error: str | None = None  # Stored as a string, since exceptions are not always picklable
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+    def to_manifest_entry(self) -> dict:
+        entry = {'hash': self.source_hash, 'templates': self.templates}
+        if self.error is not None:
+            entry['error'] = self.error
+        return entry
+
+
+def get_source_hash(script_path: str) -> str:
+    with open(script_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def find_scripts(scripts_dir: str) -> list[str]:
+    """
+    Returns the paths of the scripts in `scripts_dir` relative to it, in sorted order.
+
+    :param str scripts_dir: The directory to search.
+    """
+    scripts = []
+    for dir_path, dir_names, file_names in os.walk(scripts_dir):
+        dir_names[:] = sorted(d for d in dir_names if not d.startswith(('.', '_')))
+        for file_name in sorted(file_names):
+            if file_name.endswith('.py') and not file_name.startswith('_'):
+                relative_path = os.path.relpath(os.path.join(dir_path, file_name), scripts_dir)
+                scripts.append(relative_path.replace(os.sep, '/'))
+    return scripts
+
+
+@contextmanager
+def capture_sent_templates() -> Iterator[list[DFTemplate]]:
+    """
+    Collects the templates a script sends instead of sending them.
+    Every send method of `DFTemplate`, `Item` and the CodeClient connections is replaced, so nothing is sent.
+    Template items are decoded back into templates, and other items are ignored.
+    """
+    sent_templates = []
+
+    def capture_item(item: Item):
+        template_data = item.get_tag('codetemplatedata')
+        if template_data is not None:
+            sent_templates.append(DFTemplate.from_code(json.loads(template_data)['code']))
+
+    def build_and_send(self: DFTemplate, *args, **kwargs) -> int:
+        sent_templates.append(self)
+        return 0
+
+    async def abuild_and_send(self: DFTemplate, *args, **kwargs) -> int:
+        sent_templates.append(self)
+        return 0
+
+    def send_to_minecraft(self: Item, *args, **kwargs) -> int:
+        capture_item(self)
+        return 0
+
+    def do_nothing(self, *args, **kwargs):
+        pass
+
+    def send_item(self, item: Item):
+        capture_item(item)
+
+    def send_template(self, template: DFTemplate, *args, **kwargs):
+        sent_templates.append(template)
+
+    def send_many(self, templates: list[DFTemplate], *args, **kwargs) -> int:
+        sent_templates.extend(templates)
+        return 0
+
+    async def async_do_nothing(self, *args, **kwargs):
+        pass
+
+    async def async_send_item(self, item: Item):
+        capture_item(item)
+
+    async def async_send_template(self, template: DFTemplate, *args, **kwargs):
+        sent_templates.append(template)
+
+    async def async_send_many(self, templates: list[DFTemplate], *args, **kwargs) -> int:
+        sent_templates.extend(templates)
+        return 0
+
+    replaced_methods = [
+        (DFTemplate, 'build_and_send', build_and_send),
+        (DFTemplate, 'abuild_and_send', abuild_and_send),
+        (Item, 'send_to_minecraft', send_to_minecraft),
+        (CodeClientConnection, 'connect', do_nothing),
+        (CodeClientConnection, 'send_command', do_nothing),
+        (CodeClientConnection, 'send_item', send_item),
+        (CodeClientConnection, 'send_template', send_template),
+        (CodeClientConnection, 'send_many', send_many),
+        (AsyncCodeClientConnection, 'connect', async_do_nothing),
+        (AsyncCodeClientConnection, 'send_command', async_do_nothing),
+        (AsyncCodeClientConnection, 'send_item', async_send_item),
+        (AsyncCodeClientConnection, 'send_template', async_send_template),
+        (AsyncCodeClientConnection, 'send_many', async_send_many),
+    ]
+    original_methods = [(cls, name, vars(cls)[name]) for cls, name, _ in replaced_methods]
+    for cls, name, method in replaced_methods:
+        setattr(cls, name, method)
+    try:
+        yield sent_templates
+    finally:
+        for cls, name, method in original_methods:
+            setattr(cls, name, method)
+
+
+def get_global_templates(script_globals: dict) -> Iterator[DFTemplate]:
+    for value in script_globals.values():
+        if isinstance(value, DFTemplate):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            yield from (v for v in value if isinstance(v, DFTemplate))
+
+
+def is_helper_module(module_name: str, script_dir: str) -> bool:
+    """
+    Returns True if a module lives in the directory of a script, and is not dfpyre or an installed package.
+    Packages installed in a virtual environment inside the script directory are not helpers.
+    """
+    if module_name == 'dfpyre' or module_name.startswith('dfpyre.'):
+        return False
+    module_path = getattr(sys.modules[module_name], '__file__', None)
+    if not module_path or not module_path.startswith(script_dir + os.sep):
+        return False
+    path_parts = os.path.relpath(module_path, script_dir).split(os.sep)
+    return 'site-packages' not in path_parts and 'dist-packages' not in path_parts
+
+
+def run_script(script_path: str) -> list[DFTemplate]:
+    """
+    Runs a script as `__main__` and returns the templates it made.
+    The script runs in its own directory and can import modules next to it.
+
+    :param str script_path: The path of the script.
+    """
+    script_path = os.path.abspath(script_path)
+    script_dir = os.path.dirname(script_path)
+    old_cwd, old_argv, old_path = os.getcwd(), sys.argv, sys.path[:]
+    old_module_names = set(sys.modules)
+    os.chdir(script_dir)
+    sys.argv = [script_path]
+    sys.path.insert(0, script_dir)
+    try:
+        with capture_sent_templates() as sent_templates:
+            script_globals = runpy.run_path(script_path, run_name='__main__')
+    finally:
+        os.chdir(old_cwd)
+        sys.argv = old_argv
+        sys.path[:] = old_path
+        # Helper modules the script imported are unloaded, so scripts in other directories can use the same module names
+        for module_name in set(sys.modules) - old_module_names:
+            if is_helper_module(module_name, script_dir):
+                del sys.modules[module_name]
+
+    # Templates can be both sent and stored in a variable, so they are only collected once
+    templates = {}
+    for template in sent_templates + list(get_global_templates(script_globals)):
+        templates.setdefault(id(template), template)
+    return list(templates.values())
+
+
+def iter_pyre_namespaces() -> Iterator[object]:
+    """
+    Yields every loaded dfpyre module and the classes defined in them.
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module_name != 'dfpyre' and not module_name.startswith('dfpyre.'):
+            continue
+        yield module
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and value.__module__ == module_name:
+                yield value
+
+
+@contextmanager
+def isolate_pyre_state() -> Iterator[None]:
+    """
+    Restores pyre's settings, and the attributes of its modules and classes, when the context exits.
+    Scripts run one after another in the same process, so this keeps a setting changed or a method
+    monkeypatched by one script from leaking into the next.
+    """
+    string_conversion = get_string_conversion()
+    build_cache = get_build_cache()
+    saved_namespaces = [(n, dict(vars(n))) for n in iter_pyre_namespaces()]
+    try:
+        yield
+    finally:
+        if get_string_conversion() is not string_conversion:
+            set_string_conversion(string_conversion)  # Also clears the strings converted with the script's setting
+        set_build_cache(build_cache)
+        # Attributes a script adds are left alone, since they are usually loaded lazily by pyre itself
+        for namespace, saved_attributes in saved_namespaces:
+            current_attributes = vars(namespace)
+            for name, value in saved_attributes.items():
+                if name not in current_attributes or current_attributes[name] is not value:
+                    setattr(namespace, name, value)
+
+
+def format_error(e: BaseException) -> str:
+    return ''.join(traceback.format_exception_only(type(e), e)).strip()
+
+
+def build_script(scripts_dir: str, script: str, source_hash: str, compression_level: int, use_cache: bool) -> ScriptBuildResult:
+    result = ScriptBuildResult(script, source_hash)
+    start = time.perf_counter()
+    with isolate_pyre_state():
+        if use_cache and get_build_cache() is None:
+            set_build_cache(BuildCache())
+        try:
+            for template in run_script(os.path.join(scripts_dir, script)):
+                result.templates.append({'name': template.get_template_name(), 'code': template.build(compression_level)})
+        except (Exception, SystemExit) as e:
+            result.templates = []
+            result.error = format_error(e)
+    result.run_time = time.perf_counter() - start
+    return result
+
+
+def preload():
+    """
+    Loads everything that is otherwise loaded lazily, so forked workers share it instead of each loading it again.
+    """
+    for class_name in action_classes.__all__:
+        getattr(action_classes, class_name)
+    for codeblock_type in ACTION_DATA:
+        ACTION_DATA[codeblock_type]
+
+
+def get_process_pool(workers: int|None) -> ProcessPoolExecutor:
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def build_scripts(scripts_dir: str, manifest: dict|None=None, workers: int|None=None,
+                  compression_level: int=DEFAULT_COMPRESSION_LEVEL, force: bool=False, use_cache: bool=False) -> Iterator[ScriptBuildResult]:
+    """
+    Runs every script in `scripts_dir` in parallel and builds the templates they make.
+    A script that fails does not stop the others, even if it ends its worker process.
+
+    :param str scripts_dir: The directory of scripts to run.
+    :param dict|None manifest: The manifest of the last build. Scripts with the same source hash and no error are skipped.
+    :param int|None workers: The number of worker processes to use. Defaults to the number of CPUs.
+    :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+    :param bool force: If True, every script is run even if it has not changed.
+    :param bool use_cache: If True, templates are built with a `BuildCache` in pyre's cache directory, unless another build cache is set.
+    :return: A result for each script in sorted order, as soon as it is ready.
+    """
+    last_entries = (manifest or {}).get('scripts', {})
+    scripts = find_scripts(scripts_dir)
+    source_hashes = [get_source_hash(os.path.join(scripts_dir, s)) for s in scripts]
+
+    changed_scripts = []
+    for script, source_hash in zip(scripts, source_hashes):
+        last_entry = last_entries.get(script)
+        if not force and last_entry is not None and last_entry['hash'] == source_hash and 'error' not in last_entry:
+            continue
+        changed_scripts.append((script, source_hash))
+
+    def iter_changed_results() -> Iterator[ScriptBuildResult]:
+        if workers == 1 or len(changed_scripts) <= 1:
+            for script, source_hash in changed_scripts:
+                yield build_script(scripts_dir, script, source_hash, compression_level, use_cache)
+            return
+
+        preload()
+        # The garbage collector does not write to frozen objects, so the pages they are on stay shared with the workers
+        gc.freeze()
+        try:
+            with get_process_pool(workers) as pool:
+                futures = [pool.submit(build_script, scripts_dir, script, source_hash, compression_level, use_cache)
+                           for script, source_hash in changed_scripts]
+                for future, (script, source_hash) in zip(futures, changed_scripts):
+                    try:
+                        yield future.result()
+                    except BrokenProcessPool as e:
+                        # A script ended its worker process, so every script that had not finished fails
+                        yield ScriptBuildResult(script, source_hash, error=format_error(e))
+        finally:
+            gc.unfreeze()
+
+    changed_results = iter_changed_results()
+    changed_names = {s for s, _ in changed_scripts}
+    for script, source_hash in zip(scripts, source_hashes):
+        if script in changed_names:
+            yield next(changed_results)
+        else:
+            yield ScriptBuildResult(script, source_hash, last_entries[script]['templates'], skipped=True)
+
+
+def load_manifest(manifest_path: str) -> dict|None:
+    """
+    Loads a build manifest, or returns None if it does not exist or is from a different version.
+    """
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(manifest_path: str, results: list[ScriptBuildResult]):
+    """
+    Writes the templates of each script into a build manifest.
+    The manifest is replaced in one step, so an interrupted build never leaves it half written.
+    """
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'scripts': {r.script: r.to_manifest_entry() for r in results}
+    }
+    write_atomic(os.path.abspath(manifest_path), json.dumps(manifest, indent=2).encode('utf-8'))
+
+
+def format_result(result: ScriptBuildResult) -> str:
+    if not result.ok:
+        return f'FAILED  {result.script}: {result.error}'
+    if result.skipped:
+        return f'skipped {result.script}'
+    return f'built   {result.script}   {len(result.templates)} template(s)   {result.run_time*1e3:.1f} ms'
+
+
+def main(argv: list[str]|None=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m dfpyre.build', description='Runs pyre scripts and writes their template codes into a manifest.')
+    parser.add_argument('scripts_dir', help='The directory of scripts to run.')
+    parser.add_argument('-m', '--manifest', default=DEFAULT_MANIFEST_PATH, help='The manifest file to write the template codes to.')
+    parser.add_argument('-j', '--workers', type=int, help='The number of worker processes. Defaults to the number of CPUs.')
+    parser.add_argument('-c', '--compression-level', type=int, default=DEFAULT_COMPRESSION_LEVEL, help='The gzip compression level, from 1 to 9.')
+    parser.add_argument('-f', '--force', action='store_true', help='Run every script, even if it has not changed.')
+    parser.add_argument('--cache', action='store_true', help='Reuse the codes of templates that were built before, even by other scripts.')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only report failures.')
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    start = time.perf_counter()
+    results = []
+    for result in build_scripts(args.scripts_dir, manifest, args.workers, args.compression_level, args.force, args.cache):
+        results.append(result)
+        if not args.quiet or not result.ok:
+            print(format_result(result), flush=True)
+    save_manifest(args.manifest, results)
+
+    elapsed = time.perf_counter() - start
+    built_count = sum(1 for r in results if r.ok and not r.skipped)
+    skipped_count = sum(1 for r in results if r.skipped)
+    failed_count = sum(1 for r in results if not r.ok)
+    print(f'Built {built_count} script(s), skipped {skipped_count}, {failed_count} failed, in {elapsed:.2f} s. Wrote {args.manifest}.')
+    return 1 if failed_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
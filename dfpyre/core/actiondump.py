@@ -1,15 +1,23 @@
 import os
 import json
 import re
-from typing import Literal
+import pickle
+from typing import Literal, Callable, Iterator
+from collections.abc import Mapping
+from functools import partial, cache
 from dataclasses import dataclass
 from dfpyre.util.util import warn
+from dfpyre.util.cache import cache_enabled, get_cache_dir, hash_files, write_atomic
 
 
 ACTIONDUMP_PATH = os.path.join(os.path.dirname(__file__), '../data/actiondump_min.json')
 DEPRECATED_ACTIONS_PATH = os.path.join(os.path.dirname(__file__), '../data/deprecated_actions.json')
 SUBACTIONS_PATH = os.path.join(os.path.dirname(__file__), '../data/subactions.json')
 
+# Increment this whenever the parsed actiondump classes change shape
+ACTIONDUMP_CACHE_VERSION = 2
+ACTIONDUMP_CACHE_PREFIX = 'actiondump-'
+
 CODEBLOCK_ID_LOOKUP = {
     'PLAYER ACTION': 'player_action',
     'ENTITY ACTION': 'entity_action',
@@ -92,7 +100,7 @@ class ParticleEntry:
 @dataclass
 class ActiondumpResult:
     codeblock_data: dict[str, CodeblockDataEntry]
-    action_data: dict[str, dict[str, ActionDataEntry]]
+    action_data: Mapping[str, dict[str, ActionDataEntry]]
     particle_data: list[ParticleEntry]
     game_values: dict[str, VariableType]
     sound_names: list[str]
@@ -200,14 +208,13 @@ def parse_codeblock_data(raw_codeblock_data: list[dict]) -> dict[str, CodeblockD
     return parsed_data
 
 
-def parse_action_data(raw_action_data: list[dict]):
-    all_action_data = {n: {} for n in CODEBLOCK_ID_LOOKUP.values()}
-    all_action_data['else'] = dict()
-
-    with open(DEPRECATED_ACTIONS_PATH, 'r', encoding='utf-8') as f:
-        all_deprecated_actions: dict = json.loads(f.read())
+def parse_codeblock_actions(raw_actions: list[dict], deprecated_actions: dict) -> dict[str, ActionDataEntry]:
+    """
+    Parses all actions belonging to a single codeblock type.
+    """
+    codeblock_actions: dict[str, ActionDataEntry] = {}
 
-    for action_data in raw_action_data:
+    for action_data in raw_actions:
         action_tags = parse_action_tags(action_data)
         
         action_name = action_data['name']
@@ -232,10 +239,7 @@ def parse_action_data(raw_action_data: list[dict]):
             dep_note = ' '.join(dep_note)
         else:
             dep_note = None
-        
-        codeblock_type = CODEBLOCK_ID_LOOKUP[action_data['codeblockName']]
 
-        deprecated_actions = all_deprecated_actions.get(codeblock_type) or {}
         is_deprecated = action_name in deprecated_actions
         
         parsed_action_data = ActionDataEntry(
@@ -247,20 +251,81 @@ def parse_action_data(raw_action_data: list[dict]):
             is_deprecated=is_deprecated,
             deprecated_note=dep_note
         )
-        all_action_data[codeblock_type][action_name] = parsed_action_data
+        codeblock_actions[action_name] = parsed_action_data
     
     # Remove actions without trailing whitespace because they contain bad data
     # This may have to be removed/replaced in the future, but for now the actiondump is a mess :shrug:
-    for codeblock_type, actions in list(all_action_data.items()):
-        action_name_set = set(actions.keys())
-        for action_name, action_data in list(actions.items()):
-            action_data: ActionDataEntry
-            if action_data.is_deprecated:
-                continue
-            if re.match(r'^ \w+ $', action_name) and action_name.strip() in action_name_set:
-                del all_action_data[codeblock_type][action_name.strip()]
+    action_name_set = set(codeblock_actions.keys())
+    for action_name, action_data in list(codeblock_actions.items()):
+        if action_data.is_deprecated:
+            continue
+        if re.match(r'^ \w+ $', action_name) and action_name.strip() in action_name_set:
+            codeblock_actions.pop(action_name.strip(), None)
+    
+    return codeblock_actions
+
+
+class LazyActionData(Mapping[str, dict[str, ActionDataEntry]]):
+    """
+    Maps codeblock types to their actions, only parsing a codeblock type's
+    actions the first time it is accessed.
+    """
+    def __init__(self, loaders: dict[str, Callable[[], dict[str, ActionDataEntry]]]):
+        self._loaders = loaders
+        self._loaded: dict[str, dict[str, ActionDataEntry]] = {}
+    
+
+    def __getitem__(self, codeblock_type: str) -> dict[str, ActionDataEntry]:
+        actions = self._loaded.get(codeblock_type)
+        if actions is None:
+            actions = self._loaders[codeblock_type]()
+            self._loaded[codeblock_type] = actions
+        return actions
+    
+
+    def __contains__(self, codeblock_type: object) -> bool:
+        return codeblock_type in self._loaders
+    
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+    
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+    
+
+    def __repr__(self) -> str:
+        return f'LazyActionData(loaded: {list(self._loaded)}, total: {len(self._loaders)})'
+
+
+    def __getstate__(self) -> dict[str, bytes]:
+        # Each codeblock type is pickled separately so it can still be loaded lazily
+        return {t: pickle.dumps(self[t], protocol=pickle.HIGHEST_PROTOCOL) for t in self._loaders}
     
-    return all_action_data
+
+    def __setstate__(self, state: dict[str, bytes]):
+        self._loaders = {t: partial(pickle.loads, pickled_actions) for t, pickled_actions in state.items()}
+        self._loaded = {}
+
+
+def parse_action_data(raw_action_data: list[dict]) -> LazyActionData:
+    raw_actions_by_type: dict[str, list[dict]] = {n: [] for n in CODEBLOCK_ID_LOOKUP.values()}
+    raw_actions_by_type['else'] = []
+
+    for action_data in raw_action_data:
+        codeblock_type = CODEBLOCK_ID_LOOKUP[action_data['codeblockName']]
+        raw_actions_by_type[codeblock_type].append(action_data)
+
+    with open(DEPRECATED_ACTIONS_PATH, 'r', encoding='utf-8') as f:
+        all_deprecated_actions: dict = json.loads(f.read())
+    
+    loaders = {}
+    for codeblock_type, raw_actions in raw_actions_by_type.items():
+        deprecated_actions = all_deprecated_actions.get(codeblock_type) or {}
+        loaders[codeblock_type] = partial(parse_codeblock_actions, raw_actions, deprecated_actions)
+    
+    return LazyActionData(loaders)
 
 
 def parse_particle_data(raw_particle_data: list[dict]):
@@ -303,7 +368,7 @@ def parse_particle_data(raw_particle_data: list[dict]):
 def parse_actiondump() -> ActiondumpResult:
     if not os.path.isfile(ACTIONDUMP_PATH):
         warn('Actiondump not found -- Item tags and error checking will not work.')
-        return ActiondumpResult(codeblock_data={}, action_data={}, game_values=[], sound_names=[], potion_names=[])
+        return ActiondumpResult(codeblock_data={}, action_data={}, particle_data=[], game_values={}, sound_names=[], potion_names=[])
     
     with open(ACTIONDUMP_PATH, 'r', encoding='utf-8') as f:
         actiondump: dict = json.loads(f.read())
@@ -335,7 +400,58 @@ def parse_actiondump() -> ActiondumpResult:
     )
 
 
-ACTIONDUMP = parse_actiondump()
+@cache
+def get_actiondump_hash() -> str:
+    """
+    Returns a hex digest of the action data files, which changes whenever the data that codeblocks are built from changes.
+    """
+    return hash_files(ACTIONDUMP_PATH, DEPRECATED_ACTIONS_PATH, SUBACTIONS_PATH)
+
+
+def get_actiondump_cache_path(cache_version: int=ACTIONDUMP_CACHE_VERSION) -> str:
+    source_hash = get_actiondump_hash()
+    file_name = f'{ACTIONDUMP_CACHE_PREFIX}v{cache_version}-{source_hash[:20]}.pickle'
+    return os.path.join(get_cache_dir(), file_name)
+
+
+def _remove_old_format_caches():
+    # Only caches of the same actiondump are removed, since others can belong to other versions of pyre sharing the cache directory
+    for cache_version in range(ACTIONDUMP_CACHE_VERSION):
+        try:
+            os.remove(get_actiondump_cache_path(cache_version))
+        except OSError:
+            pass
+
+
+def load_actiondump() -> ActiondumpResult:
+    """
+    Loads the parsed actiondump from the cache directory, or parses it
+    and writes a new cache file if the source data has changed.
+    """
+    if not cache_enabled() or not os.path.isfile(ACTIONDUMP_PATH):
+        return parse_actiondump()
+    
+    cache_path = get_actiondump_cache_path()
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_result = pickle.load(f)
+            if isinstance(cached_result, ActiondumpResult):
+                return cached_result
+        except Exception:
+            pass  # Corrupted or incompatible cache, so parse it again
+    
+    actiondump_result = parse_actiondump()
+    try:
+        write_atomic(cache_path, pickle.dumps(actiondump_result, protocol=pickle.HIGHEST_PROTOCOL))
+        _remove_old_format_caches()
+    except OSError:
+        pass  # Cache directory is not writable, so just skip caching
+    
+    return actiondump_result
+
+
+ACTIONDUMP = load_actiondump()
 ACTION_DATA = ACTIONDUMP.action_data
 
 with open(SUBACTIONS_PATH, 'r', encoding='utf-8') as f:
@@ -1,8 +1,14 @@
-from typing import Literal
+import json
+import hashlib
+from typing import Literal, Callable
+from operator import attrgetter
 from enum import Enum
+from functools import cache, wraps
+from dataclasses import dataclass
 from difflib import get_close_matches
-from dfpyre.util.util import warn, flatten
-from dfpyre.core.items import convert_literals
+from dfpyre.util.util import PyreException, warn, flatten_list
+from dfpyre.util.codeitem import CodeItem
+from dfpyre.core.items import convert_literals, Item
 from dfpyre.core.actiondump import ACTION_DATA, ActionTag, SUBACTION_LOOKUP
 
 
@@ -41,52 +47,89 @@ def _warn_unrecognized_name(codeblock_type: str, codeblock_name: str):
         warn(f'Code block name "{codeblock_name}" not recognized. Try spell checking or retyping without spaces.')
 
 
-def _check_applied_tags(tags: list[ActionTag], applied_tags: dict[str, str], codeblock_name: str) -> dict[str, str]:
-    if len(applied_tags) > 0 and len(tags) == 0:
+@dataclass(frozen=True)
+class _ActionTagTable:
+    """
+    Precomputed tag data for a single action.
+    """
+    defaults: dict[str, str]
+    options: dict[str, tuple[str, ...]]
+    default_items: tuple[dict, ...]
+    is_deprecated: bool
+    deprecated_note: str | None
+
+
+def _format_tag_item(option: str, name: str, slot: int, codeblock_type: str, codeblock_action: str) -> dict:
+    return {
+        'item': {
+            'id': 'bl_tag',
+            'data': {'option': option, 'tag': name, 'action': codeblock_action, 'block': codeblock_type}
+        },
+        'slot': slot
+    }
+
+
+def _copy_tag_item(tag_item: dict) -> dict:
+    return {'item': {'id': 'bl_tag', 'data': tag_item['item']['data'].copy()}, 'slot': tag_item['slot']}
+
+
+@cache
+def _is_known_action(codeblock_type: str, codeblock_action: str) -> bool:
+    return codeblock_action in ACTION_DATA[codeblock_type]
+
+
+@cache
+def _get_tag_table(codeblock_type: str, codeblock_action: str) -> _ActionTagTable:
+    action_data = ACTION_DATA[codeblock_type][codeblock_action]
+    tags: list[ActionTag] = action_data.tags
+    return _ActionTagTable(
+        defaults={t.name: t.default for t in tags},
+        options={t.name: tuple(o.name for o in t.options) for t in tags},
+        default_items=tuple(_format_tag_item(t.default, t.name, t.slot, codeblock_type, codeblock_action) for t in tags),
+        is_deprecated=action_data.is_deprecated,
+        deprecated_note=action_data.deprecated_note
+    )
+
+
+def _check_applied_tags(tag_table: _ActionTagTable, applied_tags: dict[str, str], codeblock_name: str) -> dict[str, str]:
+    """
+    Returns the applied tags that are valid and differ from their default option.
+    """
+    if len(applied_tags) > 0 and len(tag_table.defaults) == 0:
         warn(f'Action "{codeblock_name}" does not have any tags, but still received {len(applied_tags)}.')
         return {}
     
-    valid_tags = {}
-    tags_lookup = {t.name: t for t in tags}
-
+    overridden_tags = {}
     for name, option in applied_tags.items():
-        option_strings = [o.name for o in tags_lookup[name].options]
-
-        if name not in tags_lookup:
-            tag_names_joined = '\n'.join(map(lambda s: '    - '+s, tags_lookup.keys()))
+        default_option = tag_table.defaults.get(name)
+        if default_option is None:
+            tag_names_joined = '\n'.join(map(lambda s: '    - '+s, tag_table.defaults.keys()))
             warn(f'Tag "{name}" does not exist for action "{codeblock_name}". Available tags:\n{tag_names_joined}')
-        elif option not in option_strings:
-            options_joined = '\n'.join(map(lambda s: '    - '+s, option_strings))
+        elif option == default_option:
+            continue
+        elif option not in tag_table.options[name]:
+            options_joined = '\n'.join(map(lambda s: '    - '+s, tag_table.options[name]))
             warn(f'Tag "{name}" does not have the option "{option}". Available tag options:\n{options_joined}')
         else:
-            valid_tags[name] = option
-    return valid_tags
+            overridden_tags[name] = option
+    return overridden_tags
 
 
-def _reformat_codeblock_tags(tags: list[ActionTag], codeblock_type: str, codeblock_action: str, applied_tags: dict[str, str]) -> list[dict]:
+def _reformat_codeblock_tags(tag_table: _ActionTagTable, codeblock_type: str, codeblock_action: str, applied_tags: dict[str, str]) -> list[dict]:
     """
     Turns tag objects into DiamondFire formatted tag items.
     """
-
-    def format_tag(option: str, name: str):
-        return {
-            'item': {
-                'id': 'bl_tag',
-                'data': {'option': option, 'tag': name, 'action': codeblock_action, 'block': codeblock_type}
-            },
-            'slot': tag_item.slot
-        }
+    overridden_tags = _check_applied_tags(tag_table, applied_tags, codeblock_action)
+    if not overridden_tags:
+        return [_copy_tag_item(i) for i in tag_table.default_items]
     
-    valid_applied_tags = _check_applied_tags(tags, applied_tags, codeblock_action)
     reformatted_tags = []
-    for tag_item in tags:
-        tag_name = tag_item.name
-        tag_option = tag_item.default
-
-        if tag_name in valid_applied_tags:
-            tag_option = valid_applied_tags[tag_name]
-
-        new_tag_item = format_tag(tag_option, tag_name)
+    for tag_item in tag_table.default_items:
+        tag_name = tag_item['item']['data']['tag']
+        if tag_name in overridden_tags:
+            new_tag_item = _format_tag_item(overridden_tags[tag_name], tag_name, tag_item['slot'], codeblock_type, codeblock_action)
+        else:
+            new_tag_item = _copy_tag_item(tag_item)
         reformatted_tags.append(new_tag_item)
     return reformatted_tags
 
@@ -95,30 +138,188 @@ def _get_codeblock_tags(codeblock_type: str, codeblock_name: str, applied_tags:
     """
     Get tags for the specified codeblock type and name.
     """
-    action_data = ACTION_DATA[codeblock_type][codeblock_name]
-    if action_data.is_deprecated:
-        warn(f'Action "{codeblock_name}" is deprecated: {action_data.deprecated_note}')
-    tags = action_data.tags
-    return _reformat_codeblock_tags(tags, codeblock_type, codeblock_name, applied_tags)
+    tag_table = _get_tag_table(codeblock_type, codeblock_name)
+    if tag_table.is_deprecated:
+        warn(f'Action "{codeblock_name}" is deprecated: {tag_table.deprecated_note}')
+    return _reformat_codeblock_tags(tag_table, codeblock_type, codeblock_name, applied_tags)
+
+
+def build_codeblock(codeblock_type: str, action_name: str, args: list, target: Target, data: dict, applied_tags: dict[str, str]) -> dict:
+    """
+    Builds a properly formatted block from the fields of a codeblock.
+    """
+    built_block = data.copy()
+    
+    # Add target if necessary ('Selection' is the default when 'target' is blank)
+    if codeblock_type in TARGET_CODEBLOCKS and target != DEFAULT_TARGET:
+        built_block['target'] = target.get_string_value()
+    
+    # Add items into args
+    final_args = [arg.format(slot) for slot, arg in enumerate(args) if arg.type in VARIABLE_TYPES]
+    already_applied_tags: dict[str, dict] = {a['item']['data']['tag']: a for a in final_args if a['item']['id'] == 'bl_tag'}
+    
+    # Check for unrecognized name, add tags
+    if codeblock_type not in {'bracket', 'else'}:
+        if not _is_known_action(codeblock_type, action_name):
+            _warn_unrecognized_name(codeblock_type, action_name)
+        
+        # Get tags
+        subaction = data.get('subAction')
+        if subaction is not None:
+            if subaction in SUBACTION_LOOKUP:
+                subaction_block_type, subaction_action = SUBACTION_LOOKUP[subaction]
+                tags = _get_codeblock_tags(subaction_block_type, subaction_action, applied_tags)
+            else:
+                tags = {}
+        else:
+            tags = _get_codeblock_tags(codeblock_type, action_name, applied_tags)
+        
+        if already_applied_tags:
+            for i, tag_data in enumerate(tags):
+                already_applied_tag_data = already_applied_tags.get(tag_data['item']['data']['tag'])
+                if already_applied_tag_data is not None:
+                    tags[i] = already_applied_tag_data
+        
+        if len(final_args) + len(tags) > 27:
+            final_args = final_args[:(27-len(tags))]  # Trim list if over 27 elements
+        
+        final_args.extend(tags)  # Add tags to end
+
+    built_block['args'] = {'items': final_args}
+    return built_block
+
+
+def _tracked_method(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.modified = True
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _TrackedList(list):
+    """
+    A list that records whether it has been modified in place.
+    """
+    modified = False
+
+for _method_name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_TrackedList, _method_name, _tracked_method(getattr(list, _method_name)))
+
+
+class _TrackedDict(dict):
+    """
+    A dict that records whether it has been modified in place.
+    """
+    modified = False
+
+for _method_name in ('__setitem__', '__delitem__', '__ior__', 'pop', 'popitem', 'clear', 'update', 'setdefault'):
+    setattr(_TrackedDict, _method_name, _tracked_method(getattr(dict, _method_name)))
+
+
+# Attributes that change the built form of a codeblock
+CACHE_INVALIDATING_ATTRIBUTES = {'type', 'action_name', 'args', 'target', 'data', 'tags'}
+
+STRUCTURE_HASH_SIZE = 16
+
+# Values of these types have a repr that is a complete structure key
+PRIMITIVE_KEY_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@cache
+def _get_slot_names(item_type: type) -> tuple[str, ...]:
+    slot_names = []
+    for cls in reversed(item_type.__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        slot_names.extend([slots] if isinstance(slots, str) else slots)
+    # Private slots, such as whether an item is interned, don't change how an item is built
+    return tuple(n for n in dict.fromkeys(slot_names) if not n.startswith('_'))
+
+
+def get_structure_key(value):
+    """
+    Returns a representation of `value` made of built-in types, which changes whenever the built form of `value` changes.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return (type(value).__name__, value.value)
+    if isinstance(value, (list, tuple)):
+        return tuple(map(get_structure_key, value))
+    if isinstance(value, dict):
+        return tuple((k, get_structure_key(v)) for k, v in value.items())
+    if isinstance(value, Item):
+        return ('Item', value.get_snbt(), value.slot)
+    if isinstance(value, CodeItem):
+        key = [type(value).__name__]
+        key.extend(get_structure_key(getattr(value, n, None)) for n in _get_slot_names(type(value)))
+        if hasattr(value, '__dict__'):
+            key.append(get_structure_key(vars(value)))
+        return tuple(key)
+    raise PyreException(f'Cannot hash a value of type {type(value).__name__}.')
+
+
+@cache
+def _get_item_key_function(item_type: type) -> Callable[[CodeItem], object]:
+    """
+    Returns a fast function that does the same as `get_structure_key` for items of `item_type`.
+    """
+    if issubclass(item_type, Item):
+        return lambda item: (item.get_snbt(), item.slot)
+    if not issubclass(item_type, CodeItem) or item_type.__dictoffset__:
+        return get_structure_key
+
+    slot_names = _get_slot_names(item_type)
+    get_slot_values = attrgetter(*slot_names) if len(slot_names) > 1 else lambda item: (getattr(item, slot_names[0]),)
+
+    def get_item_key(item: CodeItem) -> tuple:
+        slot_values = get_slot_values(item)
+        if set(map(type, slot_values)) <= PRIMITIVE_KEY_TYPES:
+            return slot_values
+        # The repr of nested items and enums doesn't always include all of their fields
+        return tuple(map(get_structure_key, slot_values))
+    return get_item_key
 
 
 class CodeBlock:
-    def __init__(self, codeblock_type: str, action_name: str, args: tuple=(), target: Target=DEFAULT_TARGET, data: dict={}, tags: dict[str, str]={}):
-        self.type = codeblock_type
-        self.action_name = action_name
-        self.args = [convert_literals(a) for a in flatten(args) if a is not None]
-        self.target = target
-        self.data = data
-        self.tags = tags
+    def __init__(self, codeblock_type: str, action_name: str, args: tuple=(), target: Target=DEFAULT_TARGET, data: dict={}, tags: dict[str, str]={},
+                 normalized_args: bool=False):
+        """
+        :param bool normalized_args: If True, `args` must already be a flat list of code items, and is used without being flattened or converted.
+        """
+        # Attributes are set directly, since there is no cached build to invalidate yet
+        if not normalized_args:
+            args = [convert_literals(a) for a in flatten_list(args) if a is not None]
+        object.__setattr__(self, 'type', codeblock_type)
+        object.__setattr__(self, 'action_name', action_name)
+        object.__setattr__(self, 'args', _TrackedList(args))
+        object.__setattr__(self, 'target', target)
+        object.__setattr__(self, 'data', _TrackedDict(data))
+        object.__setattr__(self, 'tags', _TrackedDict(tags))
+        object.__setattr__(self, '_built_json', None)
+        object.__setattr__(self, '_structure_hash', None)
+        object.__setattr__(self, '_built_args_key', None)
+        object.__setattr__(self, '_hashed_args_key', None)
+    
+
+    def __setattr__(self, name: str, value):
+        if name in CACHE_INVALIDATING_ATTRIBUTES:
+            if name == 'args':
+                value = _TrackedList(value)
+            elif name == 'data' or name == 'tags':
+                value = _TrackedDict(value)
+            object.__setattr__(self, '_built_json', None)
+            object.__setattr__(self, '_structure_hash', None)
+        object.__setattr__(self, name, value)
     
 
     @classmethod
-    def new_action(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], target: Target=DEFAULT_TARGET) -> "CodeBlock":
-        return cls(codeblock_type, action_name, args=args, data={'id': 'block', 'block': codeblock_type, 'action': action_name}, tags=tags, target=target)
+    def new_action(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], target: Target=DEFAULT_TARGET, normalized_args: bool=False) -> "CodeBlock":
+        return cls(codeblock_type, action_name, args=args, data={'id': 'block', 'block': codeblock_type, 'action': action_name}, tags=tags, target=target, normalized_args=normalized_args)
 
     @classmethod
-    def new_data(cls, codeblock_type: str, data_value: str, args: tuple, tags: dict[str, str]) -> "CodeBlock":
-        return cls(codeblock_type, 'dynamic', args=args, data={'id': 'block', 'block': codeblock_type, 'data': data_value}, tags=tags)
+    def new_data(cls, codeblock_type: str, data_value: str, args: tuple, tags: dict[str, str], normalized_args: bool=False) -> "CodeBlock":
+        return cls(codeblock_type, 'dynamic', args=args, data={'id': 'block', 'block': codeblock_type, 'data': data_value}, tags=tags, normalized_args=normalized_args)
 
     @classmethod
     def new_event(cls, codeblock_type: str, action_name: str, ls_cancel: bool):
@@ -128,20 +329,22 @@ class CodeBlock:
         return cls(codeblock_type, action_name, data=data)
 
     @classmethod
-    def new_conditional(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], inverted: bool, target: Target=DEFAULT_TARGET) -> "CodeBlock":
+    def new_conditional(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], inverted: bool, target: Target=DEFAULT_TARGET,
+                        normalized_args: bool=False) -> "CodeBlock":
         data = {'id': 'block', 'block': codeblock_type, 'action': action_name}
         if inverted:
             data['attribute'] = 'NOT'
-        return cls(codeblock_type, action_name, args=args, data=data, tags=tags, target=target)
+        return cls(codeblock_type, action_name, args=args, data=data, tags=tags, target=target, normalized_args=normalized_args)
 
     @classmethod
-    def new_subaction_block(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], sub_action: str|None, inverted: bool) -> "CodeBlock":
+    def new_subaction_block(cls, codeblock_type: str, action_name: str, args: tuple, tags: dict[str, str], sub_action: str|None, inverted: bool,
+                            normalized_args: bool=False) -> "CodeBlock":
         data = {'id': 'block', 'block': codeblock_type, 'action': action_name}
         if sub_action is not None:
             data['subAction'] = sub_action
             if inverted:
                 data['attribute'] = 'NOT'
-        return cls(codeblock_type, action_name, args=args, data=data, tags=tags)
+        return cls(codeblock_type, action_name, args=args, data=data, tags=tags, normalized_args=normalized_args)
 
     @classmethod
     def new_else(cls) -> "CodeBlock":
@@ -177,41 +380,64 @@ class CodeBlock:
         """
         Builds a properly formatted block from a CodeBlock object.
         """
-        built_block = self.data.copy()
-        
-        # Add target if necessary ('Selection' is the default when 'target' is blank)
-        if self.type in TARGET_CODEBLOCKS and self.target != DEFAULT_TARGET:
-            built_block['target'] = self.target.get_string_value()
-        
-        # Add items into args
-        final_args = [arg.format(slot) for slot, arg in enumerate(self.args) if arg.type in VARIABLE_TYPES]
-        already_applied_tags: dict[str, dict] = {a['item']['data']['tag']: a for a in final_args if a['item']['id'] == 'bl_tag'}
-        
-        # Check for unrecognized name, add tags
-        if self.type not in {'bracket', 'else'}:
-            if self.action_name not in ACTION_DATA[self.type]:
-                _warn_unrecognized_name(self.type, self.action_name)
-            
-            # Get tags
-            subaction = self.data.get('subAction')
-            if subaction is not None:
-                if subaction in SUBACTION_LOOKUP:
-                    subaction_block_type, subaction_action = SUBACTION_LOOKUP[subaction]
-                    tags = _get_codeblock_tags(subaction_block_type, subaction_action, self.tags)
-                else:
-                    tags = {}
-            else:
-                tags = _get_codeblock_tags(self.type, self.action_name, self.tags)
-            
-            for i, tag_data in enumerate(tags):
-                already_applied_tag_data = already_applied_tags.get(tag_data['item']['data']['tag'])
-                if already_applied_tag_data is not None:
-                    tags[i] = already_applied_tag_data
-            
-            if len(final_args) + len(tags) > 27:
-                final_args = final_args[:(27-len(tags))]  # Trim list if over 27 elements
-            
-            final_args.extend(tags)  # Add tags to end
-
-        built_block['args'] = {'items': final_args}
-        return built_block
+        return build_codeblock(self.type, self.action_name, self.args, self.target, self.data, self.tags)
+    
+
+    def build_json(self) -> str:
+        """
+        Builds this codeblock as a JSON string.
+        The result is cached until the args, tags, target, or data of this codeblock change, or one of its items changes.
+        """
+        self._clear_if_modified()
+        args_key = self._get_args_key()
+        if self._built_json is not None and self._built_args_key == args_key:
+            return self._built_json
+
+        built_json = json.dumps(self.build(), separators=(',', ':'))
+        object.__setattr__(self, '_built_json', built_json)
+        object.__setattr__(self, '_built_args_key', args_key)
+        return built_json
+    
+
+    def _get_args_key(self) -> list[tuple]:
+        """
+        Returns the structure key of each arg, which is compared to tell if an item has been changed in place.
+        """
+        return [(t.__name__, _get_item_key_function(t)(a)) for t, a in zip(map(type, self.args), self.args)]
+
+
+    def invalidate(self):
+        """
+        Clears the cached build of this codeblock and its items.
+        Call this after changing the `nbt` of an item that has already been added to this codeblock.
+        """
+        self._built_json = None
+        self._structure_hash = None
+        for arg in self.args:
+            if isinstance(arg, Item):
+                arg.invalidate()
+
+
+    def _clear_if_modified(self):
+        if self.args.modified or self.tags.modified or self.data.modified:
+            self.args.modified = self.tags.modified = self.data.modified = False
+            self._built_json = None
+            self._structure_hash = None
+
+
+    def get_structure_hash(self) -> bytes:
+        """
+        Returns a hash of the type, action, args, target, data and tags of this codeblock.
+        It is computed without building this codeblock, and is cached the same way as `build_json`.
+        """
+        self._clear_if_modified()
+        args_key = self._get_args_key()
+        if self._structure_hash is not None and self._hashed_args_key == args_key:
+            return self._structure_hash
+
+        # Data and tags only hold JSON values, so their repr is already a complete key
+        structure_key = (self.type, self.action_name, args_key, self.target, self.data, self.tags)
+        structure_hash = hashlib.blake2b(repr(structure_key).encode(), digest_size=STRUCTURE_HASH_SIZE).digest()
+        object.__setattr__(self, '_structure_hash', structure_hash)
+        object.__setattr__(self, '_hashed_args_key', args_key)
+        return structure_hash
@@ -0,0 +1,369 @@
+"""
+A reusable connection to the CodeClient API.
+"""
+
+import asyncio
+import socket
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+import websocket
+from dfpyre.util.util import COL_SUCCESS, COL_ERROR, COL_RESET, DEFAULT_COMPRESSION_LEVEL
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from dfpyre.core.items import Item
+    from dfpyre.core.template import DFTemplate
+
+
+__all__ = ['CodeClientConnection', 'AsyncCodeClientConnection']
+
+
+CODECLIENT_URL = 'ws://localhost:31375'
+
+# Exceptions that mean the connection was lost and should be reopened
+CONNECTION_ERRORS = (websocket.WebSocketException, OSError)
+
+# Default number of templates an async connection builds at the same time
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def print_connection_help():
+    print(f'{COL_ERROR}Could not connect to CodeClient API. Possible problems:')
+    print(f'    - Minecraft is not open')
+    print(f'    - CodeClient is not installed (get it here: https://modrinth.com/mod/codeclient)')
+    print(f'    - CodeClient API is not enabled (enable it in CodeClient general settings){COL_RESET}')
+
+
+def print_send_success(template_count: int):
+    if template_count == 1:
+        print(f'{COL_SUCCESS}Item sent to client successfully.{COL_RESET}')
+    else:
+        print(f'{COL_SUCCESS}Sent {template_count} templates to client successfully.{COL_RESET}')
+
+
+class CodeClientConnection:
+    """
+    A connection to the CodeClient API that stays open between sends.
+
+    Can be used as a context manager, which closes the connection on exit:
+    ```
+    with CodeClientConnection() as connection:
+        connection.send_many(templates)
+    ```
+    """
+
+    def __init__(self, url: str=CODECLIENT_URL, timeout: float|None=5.0, max_retries: int=1):
+        """
+        :param str url: The URL of the CodeClient API.
+        :param float|None timeout: The socket timeout in seconds.
+        :param int max_retries: How many times to reconnect and resend if a send fails.
+        """
+        self.url = url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._ws: websocket.WebSocket|None = None
+
+
+    def __enter__(self) -> 'CodeClientConnection':
+        self.connect()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._ws.connected
+
+
+    def connect(self):
+        """
+        Opens the connection if it is not already open.
+        """
+        if self.connected:
+            return
+        ws = websocket.WebSocket()
+        ws.settimeout(self.timeout)
+        ws.connect(self.url)
+        self._ws = ws
+
+
+    def close(self):
+        """
+        Closes the connection if it is open.
+        """
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except CONNECTION_ERRORS:
+                pass
+            self._ws = None
+
+
+    def send_command(self, command: str):
+        """
+        Sends a command to CodeClient, reconnecting if the connection was lost.
+
+        :param str command: The command to send.
+        """
+        for attempt in range(self.max_retries+1):
+            try:
+                self.connect()
+                self._ws.send(command)
+                return
+            except CONNECTION_ERRORS:
+                self.close()
+                if attempt == self.max_retries:
+                    raise
+
+
+    def send_item(self, item: 'Item'):
+        """
+        Gives an item to the player.
+
+        :param Item item: The item to give.
+        """
+        self.send_command(f'give {item.get_snbt()}')
+
+
+    def send_template(self, template: 'DFTemplate', compression_level: int=DEFAULT_COMPRESSION_LEVEL):
+        """
+        Builds a template and gives its template item to the player.
+
+        :param DFTemplate template: The template to send.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        """
+        self.send_item(template.generate_template_item(compression_level))
+
+
+    def send_many(self, templates: list['DFTemplate'], compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> int:
+        """
+        Builds and sends multiple templates over this connection.
+        Commands are sent back to back without waiting for CodeClient between them.
+
+        :param list[DFTemplate] templates: The templates to send.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :return: 0 if all templates were sent, 1 if CodeClient could not be reached, 2 if sending failed.
+        """
+        try:
+            for template in templates:
+                self.send_template(template, compression_level)
+        except ConnectionRefusedError:
+            print_connection_help()
+            return 1
+        except CONNECTION_ERRORS as e:
+            print(f'Connection failed: {e}')
+            return 2
+
+        print_send_success(len(templates))
+        return 0
+
+
+class AsyncCodeClientConnection:
+    """
+    An asyncio connection to the CodeClient API that stays open between sends.
+    The WebSocket is run by websocket-client in worker threads, and templates are built in an executor,
+    so the event loop is not blocked.
+    Pings from CodeClient are answered, and a close from CodeClient is noticed right away.
+
+    Can be used as an async context manager, which closes the connection on exit:
+    ```
+    async with AsyncCodeClientConnection() as connection:
+        await connection.send_many(templates)
+    ```
+    """
+
+    def __init__(self, url: str=CODECLIENT_URL, timeout: float|None=5.0, max_retries: int=1,
+                 max_concurrency: int=DEFAULT_MAX_CONCURRENCY, executor: 'Executor|None'=None):
+        """
+        :param str url: The URL of the CodeClient API.
+        :param float|None timeout: The socket timeout in seconds.
+        :param int max_retries: How many times to reconnect and resend if a send fails.
+        :param int max_concurrency: The maximum number of templates being built at the same time.
+        :param Executor|None executor: The executor to build templates in. Defaults to the event loop's default executor.
+        """
+        self.url = url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self._ws: websocket.WebSocket|None = None
+        self._reader: threading.Thread|None = None
+        self._send_lock = asyncio.Lock()
+        self._build_semaphore = asyncio.Semaphore(max_concurrency)
+
+
+    async def __aenter__(self) -> 'AsyncCodeClientConnection':
+        await self.connect()
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._ws.connected
+
+
+    async def connect(self):
+        """
+        Opens the connection if it is not already open.
+        """
+        if self.connected:
+            return
+        await self.close()
+
+        ws = websocket.WebSocket()
+        ws.settimeout(self.timeout)
+        await asyncio.get_running_loop().run_in_executor(None, ws.connect, self.url)
+
+        # The reader is a daemon thread so a connection that is never closed does not keep the program running
+        reader = threading.Thread(target=_read_frames, args=(ws,), daemon=True)
+        reader.start()
+        self._ws = ws
+        self._reader = reader
+
+
+    async def close(self):
+        """
+        Closes the connection if it is open.
+        """
+        ws, reader = self._ws, self._reader
+        if ws is None:
+            return
+        self._ws = None
+        self._reader = None
+        await asyncio.get_running_loop().run_in_executor(None, _close_websocket, ws, reader, self.timeout)
+
+
+    async def send_command(self, command: str):
+        """
+        Sends a command to CodeClient, reconnecting if the connection was lost.
+        Waits until the command has been handed to the socket, so fast producers are slowed down to the speed of the connection.
+
+        :param str command: The command to send.
+        """
+        async with self._send_lock:
+            for attempt in range(self.max_retries+1):
+                try:
+                    await self.connect()
+                    await asyncio.get_running_loop().run_in_executor(None, self._ws.send, command)
+                    return
+                except CONNECTION_ERRORS:
+                    await self.close()
+                    if attempt == self.max_retries:
+                        raise
+
+
+    async def send_item(self, item: 'Item'):
+        """
+        Gives an item to the player.
+
+        :param Item item: The item to give.
+        """
+        await self.send_command(f'give {item.get_snbt()}')
+
+
+    async def build_template_item(self, template: 'DFTemplate', compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> 'Item':
+        """
+        Builds the template item of a template in this connection's executor.
+
+        :param DFTemplate template: The template to build.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        """
+        async with self._build_semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, template.generate_template_item, compression_level)
+
+
+    async def send_template(self, template: 'DFTemplate', compression_level: int=DEFAULT_COMPRESSION_LEVEL):
+        """
+        Builds a template and gives its template item to the player.
+
+        :param DFTemplate template: The template to send.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        """
+        await self.send_item(await self.build_template_item(template, compression_level))
+
+
+    async def send_many(self, templates: list['DFTemplate'], compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> int:
+        """
+        Builds and sends multiple templates over this connection, in order.
+        Up to `max_concurrency` templates are built ahead of the one being sent.
+
+        :param list[DFTemplate] templates: The templates to send.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :return: 0 if all templates were sent, 1 if CodeClient could not be reached, 2 if sending failed.
+        """
+        pending_builds: deque[asyncio.Task] = deque()
+        template_iter = iter(templates)
+        
+        def schedule_builds():
+            while len(pending_builds) < self.max_concurrency:
+                template = next(template_iter, None)
+                if template is None:
+                    return
+                pending_builds.append(asyncio.ensure_future(self.build_template_item(template, compression_level)))
+        
+        try:
+            schedule_builds()
+            while pending_builds:
+                template_item = await pending_builds.popleft()
+                await self.send_item(template_item)
+                schedule_builds()
+        except ConnectionRefusedError:
+            print_connection_help()
+            return 1
+        except (TimeoutError, websocket.WebSocketTimeoutException):
+            print('Connection failed: Timed out.')
+            return 2
+        except CONNECTION_ERRORS as e:
+            print(f'Connection failed: {e}')
+            return 2
+        finally:
+            for build_task in pending_builds:
+                build_task.cancel()
+
+        print_send_success(len(templates))
+        return 0
+
+
+def _read_frames(ws: websocket.WebSocket):
+    """
+    Reads the frames CodeClient sends until the connection closes. Runs in the connection's reader thread.
+    Pings are answered with a pong, and a close is answered with a close before the connection is closed.
+    """
+    try:
+        while ws.connected:
+            try:
+                opcode, _ = ws.recv_data_frame()
+            except websocket.WebSocketTimeoutException:
+                continue
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                return
+    except CONNECTION_ERRORS:
+        # The connection was lost, so it is reopened by the next send
+        pass
+    finally:
+        ws.shutdown()
+
+
+def _close_websocket(ws: websocket.WebSocket, reader: threading.Thread, timeout: float|None):
+    """
+    Sends a close to CodeClient, waits for the reader thread to see its answer, then closes the socket.
+    """
+    sock = ws.sock
+    try:
+        ws.send_close()
+        reader.join(timeout)
+        if sock is not None:
+            # Wakes the reader thread if CodeClient did not answer
+            sock.shutdown(socket.SHUT_RDWR)
+    except CONNECTION_ERRORS:
+        pass
+    reader.join()
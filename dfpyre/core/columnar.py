@@ -0,0 +1,238 @@
+"""
+A columnar template representation for very large generated templates.
+"""
+
+import json
+from array import array
+from typing import Iterable, Iterator
+from dfpyre.util.util import PyreException, flatten
+from dfpyre.core.codeblock import CodeBlock, Target, build_codeblock
+from dfpyre.core.template import DFTemplate
+
+
+__all__ = ['ColumnarTemplate']
+
+
+class _InternTable:
+    """
+    Maps values to integer codes and back.
+    Values are compared by identity if `by_identity` is True, otherwise they must be hashable.
+    """
+    __slots__ = ('values', 'codes', 'by_identity')
+
+    def __init__(self, by_identity: bool=False):
+        self.values = []
+        self.codes = {}
+        self.by_identity = by_identity
+
+
+    def __getstate__(self):
+        return self.values, self.by_identity
+
+
+    def __setstate__(self, state):
+        # Object ids change when unpickled, so the codes are rebuilt
+        values, by_identity = state
+        self.values = values
+        self.by_identity = by_identity
+        self.codes = {(id(v) if by_identity else v): i for i, v in enumerate(values)}
+
+
+    def get_code(self, value) -> int:
+        key = id(value) if self.by_identity else value
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ColumnarTemplate(DFTemplate):
+    """
+    A template that stores its codeblocks in columns instead of as `CodeBlock` objects.
+
+    The type, action, target, data and tags of each codeblock are stored as integer codes in arrays,
+    and the args of all codeblocks are stored as item codes in one shared array. Repeated values are
+    only stored once, so large generated templates use much less memory and are faster to garbage collect.
+
+    Accessing `codeblocks` creates new `CodeBlock` objects, so changes to their fields are not stored.
+    Their items are the ones stored in this template though, so changing an item in place changes
+    every codeblock that uses it. Use `append`, `extend` and `insert` to change this template instead.
+    """
+    def __init__(self, codeblocks: Iterable[CodeBlock]=(), author: str='pyre'):
+        self.author = author
+        self._clear()
+        self.extend(codeblocks)
+
+
+    def _clear(self):
+        self._strings = _InternTable()
+        self._data = _InternTable()
+        self._tags = _InternTable()
+        self._items = _InternTable(by_identity=True)
+        self._type_codes = array('I')
+        self._action_codes = array('I')
+        self._target_codes = array('B')
+        self._data_codes = array('I')
+        self._tags_codes = array('I')
+        self._arg_starts = array('I', [0])  # The args of codeblock `i` are `_arg_codes[_arg_starts[i]:_arg_starts[i+1]]`
+        self._arg_codes = array('I')
+
+
+    @property
+    def codeblocks(self) -> list[CodeBlock]:
+        return list(self)
+
+
+    @codeblocks.setter
+    def codeblocks(self, codeblocks: Iterable[CodeBlock]):
+        self._clear()
+        self.extend(codeblocks)
+
+
+    def __len__(self) -> int:
+        return len(self._type_codes)
+
+
+    def __iter__(self) -> Iterator[CodeBlock]:
+        for i in range(len(self)):
+            yield self.get_codeblock(i)
+
+
+    def __getitem__(self, index: int) -> CodeBlock:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('codeblock index out of range')
+        return self.get_codeblock(index)
+
+
+    def __repr__(self) -> str:
+        return f'ColumnarTemplate(name: "{self.get_template_name()}", author: "{self.author}", codeblocks: {len(self)})'
+
+
+    @staticmethod
+    def from_code(template_code: str, preserve_item_slots: bool=True, author: str='pyre') -> 'ColumnarTemplate':
+        """
+        Create a columnar template from an existing template code.
+        Codeblocks are decoded one at a time, so the whole template is never stored as `CodeBlock` objects.
+
+        :param str template_code: The base64 string to create a template from.
+        :param bool preserve_item_slots: If True, the positions of items within chests will be saved.
+        :param str author: The author of this template.
+        """
+        return ColumnarTemplate(DFTemplate.iter_blocks(template_code, preserve_item_slots), author)
+
+
+    def to_template(self) -> DFTemplate:
+        """
+        Converts this template into a regular template with a list of `CodeBlock` objects.
+        """
+        return DFTemplate(self.codeblocks, self.author)
+
+
+    def to_columnar(self) -> 'ColumnarTemplate':
+        return self
+
+
+    def append(self, codeblock: CodeBlock):
+        """
+        Add a codeblock to the end of this template.
+
+        :param CodeBlock codeblock: The codeblock to add.
+        """
+        self._type_codes.append(self._strings.get_code(codeblock.type))
+        self._action_codes.append(self._strings.get_code(codeblock.action_name))
+        self._target_codes.append(codeblock.target.value)
+        self._data_codes.append(self._data.get_code(tuple(codeblock.data.items())))
+        self._tags_codes.append(self._tags.get_code(tuple(codeblock.tags.items())))
+        self._arg_codes.extend(self._items.get_code(a) for a in codeblock.args)
+        self._arg_starts.append(len(self._arg_codes))
+
+
+    def extend(self, codeblocks: Iterable[CodeBlock]):
+        """
+        Add codeblocks to the end of this template.
+
+        :param Iterable[CodeBlock] codeblocks: The codeblocks to add.
+        """
+        for codeblock in codeblocks:
+            self.append(codeblock)
+
+
+    def insert(self, insert_codeblocks: CodeBlock|list[CodeBlock], index: int=-1):
+        """
+        Insert `insert_codeblocks` into this template at `index`.
+        Inserting anywhere but the end rebuilds the columns.
+
+        :param CodeBlock|list[CodeBlock] insert_codeblocks: The block(s) to insert.
+        :param int index: The index to insert at.
+        :return: self
+        """
+        if isinstance(insert_codeblocks, list):
+            insert_codeblocks = list(flatten(insert_codeblocks))
+            if index == -1:
+                self.extend(insert_codeblocks)
+                return self
+            codeblocks = self.codeblocks
+            codeblocks[index:index] = insert_codeblocks
+        elif isinstance(insert_codeblocks, CodeBlock):
+            if index == -1:
+                self.append(insert_codeblocks)
+                return self
+            codeblocks = self.codeblocks
+            codeblocks.insert(index, insert_codeblocks)
+        else:
+            raise PyreException('Expected CodeBlock or list[CodeBlock] to insert.')
+
+        self.codeblocks = codeblocks
+        return self
+
+
+    def get_codeblock(self, index: int) -> CodeBlock:
+        """
+        Creates a `CodeBlock` object from the codeblock at `index`.
+
+        :param int index: The index of the codeblock.
+        """
+        items = self._items.values
+        return CodeBlock(
+            self._strings.values[self._type_codes[index]],
+            self._strings.values[self._action_codes[index]],
+            [items[c] for c in self._arg_codes[self._arg_starts[index]:self._arg_starts[index+1]]],
+            Target(self._target_codes[index]),
+            dict(self._data.values[self._data_codes[index]]),
+            dict(self._tags.values[self._tags_codes[index]]),
+            normalized_args=True
+        )
+
+
+    def _get_first_block_data(self) -> dict:
+        return dict(self._data.values[self._data_codes[0]])
+
+
+    def _build_block_strings(self) -> list[str]:
+        strings = self._strings.values
+        data_values = self._data.values
+        tags_values = self._tags.values
+        items = self._items.values
+        arg_starts = self._arg_starts
+        arg_codes = self._arg_codes
+
+        # Codeblocks with the same codes build to the same JSON, so each one is only built once
+        built_blocks: dict[tuple, str] = {}
+        block_strings = []
+        for i, block_codes in enumerate(zip(self._type_codes, self._action_codes, self._target_codes, self._data_codes, self._tags_codes)):
+            block_key = (block_codes, arg_codes[arg_starts[i]:arg_starts[i+1]].tobytes())
+            block_string = built_blocks.get(block_key)
+            if block_string is None:
+                type_code, action_code, target_code, data_code, tags_code = block_codes
+                args = [items[c] for c in arg_codes[arg_starts[i]:arg_starts[i+1]]]
+                built_block = build_codeblock(
+                    strings[type_code], strings[action_code], args, Target(target_code),
+                    dict(data_values[data_code]), dict(tags_values[tags_code])
+                )
+                block_string = json.dumps(built_block, separators=(',', ':'))
+                built_blocks[block_key] = block_string
+            block_strings.append(block_string)
+        return block_strings
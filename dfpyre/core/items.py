@@ -4,13 +4,14 @@ Class definitions for code items.
 
 from enum import Enum
 import re
+from functools import lru_cache, wraps
 from typing import Literal, Union
-import websocket
-from mcitemlib.itemlib import Item as NbtItem, MCItemlibException
+from mcitemlib.itemlib import Item as NbtItem, MCItemlibException, DEFAULT_SNBT_FORMAT
 from rapidnbt import DoubleTag, StringTag, CompoundTag
 from dfpyre.util.style import is_ampersand_coded, ampersand_to_minimessage
-from dfpyre.util.util import PyreException, warn, is_number, COL_SUCCESS, COL_ERROR, COL_RESET
+from dfpyre.util.util import PyreException, warn, is_number, COL_SUCCESS, COL_RESET
 from dfpyre.util.codeitem import CodeItem, add_slot
+from dfpyre.core.codeclient import CodeClientConnection, CODECLIENT_URL, print_connection_help
 from dfpyre.export.particle_item import Particle
 from dfpyre.gen.action_literals import GAME_VALUE_NAME, SOUND_NAME, POTION_NAME
 
@@ -21,44 +22,135 @@ VAR_ITEM_TYPES = [
     'Vector', 'Vec', 'ParameterType', 'Parameter'
 ]
 
-__all__ = ['convert_literals', 'item_from_dict', 'CodeItem', 'ArgValue', 'VAR_ITEM_TYPES'] + VAR_ITEM_TYPES
+__all__ = ['convert_literals', 'set_string_conversion', 'get_string_conversion', 'item_from_dict', 'CodeItem', 'ArgValue', 'VAR_ITEM_TYPES'] + VAR_ITEM_TYPES
 
 
 PARAMETER_TYPE_LOOKUP = ['txt', 'comp', 'num', 'loc', 'vec', 'snd', 'part', 'pot', 'item', 'any', 'var', 'list', 'dict']
 
-VAR_SHORTHAND_REGEX = r'^\$([gsli]) (.+)$'
+VAR_SHORTHAND_REGEX = re.compile(r'^\$([gsli]) (.+)$')
 VAR_SCOPE_LOOKUP = {'g': 'unsaved', 's': 'saved', 'l': 'local', 'i': 'line'}
 
-CODECLIENT_URL = 'ws://localhost:31375'
+# Maximum number of distinct literals of each item type that are interned
+LITERAL_CACHE_SIZE = 4096
 
 # Valid types that can be passed as args for a CodeBlock function
 ArgValue = Union["CodeItem", str, int, float]
 
 
 def convert_literals(arg: ArgValue) -> CodeItem:
-    if type(arg) in {int, float}:
-        return Number(arg)
+    """
+    Converts a python literal into a code item.
+
+    Items made from repeated literals are interned, so they are shared between codeblocks
+    and cannot be changed in place. Copies of them can be changed.
+    """
+    arg_type = type(arg)
+    if arg_type is str:
+        return _convert_string(arg)
+    
+    if arg_type is int or arg_type is float:
+        return _intern_number(arg)
+
+    if isinstance(arg, str):
+        return _convert_string(arg)
+    
+    return arg
+
+
+def set_string_conversion(item_type: type['String']|type['Text']):
+    """
+    Sets the item type that python strings are converted to.
+    Strings are converted to `String` by default.
+
+    :param type[String]|type[Text] item_type: `String` or `Text`.
+    """
+    global _string_conversion
+    if item_type not in {String, Text}:
+        raise PyreException(f'Strings can only be converted to String or Text, not {item_type}.')
+    _string_conversion = item_type
+    _convert_string.cache_clear()
+
+
+def get_string_conversion() -> type['String']|type['Text']:
+    """
+    Returns the item type that python strings are converted to.
+    """
+    return _string_conversion
+
 
-    elif isinstance(arg, str):
-        shorthand_match = re.match(VAR_SHORTHAND_REGEX, arg)
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def _convert_string(value: str) -> CodeItem:
+    # Most strings aren't var shorthands, so the regex is only run on strings that start like one
+    if value[:1] == '$':
+        shorthand_match = VAR_SHORTHAND_REGEX.match(value)
         if shorthand_match:
             scope = VAR_SCOPE_LOOKUP[shorthand_match.group(1)]
-            return Variable(shorthand_match.group(2), scope)
-        
-        return String(arg)
+            return _intern_variable(shorthand_match.group(2), scope)
     
-    return arg
+    if _string_conversion is Text:
+        return Text(value)
+    return _intern_string(value)
+
+
+@lru_cache(maxsize=LITERAL_CACHE_SIZE, typed=True)
+def _intern_number(num: int|float|str) -> 'Number':
+    return _intern(Number(num))
+
+
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def _intern_string(value: str) -> 'String':
+    return _intern(String(value))
+
+
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def _intern_variable(name: str, scope: str) -> 'Variable':
+    return _intern(Variable(name, scope))
 
 
-class String(CodeItem):
+def _intern(item: '_InternableItem') -> CodeItem:
+    object.__setattr__(item, '_interned', True)
+    return item
+
+
+class _InternableItem:
+    """
+    Mixin for the item types that literals are interned as.
+    Interned items are shared by every identical literal, so they cannot be changed.
+
+    Subclasses set their fields with `object.__setattr__`, so only changes made afterwards are checked.
+    """
+    __slots__ = ()
+    _init_fields: tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value):
+        if getattr(self, '_interned', False):
+            item_type_name = type(self).__name__
+            raise PyreException(f'{item_type_name} items made from literals are shared and cannot be changed. Make a new {item_type_name} instead.')
+        object.__setattr__(self, name, value)
+    
+    def __delattr__(self, name: str):
+        if getattr(self, '_interned', False):
+            self.__setattr__(name, None)  # Raises the same error
+        object.__delattr__(self, name)
+    
+    def __reduce__(self):
+        # Copies are not shared, so they can be changed
+        return (type(self), tuple(getattr(self, n) for n in self._init_fields))
+
+
+class String(_InternableItem, CodeItem):
     """
     Represents a DiamondFire string object. (`txt`)
     """
+    __slots__ = ('value', '_interned')
     type = 'txt'
+    _init_fields = ('value', 'slot')
 
     def __init__(self, value: str, slot: int|None=None):
-        super().__init__(slot)
-        self.value = value
+        # Set directly, since changes made after an item is made are checked
+        _set = object.__setattr__
+        _set(self, 'slot', slot)
+        _set(self, 'value', value)
     
     def format(self, slot: int|None):
         formatted_dict = {"item": {"id": self.type, "data": {"name": self.value}}}
@@ -75,6 +167,7 @@ class Text(CodeItem):
     """
     Represents a DiamondFire styled text object (`comp`)
     """
+    __slots__ = ('value',)
     type = 'comp'
 
     def __init__(self, value: str, slot: int|None=None):
@@ -93,15 +186,22 @@ class Text(CodeItem):
         return f'{self.__class__.__name__}("{self.value}")'
 
 
-class Number(CodeItem):
+# The item type that python strings are converted to
+_string_conversion: type[String]|type[Text] = String
+
+
+class Number(_InternableItem, CodeItem):
     """
     Represents a DiamondFire number object.
     """
+    __slots__ = ('value', '_interned')
     type = 'num'
+    _init_fields = ('value', 'slot')
 
     def __init__(self, num: int|float|str, slot: int|None=None):
-        super().__init__(slot)
-        self.value = num
+        _set = object.__setattr__
+        _set(self, 'slot', slot)
+        _set(self, 'value', num)
     
     def format(self, slot: int|None):
         formatted_dict = {"item": {"id": self.type, "data": {"name": str(self.value)}}}
@@ -114,15 +214,52 @@ class Number(CodeItem):
 Num = Number  # Number alias
 
 
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def _get_new_item_snbt(item_id: str, count: int) -> str:
+    return NbtItem(item_id, count).get_snbt()
+
+
 class Item(CodeItem, NbtItem):
     """
     Represents a Minecraft item.
+
+    The snbt of this item is cached until it is changed with one of its methods.
+    Call `invalidate` after changing `nbt` directly.
     """
     type = 'item'
 
     def __init__(self, item_id: str, count: int=1, slot: int | None=None):
         NbtItem.__init__(self, item_id, count)
         CodeItem.__init__(self, slot)
+        # Items that haven't been changed since they were created share their snbt
+        self._new_item_key = (item_id, count)
+
+    def __setattr__(self, name: str, value):
+        if name == 'nbt':
+            self.invalidate()
+        object.__setattr__(self, name, value)
+
+    def invalidate(self):
+        """
+        Clears the cached snbt of this item.
+        Call this after changing the `nbt` of this item directly.
+        """
+        object.__setattr__(self, '_snbt', None)
+        object.__setattr__(self, '_new_item_key', None)
+
+    def get_snbt(self, format=DEFAULT_SNBT_FORMAT, indent: int=0) -> str:
+        """
+        Returns the raw snbt data of this item.
+        """
+        if format != DEFAULT_SNBT_FORMAT or indent:
+            return NbtItem.get_snbt(self, format, indent)
+        if self._snbt is None:
+            if self._new_item_key is not None:
+                snbt = _get_new_item_snbt(*self._new_item_key)
+            else:
+                snbt = NbtItem.get_snbt(self)
+            object.__setattr__(self, '_snbt', snbt)
+        return self._snbt
 
     def format(self, slot: int|None):
         formatted_dict = {"item": {"id": self.type, "data": {"item": self.get_snbt()}}}
@@ -132,6 +269,10 @@ class Item(CodeItem, NbtItem):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.get_id()}, {self.get_count()})'
     
+    def __reduce__(self):
+        # NBT tags can't be pickled directly, so pickle the snbt string instead
+        return (_item_from_snbt, (self.get_snbt(), self.slot))
+    
     def set_tag(self, tag_name: str, tag_value: str|int|float|String|Number):
         """
         Add a DiamondFire custom tag to this item.
@@ -155,9 +296,9 @@ class Item(CodeItem, NbtItem):
             custom_data_tag = CompoundTag()
             pbv_tag = CompoundTag()
         
-        custom_data_tag['PublicBukkitValues'] = pbv_tag
-        
+        # Tags are copied when they are assigned, so the new tag is added first
         pbv_tag[f'hypercube:{tag_name}'] = tag
+        custom_data_tag['PublicBukkitValues'] = pbv_tag
         self.set_component('minecraft:custom_data', custom_data_tag)
     
     def get_tag(self, tag_name: str) -> str|float|None:
@@ -180,10 +321,11 @@ class Item(CodeItem, NbtItem):
         if df_tag_value.is_null():
             return None
         
-        if isinstance(df_tag_value, DoubleTag):
-            return float(df_tag_value)
-        if isinstance(df_tag_value, StringTag):
-            return str(df_tag_value)
+        # Tags inside a compound are returned as variants, not as `DoubleTag` or `StringTag`
+        if df_tag_value.is_number():
+            return df_tag_value.get_double()
+        if df_tag_value.is_string():
+            return df_tag_value.get_string()
     
     def remove_tag(self, tag_name: str):
         """
@@ -198,27 +340,25 @@ class Item(CodeItem, NbtItem):
 
         return True
     
-    def send_to_minecraft(self):
+    def send_to_minecraft(self, connection: CodeClientConnection|None=None):
         """
         Sends this item to Minecraft automatically.
+
+        :param CodeClientConnection|None connection: An open connection to send with. If not given, a new connection is opened and closed.
         """
         try:
-            ws = websocket.WebSocket()
-            ws.connect(CODECLIENT_URL)
-            print(f'{COL_SUCCESS}Connected.{COL_RESET}')
-
-            command = f'give {self.get_snbt()}'
-            ws.send(command)
-            ws.close()
+            if connection is not None:
+                connection.send_item(self)
+            else:
+                with CodeClientConnection() as new_connection:
+                    print(f'{COL_SUCCESS}Connected.{COL_RESET}')
+                    new_connection.send_item(self)
 
             print(f'{COL_SUCCESS}Item sent to client successfully.{COL_RESET}')
             return 0
             
         except ConnectionRefusedError as e:
-            print(f'{COL_ERROR}Could not connect to CodeClient API. Possible problems:')
-            print(f'    - Minecraft is not open')
-            print(f'    - CodeClient is not installed (get it here: https://modrinth.com/mod/codeclient)')
-            print(f'    - CodeClient API is not enabled (enable it in CodeClient general settings){COL_RESET}')
+            print_connection_help()
             return 1
 
         except Exception as e:
@@ -226,10 +366,30 @@ class Item(CodeItem, NbtItem):
             return 2
 
 
+def _invalidating_method(method):
+    @wraps(method)
+    def wrapper(self: Item, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate()
+    return wrapper
+
+for _method_name in [n for n in dir(Item) if n.startswith('set_')] + ['remove_tag']:
+    setattr(Item, _method_name, _invalidating_method(getattr(Item, _method_name)))
+
+
+def _item_from_snbt(snbt: str, slot: int|None) -> Item:
+    item = Item.from_snbt(snbt)
+    item.slot = slot
+    return item
+
+
 class Location(CodeItem):
     """
     Represents a DiamondFire location object.
     """
+    __slots__ = ('x', 'y', 'z', 'pitch', 'yaw')
     type = 'loc'
 
     def __init__(self, x: float=0, y: float=0, z: float=0, pitch: float=0, yaw: float=0, slot: int | None=None):
@@ -263,19 +423,22 @@ class Location(CodeItem):
 Loc = Location  # Location alias
 
 
-class Variable(CodeItem):
+class Variable(_InternableItem, CodeItem):
     """
     Represents a DiamondFire variable object.
     """
+    __slots__ = ('name', 'scope', '_interned')
     type = 'var'
+    _init_fields = ('name', 'scope', 'slot')
 
     def __init__(self, name: str, scope: Literal['unsaved', 'game', 'saved', 'local', 'line']='unsaved', slot: int | None=None):
-        super().__init__(slot)
-        self.name = name
+        _set = object.__setattr__
+        _set(self, 'slot', slot)
+        _set(self, 'name', name)
 
         if scope == 'game':
             scope = 'unsaved'
-        self.scope = scope
+        _set(self, 'scope', scope)
 
     def format(self, slot: int|None):
         formatted_dict = {"item": {"id": self.type,"data": {"name": self.name, "scope": self.scope}}}
@@ -292,6 +455,7 @@ class Sound(CodeItem):
     """
     Represents a DiamondFire sound object.
     """
+    __slots__ = ('name', 'pitch', 'vol')
     type = 'snd'
 
     def __init__(self, name: SOUND_NAME, pitch: float=1.0, vol: float=2.0, slot: int | None=None):
@@ -318,6 +482,7 @@ class Potion(CodeItem):
     """
     Represents a DiamondFire potion object.
     """
+    __slots__ = ('name', 'dur', 'amp')
     type = 'pot'
 
     def __init__(self, name: POTION_NAME, dur: int=1000000, amp: int=0, slot: int | None=None):
@@ -345,6 +510,7 @@ class GameValue(CodeItem):
     """
     Represents a DiamondFire game value object.
     """
+    __slots__ = ('name', 'target')
     type = 'g_val'
 
     def __init__(self, name: GAME_VALUE_NAME, target: str='Default', slot: int | None=None):
@@ -369,6 +535,7 @@ class Vector(CodeItem):
     """
     Represents a DiamondFire vector object.
     """
+    __slots__ = ('x', 'y', 'z')
     type = 'vec'
 
     def __init__(self, x: float=0.0, y: float=0.0, z: float=0.0, slot: int | None=None):
@@ -410,6 +577,7 @@ class Parameter(CodeItem):
     """
     Represents a DiamondFire parameter object.
     """
+    __slots__ = ('name', 'param_type', 'plural', 'optional', 'description', 'note', 'default_value')
     type = 'pn_el'
 
     def __init__(self, name: str, param_type: ParameterType, plural: bool=False, optional: bool=False, 
@@ -458,6 +626,7 @@ class _Tag(CodeItem):
     """
     Represents a CodeBlock action tag.
     """
+    __slots__ = ('tag_data',)
     type = 'bl_tag'
 
     def __init__(self, tag_data: dict, slot: int | None=None):
@@ -495,7 +664,6 @@ def item_from_dict(item_dict: dict, preserve_item_slots: bool):
             num_value = float(item_data['name'])
             if num_value % 1 == 0:
                 num_value = int(num_value)
-            return Number(num_value, item_slot)
         return Number(num_value, item_slot)
     
     elif item_id == 'loc':
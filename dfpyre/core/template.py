@@ -4,20 +4,33 @@ A package for making code templates for the DiamondFire Minecraft server.
 By Amp
 """
 
+import os
+import re
 import json
+import hashlib
 import datetime
 import platform
+from typing import Iterator, TextIO, TYPE_CHECKING
+from dataclasses import dataclass
 from rapidnbt import CompoundTag, StringTag, DoubleTag
-from dfpyre.util.util import df_encode, df_decode, flatten, deprecated
+from dfpyre.util.util import PyreException, warn, df_encode, df_decode, df_decode_chunks, flatten, deprecated, set_gzip_backend, get_gzip_backend, DEFAULT_COMPRESSION_LEVEL
 from dfpyre.core.items import *
-from dfpyre.core.codeblock import CodeBlock, Target, TARGETS, DEFAULT_TARGET, CONDITIONAL_CODEBLOCKS, TEMPLATE_STARTERS, EVENT_CODEBLOCKS
-from dfpyre.core.actiondump import get_default_tags
+from dfpyre.core.codeblock import CodeBlock, Target, STRUCTURE_HASH_SIZE, TARGETS, DEFAULT_TARGET, CONDITIONAL_CODEBLOCKS, TEMPLATE_STARTERS, EVENT_CODEBLOCKS
+from dfpyre.core.actiondump import get_default_tags, get_actiondump_hash
+from dfpyre.util.cache import BuildCache
+from dfpyre.core.codeclient import CodeClientConnection, AsyncCodeClientConnection
 from dfpyre.gen.action_literals import *
 from dfpyre.tool.scriptgen import generate_script, GeneratorFlags
-from dfpyre.tool.slice import slice_template
+from dfpyre.tool.slice import slice_template, get_slice_costs, SliceCost
+from dfpyre.tool.diff import TemplateDiff, get_block_hash, diff_block_hashes
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from dfpyre.core.columnar import ColumnarTemplate
 
 __all__ = [
-    'Target', 'CodeBlock', 'DFTemplate',
+    'Target', 'CodeBlock', 'DFTemplate', 'TemplateBuildResult', 'SliceCost', 'TemplateDiff', 'CodeClientConnection', 'AsyncCodeClientConnection',
+    'BuildCache', 'set_build_cache', 'get_build_cache', 'set_string_conversion', 'get_string_conversion', 'set_gzip_backend', 'get_gzip_backend'
 ] + VAR_ITEM_TYPES
 
 
@@ -25,6 +38,174 @@ DYNAMIC_CODEBLOCKS = {'func', 'process', 'call_func', 'start_process'}
 
 DATE_FORMAT_STR = "%b %#d, %Y" if platform.system() == "Windows" else "%b %-d, %Y"
 
+BLOCKS_START_REGEX = re.compile(r'\s*\{\s*"blocks"\s*:\s*\[')
+BLOCKS_START_MAX_LENGTH = 64
+BLOCK_SEPARATOR_CHARS = frozenset(' \t\r\n,')
+JSON_DECODER = json.JSONDecoder()
+
+# Number of batches to give each worker when building templates in parallel
+BUILD_BATCHES_PER_WORKER = 4
+
+# Bump when the way codeblocks are built changes, so old structure hashes no longer match
+STRUCTURE_HASH_VERSION = 1
+
+# The cache that templates are built with
+_build_cache: BuildCache|None = None
+
+
+def set_build_cache(build_cache: BuildCache|None):
+    """
+    Sets the cache that `DFTemplate.build` stores template codes in.
+    Templates with the same structure hash as a cached template are not built again.
+    Builds are not cached by default.
+
+    :param BuildCache|None build_cache: The cache to use, or None to stop caching.
+    """
+    global _build_cache
+    _build_cache = build_cache
+
+
+def get_build_cache() -> BuildCache|None:
+    """
+    Returns the cache that `DFTemplate.build` stores template codes in.
+    """
+    return _build_cache
+
+
+@dataclass
+class TemplateBuildResult:
+    """
+    The result of building a single template with `DFTemplate.build_many`.
+    """
+    template_code: str | None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _build_template_batch(templates: list['DFTemplate'], compression_level: int, gzip_backend: str) -> list[TemplateBuildResult]:
+    # Workers that are not forked don't have the backend set in the main process
+    if get_gzip_backend() != gzip_backend:
+        set_gzip_backend(gzip_backend)
+    results = []
+    for template in templates:
+        try:
+            results.append(TemplateBuildResult(template.build(compression_level)))
+        except Exception as e:
+            results.append(TemplateBuildResult(None, e))
+    return results
+
+
+def _codeblock_from_dict(block_dict: dict, preserve_item_slots: bool) -> CodeBlock:
+    """
+    Creates a codeblock from its template JSON representation.
+    """
+    block_tags = get_default_tags(block_dict.get('block'), block_dict.get('action'))
+    block_args = []
+    if 'args' in block_dict:
+        for item_dict in block_dict['args']['items']:
+            if item_dict['item'].get('id') == 'bl_tag':
+                tag_data = item_dict['item']['data']
+                block_tags[tag_data['tag']] = tag_data['option']
+            parsed_item = item_from_dict(item_dict, preserve_item_slots)
+            if parsed_item is not None:
+                block_args.append(parsed_item)
+
+    codeblock_target = Target(TARGETS.index(block_dict['target'])) if 'target' in block_dict else DEFAULT_TARGET
+    codeblock_type = block_dict.get('block')
+
+    if codeblock_type is None:
+        return CodeBlock.new_bracket(block_dict['direct'], block_dict['type'])
+    
+    if codeblock_type == 'else':
+        return CodeBlock.new_else()
+    
+    if codeblock_type in DYNAMIC_CODEBLOCKS:
+        return CodeBlock.new_data(codeblock_type, block_dict['data'], block_args, block_tags, normalized_args=True)
+    
+    if 'action' not in block_dict:
+        raise PyreException(f'Codeblock of type "{codeblock_type}" is missing an action.')
+    
+    codeblock_action = block_dict['action']
+    attribute = block_dict.get('attribute')
+    inverted = attribute == 'NOT'
+    sub_action = block_dict.get('subAction')
+    if sub_action is not None:
+        return CodeBlock.new_subaction_block(codeblock_type, codeblock_action, block_args, block_tags, sub_action, inverted, normalized_args=True)
+    if codeblock_type in EVENT_CODEBLOCKS:
+        ls_cancel = attribute == 'LS-CANCEL'
+        return CodeBlock.new_event(codeblock_type, codeblock_action, ls_cancel)
+    if codeblock_type in CONDITIONAL_CODEBLOCKS:
+        return CodeBlock.new_conditional(codeblock_type, codeblock_action, block_args, block_tags, inverted, codeblock_target, normalized_args=True)
+    return CodeBlock.new_action(codeblock_type, codeblock_action, block_args, block_tags, codeblock_target, normalized_args=True)
+
+
+def _iter_block_dicts(template_code: str, raw: bool=False) -> Iterator[dict|str]:
+    """
+    Incrementally decodes a template code and yields each block dictionary
+    from its `blocks` list as soon as it has been fully decompressed.
+    If `raw` is True, the compact JSON string of each block is yielded instead.
+    """
+    decoded_chunks = df_decode_chunks(template_code)
+    buffer = ''
+    position = 0
+
+    def read_more() -> bool:
+        nonlocal buffer, position
+        chunk = next(decoded_chunks, None)
+        if chunk is None:
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+    
+    # Find the start of the blocks list
+    while (blocks_start := BLOCKS_START_REGEX.match(buffer)) is None:
+        if len(buffer) > BLOCKS_START_MAX_LENGTH or not read_more():
+            # Blocks aren't at the start of the template, so decode it normally
+            block_dicts = json.loads(buffer + ''.join(decoded_chunks))['blocks']
+            if raw:
+                yield from (json.dumps(b, separators=(',', ':')) for b in block_dicts)
+            else:
+                yield from block_dicts
+            return
+    position = blocks_start.end()
+
+    while True:
+        # Skip separators between blocks
+        while True:
+            while position < len(buffer) and buffer[position] in BLOCK_SEPARATOR_CHARS:
+                position += 1
+            if position < len(buffer):
+                break
+            if not read_more():
+                raise PyreException('Template data ended before the end of the blocks list.')
+        
+        if buffer[position] == ']':
+            return
+        
+        block_start = position
+        try:
+            block_dict, position = JSON_DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The block has not been fully decompressed yet
+            if not read_more():
+                raise
+            continue
+        yield buffer[block_start:position] if raw else block_dict
+
+
+def _iter_block_strings(template: 'DFTemplate|str') -> Iterator[str]:
+    """
+    Yields the built JSON of each codeblock in a template or template code.
+    """
+    if isinstance(template, str):
+        yield from _iter_block_dicts(template, raw=True)
+    else:
+        yield from template._build_block_strings()
+
 
 class DFTemplate:
     """
@@ -41,13 +222,17 @@ class DFTemplate:
         
         :return: Template name
         """
-        first_block_data = self.codeblocks[0].data
+        first_block_data = self._get_first_block_data()
         if 'data' in first_block_data:
             name = first_block_data['data']
             return name if name else 'Unnamed Template'
         return first_block_data['block'] + '_' + first_block_data['action']
 
 
+    def _get_first_block_data(self) -> dict:
+        return self.codeblocks[0].data
+
+
     @deprecated('Use get_template_name instead')
     def _get_template_name(self):
         return self.get_template_name()
@@ -67,58 +252,31 @@ class DFTemplate:
         :param str author: The author of this template.
         """
         template_dict = json.loads(df_decode(template_code))
-        codeblocks: list[CodeBlock] = []
-        for block_dict in template_dict['blocks']:
-            block_tags = get_default_tags(block_dict.get('block'), block_dict.get('action'))
-            if 'args' in block_dict:
-                block_args = []
-                for item_dict in block_dict['args']['items']:
-                    if item_dict['item'].get('id') == 'bl_tag':
-                        tag_data = item_dict['item']['data']
-                        block_tags[tag_data['tag']] = tag_data['option']
-                    parsed_item = item_from_dict(item_dict, preserve_item_slots)
-                    if parsed_item is not None:
-                        block_args.append(parsed_item)
-
-            codeblock_target = Target(TARGETS.index(block_dict['target'])) if 'target' in block_dict else DEFAULT_TARGET
-            codeblock_type = block_dict.get('block')
-
-            if codeblock_type is None:
-                codeblock = CodeBlock.new_bracket(block_dict['direct'], block_dict['type'])
-            
-            elif codeblock_type == 'else':
-                codeblock = CodeBlock.new_else()
-            
-            elif codeblock_type in DYNAMIC_CODEBLOCKS:
-                codeblock = CodeBlock.new_data(codeblock_type, block_dict['data'], block_args, block_tags)
-            
-            elif 'action' in block_dict:
-                codeblock_action = block_dict['action']
-                attribute = block_dict.get('attribute')
-                inverted = attribute == 'NOT'
-                sub_action = block_dict.get('subAction')
-                if sub_action is not None:
-                    codeblock = CodeBlock.new_subaction_block(codeblock_type, codeblock_action, block_args, block_tags, sub_action, inverted)
-                elif codeblock_type in EVENT_CODEBLOCKS:
-                    ls_cancel = attribute == 'LS-CANCEL'
-                    codeblock = CodeBlock.new_event(codeblock_type, codeblock_action, ls_cancel)
-                elif codeblock_type in CONDITIONAL_CODEBLOCKS:
-                    codeblock = CodeBlock.new_conditional(codeblock_type, codeblock_action, block_args, block_tags, inverted, codeblock_target)
-                else:
-                    codeblock = CodeBlock.new_action(codeblock_type, codeblock_action, block_args, block_tags, codeblock_target)
-            
-            codeblocks.append(codeblock)
-        
+        codeblocks = [_codeblock_from_dict(b, preserve_item_slots) for b in template_dict['blocks']]
         return DFTemplate(codeblocks, author)
 
 
-    def generate_template_item(self) -> Item:
+    @staticmethod
+    def iter_blocks(template_code: str, preserve_item_slots: bool=True) -> Iterator[CodeBlock]:
+        """
+        Iterate over the codeblocks of an existing template code without decoding the whole template at once.
+        Useful for scanning many templates, since iteration can be stopped early.
+
+        :param str template_code: The base64 string to read codeblocks from.
+        :param bool preserve_item_slots: If True, the positions of items within chests will be saved.
+        """
+        for block_dict in _iter_block_dicts(template_code):
+            yield _codeblock_from_dict(block_dict, preserve_item_slots)
+
+
+    def generate_template_item(self, compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> Item:
         """
         Create an item from this template.
 
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
         :return: Template item
         """
-        template_code = self.build()
+        template_code = self.build(compression_level)
 
         now = datetime.datetime.now()
         name = self.get_template_name()
@@ -157,7 +315,7 @@ class DFTemplate:
             if index == -1:
                 self.codeblocks.extend(insert_codeblocks)
             else:
-                self.codeblocks[index:index+len(insert_codeblocks)] = insert_codeblocks
+                self.codeblocks[index:index] = insert_codeblocks
         elif isinstance(insert_codeblocks, CodeBlock):
             if index == -1:
                 index = len(self.codeblocks)
@@ -167,54 +325,205 @@ class DFTemplate:
         return self
 
 
-    def build(self) -> str:
+    def build(self, compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> str:
         """
         Build this template.
 
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
         :return: String containing encoded template data.
         """
-        template_dict_blocks = [codeblock.build() for codeblock in self.codeblocks]
-        template_dict = {'blocks': template_dict_blocks}
-        first_block = template_dict_blocks[0]
-        if first_block['block'] not in TEMPLATE_STARTERS:
+        build_cache = _build_cache
+        if build_cache is not None:
+            cache_key = f'{self.get_structure_hash()}-{get_gzip_backend()}-{compression_level}'
+            cached_template_code = build_cache.get(cache_key)
+            if cached_template_code is not None:
+                return cached_template_code
+
+        block_strings = self._build_block_strings()
+        if self._get_first_block_data().get('block') not in TEMPLATE_STARTERS:
             warn('Template does not start with an event, function, or process.')
 
-        json_string = json.dumps(template_dict, separators=(',', ':'))
-        return df_encode(json_string)
+        json_string = '{"blocks":[' + ','.join(block_strings) + ']}'
+        template_code = df_encode(json_string, compression_level)
+        if build_cache is not None:
+            try:
+                build_cache.put(cache_key, template_code)
+            except OSError:
+                pass  # Cache directory is not writable, so just skip caching
+        return template_code
+
+
+    def get_structure_hash(self) -> str:
+        """
+        Returns a hash of the codeblocks of this template, including their args, tags and targets.
+        Templates that build to the same code have the same hash, but unlike the built code,
+        the hash is computed without building and is the same every time.
+
+        :return: Hex digest of the structure of this template.
+        """
+        structure_hash = hashlib.blake2b(f'{STRUCTURE_HASH_VERSION}-{get_actiondump_hash()}'.encode(), digest_size=STRUCTURE_HASH_SIZE)
+        for codeblock in self.codeblocks:
+            structure_hash.update(codeblock.get_structure_hash())
+        return structure_hash.hexdigest()
+
+
+    def _build_block_strings(self) -> list[str]:
+        return [codeblock.build_json() for codeblock in self.codeblocks]
     
 
-    def build_and_send(self) -> int:
+    @staticmethod
+    def build_many(templates: list['DFTemplate'], workers: int|None=None, executor: 'Executor|None'=None,
+                   compression_level: int=DEFAULT_COMPRESSION_LEVEL) -> list[TemplateBuildResult]:
+        """
+        Build multiple templates in parallel.
+        A template that fails to build does not stop the others from building.
+
+        :param list[DFTemplate] templates: The templates to build.
+        :param int|None workers: The number of worker processes to use. Defaults to the number of CPUs.
+        :param Executor|None executor: An existing executor to build with instead of creating a process pool.
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :return: A build result for each template, in the same order as `templates`.
+        """
+        if not templates:
+            return []
+        
+        if executor is None and workers == 1:
+            return _build_template_batch(templates, compression_level, get_gzip_backend())
+        
+        worker_count = workers or os.cpu_count() or 1
+        batch_size = max(1, len(templates) // (worker_count * BUILD_BATCHES_PER_WORKER))
+        batches = [templates[i:i+batch_size] for i in range(0, len(templates), batch_size)]
+
+        gzip_backend = get_gzip_backend()
+
+        def collect_results(pool: 'Executor') -> list[TemplateBuildResult]:
+            futures = [pool.submit(_build_template_batch, b, compression_level, gzip_backend) for b in batches]
+            results: list[TemplateBuildResult] = []
+            for batch, future in zip(batches, futures):
+                try:
+                    results.extend(future.result())
+                except Exception:
+                    # The batch could not be sent to or received from the worker,
+                    # so retry each template on its own to find which ones failed
+                    for template in batch:
+                        try:
+                            results.extend(pool.submit(_build_template_batch, [template], compression_level, gzip_backend).result())
+                        except Exception as e:
+                            results.append(TemplateBuildResult(None, e))
+            return results
+        
+        if executor is not None:
+            return collect_results(executor)
+        # Imported here since concurrent.futures is slow to import and only needed for parallel builds
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            return collect_results(pool)
+
+
+    def build_and_send(self, compression_level: int=DEFAULT_COMPRESSION_LEVEL, connection: CodeClientConnection|None=None) -> int:
         """
         Builds this template and sends it to DiamondFire automatically.
+
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :param CodeClientConnection|None connection: An open connection to send with. If not given, a new connection is opened and closed.
+        """
+        template_item = self.generate_template_item(compression_level)
+        return template_item.send_to_minecraft(connection)
+
+
+    async def abuild_and_send(self, compression_level: int=DEFAULT_COMPRESSION_LEVEL, connection: AsyncCodeClientConnection|None=None) -> int:
+        """
+        Builds this template in an executor and sends it to DiamondFire without blocking the event loop.
+
+        :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :param AsyncCodeClientConnection|None connection: An open connection to send with. If not given, a new connection is opened and closed.
         """
-        template_item = self.generate_template_item()
-        return template_item.send_to_minecraft()
+        if connection is not None:
+            return await connection.send_many([self], compression_level)
+        
+        new_connection = AsyncCodeClientConnection()
+        try:
+            return await new_connection.send_many([self], compression_level)
+        finally:
+            await new_connection.close()
     
     
     def generate_script(self, indent_size: int=4, literal_shorthand: bool=True, var_shorthand: bool=False, 
                         preserve_slots: bool=False, assign_variable: bool=False, include_import: bool=True, 
-                        build_and_send: bool=False) -> str:
+                        build_and_send: bool=False, stream: TextIO|None=None) -> str|None:
         """
         Generate an equivalent python script for this template.
         
         :param int indent_size: The multiple of spaces to add when indenting lines.
-        :param bool literal_shorthand: If True, `Text` and `Number` items will be written as strings and ints respectively.
+        :param bool literal_shorthand: If True, `String` and `Number` items will be written as strings and ints respectively.
         :param bool var_shorthand: If True, all variables will be written using variable shorthand.
         :param bool preserve_slots: If True, the positions of items within chests will be saved.
         :param bool assign_variable: If True, the generated template will be assigned to a variable.
         :param bool include_import: If True, the `dfpyre` import statement will be added.
         :param bool build_and_send: If True, `.build_and_send()` will be added to the end of the generated template.
+        :param TextIO|None stream: If given, the script is written to this stream as it is generated instead of being returned.
         """
         flags = GeneratorFlags(indent_size, literal_shorthand, var_shorthand, preserve_slots, assign_variable, include_import, build_and_send)
-        return generate_script(self.codeblocks, flags)
+        return generate_script(self.codeblocks, flags, stream)
     
     
-    def slice(self, target_length: int) -> list['DFTemplate']:
+    def diff(self, old_template: 'DFTemplate|str') -> TemplateDiff:
+        """
+        Find the codeblocks that were inserted, removed or changed since an older version of this template.
+        Codeblocks are compared by hashes of their built JSON.
+
+        :param DFTemplate|str old_template: The older template, or a template code it was built to.
+        :return: The differences, which can be applied to the old codeblocks to get the codeblocks of this template.
+        """
+        old_hashes = [get_block_hash(s) for s in _iter_block_strings(old_template)]
+        new_hashes = [get_block_hash(s) for s in _iter_block_strings(self)]
+        return TemplateDiff(diff_block_hashes(old_hashes, new_hashes), self.codeblocks)
+    
+    
+    def has_changes(self, old_template: 'DFTemplate|str') -> bool:
+        """
+        Check whether this template builds differently from an older version of it.
+        Stops at the first difference, so a template code is only decoded as far as needed.
+
+        :param DFTemplate|str old_template: The older template, or a template code it was built to.
+        """
+        new_block_strings = self._build_block_strings()
+        old_block_count = 0
+        for old_block_string in _iter_block_strings(old_template):
+            if old_block_count == len(new_block_strings) or old_block_string != new_block_strings[old_block_count]:
+                return True
+            old_block_count += 1
+        return old_block_count != len(new_block_strings)
+    
+    
+    def to_columnar(self) -> 'ColumnarTemplate':
+        """
+        Converts this template into a columnar template, which uses much less memory for large templates.
+        """
+        from dfpyre.core.columnar import ColumnarTemplate
+        return ColumnarTemplate(self.codeblocks, self.author)
+    
+    
+    def slice(self, target_length: int, strategy: str='greedy') -> list['DFTemplate']:
         """
         Slice the current template into multiple other templates.
         Useful for compressing a template to fit on a smaller plot.
 
         :param int target_length: The maximum allowed length of each sliced template.
+        :param str strategy: How cuts are chosen:
+            - `greedy`: Repeatedly extract the longest slice into a new function.
+            - `min_functions`: Plan every cut up front, using as few functions as possible.
+            - `min_parameters`: Plan every cut up front, passing as few line vars into functions as possible.
         """
-        sliced_templates = slice_template(self.codeblocks, target_length, self.get_template_name())
+        sliced_templates = slice_template(self.codeblocks, target_length, self.get_template_name(), strategy)
         return [DFTemplate(t, self.author) for t in sliced_templates]
+    
+    
+    @staticmethod
+    def get_slice_costs(sliced_templates: list['DFTemplate']) -> list[SliceCost]:
+        """
+        Returns the length and number of line var parameters of each template returned by `slice`.
+
+        :param list[DFTemplate] sliced_templates: The templates returned by `slice`.
+        """
+        return get_slice_costs([t.codeblocks for t in sliced_templates], [t.get_template_name() for t in sliced_templates])
@@ -0,0 +1,241 @@
+"""
+Converts many template codes into Python scripts in parallel.
+
+Usage:
+    python -m dfpyre.decompile [PATH ...] [-o OUTPUT_DIR] [-j WORKERS] [scriptgen options]
+
+Each path can be a file or a directory of files. If no paths are given, or a path is `-`, codes are read from stdin.
+Each line of input is either a template code or a JSON object with a `code` field and an optional `name` field.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, TextIO
+from dfpyre.core.template import DFTemplate
+from dfpyre.tool.scriptgen import generate_script, GeneratorFlags
+
+
+__all__ = ['DecompileJob', 'DecompileResult', 'iter_decompile_jobs', 'decompile_many']
+
+
+DEFAULT_OUTPUT_DIR = 'decompiled'
+
+# Number of templates sent to a worker at a time
+DECOMPILE_CHUNK_SIZE = 16
+
+INVALID_NAME_CHARS_REGEX = re.compile(r'[^\w\-.]+')
+
+
+@dataclass
+class DecompileJob:
+    """
+    A template code to decompile, and where it came from.
+    """
+    name: str
+    template_code: str | None
+    source: str  # The file and line the code was read from
+    error: str | None = None  # Set if the line could not be read
+
+
+@dataclass
+class DecompileResult:
+    """
+    The result of decompiling a single template with `decompile_many`.
+    """
+    name: str
+    source: str
+    output_path: str | None
+    decode_time: float = 0.0
+    script_time: float = 0.0
+    error: str | None = None  # Stored as a string, since exceptions are not always picklable
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def to_file_name(name: str) -> str:
+    return INVALID_NAME_CHARS_REGEX.sub('_', name).strip('._') or 'template'
+
+
+def parse_line(line: str, code_key: str, name_key: str) -> tuple[str|None, str|None]:
+    """
+    Returns the template code and name in a line of input.
+    """
+    # Template codes are base64, so a line starting with a brace is always JSON
+    if line.startswith('{'):
+        line_object = json.loads(line)
+        if not isinstance(line_object, dict):
+            raise ValueError('Expected a JSON object.')
+        name = line_object.get(name_key)
+        return line_object.get(code_key), (str(name) if name is not None else None)
+    return line, None
+
+
+def iter_stream_jobs(stream: TextIO, source_name: str, default_name: str, code_key: str, name_key: str) -> Iterator[DecompileJob]:
+    lines = ((n, l.strip()) for n, l in enumerate(stream, 1))
+    lines = [(n, l) for n, l in lines if l]
+    for line_number, line in lines:
+        error = None
+        try:
+            template_code, name = parse_line(line, code_key, name_key)
+        except ValueError as e:
+            # Unreadable lines are still yielded, so they are reported as failures
+            template_code, name = None, None
+            error = f'{type(e).__name__}: {e}'
+        if template_code is None and error is None:
+            error = f'Missing "{code_key}" field.'
+        if name is None:
+            name = default_name if len(lines) == 1 else f'{default_name}_{line_number}'
+        yield DecompileJob(name, template_code, f'{source_name}:{line_number}', error)
+
+
+def iter_input_files(paths: list[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    yield os.path.join(dir_path, file_name)
+        else:
+            yield path
+
+
+def iter_decompile_jobs(paths: list[str], stdin: TextIO|None=None, code_key: str='code', name_key: str='name') -> Iterator[DecompileJob]:
+    """
+    Reads the template codes in files, directories or stdin.
+    Every job gets a unique name that can be used as a file name.
+    A file that can't be read as UTF-8 text gives a single failed job.
+
+    :param list[str] paths: The files and directories to read. `-` reads from stdin.
+    :param TextIO|None stdin: The stream to read for `-`. Defaults to `sys.stdin`.
+    :param str code_key: The field that holds the template code in JSON lines.
+    :param str name_key: The field that holds the template name in JSON lines.
+    """
+    used_names = set()
+    for path in iter_input_files(paths):
+        if path == '-':
+            source_name, default_name = '<stdin>', 'template'
+        else:
+            source_name, default_name = path, os.path.splitext(os.path.basename(path))[0]
+        try:
+            if path == '-':
+                jobs = list(iter_stream_jobs(stdin or sys.stdin, source_name, default_name, code_key, name_key))
+            else:
+                with open(path, encoding='utf-8') as f:
+                    jobs = list(iter_stream_jobs(f, source_name, default_name, code_key, name_key))
+        except (OSError, UnicodeDecodeError) as e:
+            # A file that can't be read, such as a binary file in a directory, fails on its own
+            jobs = [DecompileJob(default_name, None, source_name, f'{type(e).__name__}: {e}')]
+
+        for job in jobs:
+            name = base_name = to_file_name(job.name)
+            suffix = 2
+            while name in used_names:
+                name = f'{base_name}_{suffix}'
+                suffix += 1
+            used_names.add(name)
+            job.name = name
+            yield job
+
+
+def decompile_job(job: DecompileJob, output_dir: str, flags: GeneratorFlags) -> DecompileResult:
+    """
+    Decompiles a template code and writes its script into `output_dir`.
+    """
+    output_path = os.path.join(output_dir, f'{job.name}.py')
+    result = DecompileResult(job.name, job.source, None)
+    if job.error is not None:
+        result.error = job.error
+        return result
+
+    try:
+        start = time.perf_counter()
+        template = DFTemplate.from_code(job.template_code)
+        result.decode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            generate_script(template.codeblocks, flags, f)
+        result.script_time = time.perf_counter() - start
+        result.output_path = output_path
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+        if os.path.isfile(output_path):
+            os.remove(output_path)
+    return result
+
+
+def decompile_many(jobs: Iterable[DecompileJob], output_dir: str, flags: GeneratorFlags, workers: int|None=None) -> Iterator[DecompileResult]:
+    """
+    Decompiles templates in parallel and writes one script per template into `output_dir`.
+    A template that fails to decompile does not stop the others.
+
+    :param Iterable[DecompileJob] jobs: The templates to decompile.
+    :param str output_dir: The directory to write the scripts to.
+    :param GeneratorFlags flags: The scriptgen options.
+    :param int|None workers: The number of worker processes to use. Defaults to the number of CPUs.
+    :return: A result for each job, in the same order as `jobs`, as soon as it is ready.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1:
+        for job in jobs:
+            yield decompile_job(job, output_dir, flags)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = list(jobs)
+        yield from pool.map(decompile_job, jobs, [output_dir]*len(jobs), [flags]*len(jobs), chunksize=DECOMPILE_CHUNK_SIZE)
+
+
+def format_result(result: DecompileResult) -> str:
+    if not result.ok:
+        return f'FAILED {result.name} ({result.source}): {result.error}'
+    return f'ok     {result.name}   decode {result.decode_time*1e3:.1f} ms   script {result.script_time*1e3:.1f} ms'
+
+
+def main(argv: list[str]|None=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m dfpyre.decompile', description='Converts template codes into Python scripts.')
+    parser.add_argument('paths', nargs='*', default=['-'], help='Files or directories of template codes, one per line or as JSON lines. Defaults to stdin.')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='The directory to write scripts to.')
+    parser.add_argument('-j', '--workers', type=int, help='The number of worker processes. Defaults to the number of CPUs.')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only report failures.')
+    parser.add_argument('--code-key', default='code', help='The field that holds the template code in JSON lines.')
+    parser.add_argument('--name-key', default='name', help='The field that holds the template name in JSON lines.')
+    parser.add_argument('--indent-size', type=int, default=4)
+    parser.add_argument('--no-literal-shorthand', action='store_true', help='Write String and Number items instead of literals.')
+    parser.add_argument('--var-shorthand', action='store_true', help='Write variables in the shorthand format.')
+    parser.add_argument('--preserve-slots', action='store_true', help='Write the slot of each item.')
+    parser.add_argument('--assign-variable', action='store_true', help='Assign each template to a variable.')
+    parser.add_argument('--no-import', action='store_true', help='Leave out the dfpyre import.')
+    parser.add_argument('--build-and-send', action='store_true', help='Add `.build_and_send()` to the end of each script.')
+    args = parser.parse_args(argv)
+
+    flags = GeneratorFlags(
+        args.indent_size, not args.no_literal_shorthand, args.var_shorthand, args.preserve_slots,
+        args.assign_variable, not args.no_import, args.build_and_send
+    )
+    jobs = iter_decompile_jobs(args.paths, code_key=args.code_key, name_key=args.name_key)
+
+    start = time.perf_counter()
+    template_count = 0
+    failure_count = 0
+    for result in decompile_many(jobs, args.output, flags, args.workers):
+        template_count += 1
+        failure_count += not result.ok
+        if not args.quiet or not result.ok:
+            print(format_result(result), flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f'Decompiled {template_count - failure_count}/{template_count} templates into {args.output} in {elapsed:.2f} s.')
+    return 1 if failure_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
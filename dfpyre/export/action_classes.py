@@ -1,11351 +1,62 @@
-# Auto generated by pyre 2026-05-16T17:07:32.103813+00:00
-from typing import Literal
-from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
-from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
-from dfpyre.export.block_functions import assemble_template, add_brackets
-from dfpyre.gen.action_literals import SUBACTION
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+import importlib
+from typing import TYPE_CHECKING
 __all__ = ['PlayerEvent', 'EntityEvent', 'PlayerAction', 'GameAction', 'EntityAction', 'IfPlayer', 'IfVariable', 'IfGame', 'IfEntity', 'Repeat', 'Control', 'SelectObject', 'SetVariable', 'GameEvent', 'PE', 'EE', 'PA', 'GA', 'EA', 'IP', 'IV', 'IG', 'IE', 'SO', 'SV', 'GE']
 
-class PlayerAction:
-    """
-    Used to do something related to a player or multiple players.
-    """
-
-    @staticmethod
-    def SetHotbar(item_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets items in a player's hotbar.
-    
-        :param list[Item] | Item item_to_set: Item(s) to set (Slots 1-9)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetHotbar', (item_to_set,), {}, target=target)
-
-    @staticmethod
-    def SetReducedDebug(reduced_debug_info_enabled: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        When enabled, a player won't be able to see their coordinates, block info, or other info.
-    
-        :param str reduced_debug_info_enabled: Reduced Debug Info Enabled
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetReducedDebug', (), {'Reduced Debug Info Enabled': reduced_debug_info_enabled}, target=target)
-
-    @staticmethod
-    def CloseInv(target: Target=DEFAULT_TARGET):
-        """
-        Closes a player's inventory.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'CloseInv', (), {}, target=target)
-
-    @staticmethod
-    def GiveItems(item_to_give: list[Item] | Item, amount_to_give: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Gives a player all of the items in the chest.
-    
-        :param list[Item] | Item item_to_give: Item(s) to give
-        :param Number | None amount_to_give: Amount to give (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GiveItems', (item_to_give, amount_to_give,), {}, target=target)
-
-    @staticmethod
-    def SetHandCrafting(allow_hand_crafting: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets if a player is allowed to interact with their hand-crafting menu.
-    
-        :param str allow_hand_crafting: Allow Hand Crafting
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetHandCrafting', (), {'Allow Hand Crafting': allow_hand_crafting}, target=target)
-
-    @staticmethod
-    def ParticleSphere(effect: Particle, center_location: Location, diameter: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a sphere of particles at a location to a player.
-    
-        :param Particle effect: Effect
-        :param Location center_location: Center location
-        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleSphere', (effect, center_location, diameter,), {}, target=target)
-
-    @staticmethod
-    def SetVelocity(new_velocity: DFVector, add_to_current_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's movement velocity.
-    
-        :param DFVector new_velocity: New velocity
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetVelocity', (new_velocity,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
-
-    @staticmethod
-    def Particle(effect: list[Particle] | Particle, effect_location: Location, target: Target=DEFAULT_TARGET):
-        """
-        Displays a particle effect to a player.
-    
-        :param list[Particle] | Particle effect: Effect
-        :param Location effect_location: Effect location
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Particle', (effect, effect_location,), {}, target=target)
-
-    @staticmethod
-    def AddInvRow(items_to_display: list[Item] | Item | None=None, new_row_position: Literal["Top row", "Bottom row"]="Bottom row", target: Target=DEFAULT_TARGET):
-        """
-        Adds a row to the bottom of a player's current inventory menu.
-    
-        :param list[Item] | Item | None items_to_display: Items to display (optional)
-        :param str new_row_position: New Row Position
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'AddInvRow', (items_to_display,), {'New Row Position': new_row_position}, target=target)
-
-    @staticmethod
-    def DisplayLightning(strike_location: Location, target: Target=DEFAULT_TARGET):
-        """
-        Displays a lightning strike effect to a player.
-    
-        :param Location strike_location: Strike location
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayLightning', (strike_location,), {}, target=target)
-
-    @staticmethod
-    def Damage(damage_to_inflict: Number, uuid_of_damager_entity: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Damages a player.
-    
-        :param Number damage_to_inflict: Damage to inflict (❤ = 2 Health)
-        :param DFString | None uuid_of_damager_entity: UUID of damager entity (optional)
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Damage', (damage_to_inflict, uuid_of_damager_entity,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetInventory(item_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets items in a player's upper inventory.
-    
-        :param list[Item] | Item item_to_set: Item(s) to set
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetInventory', (item_to_set,), {}, target=target)
-
-    @staticmethod
-    def Heal(amount_to_heal: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Restores a player's health.
-    
-        :param Number | None amount_to_heal: Amount to heal OR Heals to full health (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Heal', (amount_to_heal,), {}, target=target)
-
-    @staticmethod
-    def SetSpawnPoint(the_new_spawn_location: Location | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the location a player will spawn when they die and respawn.
-    
-        :param Location | None the_new_spawn_location: The new spawn location OR Plot spawn
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSpawnPoint', (the_new_spawn_location,), {}, target=target)
-
-    @staticmethod
-    def SetInventoryKept(inventory_kept: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player's inventory is kept after death.
-    
-        :param str inventory_kept: Inventory Kept
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetInventoryKept', (), {'Inventory Kept': inventory_kept}, target=target)
-
-    @staticmethod
-    def LaunchUp(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Launches a player up or down.
-    
-        :param Number launch_power: Launch power
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LaunchUp', (launch_power,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
-
-    @staticmethod
-    def ForceFlight(flight_mode: Literal["Start Flight", "Stop Flight"]="Start Flight", target: Target=DEFAULT_TARGET):
-        """
-        :param str flight_mode: Flight Mode
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ForceFlight', (), {'Flight Mode': flight_mode}, target=target)
-
-    @staticmethod
-    def LoadInv(code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", target: Target=DEFAULT_TARGET):
-        """
-        Loads a player's inventory.
-    
-        :param str code_flow: Code Flow
-    
-            - Synchronous: Waits for the inventory to be loaded before continuing.
-            - Asynchronous: Continues running code immediately.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LoadInv', (), {'Code Flow': code_flow}, target=target)
-
-    @staticmethod
-    def ChatStyle(new_chat_style: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's chat color or decoration.
-    
-        :param DFText | None new_chat_style: New chat style OR Resets chat style)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ChatStyle', (new_chat_style,), {}, target=target)
-
-    @staticmethod
-    def Kick(target: Target=DEFAULT_TARGET):
-        """
-        Kicks a player from the plot.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Kick', (), {}, target=target)
-
-    @staticmethod
-    def MiscAttribute(value: Number | None=None, attribute: Literal["Scale", "Luck", "Oxygen bonus", "Burning time", "Camera distance"]="Scale", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's miscellaneous attributes such as scale and burning time.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Scale: Base: 1.0 Range: 0.0625-16.0
-            - Luck: Base: 0.0 Range: -1024.0-1024.0
-            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
-            - Burning time: Base: 1.0 Range: 0.0-1024.0
-            - Camera distance: Base: 4.0 Range: 0.0-32.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'MiscAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SpectateTarget(target_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Makes a player spectate another player or entity.
-    
-        :param DFString | None target_uuid: Target UUID OR Stops spectating
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SpectateTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def HurtAnimation(damage_source: Location | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Makes a player perform a hurt animation.
-    
-        :param Location | None damage_source: Damage source (optional) (Affects the direction of the screen tilt effect.)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'HurtAnimation', (damage_source,), {}, target=target)
-
-    @staticmethod
-    def SurvivalMode(target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's game mode to Survival.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SurvivalMode', (), {}, target=target)
-
-    @staticmethod
-    def DisplayBellRing(block_location: Location, ring_direction: Literal["North", "South", "West", "East"]="North", target: Target=DEFAULT_TARGET):
-        """
-        Displays a bell ring animation at a location to a player.
-    
-        :param Location block_location: Block location
-        :param str ring_direction: Ring Direction
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayBellRing', (block_location,), {'Ring Direction': ring_direction}, target=target)
-
-    @staticmethod
-    def SetStatus(game_status: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the player's game status, which is used to display information about what the player is doing in the game.
-    
-        :param DFText | None game_status: Game Status OR Clears status) (Limited at 50 characters)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetStatus', (game_status,), {}, target=target)
-
-    @staticmethod
-    def SetCursorItem(item_to_set: Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the item on a player's cursor.
-    
-        :param Item | None item_to_set: Item to set OR Clears cursor item)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetCursorItem', (item_to_set,), {}, target=target)
-
-    @staticmethod
-    def SetFireTicks(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the remaining time a player is on fire for.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFireTicks', (ticks,), {}, target=target)
-
-    @staticmethod
-    def CombatAttribute(value: Number | None=None, attribute: Literal["Attack damage", "Attack speed", "Sweeping damage ratio"]="Attack damage", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's combat-related attributes such as attack damage and attack speed.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Attack damage: Base: 2.0 Range: 0.0-2048.0
-            - Attack speed: Base: 4.0 Range: 0.0-1024.0
-            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'CombatAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def RemoveInvRow(rows_to_remove: Number | None=None, row_to_remove: Literal["Top row", "Bottom row"]="Bottom row", target: Target=DEFAULT_TARGET):
-        """
-        Removes the given number of rows from the bottom of a player's current inventory menu.
-    
-        :param Number | None rows_to_remove: Rows to remove (optional)
-        :param str row_to_remove: Row to Remove
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RemoveInvRow', (rows_to_remove,), {'Row to Remove': row_to_remove}, target=target)
-
-    @staticmethod
-    def WakeUpAnimation(target: Target=DEFAULT_TARGET):
-        """
-        Displays the wake up (fade in) animation to a player.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'WakeUpAnimation', (), {}, target=target)
-
-    @staticmethod
-    def DisableBlocks(blocks_to_disallow: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Prevents a player from placing and breaking certain blocks.
-    
-        :param list[Item] | Item | None blocks_to_disallow: Blocks to disallow (optional) (If no blocks are given, disallows all blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisableBlocks', (blocks_to_disallow,), {}, target=target)
-
-    @staticmethod
-    def SetScoreObj(objective_name: DFText, target: Target=DEFAULT_TARGET):
-        """
-        Sets the objective name of the scoreboard sidebar.
-    
-        :param DFText objective_name: Objective name
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetScoreObj', (objective_name,), {}, target=target)
-
-    @staticmethod
-    def ClearInv(clear_mode: Literal["Entire inventory", "Main inventory", "Upper inventory", "Hotbar", "Armor"]="Entire inventory", clear_crafting_and_cursor: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Empties a player's inventory.
-    
-        :param str clear_mode: Clear Mode
-        :param str clear_crafting_and_cursor: Clear Crafting and Cursor
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ClearInv', (), {'Clear Mode': clear_mode, 'Clear Crafting and Cursor': clear_crafting_and_cursor}, target=target)
-
-    @staticmethod
-    def SetFreezeTicks(ticks: Number, ticking_locked: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets how long a player is frozen for.
-    
-        :param Number ticks: Ticks (0-140)
-        :param str ticking_locked: Ticking Locked
-    
-            - Enable: Player will stay frozen.
-            - Disable: Player will slowly unfreeze over time.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFreezeTicks', (ticks,), {'Ticking Locked': ticking_locked}, target=target)
-
-    @staticmethod
-    def SetGliding(gliding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player is gliding with elytra.
-    
-        :param str gliding: Gliding
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetGliding', (), {'Gliding': gliding}, target=target)
-
-    @staticmethod
-    def SetRotation(pitch: Number, yaw: Number, target: Target=DEFAULT_TARGET):
-        """
-        Changes a player's pitch and yaw.
-    
-        :param Number pitch: Pitch (-90 to 90)
-        :param Number yaw: Yaw (-180 to 180)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetRotation', (pitch, yaw,), {}, target=target)
-
-    @staticmethod
-    def ClearItems(item_to_clear: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Removes all of an item from a player.
-    
-        :param list[Item] | Item item_to_clear: Item(s) to clear
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ClearItems', (item_to_clear,), {}, target=target)
-
-    @staticmethod
-    def OpenSign(sign_location: Location, sign_side: Literal["Front", "Back"]="Front", target: Target=DEFAULT_TARGET):
-        """
-        Opens a sign for a player. Also works with client-side signs.
-    
-        :param Location sign_location: Sign location
-        :param str sign_side: Sign Side
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'OpenSign', (sign_location,), {'Sign Side': sign_side}, target=target)
-
-    @staticmethod
-    def SetFlying(flying: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player is flying.
-    
-        :param str flying: Flying
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFlying', (), {'Flying': flying}, target=target)
-
-    @staticmethod
-    def DisplayBlockOpen(block_location: Location, container_state: Literal["Open", "Closed"]="Open", target: Target=DEFAULT_TARGET):
-        """
-        Displays a container block at a location as being open or closed to a player.
-    
-        :param Location block_location: Block location
-        :param str container_state: Container State
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayBlockOpen', (block_location,), {'Container State': container_state}, target=target)
-
-    @staticmethod
-    def SendAdvancement(advancement_name: DFText, advancement_icon: Item | None=None, toast_type: Literal["Advancement", "Goal", "Challenge"]="Advancement", target: Target=DEFAULT_TARGET):
-        """
-        Displays a custom advancement popup to a player.
-    
-        :param DFText advancement_name: Advancement name
-        :param Item | None advancement_icon: Advancement icon (optional)
-        :param str toast_type: Toast Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SendAdvancement', (advancement_name, advancement_icon,), {'Toast Type': toast_type}, target=target)
-
-    @staticmethod
-    def SetMenuItem(slot: Number, item_to_set: Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the item in a slot of a player's current inventory menu.
-    
-        :param Number slot: Slot
-        :param Item | None item_to_set: Item to set (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetMenuItem', (slot, item_to_set,), {}, target=target)
-
-    @staticmethod
-    def LaunchToward(launch_destination: Location, launch_power: Number | None=None, add_to_current_velocity: Literal["True", "False"]="True", ignore_distance: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Launches a player toward or away from a location.
-    
-        :param Location launch_destination: Launch destination
-        :param Number | None launch_power: Launch power (optional)
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param str ignore_distance: Ignore Distance
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LaunchToward', (launch_destination, launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Ignore Distance': ignore_distance}, target=target)
-
-    @staticmethod
-    def SetArmor(armor_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's armor items. Place the armor in slots 1-4 of the chest, with 1 being the helmet and 4 being the boots.
-    
-        :param list[Item] | Item armor_to_set: Armor to set
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetArmor', (armor_to_set,), {}, target=target)
-
-    @staticmethod
-    def DisplayGateway(gateway_location: Location, animation_type: Literal["Initial beam", "Periodic beam"]="Initial beam", target: Target=DEFAULT_TARGET):
-        """
-        Displays a vertical beam on an end gateway to a player.
-    
-        :param Location gateway_location: Gateway location
-        :param str animation_type: Animation Type
-    
-            - Initial beam: A magenta beam. Plays for 200 ticks.
-            - Periodic beam: A purple beam. Plays for 40 ticks.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayGateway', (gateway_location,), {'Animation Type': animation_type}, target=target)
-
-    @staticmethod
-    def GiveSaturation(saturation_to_give: Number, target: Target=DEFAULT_TARGET):
-        """
-        Adds saturation to a player.
-    
-        :param Number saturation_to_give: Saturation to give
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GiveSaturation', (saturation_to_give,), {}, target=target)
-
-    @staticmethod
-    def DisplayEquipment(entity_uuid_or_name: DFString, equipment: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Displays equipment on an entity to a player. Equipment goes from slots 2-7 in order of Helmet, Chestplate, Leggings, Boots, Main Hand, Off Hand.
-    
-        :param DFString entity_uuid_or_name: Entity UUID or name
-        :param list[Item] | Item equipment: Equipment
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayEquipment', (entity_uuid_or_name, equipment,), {}, target=target)
-
-    @staticmethod
-    def GiveExp(experience_to_give: Number, give_experience: Literal["Points", "Levels", "Level Percentage"]="Points", target: Target=DEFAULT_TARGET):
-        """
-        Adds experience points or levels to a player.
-    
-        :param Number experience_to_give: Experience to give
-        :param str give_experience: Give Experience
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GiveExp', (experience_to_give,), {'Give Experience': give_experience}, target=target)
-
-    @staticmethod
-    def FaceLocation(location_to_face: Location, target: Target=DEFAULT_TARGET):
-        """
-        Rotates a player to look toward a location without teleporting them.
-    
-        :param Location location_to_face: Location to face
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'FaceLocation', (location_to_face,), {}, target=target)
-
-    @staticmethod
-    def ClearScoreboard(target: Target=DEFAULT_TARGET):
-        """
-        Removes all scores from the scoreboard.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ClearScoreboard', (), {}, target=target)
-
-    @staticmethod
-    def ActionBar(message_to_send: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Displays text directly above a player's hotbar.
-    
-        :param list[DFText] | DFText message_to_send: Message to send
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ActionBar', (message_to_send,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
-
-    @staticmethod
-    def SetChatTag(chat_tag: list[DFText] | DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's chat tag.
-    
-        :param list[DFText] | DFText | None chat_tag: Chat tag OR Resets chat tag)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetChatTag', (chat_tag,), {}, target=target)
-
-    @staticmethod
-    def ShiftWorldBorder(new_radius: Number, blocks_per_second: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Changes a player's world border size if they have one active.
-    
-        :param Number new_radius: New radius
-        :param Number | None blocks_per_second: Blocks per second (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ShiftWorldBorder', (new_radius, blocks_per_second,), {}, target=target)
-
-    @staticmethod
-    def DisplaySignText(sign_location: Location, text_line: list[DFText] | DFText | None=None, sign_side: Literal["Front", "Back"]="Front", text_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="Black", glowing: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Displays text on a sign to a player.
-    
-        :param Location sign_location: Sign location
-        :param list[DFText] | DFText | None text_line: Text line(s) (optional)
-        :param str sign_side: Sign Side
-        :param str text_color: Text Color
-        :param str glowing: Glowing
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplaySignText', (sign_location, text_line,), {'Sign Side': sign_side, 'Text Color': text_color, 'Glowing': glowing}, target=target)
-
-    @staticmethod
-    def ExpandInv(items_to_display: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Adds 3 more rows to a player's current inventory menu using the contents of the chest.
-    
-        :param list[Item] | Item | None items_to_display: Items to display (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ExpandInv', (items_to_display,), {}, target=target)
-
-    @staticmethod
-    def LaunchProj(projectile_to_launch: Item, launch_point: Location | None=None, projectile_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Launches a projectile from a player.
-    
-        :param Item projectile_to_launch: Projectile to launch
-        :param Location | None launch_point: Launch point (optional)
-        :param DFText | None projectile_name: Projectile name (optional)
-        :param Number | None speed: Speed (optional)
-        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LaunchProj', (projectile_to_launch, launch_point, projectile_name, speed, inaccuracy,), {}, target=target)
-
-    @staticmethod
-    def ParticleCuboidA(effect: Particle, corner_1: Location, corner_2: Location, effect_spacing: Number | None=None, animation_duration: Number | None=None, fill_type: Literal["Wireframe", "Hollow", "Solid"]="Wireframe", target: Target=DEFAULT_TARGET):
-        """
-        Displays an animated particle cuboid to a player.
-    
-        :param Particle effect: Effect
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
-        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
-        :param str fill_type: Fill Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleCuboidA', (effect, corner_1, corner_2, effect_spacing, animation_duration,), {'Fill Type': fill_type}, target=target)
-
-    @staticmethod
-    def PlaySound(sound_to_play: list[Sound] | Sound, playback_location: Location | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
-        """
-        Plays a sound for a player.
-    
-        :param list[Sound] | Sound sound_to_play: Sound to play
-        :param Location | None playback_location: Playback location (optional)
-        :param str sound_source: Sound Source
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'PlaySound', (sound_to_play, playback_location,), {'Sound Source': sound_source}, target=target)
-
-    @staticmethod
-    def SetCompass(new_target: Location, target: Target=DEFAULT_TARGET):
-        """
-        Sets the location compasses point to for a player.
-    
-        :param Location new_target: New Target
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetCompass', (new_target,), {}, target=target)
-
-    @staticmethod
-    def MobDisguise(mob_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises a player as a mob.
-    
-        :param Item mob_to_disguise_as: Mob to disguise as
-        :param DFText | None display_name: Display name (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'MobDisguise', (mob_to_disguise_as, display_name,), {}, target=target)
-
-    @staticmethod
-    def EnableBlocks(blocks_to_allow: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Allows a player to place and break certain blocks.
-    
-        :param list[Item] | Item | None blocks_to_allow: Blocks to allow (optional) (If no blocks are given, allows all blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'EnableBlocks', (blocks_to_allow,), {}, target=target)
-
-    @staticmethod
-    def OpenBlockInv(container_location: Location, target: Target=DEFAULT_TARGET):
-        """
-        Opens a container's inventory. Also works with crafting tables.
-    
-        :param Location container_location: Container location
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'OpenBlockInv', (container_location,), {}, target=target)
-
-    @staticmethod
-    def LockDisgRotation(pitch_to_lock_to: Number | None=None, yaw_to_lock_to: Number | None=None, pitch: Literal["Lock", "Unlock", "No Change"]="No Change", yaw: Literal["Lock", "Unlock", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
-        """
-        Locks a disguise's pitch or yaw values.
-    
-        :param Number | None pitch_to_lock_to: Pitch to lock to (optional) (Default = 0)
-        :param Number | None yaw_to_lock_to: Yaw to lock to (optional) (Default = 0)
-        :param str pitch: Pitch
-        :param str yaw: Yaw
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LockDisgRotation', (pitch_to_lock_to, yaw_to_lock_to,), {'Pitch': pitch, 'Yaw': yaw}, target=target)
-
-    @staticmethod
-    def ParticleCircleA(effect: Particle, center_location: Location, diameter: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays an animated circle of particles to a player.
-    
-        :param Particle effect: Effect
-        :param Location center_location: Center location
-        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
-        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleCircleA', (effect, center_location, diameter, animation_duration,), {}, target=target)
-
-    @staticmethod
-    def SetEquipment(item_to_set: Item | None=None, equipment_slot: Literal["Main hand", "Off hand", "Head", "Chest", "Legs", "Feet"]="Main hand", target: Target=DEFAULT_TARGET):
-        """
-        Sets the item in one of the equipment slots (armor and held items) of a player.
-    
-        :param Item | None item_to_set: Item to set (optional)
-        :param str equipment_slot: Equipment Slot
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetEquipment', (item_to_set,), {'Equipment Slot': equipment_slot}, target=target)
-
-    @staticmethod
-    def SetDropsEnabled(spawn_death_drops: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player drops their items when dead.
-    
-        :param str spawn_death_drops: Spawn Death Drops
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetDropsEnabled', (), {'Spawn Death Drops': spawn_death_drops}, target=target)
-
-    @staticmethod
-    def SendToPlot(plot_handle_or_id: DFString, target: Target=DEFAULT_TARGET):
-        """
-        Sends a player to another plot.
-    
-        :param DFString plot_handle_or_id: Plot handle or ID
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SendToPlot', (plot_handle_or_id,), {}, target=target)
-
-    @staticmethod
-    def RemovePotion(effect_to_remove: list[Potion] | Potion, target: Target=DEFAULT_TARGET):
-        """
-        Removes one or more potion effects from a player.
-    
-        :param list[Potion] | Potion effect_to_remove: Effect(s) to remove
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RemovePotion', (effect_to_remove,), {}, target=target)
-
-    @staticmethod
-    def DisplayFracture(block_to_fracture: list[Location] | Location, fracture_level: Number | None=None, overwrite_previous_fracture: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Displays a block fracture effect at a location to a player.
-    
-        :param list[Location] | Location block_to_fracture: Block(s) to fracture
-        :param Number | None fracture_level: Fracture level (optional) (0-10 (default = 0))
-        :param str overwrite_previous_fracture: Overwrite Previous Fracture
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayFracture', (block_to_fracture, fracture_level,), {'Overwrite Previous Fracture': overwrite_previous_fracture}, target=target)
-
-    @staticmethod
-    def SetEntityHidden(entity_uuids: list[DFString] | DFString, hidden: Literal["Enable", "Disable"]="Enable", ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets if an entity is hidden to a target.
-    
-        :param list[DFString] | DFString entity_uuids: Entity UUIDs
-        :param str hidden: Hidden
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetEntityHidden', (entity_uuids,), {'Hidden': hidden, 'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetSidebar(sidebar: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether the scoreboard sidebar is visible to a player.
-    
-        :param str sidebar: Sidebar
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSidebar', (), {'Sidebar': sidebar}, target=target)
-
-    @staticmethod
-    def SetSlot(new_slot: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's selected hotbar slot.
-    
-        :param Number new_slot: New slot (1 (left) to 9 (right))
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSlot', (new_slot,), {}, target=target)
-
-    @staticmethod
-    def ParticleRay(effect: Particle, ray_location: Location, ray_vector: DFVector, effect_spacing: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a ray of particles to a player.
-    
-        :param Particle effect: Effect
-        :param Location ray_location: Ray location
-        :param DFVector ray_vector: Ray vector
-        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleRay', (effect, ray_location, ray_vector, effect_spacing,), {}, target=target)
-
-    @staticmethod
-    def ParticleCuboid(effect: Particle, corner_1: Location, corner_2: Location, effect_spacing: Number | None=None, fill_type: Literal["Wireframe", "Hollow", "Solid"]="Wireframe", target: Target=DEFAULT_TARGET):
-        """
-        Displays a particle cuboid as a solid, hollow or wireframe shape to a player.
-    
-        :param Particle effect: Effect
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
-        :param str fill_type: Fill Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleCuboid', (effect, corner_1, corner_2, effect_spacing,), {'Fill Type': fill_type}, target=target)
-
-    @staticmethod
-    def SendMessageSeq(messages_to_send: list[DFText] | DFText, message_delay_ticks: Number | None=None, alignment_mode: Literal["Regular", "Centered"]="Regular", target: Target=DEFAULT_TARGET):
-        """
-        Sends a series of messages in chat to a player, with a delay after each message.
-    
-        :param list[DFText] | DFText messages_to_send: Messages to send
-        :param Number | None message_delay_ticks: Message delay ticks (optional) (Default = 60)
-        :param str alignment_mode: Alignment Mode
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SendMessageSeq', (messages_to_send, message_delay_ticks,), {'Alignment Mode': alignment_mode}, target=target)
-
-    @staticmethod
-    def SetNamePrefix(prefixsuffix_text: DFText | None=None, text_type: Literal["Prefix", "Suffix"]="Prefix", target: Target=DEFAULT_TARGET):
-        """
-        Sets the prefix or suffix for the player's name.
-    
-        :param DFText | None prefixsuffix_text: Prefix/suffix text (optional)
-        :param str text_type: Text Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetNamePrefix', (prefixsuffix_text,), {'Text Type': text_type}, target=target)
-
-    @staticmethod
-    def ClearDispBlock(block_location_or_start_of_region: Location, end_of_region: Location | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays the real block at a location to a player, effectively removing any client-side blocks.
-    
-        :param Location block_location_or_start_of_region: Block location, or start of region
-        :param Location | None end_of_region: End of region (optional) (Region size limit: 500 blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ClearDispBlock', (block_location_or_start_of_region, end_of_region,), {}, target=target)
-
-    @staticmethod
-    def SetRainLevel(rain_level: Number, storm_level: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the heaviness of rain and storm visible to a player.
-    
-        :param Number rain_level: Rain level (%)
-        :param Number storm_level: Storm level (%)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetRainLevel', (rain_level, storm_level,), {}, target=target)
-
-    @staticmethod
-    def Undisguise(target: Target=DEFAULT_TARGET):
-        """
-        Removes a player's disguise.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Undisguise', (), {}, target=target)
-
-    @staticmethod
-    def ParticleSpiralA(effect: Particle, base_location: Location, length: Number | None=None, diameter: Number | None=None, effect_count: Number | None=None, rotations: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays an animated spiral of particles to a player.
-    
-        :param Particle effect: Effect
-        :param Location base_location: Base location
-        :param Number | None length: Length (optional) (Default = 10 blocks)
-        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
-        :param Number | None effect_count: Effect count (optional) (Default = 50)
-        :param Number | None rotations: Rotations (optional) (Default = 4)
-        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleSpiralA', (effect, base_location, length, diameter, effect_count, rotations, animation_duration,), {}, target=target)
-
-    @staticmethod
-    def InstantRespawn(instant_respawn: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets if a player is instantly  respawned upon dying.
-    
-        :param str instant_respawn: Instant Respawn
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'InstantRespawn', (), {'Instant Respawn': instant_respawn}, target=target)
-
-    @staticmethod
-    def SetScore(score_name: DFText, score_value: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets a score on the scoreboard.
-    
-        :param DFText score_name: Score name
-        :param Number | None score_value: Score value (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetScore', (score_name, score_value,), {}, target=target)
-
-    @staticmethod
-    def SetNameColor(name_color: Literal["Black", "Dark blue", "Dark green", "Dark aqua", "Dark red", "Dark purple", "Gold", "Gray", "Dark gray", "Blue", "Green", "Aqua", "Red", "Light purple", "Yellow", "White", "None"]="Black", target: Target=DEFAULT_TARGET):
-        """
-        Sets the color a player's name tag appears in.
-    
-        :param str name_color: Name Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetNameColor', (), {'Name Color': name_color}, target=target)
-
-    @staticmethod
-    def ReachAttribute(value: Number | None=None, attribute: Literal["Block interaction range", "Entity interaction range"]="Block interaction range", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's reach-related attributes such as block and entity interaction ranges.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Block interaction range: Base: 4.5 Range: 0.0-64.0
-            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ReachAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SetTickRate(ticks_per_second: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Changes the tick rate of a player.
-    
-        :param Number | None ticks_per_second: Ticks per second (0-20) (optional) (Default = 20)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetTickRate', (ticks_per_second,), {}, target=target)
-
-    @staticmethod
-    def PlayEntitySound(sound_to_play: list[Sound] | Sound, target_uuid: list[DFString] | DFString, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Plays a sound that follows a moving entity or player.
-    
-        :param list[Sound] | Sound sound_to_play: Sound to play
-        :param list[DFString] | DFString target_uuid: Target UUID
-        :param str sound_source: Sound Source
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'PlayEntitySound', (sound_to_play, target_uuid,), {'Sound Source': sound_source, 'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetExp(experience_to_set: Number, set_experience: Literal["Points", "Level", "Level Percentage"]="Level", target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's experience level, points or progress.
-    
-        :param Number experience_to_set: Experience to set
-        :param str set_experience: Set Experience
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetExp', (experience_to_set,), {'Set Experience': set_experience}, target=target)
-
-    @staticmethod
-    def MiningAttribute(value: Number | None=None, attribute: Literal["Block break speed", "Mining efficiency", "Submerged mining speed"]="Block break speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's mining-related attributes such as break speed and mining efficiency.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Block break speed: Base: 1.0 Range: 0.0-1024.0
-            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
-            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'MiningAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def KBAttribute(value: Number | None=None, attribute: Literal["Knockback resistance", "Explosion knockback resistance"]="Knockback resistance", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's knockback-related attributes such as knockback resistance.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'KBAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def MovementAttribute(value: Number | None=None, attribute: Literal["Walking speed", "Flying speed", "Jump strength", "Sneaking speed", "Step height", "Movement efficiency", "Water movement efficiency"]="Walking speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's movement-related attributes, such as walking speed and jump height.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Walking speed: Base: 0.2 Range: -1.0-1.0
-            - Flying speed: Base: 0.1 Range: -1.0-1.0
-            - Jump strength: Base: 0.42 Range: 0.0-32.0
-            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
-            - Step height: Base: 0.6 Range: 0.0-10.0
-            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'MovementAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def ParticleSpiral(effect: Particle, base_location: Location, length: Number | None=None, diameter: Number | None=None, effect_count: Number | None=None, rotations: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a spiral of particles at a location to a player.
-    
-        :param Particle effect: Effect
-        :param Location base_location: Base location
-        :param Number | None length: Length (optional) (Default = 10 blocks)
-        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
-        :param Number | None effect_count: Effect count (optional) (Default = 50)
-        :param Number | None rotations: Rotations (optional) (Default = 4)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleSpiral', (effect, base_location, length, diameter, effect_count, rotations,), {}, target=target)
-
-    @staticmethod
-    def FallingAttribute(value: Number | None=None, attribute: Literal["Gravity", "Safe fall distance", "Fall damage multiplier"]="Gravity", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's falling-related attributes, such as gravity and fall damage multiplier.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Gravity: Base: 0.08 Range: -1.0-1.0
-            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
-            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'FallingAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SetAllowFlight(allow_flight: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player is able to enter and exit flight mode by double tapping jump.
-    
-        :param str allow_flight: Allow Flight
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetAllowFlight', (), {'Allow Flight': allow_flight}, target=target)
-
-    @staticmethod
-    def SetMaxHealth(maximum_health: Number, heal_player_to_max_health: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's maximum health.
-    
-        :param Number maximum_health: Maximum health (❤ = 2 Health)
-        :param str heal_player_to_max_health: Heal Player to Max Health
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetMaxHealth', (maximum_health,), {'Heal Player to Max Health': heal_player_to_max_health}, target=target)
-
-    @staticmethod
-    def RemoveBossBar(boss_bar_position: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Removes a boss health bar from a player's screen.
-    
-        :param Number | None boss_bar_position: Boss bar position OR Removes all boss bars
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', ' RemoveBossBar ', (boss_bar_position,), {}, target=target)
-
-    @staticmethod
-    def SetFogDistance(fog_distance_in_chunks: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets how far the fog is displayed to a player.
-    
-        :param Number | None fog_distance_in_chunks: Fog distance in chunks (2-7) OR Removes fog
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFogDistance', (fog_distance_in_chunks,), {}, target=target)
-
-    @staticmethod
-    def AdventureMode(target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's game mode to Adventure.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'AdventureMode', (), {}, target=target)
-
-    @staticmethod
-    def SpectatorMode(target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's game mode to Spectator.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SpectatorMode', (), {}, target=target)
-
-    @staticmethod
-    def DispHeadTexture(head_location: Location, player_head: Item | DFString, target: Target=DEFAULT_TARGET):
-        """
-        Changes a head's texture at a location for a player.
-    
-        :param Location head_location: Head location
-        :param Item | DFString player_head: Player Head OR Head owner (Player name, UUID, or texture)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DispHeadTexture', (head_location, player_head,), {}, target=target)
-
-    @staticmethod
-    def ClearPotions(target: Target=DEFAULT_TARGET):
-        """
-        Removes all active potion effects from a player.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ClearPotions', (), {}, target=target)
-
-    @staticmethod
-    def SetTabListInfo(headerfooter_text: list[DFText] | DFText | None=None, player_list_field: Literal["Header", "Footer"]="Header", text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets the text to be displayed above or below a player's player list shown when pressing Tab.
-    
-        :param list[DFText] | DFText | None headerfooter_text: Header/footer text (optional)
-        :param str player_list_field: Player List Field
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetTabListInfo', (headerfooter_text,), {'Player List Field': player_list_field, 'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
-
-    @staticmethod
-    def PromptPurchase(product_id: DFString, target: Target=DEFAULT_TARGET):
-        """
-        Prompts the player to purchase a plot product.
-    
-        :param DFString product_id: Product ID
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'PromptPurchase', (product_id,), {}, target=target)
-
-    @staticmethod
-    def ScoreLineFormat(score_name: DFText, content_or_style: DFText | None=None, number_format: Literal["Fixed", "Styled", "Blank", "Reset"]="Fixed", target: Target=DEFAULT_TARGET):
-        """
-        Sets the number format of a single line in the player's scoreboard.
-    
-        :param DFText score_name: Score name
-        :param DFText | None content_or_style: Content or style OR Uses the default number format
-        :param str number_format: Number Format
-    
-            - Fixed: Displays a constant text.
-            - Styled: Displays a score number with the specified text style.
-            - Blank: Does not display anything.
-            - Reset: Uses the default number format.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ScoreLineFormat', (score_name, content_or_style,), {'Number Format': number_format}, target=target)
-
-    @staticmethod
-    def SetBossBar(title: DFText | None=None, current_health: Number | None=None, maximum_health: Number | None=None, boss_bar_position: Number | None=None, bar_style: Literal["Solid", "6 segments", "10 segments", "12 segments", "20 segments"]="Solid", sky_effect: Literal["None", "Create fog", "Darken sky", "Both"]="None", bar_color: Literal["Red", "Purple", "Pink", "Blue", "Green", "Yellow", "White"]="Purple", target: Target=DEFAULT_TARGET):
-        """
-        Creates or modifies a custom boss health bar at the top of a player's screen.
-    
-        :param DFText | None title: Title (optional)
-        :param Number | None current_health: Current health (optional)
-        :param Number | None maximum_health: Maximum health (optional) (Default = 100)
-        :param Number | None boss_bar_position: Boss bar position (optional) (Default = 1 (top))
-        :param str bar_style: Bar Style
-    
-            - Solid: The boss bar has no segments.
-            - 6 segments: Each segment covers 16.66% of the boss bar.
-            - 10 segments: Each segment covers 10% of the boss bar.
-            - 12 segments: Each segment covers 8.33% of the boss bar.
-            - 20 segments: Each segment covers 5% of the boss bar.
-        :param str sky_effect: Sky Effect
-        :param str bar_color: Bar Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', ' SetBossBar ', (title, current_health, maximum_health, boss_bar_position,), {'Bar Style': bar_style, 'Sky Effect': sky_effect, 'Bar Color': bar_color}, target=target)
-
-    @staticmethod
-    def SetSkin(player_head: Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the player's skin.
-    
-        :param Item | None player_head: Player head OR Clears Skin)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSkin', (player_head,), {}, target=target)
-
-    @staticmethod
-    def SpectatorCollision(spectator_collision: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Toggles whether a player collides with blocks in spectator mode.
-    
-        :param str spectator_collision: Spectator Collision
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SpectatorCollision', (), {'Spectator Collision': spectator_collision}, target=target)
-
-    @staticmethod
-    def SetNameVisible(name_tag_visible: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player's name tag is visible.
-    
-        :param str name_tag_visible: Name Tag Visible
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetNameVisible', (), {'Name Tag Visible': name_tag_visible}, target=target)
-
-    @staticmethod
-    def SetInvulTicks(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the currently remaining ticks until a player can next be hurt.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetInvulTicks', (ticks,), {}, target=target)
-
-    @staticmethod
-    def Mimic(target_uuid: list[DFString] | DFString, remove_original_entity: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Disguises a player as another currently existing entity or player.
-    
-        :param list[DFString] | DFString target_uuid: UUID of target to disguise as
-        :param str remove_original_entity: Remove Original Entity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Mimic', (target_uuid,), {'Remove Original Entity': remove_original_entity}, target=target)
-
-    @staticmethod
-    def SetStingsStuck(sting_count: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the amount of bee stings sticking out of a player's character model.
-    
-        :param Number | None sting_count: Sting Count (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetStingsStuck', (sting_count,), {}, target=target)
-
-    @staticmethod
-    def RemoveScore(score_name: DFText, target: Target=DEFAULT_TARGET):
-        """
-        Removes a score from the scoreboard.
-    
-        :param DFText score_name: Score name
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RemoveScore', (score_name,), {}, target=target)
-
-    @staticmethod
-    def SetExhaustion(exhaustion_level: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's exhaustion level.
-    
-        :param Number exhaustion_level: Exhaustion level (0-4)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetExhaustion', (exhaustion_level,), {}, target=target)
-
-    @staticmethod
-    def ParticleCircle(effect: Particle, center_location: Location, diameter: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a circle of particles to a player.
-    
-        :param Particle effect: Effect
-        :param Location center_location: Center location
-        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleCircle', (effect, center_location, diameter,), {}, target=target)
-
-    @staticmethod
-    def DisplayBlock(block_to_display: Item, block_location_or_start_of_region: Location, end_of_region: Location | None=None, block_data: list[DFString] | DFString | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a block at a location to a player.
-    
-        :param Item block_to_display: Block to display
-        :param Location block_location_or_start_of_region: Block location, or start of region
-        :param Location | None end_of_region: End of region (optional) (Region size limit: 250,000 blocks)
-        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayBlock', (block_to_display, block_location_or_start_of_region, end_of_region, block_data,), {}, target=target)
-
-    @staticmethod
-    def RideEntity(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Mounts a player on top of another player or entity.
-    
-        :param list[DFString] | DFString | None target_uuid: Target UUID OR Dismounts player
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RideEntity', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def RmWorldBorder(target: Target=DEFAULT_TARGET):
-        """
-        Removes a player's world border.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RmWorldBorder', (), {}, target=target)
-
-    @staticmethod
-    def ResourcePack(resource_pack_url: DFString, target: Target=DEFAULT_TARGET):
-        """
-        Send a resource pack to a player.
-    
-        :param DFString resource_pack_url: Resource Pack URL (Must link directly to a .zip file.)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ResourcePack', (resource_pack_url,), {}, target=target)
-
-    @staticmethod
-    def SetInvName(inventory_name: DFText, alignment_mode: Literal["Regular", "Centered"]="Regular", target: Target=DEFAULT_TARGET):
-        """
-        Renames a player's current inventory menu.
-    
-        :param DFText inventory_name: Inventory name
-        :param str alignment_mode: Alignment Mode
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', ' SetInvName ', (inventory_name,), {'Alignment Mode': alignment_mode}, target=target)
-
-    @staticmethod
-    def GiveExhaustion(exhaustion_to_give: Number, target: Target=DEFAULT_TARGET):
-        """
-        Adds exhaustion to a player.
-    
-        :param Number exhaustion_to_give: Exhaustion to give
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GiveExhaustion', (exhaustion_to_give,), {}, target=target)
-
-    @staticmethod
-    def Teleport(new_position: Location, keep_current_rotation: Literal["True", "False"]="False", keep_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Teleports a player to a location.
-    
-        :param Location new_position: New position
-        :param str keep_current_rotation: Keep Current Rotation
-        :param str keep_velocity: Keep Velocity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'Teleport', (new_position,), {'Keep Current Rotation': keep_current_rotation, 'Keep Velocity': keep_velocity}, target=target)
-
-    @staticmethod
-    def SetAllowPVP(pvp: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player can hurt or be hurt by other players.
-    
-        :param str pvp: PVP
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetAllowPVP', (), {'PVP': pvp}, target=target)
-
-    @staticmethod
-    def SetVisualFire(on_fire: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player should appear on fire.
-    
-        :param str on_fire: On Fire
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetVisualFire', (), {'On Fire': on_fire}, target=target)
-
-    @staticmethod
-    def SetDisguiseVisible(disguise_visible: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's ability to see their own disguise. It is recommended that it is almost always hidden.
-    
-        :param str disguise_visible: Disguise Visible
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetDisguiseVisible', (), {'Disguise Visible': disguise_visible}, target=target)
-
-    @staticmethod
-    def DisguiseShiftVert(yoffset: Number, target: Target=DEFAULT_TARGET):
-        """
-        Shifts the disguise of a player up or down relative to the player.
-    
-        :param Number yoffset: Y-Offset
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisguiseShiftVert', (yoffset,), {}, target=target)
-
-    @staticmethod
-    def SetArrowsStuck(arrow_count: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the amount of arrows sticking out of a player's character model.
-    
-        :param Number | None arrow_count: Arrow Count (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetArrowsStuck', (arrow_count,), {}, target=target)
-
-    @staticmethod
-    def GetItemCooldown(result: Variable, item_type_to_check: Item, target: Target=DEFAULT_TARGET):
-        """
-        Gets the remaining cooldown on an item type.
-    
-        :param Variable result: Variable to set
-        :param Item item_type_to_check: Item type to check
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GetItemCooldown', (result, item_type_to_check,), {}, target=target)
-
-    @staticmethod
-    def ReplaceItems(item_to_replace: list[Item] | Item | None=None, item_to_replace_with: Item=None, items_amount: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Replaces items in a player's inventory with the given item.
-    
-        :param list[Item] | Item | None item_to_replace: Item(s) to replace (optional)
-        :param Item item_to_replace_with: Item to replace with
-        :param Number | None items_amount: Amount of items to replace (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ReplaceItems', (item_to_replace, item_to_replace_with, items_amount,), {}, target=target)
-
-    @staticmethod
-    def SendMessage(message_to_send: list[DFText] | DFText | None=None, alignment_mode: Literal["Regular", "Centered"]="Regular", text_value_merging: Literal["Add spaces", "No spaces"]="Add spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sends a chat message to a player.
-    
-        :param list[DFText] | DFText | None message_to_send: Message to send (optional)
-        :param str alignment_mode: Alignment Mode
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SendMessage', (message_to_send,), {'Alignment Mode': alignment_mode, 'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
-
-    @staticmethod
-    def SetSlotItem(item_to_set: Item | None=None, slot_to_set: Number=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the item in a slot of a player's inventory.
-    
-        :param Item | None item_to_set: Item to set (optional)
-        :param Number slot_to_set: Slot to set (1-9 Hotbar)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSlotItem', (item_to_set, slot_to_set,), {}, target=target)
-
-    @staticmethod
-    def PlaySoundSeq(sounds_to_play: list[Sound] | Sound, sound_delay: Number | None=None, playback_location: Location | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
-        """
-        Plays a sequence of sounds to a player, with a delay between each sound.
-    
-        :param list[Sound] | Sound sounds_to_play: Sounds to play
-        :param Number | None sound_delay: Sound delay (ticks, default = 60) (optional)
-        :param Location | None playback_location: Playback location (optional)
-        :param str sound_source: Sound Source
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'PlaySoundSeq', (sounds_to_play, sound_delay, playback_location,), {'Sound Source': sound_source}, target=target)
-
-    @staticmethod
-    def OpenTradeMenu(villager_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Opens the trading menu of a villager.
-    
-        :param DFString villager_uuid: Villager UUID
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'OpenTradeMenu', (villager_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def ParticleLineA(effect: Particle, start_location: Location, end_location: Location, effect_spacing: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays an animated line of particles between two locations to a player.
-    
-        :param Particle effect: Effect
-        :param Location start_location: Start location
-        :param Location end_location: End location
-        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
-        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleLineA', (effect, start_location, end_location, effect_spacing, animation_duration,), {}, target=target)
-
-    @staticmethod
-    def SetItemCooldown(item_type_to_affect: Item, cooldown: Number, target: Target=DEFAULT_TARGET):
-        """
-        Applies a cooldown visual effect to an item type.
-    
-        :param Item item_type_to_affect: Item type to affect
-        :param Number cooldown: Cooldown in ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetItemCooldown', (item_type_to_affect, cooldown,), {}, target=target)
-
-    @staticmethod
-    def SetPlayerWeather(weather: Literal["Clear", "Downfall"]="Downfall", target: Target=DEFAULT_TARGET):
-        """
-        Sets the type of weather visible to a player.
-    
-        :param str weather: Weather
-    
-            - Clear: Displays sunny weather.
-            - Downfall: Displays rain, or snow (in cold biomes).
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetPlayerWeather', (), {'Weather': weather}, target=target)
-
-    @staticmethod
-    def SetShoulder(shoulder: Literal["Left", "Right"]="Left", type: Literal["Remove", "Red", "Blue", "Green", "Cyan", "Gray"]="Remove", target: Target=DEFAULT_TARGET):
-        """
-        Displays a parrot on the targets' shoulders.
-    
-        :param str shoulder: Shoulder
-        :param str type: Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetShoulder', (), {'Shoulder': shoulder, 'Type': type}, target=target)
-
-    @staticmethod
-    def SetAirTicks(breath_ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's remaining breath ticks.
-    
-        :param Number breath_ticks: Breath ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetAirTicks', (breath_ticks,), {}, target=target)
-
-    @staticmethod
-    def DisplayPickup(entity_uuid: DFString, collector_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Displays a pickup animation of one entity being collected by another entity.
-    
-        :param DFString entity_uuid: Entity UUID
-        :param DFString collector_uuid: Collector UUID
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayPickup', (entity_uuid, collector_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetWorldBorder(center_position: Location, radius_in_blocks: Number, warning_distance: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Creates a world border only visible to a player.
-    
-        :param Location center_position: Center position
-        :param Number radius_in_blocks: Radius in blocks
-        :param Number | None warning_distance: Warning distance (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetWorldBorder', (center_position, radius_in_blocks, warning_distance,), {}, target=target)
-
-    @staticmethod
-    def SetPlayerTime(daylight_ticks: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the time of day visible to a player.
-    
-        :param Number | None daylight_ticks: Daylight ticks OR Resets player time (Day: 1000)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetPlayerTime', (daylight_ticks,), {}, target=target)
-
-    @staticmethod
-    def GiveFood(food_to_give: Number, target: Target=DEFAULT_TARGET):
-        """
-        Adds food to a player.
-    
-        :param Number food_to_give: Food to give
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GiveFood', (food_to_give,), {}, target=target)
-
-    @staticmethod
-    def GivePotion(effect_to_give: list[Potion] | Potion, show_icon: Literal["True", "False"]="True", overwrite_effect: Literal["True", "False"]="True", effect_particles: Literal["Regular", "Ambient", "None"]="Regular", target: Target=DEFAULT_TARGET):
-        """
-        Gives one or more potion effects to a player.
-    
-        :param list[Potion] | Potion effect_to_give: Effect(s) to give
-        :param str show_icon: Show Icon
-    
-            - True: Shows the effect's icon.
-            - False: Hides the effect's icon. It can still be seen in the inventory.
-        :param str overwrite_effect: Overwrite Effect
-    
-            - True: Effects of the same type will always be replaced.
-            - False: Weaker effects of the same type will be hidden.
-        :param str effect_particles: Effect Particles
-    
-            - Ambient: Ambient particles are translucent and make the icon border blue.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'GivePotion', (effect_to_give,), {'Show Icon': show_icon, 'Overwrite Effect': overwrite_effect, 'Effect Particles': effect_particles}, target=target)
-
-    @staticmethod
-    def RemoveItems(item_to_remove: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Removes items from a player.
-    
-        :param list[Item] | Item item_to_remove: Item(s) to remove
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RemoveItems', (item_to_remove,), {}, target=target)
-
-    @staticmethod
-    def BoostElytra(firework: Item, target: Target=DEFAULT_TARGET):
-        """
-        Boosts a player's elytra using a firework rocket.
-    
-        :param Item firework: Firework
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'BoostElytra', (firework,), {}, target=target)
-
-    @staticmethod
-    def SaveInv(target: Target=DEFAULT_TARGET):
-        """
-        Saves a player's inventory. It can be loaded later with 'Load Saved Inventory'.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SaveInv', (), {}, target=target)
-
-    @staticmethod
-    def OpenBook(book_item: Item, target: Target=DEFAULT_TARGET):
-        """
-        Opens a written book menu for a player.
-    
-        :param Item book_item: Book item
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'OpenBook', (book_item,), {}, target=target)
-
-    @staticmethod
-    def SetHealth(current_health: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's current health.
-    
-        :param Number current_health: Current health (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetHealth', (current_health,), {}, target=target)
-
-    @staticmethod
-    def BlockDisguise(block_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises a player as a block.
-    
-        :param Item block_to_disguise_as: Block to disguise as
-        :param DFText | None display_name: Display name (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'BlockDisguise', (block_to_disguise_as, display_name,), {}, target=target)
-
-    @staticmethod
-    def RollbackBlocks(rollback_time: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Undoes the interactions with blocks by a player.
-    
-        :param Number | None rollback_time: Rollback time (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'RollbackBlocks', (rollback_time,), {}, target=target)
-
-    @staticmethod
-    def SetCollidable(collision: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a player is able to collide with other entities.
-    
-        :param str collision: Collision
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetCollidable', (), {'Collision': collision}, target=target)
-
-    @staticmethod
-    def LaunchFwd(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", launch_axis: Literal["Pitch and Yaw", "Yaw Only"]="Pitch and Yaw", target: Target=DEFAULT_TARGET):
-        """
-        Launches a player forward or backward.
-    
-        :param Number launch_power: Launch power
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param str launch_axis: Launch Axis
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'LaunchFwd', (launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Launch Axis': launch_axis}, target=target)
-
-    @staticmethod
-    def SetFallDistance(fall_distance: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's fall distance, affecting fall damage upon landing.
-    
-        :param Number fall_distance: Fall distance (blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFallDistance', (fall_distance,), {}, target=target)
-
-    @staticmethod
-    def CreativeMode(target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's game mode to Creative.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'CreativeMode', (), {}, target=target)
-
-    @staticmethod
-    def AttackAnimation(animation_arm: Literal["Swing main arm", "Swing off arm"]="Swing main arm", target: Target=DEFAULT_TARGET):
-        """
-        Makes a player perform an attack animation.
-    
-        :param str animation_arm: Animation Arm
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'AttackAnimation', (), {'Animation Arm': animation_arm}, target=target)
-
-    @staticmethod
-    def DisplayHologram(display_location: Location, text_to_display: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a floating name tag at a location to a player.
-    
-        :param Location display_location: Display location
-        :param DFText | None text_to_display: Text to display OR Removes hologram
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'DisplayHologram', (display_location, text_to_display,), {}, target=target)
-
-    @staticmethod
-    def SetAbsorption(absorption_health: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's absorption health (golden hearts).
-    
-        :param Number absorption_health: Absorption health (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', ' SetAbsorption ', (absorption_health,), {}, target=target)
-
-    @staticmethod
-    def ShowInv(items_to_display: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Opens a custom inventory for a player.
-    
-        :param list[Item] | Item | None items_to_display: Items to display (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ShowInv', (items_to_display,), {}, target=target)
-
-    @staticmethod
-    def SetFoodLevel(food_level: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's food hunger level.
-    
-        :param Number food_level: Food level (1-20)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetFoodLevel', (food_level,), {}, target=target)
-
-    @staticmethod
-    def PlayerDisguise(player_name_to_disguise_as: DFText, display_skin: Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises a player as another player.
-    
-        :param DFText player_name_to_disguise_as: Player name to disguise as
-        :param Item | None display_skin: Display skin (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'PlayerDisguise', (player_name_to_disguise_as, display_skin,), {}, target=target)
-
-    @staticmethod
-    def SetSaturation(saturation_level: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a player's saturation level.
-    
-        :param Number saturation_level: Saturation level (1-20)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SetSaturation', (saturation_level,), {}, target=target)
-
-    @staticmethod
-    def SendTitle(title_text: DFText, subtitle_text: DFText | None=None, title_duration: Number | None=None, fade_in_length: Number | None=None, fade_out_length: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays text in the center of a player's screen.
-    
-        :param DFText title_text: Title text
-        :param DFText | None subtitle_text: Subtitle text (optional)
-        :param Number | None title_duration: Title duration (optional) (Default = 60 ticks)
-        :param Number | None fade_in_length: Fade in length (optional) (Default = 20 ticks)
-        :param Number | None fade_out_length: Fade out length (optional) (Default = 20 ticks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'SendTitle', (title_text, subtitle_text, title_duration, fade_in_length, fade_out_length,), {}, target=target)
-
-    @staticmethod
-    def ScoreDefFormat(content_or_style: DFText | None=None, number_format: Literal["Fixed", "Styled", "Blank", "Reset"]="Fixed", target: Target=DEFAULT_TARGET):
-        """
-        Sets the default number format of the player's scoreboard.
-    
-        :param DFText | None content_or_style: Content or style OR Uses the default number format
-        :param str number_format: Number Format
-    
-            - Fixed: Displays a constant text.
-            - Styled: Displays a score number with the specified text style.
-            - Blank: Does not display anything.
-            - Reset: Uses the default number format.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ScoreDefFormat', (content_or_style,), {'Number Format': number_format}, target=target)
-
-    @staticmethod
-    def StopSound(sounds_to_stop: list[Sound] | Sound | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
-        """
-        Stops all or specific sounds for a player.
-    
-        :param list[Sound] | Sound | None sounds_to_stop: Sounds to stop (optional)
-        :param str sound_source: Sound Source
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'StopSound', (sounds_to_stop,), {'Sound Source': sound_source}, target=target)
-
-    @staticmethod
-    def HealthAttribute(value: Number | None=None, attribute: Literal["Maximum health", "Maximum absorption health", "Armor", "Armor toughness"]="Maximum health", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the player's health-related attributes such as max health and armor defense points.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Maximum health: Base: 20.0 Range: 1.0-1024.0
-            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
-            - Armor: Base: 0.0 Range: 0.0-30.0
-            - Armor toughness: Base: 0.0 Range: 0.0-20.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'HealthAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def ParticleLine(effect: Particle, start_location: Location, end_location: Location, effect_spacing: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Displays a line of particles between two locations to a player.
-    
-        :param Particle effect: Effect
-        :param Location start_location: Start location
-        :param Location end_location: End location
-        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('player_action', 'ParticleLine', (effect, start_location, end_location, effect_spacing,), {}, target=target)
-
-PA = PlayerAction
-class EntityAction:
-    """
-    Used to do something related to an entity or multiple entities.
-    """
-
-    @staticmethod
-    def DispRotationEuler(pitch: Number, yaw: Number, roll: Number | DFVector, rotation_type: Literal["Left Rotation", "Right Rotation"]="Left Rotation", target: Target=DEFAULT_TARGET):
-        """
-        Sets the left or right rotation of a display entity from 3 angles on each axis.
-    
-        :param Number pitch: Pitch (0-360)
-        :param Number yaw: Yaw (0-360)
-        :param Number | DFVector roll: Roll (0-360) OR Pitch/Yaw/Roll Vector
-        :param str rotation_type: Rotation Type
-    
-            - Left Rotation: Applies before scaling the display entity when rendering.
-            - Right Rotation: Applies after scaling the display entity when rendering.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DispRotationEuler', (pitch, yaw, roll,), {'Rotation Type': rotation_type}, target=target)
-
-    @staticmethod
-    def MannequinLayers(cape_layer: Literal["Visible", "Hidden"]="Visible", jacket_layer: Literal["Visible", "Hidden"]="Visible", left_sleeve_layer: Literal["Visible", "Hidden"]="Visible", right_sleeve_layer: Literal["Visible", "Hidden"]="Visible", left_pants_layer: Literal["Visible", "Hidden"]="Visible", right_pants_layer: Literal["Visible", "Hidden"]="Visible", hat_layer: Literal["Visible", "Hidden"]="Visible", target: Target=DEFAULT_TARGET):
-        """
-        Sets a mannequin's skin layers.
-    
-        :param str cape_layer: Cape Layer
-        :param str jacket_layer: Jacket Layer
-        :param str left_sleeve_layer: Left Sleeve Layer
-        :param str right_sleeve_layer: Right Sleeve Layer
-        :param str left_pants_layer: Left Pants Layer
-        :param str right_pants_layer: Right Pants Layer
-        :param str hat_layer: Hat Layer
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MannequinLayers', (), {'Cape Layer': cape_layer, 'Jacket Layer': jacket_layer, 'Left Sleeve Layer': left_sleeve_layer, 'Right Sleeve Layer': right_sleeve_layer, 'Left Pants Layer': left_pants_layer, 'Right Pants Layer': right_pants_layer, 'Hat Layer': hat_layer}, target=target)
-
-    @staticmethod
-    def Shear(target: Target=DEFAULT_TARGET):
-        """
-        Sets a mob in the sheared state.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Shear', (), {}, target=target)
-
-    @staticmethod
-    def SetVelocity(new_velocity: DFVector, add_to_current_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's movement velocity.
-    
-        :param DFVector new_velocity: New velocity
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVelocity', (new_velocity,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
-
-    @staticmethod
-    def SetGlowSquidDark(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the number of ticks a glow squid will stop glowing for.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGlowSquidDark', (ticks,), {}, target=target)
-
-    @staticmethod
-    def DispRotAxisAngle(axis_vector: DFVector, angle: Number, rotation_type: Literal["Left Rotation", "Right Rotation"]="Left Rotation", target: Target=DEFAULT_TARGET):
-        """
-        Sets the left or right rotation of a display entity from axis-angle rotation.
-    
-        :param DFVector axis_vector: Axis vector
-        :param Number angle: Angle (0-360)
-        :param str rotation_type: Rotation Type
-    
-            - Left Rotation: Applies before scaling the display entity when rendering.
-            - Right Rotation: Applies after scaling the display entity when rendering.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DispRotAxisAngle', (axis_vector, angle,), {'Rotation Type': rotation_type}, target=target)
-
-    @staticmethod
-    def SetFrogType(frog_type: Literal["Temperate", "Warm", "Cold"]="Temperate", target: Target=DEFAULT_TARGET):
-        """
-        :param str frog_type: Frog Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFrogType', (), {'Frog Type': frog_type}, target=target)
-
-    @staticmethod
-    def Damage(damage_to_inflict: Number, uuid_of_damager_entity: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Damages a mob.
-    
-        :param Number damage_to_inflict: Damage to inflict (❤ = 2 Health)
-        :param DFString | None uuid_of_damager_entity: UUID of damager entity (optional)
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Damage', (damage_to_inflict, uuid_of_damager_entity,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetMobSitting(is_sitting: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is sitting.
-    
-        :param str is_sitting: Is Sitting
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetMobSitting', (), {'Is Sitting': is_sitting}, target=target)
-
-    @staticmethod
-    def SendAnimation(animation_type: Literal["Hurt animation", "Crit particles", "Enchanted hit particles"]="Hurt animation", target: Target=DEFAULT_TARGET):
-        """
-        Makes a mob perform an animation.
-    
-        :param str animation_type: Animation Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SendAnimation', (), {'Animation Type': animation_type}, target=target)
-
-    @staticmethod
-    def SetWardenAnger(anger_level: Number, entity_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets the anger level of a Warden.
-    
-        :param Number anger_level: Anger level (0-150)
-        :param DFString entity_uuid: Entity UUID
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetWardenAnger', (anger_level, entity_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetHorsePattern(horse_color: Literal["White", "Buckskin", "Flaxen chestnut", "Bay", "Black", "Dapple gray", "Dark bay", "Don't change"]="Flaxen chestnut", horse_markings: Literal["No markings", "Stockings and blaze", "Paint", "Snowflake appaloosa", "Sooty", "Don't change"]="Stockings and blaze", target: Target=DEFAULT_TARGET):
-        """
-        Sets a horse's color and pattern.
-    
-        :param str horse_color: Horse Color
-        :param str horse_markings: Horse Markings
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetHorsePattern', (), {'Horse Color': horse_color, 'Horse Markings': horse_markings}, target=target)
-
-    @staticmethod
-    def Heal(amount_to_heal: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Restores a mob's health.
-    
-        :param Number | None amount_to_heal: Amount to heal OR Heals to full health) (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Heal', (amount_to_heal,), {}, target=target)
-
-    @staticmethod
-    def SetPandaSadTicks(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Makes a panda sad for the specified duration.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPandaSadTicks', (ticks,), {}, target=target)
-
-    @staticmethod
-    def SetDyeColor(dye: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="White", target: Target=DEFAULT_TARGET):
-        """
-        Sets a mob's dye color.
-    
-        :param str dye: Dye
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetDyeColor', (), {'Dye': dye}, target=target)
-
-    @staticmethod
-    def LaunchUp(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Launches an entity up or down.
-    
-        :param Number launch_power: Launch power
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'LaunchUp', (launch_power,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
-
-    @staticmethod
-    def SetAge(age: Number, age_lock: Literal["Enable", "Disable", "Don't change"]="Don't change", target: Target=DEFAULT_TARGET):
-        """
-        Sets an animal's age.
-    
-        :param Number age: Age
-        :param str age_lock: Age Lock
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAge', (age,), {'Age Lock': age_lock}, target=target)
-
-    @staticmethod
-    def SetName(custom_name: DFText | None=None, name_tag_visibility: Literal["Always", "Default", "Never", "Don't change"]="Always", target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's custom name.
-    
-        :param DFText | None custom_name: Custom name OR Removes custom name
-        :param str name_tag_visibility: Name Tag Visibility
-    
-            - Always: The custom name is always shown.
-            - Default: The custom name is shown when you are looking at the entity.
-            - Never: The custom name is always hidden.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', ' SetName ', (custom_name,), {'Name Tag Visibility': name_tag_visibility}, target=target)
-
-    @staticmethod
-    def SetArmsRaised(arms_raised: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob has its arms raised.
-    
-        :param str arms_raised: Arms Raised
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArmsRaised', (), {'Arms Raised': arms_raised}, target=target)
-
-    @staticmethod
-    def SetInvulnerable(invulnerable: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is invulnerable to damage.
-    
-        :param str invulnerable: Invulnerable
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetInvulnerable', (), {'Invulnerable': invulnerable}, target=target)
-
-    @staticmethod
-    def SetFriction(friction_type: Literal["Normal", "No Friction"]="No Friction", target: Target=DEFAULT_TARGET):
-        """
-        Changes the type of friction an entity experiences.
-    
-        :param str friction_type: Friction Type
-    
-            - Normal: The entity has normal friction.
-            - No Friction: The entity isn't slowed down by friction with the ground.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFriction', (), {'Friction Type': friction_type}, target=target)
-
-    @staticmethod
-    def SetPickupDelay(delay: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the number of ticks a dropped item cannot be picked up for.
-    
-        :param Number delay: Delay
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPickupDelay', (delay,), {}, target=target)
-
-    @staticmethod
-    def MannequinHand(main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", target: Target=DEFAULT_TARGET):
-        """
-        Sets a mannequin's main hand.
-    
-        :param str main_hand: Main Hand
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MannequinHand', (), {'Main Hand': main_hand}, target=target)
-
-    @staticmethod
-    def MiscAttribute(value: Number | None=None, attribute: Literal["Scale", "Follow range", "Zombie spawn reinforcements", "Oxygen bonus", "Burning time", "Camera distance", "Tempt range"]="Scale", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's miscellaneous attributes such as scale and burning time.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Scale: Base: 1.0 Range: 0.0625-16.0
-            - Follow range: Base: 32.0 Range: 0.0-2048.0
-            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
-            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
-            - Burning time: Base: 1.0 Range: 0.0-1024.0
-            - Camera distance: Base: 4.0 Range: 0.0-32.0
-            - Tempt range: Base: 10.0 Range: 0.0-2048.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MiscAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SetCreeperPower(power: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a creeper's explosion power. This affects the damage and area of effect.
-    
-        :param Number power: Power (0-25) (Default = 3 (6 for charged creepers))
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCreeperPower', (power,), {}, target=target)
-
-    @staticmethod
-    def SetMarker(marker: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an armor stand is a marker.
-    
-        :param str marker: Marker
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetMarker', (), {'Marker': marker}, target=target)
-
-    @staticmethod
-    def RemoveCustomTag(tag_name: DFString, target: Target=DEFAULT_TARGET):
-        """
-        Removes a custom tag from an entity.
-    
-        :param DFString tag_name: Tag name
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'RemoveCustomTag', (tag_name,), {}, target=target)
-
-    @staticmethod
-    def SetAbsorption(absorption_health: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's absorption health (golden hearts).
-    
-        :param Number absorption_health: Absorption health (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAbsorption', (absorption_health,), {}, target=target)
-
-    @staticmethod
-    def CreeperCharged(charged: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a creeper has the charged effect.
-    
-        :param str charged: Charged
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'CreeperCharged', (), {'Charged': charged}, target=target)
-
-    @staticmethod
-    def SetFireTicks(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the remaining time an entity is on fire for.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFireTicks', (ticks,), {}, target=target)
-
-    @staticmethod
-    def CombatAttribute(value: Number | None=None, attribute: Literal["Attack damage", "Attack knockback"]="Attack damage", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's combat-related attributes such as attack damage and attack speed.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Attack damage: Base: 2.0 Range: 0.0-2048.0
-            - Attack knockback: Base: 0.0 Range: 0.0-5.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'CombatAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def Jump(target: Target=DEFAULT_TARGET):
-        """
-        Causes a mob to jump.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Jump', (), {}, target=target)
-
-    @staticmethod
-    def MannequinDesc(description: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets a mannequin's description.
-    
-        :param DFText | None description: Description (optional) (Only shown if name is visible)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MannequinDesc', (description,), {}, target=target)
-
-    @staticmethod
-    def BDisplayBlock(displayed_block: Item, block_data: list[DFString] | DFString | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the displayed block of a block display.
-    
-        :param Item displayed_block: Displayed block
-        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'BDisplayBlock', (displayed_block, block_data,), {}, target=target)
-
-    @staticmethod
-    def SetFreezeTicks(ticks: Number, ticking_locked: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's current freeze ticks.
-    
-        :param Number ticks: Ticks (0-140)
-        :param str ticking_locked: Ticking Locked
-    
-            - Enable: Entity will stay frozen.
-            - Disable: Entity will slowly unfreeze over time.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFreezeTicks', (ticks,), {'Ticking Locked': ticking_locked}, target=target)
-
-    @staticmethod
-    def TDisplaySeeThru(seethrough: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a text display is visible through walls or not.
-    
-        :param str seethrough: See-through
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplaySeeThru', (), {'See-through': seethrough}, target=target)
-
-    @staticmethod
-    def SetGliding(gliding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is gliding.
-    
-        :param str gliding: Gliding
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGliding', (), {'Gliding': gliding}, target=target)
-
-    @staticmethod
-    def SetRotation(pitch: Number, yaw: Number, target: Target=DEFAULT_TARGET):
-        """
-        Changes an entity's pitch and yaw without teleporting it.
-    
-        :param Number pitch: Pitch (-90 to 90)
-        :param Number yaw: Yaw (-180 to 180)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetRotation', (pitch, yaw,), {}, target=target)
-
-    @staticmethod
-    def VillagerHeadAnim(target: Target=DEFAULT_TARGET):
-        """
-        Makes a villager perform a head shake animation.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'VillagerHeadAnim', (), {}, target=target)
-
-    @staticmethod
-    def SetPandaRolling(roll_type: Literal["Roll", "Stop Rolling"]="Roll", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a panda is rolling or not.
-    
-        :param str roll_type: Roll Type
-    
-            - Roll: Makes the panda do a single roll. Does nothing if already rolling.
-            - Stop Rolling: Makes the panda stop rolling if it's already rolling.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPandaRolling', (), {'Roll Type': roll_type}, target=target)
-
-    @staticmethod
-    def SetFishPattern(pattern_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black", "Don't change"]="White", body_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black", "Don't change"]="White", pattern: Literal["Kob", "Sunstreak", "Snooper", "Dasher", "Brinely", "Spotty", "Flopper", "Stripey", "Glitter", "Blockfish", "Betty", "Clayfish", "Don't change"]="Kob", target: Target=DEFAULT_TARGET):
-        """
-        Sets a tropical fish's color and pattern.
-    
-        :param str pattern_color: Pattern Color
-        :param str body_color: Body Color
-        :param str pattern: Pattern
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFishPattern', (), {'Pattern Color': pattern_color, 'Body Color': body_color, 'Pattern': pattern}, target=target)
-
-    @staticmethod
-    def SetTemperature(temperature_type: Literal["Cold", "Temperate", "Warm"]="Temperate", target: Target=DEFAULT_TARGET):
-        """
-        Sets a mob's temperature variant.
-    
-        :param str temperature_type: Temperature Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetTemperature', (), {'Temperature Type': temperature_type}, target=target)
-
-    @staticmethod
-    def SetWolfType(wolf_type: Literal["Ashen", "Black", "Chestnut", "Pale", "Rusty", "Snowy", "Spotted", "Striped", "Woods"]="Ashen", target: Target=DEFAULT_TARGET):
-        """
-        Sets a wolf's variant.
-    
-        :param str wolf_type: Wolf Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetWolfType', (), {'Wolf Type': wolf_type}, target=target)
-
-    @staticmethod
-    def DispInterpolation(interpolation_duration: Number | None=None, interpolation_delay: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the interpolation properties of a display entity.
-    
-        :param Number | None interpolation_duration: Interpolation duration in ticks (optional) (Default = 0)
-        :param Number | None interpolation_delay: Interpolation delay in ticks (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DispInterpolation', (interpolation_duration, interpolation_delay,), {}, target=target)
-
-    @staticmethod
-    def SetEndermanBlock(block_to_hold: Item, target: Target=DEFAULT_TARGET):
-        """
-        Set an enderman's held block.
-    
-        :param Item block_to_hold: Block to hold
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetEndermanBlock', (block_to_hold,), {}, target=target)
-
-    @staticmethod
-    def MannequinMovable(movable: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mannequin is movable.
-    
-        :param str movable: Movable
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MannequinMovable', (), {'Movable': movable}, target=target)
-
-    @staticmethod
-    def LaunchToward(launch_destination: Location, launch_power: Number | None=None, add_to_current_velocity: Literal["True", "False"]="True", ignore_distance: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Launches an entity toward or away from a location.
-    
-        :param Location launch_destination: Launch destination
-        :param Number | None launch_power: Launch power (optional)
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param str ignore_distance: Ignore Distance
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'LaunchToward', (launch_destination, launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Ignore Distance': ignore_distance}, target=target)
-
-    @staticmethod
-    def SetArmor(armor_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets a mob's armor items. Place the armor in slots 1-4 of the chest, with 1 being the helmet and 4 being the boots.
-    
-        :param list[Item] | Item armor_to_set: Armor to set
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArmor', (armor_to_set,), {}, target=target)
-
-    @staticmethod
-    def GetCustomTag(result: Variable, tag_name: DFString, target: Target=DEFAULT_TARGET):
-        """
-        Gets the value of a custom entity tag.
-    
-        :param Variable result: Variable to set
-        :param DFString tag_name: Tag name
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'GetCustomTag', (result, tag_name,), {}, target=target)
-
-    @staticmethod
-    def InteractionSize(width: Number | None=None, height: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the hitbox size of an interaction entity.
-    
-        :param Number | None width: Width (optional) (Default = 1)
-        :param Number | None height: Height (optional) (Default = 1)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'InteractionSize', (width, height,), {}, target=target)
-
-    @staticmethod
-    def FaceLocation(location_to_face: Location, face_direction: Literal["Toward location", "Away from location"]="Toward location", target: Target=DEFAULT_TARGET):
-        """
-        Rotates an entity to look toward a location without teleporting them.
-    
-        :param Location location_to_face: Location to face
-        :param str face_direction: Face Direction
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'FaceLocation', (location_to_face,), {'Face Direction': face_direction}, target=target)
-
-    @staticmethod
-    def SetCatType(skin_type: Literal["Tabby", "Tuxedo", "Red", "Siamese", "British Shorthair", "Calico", "Persian", "Ragdoll", "White", "Jellie", "Black"]="Tabby", target: Target=DEFAULT_TARGET):
-        """
-        Sets a cat's skin type.
-    
-        :param str skin_type: Skin Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCatType', (), {'Skin Type': skin_type}, target=target)
-
-    @staticmethod
-    def SetArrowDamage(base_damage: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the base damage dealt by an arrow or trident.
-    
-        :param Number base_damage: Base Damage
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArrowDamage', (base_damage,), {}, target=target)
-
-    @staticmethod
-    def DisplayScale(x_scale: Number, y_scale: Number, z_scale: Number | DFVector, target: Target=DEFAULT_TARGET):
-        """
-        Sets the scale of a display entity.
-    
-        :param Number x_scale: X scale
-        :param Number y_scale: Y scale
-        :param Number | DFVector z_scale: Z scale OR Scale vector
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayScale', (x_scale, y_scale, z_scale,), {}, target=target)
-
-    @staticmethod
-    def TDisplayAlign(text_alignment: Literal["Center", "Left", "Right"]="Center", target: Target=DEFAULT_TARGET):
-        """
-        Sets the text alignment of a text display.
-    
-        :param str text_alignment: Text Alignment
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplayAlign', (), {'Text Alignment': text_alignment}, target=target)
-
-    @staticmethod
-    def LaunchProj(projectile_to_launch: Item, launch_point: Location | None=None, projectile_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Launches a projectile from a mob.
-    
-        :param Item projectile_to_launch: Projectile to launch
-        :param Location | None launch_point: Launch point (optional)
-        :param DFText | None projectile_name: Projectile name (optional)
-        :param Number | None speed: Speed (optional)
-        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'LaunchProj', (projectile_to_launch, launch_point, projectile_name, speed, inaccuracy,), {}, target=target)
-
-    @staticmethod
-    def DisplayBillboard(billboard_type: Literal["Fixed", "Vertical", "Horizontal", "Center"]="Fixed", target: Target=DEFAULT_TARGET):
-        """
-        Sets how a display entity is rotated with a player's view.
-    
-        :param str billboard_type: Billboard Type
-    
-            - Fixed: Display entity does not rotate.
-            - Vertical: Display entity faces player around vertical axis.
-            - Horizontal: Display entity faces player around horizontal axis.
-            - Center: Display entity faces player in all axes.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayBillboard', (), {'Billboard Type': billboard_type}, target=target)
-
-    @staticmethod
-    def Tame(owner_uuid: DFString | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Tames and sets the owner of a tameable mob.
-    
-        :param DFString | None owner_uuid: Owner UUID OR Untames mob
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Tame', (owner_uuid,), {}, target=target)
-
-    @staticmethod
-    def SetGoatScreaming(screams: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a goat screams or not.
-    
-        :param str screams: Screams
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGoatScreaming', (), {'Screams': screams}, target=target)
-
-    @staticmethod
-    def SetBeeStinger(has_stinger: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a bee has its stinger.
-    
-        :param str has_stinger: Has Stinger
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetBeeStinger', (), {'Has Stinger': has_stinger}, target=target)
-
-    @staticmethod
-    def RestockTrades(target: Target=DEFAULT_TARGET):
-        """
-        Restocks all of a villager's trades.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'RestockTrades', (), {}, target=target)
-
-    @staticmethod
-    def MobDisguise(mob_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises an entity as a mob.
-    
-        :param Item mob_to_disguise_as: Mob to disguise as
-        :param DFText | None display_name: Display name (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MobDisguise', (mob_to_disguise_as, display_name,), {}, target=target)
-
-    @staticmethod
-    def SetMinecartBlock(block_to_show: Item, block_offset: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the block shown inside a minecart. This does not affect its functionality.
-    
-        :param Item block_to_show: Block to show
-        :param Number | None block_offset: Block offset (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetMinecartBlock', (block_to_show, block_offset,), {}, target=target)
-
-    @staticmethod
-    def FoxSleeping(sleeping: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Causes a fox to start or stop sleeping.
-    
-        :param str sleeping: Sleeping
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'FoxSleeping', (), {'Sleeping': sleeping}, target=target)
-
-    @staticmethod
-    def LockDisgRotation(pitch_to_lock_to: Number | None=None, yaw_to_lock_to: Number | None=None, pitch: Literal["Lock", "Unlock", "No Change"]="No Change", yaw: Literal["Lock", "Unlock", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
-        """
-        Locks a disguise's pitch or yaw values.
-    
-        :param Number | None pitch_to_lock_to: Pitch to lock to (optional) (Default = 0)
-        :param Number | None yaw_to_lock_to: Yaw to lock to (optional) (Default = 0)
-        :param str pitch: Pitch
-        :param str yaw: Yaw
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'LockDisgRotation', (pitch_to_lock_to, yaw_to_lock_to,), {'Pitch': pitch, 'Yaw': yaw}, target=target)
-
-    @staticmethod
-    def SetEquipment(item_to_set: Item | None=None, equipment_slot: Literal["Main hand", "Off hand", "Head", "Body", "Legs", "Feet", "Saddle", "Horse armor", "Decor", "Harness"]="Main hand", target: Target=DEFAULT_TARGET):
-        """
-        Sets the item in one of the equipment slots (including horse items) of an entity.
-    
-        :param Item | None item_to_set: Item to set (optional)
-        :param str equipment_slot: Equipment Slot
-    
-            - Main hand: Sets the hand item of a mob with a hand slot.
-            - Off hand: Sets the off hand item of a mob with two hand slots.
-            - Head: Sets the head armor item of a mob that can wear hats or armor.
-            - Body: Sets the chest armor item of a mob that can wear armor.
-            - Legs: Sets the legs armor item of a mob that can wear armor.
-            - Feet: Sets the feet armor item of a mob that can wear armor.
-            - Saddle: Sets the saddle item of a horse.
-            - Horse armor: Sets the armor item of a horse.
-            - Decor: Sets the decor item of a llama.
-            - Harness: Sets the harness item of a happy ghast.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetEquipment', (item_to_set,), {'Equipment Slot': equipment_slot}, target=target)
-
-    @staticmethod
-    def SetSilenced(silenced: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity will produce sound effects.
-    
-        :param str silenced: Silenced
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetSilenced', (), {'Silenced': silenced}, target=target)
-
-    @staticmethod
-    def SetBeeNectar(has_nectar: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets if a bee has nectar on its body.
-    
-        :param str has_nectar: Has Nectar
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetBeeNectar', (), {'Has Nectar': has_nectar}, target=target)
-
-    @staticmethod
-    def AttachLead(lead_holder_uuid: DFString | Location, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Attaches a lead to the target, held by an entity or lead knot.
-    
-        :param DFString | Location lead_holder_uuid: Lead holder UUID OR Lead knot location (Spawns a Leash Knot entity. Requires a fence block.)
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'AttachLead', (lead_holder_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def RemovePotion(effect_to_remove: list[Potion] | Potion, target: Target=DEFAULT_TARGET):
-        """
-        Removes one or more potion effects from an entity.
-    
-        :param list[Potion] | Potion effect_to_remove: Effect(s) to remove
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'RemovePotion', (effect_to_remove,), {}, target=target)
-
-    @staticmethod
-    def ShearSheep(target: Target=DEFAULT_TARGET):
-        """
-        Causes a sheep to be sheared.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ShearSheep', (), {}, target=target)
-
-    @staticmethod
-    def ArmorStandSlots(interactions: Literal["Take, swap or place item", "Take or swap item", "Take item", "Place item", "None"]="Take, swap or place item", equipment_slot: Literal["All", "Main hand", "Off hand", "Head", "Chest", "Legs", "Feet"]="All", target: Target=DEFAULT_TARGET):
-        """
-        Sets the possible interactions, such as adding or removing items, of an armor stand's slot(s).
-    
-        :param str interactions: Interactions
-    
-            - Take, swap or place item: Players are able to: • Remove an item from this slot • Swap their held item with this slot • Place their held item in this slot
-            - Take or swap item: Players are able to: • Remove an item from this slot • Swap their held item with this slot
-            - Take item: Players are able to: • Remove an item from this slot
-            - Place item: Players are able to: • Place their held item in this slot (if the slot is empty)
-            - None: Players are unable to interact with this slot.
-        :param str equipment_slot: Equipment Slot
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ArmorStandSlots', (), {'Interactions': interactions, 'Equipment Slot': equipment_slot}, target=target)
-
-    @staticmethod
-    def SetAllayDancing(dancing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an allay is dancing or not.
-    
-        :param str dancing: Dancing
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAllayDancing', (), {'Dancing': dancing}, target=target)
-
-    @staticmethod
-    def SetRabbitType(skin_type: Literal["Brown", "White", "Black", "Black and White", "Gold", "Salt and Pepper", "Killer"]="Brown", target: Target=DEFAULT_TARGET):
-        """
-        Sets a rabbit's skin type.
-    
-        :param str skin_type: Skin Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetRabbitType', (), {'Skin Type': skin_type}, target=target)
-
-    @staticmethod
-    def SetSize(size: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the size of an entity. This may also affect its health and strength.
-    
-        :param Number size: Size
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetSize', (size,), {}, target=target)
-
-    @staticmethod
-    def SetAngry(angry: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob is angry at players.
-    
-        :param str angry: Angry
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAngry', (), {'Angry': angry}, target=target)
-
-    @staticmethod
-    def Undisguise(target: Target=DEFAULT_TARGET):
-        """
-        Removes an entity's disguise.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Undisguise', (), {}, target=target)
-
-    @staticmethod
-    def SetDeathDrops(has_death_drops: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob drops their items when dead.
-    
-        :param str has_death_drops: Has Death Drops
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetDeathDrops', (), {'Has Death Drops': has_death_drops}, target=target)
-
-    @staticmethod
-    def SetPersistent(persistent: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an item or a falling block will never despawn.
-    
-        :param str persistent: Persistent
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPersistent', (), {'Persistent': persistent}, target=target)
-
-    @staticmethod
-    def ProjectileItem(display_item: Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets the item a projectile displays as.
-    
-        :param Item display_item: Display item
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ProjectileItem', (display_item,), {}, target=target)
-
-    @staticmethod
-    def SetNameColor(name_color: Literal["Black", "Dark blue", "Dark green", "Dark aqua", "Dark red", "Dark purple", "Gold", "Gray", "Dark gray", "Blue", "Green", "Aqua", "Red", "Light purple", "Yellow", "White", "None"]="Black", target: Target=DEFAULT_TARGET):
-        """
-        Sets the color an entity's name tag appears in.
-    
-        :param str name_color: Name Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetNameColor', (), {'Name Color': name_color}, target=target)
-
-    @staticmethod
-    def SetCarryingChest(carrying_chest: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob carries a chest, which allows its inventory to be accessed.
-    
-        :param str carrying_chest: Carrying Chest
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCarryingChest', (), {'Carrying Chest': carrying_chest}, target=target)
-
-    @staticmethod
-    def SetParrotColor(parrot_color: Literal["Red", "Blue", "Green", "Cyan", "Gray"]="Red", target: Target=DEFAULT_TARGET):
-        """
-        Sets a parrot's color.
-    
-        :param str parrot_color: Parrot Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetParrotColor', (), {'Parrot Color': parrot_color}, target=target)
-
-    @staticmethod
-    def DispTranslation(x_translation: Number, y_translation: Number, z_translation: Number | DFVector, target: Target=DEFAULT_TARGET):
-        """
-        Sets the translation values of a display entity.
-    
-        :param Number x_translation: X translation
-        :param Number y_translation: Y translation
-        :param Number | DFVector z_translation: Z translation OR Translation vector
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DispTranslation', (x_translation, y_translation, z_translation,), {}, target=target)
-
-    @staticmethod
-    def Remove(target: Target=DEFAULT_TARGET):
-        """
-        Deletes an entity.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Remove', (), {}, target=target)
-
-    @staticmethod
-    def TDispBackground(color_hexadecimal: DFString, opacity_in_percentage: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the background color and opacity of a text display.
-    
-        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
-        :param Number | None opacity_in_percentage: Opacity in percentage OR Uses the default background color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDispBackground', (color_hexadecimal, opacity_in_percentage,), {}, target=target)
-
-    @staticmethod
-    def DisplayCullingSize(width: Number | None=None, height: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the culling width and height of a display entity.
-    
-        :param Number | None width: Width (optional) (Default = 0)
-        :param Number | None height: Height (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayCullingSize', (width, height,), {}, target=target)
-
-    @staticmethod
-    def SetAxolotlColor(axolotl_color: Literal["Pink", "Brown", "Yellow", "Cyan", "Blue"]="Pink", target: Target=DEFAULT_TARGET):
-        """
-        Sets an axolotl's color.
-    
-        :param str axolotl_color: Axolotl Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAxolotlColor', (), {'Axolotl Color': axolotl_color}, target=target)
-
-    @staticmethod
-    def GetAllEntityTags(result: Variable, target: Target=DEFAULT_TARGET):
-        """
-        Gets all tags registered on an entity.
-    
-        :param Variable result: Variable to set
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'GetAllEntityTags', (result,), {}, target=target)
-
-    @staticmethod
-    def SetAI(ai: Literal["Sentient", "Insentient", "None"]="None", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is sentient and/or affected by physics.
-    
-        :param str ai: AI
-    
-            - Sentient: The entity acts normally.
-            - Insentient: The entity does not act by itself, but is affected by physics.
-            - None: The entity does not act by itself, and is unaffected by physics.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetAI', (), {'AI': ai}, target=target)
-
-    @staticmethod
-    def KBAttribute(value: Number | None=None, attribute: Literal["Knockback resistance", "Explosion knockback resistance"]="Knockback resistance", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's knockback-related attributes such as knockback resistance.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'KBAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def MovementAttribute(value: Number | None=None, attribute: Literal["Walking speed", "Flying speed", "Jump strength", "Step height", "Movement efficiency", "Water movement efficiency"]="Walking speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's movement-related attributes, such as walking speed and jump height.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Walking speed: Base: 0.2 Range: 0.0-1024.0
-            - Flying speed: Base: 0.4 Range: 0.0-1024.0
-            - Jump strength: Base: 0.42 Range: 0.0-32.0
-            - Step height: Base: 0.6 Range: 0.0-10.0
-            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MovementAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SetRiptiding(riptiding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is riptiding.
-    
-        :param str riptiding: Riptiding
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetRiptiding', (), {'Riptiding': riptiding}, target=target)
-
-    @staticmethod
-    def SetArrowNoClip(has_noclip: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an arrow will pass through blocks and through entities.
-    
-        :param str has_noclip: Has NoClip
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArrowNoClip', (), {'Has NoClip': has_noclip}, target=target)
-
-    @staticmethod
-    def FallingAttribute(value: Number | None=None, attribute: Literal["Gravity", "Safe fall distance", "Fall damage multiplier"]="Gravity", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's falling-related attributes, such as gravity and fall damage multiplier.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Gravity: Base: 0.08 Range: -1.0-1.0
-            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
-            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'FallingAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def SetProjSource(shooter_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets the projectile source of a projectile (or removes it).
-    
-        :param DFString | None shooter_uuid: Shooter UUID OR Removes shooter
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetProjSource', (shooter_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetFoxLeaping(leaping: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a fox appears to be leaping.
-    
-        :param str leaping: Leaping
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFoxLeaping', (), {'Leaping': leaping}, target=target)
-
-    @staticmethod
-    def SetPandaGene(set_gene: Literal["Main gene", "Hidden gene", "Both"]="Both", gene_type: Literal["Aggressive", "Lazy", "Weak", "Worried", "Playful", "Normal", "Brown"]="Aggressive", target: Target=DEFAULT_TARGET):
-        """
-        Sets the gene of a panda. This affects their behavior and appearance.
-    
-        :param str set_gene: Set Gene
-        :param str gene_type: Gene Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPandaGene', (), {'Set Gene': set_gene, 'Gene Type': gene_type}, target=target)
-
-    @staticmethod
-    def SetMaxHealth(maximum_health: Number, heal_mob_to_max_health: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's maximum health.
-    
-        :param Number maximum_health: Maximum health
-        :param str heal_mob_to_max_health: Heal Mob to Max Health
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetMaxHealth', (maximum_health,), {'Heal Mob to Max Health': heal_mob_to_max_health}, target=target)
-
-    @staticmethod
-    def SetFishingTime(wait_time: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the time until a fish starts to approach a fishing hook.
-    
-        :param Number wait_time: Wait time (ticks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFishingTime', (wait_time,), {}, target=target)
-
-    @staticmethod
-    def ClrVillagerTrades(target: Target=DEFAULT_TARGET):
-        """
-        Removes all trades from a villager.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ClrVillagerTrades', (), {}, target=target)
-
-    @staticmethod
-    def EndCrystalBeam(target_location: Location | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the location an end crystal points its beam at.
-    
-        :param Location | None target_location: Target (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'EndCrystalBeam', (target_location,), {}, target=target)
-
-    @staticmethod
-    def FrogEat(target_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Makes a frog try to eat the specified mob or player.
-    
-        :param DFString target_uuid: Target UUID
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'FrogEat', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetSalmonType(salmon_type: Literal["Small", "Medium", "Large"]="Medium", target: Target=DEFAULT_TARGET):
-        """
-        Sets a salmon's variant.
-    
-        :param str salmon_type: Salmon Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetSalmonType', (), {'Salmon Type': salmon_type}, target=target)
-
-    @staticmethod
-    def DisplayBrightness(block_light_level: Number, sky_light_level: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the brightness of a display entity.
-    
-        :param Number block_light_level: Block light level (0-15)
-        :param Number | None sky_light_level: Sky light level (0-15) OR Uses the light level at entity's location
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayBrightness', (block_light_level, sky_light_level,), {}, target=target)
-
-    @staticmethod
-    def SetProfession(retain_trades: Literal["True", "False"]="False", profession: Literal["Unemployed", "Armorer", "Butcher", "Cartographer", "Cleric", "Farmer", "Fisherman", "Fletcher", "Leatherworker", "Librarian", "Mason", "Nitwit", "Shepherd", "Toolsmith", "Weaponsmith"]="Armorer", target: Target=DEFAULT_TARGET):
-        """
-        Sets a villager's profession.
-    
-        :param str retain_trades: Retain Trades
-        :param str profession: Profession
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetProfession', (), {'Retain Trades': retain_trades, 'Profession': profession}, target=target)
-
-    @staticmethod
-    def SetTradeUses(trade_index: Number, remaining_uses: Number | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the amount of times a trade can be made before the villager has to restock.
-    
-        :param Number trade_index: Trade index
-        :param Number | None remaining_uses: Remaining uses (optional) (Default = Infinite)
-        :param Number | None maximum_uses: Maximum uses (optional) (Default = No change)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetTradeUses', (trade_index, remaining_uses, maximum_uses,), {}, target=target)
-
-    @staticmethod
-    def ClearPotions(target: Target=DEFAULT_TARGET):
-        """
-        Removes all active potion effects from an entity.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ClearPotions', (), {}, target=target)
-
-    @staticmethod
-    def ArmorStandParts(arms: Literal["Enable", "Disable", "Don't change"]="Enable", base_plate: Literal["Enable", "Disable", "Don't change"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an armor stand has arms and a base plate.
-    
-        :param str arms: Arms
-        :param str base_plate: Base Plate
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ArmorStandParts', (), {'Arms': arms, 'Base Plate': base_plate}, target=target)
-
-    @staticmethod
-    def SetNameVisible(name_tag_visibility: Literal["Always", "Default", "Never"]="Always", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity's custom name is always displayed above them.
-    
-        :param str name_tag_visibility: Name Tag Visibility
-    
-            - Always: The custom name is always shown.
-            - Default: The custom name is shown when you are looking at the entity.
-            - Never: The custom name is always hidden.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', ' SetNameVisible ', (), {'Name Tag Visibility': name_tag_visibility}, target=target)
-
-    @staticmethod
-    def SetTarget(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Instructs a mob's AI to target a specific mob or player.
-    
-        :param list[DFString] | DFString | None target_uuid: Target UUID OR Stop targeting)
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def TDisplayShadow(text_shadow: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether the text in a text display has shadow or not.
-    
-        :param str text_shadow: Text Shadow
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplayShadow', (), {'Text Shadow': text_shadow}, target=target)
-
-    @staticmethod
-    def SetInvulTicks(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the currently remaining ticks until an entity can next be hurt.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetInvulTicks', (ticks,), {}, target=target)
-
-    @staticmethod
-    def MannequinSkin(mannequin_player_head: Item | DFString, target: Target=DEFAULT_TARGET):
-        """
-        Sets a mannequin's skin avatar.
-    
-        :param Item | DFString mannequin_player_head: Mannequin player head OR Mannequin player name or UUID
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MannequinSkin', (mannequin_player_head,), {}, target=target)
-
-    @staticmethod
-    def SetShulkerPeek(peek_percentage: Number, is_silent: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets how far a shulker should peek up to.
-    
-        :param Number peek_percentage: Peek Percentage
-        :param str is_silent: Is Silent
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetShulkerPeek', (peek_percentage,), {'Is Silent': is_silent}, target=target)
-
-    @staticmethod
-    def SetPose(pose: Literal["Standing", "Sleeping", "Swimming", "Sneaking"]="Standing", target: Target=DEFAULT_TARGET):
-        """
-        Changes the pose of an entity. This affects their animations and/or hitbox, depending on the pose and entity type.
-    
-        :param str pose: Pose
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', ' SetPose ', (), {'Pose': pose}, target=target)
-
-    @staticmethod
-    def SetRearing(rearing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a horse is standing on its hind legs.
-    
-        :param str rearing: Rearing
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetRearing', (), {'Rearing': rearing}, target=target)
-
-    @staticmethod
-    def SetCloudRadius(radius: Number, shrinking_speed: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets an area of effect cloud's radius and shrinking speed.
-    
-        :param Number radius: Radius
-        :param Number | None shrinking_speed: Shrinking speed (blocks per second) (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCloudRadius', (radius, shrinking_speed,), {}, target=target)
-
-    @staticmethod
-    def SetGravity(gravity: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is affected by gravity.
-    
-        :param str gravity: Gravity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGravity', (), {'Gravity': gravity}, target=target)
-
-    @staticmethod
-    def Mimic(target_uuid: list[DFString] | DFString, remove_original_entity: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Disguises an entity as another currently existing entity or player.
-    
-        :param list[DFString] | DFString target_uuid: UUID of target to disguise as
-        :param str remove_original_entity: Remove Original Entity
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Mimic', (target_uuid,), {'Remove Original Entity': remove_original_entity}, target=target)
-
-    @staticmethod
-    def DispTPDuration(teleport_duration: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets how long a display entity takes to visually move to its destination when it teleports.
-    
-        :param Number | None teleport_duration: Teleport duration in ticks (optional) (Default = 0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DispTPDuration', (teleport_duration,), {}, target=target)
-
-    @staticmethod
-    def SetWitherInvul(ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the remaining ticks of invulnerability a wither has.
-    
-        :param Number ticks: Ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetWitherInvul', (ticks,), {}, target=target)
-
-    @staticmethod
-    def SetArrowPierce(targets_to_pierce: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets how many targets an arrow can pierce through. A pierce of 1 can hit up to 2 entities.
-    
-        :param Number targets_to_pierce: Targets to pierce
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArrowPierce', (targets_to_pierce,), {}, target=target)
-
-    @staticmethod
-    def DisplayShadow(shadow_radius_in_blocks: Number | None=None, shadow_opacity_in_percentage: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the shadow properties of a display entity.
-    
-        :param Number | None shadow_radius_in_blocks: Shadow radius in blocks (optional) (Default = 1)
-        :param Number | None shadow_opacity_in_percentage: Shadow opacity in percentage (optional) (Default = 100)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayShadow', (shadow_radius_in_blocks, shadow_opacity_in_percentage,), {}, target=target)
-
-    @staticmethod
-    def InteractResponse(responsive: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an interaction entity has response when interacting with it.
-    
-        :param str responsive: Responsive
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'InteractResponse', (), {'Responsive': responsive}, target=target)
-
-    @staticmethod
-    def UseItem(hand: Literal["Main Hand", "Off Hand"]="Main Hand", use_item: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Forces a mob to use held items such as bow or spyglass.
-    
-        :param str hand: Hand
-        :param str use_item: Use Item
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'UseItem', (), {'Hand': hand, 'Use Item': use_item}, target=target)
-
-    @staticmethod
-    def RideEntity(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Mounts an entity on top of another entity or player.
-    
-        :param list[DFString] | DFString | None target_uuid: Target UUID OR Dismounts entity
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'RideEntity', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def DisplayMatrix(sixteen_numbers_describing_a_rowmajor_matrix: ArgValue, target: Target=DEFAULT_TARGET):
-        """
-        Sets the affine transformation matrix of a display entity.
-    
-        :param ArgValue sixteen_numbers_describing_a_rowmajor_matrix: 16 numbers describing a row-major matrix
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayMatrix', (sixteen_numbers_describing_a_rowmajor_matrix,), {}, target=target)
-
-    @staticmethod
-    def SetWolfSoundType(wolf_sound_type: Literal["Angry", "Big", "Classic", "Cute", "Grumpy", "Puglin", "Sad"]="Angry", target: Target=DEFAULT_TARGET):
-        """
-        Sets a wolf's sound variant.
-    
-        :param str wolf_sound_type: Wolf Sound Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetWolfSoundType', (), {'Wolf Sound Type': wolf_sound_type}, target=target)
-
-    @staticmethod
-    def SnifferState(behavior: Literal["Idle", "Feeling Happy", "Scenting", "Sniffing", "Searching", "Digging"]="Idle", target: Target=DEFAULT_TARGET):
-        """
-        Forces a sniffer to perform a specific action.
-    
-        :param str behavior: Behavior
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SnifferState', (), {'Behavior': behavior}, target=target)
-
-    @staticmethod
-    def Teleport(new_position: Location, keep_current_rotation: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
-        """
-        Teleports an entity to a specified location.
-    
-        :param Location new_position: New position
-        :param str keep_current_rotation: Keep Current Rotation
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Teleport', (new_position,), {'Keep Current Rotation': keep_current_rotation}, target=target)
-
-    @staticmethod
-    def DisplayGlowColor(color_hexadecimal: DFString | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the glowing color of a display entity.
-    
-        :param DFString | None color_hexadecimal: Color hexadecimal OR Resets glow color (Example: "#FF0000" (red))
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayGlowColor', (color_hexadecimal,), {}, target=target)
-
-    @staticmethod
-    def SetVisualFire(on_fire: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity should appear on fire.
-    
-        :param str on_fire: On Fire
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVisualFire', (), {'On Fire': on_fire}, target=target)
-
-    @staticmethod
-    def DisguiseShiftVert(yoffset: Number, target: Target=DEFAULT_TARGET):
-        """
-        Shifts the disguise of an entity up or down relative to the entity itself.
-    
-        :param Number yoffset: Y-Offset
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisguiseShiftVert', (yoffset,), {}, target=target)
-
-    @staticmethod
-    def SetSaddle(saddle: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob wears a saddle.
-    
-        :param str saddle: Saddle
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetSaddle', (), {'Saddle': saddle}, target=target)
-
-    @staticmethod
-    def SetBulletTarget(target_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Causes a shulker bullet to start targeting the provided entity.
-    
-        :param DFString | None target_uuid: Target UUID OR No Target)
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetBulletTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def TDisplayLineWidth(line_width: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the maximum line width of a text display.
-    
-        :param Number | None line_width: Line width (optional) (Default = 200)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplayLineWidth', (line_width,), {}, target=target)
-
-    @staticmethod
-    def RemVillagerTrade(trade_index: Number, target: Target=DEFAULT_TARGET):
-        """
-        Removes a trade from a villager
-    
-        :param Number trade_index: Trade index
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'RemVillagerTrade', (trade_index,), {}, target=target)
-
-    @staticmethod
-    def SetDragonPhase(phase: Literal["Flying", "Hovering", "Breath attack", "Dying"]="Flying", target: Target=DEFAULT_TARGET):
-        """
-        Sets the behavior phase of an Ender Dragon.
-    
-        :param str phase: Phase
-    
-            - Flying: The dragon will fly towards the world origin.
-            - Hovering: The dragon will not move.
-            - Breath attack: The dragon will perform a breath attack while hovering.
-            - Dying: The dragon will disappear after a 10 second death animation.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetDragonPhase', (), {'Phase': phase}, target=target)
-
-    @staticmethod
-    def SetLlamaColor(llama_color: Literal["Brown", "Creamy", "White", "Gray"]="Brown", target: Target=DEFAULT_TARGET):
-        """
-        Sets a llama's fur color.
-    
-        :param str llama_color: Llama Color
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetLlamaColor', (), {'Llama Color': llama_color}, target=target)
-
-    @staticmethod
-    def SetVillagerBiome(biome: Literal["Desert", "Jungle", "Plains", "Savanna", "Snow", "Swamp", "Taiga"]="Desert", target: Target=DEFAULT_TARGET):
-        """
-        Sets the biome type of a villager. This affects their appearance only.
-    
-        :param str biome: Biome
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVillagerBiome', (), {'Biome': biome}, target=target)
-
-    @staticmethod
-    def SetCreeperFuse(fuse_ticks: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets the starting amount of ticks it takes for a creeper to explode.
-    
-        :param Number fuse_ticks: Fuse ticks
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCreeperFuse', (fuse_ticks,), {}, target=target)
-
-    @staticmethod
-    def SetBaby(baby: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is a baby (permanently).
-    
-        :param str baby: Baby
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetBaby', (), {'Baby': baby}, target=target)
-
-    @staticmethod
-    def MooshroomType(mooshroom_variant: Literal["Red", "Brown"]="Red", target: Target=DEFAULT_TARGET):
-        """
-        Sets a mooshroom's skin type.
-    
-        :param str mooshroom_variant: Mooshroom Variant
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MooshroomType', (), {'Mooshroom Variant': mooshroom_variant}, target=target)
-
-    @staticmethod
-    def SetInvisible(invisible: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether an entity is invisible.
-    
-        :param str invisible: Invisible
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetInvisible', (), {'Invisible': invisible}, target=target)
-
-    @staticmethod
-    def SheepEat(target: Target=DEFAULT_TARGET):
-        """
-        Causes a sheep to eat grass.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SheepEat', (), {}, target=target)
-
-    @staticmethod
-    def SetCatResting(resting: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a cat appears to be lying down.
-    
-        :param str resting: Resting
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCatResting', (), {'Resting': resting}, target=target)
-
-    @staticmethod
-    def GivePotion(effect_to_give: list[Potion] | Potion, overwrite_effect: Literal["True", "False"]="True", effect_particles: Literal["Regular", "Ambient", "None"]="Regular", target: Target=DEFAULT_TARGET):
-        """
-        Gives one or more potion effects to an entity.
-    
-        :param list[Potion] | Potion effect_to_give: Effect(s) to give
-        :param str overwrite_effect: Overwrite Effect
-    
-            - True: Effects of the same type will always be replaced.
-            - False: Weaker effects of the same type will be hidden.
-        :param str effect_particles: Effect Particles
-    
-            - Ambient: Ambient particles are translucent.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'GivePotion', (effect_to_give,), {'Overwrite Effect': overwrite_effect, 'Effect Particles': effect_particles}, target=target)
-
-    @staticmethod
-    def SetGoatHorns(left_horn: Literal["Show", "Hide", "No Change"]="No Change", right_horn: Literal["Show", "Hide", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
-        """
-        Sets which goat horns are shown or hidden.
-    
-        :param str left_horn: Left Horn
-        :param str right_horn: Right Horn
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGoatHorns', (), {'Left Horn': left_horn, 'Right Horn': right_horn}, target=target)
-
-    @staticmethod
-    def SetGlowing(glowing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether this entity has a glowing outline that can be seen through blocks.
-    
-        :param str glowing: Glowing
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetGlowing', (), {'Glowing': glowing}, target=target)
-
-    @staticmethod
-    def SetPandaOnBack(on_its_back: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a panda is laying on its back or not.
-    
-        :param str on_its_back: On Its Back
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetPandaOnBack', (), {'On Its Back': on_its_back}, target=target)
-
-    @staticmethod
-    def IDisplayModelType(model_type: Literal["None", "First Person Left Hand", "First Person Right Hand", "Third Person Left Hand", "Third Person Right Hand", "Head", "GUI", "Ground", "Fixed"]="None", target: Target=DEFAULT_TARGET):
-        """
-        Sets the model type of an item display.
-    
-        :param str model_type: Model Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'IDisplayModelType', (), {'Model Type': model_type}, target=target)
-
-    @staticmethod
-    def SetHealth(current_health: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's current health.
-    
-        :param Number current_health: Current health (❤ = 2 Health)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetHealth', (current_health,), {}, target=target)
-
-    @staticmethod
-    def BlockDisguise(block_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises an entity as a block.
-    
-        :param Item block_to_disguise_as: Block to disguise as
-        :param DFText | None display_name: Display name (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'BlockDisguise', (block_to_disguise_as, display_name,), {}, target=target)
-
-    @staticmethod
-    def AddVillagerTrade(result_item: Item, first_ingredient: Item, second_ingredient: Item | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Adds a trade to a villager.
-    
-        :param Item result_item: Result item
-        :param Item first_ingredient: First ingredient
-        :param Item | None second_ingredient: Second ingredient (optional)
-        :param Number | None maximum_uses: Maximum uses (optional) (Negative numbers are treated as infinite)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'AddVillagerTrade', (result_item, first_ingredient, second_ingredient, maximum_uses,), {}, target=target)
-
-    @staticmethod
-    def SetCollidable(collision: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a mob is able to collide with other entities.
-    
-        :param str collision: Collision
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCollidable', (), {'Collision': collision}, target=target)
-
-    @staticmethod
-    def ArmorStandPose(direction: DFVector | Number, y_rotation: Number | None=None, z_rotation: Number | None=None, armor_stand_part: Literal["Head", "Body", "Left Arm", "Right Arm", "Left Leg", "Right Leg"]="Head", target: Target=DEFAULT_TARGET):
-        """
-        Sets the rotation of an armor stand part.
-    
-        :param DFVector | Number direction: Direction OR X Rotation (0-360) (Default = 0)
-        :param Number | None y_rotation: Y Rotation (0-360) (optional) (Default = 0)
-        :param Number | None z_rotation: Z Rotation (0-360) (optional) (Default = 0)
-        :param str armor_stand_part: Armor Stand Part
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'ArmorStandPose', (direction, y_rotation, z_rotation,), {'Armor Stand Part': armor_stand_part}, target=target)
-
-    @staticmethod
-    def LaunchFwd(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", launch_axis: Literal["Pitch and Yaw", "Yaw Only"]="Pitch and Yaw", target: Target=DEFAULT_TARGET):
-        """
-        Launches an entity forward or backward.
-    
-        :param Number launch_power: Launch power
-        :param str add_to_current_velocity: Add to Current Velocity
-        :param str launch_axis: Launch Axis
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'LaunchFwd', (launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Launch Axis': launch_axis}, target=target)
-
-    @staticmethod
-    def SetFallDistance(fall_distance: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets an entity's fall distance, affecting fall damage upon landing.
-    
-        :param Number fall_distance: Fall distance (blocks)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFallDistance', (fall_distance,), {}, target=target)
-
-    @staticmethod
-    def MoveToLoc(target_location: Location | None, walk_speed: Number, target: Target=DEFAULT_TARGET):
-        """
-        Instructs a mob's AI to always pathfind to a certain location at a certain speed.
-    
-        :param Location | None target_location: Target location OR Stop moving)
-        :param Number walk_speed: Walk speed
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'MoveToLoc', (target_location, walk_speed,), {}, target=target)
-
-    @staticmethod
-    def TDisplayOpacity(text_opacity: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the text opacity of a text display.
-    
-        :param Number | None text_opacity: Text opacity (optional) (Default = 100)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplayOpacity', (text_opacity,), {}, target=target)
-
-    @staticmethod
-    def IDisplayItem(displayed_item: Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets the displayed item of an item display.
-    
-        :param Item displayed_item: Displayed item
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'IDisplayItem', (displayed_item,), {}, target=target)
-
-    @staticmethod
-    def AttackAnimation(animation_arm: Literal["Swing main arm", "Swing off arm"]="Swing main arm", target: Target=DEFAULT_TARGET):
-        """
-        Makes a mob perform an attack animation.
-    
-        :param str animation_arm: Animation Arm
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'AttackAnimation', (), {'Animation Arm': animation_arm}, target=target)
-
-    @staticmethod
-    def SnowmanPumpkin(pumpkin: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a snow golem is wearing a pumpkin.
-    
-        :param str pumpkin: Pumpkin
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SnowmanPumpkin', (), {'Pumpkin': pumpkin}, target=target)
-
-    @staticmethod
-    def SetCustomTag(tag_name: DFString, tag_value: Number | DFString, target: Target=DEFAULT_TARGET):
-        """
-        Sets the value of or creates a custom tag value.
-    
-        :param DFString tag_name: Tag name
-        :param Number | DFString tag_value: Tag value OR Tag value
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCustomTag', (tag_name, tag_value,), {}, target=target)
-
-    @staticmethod
-    def DisplayViewRange(view_range_in_blocks: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the view range of a display entity.
-    
-        :param Number | None view_range_in_blocks: View range in blocks (optional) (Default = 64)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'DisplayViewRange', (view_range_in_blocks,), {}, target=target)
-
-    @staticmethod
-    def PlayerDisguise(player_name_to_disguise_as: DFText, display_skin: Item | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Disguises an entity as a player.
-    
-        :param DFText player_name_to_disguise_as: Player name to disguise as
-        :param Item | None display_skin: Display skin (optional)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'PlayerDisguise', (player_name_to_disguise_as, display_skin,), {}, target=target)
-
-    @staticmethod
-    def SetItem(new_item: Item, target: Target=DEFAULT_TARGET):
-        """
-        Sets the item of an item entity.
-    
-        :param Item new_item: New item
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetItem', (new_item,), {}, target=target)
-
-    @staticmethod
-    def SetVillagerTrade(trade_index: Number, result_item: Item, first_ingredient: Item, second_ingredient: Item | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
-        """
-        Sets the villager trade at an index.
-    
-        :param Number trade_index: Trade index
-        :param Item result_item: Result item
-        :param Item first_ingredient: First Ingredient
-        :param Item | None second_ingredient: Second Ingredient (optional)
-        :param Number | None maximum_uses: Maximum uses (optional) (Default = Infinite)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVillagerTrade', (trade_index, result_item, first_ingredient, second_ingredient, maximum_uses,), {}, target=target)
-
-    @staticmethod
-    def Explode(target: Target=DEFAULT_TARGET):
-        """
-        Causes an entity to explode.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Explode', (), {}, target=target)
-
-    @staticmethod
-    def SetDigging(digging_type: Literal["Emerge", "Dig Down"]="Emerge", target: Target=DEFAULT_TARGET):
-        """
-        Makes a warden emerge or dig into the ground.
-    
-        :param str digging_type: Digging Type
-    
-            - Dig Down: The warden will not despawn after digging down.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetDigging', (), {'Digging Type': digging_type}, target=target)
-
-    @staticmethod
-    def SetArrowHitSound(sound_to_play: Sound, target: Target=DEFAULT_TARGET):
-        """
-        Sets the sound an arrow plays whenever it lands.
-    
-        :param Sound sound_to_play: Sound to play
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetArrowHitSound', (sound_to_play,), {}, target=target)
-
-    @staticmethod
-    def SetVexCharging(charging: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Sets whether a vex is charging or not.
-    
-        :param str charging: Charging
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVexCharging', (), {'Charging': charging}, target=target)
-
-    @staticmethod
-    def SetVillagerExp(experience: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a villager's experience points, which affects their level.
-    
-        :param Number experience: Experience
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetVillagerExp', (experience,), {}, target=target)
-
-    @staticmethod
-    def IgniteCreeper(target: Target=DEFAULT_TARGET):
-        """
-        Ignites a creeper, causing it to explode after a fuse period.
-    
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'IgniteCreeper', (), {}, target=target)
-
-    @staticmethod
-    def SetCelebrating(celebrate: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
-        """
-        Causes a mob to start or stop celebrating.
-    
-        :param str celebrate: Celebrate
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetCelebrating', (), {'Celebrate': celebrate}, target=target)
-
-    @staticmethod
-    def TDisplayText(displayed_text: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Sets the displayed text of a text display.
-    
-        :param list[DFText] | DFText displayed_text: Displayed text
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'TDisplayText', (displayed_text,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
-
-    @staticmethod
-    def SetHorseJump(strength: Number, target: Target=DEFAULT_TARGET):
-        """
-        Sets a horse's jump strength.
-    
-        :param Number strength: Strength (0.0 (can't jump) to 2.0)
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetHorseJump', (strength,), {}, target=target)
-
-    @staticmethod
-    def HealthAttribute(value: Number | None=None, attribute: Literal["Maximum health", "Maximum absorption health", "Armor", "Armor toughness"]="Maximum health", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
-        """
-        Sets one of the entity's health-related attributes such as max health and armor defense points.
-    
-        :param Number | None value: Value (optional)
-        :param str attribute: Attribute
-    
-            - Maximum health: Base: 20.0 Range: 1.0-1024.0
-            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
-            - Armor: Base: 0.0 Range: 0.0-30.0
-            - Armor toughness: Base: 0.0 Range: 0.0-20.0
-        :param str value_type: Value Type
-    
-            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
-            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'HealthAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
-
-    @staticmethod
-    def Ram(target_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
-        """
-        Makes a goat ram the specified mob or player.
-    
-        :param DFString target_uuid: Target UUID
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'Ram', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
-
-    @staticmethod
-    def SetFoxType(fox_type: Literal["Red", "Snow"]="Red", target: Target=DEFAULT_TARGET):
-        """
-        Sets a fox's fur type.
-    
-        :param str fox_type: Fox Type
-        :param Target target: The target for the action.
-        """
-        return CodeBlock.new_action('entity_action', 'SetFoxType', (), {'Fox Type': fox_type}, target=target)
-
-EA = EntityAction
-class GameAction:
-    """
-    Used to do something related to the plot and everyone playing it.
-    """
-
-    @staticmethod
-    def FillContainer(container_location: Location, item_to_fill_with: list[Item] | Item, ):
-        """
-        Fills the container at a location with items.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_fill_with: Item(s) to fill with
-        
-        """
-        return CodeBlock.new_action('game_action', 'FillContainer', (container_location, item_to_fill_with,), {})
-
-    @staticmethod
-    def BreakBlock(block_to_break: list[Location] | Location, ):
-        """
-        Breaks the block at a location as if it was broken by a player.
-    
-        :param list[Location] | Location block_to_break: Block(s) to break
-        
-        """
-        return CodeBlock.new_action('game_action', 'BreakBlock', (block_to_break,), {})
-
-    @staticmethod
-    def ChangeSign(sign_location: Location, line_number: Number, new_text: DFText | None=None, sign_side: Literal["Front", "Back"]="Front", ):
-        """
-        Changes a line of text on a sign.
-    
-        :param Location sign_location: Sign location
-        :param Number line_number: Line number
-        :param DFText | None new_text: New text (optional)
-        :param str sign_side: Sign Side
-        
-        """
-        return CodeBlock.new_action('game_action', 'ChangeSign', (sign_location, line_number, new_text,), {'Sign Side': sign_side})
-
-    @staticmethod
-    def WebRequest(url_to_request: DFString, content_body: DFString | None=None, request_method: Literal["Post", "Get", "Put", "Delete"]="Post", content_type: Literal["text/plain", "application/json"]="text/plain", ):
-        """
-        Sends a web request to a URL.
-    
-        :param DFString url_to_request: URL to request
-        :param DFString | None content_body: Content body (optional)
-        :param str request_method: Request Method
-        :param str content_type: Content Type
-        
-        """
-        return CodeBlock.new_action('game_action', 'WebRequest', (url_to_request, content_body,), {'Request Method': request_method, 'Content Type': content_type})
-
-    @staticmethod
-    def SimulationDistance(simulation_distance: Number, ):
-        """
-        Sets the simulation distance in the world.
-    
-        :param Number simulation_distance: Simulation distance (Limit: 2-32)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SimulationDistance', (simulation_distance,), {})
-
-    @staticmethod
-    def SetEventDeathMsg(new_death_message: DFText, ):
-        """
-        Sets the death message in this event.
-    
-        :param DFText new_death_message: New death message
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventDeathMsg', (new_death_message,), {})
-
-    @staticmethod
-    def WriteTransaction(block_to_set: Item, corner_1: Location, corner_2: Location, block_data: DFString | None=None, ):
-        """
-        Adds blocks to the next transaction; a method of queuing up block operations so that they can be sent simultaneously.
-    
-        :param Item block_to_set: Block to set
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param DFString | None block_data: Block data (comma separated) (optional) (Example: "facing=up,half=top")
-        
-        """
-        return CodeBlock.new_action('game_action', 'WriteTransaction', (block_to_set, corner_1, corner_2, block_data,), {})
-
-    @staticmethod
-    def SetWorldTime(daylight_ticks: Number, ):
-        """
-        Sets the time in the world.
-    
-        :param Number daylight_ticks: Daylight ticks (Day: 1000)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetWorldTime', (daylight_ticks,), {})
-
-    @staticmethod
-    def SetBlockData(location: list[Location] | Location, block_data: list[DFString] | DFString, overwrite_existing_data: Literal["True", "False"]="False", ):
-        """
-        Sets a data tag value of the block at a location.
-    
-        :param list[Location] | Location location: Location
-        :param list[DFString] | DFString block_data: Block data (Example: "facing=up")
-        :param str overwrite_existing_data: Overwrite Existing Data
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetBlockData', (location, block_data,), {'Overwrite Existing Data': overwrite_existing_data})
-
-    @staticmethod
-    def Firework(firework_rocket: Item, spawn_location: Location, instant: Literal["True", "False"]="False", movement: Literal["Upwards", "Directional"]="Upwards", ):
-        """
-        Launches a firework rocket at a location.
-    
-        :param Item firework_rocket: Firework rocket
-        :param Location spawn_location: Spawn location
-        :param str instant: Instant
-    
-            - True: Instantly explodes.
-        :param str movement: Movement
-        
-        """
-        return CodeBlock.new_action('game_action', 'Firework', (firework_rocket, spawn_location,), {'Instant': instant, 'Movement': movement})
-
-    @staticmethod
-    def SetEventDamage(new_damage_amount: Number, ):
-        """
-        Sets the damage dealt in this event.
-    
-        :param Number new_damage_amount: New damage amount (❤ = 2 Health)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventDamage', (new_damage_amount,), {})
-
-    @staticmethod
-    def AdvanceWeather(has_weather_cycle: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets if this world has a natural weather cycle.
-    
-        :param str has_weather_cycle: Has Weather Cycle
-        
-        """
-        return CodeBlock.new_action('game_action', 'AdvanceWeather', (), {'Has Weather Cycle': has_weather_cycle})
-
-    @staticmethod
-    def FireSpreadRadius(radius_in_blocks: Number, ):
-        """
-        Sets the radius fire spreads around a player.
-    
-        :param Number radius_in_blocks: Radius in blocks (Set to -1 to disable fire spreading.)
-        
-        """
-        return CodeBlock.new_action('game_action', 'FireSpreadRadius', (radius_in_blocks,), {})
-
-    @staticmethod
-    def SpawnItem(item_to_spawn: list[Item] | Item, spawn_location: Location, custom_name: DFText | None=None, apply_item_motion: Literal["True", "False"]="True", ):
-        """
-        Spawns an item at a location.
-    
-        :param list[Item] | Item item_to_spawn: Item(s) to spawn
-        :param Location spawn_location: Spawn location
-        :param DFText | None custom_name: Custom name (optional)
-        :param str apply_item_motion: Apply Item Motion
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnItem', (item_to_spawn, spawn_location, custom_name,), {'Apply Item Motion': apply_item_motion})
-
-    @staticmethod
-    def SignColor(sign_location: Location, sign_side: Literal["Front", "Back"]="Front", text_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="Black", glowing: Literal["Enable", "Disable"]="Disable", ):
-        """
-        Changes the text color of a sign.
-    
-        :param Location sign_location: Sign location
-        :param str sign_side: Sign Side
-        :param str text_color: Text Color
-        :param str glowing: Glowing
-        
-        """
-        return CodeBlock.new_action('game_action', 'SignColor', (sign_location,), {'Sign Side': sign_side, 'Text Color': text_color, 'Glowing': glowing})
-
-    @staticmethod
-    def ShulkerBullet(spawn_location: Location, ):
-        """
-        Spawns a shulker bullet at a location.
-    
-        :param Location spawn_location: Spawn Location
-        
-        """
-        return CodeBlock.new_action('game_action', 'ShulkerBullet', (spawn_location,), {})
-
-    @staticmethod
-    def MobSpawning(mob_spawning: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets if this world spawns mobs.
-    
-        :param str mob_spawning: Mob Spawning
-        
-        """
-        return CodeBlock.new_action('game_action', 'MobSpawning', (), {'Mob Spawning': mob_spawning})
-
-    @staticmethod
-    def SetContainer(container_location: Location, item_to_set: list[Item] | Item, ):
-        """
-        Sets the contents of the container at a location.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_set: Item(s) to set
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetContainer', (container_location, item_to_set,), {})
-
-    @staticmethod
-    def SpawnInteraction(spawn_location: Location, hitbox_width: Number | None=None, hitbox_height: Number | None=None, responsive: Literal["Enable", "Disable"]="Disable", ):
-        """
-        Spawns an invisible hitbox with the specified size.
-    
-        :param Location spawn_location: Spawn location
-        :param Number | None hitbox_width: Hitbox width (optional)
-        :param Number | None hitbox_height: Hitbox height (optional)
-        :param str responsive: Responsive
-    
-            - Enable: Player swings main hand and plays the attack sound.
-            - Disable: No visual or audio response.
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnInteraction', (spawn_location, hitbox_width, hitbox_height,), {'Responsive': responsive})
-
-    @staticmethod
-    def SetItemInSlot(container_location: Location, item_to_set: Item | None=None, slot: Number=None, ):
-        """
-        Sets the item in a slot of the container at a location.
-    
-        :param Location container_location: Container location
-        :param Item | None item_to_set: Item to set (optional)
-        :param Number slot: Slot
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetItemInSlot', (container_location, item_to_set, slot,), {})
-
-    @staticmethod
-    def CloneRegion(corner_1: Location, corner_2: Location, position_to_copy_from: Location, position_to_paste_to: Location, ignore_air: Literal["True", "False"]="False", clone_block_entities: Literal["True", "False"]="True", ):
-        """
-        Copies a region of blocks to another region, including air.
-    
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param Location position_to_copy_from: Position to copy from
-        :param Location position_to_paste_to: Position to paste to
-        :param str ignore_air: Ignore Air
-        :param str clone_block_entities: Clone Block Entities
-    
-            - True: Blocks such as chests will have their contents saved.  This takes up more server CPU.
-            - False: Blocks such as chests will not have their contents saved.
-        
-        """
-        return CodeBlock.new_action('game_action', 'CloneRegion', (corner_1, corner_2, position_to_copy_from, position_to_paste_to,), {'Ignore Air': ignore_air, 'Clone Block Entities': clone_block_entities})
-
-    @staticmethod
-    def UncancelEvent():
-        """
-        Uncancels the initial event that triggered this line of code.
-    
-        
-        """
-        return CodeBlock.new_action('game_action', 'UncancelEvent', (), {})
-
-    @staticmethod
-    def SetLecternBook(lectern_location: Location, book_to_put: Item | None=None, displayed_page: Number | None=None, ):
-        """
-        Sets the book and the displayed page of a Lectern.
-    
-        :param Location lectern_location: Lectern location
-        :param Item | None book_to_put: Book to put (optional)
-        :param Number | None displayed_page: Displayed page (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetLecternBook', (lectern_location, book_to_put, displayed_page,), {})
-
-    @staticmethod
-    def SpawnArmorStand(spawn_location: Location, custom_name: DFText | None=None, equipment: list[Item] | Item | None=None, visibility: Literal["Visible", "Visible (No hitbox)", "Invisible", "Invisible (No hitbox)"]="Visible", ):
-        """
-        Spawns an armor stand at a location.
-    
-        :param Location spawn_location: Spawn location
-        :param DFText | None custom_name: Custom name (optional)
-        :param list[Item] | Item | None equipment: Equipment (optional)
-        :param str visibility: Visibility
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnArmorStand', (spawn_location, custom_name, equipment,), {'Visibility': visibility})
-
-    @staticmethod
-    def SpawnBlockDisp(spawn_location: Location, displayed_block: Item, block_data: list[DFString] | DFString | None=None, ):
-        """
-        Spawns a block display entity.
-    
-        :param Location spawn_location: Spawn location
-        :param Item displayed_block: Displayed block
-        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnBlockDisp', (spawn_location, displayed_block, block_data,), {})
-
-    @staticmethod
-    def RedstoneStrength(new_current_strength: Number, ):
-        """
-        Sets the current strength in this event.
-    
-        :param Number new_current_strength: New current strength (Range: 0-15)
-        
-        """
-        return CodeBlock.new_action('game_action', 'RedstoneStrength', (new_current_strength,), {})
-
-    @staticmethod
-    def ClearContainer(container_location: Location, ):
-        """
-        Empties a container at a location.
-    
-        :param Location container_location: Container location
-        
-        """
-        return CodeBlock.new_action('game_action', 'ClearContainer', (container_location,), {})
-
-    @staticmethod
-    def TraderSpawning(trader_spawning: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets if this world spawns wandering traders.
-    
-        :param str trader_spawning: Trader Spawning
-        
-        """
-        return CodeBlock.new_action('game_action', 'TraderSpawning', (), {'Trader Spawning': trader_spawning})
-
-    @staticmethod
-    def CancelEvent():
-        """
-        Cancels the initial event that triggered this line of code.
-    
-        
-        """
-        return CodeBlock.new_action('game_action', 'CancelEvent', (), {})
-
-    @staticmethod
-    def SpawnFangs(spawn_location: Location, custom_name: DFText | None=None, ):
-        """
-        Spawns evoker fangs at a location.
-    
-        :param Location spawn_location: Spawn location
-        :param DFText | None custom_name: Custom name (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnFangs', (spawn_location, custom_name,), {})
-
-    @staticmethod
-    def SetEventSound(new_sound: Sound, ):
-        """
-        Sets the sound to play for this event, replacing the original sound.
-    
-        :param Sound new_sound: New sound
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventSound', (new_sound,), {})
-
-    @staticmethod
-    def SetEventXP(experience: Number, ):
-        """
-        Sets the amount of experience this event should drop.
-    
-        :param Number experience: Experience
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventXP', (experience,), {})
-
-    @staticmethod
-    def LockContainer(container_location: Location, lock_key: DFString | None=None, ):
-        """
-        Sets the lock key of the container at a location.
-    
-        :param Location container_location: Container location
-        :param DFString | None lock_key: Lock key OR Unlocks the container)
-        
-        """
-        return CodeBlock.new_action('game_action', 'LockContainer', (container_location, lock_key,), {})
-
-    @staticmethod
-    def SetExhaustion(new_exhaustion_amount: Number, ):
-        """
-        Sets the exhaustion  gained in this event.
-    
-        :param Number new_exhaustion_amount: New exhaustion amount
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetExhaustion', (new_exhaustion_amount,), {})
-
-    @staticmethod
-    def AdvanceTime(advance_time: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets if this world has a natural time cycle.
-    
-        :param str advance_time: Advance Time
-        
-        """
-        return CodeBlock.new_action('game_action', 'AdvanceTime', (), {'Advance Time': advance_time})
-
-    @staticmethod
-    def ClearItems(container_location: Location, item_to_clear: list[Item] | Item, ):
-        """
-        Removes all of an item from the container at a location.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_clear: Item(s) to clear
-        
-        """
-        return CodeBlock.new_action('game_action', 'ClearItems', (container_location, item_to_clear,), {})
-
-    @staticmethod
-    def SetFurnaceSpeed(furnace_location: Location, ticks: Number, ):
-        """
-        Sets the amount of ticks it takes for a furnace block to cook an item.
-    
-        :param Location furnace_location: Furnace location
-        :param Number ticks: Ticks
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetFurnaceSpeed', (furnace_location, ticks,), {})
-
-    @staticmethod
-    def BlockDropsOn():
-        """
-        Enables blocks dropping as items when broken.
-    
-        
-        """
-        return CodeBlock.new_action('game_action', 'BlockDropsOn', (), {})
-
-    @staticmethod
-    def SpawnMannequin(mannequin_player_head: Item | DFString, spawn_location: Location, description: DFText | None=None, movable: Literal["True", "False"]="True", main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", ):
-        """
-        Spawns a mannequin at a location.
-    
-        :param Item | DFString mannequin_player_head: Mannequin player head OR Mannequin player name or UUID
-        :param Location spawn_location: Spawn location
-        :param DFText | None description: Description (optional) (Only shown if name is visible)
-        :param str movable: Movable
-        :param str main_hand: Main Hand
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnMannequin', (mannequin_player_head, spawn_location, description,), {'Movable': movable, 'Main Hand': main_hand})
-
-    @staticmethod
-    def ViewDistance(view_distance: Number, ):
-        """
-        Sets the view distance in the world.
-    
-        :param Number view_distance: View distance (Limit: 2-32)
-        
-        """
-        return CodeBlock.new_action('game_action', 'ViewDistance', (view_distance,), {})
-
-    @staticmethod
-    def BoneMeal(block_to_bone_meal: list[Location] | Location, number_of_uses: Number | None=None, show_particles: Literal["True", "False"]="True", ):
-        """
-        Applies bone meal to a block.
-    
-        :param list[Location] | Location block_to_bone_meal: Block(s) to bone meal
-        :param Number | None number_of_uses: Number of uses (optional)
-        :param str show_particles: Show Particles
-        
-        """
-        return CodeBlock.new_action('game_action', 'BoneMeal', (block_to_bone_meal, number_of_uses,), {'Show Particles': show_particles})
-
-    @staticmethod
-    def FallingBlock(block_location: Location, block_material: Item | None=None, block_data: list[DFString] | DFString | None=None, hurt_hit_entities: Literal["True", "False"]="False", reform_on_impact: Literal["True", "False"]="True", ):
-        """
-        Spawns a falling block at a location.
-    
-        :param Location block_location: Block location
-        :param Item | None block_material: Block material OR Converts the block at the location to a falling block)
-        :param list[DFString] | DFString | None block_data: Block data (optional)
-        :param str hurt_hit_entities: Hurt Hit Entities
-        :param str reform_on_impact: Reform on Impact
-        
-        """
-        return CodeBlock.new_action('game_action', 'FallingBlock', (block_location, block_material, block_data,), {'Hurt Hit Entities': hurt_hit_entities, 'Reform on Impact': reform_on_impact})
-
-    @staticmethod
-    def SetDisplayedItem(item_to_display: Item, ):
-        """
-        Sets the item displayed in this event.
-    
-        :param Item item_to_display: Item to display
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetDisplayedItem', (item_to_display,), {})
-
-    @staticmethod
-    def DiscordWebhook(webhook_url: DFString, message_content: DFString, ):
-        """
-        Sends a message to a Discord webhook.
-    
-        :param DFString webhook_url: Webhook URL
-        :param DFString message_content: Message content
-        
-        """
-        return CodeBlock.new_action('game_action', 'DiscordWebhook', (webhook_url, message_content,), {})
-
-    @staticmethod
-    def TickBlock(block_to_tick: list[Location] | Location, number_of_ticks: Number | None=None, ):
-        """
-        Causes a block to get "random ticked", which could cause a block update.
-    
-        :param list[Location] | Location block_to_tick: Block(s) to tick
-        :param Number | None number_of_ticks: Number of ticks (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'TickBlock', (block_to_tick, number_of_ticks,), {})
-
-    @staticmethod
-    def ReplaceItems(container_location: Location, item_to_replace: list[Item] | Item | None=None, item_to_replace_with: Item=None, items_amount: Number | None=None, ):
-        """
-        Replaces items in the container at a location with the given item.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item | None item_to_replace: Item(s) to replace (optional)
-        :param Item item_to_replace_with: Item to replace with
-        :param Number | None items_amount: Amount of items to replace (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'ReplaceItems', (container_location, item_to_replace, item_to_replace_with, items_amount,), {})
-
-    @staticmethod
-    def SetEventProj(projectile_to_launch: Item | None=None, ):
-        """
-        Replaces the projectile fired in the Shoot Bow Event.
-    
-        :param Item | None projectile_to_launch: Projectile to launch (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventProj', (projectile_to_launch,), {})
-
-    @staticmethod
-    def RandomTickSpeed(tick_speed: Number, ):
-        """
-        Sets the random tick speed  in the world.
-    
-        :param Number tick_speed: Tick speed
-        
-        """
-        return CodeBlock.new_action('game_action', 'RandomTickSpeed', (tick_speed,), {})
-
-    @staticmethod
-    def Explosion(explosion_location: Location, explosion_power: Number | None=None, ):
-        """
-        Creates an explosion at a location.
-    
-        :param Location explosion_location: Explosion location
-        :param Number | None explosion_power: Explosion power (0-4) (optional) (Default = 4)
-        
-        """
-        return CodeBlock.new_action('game_action', 'Explosion', (explosion_location, explosion_power,), {})
-
-    @staticmethod
-    def SpawnMob(mob_type: Item, spawn_location: Location, health: Number | None=None, custom_name: DFText | None=None, effect: list[Potion] | Potion | None=None, equipment: list[Item] | Item | None=None, ):
-        """
-        Spawns a mob at a location.
-    
-        :param Item mob_type: Mob type
-        :param Location spawn_location: Spawn location
-        :param Number | None health: Health (optional)
-        :param DFText | None custom_name: Custom name (optional)
-        :param list[Potion] | Potion | None effect: Effect(s) (optional)
-        :param list[Item] | Item | None equipment: Equipment (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnMob', (mob_type, spawn_location, health, custom_name, effect, equipment,), {})
-
-    @staticmethod
-    def SetBrushableItem(block_location: Location, item: Item | None=None, ):
-        """
-        Sets the item buried in a suspicious sand or gravel.
-    
-        :param Location block_location: Block location
-        :param Item | None item: Item (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetBrushableItem', (block_location, item,), {})
-
-    @staticmethod
-    def SpawnEnderEye(location_to_spawn_at: Location, destination: Location | None=None, lifespan: Number | None=None, custom_name: DFText | None=None, end_of_lifespan: Literal["Drop item", "Shatter", "Random"]="Random", ):
-        """
-        Spawns an eye of ender at a location, which (if specified) will float towards its destination.
-    
-        :param Location location_to_spawn_at: Location to spawn at
-        :param Location | None destination: Destination (optional)
-        :param Number | None lifespan: Lifespan (ticks) (optional)
-        :param DFText | None custom_name: Custom name (optional)
-        :param str end_of_lifespan: End of Lifespan
-    
-            - Drop item: The eye always drops itself as an item.
-            - Shatter: The eye always shatters.
-            - Random: The eye has a 20% chance of shattering.
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnEnderEye', (location_to_spawn_at, destination, lifespan, custom_name,), {'End of Lifespan': end_of_lifespan})
-
-    @staticmethod
-    def SpawnPotionCloud(spawn_location: Location, effect_to_apply: list[Potion] | Potion | None=None, custom_name: DFText | None=None, radius: Number | None=None, duration: Number | None=None, ):
-        """
-        Spawns a lingering potion cloud at a location that imbues effects onto entities who enter it.
-    
-        :param Location spawn_location: Spawn location
-        :param list[Potion] | Potion | None effect_to_apply: Effect to apply (optional)
-        :param DFText | None custom_name: Custom name (optional)
-        :param Number | None radius: Radius (blocks) (optional) (Default = 3)
-        :param Number | None duration: Duration (ticks) (optional) (Default = 200)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnPotionCloud', (spawn_location, effect_to_apply, custom_name, radius, duration,), {})
-
-    @staticmethod
-    def LaunchProj(projectile_to_launch: Item, launch_point: Location, custom_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, ):
-        """
-        Launches a projectile.
-    
-        :param Item projectile_to_launch: Projectile to launch
-        :param Location launch_point: Launch point
-        :param DFText | None custom_name: Custom name (optional)
-        :param Number | None speed: Speed (optional)
-        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
-        
-        """
-        return CodeBlock.new_action('game_action', 'LaunchProj', (projectile_to_launch, launch_point, custom_name, speed, inaccuracy,), {})
-
-    @staticmethod
-    def SetBlock(block_to_set: Item, block_location: list[Location] | Location, block_data: list[DFString] | DFString | None=None, ):
-        """
-        Sets the block at a location.
-    
-        :param Item block_to_set: Block to set
-        :param list[Location] | Location block_location: Block location(s)
-        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
-        
-        """
-        return CodeBlock.new_action('game_action', ' SetBlock ', (block_to_set, block_location, block_data,), {})
-
-    @staticmethod
-    def SpawnItemDisp(spawn_location: Location, displayed_item: Item, ):
-        """
-        Spawns an item display entity.
-    
-        :param Location spawn_location: Spawn location
-        :param Item displayed_item: Displayed item
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnItemDisp', (spawn_location, displayed_item,), {})
-
-    @staticmethod
-    def SetBlockGrowth(block_location: Location, growth_stage: Number | None=None, growth_unit: Literal["Growth Stage Number", "Growth Percentage"]="Growth Stage Number", ):
-        """
-        Sets the growth stage of the block (eg. carrots) at a location.
-    
-        :param Location block_location: Block location
-        :param Number | None growth_stage: Growth stage (optional) (Default = 0)
-        :param str growth_unit: Growth Unit
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetBlockGrowth', (block_location, growth_stage,), {'Growth Unit': growth_unit})
-
-    @staticmethod
-    def SetContainerName(container_location: Location, name: DFText, ):
-        """
-        Sets the name of the container at a location.
-    
-        :param Location container_location: Container location
-        :param DFText name: Name
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetContainerName', (container_location, name,), {})
-
-    @staticmethod
-    def SetHead(head_location: Location, player_head: Item | DFString, ):
-        """
-        Sets the block at a location to a player head.
-    
-        :param Location head_location: Head location
-        :param Item | DFString player_head: Player Head OR Head owner (Player name or UUID)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetHead', (head_location, player_head,), {})
-
-    @staticmethod
-    def RemoveItems(container_location: Location, item_to_remove: list[Item] | Item, ):
-        """
-        Removes items from the container at a location.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_remove: Item(s) to remove
-        
-        """
-        return CodeBlock.new_action('game_action', 'RemoveItems', (container_location, item_to_remove,), {})
-
-    @staticmethod
-    def SetRegion(block_to_set: Item, corner_1: Location, corner_2: Location, block_data: DFString | None=None, ):
-        """
-        Fills a region with a type of block.
-    
-        :param Item block_to_set: Block to set
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param DFString | None block_data: Block data (comma separated) (optional) (Example: "facing=up,half=top")
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetRegion', (block_to_set, corner_1, corner_2, block_data,), {})
-
-    @staticmethod
-    def VineSpreading(vine_spreading: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets if this world spreads vines.
-    
-        :param str vine_spreading: Vine Spreading
-        
-        """
-        return CodeBlock.new_action('game_action', 'VineSpreading', (), {'Vine Spreading': vine_spreading})
-
-    @staticmethod
-    def SpawnTNT(spawn_location: Location, tnt_power: Number | None=None, fuse_duration: Number | None=None, custom_name: DFText | None=None, ):
-        """
-        Spawns primed TNT at a location.
-    
-        :param Location spawn_location: Spawn location
-        :param Number | None tnt_power: TNT power (0-4) (optional) (Default = 4)
-        :param Number | None fuse_duration: Fuse duration (optional) (Default = 80)
-        :param DFText | None custom_name: Custom name (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnTNT', (spawn_location, tnt_power, fuse_duration, custom_name,), {})
-
-    @staticmethod
-    def SpawnExpOrb(spawn_location: Location, experience_amount: Number | None=None, custom_name: DFText | None=None, ):
-        """
-        Spawns an experience orb at a location.
-    
-        :param Location spawn_location: Spawn location
-        :param Number | None experience_amount: Experience amount (optional)
-        :param DFText | None custom_name: Custom name (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnExpOrb', (spawn_location, experience_amount, custom_name,), {})
-
-    @staticmethod
-    def SetBiome(corner_1: Location, corner_2: Location, biome_to_set: DFString, ):
-        """
-        Sets the biome of a region.
-    
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param DFString biome_to_set: Biome to set (Example: "basalt_deltas", "plains")
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetBiome', (corner_1, corner_2, biome_to_set,), {})
-
-    @staticmethod
-    def SetEventHeal(new_healing_amount: Number, ):
-        """
-        Sets the amount of health regained in this event.
-    
-        :param Number new_healing_amount: New healing amount (❤ = 2 Health)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetEventHeal', (new_healing_amount,), {})
-
-    @staticmethod
-    def ApplyTransaction():
-        """
-        Applies the current transaction and generates a new one.
-    
-        
-        """
-        return CodeBlock.new_action('game_action', 'ApplyTransaction', (), {})
-
-    @staticmethod
-    def GenerateTree(tree_location: Location, tree_type: Literal["Oak Tree", "Big Oak Tree", "Swamp Tree", "Spruce Tree", "Slightly Taller Spruce Tree", "Big Spruce Tree", "Birch Tree", "Tall Birch Tree", "Jungle Tree", "Big Jungle Tree", "Jungle Bush", "Acacia Tree", "Dark Oak Tree", "Pale Oak Tree", "Creaking Pale Oak Tree", "Mangrove Tree", "Tall Mangrove Tree", "Cherry Tree", "Azalea Tree", "Red Mushroom", "Brown Mushroom", "Crimson Fungus", "Warped Fungus", "Chorus Plant"]="Oak Tree", ):
-        """
-        Generates a tree at a location.
-    
-        :param Location tree_location: Tree location (bottom log block)
-        :param str tree_type: Tree Type
-        
-        """
-        return CodeBlock.new_action('game_action', 'GenerateTree', (tree_location,), {'Tree Type': tree_type})
-
-    @staticmethod
-    def SpawnCrystal(spawn_location: Location, custom_name: DFText | None=None, show_bottom: Literal["True", "False"]="True", ):
-        """
-        Spawns an end crystal at a location.
-    
-        :param Location spawn_location: Spawn location
-        :param DFText | None custom_name: Custom name (optional)
-        :param str show_bottom: Show Bottom
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnCrystal', (spawn_location, custom_name,), {'Show Bottom': show_bottom})
-
-    @staticmethod
-    def SetCampfireItem(campfire_location: Location, campfire_item: Item, cooking_time: Number | None=None, campfire_slot: Literal["1", "2", "3", "4"]="1", ):
-        """
-        Sets the item being cooked in one of a campfire's slots.
-    
-        :param Location campfire_location: Campfire location
-        :param Item campfire_item: Campfire item
-        :param Number | None cooking_time: Cooking time (ticks) (optional) (Default = 600)
-        :param str campfire_slot: Campfire Slot
-    
-            - 1: Sets the item on the southwest corner of the campfire.
-            - 2: Sets the item on the northwest corner of the campfire.
-            - 3: Sets the item on the northeast corner of the campfire.
-            - 4: Sets the item on the southeast corner of the campfire.
-        
-        """
-        return CodeBlock.new_action('game_action', 'SetCampfireItem', (campfire_location, campfire_item, cooking_time,), {'Campfire Slot': campfire_slot})
-
-    @staticmethod
-    def SpawnTextDisplay(spawn_location: Location, displayed_text: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", ):
-        """
-        Spawns a text display entity.
-    
-        :param Location spawn_location: Spawn location
-        :param list[DFText] | DFText displayed_text: Displayed text
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnTextDisplay', (spawn_location, displayed_text,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles})
-
-    @staticmethod
-    def SpawnVehicle(vehicle_type: Item, spawn_location: Location, custom_name: DFText | None=None, ):
-        """
-        Spawns a vehicle at a location.
-    
-        :param Item vehicle_type: Vehicle type
-        :param Location spawn_location: Spawn location
-        :param DFText | None custom_name: Custom name (optional)
-        
-        """
-        return CodeBlock.new_action('game_action', 'SpawnVehicle', (vehicle_type, spawn_location, custom_name,), {})
-
-    @staticmethod
-    def Lightning(impact_location: Location, ):
-        """
-        Strikes lightning at a location.
-    
-        :param Location impact_location: Impact location
-        
-        """
-        return CodeBlock.new_action('game_action', 'Lightning', (impact_location,), {})
-
-    @staticmethod
-    def BlockDropsOff():
-        """
-        Disables blocks dropping as items when broken.
-    
-        
-        """
-        return CodeBlock.new_action('game_action', 'BlockDropsOff', (), {})
-
-GA = GameAction
-class SetVariable:
-    """
-    Used to set the value of a variable.
-    """
-
-    @staticmethod
-    def SetParticlePower(result: Variable, effect_to_change: Particle | None=None, particle_power: Number=None, ):
-        """
-        Sets a particle effect's power.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_power: Particle power
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticlePower', (result, effect_to_change, particle_power,), {})
-
-    @staticmethod
-    def String(result: Variable, string_to_set_to: list[ArgValue] | ArgValue | None=None, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", ):
-        """
-        Sets a variable to a string, or combines multiple values into one string.
-    
-        :param Variable result: Variable to set
-        :param list[ArgValue] | ArgValue | None string_to_set_to: String to set to (optional)
-        :param str text_value_merging: Text Value Merging
-        
-        """
-        return CodeBlock.new_action('set_var', 'String', (result, string_to_set_to,), {'Text Value Merging': text_value_merging})
-
-    @staticmethod
-    def AllRegexGroups(result: Variable, input_string: DFString, regex_pattern: DFString, ):
-        """
-        Gets a list of all capture groups in a Regex match.
-    
-        :param Variable result: Variable to set
-        :param DFString input_string: Input string
-        :param DFString regex_pattern: Regex pattern
-        
-        """
-        return CodeBlock.new_action('set_var', 'AllRegexGroups', (result, input_string, regex_pattern,), {})
-
-    @staticmethod
-    def SetBundleItems(result: Variable, bundle: Item | None=None, contents: list[Item] | Item | None=None, ):
-        """
-        Sets the contents of a bundle.
-    
-        :param Variable result: Variable to set
-        :param Item | None bundle: Bundle (optional)
-        :param list[Item] | Item | None contents: Contents (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetBundleItems', (result, bundle, contents,), {})
-
-    @staticmethod
-    def SetParticleType(result: Variable, effect_to_change: Particle | None=None, type: DFString=None, ):
-        """
-        Sets a particle effect's type.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param DFString type: Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleType', (result, effect_to_change, type,), {})
-
-    @staticmethod
-    def ClearItemTag(result: Variable, item_to_change: Item | None=None, ):
-        """
-        Removes all item custom tags.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClearItemTag', (result, item_to_change,), {})
-
-    @staticmethod
-    def PurgeVars(name_to_match: list[DFString] | DFString, match_requirement: Literal["Entire name", "Full word(s) in name", "Any part of name"]="Full word(s) in name", ignore_case: Literal["True", "False"]="False", ):
-        """
-        Clears all variables with names that match the given text.
-    
-        :param list[DFString] | DFString name_to_match: Name to match
-        :param str match_requirement: Match Requirement
-        :param str ignore_case: Ignore Case
-        
-        """
-        return CodeBlock.new_action('set_var', 'PurgeVars', (name_to_match,), {'Match Requirement': match_requirement, 'Ignore Case': ignore_case})
-
-    @staticmethod
-    def ShiftAllAxes(result: Variable, location_to_change: Location | None=None, x_change: Number | None=None, y_change: Number | None=None, z_change: Number | None=None, ):
-        """
-        Shifts a location's coordinates on the X, Y, and Z axes.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_change: Location to change (optional)
-        :param Number | None x_change: X Change (optional)
-        :param Number | None y_change: Y Change (optional)
-        :param Number | None z_change: Z Change (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftAllAxes', (result, location_to_change, x_change, y_change, z_change,), {})
-
-    @staticmethod
-    def GetParticleMat(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle display material.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get material of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleMat', (result, effect,), {})
-
-    @staticmethod
-    def SetParticleSprd(result: Variable, effect_to_change: Particle | None=None, horizontal_spread: Number=None, vertical_spread: Number=None, ):
-        """
-        Sets a particle effect's horizontal and vertical spread.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number horizontal_spread: Horizontal spread
-        :param Number vertical_spread: Vertical spread
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleSprd', (result, effect_to_change, horizontal_spread, vertical_spread,), {})
-
-    @staticmethod
-    def AbsoluteValue(result: Variable, number_input: Number | None=None, ):
-        """
-        Makes a number positive if it is negative.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_input: Number input (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'AbsoluteValue', (result, number_input,), {})
-
-    @staticmethod
-    def RemoveItemAttrs(result: Variable, item: Item | None=None, slot: Literal["All", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="All", attribute: Literal["All", "Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="All", ):
-        """
-        Removes all attributes from an item with the given attribute type and slot.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        :param str slot: Slot
-        :param str attribute: Attribute
-    
-            - Armor: Base: 0.0 Range: 0.0-30.0
-            - Armor toughness: Base: 0.0 Range: 0.0-20.0
-            - Attack damage: Base: 2.0 Range: 0.0-2048.0
-            - Attack knockback: Base: 0.0 Range: 0.0-5.0
-            - Attack speed: Base: 4.0 Range: 0.0-1024.0
-            - Burning time: Base: 1.0 Range: 0.0-1024.0
-            - Camera distance: Base: 4.0 Range: 0.0-32.0
-            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
-            - Flying speed: Base: 0.4 Range: 0.0-1024.0
-            - Follow range: Base: 32.0 Range: 0.0-2048.0
-            - Gravity: Base: 0.08 Range: -1.0-1.0
-            - Jump strength: Base: 0.42 Range: 0.0-32.0
-            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Luck: Base: 0.0 Range: -1024.0-1024.0
-            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
-            - Maximum health: Base: 20.0 Range: 1.0-1024.0
-            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Walking speed: Base: 0.2 Range: 0.0-1024.0
-            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
-            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
-            - Scale: Base: 1.0 Range: 0.0625-16.0
-            - Step height: Base: 0.6 Range: 0.0-10.0
-            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Tempt range: Base: 10.0 Range: 0.0-2048.0
-            - Block break speed: Base: 1.0 Range: 0.0-1024.0
-            - Block interaction range: Base: 4.5 Range: 0.0-64.0
-            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
-            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
-            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
-            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
-            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
-            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveItemAttrs', (result, item,), {'Slot': slot, 'Attribute': attribute})
-
-    @staticmethod
-    def AppendValue(list_to_append_to: Variable, value_to_append: list[ArgValue] | ArgValue, ):
-        """
-        Adds a value to the end of a list variable.
-    
-        :param Variable list_to_append_to: List to append to
-        :param list[ArgValue] | ArgValue value_to_append: Value(s) to append
-        
-        """
-        return CodeBlock.new_action('set_var', 'AppendValue', (list_to_append_to, value_to_append,), {})
-
-    @staticmethod
-    def Mod(result: Variable, dividend: Number, divisor: Number, remainder_mode: Literal["Remainder", "Modulo"]="Remainder", ):
-        """
-        Sets a variable to the remainder after dividing two numbers with a whole quotient.
-    
-        :param Variable result: Variable to set
-        :param Number dividend: Dividend
-        :param Number divisor: Divisor
-        :param str remainder_mode: Remainder Mode
-    
-            - Remainder: Takes the remainder of the numbers. Remainder keeps the sign of the numerator:   -1 rem 10 = -1
-            - Modulo: Takes the modulus of the numbers. Modulus keeps the sign of the denominator:   -1 mod 10 = 9
-        
-        """
-        return CodeBlock.new_action('set_var', '%', (result, dividend, divisor,), {'Remainder Mode': remainder_mode})
-    Modulo = Mod
-    Remainder = Mod
-
-    @staticmethod
-    def ShiftOnVector(result: Variable, location_to_shift: Location | None=None, shift_vector: DFVector=None, shift_distance: Number | None=None, add_location_rotation: Literal["True", "False"]="False", ):
-        """
-        Shifts a location along a vector.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param DFVector shift_vector: Shift vector
-        :param Number | None shift_distance: Shift distance OR Adds full vector)
-        :param str add_location_rotation: Add Location Rotation
-    
-            - True: The location's rotation will be added to the vector's rotation.
-            - False: The location's rotation will not be added to the vector's rotation.
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftOnVector', (result, location_to_shift, shift_vector, shift_distance,), {'Add Location Rotation': add_location_rotation})
-
-    @staticmethod
-    def GetItemAttribute(result: Variable, item: Item, attribute: Literal["Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="Armor", active_equipment_slot: Literal["Any", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="Any", ):
-        """
-        Get an attribute's multiplier for a specific slot.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item
-        :param str attribute: Attribute
-    
-            - Armor: Base: 0.0 Range: 0.0-30.0
-            - Armor toughness: Base: 0.0 Range: 0.0-20.0
-            - Attack damage: Base: 2.0 Range: 0.0-2048.0
-            - Attack knockback: Base: 0.0 Range: 0.0-5.0
-            - Attack speed: Base: 4.0 Range: 0.0-1024.0
-            - Burning time: Base: 1.0 Range: 0.0-1024.0
-            - Camera distance: Base: 4.0 Range: 0.0-32.0
-            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
-            - Flying speed: Base: 0.4 Range: 0.0-1024.0
-            - Follow range: Base: 32.0 Range: 0.0-2048.0
-            - Gravity: Base: 0.08 Range: -1.0-1.0
-            - Jump strength: Base: 0.42 Range: 0.0-32.0
-            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Luck: Base: 0.0 Range: -1024.0-1024.0
-            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
-            - Maximum health: Base: 20.0 Range: 1.0-1024.0
-            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Walking speed: Base: 0.2 Range: 0.0-1024.0
-            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
-            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
-            - Scale: Base: 1.0 Range: 0.0625-16.0
-            - Step height: Base: 0.6 Range: 0.0-10.0
-            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Tempt range: Base: 10.0 Range: 0.0-2048.0
-            - Block break speed: Base: 1.0 Range: 0.0-1024.0
-            - Block interaction range: Base: 4.5 Range: 0.0-64.0
-            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
-            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
-            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
-            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
-            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
-            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
-        :param str active_equipment_slot: Active Equipment Slot
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemAttribute', (result, item,), {'Attribute': attribute, 'Active Equipment Slot': active_equipment_slot})
-
-    @staticmethod
-    def ClearDict(dictionary_to_clear: Variable, ):
-        """
-        Removes all entries from a dictionary.
-    
-        :param Variable dictionary_to_clear: Dictionary to clear
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClearDict', (dictionary_to_clear,), {})
-
-    @staticmethod
-    def Add(result: Variable, numbers_to_add: list[Number] | Number, ):
-        """
-        Sets a variable to the sum of the given numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number numbers_to_add: Numbers to add
-        
-        """
-        return CodeBlock.new_action('set_var', '+', (result, numbers_to_add,), {})
-
-    @staticmethod
-    def SegmentString(result: Variable, string_to_segment: DFString, segment_size: Number | None=None, ):
-        """
-        Segments a string into chunks of a specified size.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_segment: String to segment
-        :param Number | None segment_size: Segment size (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SegmentString', (result, string_to_segment, segment_size,), {})
-
-    @staticmethod
-    def ShiftRotation(result: Variable, location_to_shift: Location | None=None, rotation_amount: Number=None, rotation_axis: Literal["Pitch", "Yaw"]="Pitch", ):
-        """
-        Rotates a location by shifting its pitch (up/down) or yaw (left/right) value.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param Number rotation_amount: Rotation amount
-        :param str rotation_axis: Rotation Axis
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftRotation', (result, location_to_shift, rotation_amount,), {'Rotation Axis': rotation_axis})
-
-    @staticmethod
-    def Subtract(result: Variable, numbers_to_subtract: list[Number] | Number, ):
-        """
-        Sets a variable to the difference between the given numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number numbers_to_subtract: Numbers to subtract
-        
-        """
-        return CodeBlock.new_action('set_var', '-', (result, numbers_to_subtract,), {})
-    Minus = Subtract
-
-    @staticmethod
-    def GetItemName(result: Variable, item: Item, ):
-        """
-        Gets an item's name.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get name of
-        
-        """
-        return CodeBlock.new_action('set_var', ' GetItemName ', (result, item,), {})
-
-    @staticmethod
-    def GetItemRarity(result: Variable, item: Item, ):
-        """
-        Gets an item's rarity.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemRarity', (result, item,), {})
-
-    @staticmethod
-    def MultiplyVector(result: Variable, vector_to_multiply: DFVector | None=None, multiplier: Number=None, ):
-        """
-        Multiplies a vector's length by a number.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_multiply: Vector to multiply (optional)
-        :param Number multiplier: Multiplier
-        
-        """
-        return CodeBlock.new_action('set_var', 'MultiplyVector', (result, vector_to_multiply, multiplier,), {})
-
-    @staticmethod
-    def Divide(result: Variable, numbers_to_divide: list[Number] | Number, division_mode: Literal["Default", "Floor result"]="Default", ):
-        """
-        Sets a variable to the quotient of the given numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number numbers_to_divide: Numbers to divide
-        :param str division_mode: Division Mode
-    
-            - Floor result: Rounds down the result.
-        
-        """
-        return CodeBlock.new_action('set_var', '/', (result, numbers_to_divide,), {'Division Mode': division_mode})
-
-    @staticmethod
-    def DestructureList(list_to_destructure: ArgValue, variable_to_set: list[Variable] | Variable, ):
-        """
-        Splits a list into separate variables.
-    
-        :param ArgValue list_to_destructure: List to destructure
-        :param list[Variable] | Variable variable_to_set: Variable(s) to set
-        
-        """
-        return CodeBlock.new_action('set_var', 'DestructureList', (list_to_destructure, variable_to_set,), {})
-
-    @staticmethod
-    def Bitwise(result: Variable, operand_1: Number, operand_2: Number | None=None, operator: Literal["|", "&", "~", "^", "<<", ">>", ">>>"]="|", bit_precision: Literal["Default", "64-bit"]="Default", ):
-        """
-        Sets a variable to the result of a bitwise operation.
-    
-        :param Variable result: Variable to set
-        :param Number operand_1: Operand 1
-        :param Number | None operand_2: Operand 2 (optional)
-        :param str operator: Operator
-    
-            - |: Bitwise Or
-            - &: Bitwise And
-            - ~: Bitwise Not (no 2nd operand required)
-            - ^: Bitwise Xor
-            - <<: Bitwise Left Shift
-            - >>: Bitwise Right Shift
-            - >>>: Bitwise Unsigned Right Shift
-        :param str bit_precision: Bit Precision
-    
-            - Default: Default precision (long / 1000)
-            - 64-bit: 64-bit precision (long), numbers are "multiplied" by 1000
-        
-        """
-        return CodeBlock.new_action('set_var', 'Bitwise', (result, operand_1, operand_2,), {'Operator': operator, 'Bit Precision': bit_precision})
-
-    @staticmethod
-    def GetLecternPage(result: Variable, lectern_location: Location, ):
-        """
-        Gets the displayed page number of a Lectern.
-    
-        :param Variable result: Variable to set
-        :param Location lectern_location: Lectern location
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetLecternPage', (result, lectern_location,), {})
-
-    @staticmethod
-    def ShiftOnAxis(result: Variable, location_to_shift: Location | None=None, shift_distance: Number=None, coordinate: Literal["X", "Y", "Z"]="X", ):
-        """
-        Shifts the X, Y, or Z coordinate of a location on its axis.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param Number shift_distance: Shift distance
-        :param str coordinate: Coordinate
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftOnAxis', (result, location_to_shift, shift_distance,), {'Coordinate': coordinate})
-
-    @staticmethod
-    def VectorBetween(result: Variable, start_location: Location, end_location: Location, ):
-        """
-        Sets a variable to the vector between two locations.
-    
-        :param Variable result: Variable to set
-        :param Location start_location: Start location
-        :param Location end_location: End location
-        
-        """
-        return CodeBlock.new_action('set_var', 'VectorBetween', (result, start_location, end_location,), {})
-
-    @staticmethod
-    def SetBreakSound(result: Variable, item_to_change: Item | None=None, break_sound: Sound | None=None, ):
-        """
-        Sets which sound an item makes when it breaks.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Sound | None break_sound: Break sound OR Sets to default break sound)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetBreakSound', (result, item_to_change, break_sound,), {})
-
-    @staticmethod
-    def GetVectorComp(result: Variable, vector: DFVector, component: Literal["X", "Y", "Z"]="X", ):
-        """
-        Gets a vector's X, Y, or Z component.
-    
-        :param Variable result: Variable to set
-        :param DFVector vector: Vector to get component of
-        :param str component: Component
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetVectorComp', (result, vector,), {'Component': component})
-
-    @staticmethod
-    def Assign(result: Variable, value: ArgValue, ):
-        """
-        Sets a variable to a value.
-    
-        :param Variable result: Variable to set
-        :param ArgValue value: Value
-        
-        """
-        return CodeBlock.new_action('set_var', '=', (result, value,), {})
-    Equals = Assign
-    Set = Assign
-
-    @staticmethod
-    def AddItemAttribute(result: Variable, item: Item | None=None, modifier_amount: Number=None, attribute: Literal["Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="Armor", operation: Literal["Add number", "Add percentage to base", "Multiply modifier by percentage"]="Add number", active_equipment_slot: Literal["Any", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="Main hand", ):
-        """
-        Adds an attribute modifier to an item, which is active in a certain equipment slot.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        :param Number modifier_amount: Modifier Amount
-        :param str attribute: Attribute
-    
-            - Armor: Base: 0.0 Range: 0.0-30.0
-            - Armor toughness: Base: 0.0 Range: 0.0-20.0
-            - Attack damage: Base: 2.0 Range: 0.0-2048.0
-            - Attack knockback: Base: 0.0 Range: 0.0-5.0
-            - Attack speed: Base: 4.0 Range: 0.0-1024.0
-            - Burning time: Base: 1.0 Range: 0.0-1024.0
-            - Camera distance: Base: 4.0 Range: 0.0-32.0
-            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
-            - Flying speed: Base: 0.4 Range: 0.0-1024.0
-            - Follow range: Base: 32.0 Range: 0.0-2048.0
-            - Gravity: Base: 0.08 Range: -1.0-1.0
-            - Jump strength: Base: 0.42 Range: 0.0-32.0
-            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
-            - Luck: Base: 0.0 Range: -1024.0-1024.0
-            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
-            - Maximum health: Base: 20.0 Range: 1.0-1024.0
-            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Walking speed: Base: 0.2 Range: 0.0-1024.0
-            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
-            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
-            - Scale: Base: 1.0 Range: 0.0625-16.0
-            - Step height: Base: 0.6 Range: 0.0-10.0
-            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
-            - Tempt range: Base: 10.0 Range: 0.0-2048.0
-            - Block break speed: Base: 1.0 Range: 0.0-1024.0
-            - Block interaction range: Base: 4.5 Range: 0.0-64.0
-            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
-            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
-            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
-            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
-            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
-            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
-        :param str operation: Operation
-    
-            - Add number: Increases the attribute value by the given amount.  Equation: mod + (amount)
-            - Add percentage to base: Increases the base attribute value by the given percentage.  Equation: base * (100% + amount)
-            - Multiply modifier by percentage: Increases the attribute value by the given percentage  Equation: mod * (100% + amount)
-        :param str active_equipment_slot: Active Equipment Slot
-        
-        """
-        return CodeBlock.new_action('set_var', 'AddItemAttribute', (result, item, modifier_amount,), {'Attribute': attribute, 'Operation': operation, 'Active Equipment Slot': active_equipment_slot})
-
-    @staticmethod
-    def GetCenterLoc(result: Variable, locations_to_center: list[Location] | Location, ):
-        """
-        Finds an average position (center) of the given locations.
-    
-        :param Variable result: Variable to set
-        :param list[Location] | Location locations_to_center: Locations to center
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCenterLoc', (result, locations_to_center,), {})
-
-    @staticmethod
-    def Base64Decode(result: Variable, base64_byte_to_decode: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", ):
-        """
-        Decodes Base64-encoded bytes as a list of numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number | int] | Number | int base64_byte_to_decode: Base64 byte(s) to decode
-        :param str signed: Signed
-        
-        """
-        return CodeBlock.new_action('set_var', 'Base64Decode', (result, base64_byte_to_decode,), {'Signed': signed})
-
-    @staticmethod
-    def AlignLoc(result: Variable, location_to_align: Location | None=None, alignment_mode: Literal["Block center", "Lower block corner"]="Block center", coordinates: Literal["All coordinates", "X and Z", "Only Y"]="All coordinates", rotation: Literal["Keep rotation", "Remove rotation"]="Keep rotation", ):
-        """
-        Aligns a location to the center or corner of the block it is in.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_align: Location to align (optional)
-        :param str alignment_mode: Alignment Mode
-        :param str coordinates: Coordinates
-        :param str rotation: Rotation
-        
-        """
-        return CodeBlock.new_action('set_var', 'AlignLoc', (result, location_to_align,), {'Alignment Mode': alignment_mode, 'Coordinates': coordinates, 'Rotation': rotation})
-
-    @staticmethod
-    def GetSoundVolume(result: Variable, sound: Sound, ):
-        """
-        Gets a sound's volume.
-    
-        :param Variable result: Variable to set
-        :param Sound sound: Sound to get volume of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetSoundVolume', (result, sound,), {})
-
-    @staticmethod
-    def RandomNumber(result: Variable, minimum_number: Number, maximum_number: Number, rounding_mode: Literal["Whole number", "Decimal number"]="Whole number", ):
-        """
-        Sets a variable to a random number between two other numbers.
-    
-        :param Variable result: Variable to set
-        :param Number minimum_number: Minimum number
-        :param Number maximum_number: Maximum number
-        :param str rounding_mode: Rounding Mode
-        
-        """
-        return CodeBlock.new_action('set_var', 'RandomNumber', (result, minimum_number, maximum_number,), {'Rounding Mode': rounding_mode})
-
-    @staticmethod
-    def GetCrossbowProj(result: Variable, crossbow: Item, ):
-        """
-        Gets a crossbow's loaded projectile list.
-    
-        :param Variable result: Variable to set
-        :param Item crossbow: Crossbow
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCrossbowProj', (result, crossbow,), {})
-
-    @staticmethod
-    def GzipDecompress(result: Variable, byte_to_decompress: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", ):
-        """
-        Decompresses Gzip-compressed bytes as a list of numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number | int] | Number | int byte_to_decompress: Byte(s) to decompress
-        :param str signed: Signed
-        
-        """
-        return CodeBlock.new_action('set_var', 'GzipDecompress', (result, byte_to_decompress,), {'Signed': signed})
-
-    @staticmethod
-    def ContainerName(result: Variable, container_location: Location, ):
-        """
-        Gets a container's name at a location.
-    
-        :param Variable result: Variable to set
-        :param Location container_location: Container location
-        
-        """
-        return CodeBlock.new_action('set_var', 'ContainerName', (result, container_location,), {})
-
-    @staticmethod
-    def Raycast(result: Variable, ray_origin: Location, ray_distance: Number, entity_collision: Literal["True", "False"]="False", block_collision: Literal["All blocks", "Non-fluid blocks", "Solid blocks", "None"]="All blocks", ):
-        """
-        Raycasts from a location to the first intersection.
-    
-        :param Variable result: Variable to set
-        :param Location ray_origin: Ray origin
-        :param Number ray_distance: Ray distance
-        :param str entity_collision: Entity Collision
-    
-            - True: Collides with players and entities.
-        :param str block_collision: Block Collision
-    
-            - All blocks: Passes through air only.
-            - Non-fluid blocks: Passes through fluids (water and lava).
-            - Solid blocks: Passes through non-solid blocks such as tall grass, and through fluids.
-            - None: Passes through all blocks.
-        
-        """
-        return CodeBlock.new_action('set_var', 'Raycast', (result, ray_origin, ray_distance,), {'Entity Collision': entity_collision, 'Block Collision': block_collision})
-
-    @staticmethod
-    def RotateAroundVec(result: Variable, vector_to_rotate: DFVector | None=None, axis_vector: DFVector=None, angle: Number=None, angle_units: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Rotates a vector around another vector by an angle.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_rotate: Vector to rotate (optional)
-        :param DFVector axis_vector: Axis vector
-        :param Number angle: Angle
-        :param str angle_units: Angle Units
-        
-        """
-        return CodeBlock.new_action('set_var', 'RotateAroundVec', (result, vector_to_rotate, axis_vector, angle,), {'Angle Units': angle_units})
-
-    @staticmethod
-    def GetParticleMotion(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle motion.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get motion of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleMotion', (result, effect,), {})
-
-    @staticmethod
-    def SetTooltipStyle(result: Variable, item_to_change: Item | None=None, tooltip_key: DFString | None=None, ):
-        """
-        Sets an item's custom tooltip.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString | None tooltip_key: Tooltip key (optional) (A namespaced key ("minecraft:" by default))
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetTooltipStyle', (result, item_to_change, tooltip_key,), {})
-
-    @staticmethod
-    def SetConsumable(result: Variable, item_to_change: Item | None=None, consuming_sound: Sound | None=None, nutrition: Number | None=None, saturation: Number | None=None, use_duration: Number | None=None, can_always_eat: Literal["True", "False"]="False", show_particles: Literal["True", "False"]="True", consuming_animation: Literal["None", "Eat", "Drink", "Block", "Bow", "Trident", "Crossbow", "Spyglass", "Toot horn", "Brush", "Bundle", "Spear"]="Eat", ):
-        """
-        Adds consumable properties to an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Sound | None consuming_sound: Consuming sound (optional)
-        :param Number | None nutrition: Nutrition (optional)
-        :param Number | None saturation: Saturation (optional)
-        :param Number | None use_duration: Use duration (seconds) (optional) (Default = 1.6)
-        :param str can_always_eat: Can Always Eat
-        :param str show_particles: Show Particles
-        :param str consuming_animation: Consuming Animation
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetConsumable', (result, item_to_change, consuming_sound, nutrition, saturation, use_duration,), {'Can Always Eat': can_always_eat, 'Show Particles': show_particles, 'Consuming Animation': consuming_animation})
-
-    @staticmethod
-    def SetParticleMotion(result: Variable, effect_to_change: Particle | None=None, particle_motion: DFVector | None=None, motion_variation: Number | None=None, ):
-        """
-        Sets a particle effect's particle motion and motion variation.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param DFVector | None particle_motion: Particle motion (optional)
-        :param Number | None motion_variation: Motion variation (%) (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleMotion', (result, effect_to_change, particle_motion, motion_variation,), {})
-
-    @staticmethod
-    def Average(result: Variable, numbers_to_average: list[Number] | Number, ):
-        """
-        Sets a variable to the average of the given numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number numbers_to_average: Numbers to average
-        
-        """
-        return CodeBlock.new_action('set_var', 'Average', (result, numbers_to_average,), {})
-
-    @staticmethod
-    def ClampLoc(result: Variable, location_to_clamp: Location | None=None, corner_1: Location=None, corner_2: Location=None, coordinates: Literal["All coordinates", "X and Z"]="All coordinates", ):
-        """
-        Clamps a location to a region defined by 2 corners.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_clamp: Location to clamp (optional)
-        :param Location corner_1: Corner 1
-        :param Location corner_2: Corner 2
-        :param str coordinates: Coordinates
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClampLoc', (result, location_to_clamp, corner_1, corner_2,), {'Coordinates': coordinates})
-
-    @staticmethod
-    def SetMapTexture(result: Variable, item_to_change: Item | None=None, image_url: DFString=None, ):
-        """
-        Sets a map item's texture to the image at the given URL.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString image_url: Image URL
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetMapTexture', (result, item_to_change, image_url,), {})
-
-    @staticmethod
-    def GetBlockData(result: Variable, block_location: Location, tag_name: DFString, ):
-        """
-        Gets a block state tag value at a location.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        :param DFString tag_name: Tag name
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockData', (result, block_location, tag_name,), {})
-
-    @staticmethod
-    def SortDict(result: Variable, dictionary_to_sort: ArgValue | None=None, sorting_type: Literal["Sort by Key", "Sort by Value"]="Sort by Key", sorting_order: Literal["Ascending", "Descending"]="Ascending", ):
-        """
-        Sorts a dictionary by its keys or values.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None dictionary_to_sort: Dictionary to sort (optional)
-        :param str sorting_type: Sorting Type
-        :param str sorting_order: Sorting Order
-        
-        """
-        return CodeBlock.new_action('set_var', 'SortDict', (result, dictionary_to_sort,), {'Sorting Type': sorting_type, 'Sorting Order': sorting_order})
-
-    @staticmethod
-    def GetLecternBook(result: Variable, lectern_location: Location, ):
-        """
-        Gets the book on the Lectern at a location.
-    
-        :param Variable result: Variable to set
-        :param Location lectern_location: Lectern location
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetLecternBook', (result, lectern_location,), {})
-
-    @staticmethod
-    def GetCustomSound(result: Variable, sound: Sound, ):
-        """
-        Gets the key of a custom sound.
-    
-        :param Variable result: Variable to set
-        :param Sound sound: Sound to get key of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCustomSound', (result, sound,), {})
-
-    @staticmethod
-    def CrossProduct(result: Variable, vector_1: DFVector, vector_2: DFVector, ):
-        """
-        Sets a variable to the cross product of two vectors.
-    
-        :param Variable result: Variable to set
-        :param DFVector vector_1: Vector 1
-        :param DFVector vector_2: Vector 2
-        
-        """
-        return CodeBlock.new_action('set_var', 'CrossProduct', (result, vector_1, vector_2,), {})
-
-    @staticmethod
-    def Multiply(result: Variable, numbers_to_multiply: list[Number] | Number, ):
-        """
-        Sets a variable to the product of the given numbers.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number numbers_to_multiply: Numbers to multiply
-        
-        """
-        return CodeBlock.new_action('set_var', 'x', (result, numbers_to_multiply,), {})
-
-    @staticmethod
-    def GetParticleRoll(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's roll.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get roll of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleRoll', (result, effect,), {})
-
-    @staticmethod
-    def DotProduct(result: Variable, vector_1: DFVector, vector_2: DFVector, ):
-        """
-        Sets a variable to the dot product of two vectors.
-    
-        :param Variable result: Variable to set
-        :param DFVector vector_1: Vector 1
-        :param DFVector vector_2: Vector 2
-        
-        """
-        return CodeBlock.new_action('set_var', 'DotProduct', (result, vector_1, vector_2,), {})
-
-    @staticmethod
-    def SetArmorTrim(result: Variable, item_to_change: Item | None=None, trim_pattern: Literal["None", "Bolt", "Coast", "Dune", "Eye", "Flow", "Rib", "Sentry", "Snout", "Spire", "Tide", "Vex", "Ward", "Wayfinder", "Shaper", "Silence", "Raiser", "Host", "Wild"]="None", trim_material: Literal["Amethyst", "Copper", "Diamond", "Emerald", "Gold", "Iron", "Lapis Lazuli", "Netherite", "Quartz", "Resin", "Redstone"]="Amethyst", ):
-        """
-        Sets the trim of an armor item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param str trim_pattern: Trim Pattern
-    
-            - None: Removes the armor trim from the item.
-        :param str trim_material: Trim Material
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetArmorTrim', (result, item_to_change,), {'Trim Pattern': trim_pattern, 'Trim Material': trim_material})
-
-    @staticmethod
-    def PopListValue(result: Variable, list: ArgValue, index: Number | None=None, ):
-        """
-        Gets a list variable's value at an index and removes it.
-    
-        :param Variable result: Variable to set
-        :param ArgValue list: List to get value of
-        :param Number | None index: Index (optional) (Default = Last index)
-        
-        """
-        return CodeBlock.new_action('set_var', 'PopListValue', (result, list, index,), {})
-
-    @staticmethod
-    def SetParticleOpac(result: Variable, effect_to_change: Particle | None=None, particle_opacity: Number=None, ):
-        """
-        Sets a particle effect's opacity.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_opacity: Particle opacity
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleOpac', (result, effect_to_change, particle_opacity,), {})
-
-    @staticmethod
-    def Noise(result: Variable, noise_location: Location, frequency: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, generation_seed: Number | None=None, return_type: Literal["Simplex", "Perlin", "Voronoi", "Worley", "Value"]="Simplex", dimensions: Literal["3D", "2D"]="3D", ):
-        """
-        Gets a seeded noise value.
-    
-        :param Variable result: Variable to set
-        :param Location noise_location: Noise location
-        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
-        :param Number | None octaves: Octaves (optional) (Adds an additional layer of noise to the output. 1-16, Default = 1)
-        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
-        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None generation_seed: Generation seed (optional)
-        :param str return_type: Return Type
-    
-            - Simplex: Provides the average of a honeycomb of gradient vectors.  Using a honeycomb instead of a lattice like that used in Perlin Noise, removes directional artifacts and increases efficiency.
-            - Perlin: Provides the average of a lattice of gradient vectors.  Using vectors rather than values like those seen in Value Noise, provides more detail at the cost of lower efficiency.
-            - Voronoi: Provides the identifier of the closest cell with cellular noise.
-            - Worley: Provides the distance from the closest cell origin with cellular noise.
-            - Value: Provides the average of a lattice (grid) of random values.
-        :param str dimensions: Dimensions
-    
-            - 3D: Generates using the X, Y and Z axis.
-            - 2D: Generates using the X and Z axis only.
-        
-        """
-        return CodeBlock.new_action('set_var', 'Noise', (result, noise_location, frequency, octaves, lacunarity, gain, generation_seed,), {'Return Type': return_type, 'Dimensions': dimensions})
-
-    @staticmethod
-    def MinNumber(result: Variable, number_set_to_compare: list[Number] | Number, ):
-        """
-        Sets a variable to the lowest number in a set.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number number_set_to_compare: Number set to compare
-        
-        """
-        return CodeBlock.new_action('set_var', 'MinNumber', (result, number_set_to_compare,), {})
-
-    @staticmethod
-    def GetPotionType(result: Variable, potion: Potion, ):
-        """
-        Gets a potion effect's type.
-    
-        :param Variable result: Variable to set
-        :param Potion potion: Potion to get type of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetPotionType', (result, potion,), {})
-
-    @staticmethod
-    def ListLength(result: Variable, list_to_measure: ArgValue, ):
-        """
-        Gets the number of values a list has.
-    
-        :param Variable result: Variable to set
-        :param ArgValue list_to_measure: List to measure
-        
-        """
-        return CodeBlock.new_action('set_var', 'ListLength', (result, list_to_measure,), {})
-
-    @staticmethod
-    def Sine(result: Variable, number_input: Number, sine_variant: Literal["Sine", "Inverse sine (arcsine)", "Hyperbolic sine"]="Sine", input: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Sets a variable to the trigonometric sine function of a number.
-    
-        :param Variable result: Variable to set
-        :param Number number_input: Number input
-        :param str sine_variant: Sine Variant
-        :param str input: Input
-        
-        """
-        return CodeBlock.new_action('set_var', 'Sine', (result, number_input,), {'Sine Variant': sine_variant, 'Input': input})
-
-    @staticmethod
-    def DirectionName(result: Variable, direction: DFVector, ):
-        """
-        Sets a variable to the name of the direction of a vector.
-    
-        :param Variable result: Variable to set
-        :param DFVector direction: Direction
-        
-        """
-        return CodeBlock.new_action('set_var', 'DirectionName', (result, direction,), {})
-
-    @staticmethod
-    def RepeatString(result: Variable, string_to_repeat: DFString, times_to_repeat: Number, ):
-        """
-        Repeats a string the given number of times.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_repeat: String to repeat
-        :param Number times_to_repeat: Times to repeat
-        
-        """
-        return CodeBlock.new_action('set_var', 'RepeatString', (result, string_to_repeat, times_to_repeat,), {})
-
-    @staticmethod
-    def JoinString(result: Variable, strings_to_join: ArgValue, joining_string: DFString | None=None, final_joining_string: DFString | None=None, ):
-        """
-        Combines a list of strings.
-    
-        :param Variable result: Variable to set
-        :param ArgValue strings_to_join: Strings to join
-        :param DFString | None joining_string: Joining string (optional)
-        :param DFString | None final_joining_string: Final joining string (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'JoinString', (result, strings_to_join, joining_string, final_joining_string,), {})
-
-    @staticmethod
-    def ReverseList(result: Variable, list_to_reverse: ArgValue | None=None, ):
-        """
-        Reverses the order of a list variable's values.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_reverse: List to reverse (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ReverseList', (result, list_to_reverse,), {})
-
-    @staticmethod
-    def DedupList(result: Variable, list_to_deduplicate: ArgValue | None=None, ):
-        """
-        Removes list elements that appear more than once.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_deduplicate: List to de-duplicate (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'DedupList', (result, list_to_deduplicate,), {})
-
-    @staticmethod
-    def CreateDict(result: Variable, key_list: ArgValue | None=None, value_list: ArgValue | None=None, ):
-        """
-        Creates a dictionary with the given keys and values.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None key_list: Key list (optional)
-        :param ArgValue | None value_list: Value list (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'CreateDict', (result, key_list, value_list,), {})
-
-    @staticmethod
-    def GetItemLeftover(result: Variable, item: Item, ):
-        """
-        Gets an item's leftover item that gets replaced on use, e.g. drinking stew gives a bowl.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get remainder of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemLeftover', (result, item,), {})
-
-    @staticmethod
-    def GetBlockByMCTag(result: Variable, block_tag_id: DFString, return_value_type: Literal["Material ID (golden_apple)", "Material Name (Golden Apple)", "Item"]="Material ID (golden_apple)", ):
-        """
-        Gets a list of blocks that belongs to the specified block tag.
-    
-        :param Variable result: Variable to set
-        :param DFString block_tag_id: Block tag ID (Example: "#mineable/pickaxe")
-        :param str return_value_type: Return Value Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockByMCTag', (result, block_tag_id,), {'Return Value Type': return_value_type})
-
-    @staticmethod
-    def FaceLocation(result: Variable, location_to_change: Location | None=None, target_location: Location=None, face_direction: Literal["Toward location", "Away from location"]="Toward location", ):
-        """
-        Sets a location's rotation to face another location.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_change: Location to change (optional)
-        :param Location target_location: Target location
-        :param str face_direction: Face Direction
-        
-        """
-        return CodeBlock.new_action('set_var', 'FaceLocation', (result, location_to_change, target_location,), {'Face Direction': face_direction})
-
-    @staticmethod
-    def SetVectorLength(result: Variable, vector_to_change: DFVector | None=None, length: Number | None=None, ):
-        """
-        Sets a vector's length. This affects all components.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_change: Vector to change (optional)
-        :param Number | None length: Length (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetVectorLength', (result, vector_to_change, length,), {})
-
-    @staticmethod
-    def SetPotionDur(result: Variable, potion_to_change: Potion | None=None, duration: Number=None, ):
-        """
-        Sets a potion effect's duration.
-    
-        :param Variable result: Variable to set
-        :param Potion | None potion_to_change: Potion to change (optional)
-        :param Number duration: Duration (ticks)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetPotionDur', (result, potion_to_change, duration,), {})
-
-    @staticmethod
-    def BlockResistance(result: Variable, block_to_check: Item | Location, ):
-        """
-        Gets a block's blast resistance.
-    
-        :param Variable result: Variable to set
-        :param Item | Location block_to_check: Block to check OR Location to check
-        
-        """
-        return CodeBlock.new_action('set_var', 'BlockResistance', (result, block_to_check,), {})
-
-    @staticmethod
-    def SplitString(result: Variable, string_to_split: DFString, splitter_string: DFString | None=None, strip_spaces: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Splits a string into a list of strings.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_split: String to split
-        :param DFString | None splitter_string: Splitter string (optional) (Default = " ")
-        :param str strip_spaces: Strip Spaces
-    
-            - Enable: Leading and trailing spaces are removed from the result.
-            - Disable: Leading and trailing spaces are kept.
-        
-        """
-        return CodeBlock.new_action('set_var', 'SplitString', (result, string_to_split, splitter_string,), {'Strip Spaces': strip_spaces})
-
-    @staticmethod
-    def NormalRandom(result: Variable, μ: Number, σ: Number, distribution: Literal["Normal", "Folded normal"]="Normal", ):
-        """
-        Sets a variable to a normally distributed random number. Values closer to μ are more likely to be chosen.
-    
-        :param Variable result: Variable to set
-        :param Number μ: μ (Mean midpoint)
-        :param Number σ: σ (Standard deviation)
-        :param str distribution: Distribution
-    
-            - Normal: Values can be above or below μ.
-            - Folded normal: Values can only be above μ.
-        
-        """
-        return CodeBlock.new_action('set_var', 'NormalRandom', (result, μ, σ,), {'Distribution': distribution})
-
-    @staticmethod
-    def SetPotionType(result: Variable, potion_to_change: Potion | None=None, type: DFString=None, ):
-        """
-        Sets a potion effect's type.
-    
-        :param Variable result: Variable to set
-        :param Potion | None potion_to_change: Potion to change (optional)
-        :param DFString type: Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetPotionType', (result, potion_to_change, type,), {})
-
-    @staticmethod
-    def GetRegexGroup(result: Variable, input_string: DFString, regex_pattern: DFString, group_name: DFString | Number, ):
-        """
-        Gets the value of a specific Regex Group in a Regex match.
-    
-        :param Variable result: Variable to set
-        :param DFString input_string: Input string
-        :param DFString regex_pattern: Regex pattern
-        :param DFString | Number group_name: Group name OR Group index
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetRegexGroup', (result, input_string, regex_pattern, group_name,), {})
-
-    @staticmethod
-    def GetParticlePower(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's power.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get power of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticlePower', (result, effect,), {})
-
-    @staticmethod
-    def AlignVector(result: Variable, vector_to_align: DFVector | None=None, ):
-        """
-        Aligns a vector to the nearest axis.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_align: Vector to align (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'AlignVector', (result, vector_to_align,), {})
-
-    @staticmethod
-    def SetItemDura(result: Variable, item: Item | None=None, item_durability: Number=None, durability_type: Literal["Set Damage", "Set Damage Percentage", "Set Remaining", "Set Remaining Percentage"]="Set Damage", ):
-        """
-        Sets an item's durability.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        :param Number item_durability: Item durability
-        :param str durability_type: Durability Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemDura', (result, item, item_durability,), {'Durability Type': durability_type})
-
-    @staticmethod
-    def SetHeadTexture(result: Variable, player_head: Item | None=None, owner_name_uuid_or_texture_value: DFString=None, code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", ):
-        """
-        Sets a player head's texture using an owning player or custom texture.
-    
-        :param Variable result: Variable to set
-        :param Item | None player_head: Player head (optional)
-        :param DFString owner_name_uuid_or_texture_value: Owner name, UUID or texture value
-        :param str code_flow: Code Flow
-    
-            - Synchronous: Waits for the texture to be loaded before continuing.
-            - Asynchronous: Continues running code immediately.
-        
-        """
-        return CodeBlock.new_action('set_var', ' SetHeadTexture ', (result, player_head, owner_name_uuid_or_texture_value,), {'Code Flow': code_flow})
-
-    @staticmethod
-    def SetBreakability(result: Variable, item: Item | None=None, breakability: Literal["Breakable", "Unbreakable"]="Unbreakable", ):
-        """
-        Sets whether an item is unbreakable.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        :param str breakability: Breakability
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetBreakability', (result, item,), {'Breakability': breakability})
-
-    @staticmethod
-    def SetMaxAmount(result: Variable, item_to_change: Item | None=None, maximum_stack_size: Number | None=None, ):
-        """
-        Set an item's maximum stack size.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Number | None maximum_stack_size: Maximum stack size (1-99) (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetMaxAmount', (result, item_to_change, maximum_stack_size,), {})
-
-    @staticmethod
-    def GetSignText(result: Variable, location: Location, sign_line: Literal["1", "2", "3", "4", "All lines"]="1", sign_side: Literal["Front", "Back"]="Front", ):
-        """
-        Gets a sign's text at a location.
-    
-        :param Variable result: Variable to set
-        :param Location location: Location
-        :param str sign_line: Sign Line
-        :param str sign_side: Sign Side
-        
-        """
-        return CodeBlock.new_action('set_var', ' GetSignText ', (result, location,), {'Sign Line': sign_line, 'Sign Side': sign_side})
-
-    @staticmethod
-    def SetDictValue(dictionary_to_add_to: Variable, key: DFString, value: ArgValue, ):
-        """
-        Sets the given key to the value.
-    
-        :param Variable dictionary_to_add_to: Dictionary to add to
-        :param DFString key: Key
-        :param ArgValue value: Value
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetDictValue', (dictionary_to_add_to, key, value,), {})
-
-    @staticmethod
-    def SetAllCoords(result: Variable, location_to_change: Location | None=None, new_x: Number | None=None, new_y: Number | None=None, new_z: Number | None=None, new_pitch: Number | None=None, new_yaw: Number | None=None, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", ):
-        """
-        Sets a location's coordinates or creates a new location.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_change: Location to change (optional)
-        :param Number | None new_x: New X (optional)
-        :param Number | None new_y: New Y (optional)
-        :param Number | None new_z: New Z (optional)
-        :param Number | None new_pitch: New Pitch (optional)
-        :param Number | None new_yaw: New Yaw (optional)
-        :param str coordinate_type: Coordinate Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetAllCoords', (result, location_to_change, new_x, new_y, new_z, new_pitch, new_yaw,), {'Coordinate Type': coordinate_type})
-
-    @staticmethod
-    def GetAllItems(result: Variable, include_items: Literal["True", "False"]="True", include_blocks: Literal["True", "False"]="True", ):
-        """
-        Gets a list of every minecraft item material
-    
-        :param Variable result: Variable to set
-        :param str include_items: Include Items
-    
-            - True: Include items that can be held by a player but cannot be placed down.
-            - False: Include items that can be held by a player but cannot be placed down.
-        :param str include_blocks: Include Blocks
-    
-            - True: Include items that can be held by a player and placed down in the world.
-            - False: Include items that can be held by a player and placed down in the world.
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetAllItems', (result,), {'Include Items': include_items, 'Include Blocks': include_blocks})
-
-    @staticmethod
-    def RGBColor(result: Variable, red: Number, green: Number, blue: Number | ArgValue, ):
-        """
-        Creates a color hex based on red, green, and blue channels.
-    
-        :param Variable result: Variable to set
-        :param Number red: Red (0-255)
-        :param Number green: Green (0-255)
-        :param Number | ArgValue blue: Blue (0-255) OR R, G, B values
-        
-        """
-        return CodeBlock.new_action('set_var', 'RGBColor', (result, red, green, blue,), {})
-
-    @staticmethod
-    def SetCanDestroy(result: Variable, item_to_change: Item | None=None, breakable_blocks: list[Item] | Item=None, ):
-        """
-        Sets which blocks an item can break in Adventure Mode.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[Item] | Item breakable_blocks: Breakable blocks
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCanDestroy', (result, item_to_change, breakable_blocks,), {})
-
-    @staticmethod
-    def HSLColor(result: Variable, hue: Number, saturation: Number | None=None, lightness: Number | ArgValue | None=None, ):
-        """
-        Creates a color based on hue, saturation, and lightness.
-    
-        :param Variable result: Variable to set
-        :param Number hue: Hue (Color circle, 0-360)
-        :param Number | None saturation: Saturation (0-100) (optional) (Default = 100)
-        :param Number | ArgValue | None lightness: Lightness (0-100) OR H, S, L values (optional) (Default = 50)
-        
-        """
-        return CodeBlock.new_action('set_var', 'HSLColor', (result, hue, saturation, lightness,), {})
-
-    @staticmethod
-    def GetItemLore(result: Variable, item: Item, ):
-        """
-        Gets an item's lore list.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get lore from
-        
-        """
-        return CodeBlock.new_action('set_var', ' GetItemLore ', (result, item,), {})
-
-    @staticmethod
-    def RemoveListIndex(list_to_change: Variable, index_to_remove: list[Number] | Number, ):
-        """
-        Removes a list variable's value at an index and shifts all values after it to the left.
-    
-        :param Variable list_to_change: List to change
-        :param list[Number] | Number index_to_remove: Index to remove
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveListIndex', (list_to_change, index_to_remove,), {})
-
-    @staticmethod
-    def CellularNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, return_type: Literal["Voronoi", "Worley", "Secondary", "Additive", "Subtractive", "Divisive", "Multiplicative", "Origin"]="Voronoi", distance_calculation: Literal["Euclidean", "Manhattan", "Natural"]="Euclidean", domain_fractal: Literal["Progressive", "Independent"]="Progressive", dimensions: Literal["3D", "2D"]="3D", ):
-        """
-        Gets cellular noise: A type of noise based on distance from cell origins.
-    
-        :param Variable result: Variable to set
-        :param Location noise_location: Noise location
-        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
-        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
-        :param Number | None octaves: Octaves (optional) (Adds an additional layer of cellular noise to the output. 1-16, Default = 1)
-        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
-        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
-        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
-        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
-        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
-        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None generation_seed: Generation seed (optional)
-        :param str return_type: Return Type
-    
-            - Voronoi: Provides the identifier of the closest cell.
-            - Worley: Provides the distance from the closest cell origin.
-            - Secondary: Provides the secondary distance from the nearest cell origin.
-            - Additive: Provides the additive distance from the nearest cell origin.
-            - Subtractive: Provides the subtractive distance from the nearest cell origin.
-            - Divisive: Provides the divisive distance from the nearest cell origin.
-            - Multiplicative: Provides the multiplicative distance from the nearest cell origin.
-            - Origin: Provides a vector that points to the closest cell origin.
-        :param str distance_calculation: Distance Calculation
-    
-            - Euclidean: Determines the closest cell using regular distance.
-            - Manhattan: Determines the closest cell using distance measured orthogonally.
-            - Natural: Determines the closest cell using Euclidean and Manhattan distance.
-        :param str domain_fractal: Domain Fractal
-    
-            - Progressive: Domains are calculated on top of one another.
-            - Independent: Domains are calculated in isolation.
-        :param str dimensions: Dimensions
-    
-            - 3D: Generates using the X, Y and Z axis.
-            - 2D: Generates using the X and Z axis only.
-        
-        """
-        return CodeBlock.new_action('set_var', 'CellularNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Return Type': return_type, 'Distance Calculation': distance_calculation, 'Domain Fractal': domain_fractal, 'Dimensions': dimensions})
-
-    @staticmethod
-    def Base64Encode(result: Variable, byte_to_encode: list[Number | int] | Number | int, ):
-        """
-        Encodes bytes as a list of numbers to Base64.
-    
-        :param Variable result: Variable to set
-        :param list[Number | int] | Number | int byte_to_encode: Byte(s) to encode
-        
-        """
-        return CodeBlock.new_action('set_var', 'Base64Encode', (result, byte_to_encode,), {})
-
-    @staticmethod
-    def Logarithm(result: Variable, number_input: Number | None=None, base: Number=None, ):
-        """
-        Finds the logarithm of a number. A logarithm is the power the base must be raised to to get the given input.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_input: Number input (optional)
-        :param Number base: Base
-        
-        """
-        return CodeBlock.new_action('set_var', 'Logarithm', (result, number_input, base,), {})
-
-    @staticmethod
-    def SetItemTag(result: Variable, item_to_change: Item | None=None, tag_name: DFString=None, tag_value: Number | DFString=None, ):
-        """
-        Sets the value of or creates a custom stored tag value.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString tag_name: Tag name
-        :param Number | DFString tag_value: Tag value OR Tag value
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemTag', (result, item_to_change, tag_name, tag_value,), {})
-
-    @staticmethod
-    def TrimString(result: Variable, string_to_trim: DFString | None=None, start_character_position: Number=None, end_character_position: Number | None=None, ):
-        """
-        Trims a string, starting and ending at the given positions.
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_trim: String to trim (optional)
-        :param Number start_character_position: Start character position
-        :param Number | None end_character_position: End character position (optional) (Default = String length)
-        
-        """
-        return CodeBlock.new_action('set_var', 'TrimString', (result, string_to_trim, start_character_position, end_character_position,), {})
-
-    @staticmethod
-    def GetItemAmount(result: Variable, item: Item, ):
-        """
-        Gets an item's stack size.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get stack size of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemAmount', (result, item,), {})
-
-    @staticmethod
-    def SetPotionAmp(result: Variable, potion_to_change: Potion | None=None, amplifier: Number=None, ):
-        """
-        Sets a potion effect's amplifier.
-    
-        :param Variable result: Variable to set
-        :param Potion | None potion_to_change: Potion to change (optional)
-        :param Number amplifier: Amplifier
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetPotionAmp', (result, potion_to_change, amplifier,), {})
-
-    @staticmethod
-    def GetCanDestroy(result: Variable, item: Item, ):
-        """
-        Gets which blocks an item can break in Adventure Mode.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCanDestroy', (result, item,), {})
-
-    @staticmethod
-    def RotateAroundAxis(result: Variable, vector_to_rotate: DFVector | None=None, angle: Number=None, axis: Literal["X", "Y", "Z"]="X", angle_units: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Rotates a vector around an axis by an angle.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_rotate: Vector to rotate (optional)
-        :param Number angle: Angle
-        :param str axis: Axis
-        :param str angle_units: Angle Units
-        
-        """
-        return CodeBlock.new_action('set_var', 'RotateAroundAxis', (result, vector_to_rotate, angle,), {'Axis': axis, 'Angle Units': angle_units})
-
-    @staticmethod
-    def GetItemDura(result: Variable, item: Item, durability_type: Literal["Get Damage", "Get Damage Percentage", "Get Remaining", "Get Remaining Percentage", "Get Maximum"]="Get Damage", ):
-        """
-        Gets an item's current or maximum durability.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item
-        :param str durability_type: Durability Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemDura', (result, item,), {'Durability Type': durability_type})
-
-    @staticmethod
-    def ShiftInDirection(result: Variable, location_to_shift: Location | None=None, shift_distance: Number | None=None, direction: Literal["Forward", "Upward", "Sideways"]="Forward", ):
-        """
-        Shifts a location forward, upward, or sideways based on its rotation.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param Number | None shift_distance: Shift distance (optional) (Default = 1)
-        :param str direction: Direction
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftInDirection', (result, location_to_shift, shift_distance,), {'Direction': direction})
-
-    @staticmethod
-    def RotationVector(result: Variable, pitch: Number, yaw: Number, length: Number | None=None, ):
-        """
-        Sets a variable to a vector facing a given rotation.
-    
-        :param Variable result: Variable to set
-        :param Number pitch: Pitch
-        :param Number yaw: Yaw
-        :param Number | None length: Length (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'RotationVector', (result, pitch, yaw, length,), {})
-
-    @staticmethod
-    def JsonToValue(result: Variable, json_to_convert: DFString, ):
-        """
-        Converts JSON to a value.
-    
-        :param Variable result: Variable to set
-        :param DFString json_to_convert: JSON to convert
-        
-        """
-        return CodeBlock.new_action('set_var', 'JsonToValue', (result, json_to_convert,), {})
-
-    @staticmethod
-    def WrapNum(result: Variable, number_to_wrap: Number | None=None, lower_bound: Number=None, upper_bound: Number=None, ):
-        """
-        Checks if a number is inside the bounds and if not, wraps it around the farthest bound.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_to_wrap: Number to wrap (optional)
-        :param Number lower_bound: Lower bound (inclusive)
-        :param Number upper_bound: Upper bound (exclusive)
-        
-        """
-        return CodeBlock.new_action('set_var', 'WrapNum', (result, number_to_wrap, lower_bound, upper_bound,), {})
-
-    @staticmethod
-    def SetModelDataNums(result: Variable, item_to_change: Item | None=None, number_model_value: list[Number] | Number=None, model_value_type: Literal["Floats", "Flags", "Colors"]="Floats", ):
-        """
-        Sets the numerical model values on an item, used in resource packs.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[Number] | Number number_model_value: Number model value(s)
-        :param str model_value_type: Model Value Type
-    
-            - Floats: Sets the "floats" array of the model data Valid input: Decimal numbers
-            - Flags: Sets the "flags" array of the model data Valid input: 0 (false) or 1 (true)
-            - Colors: Sets the "colors" array of the model data Valid input: RGB integers (e.g. 16733525)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetModelDataNums', (result, item_to_change, number_model_value,), {'Model Value Type': model_value_type})
-
-    @staticmethod
-    def ReplaceString(result: Variable, string_to_change: DFString, string_part_to_replace: DFString, replacement: DFString, regular_expressions: Literal["Enable", "Disable"]="Disable", replacement_type: Literal["First occurrence", "All occurrences"]="All occurrences", ):
-        """
-        Searches for part of a string and replaces it.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_change: String to change
-        :param DFString string_part_to_replace: String part to replace
-        :param DFString replacement: Replacement
-        :param str regular_expressions: Regular Expressions
-        :param str replacement_type: Replacement Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'ReplaceString', (result, string_to_change, string_part_to_replace, replacement,), {'Regular Expressions': regular_expressions, 'Replacement Type': replacement_type})
-
-    @staticmethod
-    def SetItemGlowing(result: Variable, item_to_change: Item | None=None, glowing: Literal["Enable", "Disable", "Default"]="Enable", ):
-        """
-        Sets whether an item is glowing regardless of its enchantments.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param str glowing: Glowing
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemGlowing', (result, item_to_change,), {'Glowing': glowing})
-
-    @staticmethod
-    def SetItemName(result: Variable, item_to_change: Item | None=None, name: list[DFText] | DFText=None, ):
-        """
-        Sets an item's name.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[DFText] | DFText name: Name
-        
-        """
-        return CodeBlock.new_action('set_var', ' SetItemName ', (result, item_to_change, name,), {})
-
-    @staticmethod
-    def SetLodestoneLoc(result: Variable, item_to_change: Item | None=None, lodestone_location: Location=None, require_lodestone_at_location: Literal["True", "False"]="False", ):
-        """
-        Sets a compass's lodestone location.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Location lodestone_location: Lodestone location
-        :param str require_lodestone_at_location: Require Lodestone at Location
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetLodestoneLoc', (result, item_to_change, lodestone_location,), {'Require Lodestone at Location': require_lodestone_at_location})
-
-    @staticmethod
-    def FlattenList(result: Variable, list_to_flatten: ArgValue | None=None, ):
-        """
-        Sets a variable to a list with its sub-lists spread out into individual elements.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_flatten: List to flatten (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'FlattenList', (result, list_to_flatten,), {})
-
-    @staticmethod
-    def SetItemRarity(result: Variable, item_to_change: Item | None=None, rarity: Literal["Default for item type", "Common", "Uncommon", "Rare", "Epic"]="Default for item type", ):
-        """
-        Sets an item's rarity, affecting its default name color.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param str rarity: Rarity
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemRarity', (result, item_to_change,), {'Rarity': rarity})
-
-    @staticmethod
-    def BlockHardness(result: Variable, block_to_check: Item | Location, ):
-        """
-        Gets a block's hardness value.
-    
-        :param Variable result: Variable to set
-        :param Item | Location block_to_check: Block to check OR Location to check
-        
-        """
-        return CodeBlock.new_action('set_var', 'BlockHardness', (result, block_to_check,), {})
-
-    @staticmethod
-    def GetPotionAmp(result: Variable, potion: Potion, ):
-        """
-        Gets a potion effect's amplifier.
-    
-        :param Variable result: Variable to set
-        :param Potion potion: Potion to get amplifier of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetPotionAmp', (result, potion,), {})
-
-    @staticmethod
-    def GetBundleItems(result: Variable, bundle: Item, ):
-        """
-        Gets the contents of a bundle.
-    
-        :param Variable result: Variable to set
-        :param Item bundle: Bundle
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBundleItems', (result, bundle,), {})
-
-    @staticmethod
-    def GetParticleAmount(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle amount.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get amount of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleAmount', (result, effect,), {})
-
-    @staticmethod
-    def RandomVector(result: Variable, vector_length: Number | None=None, ):
-        """
-        Creates a random vector that lies on a sphere. Generated vectors will be uniformly distributed on its surface.
-    
-        :param Variable result: Variable to set
-        :param Number | None vector_length: Vector length (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'RandomVector', (result, vector_length,), {})
-
-    @staticmethod
-    def GetBlockShape(result: Variable, block_location: Location, ):
-        """
-        Gets a block collision shape at a location.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockShape', (result, block_location,), {})
-
-    @staticmethod
-    def GetDictSize(result: Variable, dictionary_to_measure: ArgValue, ):
-        """
-        Gets the number of entries in a dictionary.
-    
-        :param Variable result: Variable to set
-        :param ArgValue dictionary_to_measure: Dictionary to measure
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetDictSize', (result, dictionary_to_measure,), {})
-
-    @staticmethod
-    def SetItemAmount(result: Variable, item_to_change: Item | None=None, stack_size: Number=None, ):
-        """
-        Sets an item's stack size.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Number stack_size: Stack size
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemAmount', (result, item_to_change, stack_size,), {})
-
-    @staticmethod
-    def SubtractVectors(result: Variable, vectors_to_subtract: list[DFVector] | DFVector, ):
-        """
-        Sets a variable to the difference between the given vectors.
-    
-        :param Variable result: Variable to set
-        :param list[DFVector] | DFVector vectors_to_subtract: Vectors to subtract
-        
-        """
-        return CodeBlock.new_action('set_var', 'SubtractVectors', (result, vectors_to_subtract,), {})
-
-    @staticmethod
-    def AllRegexMatches(result: Variable, input_string: DFString, regex_pattern: DFString, return_type: Literal["Full Match", "All Groups", "All Named Groups"]="Full Match", ):
-        """
-        Gets a list of every Regex match in the given string.
-    
-        :param Variable result: Variable to set
-        :param DFString input_string: Input string
-        :param DFString regex_pattern: Regex pattern
-        :param str return_type: Return Type
-    
-            - Full Match: Return a list of all matches
-            - All Groups: Return a list of lists where each sub-list contains all groups of the relevant Regex match
-            - All Named Groups: Return a list of dictionaries where each dictionary contains all named groups of the relevant Regex match
-        
-        """
-        return CodeBlock.new_action('set_var', 'AllRegexMatches', (result, input_string, regex_pattern,), {'Return Type': return_type})
-
-    @staticmethod
-    def SetCase(result: Variable, string_to_change: DFString | None=None, capitalization_type: Literal["UPPERCASE", "lowercase", "Proper Case", "iNVERT CASE", "RAnDoM cASe"]="UPPERCASE", ):
-        """
-        Sets a string's capitalization (eg. to uppercase).
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_change: String to change (optional)
-        :param str capitalization_type: Capitalization Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCase', (result, string_to_change,), {'Capitalization Type': capitalization_type})
-
-    @staticmethod
-    def SwapVectorComp(result: Variable, vector_to_swap_components_of: DFVector | None=None, components_to_swap: Literal["X ⇄ Y", "X ⇄ Z", "Y ⇄ Z"]="X ⇄ Y", ):
-        """
-        Swaps two of a vector's X, Y, or Z components.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_swap_components_of: Vector to swap components of (optional)
-        :param str components_to_swap: Components to Swap
-    
-            - X ⇄ Y: Swaps the X and Y components.
-            - X ⇄ Z: Swaps the X and Z components.
-            - Y ⇄ Z: Swaps the Y and Z components.
-        
-        """
-        return CodeBlock.new_action('set_var', 'SwapVectorComp', (result, vector_to_swap_components_of,), {'Components to Swap': components_to_swap})
-
-    @staticmethod
-    def SetParticleColor(result: Variable, effect_to_change: Particle | None=None, color_hexadecimal: DFString=None, color_variation: Number | None=None, ):
-        """
-        Sets a particle effect's particle color and color variation.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
-        :param Number | None color_variation: Color variation (%) (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleColor', (result, effect_to_change, color_hexadecimal, color_variation,), {})
-
-    @staticmethod
-    def GetLight(result: Variable, light_location: Location, light_type: Literal["Combined light", "Sky light", "Block light"]="Combined light", ):
-        """
-        Gets the light level at a location.
-    
-        :param Variable result: Variable to set
-        :param Location light_location: Light location
-        :param str light_type: Light Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetLight', (result, light_location,), {'Light Type': light_type})
-
-    @staticmethod
-    def GetBookText(result: Variable, book: Item, page_number: Number | None=None, ):
-        """
-        Gets a book's text.
-    
-        :param Variable result: Variable to set
-        :param Item book: Book
-        :param Number | None page_number: Page number OR Gets list of all pages)
-        
-        """
-        return CodeBlock.new_action('set_var', ' GetBookText ', (result, book, page_number,), {})
-
-    @staticmethod
-    def GetDictValues(result: Variable, dictionary_to_pull_from: ArgValue, ):
-        """
-        Gets the list of values in this dictionary.
-    
-        :param Variable result: Variable to set
-        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetDictValues', (result, dictionary_to_pull_from,), {})
-
-    @staticmethod
-    def Vector(result: Variable, x_component: Number, y_component: Number, z_component: Number | DFString, ):
-        """
-        Sets a variable to a vector.
-    
-        :param Variable result: Variable to set
-        :param Number x_component: X component
-        :param Number y_component: Y component
-        :param Number | DFString z_component: Z component OR Direction name (One of the following: "north", "east", "south", "west",  "up", "down")
-        
-        """
-        return CodeBlock.new_action('set_var', 'Vector', (result, x_component, y_component, z_component,), {})
-
-    @staticmethod
-    def Distance(result: Variable, location_1: Location, location_2: Location, distance_type: Literal["Distance 2D (X/Z)", "Distance 3D (X/Y/Z)", "Altitude (Y)"]="Distance 3D (X/Y/Z)", ):
-        """
-        Sets a variable to the distance between two locations.
-    
-        :param Variable result: Variable to set
-        :param Location location_1: Location 1
-        :param Location location_2: Location 2
-        :param str distance_type: Distance Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'Distance', (result, location_1, location_2,), {'Distance Type': distance_type})
-
-    @staticmethod
-    def ParseMiniMessage(result: Variable, string_to_parse: DFString, allowed_tags: Literal["Style Only", "Dynamic", "Full"]="Style Only", parse_legacy_color_codes: Literal["True", "False"]="False", ):
-        """
-        Parses a MiniMessage expression from a string value into a styled text.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_parse: String to parse
-        :param str allowed_tags: Allowed Tags
-    
-            - Style Only: Resolves the following tags:  • <color>  • <gradient>  • <rainbow>  • <reset>  • <transition>  • <bold>  • <italic>  • <underline>  • <obfuscated>  • <space>  • <newline>  • <empty>
-            - Dynamic: Resolves the following tags:  • ...all tags from "Style Only"  • <font>  • <keybind>  • <translatable>
-            - Full: Resolves the following tags:  • ...all tags from "Dynamic"  • <click>  • <hover>  • <insertion>
-        :param str parse_legacy_color_codes: Parse Legacy Color Codes
-        
-        """
-        return CodeBlock.new_action('set_var', 'ParseMiniMessage', (result, string_to_parse,), {'Allowed Tags': allowed_tags, 'Parse Legacy Color Codes': parse_legacy_color_codes})
-
-    @staticmethod
-    def Root(result: Variable, number_input: Number | None=None, root_index: Number | None=None, ):
-        """
-        Takes the root of a number.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_input: Number input (optional)
-        :param Number | None root_index: Root index (optional) (Default = 2 (²√input))
-        
-        """
-        return CodeBlock.new_action('set_var', 'Root', (result, number_input, root_index,), {})
-
-    @staticmethod
-    def SetModelDataStrs(result: Variable, item_to_change: Item | None=None, string_model_value: list[DFString] | DFString=None, ):
-        """
-        Sets the model string values on an item, used in resource packs.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[DFString] | DFString string_model_value: String model value(s)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetModelDataStrs', (result, item_to_change, string_model_value,), {})
-
-    @staticmethod
-    def SetParticleAmount(result: Variable, effect_to_change: Particle | None=None, particle_amount: Number=None, ):
-        """
-        Sets a particle effect's particle amount.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_amount: Particle amount
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleAmount', (result, effect_to_change, particle_amount,), {})
-
-    @staticmethod
-    def AddItemEnchant(result: Variable, item_to_change: Item | None=None, enchantment_name: DFString=None, enchantment_level: Number=None, ):
-        """
-        Adds an enchantment to an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString enchantment_name: Enchantment name
-        :param Number enchantment_level: Enchantment level
-        
-        """
-        return CodeBlock.new_action('set_var', 'AddItemEnchant', (result, item_to_change, enchantment_name, enchantment_level,), {})
-
-    @staticmethod
-    def AddItemToolRule(result: Variable, item_to_change: Item | None=None, mining_speed: Number=None, blocks_to_apply_the_rule_for: list[Item | DFString] | Item | DFString=None, correct_tool_for_loot: Literal["True", "False"]="True", ):
-        """
-        Adds a rule for breaking blocks to a tool item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Number mining_speed: Mining speed
-        :param list[Item | DFString] | Item | DFString blocks_to_apply_the_rule_for: Blocks to apply the rule for OR Block tag ID to apply the rule for (Example: "#mineable/pickaxe")
-        :param str correct_tool_for_loot: Correct Tool for Loot
-    
-            - True: If the mined block requires certain tools for item drops, this tool will cause the items to drop and increases the mining speed.
-            - False: If the mined block requires certain tools for item drops, this tool will not cause the items to drop.
-        
-        """
-        return CodeBlock.new_action('set_var', 'AddItemToolRule', (result, item_to_change, mining_speed, blocks_to_apply_the_rule_for,), {'Correct Tool for Loot': correct_tool_for_loot})
-
-    @staticmethod
-    def GetItemType(result: Variable, item: Item, return_value_type: Literal["Item ID (golden_apple)", "Item Name (Golden Apple)", "Item"]="Item ID (golden_apple)", ):
-        """
-        Gets an item's material.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get material of
-        :param str return_value_type: Return Value Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemType', (result, item,), {'Return Value Type': return_value_type})
-
-    @staticmethod
-    def GetDirection(result: Variable, location: Location, ):
-        """
-        Gets a location's rotation (pitch and yaw) as a direction.
-    
-        :param Variable result: Variable to set
-        :param Location location: Location to get direction of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetDirection', (result, location,), {})
-
-    @staticmethod
-    def GetLoreLine(result: Variable, item: Item, lore_line: Number, ):
-        """
-        Gets a single line from an item's lore.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get lore from
-        :param Number lore_line: Lore line to get
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetLoreLine', (result, item, lore_line,), {})
-
-    @staticmethod
-    def ArcTangent2(result: Variable, y: Number, x: Number, output_type: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Sets a variable to the arc tangent of 2 numbers.
-    
-        :param Variable result: Variable to set
-        :param Number y: Y
-        :param Number x: X
-        :param str output_type: Output Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'ArcTangent2', (result, y, x,), {'Output Type': output_type})
-
-    @staticmethod
-    def GetParticleType(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's type.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get type of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleType', (result, effect,), {})
-
-    @staticmethod
-    def SetItemMaxDura(result: Variable, item: Item | None=None, maximum_durability: Number | None=None, ):
-        """
-        Sets an item's maximum durability.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        :param Number | None maximum_durability: Maximum durability (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemMaxDura', (result, item, maximum_durability,), {})
-
-    @staticmethod
-    def RemoveString(result: Variable, string_to_change: DFString | None=None, string_to_remove: list[DFString] | DFString=None, regular_expressions: Literal["Enable", "Disable"]="Disable", ):
-        """
-        Searches for part of a string and removes all instances of it.
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_change: String to change (optional)
-        :param list[DFString] | DFString string_to_remove: String to remove
-        :param str regular_expressions: Regular Expressions
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveString', (result, string_to_change, string_to_remove,), {'Regular Expressions': regular_expressions})
-
-    @staticmethod
-    def GetAllBlockData(result: Variable, block_location: Location, hide_default: Literal["True", "False"]="True", ):
-        """
-        Gets the block state tags at a location.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        :param str hide_default: Hide Default
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetAllBlockData', (result, block_location,), {'Hide Default': hide_default})
-
-    @staticmethod
-    def SetCrossbowProj(result: Variable, crossbow: Item | None=None, projectiles: list[Item] | Item | None=None, ):
-        """
-        Sets a crossbow's loaded projectiles.
-    
-        :param Variable result: Variable to set
-        :param Item | None crossbow: Crossbow (optional)
-        :param list[Item] | Item | None projectiles: Projectiles (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCrossbowProj', (result, crossbow, projectiles,), {})
-
-    @staticmethod
-    def MaxNumber(result: Variable, number_set_to_compare: list[Number] | Number, ):
-        """
-        Sets a variable to the highest number in a set.
-    
-        :param Variable result: Variable to set
-        :param list[Number] | Number number_set_to_compare: Number set to compare
-        
-        """
-        return CodeBlock.new_action('set_var', 'MaxNumber', (result, number_set_to_compare,), {})
-
-    @staticmethod
-    def GetDictKeys(result: Variable, dictionary_to_pull_from: ArgValue, ):
-        """
-        Gets the list of keys in this dictionary.
-    
-        :param Variable result: Variable to set
-        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetDictKeys', (result, dictionary_to_pull_from,), {})
-
-    @staticmethod
-    def TrimStyledText(result: Variable, text_to_trim: DFText | None=None, start_character_position: Number=None, end_character_position: Number | None=None, ):
-        """
-        Trims the content of styled text, leaving all formatting in place.
-    
-        :param Variable result: Variable to set
-        :param DFText | None text_to_trim: Text to trim (optional)
-        :param Number start_character_position: Start character position
-        :param Number | None end_character_position: End character position (optional) (Default = Text length)
-        
-        """
-        return CodeBlock.new_action('set_var', 'TrimStyledText', (result, text_to_trim, start_character_position, end_character_position,), {})
-
-    @staticmethod
-    def SetParticleMat(result: Variable, effect_to_change: Particle | None=None, particle_material: Item=None, ):
-        """
-        Sets a particle effect's particle display material.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Item particle_material: Particle material
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleMat', (result, effect_to_change, particle_material,), {})
-
-    @staticmethod
-    def GetCoord(result: Variable, location: Location, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", coordinate: Literal["X", "Y", "Z", "Pitch", "Yaw"]="X", ):
-        """
-        Gets a location's X, Y, Z, pitch, or yaw coordinate.
-    
-        :param Variable result: Variable to set
-        :param Location location: Location to get coordinate of
-        :param str coordinate_type: Coordinate Type
-        :param str coordinate: Coordinate
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCoord', (result, location,), {'Coordinate Type': coordinate_type, 'Coordinate': coordinate})
-
-    @staticmethod
-    def RemoveItemTag(result: Variable, item_to_change: Item | None=None, tag_name: DFString=None, ):
-        """
-        Removes a custom item tag.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString tag_name: Tag name
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveItemTag', (result, item_to_change, tag_name,), {})
-
-    @staticmethod
-    def GetModelDataStrs(result: Variable, item: Item, ):
-        """
-        Gets the model string values on an item, used in resource packs.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get model data from
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetModelDataStrs', (result, item,), {})
-
-    @staticmethod
-    def SetParticleSize(result: Variable, effect_to_change: Particle | None=None, particle_size: Number=None, size_variation: Number | None=None, ):
-        """
-        Sets a particle effect's particle size and size variation.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_size: Particle size
-        :param Number | None size_variation: Size variation (%) (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleSize', (result, effect_to_change, particle_size, size_variation,), {})
-
-    @staticmethod
-    def GetPotionDur(result: Variable, potion: Potion, ):
-        """
-        Gets a potion effect's duration.
-    
-        :param Variable result: Variable to set
-        :param Potion potion: Potion to get duration of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetPotionDur', (result, potion,), {})
-
-    @staticmethod
-    def RandomLoc(result: Variable, location_1: Location, location_2: Location, ):
-        """
-        Sets the variable to a random location between two locations.
-    
-        :param Variable result: Variable to set
-        :param Location location_1: Location 1
-        :param Location location_2: Location 2
-        
-        """
-        return CodeBlock.new_action('set_var', 'RandomLoc', (result, location_1, location_2,), {})
-
-    @staticmethod
-    def SetSoundType(result: Variable, sound_to_change: Sound | None=None, sound_name: DFString=None, ):
-        """
-        Sets a sound's type.
-    
-        :param Variable result: Variable to set
-        :param Sound | None sound_to_change: Sound to change (optional)
-        :param DFString sound_name: Sound name (e.g. "pling")
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetSoundType', (result, sound_to_change, sound_name,), {})
-
-    @staticmethod
-    def GetLodestoneLoc(result: Variable, compass: Item, ):
-        """
-        Gets a compass's lodestone location.
-    
-        :param Variable result: Variable to set
-        :param Item compass: Compass to get lodestone location of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetLodestoneLoc', (result, compass,), {})
-
-    @staticmethod
-    def IndexOfSubstring(result: Variable, string_to_search_in: DFString, string_to_search_for: DFString, starting_index: Number | None=None, ignore_case: Literal["True", "False"]="False", search_type: Literal["First occurrence", "Last occurrence"]="First occurrence", ):
-        """
-        Searches for a string in another string and gets the index if found.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_search_in: String to search in
-        :param DFString string_to_search_for: String to search for
-        :param Number | None starting_index: Starting index (optional) (Default = 1)
-        :param str ignore_case: Ignore Case
-        :param str search_type: Search Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'IndexOfSubstring', (result, string_to_search_in, string_to_search_for, starting_index,), {'Ignore Case': ignore_case, 'Search Type': search_type})
-
-    @staticmethod
-    def GetParticleSprd(result: Variable, effect: Particle, spread: Literal["Horizontal", "Vertical"]="Horizontal", ):
-        """
-        Gets a particle effect's horizontal or vertical spread.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get spread of
-        :param str spread: Spread
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleSprd', (result, effect,), {'Spread': spread})
-
-    @staticmethod
-    def SetItemLeftover(result: Variable, item_to_change: Item | None=None, remainder_item: Item | None=None, ):
-        """
-        Sets an item's leftover item that gets replaced on use, e.g. drinking stew gives a bowl.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Item | None remainder_item: Remainder item (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemLeftover', (result, item_to_change, remainder_item,), {})
-
-    @staticmethod
-    def ReflectVector(result: Variable, vector_to_reflect: DFVector | None=None, surface_vector: DFVector=None, ):
-        """
-        Reflects a vector off a surface defined by another vector.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_reflect: Vector to reflect (optional)
-        :param DFVector surface_vector: Surface vector
-        
-        """
-        return CodeBlock.new_action('set_var', 'ReflectVector', (result, vector_to_reflect, surface_vector,), {})
-
-    @staticmethod
-    def DecimalRGB(result: Variable, hex_code_to_convert: DFString, ):
-        """
-        Converts a hex code to a packed RGB integer.
-    
-        :param Variable result: Variable to set
-        :param DFString hex_code_to_convert: Hex code to convert
-        
-        """
-        return CodeBlock.new_action('set_var', 'DecimalRGB', (result, hex_code_to_convert,), {})
-
-    @staticmethod
-    def ClearItemAttrs(result: Variable, item: Item | None=None, ):
-        """
-        Clears all attributes from an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item: Item (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClearItemAttrs', (result, item,), {})
-
-    @staticmethod
-    def GetHeadOwner(result: Variable, head: Item, text_value: Literal["Owner Name", "Owner UUID"]="Owner Name", ):
-        """
-        Gets a player head's owner name or UUID.
-    
-        :param Variable result: Variable to set
-        :param Item head: Head to get owner of
-        :param str text_value: Text Value
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetHeadOwner', (result, head,), {'Text Value': text_value})
-
-    @staticmethod
-    def AppendDict(dictionary_to_add_to: Variable, dictionary_to_append: ArgValue, ):
-        """
-        Adds all entries from one dictionary into the other.
-    
-        :param Variable dictionary_to_add_to: Dictionary to add to
-        :param ArgValue dictionary_to_append: Dictionary to append
-        
-        """
-        return CodeBlock.new_action('set_var', 'AppendDict', (dictionary_to_add_to, dictionary_to_append,), {})
-
-    @staticmethod
-    def SetItemModel(result: Variable, item_to_change: Item | None=None, model_key: DFString | None=None, ):
-        """
-        Sets an item's model.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString | None model_key: Model key (optional) (A namespaced key ("minecraft:" by default))
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemModel', (result, item_to_change, model_key,), {})
-
-    @staticmethod
-    def GetColorChannels(result: Variable, color_hexadecimal: DFString, color_channels: Literal["RGB", "HSB", "HSL"]="RGB", ):
-        """
-        Gets a color's RGB/HSB/HSL number values as a list.
-    
-        :param Variable result: Variable to set
-        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
-        :param str color_channels: Color Channels
-    
-            - RGB: 1. Red (0 - 255) 2. Green (0 - 255) 3. Blue (0 - 255)
-            - HSB: 1. Hue (0.0 - 360.0) 2. Saturation (0.0 - 100.0) 3. Brightness (0.0 - 100.0)
-            - HSL: 1. Hue (0.0 - 360.0) 2. Saturation (0.0 - 100.0) 3. Lightness (0.0 - 100.0)
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetColorChannels', (result, color_hexadecimal,), {'Color Channels': color_channels})
-
-    @staticmethod
-    def SetDirection(result: Variable, location_to_change: Location | None=None, direction: DFVector=None, ):
-        """
-        Sets a location's rotation (pitch and yaw) to a direction.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_change: Location to change (optional)
-        :param DFVector direction: Direction
-        
-        """
-        return CodeBlock.new_action('set_var', ' SetDirection ', (result, location_to_change, direction,), {})
-
-    @staticmethod
-    def SetListValue(list_to_change: Variable, index: Number, value_to_set: ArgValue, ):
-        """
-        Sets a list variable's value at an index.
-    
-        :param Variable list_to_change: List to change
-        :param Number index: Index
-        :param ArgValue value_to_set: Value to set
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetListValue', (list_to_change, index, value_to_set,), {})
-
-    @staticmethod
-    def SetItemEnchants(result: Variable, item_to_change: Item | None=None, enchantments: ArgValue=None, ):
-        """
-        Sets an item's enchantment list.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param ArgValue enchantments: Enchantments (Key of enchantment ID)
-        
-        """
-        return CodeBlock.new_action('set_var', ' SetItemEnchants ', (result, item_to_change, enchantments,), {})
-
-    @staticmethod
-    def SetBookText(result: Variable, book: Item | None=None, pages: list[DFText] | DFText=None, page_number: Number=None, ):
-        """
-        Sets a book's text.
-    
-        :param Variable result: Variable to set
-        :param Item | None book: Book (optional)
-        :param list[DFText] | DFText pages: Pages OR Page text
-        :param Number page_number: Page number
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetBookText', (result, book, pages, page_number,), {})
-
-    @staticmethod
-    def RandomValue(result: Variable, value_set_to_choose_from: list[ArgValue] | ArgValue, ):
-        """
-        Sets a variable to a random value from a set.
-    
-        :param Variable result: Variable to set
-        :param list[ArgValue] | ArgValue value_set_to_choose_from: Value set to choose from
-        
-        """
-        return CodeBlock.new_action('set_var', 'RandomValue', (result, value_set_to_choose_from,), {})
-
-    @staticmethod
-    def SetItemType(result: Variable, item_to_change: Item | None=None, material: DFString=None, ):
-        """
-        Sets an item's material.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString material: Material
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemType', (result, item_to_change, material,), {})
-
-    @staticmethod
-    def GetSoundType(result: Variable, sound: Sound, ):
-        """
-        Gets the given sound's type.
-    
-        :param Variable result: Variable to set
-        :param Sound sound: Sound to get type of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetSoundType', (result, sound,), {})
-
-    @staticmethod
-    def ClampVector(result: Variable, vector_to_clamp: DFVector | None=None, lower_bound_vector: DFVector=None, upper_bound_vector: DFVector=None, ):
-        """
-        Clamps a vector to a region defined by 2 vectors
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_clamp: Vector to clamp (optional)
-        :param DFVector lower_bound_vector: Lower bound vector
-        :param DFVector upper_bound_vector: Upper bound vector
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClampVector', (result, vector_to_clamp, lower_bound_vector, upper_bound_vector,), {})
-
-    @staticmethod
-    def GetListValue(result: Variable, list: ArgValue, index: Number, ):
-        """
-        Gets a list variable's value at an index.
-    
-        :param Variable result: Variable to set
-        :param ArgValue list: List to get value of
-        :param Number index: Index
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetListValue', (result, list, index,), {})
-
-    @staticmethod
-    def ValueToJson(result: Variable, value_to_convert: Number | DFString | ArgValue, ):
-        """
-        Converts a value to JSON.
-    
-        :param Variable result: Variable to set
-        :param Number | DFString | ArgValue value_to_convert: Value to convert OR Value to convert OR Value to convert OR Value to convert
-        
-        """
-        return CodeBlock.new_action('set_var', 'ValueToJson', (result, value_to_convert,), {})
-
-    @staticmethod
-    def BounceNum(result: Variable, number_to_bounce: Number | None=None, lower_bound: Number=None, upper_bound: Number=None, ):
-        """
-        Checks if a number is inside the bounds and if not, bounces it towards the other bound.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_to_bounce: Number to bounce (optional)
-        :param Number lower_bound: Lower bound (inclusive)
-        :param Number upper_bound: Upper bound (exclusive)
-        
-        """
-        return CodeBlock.new_action('set_var', 'BounceNum', (result, number_to_bounce, lower_bound, upper_bound,), {})
-
-    @staticmethod
-    def Tangent(result: Variable, number_input: Number, tangent_variant: Literal["Tangent", "Inverse tangent (arctangent)", "Hyperbolic tangent"]="Tangent", input: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Sets a variable to the trigonometric tangent function of a number.
-    
-        :param Variable result: Variable to set
-        :param Number number_input: Number input
-        :param str tangent_variant: Tangent Variant
-        :param str input: Input
-        
-        """
-        return CodeBlock.new_action('set_var', 'Tangent', (result, number_input,), {'Tangent Variant': tangent_variant, 'Input': input})
-
-    @staticmethod
-    def HSBColor(result: Variable, hue: Number, saturation: Number | None=None, brightness: Number | ArgValue | None=None, ):
-        """
-        Creates a color based on hue, saturation, and brightness.
-    
-        :param Variable result: Variable to set
-        :param Number hue: Hue (Color circle, 0-360)
-        :param Number | None saturation: Saturation (0-100) (optional) (Default = 100)
-        :param Number | ArgValue | None brightness: Brightness (0-100) OR H, S, B values (optional) (Default = 100)
-        
-        """
-        return CodeBlock.new_action('set_var', 'HSBColor', (result, hue, saturation, brightness,), {})
-
-    @staticmethod
-    def Increment(variable_to_increment: Variable, number_to_increment_by: list[Number] | Number | None=None, ):
-        """
-        Increments a number variable by 1 or more other numbers.
-    
-        :param Variable variable_to_increment: Variable to increment
-        :param list[Number] | Number | None number_to_increment_by: Number(s) to increment by (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', '+=', (variable_to_increment, number_to_increment_by,), {})
-
-    @staticmethod
-    def Interpolate(result: Variable, time: Number, first_number: Number | None=None, second_number: Number | None=None, easing: Literal["Linear", "Quad", "Cubic", "Quart", "Quint", "Sine", "Expo", "Circ"]="Linear", direction: Literal["In", "Out", "In Out"]="In", ):
-        """
-        Interpolates two numbers based on a time value and an easing type.
-    
-        :param Variable result: Variable to set
-        :param Number time: Time (%)
-        :param Number | None first_number: First number (optional) (Default = 0)
-        :param Number | None second_number: Second number (optional) (Default = 1)
-        :param str easing: Easing
-        :param str direction: Direction
-        
-        """
-        return CodeBlock.new_action('set_var', 'Interpolate', (result, time, first_number, second_number,), {'Easing': easing, 'Direction': direction})
-
-    @staticmethod
-    def GetSoundVariant(result: Variable, sound: Sound, ):
-        """
-        Gets the variant of a sound.
-    
-        :param Variable result: Variable to set
-        :param Sound sound: Sound to get variant of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetSoundVariant', (result, sound,), {})
-
-    @staticmethod
-    def GetItemColor(result: Variable, item: Item, ):
-        """
-        Gets a colorable item's color.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get color of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemColor', (result, item,), {})
-
-    @staticmethod
-    def ClearFormatting(result: Variable, text_to_change: DFText | None=None, ):
-        """
-        Clears all formatting from the given styled text.
-    
-        :param Variable result: Variable to set
-        :param DFText | None text_to_change: Text to change (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClearFormatting', (result, text_to_change,), {})
-
-    @staticmethod
-    def InsertListValue(list_to_change: Variable, index: Number, value_to_insert: ArgValue, ):
-        """
-        Inserts a value into a list variable at an index, shifting all values at and after it to the right.
-    
-        :param Variable list_to_change: List to change
-        :param Number index: Index
-        :param ArgValue value_to_insert: Value to insert
-        
-        """
-        return CodeBlock.new_action('set_var', 'InsertListValue', (list_to_change, index, value_to_insert,), {})
-
-    @staticmethod
-    def GetParticleDur(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's duration.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get duration of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleDur', (result, effect,), {})
-
-    @staticmethod
-    def SetSoundVolume(result: Variable, sound_to_change: Sound | None=None, volume: Number=None, ):
-        """
-        Sets a sound's volume.
-    
-        :param Variable result: Variable to set
-        :param Sound | None sound_to_change: Sound to change (optional)
-        :param Number volume: Volume
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetSoundVolume', (result, sound_to_change, volume,), {})
-
-    @staticmethod
-    def SetCoord(result: Variable, location_to_change: Location | None=None, coordinate: Number=None, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", coordinate_tag: Literal["X", "Y", "Z", "Pitch", "Yaw"]="X", ):
-        """
-        Sets a location's X, Y, Z, pitch, or yaw coordinate.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_change: Location to change (optional)
-        :param Number coordinate: Coordinate
-        :param str coordinate_type: Coordinate Type
-        :param str coordinate_tag: Coordinate
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCoord', (result, location_to_change, coordinate,), {'Coordinate Type': coordinate_type, 'Coordinate': coordinate_tag})
-
-    @staticmethod
-    def AddVectors(result: Variable, vectors_to_add: list[DFVector] | DFVector, ):
-        """
-        Sets a variable to the sum of the given vectors.
-    
-        :param Variable result: Variable to set
-        :param list[DFVector] | DFVector vectors_to_add: Vectors to add
-        
-        """
-        return CodeBlock.new_action('set_var', 'AddVectors', (result, vectors_to_add,), {})
-
-    @staticmethod
-    def SanitizeTags(result: Variable, string_to_sanitize: DFString | None=None, ):
-        """
-        Sanitizes all MiniMessage tags in a string. This is useful for using user input in the Parse MiniMessage Set Variable.
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_sanitize: String to sanitize (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SanitizeTags', (result, string_to_sanitize,), {})
-
-    @staticmethod
-    def GetParticleFade(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle fade color.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get fade color of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleFade', (result, effect,), {})
-
-    @staticmethod
-    def SetItemTool(result: Variable, item_to_change: Item | None=None, default_mining_speed: Number | None=None, damage_per_block: Number | None=None, ):
-        """
-        Adds tool properties to an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Number | None default_mining_speed: Default mining speed (optional) (Default = 1)
-        :param Number | None damage_per_block: Damage per block (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemTool', (result, item_to_change, default_mining_speed, damage_per_block,), {})
-
-    @staticmethod
-    def GetTooltipStyle(result: Variable, item: Item, ):
-        """
-        Gets an item's custom tooltip.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get tooltip style of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetTooltipStyle', (result, item,), {})
-
-    @staticmethod
-    def GetItemEnchants(result: Variable, item: Item, ):
-        """
-        Gets an item's enchantments.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get enchantments from
-        
-        """
-        return CodeBlock.new_action('set_var', ' GetItemEnchants ', (result, item,), {})
-
-    @staticmethod
-    def GzipCompress(result: Variable, byte_to_compress: list[Number | int] | Number | int, ):
-        """
-        Compresses bytes as a list of numbers to Gzip.
-    
-        :param Variable result: Variable to set
-        :param list[Number | int] | Number | int byte_to_compress: Byte(s) to compress
-        
-        """
-        return CodeBlock.new_action('set_var', 'GzipCompress', (result, byte_to_compress,), {})
-
-    @staticmethod
-    def SetItemColor(result: Variable, item_to_change: Item | None=None, color_hexadecimal: DFString | None=None, ):
-        """
-        Sets a colorable item's color.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString | None color_hexadecimal: Color hexadecimal OR Removes color) (Example: "#FF0000" (red))
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemColor', (result, item_to_change, color_hexadecimal,), {})
-
-    @staticmethod
-    def GetParticleColor(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle color.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get color of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleColor', (result, effect,), {})
-
-    @staticmethod
-    def SetSoundPitch(result: Variable, sound_to_change: Sound | None=None, pitch: Number | DFString=None, ):
-        """
-        Sets a sound's pitch or note
-    
-        :param Variable result: Variable to set
-        :param Sound | None sound_to_change: Sound to change (optional)
-        :param Number | DFString pitch: Pitch OR Note
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetSoundPitch', (result, sound_to_change, pitch,), {})
-
-    @staticmethod
-    def RoundNumber(result: Variable, number_to_round: Number | None=None, round_multiple: Number | None=None, round_mode: Literal["Floor", "Nearest", "Ceiling"]="Nearest", ):
-        """
-        Rounds a number to a whole number or multiple.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_to_round: Number to round (optional)
-        :param Number | None round_multiple: Round multiple (optional) (Default = 1 (Whole number))
-        :param str round_mode: Round Mode
-    
-            - Floor: Rounds the number down.
-            - Nearest: Rounds the number to the nearest value.
-            - Ceiling: Rounds the number up.
-        
-        """
-        return CodeBlock.new_action('set_var', ' RoundNumber ', (result, number_to_round, round_multiple,), {'Round Mode': round_mode})
-
-    @staticmethod
-    def GetCanPlaceOn(result: Variable, item: Item, ):
-        """
-        Gets which blocks an item can be placed on in Adventure Mode.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetCanPlaceOn', (result, item,), {})
-
-    @staticmethod
-    def SortList(result: Variable, list_to_sort: ArgValue | None=None, sort_order: Literal["Ascending", "Descending"]="Ascending", ):
-        """
-        Sorts a list variable's values.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_sort: List to sort (optional)
-        :param str sort_order: Sort Order
-        
-        """
-        return CodeBlock.new_action('set_var', 'SortList', (result, list_to_sort,), {'Sort Order': sort_order})
-
-    @staticmethod
-    def SetCustomSound(result: Variable, sound_to_change: Sound | None=None, sound_key: DFString | None=None, ):
-        """
-        Sets the key of a custom sound.
-    
-        :param Variable result: Variable to set
-        :param Sound | None sound_to_change: Sound to change (optional)
-        :param DFString | None sound_key: Sound key (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCustomSound', (result, sound_to_change, sound_key,), {})
-
-    @staticmethod
-    def RemoveDictEntry(dictionary_to_change: Variable, key_to_remove: DFString, expected_value: list[ArgValue] | ArgValue | None=None, ):
-        """
-        Removes the dictionary entry with the given key.
-    
-        :param Variable dictionary_to_change: Dictionary to change
-        :param DFString key_to_remove: Key to remove
-        :param list[ArgValue] | ArgValue | None expected_value: Expected value(s) (optional) (When given, the entry will only be removed if the current value matches.)
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveDictEntry', (dictionary_to_change, key_to_remove, expected_value,), {})
-
-    @staticmethod
-    def FormatTime(result: Variable, time_to_format: Number, custom_format: DFString | None=None, format: Literal["Custom", "2020/08/17 17:20:54", "2020/08/17", "Mon, August 17", "Monday", "17:20:54", "5:20 PM", "17h20m54s", "54.229 seconds"]="2020/08/17 17:20:54", ):
-        """
-        Converts a numerical timestamp to a human-readable time/date text using a date format.
-    
-        :param Variable result: Variable to set
-        :param Number time_to_format: Time to format
-        :param DFString | None custom_format: Custom Format (optional) (Used only if Tag: Format is set to Custom)
-        :param str format: Format
-    
-            - Custom: Use the SimpleDateFormat online documentation.
-            - 2020/08/17 17:20:54: YYYY/MM/dd HH:mm:s
-            - 2020/08/17: YYYY/MM/dd
-            - Mon, August 17: EEE, MMMM d
-            - Monday: EEEE
-            - 17:20:54: HH:mm:ss
-            - 5:20 PM: h:mm a
-            - 17h20m54s: H'h'm'm's's'
-            - 54.229 seconds: s.S 'seconds'
-        
-        """
-        return CodeBlock.new_action('set_var', 'FormatTime', (result, time_to_format, custom_format,), {'Format': format})
-
-    @staticmethod
-    def SetParticleDur(result: Variable, effect_to_change: Particle | None=None, particle_duration: Number=None, ):
-        """
-        Sets a particle effect's duration.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_duration: Particle duration in ticks
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleDur', (result, effect_to_change, particle_duration,), {})
-
-    @staticmethod
-    def StringLength(result: Variable, string_to_measure: DFString, ):
-        """
-        Gets the number of characters a string has.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_measure: String to measure
-        
-        """
-        return CodeBlock.new_action('set_var', 'StringLength', (result, string_to_measure,), {})
-
-    @staticmethod
-    def GetItemEffects(result: Variable, item: Item, ):
-        """
-        Gets the potion effects applied by an item.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get effects from
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemEffects', (result, item,), {})
-
-    @staticmethod
-    def StyledText(result: Variable, text_to_set_to: list[ArgValue] | ArgValue | None=None, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", ):
-        """
-        Sets a variable to a styled text, or combines multiple values into one styled text.
-    
-        :param Variable result: Variable to set
-        :param list[ArgValue] | ArgValue | None text_to_set_to: Text to set to (optional)
-        :param str text_value_merging: Text Value Merging
-        :param str inherit_styles: Inherit Styles
-    
-            - True: Text style of the last value will be inherited when merging multiple values.
-            - False: Each value will have independent text style when merging multiple values.
-        
-        """
-        return CodeBlock.new_action('set_var', 'StyledText', (result, text_to_set_to,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles})
-
-    @staticmethod
-    def GetMiniMessageExpr(result: Variable, text_to_read: DFText, ):
-        """
-        Gets the MiniMessage expression for a styled text value.
-    
-        :param Variable result: Variable to set
-        :param DFText text_to_read: Text to read
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetMiniMessageExpr', (result, text_to_read,), {})
-
-    @staticmethod
-    def SetItemLore(result: Variable, item_to_change: Item | None=None, lore: list[DFText] | DFText | None=None, line_number: Number=None, ):
-        """
-        Sets an item's lore list.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[DFText] | DFText | None lore: Lore OR Clears lore) OR Lore line text
-        :param Number line_number: Line number
-        
-        """
-        return CodeBlock.new_action('set_var', ' SetItemLore ', (result, item_to_change, lore, line_number,), {})
-
-    @staticmethod
-    def SetItemEffects(result: Variable, item_to_change: Item | None=None, item_effects: list[Potion] | Potion=None, ):
-        """
-        Sets the potion effects applied by an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[Potion] | Potion item_effects: Item effects
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemEffects', (result, item_to_change, item_effects,), {})
-
-    @staticmethod
-    def Decrement(variable_to_decrement: Variable, number_to_decrement_by: list[Number] | Number | None=None, ):
-        """
-        Decrements a number variable by 1 or more other numbers.
-    
-        :param Variable variable_to_decrement: Variable to decrement
-        :param list[Number] | Number | None number_to_decrement_by: Number(s) to decrement by (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', '-=', (variable_to_decrement, number_to_decrement_by,), {})
-
-    @staticmethod
-    def GetItemTag(result: Variable, item: Item, tag_name: DFString, ):
-        """
-        Gets the value of a custom item tag.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get tag of
-        :param DFString tag_name: Tag name
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemTag', (result, item, tag_name,), {})
-
-    @staticmethod
-    def CreateList(result: Variable, value_list: list[ArgValue] | ArgValue | None=None, ):
-        """
-        Creates a list from the given values.
-    
-        :param Variable result: Variable to set
-        :param list[ArgValue] | ArgValue | None value_list: Value list (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'CreateList', (result, value_list,), {})
-
-    @staticmethod
-    def AppendList(list_to_append_to: Variable, list_to_append: list[ArgValue] | ArgValue, ):
-        """
-        Adds a list to the end of another list variable.
-    
-        :param Variable list_to_append_to: List to append to
-        :param list[ArgValue] | ArgValue list_to_append: List(s) to append
-        
-        """
-        return CodeBlock.new_action('set_var', 'AppendList', (list_to_append_to, list_to_append,), {})
-
-    @staticmethod
-    def GetContainerItems(result: Variable, container_location: Location, ignore_empty_slots: Literal["True", "False"]="False", ):
-        """
-        Gets a container's contents at a location.
-    
-        :param Variable result: Variable to set
-        :param Location container_location: Container location
-        :param str ignore_empty_slots: Ignore Empty Slots
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetContainerItems', (result, container_location,), {'Ignore Empty Slots': ignore_empty_slots})
-
-    @staticmethod
-    def GetModelDataNums(result: Variable, item: Item, model_value_type: Literal["Floats", "Flags", "Colors"]="Floats", ):
-        """
-        Gets the numerical model values on an item, used in resource packs.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get model data from
-        :param str model_value_type: Model Value Type
-    
-            - Floats: Gets the "floats" array of the model data Contents: Decimal numbers
-            - Flags: Gets the "flags" array of the model data Contents: 0 (false) or 1 (true)
-            - Colors: Gets the "colors" array of the model data Contents: RGB integers (e.g. 16733525)
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetModelDataNums', (result, item,), {'Model Value Type': model_value_type})
-
-    @staticmethod
-    def ShiftToward(result: Variable, location_to_shift: Location | None=None, target_location: Location=None, shift_distance: Number | None=None, ):
-        """
-        Shifts a location toward another location by the given distance.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param Location target_location: Target location
-        :param Number | None shift_distance: Shift distance (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftToward', (result, location_to_shift, target_location, shift_distance,), {})
-
-    @staticmethod
-    def TrimList(result: Variable, list_to_trim: ArgValue | None=None, start_index: Number=None, end_index: Number | None=None, ):
-        """
-        Trims a list, starting and ending at the given indices.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_trim: List to trim (optional)
-        :param Number start_index: Start index
-        :param Number | None end_index: End index (optional) (Default = List length)
-        
-        """
-        return CodeBlock.new_action('set_var', 'TrimList', (result, list_to_trim, start_index, end_index,), {})
-
-    @staticmethod
-    def GradientNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, dimensions: Literal["3D", "2D"]="3D", domain_fractal: Literal["Progressive", "Independent"]="Progressive", return_type: Literal["Simplex", "Perlin"]="Simplex", ):
-        """
-        Gets gradient noise: A type of noise based on a lattice of random gradients.
-    
-        :param Variable result: Variable to set
-        :param Location noise_location: Noise location
-        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
-        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
-        :param Number | None octaves: Octaves (optional) (Adds an additional layer of gradient noise to the output. 1-16, Default = 1)
-        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
-        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
-        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
-        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
-        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
-        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None generation_seed: Generation seed (optional)
-        :param str dimensions: Dimensions
-    
-            - 3D: Generates using the X, Y and Z axis.
-            - 2D: Generates using the X and Z axis only.
-        :param str domain_fractal: Domain Fractal
-    
-            - Progressive: Domains are calculated on top of one another.
-            - Independent: Domains are calculated in isolation.
-        :param str return_type: Return Type
-    
-            - Simplex: Provides the average of a honeycomb of gradient vectors.  Using a honeycomb instead of a lattice like that used in Perlin Noise, removes directional artifacts and increases efficiency.
-            - Perlin: Provides the average of a lattice of gradient vectors.  Using vectors rather than values like those seen in Value Noise, provides more detail at the cost of lower efficiency.
-        
-        """
-        return CodeBlock.new_action('set_var', 'GradientNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Dimensions': dimensions, 'Domain Fractal': domain_fractal, 'Return Type': return_type})
-
-    @staticmethod
-    def SetItemHideTooltip(result: Variable, item_to_change: Item | None=None, tooltip: Literal["Enable", "Disable"]="Enable", ):
-        """
-        Sets whether an item's tooltip is visible or not.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param str tooltip: Tooltip
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemHideTooltip', (result, item_to_change,), {'Tooltip': tooltip})
-
-    @staticmethod
-    def GetBlockSound(result: Variable, block: Item, sound_type: Literal["Break Sound", "Place Sound", "Hit Sound", "Fall Sound", "Step Sound"]="Break Sound", ):
-        """
-        Gets the sound for a block sound group.
-    
-        :param Variable result: Variable to set
-        :param Item block: Block to get sound from
-        :param str sound_type: Sound Type
-    
-            - Break Sound: Sound played when the block is broken.
-            - Place Sound: Sound played when the block is placed.
-            - Hit Sound: Sound played when the block is hit.
-            - Fall Sound: Sound played when something falls on the block.
-            - Step Sound: Sound played when something steps on the block.
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockSound', (result, block,), {'Sound Type': sound_type})
-
-    @staticmethod
-    def GetBlockDrops(result: Variable, location_to_check: Location, tool_to_use: Item | None=None, ):
-        """
-        Gets the items dropped by a block if mined by a given tool.
-    
-        :param Variable result: Variable to set
-        :param Location location_to_check: Location to check
-        :param Item | None tool_to_use: Tool to use (optional) (Default = Required Tool)
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockDrops', (result, location_to_check, tool_to_use,), {})
-
-    @staticmethod
-    def NamedRegexGrps(result: Variable, input_string: DFString, regex_pattern: DFString, ):
-        """
-        Gets a dictionary of all named capture groups in a Regex match.
-    
-        :param Variable result: Variable to set
-        :param DFString input_string: Input string
-        :param DFString regex_pattern: Regex pattern
-        
-        """
-        return CodeBlock.new_action('set_var', 'NamedRegexGrps', (result, input_string, regex_pattern,), {})
-
-    @staticmethod
-    def ClearEnchants(result: Variable, item_to_change: Item | None=None, ):
-        """
-        Removes enchantments from an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClearEnchants', (result, item_to_change,), {})
-
-    @staticmethod
-    def Cosine(result: Variable, number_input: Number, cosine_variant: Literal["Cosine", "Inverse cosine (arccosine)", "Hyperbolic cosine"]="Cosine", input: Literal["Degrees", "Radians"]="Degrees", ):
-        """
-        Sets a variable to the trigonometric cosine function of a number.
-    
-        :param Variable result: Variable to set
-        :param Number number_input: Number input
-        :param str cosine_variant: Cosine Variant
-        :param str input: Input
-        
-        """
-        return CodeBlock.new_action('set_var', 'Cosine', (result, number_input,), {'Cosine Variant': cosine_variant, 'Input': input})
-
-    @staticmethod
-    def GetParticleOpac(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's opacity.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get opacity of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleOpac', (result, effect,), {})
-
-    @staticmethod
-    def GetBreakSound(result: Variable, item: Item, ):
-        """
-        Gets which sound an item makes when it breaks.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get break sound from
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBreakSound', (result, item,), {})
-
-    @staticmethod
-    def GetItemByMCTag(result: Variable, item_tag_id: DFString, return_value_tyep: Literal["Material ID (golden_apple)", "Material Name (Golden Apple)", "Item"]="Material ID (golden_apple)", ):
-        """
-        Gets a list of items that belongs to the specified item tag.
-    
-        :param Variable result: Variable to set
-        :param DFString item_tag_id: Item tag ID (Example: "#enchantable/sword")
-        :param str return_value_tyep: Return Value Tyep
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemByMCTag', (result, item_tag_id,), {'Return Value Tyep': return_value_tyep})
-
-    @staticmethod
-    def SetParticleFade(result: Variable, effect_to_change: Particle | None=None, color_hexadecimal: DFString=None, ):
-        """
-        Sets a particle effect's particle fade color.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleFade', (result, effect_to_change, color_hexadecimal,), {})
-
-    @staticmethod
-    def SetVectorComp(result: Variable, vector_to_change: DFVector | None=None, component: Number=None, component_tag: Literal["X", "Y", "Z"]="X", ):
-        """
-        Sets a vector's X, Y, or Z component.
-    
-        :param Variable result: Variable to set
-        :param DFVector | None vector_to_change: Vector to change (optional)
-        :param Number component: Component
-        :param str component_tag: Component
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetVectorComp', (result, vector_to_change, component,), {'Component': component_tag})
-
-    @staticmethod
-    def ParseNumber(result: Variable, string_to_convert: DFString | None=None, ):
-        """
-        Converts a string to a number.
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_convert: String to convert (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ParseNumber', (result, string_to_convert,), {})
-
-    @staticmethod
-    def Exponent(result: Variable, number_input: Number | None=None, exponent: Number | None=None, ):
-        """
-        Raises a number to the power of an exponent.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_input: Number input (optional)
-        :param Number | None exponent: Exponent (optional) (Default = 2 (input²))
-        
-        """
-        return CodeBlock.new_action('set_var', 'Exponent', (result, number_input, exponent,), {})
-
-    @staticmethod
-    def GetValueIndex(result: Variable, list_to_search_in: ArgValue, value_to_search: ArgValue, search_order: Literal["Ascending (first index)", "Descending (last index)"]="Ascending (first index)", ):
-        """
-        Searches for a value in a list variable and gets the index if found.
-    
-        :param Variable result: Variable to set
-        :param ArgValue list_to_search_in: List to search in
-        :param ArgValue value_to_search: Value to search
-        :param str search_order: Search Order
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetValueIndex', (result, list_to_search_in, value_to_search,), {'Search Order': search_order})
-
-    @staticmethod
-    def SetItemWeapon(result: Variable, item_to_change: Item | None=None, durability_reduction_per_attack: Number | None=None, seconds_to_disable_blocking_for: Number | None=None, ):
-        """
-        Adds weapon properties to an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param Number | None durability_reduction_per_attack: Durability reduction per attack (optional) (Default = 1)
-        :param Number | None seconds_to_disable_blocking_for: Seconds to disable blocking for (optional) (Default = 0)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetItemWeapon', (result, item_to_change, durability_reduction_per_attack, seconds_to_disable_blocking_for,), {})
-
-    @staticmethod
-    def RemItemEnchant(result: Variable, item_to_change: Item | None=None, enchantment_name: DFString=None, ):
-        """
-        Removes an enchantment from an item.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param DFString enchantment_name: Enchantment name
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemItemEnchant', (result, item_to_change, enchantment_name,), {})
-
-    @staticmethod
-    def AddItemLore(result: Variable, item_to_change: Item | None=None, lore_to_add: list[DFText] | DFText=None, ):
-        """
-        Adds lines to an item's lore.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[DFText] | DFText lore_to_add: Lore to add
-        
-        """
-        return CodeBlock.new_action('set_var', 'AddItemLore', (result, item_to_change, lore_to_add,), {})
-
-    @staticmethod
-    def GetConsumable(result: Variable, item: Item, consumable_property: Literal["Nutrition", "Saturation", "Use Duration", "Animation", "Sound"]="Nutrition", ):
-        """
-        Gets an item's consumable property.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get properties of
-        :param str consumable_property: Consumable Property
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetConsumable', (result, item,), {'Consumable Property': consumable_property})
-
-    @staticmethod
-    def SetParticleRoll(result: Variable, effect_to_change: Particle | None=None, particle_roll: Number=None, ):
-        """
-        Sets a particle effect's roll.
-    
-        :param Variable result: Variable to set
-        :param Particle | None effect_to_change: Effect to change (optional)
-        :param Number particle_roll: Particle roll
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetParticleRoll', (result, effect_to_change, particle_roll,), {})
-
-    @staticmethod
-    def SetSoundVariant(result: Variable, sound_to_change: Sound | None=None, variant_id: DFString | None=None, ):
-        """
-        Sets the variant of a sound.
-    
-        :param Variable result: Variable to set
-        :param Sound | None sound_to_change: Sound to change (optional)
-        :param DFString | None variant_id: Variant ID (e.g. "break1") (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetSoundVariant', (result, sound_to_change, variant_id,), {})
-
-    @staticmethod
-    def RandomizeList(result: Variable, list_to_randomize: ArgValue | None=None, ):
-        """
-        Randomizes the order of a list variable's values.
-    
-        :param Variable result: Variable to set
-        :param ArgValue | None list_to_randomize: List to randomize (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'RandomizeList', (result, list_to_randomize,), {})
-
-    @staticmethod
-    def HiddenComponents(result: Variable, item_to_change: Item | None=None, item_component_to_hide: list[DFString] | DFString | None=None, hiding_mode: Literal["Hide", "Show", "Hide all", "Show all", "Hide all except", "Show all except"]="Hide all", ):
-        """
-        Sets an item's components that should show up in its lore.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[DFString] | DFString | None item_component_to_hide: Item component(s) to hide (optional) (Item component keys, Example: "attribute_modifiers")
-        :param str hiding_mode: Hiding Mode
-        
-        """
-        return CodeBlock.new_action('set_var', 'HiddenComponents', (result, item_to_change, item_component_to_hide,), {'Hiding Mode': hiding_mode})
-
-    @staticmethod
-    def ClampNumber(result: Variable, number_to_clamp: Number | None=None, minimum: Number=None, maximum: Number=None, ):
-        """
-        Checks if a number is between a minimum and maximum value, and if not, sets it to the nearest.
-    
-        :param Variable result: Variable to set
-        :param Number | None number_to_clamp: Number to clamp (optional)
-        :param Number minimum: Minimum
-        :param Number maximum: Maximum
-        
-        """
-        return CodeBlock.new_action('set_var', 'ClampNumber', (result, number_to_clamp, minimum, maximum,), {})
-
-    @staticmethod
-    def GetItemModel(result: Variable, item: Item, ):
-        """
-        Gets an item's model.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get model of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemModel', (result, item,), {})
-
-    @staticmethod
-    def GetSoundPitch(result: Variable, sound: Sound, return_value_type: Literal["Pitch (number)", "Note (text)"]="Pitch (number)", ):
-        """
-        Gets a sound's pitch or note.
-    
-        :param Variable result: Variable to set
-        :param Sound sound: Sound to get pitch or note of
-        :param str return_value_type: Return Value Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetSoundPitch', (result, sound,), {'Return Value Type': return_value_type})
-
-    @staticmethod
-    def TranslateColors(result: Variable, string_to_translate: DFString | None=None, translation_type: Literal["From hex to color", "From & to color", "From color to &", "Strip color"]="From & to color", ):
-        """
-        Converts legacy color codes written in "&" or hex format to functional color codes, or vice versa.
-    
-        :param Variable result: Variable to set
-        :param DFString | None string_to_translate: String to translate (optional)
-        :param str translation_type: Translation Type
-    
-            - From hex to color: Replaces "#FF0000Example #AAFF55Text" with "Example Text"
-            - From & to color: Replaces "&9Example &3Text" with "Example Text"
-            - From color to &: Replaces "Example Text" with "&9Example &3Text"
-            - Strip color: Replaces "Example Text" with "Example Text"
-        
-        """
-        return CodeBlock.new_action('set_var', 'TranslateColors', (result, string_to_translate,), {'Translation Type': translation_type})
-
-    @staticmethod
-    def GetBlockGrowth(result: Variable, block_location: Location, growth_unit: Literal["Growth stage number", "Growth percentage"]="Growth stage number", ):
-        """
-        Gets a block's current growth at a location.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        :param str growth_unit: Growth Unit
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockGrowth', (result, block_location,), {'Growth Unit': growth_unit})
-
-    @staticmethod
-    def GetAllItemTags(result: Variable, item: Item, ):
-        """
-        Gets all tags registered on an item.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get tags of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetAllItemTags', (result, item,), {})
-
-    @staticmethod
-    def RemoveListValue(list_to_change: Variable, value_to_remove: list[ArgValue] | ArgValue, items_to_remove: Literal["All Matches", "First Match", "Last Match"]="All Matches", ):
-        """
-        Removes all matching values from a list variable.
-    
-        :param Variable list_to_change: List to change
-        :param list[ArgValue] | ArgValue value_to_remove: Value(s) to remove
-        :param str items_to_remove: Items to remove
-        
-        """
-        return CodeBlock.new_action('set_var', 'RemoveListValue', (list_to_change, value_to_remove,), {'Items to remove': items_to_remove})
-
-    @staticmethod
-    def BytesToString(result: Variable, byte_to_convert: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", charset: Literal["UTF-8", "ASCII"]="UTF-8", ):
-        """
-        Converts a list of numbers representing bytes to a string.
-    
-        :param Variable result: Variable to set
-        :param list[Number | int] | Number | int byte_to_convert: Byte(s) to convert
-        :param str signed: Signed
-        :param str charset: Charset
-        
-        """
-        return CodeBlock.new_action('set_var', 'BytesToString', (result, byte_to_convert,), {'Signed': signed, 'Charset': charset})
-
-    @staticmethod
-    def ShiftAllDirections(result: Variable, location_to_shift: Location | None=None, forwards_change: Number | None=None, upwards_change: Number | None=None, sideways_change: Number | None=None, ):
-        """
-        Shifts a location in multiple directions based on its rotation.
-    
-        :param Variable result: Variable to set
-        :param Location | None location_to_shift: Location to shift (optional)
-        :param Number | None forwards_change: Forwards change (optional)
-        :param Number | None upwards_change: Upwards change (optional)
-        :param Number | None sideways_change: Sideways change (-L / +R) (optional)
-        
-        """
-        return CodeBlock.new_action('set_var', 'ShiftAllDirections', (result, location_to_shift, forwards_change, upwards_change, sideways_change,), {})
-
-    @staticmethod
-    def ValueNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, dimensions: Literal["3D", "2D"]="3D", domain_fractal: Literal["Progressive", "Independent"]="Progressive", return_type: Literal["Value", "Cubic"]="Value", ):
-        """
-        Gets value noise: A type of noise based on a lattice of random values.
-    
-        :param Variable result: Variable to set
-        :param Location noise_location: Noise location
-        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
-        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
-        :param Number | None octaves: Octaves (optional) (Adds an additional layer of value noise to the output. 1-16, Default = 1)
-        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
-        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
-        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
-        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
-        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
-        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
-        :param Number | None generation_seed: Generation seed (optional)
-        :param str dimensions: Dimensions
-    
-            - 3D: Generates using the X, Y and Z axis.
-            - 2D: Generates using the X and Z axis only.
-        :param str domain_fractal: Domain Fractal
-    
-            - Progressive: Domains are calculated on top of one another.
-            - Independent: Domains are calculated in isolation.
-        :param str return_type: Return Type
-    
-            - Value: Provides the average of a lattice (grid) of random values.
-            - Cubic: Provides the bicubic average of a lattice of random values.  The use of bicubic averaging produces a smoother result than the averaging used in Value Noise.
-        
-        """
-        return CodeBlock.new_action('set_var', 'ValueNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Dimensions': dimensions, 'Domain Fractal': domain_fractal, 'Return Type': return_type})
-
-    @staticmethod
-    def WebResponse(variable_to_store_response: Variable, url_to_request: DFString, content_body: DFString | None=None, request_method: Literal["Post", "Get", "Put", "Delete"]="Post", content_type: Literal["text/plain", "application/json"]="text/plain", code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", ):
-        """
-        Gets the response from a web request.  The output dictionary has 3 keys: "status": The HTTP status code. "statusText": The HTTP status message. And "body", or "json" if the response is JSON.
-    
-        :param Variable variable_to_store_response: Variable to store response
-        :param DFString url_to_request: URL to request
-        :param DFString | None content_body: Content body (optional)
-        :param str request_method: Request Method
-        :param str content_type: Content Type
-        :param str code_flow: Code Flow
-    
-            - Synchronous: Waits for the response before continuing.
-            - Asynchronous: Continues running code immediately. Variable will be set when the response is received.
-        
-        """
-        return CodeBlock.new_action('set_var', 'WebResponse', (variable_to_store_response, url_to_request, content_body,), {'Request Method': request_method, 'Content Type': content_type, 'Code Flow': code_flow})
-
-    @staticmethod
-    def SetAllItemTags(result: Variable, item_to_change: Item | None=None, tags: ArgValue=None, ):
-        """
-        Sets custom tags on an item based on the input dictionary.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param ArgValue tags: Tags
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetAllItemTags', (result, item_to_change, tags,), {})
-
-    @staticmethod
-    def SetCanPlaceOn(result: Variable, item_to_change: Item | None=None, placeable_blocks: list[Item] | Item=None, ):
-        """
-        Sets which blocks an item can be placed on in Adventure Mode.
-    
-        :param Variable result: Variable to set
-        :param Item | None item_to_change: Item to change (optional)
-        :param list[Item] | Item placeable_blocks: Placeable blocks
-        
-        """
-        return CodeBlock.new_action('set_var', 'SetCanPlaceOn', (result, item_to_change, placeable_blocks,), {})
-
-    @staticmethod
-    def GetBlockType(result: Variable, block_location: Location, return_value_type: Literal["Block ID (oak_log)", "Block name (Oak Log)", "Item"]="Block ID (oak_log)", ):
-        """
-        Gets a block's material at a location.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        :param str return_value_type: Return Value Type
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockType', (result, block_location,), {'Return Value Type': return_value_type})
-
-    @staticmethod
-    def GetDictValue(result: Variable, dictionary_to_pull_from: ArgValue, key: DFString, ):
-        """
-        Get a dictionary variable's value for a key.
-    
-        :param Variable result: Variable to set
-        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
-        :param DFString key: Key
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetDictValue', (result, dictionary_to_pull_from, key,), {})
-
-    @staticmethod
-    def ContainerLock(result: Variable, container_location: Location, ):
-        """
-        Gets a container's lock key at a location.
-    
-        :param Variable result: Variable to set
-        :param Location container_location: Container location
-        
-        """
-        return CodeBlock.new_action('set_var', 'ContainerLock', (result, container_location,), {})
-
-    @staticmethod
-    def GetItemWeapon(result: Variable, item: Item, weapon_property: Literal["Durability reduction per attack", "Seconds to disable blocking for"]="Durability reduction per attack", ):
-        """
-        Gets an item's weapon property.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get property of
-        :param str weapon_property: Weapon Property
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetItemWeapon', (result, item,), {'Weapon Property': weapon_property})
-
-    @staticmethod
-    def GetBlockPower(result: Variable, block_location: Location, ):
-        """
-        Gets a block's redstone power level.
-    
-        :param Variable result: Variable to set
-        :param Location block_location: Block location
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetBlockPower', (result, block_location,), {})
-
-    @staticmethod
-    def GetVectorLength(result: Variable, vector: DFVector, length_type: Literal["Length", "Length Squared"]="Length", ):
-        """
-        Gets a vector's length.
-    
-        :param Variable result: Variable to set
-        :param DFVector vector: Vector to get length of
-        :param str length_type: Length Type
-    
-            - Length: √(x² + y² + z²)
-            - Length Squared: x² + y² + z²
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetVectorLength', (result, vector,), {'Length Type': length_type})
-
-    @staticmethod
-    def ContentLength(result: Variable, text_to_measure: DFText, ):
-        """
-        Gets the number of characters a styled text has, ignoring all formatting tags.
-    
-        :param Variable result: Variable to set
-        :param DFText text_to_measure: Text to measure
-        
-        """
-        return CodeBlock.new_action('set_var', 'ContentLength', (result, text_to_measure,), {})
-
-    @staticmethod
-    def StringToBytes(result: Variable, string_to_convert: DFString, signed: Literal["True", "False"]="True", charset: Literal["UTF-8", "ASCII"]="UTF-8", ):
-        """
-        Converts a string to a list of numbers representing bytes.
-    
-        :param Variable result: Variable to set
-        :param DFString string_to_convert: String to convert
-        :param str signed: Signed
-        :param str charset: Charset
-        
-        """
-        return CodeBlock.new_action('set_var', 'StringToBytes', (result, string_to_convert,), {'Signed': signed, 'Charset': charset})
-
-    @staticmethod
-    def GetMaxAmount(result: Variable, item: Item, ):
-        """
-        Gets an item's maximum stack size.
-    
-        :param Variable result: Variable to set
-        :param Item item: Item to get maximum stack size of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetMaxAmount', (result, item,), {})
-
-    @staticmethod
-    def GetParticleSize(result: Variable, effect: Particle, ):
-        """
-        Gets a particle effect's particle size.
-    
-        :param Variable result: Variable to set
-        :param Particle effect: Effect to get size of
-        
-        """
-        return CodeBlock.new_action('set_var', 'GetParticleSize', (result, effect,), {})
-
-SV = SetVariable
-class IfPlayer:
-    """
-    Used to execute the code inside it if a certain condition related to a player is met.
-    """
-
-    @staticmethod
-    def HasRoomForItem(item_to_check_with: Item | None=None, check_mode: Literal["Has Room for Any Item", "Has Room for All Items"]="Has Room for Any Item", checked_slots: Literal["Entire inventory", "Main inventory", "Upper inventory", "Hotbar", "Armor"]="Main inventory", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's inventory has room for one or more items to be given.
-    
-        :param Item | None item_to_check_with: Item(s) to check with OR Checks for empty slot
-        :param str check_mode: Check Mode
-        :param str checked_slots: Checked Slots
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'HasRoomForItem', (item_to_check_with,), {'Check Mode': check_mode, 'Checked Slots': checked_slots}, inverted, target), codeblocks)
-
-    @staticmethod
-    def NoItemCooldown(item_type_to_check: list[Item] | Item, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player does not have a cooldown applied to an item type.
-    
-        :param list[Item] | Item item_type_to_check: Item type(s) to check
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'NoItemCooldown', (item_type_to_check,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsUsingItem(item_to_check: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is currently using an item (eg. bow).
-    
-        :param list[Item] | Item | None item_to_check: Item(s) to check (optional) (Checks material only)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsUsingItem', (item_to_check,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasItem(item_to_check_for: list[Item] | Item, check_mode: Literal["Has Any Item", "Has All Items"]="Has Any Item", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player has an item in their inventory.
-    
-        :param list[Item] | Item item_to_check_for: Item(s) to check for
-        :param str check_mode: Check Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'HasItem', (item_to_check_for,), {'Check Mode': check_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsWearing(item_to_check_for: list[Item] | Item, check_mode: Literal["Is Wearing Some", "Is Wearing All"]="Is Wearing Some", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is wearing an item.
-    
-        :param list[Item] | Item item_to_check_for: Item(s) to check for
-        :param str check_mode: Check Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsWearing', (item_to_check_for,), {'Check Mode': check_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsNear(center_location: list[Location] | Location, radius: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is within a range of a location.
-    
-        :param list[Location] | Location center_location: Center location
-        :param Number | None radius: Radius (optional) (Default = 5 blocks)
-        :param str shape: Shape
-    
-            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
-            - Circle: Checks if √(X²+Z²) is within the radius.
-            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
-            - Square: Checks if the distance on the X or Z axis is within the radius.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsNear', (center_location, radius,), {'Shape': shape}, inverted, target), codeblocks)
-
-    @staticmethod
-    def CursorItem(items_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the item that is being moved with a player's cursor is the given item.
-    
-        :param list[Item] | Item | None items_to_check_for: Items(s) to check for (optional)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'CursorItem', (items_to_check_for,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def SlotEquals(slot_id_to_check: Number, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's currently selected hotbar slot equals the given slot ID.
-    
-        :param Number slot_id_to_check: Slot ID to check (1 (left) to 9 (right))
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'SlotEquals', (slot_id_to_check,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def MenuSlotEquals(slot_to_check: list[Number] | Number, item_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's currently open inventory menu contains an item in the given slot.
-    
-        :param list[Number] | Number slot_to_check: Slot(s) to check
-        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'MenuSlotEquals', (slot_to_check, item_to_check_for,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasPermission(permission: Literal["Owner", "Developer", "Builder", "Developer or builder", "Whitelisted"]="Developer or builder", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player has a certain level of access on this plot, such as builder or owner.
-    
-        :param str permission: Permission
-    
-            - Owner: Checks if the target is the plot owner.
-            - Developer: Checks if the target has dev perms.
-            - Builder: Checks if the target has build perms.
-            - Developer or builder: Checks if the target has dev or build perms.
-            - Whitelisted: Checks if the target is whitelisted on the plot.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'HasPermission', (), {'Permission': permission}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsRiding(spawn_egg_projectile_or_vehicle: list[Item | DFString] | Item | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is riding another entity.
-    
-        :param list[Item | DFString] | Item | DFString | None spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle OR Entity UUID OR Checks if riding any entity
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', ' IsRiding ', (spawn_egg_projectile_or_vehicle,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
-
-    @staticmethod
-    def MainHandEquals(main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's main hand is their left or right hand.
-    
-        :param str main_hand: Main Hand
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'MainHandEquals', (), {'Main Hand': main_hand}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsSneaking(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is sneaking.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSneaking', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def MovementKey(forward: Literal["Pressed", "Released", "Don't check"]="Don't check", backward: Literal["Pressed", "Released", "Don't check"]="Don't check", left: Literal["Pressed", "Released", "Don't check"]="Don't check", right: Literal["Pressed", "Released", "Don't check"]="Don't check", jump: Literal["Pressed", "Released", "Don't check"]="Don't check", sneak: Literal["Pressed", "Released", "Don't check"]="Don't check", sprint: Literal["Pressed", "Released", "Don't check"]="Don't check", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is holding a specific movement key.
-    
-        :param str forward: Forward (W)
-        :param str backward: Backward (S)
-        :param str left: Left (A)
-        :param str right: Right (D)
-        :param str jump: Jump (Space)
-        :param str sneak: Sneak (Left Shift)
-        :param str sprint: Sprint (Left Control)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'MovementKey', (), {'Forward (W)': forward, 'Backward (S)': backward, 'Left (A)': left, 'Right (D)': right, 'Jump (Space)': jump, 'Sneak (Left Shift)': sneak, 'Sprint (Left Control)': sprint}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsFlying(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is flying.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsFlying', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def InvOpen(inventory_type: Literal["Any Inventory", "Plot Menu", "Crafting Table", "Chest", "Double Chest", "Ender Chest", "Shulker Box", "Barrel", "Furnace (any)", "Furnace", "Blast Furnace", "Smoker", "Dropper", "Dispenser", "Beacon", "Hopper", "Anvil", "Brewing Stand", "Cartography Table", "Smithing Table", "Loom", "Grindstone", "Stonecutter", "Enchanting Table", "Trader Menu (any)", "Villager Menu", "Wandering Trader Menu", "Horse Inventory", "Llama Inventory"]="Any Inventory", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player has a certain inventory type open.
-    
-        :param str inventory_type: Inventory Type
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'InvOpen', (), {'Inventory Type': inventory_type}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasSlotItem(slot_to_check: list[Number] | Number, item_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player has an item in the given inventory slot.
-    
-        :param list[Number] | Number slot_to_check: Slot(s) to check
-        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'HasSlotItem', (slot_to_check, item_to_check_for,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsSprinting(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is sprinting or using the sprint key to swim.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSprinting', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsGliding(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is gliding with elytra.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsGliding', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsLookingAt(block_to_check_for: list[Item | Location] | Item | Location | None=None, maximum_distance_from_target_blocklocation: Number | None=None, fluid_mode: Literal["Ignore fluids", "Detect fluids"]="Ignore fluids", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is looking at the given block or location.
-    
-        :param list[Item | Location] | Item | Location | None block_to_check_for: Block to check for OR Location to check for (optional)
-        :param Number | None maximum_distance_from_target_blocklocation: Maximum distance from target block/location (optional) (This is distance from the player's selected block )
-        :param str fluid_mode: Fluid Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsLookingAt', (block_to_check_for, maximum_distance_from_target_blocklocation,), {'Fluid Mode': fluid_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def InWorldBorder(location_to_check: Location | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player (or a location) is within their world border.
-    
-        :param Location | None location_to_check: Location to check OR Checks player location
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'InWorldBorder', (location_to_check,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsInGameMode(game_mode: Literal["Survival", "Creative", "Adventure", "Spectator"]="Survival", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is in a specific game mode.
-    
-        :param str game_mode: Game Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsInGameMode', (), {'Game Mode': game_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def UsingPack(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is using a plot resource pack.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'UsingPack', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsSwimming(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is in water or lava.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSwimming', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def StandingOn(block_to_check_for: list[Item | Location] | Item | Location | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is standing on the given block or location.
-    
-        :param list[Item | Location] | Item | Location | None block_to_check_for: Block to check for OR Location to check for (optional)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', ' StandingOn ', (block_to_check_for,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsGrounded(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is supported by a block.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsGrounded', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def OwnsProduct(product_id: DFString, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player owns a plot product or is a developer or builder.
-    
-        :param DFString product_id: Product ID
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'OwnsProduct', (product_id,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsHolding(item_to_check_for: list[Item] | Item | None=None, hand_slot: Literal["Either hand", "Main hand", "Off hand"]="Either hand", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is holding an item in their hand.
-    
-        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
-        :param str hand_slot: Hand Slot
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsHolding', (item_to_check_for,), {'Hand Slot': hand_slot}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsBlocking(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player is blocking with a shield.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsBlocking', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsHitboxNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's hitbox is within a range of a location.
-    
-        :param list[Location] | Location center_location: Center location
-        :param Number | None range: Range (optional) (Default = 5 blocks)
-        :param str shape: Shape
-    
-            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
-            - Circle: Checks if √(X²+Z²) is within the radius.
-            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
-            - Square: Checks if the distance on the X or Z axis is within the radius.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'IsHitboxNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasPotion(effect_to_check_for: list[Potion] | Potion, check_properties: Literal["None", "Amplifier", "Duration", "Amplifier and duration"]="None", check_mode: Literal["Has any effect", "Has all effects"]="Has any effect", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player has a potion effect of the given type active.
-    
-        :param list[Potion] | Potion effect_to_check_for: Effect(s) to check for
-        :param str check_properties: Check Properties
-    
-            - None: Checks only if the effect type matches.
-            - Amplifier: The amplifier of the player's effect must be equal or higher.
-            - Duration: The duration of the player's effect must be equal or higher.
-            - Amplifier and duration: The amplifier and duration of the player's effect must be equal or higher.
-        :param str check_mode: Check Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'HasPotion', (effect_to_check_for,), {'Check Properties': check_properties, 'Check Mode': check_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def NameEquals(name_to_check_for: list[DFString] | DFString, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player's username is equal to one of the given usernames (case insensitive).
-    
-        :param list[DFString] | DFString name_to_check_for: Name(s) to check for
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'NameEquals', (name_to_check_for,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def CanFly(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a player can fly.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_player', 'CanFly', (), {}, inverted, target), codeblocks)
-
-IP = IfPlayer
-class IfEntity:
-    """
-    Used to execute the code inside it if a certain condition related to an entity or multiple entities is met.
-    """
-
-    @staticmethod
-    def IsVehicle(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is a boat or minecart.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsVehicle', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsGrounded(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is supported by a block.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsGrounded', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsType(spawn_egg_projectile_or_vehicle: list[Item] | Item, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is the given type.
-    
-        :param list[Item] | Item spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsType', (spawn_egg_projectile_or_vehicle,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsProj(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is a projectile.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsProj', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsMob(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is a mob.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsMob', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasCustomTag(tag_name: DFString, tag_value: Number | DFString | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity has a given custom tag, and (if provided) whether the tag matches the given value.
-    
-        :param DFString tag_name: Tag name
-        :param Number | DFString | None tag_value: Tag value OR Tag value (optional)
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'HasCustomTag', (tag_name, tag_value,), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsSheared(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a sheep is sheared.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsSheared', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsItem(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is an item.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsItem', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsRiding(spawn_egg_projectile_or_vehicle: list[Item | DFString] | Item | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is riding another entity.
-    
-        :param list[Item | DFString] | Item | DFString | None spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle OR Entity UUID OR Checks if riding any entity
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', ' IsRiding ', (spawn_egg_projectile_or_vehicle,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
-
-    @staticmethod
-    def Exists(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity still exists in the world.
-    
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'Exists', (), {}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsHitboxNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity's hitbox is within a range of a location.
-    
-        :param list[Location] | Location center_location: Center location
-        :param Number | None range: Range (optional) (Default = 5 blocks)
-        :param str shape: Shape
-    
-            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
-            - Circle: Checks if √(X²+Z²) is within the radius.
-            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
-            - Square: Checks if the distance on the X or Z axis is within the radius.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsHitboxNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
-
-    @staticmethod
-    def IsNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is within a range of a location.
-    
-        :param list[Location] | Location center_location: Center location
-        :param Number | None range: Range (optional) (Default = 5 blocks)
-        :param str shape: Shape
-    
-            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
-            - Circle: Checks if √(X²+Z²) is within the radius.
-            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
-            - Square: Checks if the distance on the X or Z axis is within the radius.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
-
-    @staticmethod
-    def HasPotion(effect_to_check_for: list[Potion] | Potion, check_properties: Literal["None", "Amplifier", "Duration", "Amplifier and duration"]="None", check_mode: Literal["Has any effect", "Has all effects"]="Has any effect", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity has a potion effect of a certain type active.
-    
-        :param list[Potion] | Potion effect_to_check_for: Effect(s) to check for
-        :param str check_properties: Check Properties
-    
-            - None: Checks only if the effect type matches.
-            - Amplifier: The amplifier of the entity's effect must be equal or higher.
-            - Duration: The duration of the entity's effect must be equal or higher.
-            - Amplifier and duration: The amplifier and duration of the entity's effect must be equal or higher.
-        :param str check_mode: Check Mode
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'HasPotion', (effect_to_check_for,), {'Check Properties': check_properties, 'Check Mode': check_mode}, inverted, target), codeblocks)
-
-    @staticmethod
-    def NameEquals(uuid_to_check_for: list[DFString] | DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity's name or custom name is equal to the given text.
-    
-        :param list[DFString] | DFString uuid_to_check_for: UUID to check for
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', 'NameEquals', (uuid_to_check_for,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
-
-    @staticmethod
-    def StandingOn(block_to_check_for: list[Item | Location] | Item | Location, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an entity is standing on the given block or location.
-    
-        :param list[Item | Location] | Item | Location block_to_check_for: Block to check for OR Location to check for
-        :param Target target: The target for the condition.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_entity', ' StandingOn ', (block_to_check_for,), {}, inverted, target), codeblocks)
-
-IE = IfEntity
-class IfGame:
-    """
-    Used to execute the code inside it if a certain condition related to the plot is met.
-    """
-
-    @staticmethod
-    def HasRoomForItem(container_location: Location, item_to_check_with: Item | None=None, check_mode: Literal["Has Room for Any Item", "Has Room for All Items"]="Has Room for Any Item", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the container at a location has room for one or more items to be given.
-    
-        :param Location container_location: Container location
-        :param Item | None item_to_check_with: Item(s) to check with OR Checks for empty slot
-        :param str check_mode: Check Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'HasRoomForItem', (container_location, item_to_check_with,), {'Check Mode': check_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def EventBlockEquals(block_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the block in a block related event is the given block.
-    
-        :param list[Item] | Item block_to_check_for: Block(s) to check for
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'EventBlockEquals', (block_to_check_for,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def CommandEquals(string_to_check_for: list[DFString] | DFString, check_mode: Literal["Check entire command", "Check beginning"]="Check entire command", ignore_case: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the command entered in the Command Event is equal to the given string.
-    
-        :param list[DFString] | DFString string_to_check_for: String(s) to check for
-        :param str check_mode: Check Mode
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'CommandEquals', (string_to_check_for,), {'Check Mode': check_mode, 'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def EventItemEquals(item_to_check_for: list[Item] | Item, comparison_mode: Literal["Exactly equals", "Ignore stack size/durability", "Material only"]="Ignore stack size/durability", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the item in a item related event is the given item.
-    
-        :param list[Item] | Item item_to_check_for: Item(s) to check for
-        :param str comparison_mode: Comparison Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'EventItemEquals', (item_to_check_for,), {'Comparison Mode': comparison_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def SignHasTxt(sign_location: Location, text_to_check_for: list[DFText] | DFText, sign_line: Literal["1", "2", "3", "4", "All lines"]="All lines", sign_side: Literal["Front", "Back"]="Front", check_mode: Literal["Contains", "Equals"]="Contains", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the sign at a location has the given text.
-    
-        :param Location sign_location: Sign location
-        :param list[DFText] | DFText text_to_check_for: Text to check for (Formatting is ignored.)
-        :param str sign_line: Sign Line
-        :param str sign_side: Sign Side
-        :param str check_mode: Check Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', ' SignHasTxt ', (sign_location, text_to_check_for,), {'Sign Line': sign_line, 'Sign Side': sign_side, 'Check Mode': check_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def AttackIsCrit(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an event attack is critical.
-    
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'AttackIsCrit', (), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ContainerHas(container_location: Location, item_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the container at a location has the given item.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_check_for: Item(s) to check for
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'ContainerHas', (container_location, item_to_check_for,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def EventChunkNew(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the chunk being loaded in this event is a new chunk.
-    
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'EventChunkNew', (), {}, inverted), codeblocks)
-
-    @staticmethod
-    def BlockEquals(check_location: Location, block_to_check_for: list[Item] | Item | None=None, block_data: list[DFString] | DFString | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the block at a location is the given block.
-    
-        :param Location check_location: Check location
-        :param list[Item] | Item | None block_to_check_for: Block(s) to check for (optional)
-        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up")
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'BlockEquals', (check_location, block_to_check_for, block_data,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def InBlock(check_location: Location, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a location collides with the hitbox of the nearest block.
-    
-        :param Location check_location: Check location
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'InBlock', (check_location,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def MovementKey(movement_key: Literal["Forward (W)", "Backward (S)", "Left (A)", "Right (D)", "Jump (Space)", "Sneak (Left Shift)", "Sprint (Left Control)"]="Forward (W)", action: Literal["Just pressed", "Just released"]="Just pressed", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if specific movement keys changed state in the current event.
-    
-        :param str movement_key: Movement Key
-        :param str action: Action
-    
-            - Just pressed: The key was just pressed in this event call.
-            - Just released: The key was just released in this event call.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'MovementKey', (), {'Movement Key': movement_key, 'Action': action}, inverted), codeblocks)
-
-    @staticmethod
-    def BlockPowered(check_location: list[Location] | Location, redstone_power_mode: Literal["Direct power", "Indirect power"]="Direct power", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the block at a location is powered by redstone.
-    
-        :param list[Location] | Location check_location: Check location(s)
-        :param str redstone_power_mode: Redstone Power Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'BlockPowered', (check_location,), {'Redstone Power Mode': redstone_power_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def HasPlayer(name_or_uuid: list[DFString] | DFString, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if there is currently a player in the game with the given name or UUID.
-    
-        :param list[DFString] | DFString name_or_uuid: Name or UUID
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'HasPlayer', (name_or_uuid,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ContainerHasAll(container_location: Location, item_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the container at a location has all of the given items.
-    
-        :param Location container_location: Container location
-        :param list[Item] | Item item_to_check_for: Item(s) to check for
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'ContainerHasAll', (container_location, item_to_check_for,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def CmdArgEquals(string_to_check_for: list[DFString] | DFString, argument_number: Number, ignore_case: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a part of the command entered in the Command Event is equal to the given string.
-    
-        :param list[DFString] | DFString string_to_check_for: String(s) to check for
-        :param Number argument_number: Argument number
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'CmdArgEquals', (string_to_check_for, argument_number,), {'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def EventCancelled(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the current event is cancelled.
-    
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'EventCancelled', (), {}, inverted), codeblocks)
-
-    @staticmethod
-    def IsChunkLoaded(location_in_chunk: Location, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the chunk at a location is currently loaded.
-    
-        :param Location location_in_chunk: Location in chunk
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_game', 'IsChunkLoaded', (location_in_chunk,), {}, inverted), codeblocks)
-
-IG = IfGame
-class IfVariable:
-    """
-    Used to execute the code inside it if a certain condition related to the value of a variable is met.
-    """
-
-    @staticmethod
-    def LessEqual(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a number value is less than or equal to another number.
-    
-        :param Number number_to_check: Number to check
-        :param Number number_to_compare_to: Number to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '<=', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ItemHasEnchant(item_to_check: Item, enchantment: DFString | None=None, level: Number | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an item has a given enchantment, or, if no enchantment is specified, checks if it has any.
-    
-        :param Item item_to_check: Item to check
-        :param DFString | None enchantment: Enchantment (optional)
-        :param Number | None level: Level (optional)
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemHasEnchant', (item_to_check, enchantment, level,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ItemIsBlock(item_to_check: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an item is able to be placed.
-    
-        :param Item item_to_check: Item to check
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemIsBlock', (item_to_check,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def DictValueEquals(dictionary_to_check: ArgValue, key_to_check: DFString, values_to_compare_with: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a dictionary's value for the given key is equal to any of the given values.
-    
-        :param ArgValue dictionary_to_check: Dictionary to check
-        :param DFString key_to_check: Key to check
-        :param list[ArgValue] | ArgValue values_to_compare_with: Values to compare with
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'DictValueEquals', (dictionary_to_check, key_to_check, values_to_compare_with,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ItemHasTag(item_to_check: Item, tag_name: DFString, tag_value: Number | DFString | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an item has a given custom tag, and (if provided) whether the tag matches the given value.
-    
-        :param Item item_to_check: Item to check
-        :param DFString tag_name: Tag name
-        :param Number | DFString | None tag_value: Tag value OR Tag value (optional)
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemHasTag', (item_to_check, tag_name, tag_value,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ListSizeEquals(list_to_check: ArgValue, size_to_compare: Number | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a list is of a given size.
-    
-        :param ArgValue list_to_check: List to check
-        :param Number | None size_to_compare: Size to compare (optional) (Default = 0)
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ListSizeEquals', (list_to_check, size_to_compare,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def StringMatches(string_or_source_expression_to_match: DFString, string_to_compare: list[DFString] | DFString, regular_expressions: Literal["Enable", "Disable"]="Disable", ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a string value matches other values.
-    
-        :param DFString string_or_source_expression_to_match: String or source expression to match
-        :param list[DFString] | DFString string_to_compare: String to compare
-        :param str regular_expressions: Regular Expressions
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'StringMatches', (string_or_source_expression_to_match, string_to_compare,), {'Regular Expressions': regular_expressions, 'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def IsFiltered(string_to_check: DFString, link_filter: Literal["True", "False"]="True", swear_filter: Literal["True", "False"]="True", caps_filter: Literal["True", "False"]="True", character_spacing_filter: Literal["True", "False"]="True", character_drag_filter: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the input string would be filtered by the selected chat filters.
-    
-        :param DFString string_to_check: String to check
-        :param str link_filter: Link Filter
-        :param str swear_filter: Swear Filter
-        :param str caps_filter: Caps Filter
-        :param str character_spacing_filter: Character Spacing Filter
-        :param str character_drag_filter: Character Drag Filter
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'IsFiltered', (string_to_check,), {'Link Filter': link_filter, 'Swear Filter': swear_filter, 'Caps Filter': caps_filter, 'Character Spacing Filter': character_spacing_filter, 'Character Drag Filter': character_drag_filter}, inverted), codeblocks)
-
-    @staticmethod
-    def StartsWith(string_to_check: DFString, string_to_start_with: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the first part of a string value matches a certain string.
-    
-        :param DFString string_to_check: String to check
-        :param list[DFString] | DFString string_to_start_with: String to start with
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'StartsWith', (string_to_check, string_to_start_with,), {'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def ListValueEq(list_to_check_in: ArgValue, index_to_check_at: Number, variable_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a list's value at an index is equal to a value.
-    
-        :param ArgValue list_to_check_in: List to check in
-        :param Number index_to_check_at: Index to check at
-        :param list[ArgValue] | ArgValue variable_to_compare_to: Variable to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ListValueEq', (list_to_check_in, index_to_check_at, variable_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def VarIsType(value_to_check: ArgValue, variable_type: Literal["Number", "String", "Styled Text", "Location", "Item", "List", "Potion effect", "Sound", "Particle", "Vector", "Dictionary"]="Number", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a value is of a certain type.
-    
-        :param ArgValue value_to_check: Value to check
-        :param str variable_type: Variable Type
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'VarIsType', (value_to_check,), {'Variable Type': variable_type}, inverted), codeblocks)
-
-    @staticmethod
-    def InRange(check_value: ArgValue, minimum_value: ArgValue, maximum_value: ArgValue, location_handling: Literal["Block", "Exact"]="Exact", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a number value is in between 2 other numbers or a location value is within the region of 2 other locations.
-    
-        :param ArgValue check_value: Check value
-        :param ArgValue minimum_value: Minimum value
-        :param ArgValue maximum_value: Maximum value
-        :param str location_handling: Location Handling
-    
-            - Block: Block locations are compared. Does not affect number ranges.
-            - Exact: Exact decimal locations are compared. Does not affect number ranges.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', ' InRange ', (check_value, minimum_value, maximum_value,), {'Location Handling': location_handling}, inverted), codeblocks)
-
-    @staticmethod
-    def ValueIsEmpty(string_to_check_if_empty: DFString | DFText | ArgValue | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a value is empty.
-    
-        :param DFString | DFText | ArgValue | Item string_to_check_if_empty: String to check if empty OR Text to compare content length to 0 OR List to compare size to 0 OR Dictionary to compare size to 0 OR Item to compare to air
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ValueIsEmpty', (string_to_check_if_empty,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def VarExists(variable_to_check: Variable, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a variable exists.
-    
-        :param Variable variable_to_check: Variable to check
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'VarExists', (variable_to_check,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def DictHasKeys(dictionary_to_check: ArgValue, key_to_look_for: list[DFString] | DFString, check_mode: Literal["Has Any Key", "Has All Keys"]="Has Any Key", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a dictionary has the given keys.
-    
-        :param ArgValue dictionary_to_check: Dictionary to check
-        :param list[DFString] | DFString key_to_look_for: Key(s) to look for
-        :param str check_mode: Check Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'DictHasKeys', (dictionary_to_check, key_to_look_for,), {'Check Mode': check_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def BlockIsSolid(block_to_check_for: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a material will collide with entities.
-    
-        :param Item block_to_check_for: Block to check for
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'BlockIsSolid', (block_to_check_for,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def ItemEquals(item_to_check: Item, item_to_compare_to: list[Item] | Item | None=None, comparison_mode: Literal["Exactly equals", "Ignore stack size", "Ignore durability and stack size", "Material only"]="Exactly equals", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Works the same as Value = but has a few extra options for item comparison.
-    
-        :param Item item_to_check: Item to check
-        :param list[Item] | Item | None item_to_compare_to: Item(s) to compare to (optional)
-        :param str comparison_mode: Comparison Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemEquals', (item_to_check, item_to_compare_to,), {'Comparison Mode': comparison_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def ListContains(list_to_check_in: ArgValue, value_to_find: list[ArgValue] | ArgValue, check_mode: Literal["Has Any Value", "Has All Values"]="Has Any Value", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if any of a list's contents match the given value.
-    
-        :param ArgValue list_to_check_in: List to check in
-        :param list[ArgValue] | ArgValue value_to_find: Value to find
-        :param str check_mode: Check Mode
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ListContains', (list_to_check_in, value_to_find,), {'Check Mode': check_mode}, inverted), codeblocks)
-
-    @staticmethod
-    def LocIsNear(location_to_check: Location, location_to_compare_to: list[Location] | Location, radius: Number, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a location is near another location.
-    
-        :param Location location_to_check: Location to check
-        :param list[Location] | Location location_to_compare_to: Location(s) to compare to
-        :param Number radius: Radius
-        :param str shape: Shape
-    
-            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
-            - Circle: Checks if √(X²+Z²) is within the radius.
-            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
-            - Square: Checks if the distance on the X or Z axis is within the radius.
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'LocIsNear', (location_to_check, location_to_compare_to, radius,), {'Shape': shape}, inverted), codeblocks)
-
-    @staticmethod
-    def ItemIsUnbreakable(item_to_check: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if an item is unbreakable.
-    
-        :param Item item_to_check: Item to check
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemIsUnbreakable', (item_to_check,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def Contains(string_to_check: DFString, string_to_check_for: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a string value contains another string.
-    
-        :param DFString string_to_check: String to check
-        :param list[DFString] | DFString string_to_check_for: String to check for
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'Contains', (string_to_check, string_to_check_for,), {'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def NotEqual(value_to_check: ArgValue, values_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a value does not equal another value.
-    
-        :param ArgValue value_to_check: Value to check
-        :param list[ArgValue] | ArgValue values_to_compare_to: Values to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '!=', (value_to_check, values_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def LessThan(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a number value is less than another number.
-    
-        :param Number number_to_check: Number to check
-        :param Number number_to_compare_to: Number to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '<', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def Equals(value_to_check: ArgValue, values_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a value is equal to one of the given values.
-    
-        :param ArgValue value_to_check: Value to check
-        :param list[ArgValue] | ArgValue values_to_compare_to: Values to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '=', (value_to_check, values_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def GreaterThan(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a number value is greater than another number.
-    
-        :param Number number_to_check: Number to check
-        :param Number number_to_compare_to: Number to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '>', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def EndsWith(string_to_check: DFString, string_to_end_with: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if the last part of a string value matches a certain string.
-    
-        :param DFString string_to_check: String to check
-        :param list[DFString] | DFString string_to_end_with: String to end with
-        :param str ignore_case: Ignore Case
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'EndsWith', (string_to_check, string_to_end_with,), {'Ignore Case': ignore_case}, inverted), codeblocks)
-
-    @staticmethod
-    def GreaterEqual(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a number value is greater than or equal to another number.
-    
-        :param Number number_to_check: Number to check
-        :param Number number_to_compare_to: Number to compare to
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', '>=', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
-
-    @staticmethod
-    def DictHasKey(dictionary_to_check: ArgValue, key_to_look_for: DFString, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Checks if a dictionary has the given key.
-    
-        :param ArgValue dictionary_to_check: Dictionary to check
-        :param DFString key_to_look_for: Key to look for
-        :param bool inverted: Whether the condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_conditional('if_var', 'DictHasKey', (dictionary_to_check, key_to_look_for,), {}, inverted), codeblocks)
-
-IV = IfVariable
-class Repeat:
-    """
-    Used to repeat the code inside it.
-    """
-
-    @staticmethod
-    def Adjacent(block_location_var: Variable, center_block: Location, change_location_rotation: Literal["True", "False"]="False", include_origin_block: Literal["True", "False"]="False", pattern: Literal["Cardinal (4 blocks)", "Square (8 blocks)", "Adjacent (6 blocks)", "Cube (26 blocks)"]="Adjacent (6 blocks)", codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for each block adjacent to a location.
-    
-        :param Variable block_location_var: Gets the current block location each iteration
-        :param Location center_block: Center block
-        :param str change_location_rotation: Change Location Rotation
-        :param str include_origin_block: Include Origin Block
-        :param str pattern: Pattern
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Adjacent', (block_location_var, center_block,), {'Change Location Rotation': change_location_rotation, 'Include Origin Block': include_origin_block, 'Pattern': pattern}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Path(path_location_var: Variable, path_locations: list[Location] | Location, point_spacing: Number | None=None, rotate_location: Literal["True", "False"]="False", codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for each interpolated point in a path of locations.
-    
-        :param Variable path_location_var: Gets the current path location each iteration
-        :param list[Location] | Location path_locations: Path locations
-        :param Number | None point_spacing: Point spacing (optional) (Default = 0.5 blocks)
-        :param str rotate_location: Rotate Location
-    
-            - True: Sets the rotation of each returned location to face the next given path point.
-            - False: Keeps the rotation of the given path points.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Path', (path_location_var, path_locations, point_spacing,), {'Rotate Location': rotate_location}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Multiple(index_var: Variable | None=None, amount: Number=None, codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code multiple times.
-    
-        :param Variable | None index_var: Gets the current index each iteration (optional)
-        :param Number amount: Amount
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Multiple', (index_var, amount,), {}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Grid(block_location_var: Variable, start_of_region: Location, end_of_region: Location, codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for each block in a region in order: X → Z → Y. Iterates from the first to the second location.
-    
-        :param Variable block_location_var: Gets the current block location each iteration
-        :param Location start_of_region: Start of region
-        :param Location end_of_region: End of region
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Grid', (block_location_var, start_of_region, end_of_region,), {}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def DoWhile(codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code as long as a condition is true. The condition is evaluated at the end of each loop iteration.
-    
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'DoWhile', (), {}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def While(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code as long as a condition is true. The condition is evaluated before each loop iteration.
-    
-        :param tuple[ArgValue, ...] args: The argument items to include.
-        :param dict[str, str] tags: The tags to include.
-        :param str|None sub_action: The sub-action for the repeat action
-        :param bool inverted: Whether the sub-action condition should be inverted.
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'While', args, tags, sub_action, inverted), codeblocks, 'repeat')
-
-    @staticmethod
-    def ForEach(value_var: Variable, list_to_repeat_through: ArgValue, allow_list_changes: Literal["True", "False (copy list)"]="True", codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for each index of a list.
-    
-        :param Variable value_var: Gets the current value each iteration
-        :param ArgValue list_to_repeat_through: List to repeat through
-        :param str allow_list_changes: Allow List Changes
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'ForEach', (value_var, list_to_repeat_through,), {'Allow List Changes': allow_list_changes}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Sphere(sphere_location_var: Variable, sphere_center: Location, sphere_radius: Number, sphere_points: Number | None=None, point_locations_inwards: Literal["True", "False"]="False", codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for every evenly distributed sphere point.
-    
-        :param Variable sphere_location_var: Gets the current sphere location each iteration
-        :param Location sphere_center: Sphere center
-        :param Number sphere_radius: Sphere radius
-        :param Number | None sphere_points: Sphere points (optional)
-        :param str point_locations_inwards: Point Locations Inwards
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Sphere', (sphere_location_var, sphere_center, sphere_radius, sphere_points,), {'Point Locations Inwards': point_locations_inwards}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Forever(codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code indefinitely.
-    
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Forever', (), {}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def Range(number_var: Variable | None=None, start_of_range: Number=None, end_of_range: Number=None, step: Number | None=None, codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once for each number on a number line.
-    
-        :param Variable | None number_var: Gets the current number each iteration (optional)
-        :param Number start_of_range: Start of range
-        :param Number end_of_range: End of range
-        :param Number | None step: Step (optional) (Default = 1)
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', ' Range ', (number_var, start_of_range, end_of_range, step,), {}, None, False), codeblocks, 'repeat')
-
-    @staticmethod
-    def ForEachEntry(key_var: Variable, value_var: Variable, dictionary_to_repeat_through: ArgValue, codeblocks: list[CodeBlock]=[]):
-        """
-        Repeats code once per entry in a dictionary
-    
-        :param Variable key_var: Gets the current key each iteration
-        :param Variable value_var: Gets the current value each iteration
-        :param ArgValue dictionary_to_repeat_through: Dictionary to repeat through
-        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
-        """
-        return add_brackets(CodeBlock.new_subaction_block('repeat', 'ForEachEntry', (key_var, value_var, dictionary_to_repeat_through,), {}, None, False), codeblocks, 'repeat')
-
-class SelectObject:
-    """
-    Used to change the selection on the current line of code, which will affect the targets of most code blocks.
-    """
-
-    @staticmethod
-    def RandomPlayer(selection_size: Number | None=None, ):
-        """
-        Creates a selection using one or more random players in the game.
-    
-        :param Number | None selection_size: Selection size (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('select_obj', 'RandomPlayer', (selection_size,), {})
-
-    @staticmethod
-    def LastEntity():
-        """
-        Creates a selection using the most recently spawned entity.
-    
-        
-        """
-        return CodeBlock.new_action('select_obj', 'LastEntity', (), {})
-
-    @staticmethod
-    def EntityName(uuid_to_check_for: list[DFString | DFText] | DFString | DFText, ignore_formatting: Literal["True", "False"]="True", ):
-        """
-        Creates a selection using all entities in the game whose name or UUID matches.
-    
-        :param list[DFString | DFText] | DFString | DFText uuid_to_check_for: UUID to check for OR Name to check for
-        :param str ignore_formatting: Ignore Formatting
-    
-            - True: Color codes and style tags are ignored when matching an entity by its name.
-            - False: All color codes and style tags in the entity's name must match exactly.
-        
-        """
-        return CodeBlock.new_action('select_obj', 'EntityName', (uuid_to_check_for,), {'Ignore Formatting': ignore_formatting})
-
-    @staticmethod
-    def FilterRandom(selection_size: Number | None=None, ):
-        """
-        Filters the selection by randomly picking one or more objects from it.
-    
-        :param Number | None selection_size: Selection size (optional) (Default = 1)
-        
-        """
-        return CodeBlock.new_action('select_obj', 'FilterRandom', (selection_size,), {})
-
-    @staticmethod
-    def EntityUUID(uuid_to_check_for: list[DFString] | DFString, ):
-        """
-        Creates a selection of all entities in the game with the given UUIDs.
-    
-        :param list[DFString] | DFString uuid_to_check_for: UUID(s) to check for
-        
-        """
-        return CodeBlock.new_action('select_obj', 'EntityUUID', (uuid_to_check_for,), {})
-
-    @staticmethod
-    def PlayerName(name_or_uuid: list[DFString] | DFString, ):
-        """
-        Creates a selection using all players in the game whose name or UUID matches.
-    
-        :param list[DFString] | DFString name_or_uuid: Name or UUID
-        
-        """
-        return CodeBlock.new_action('select_obj', 'PlayerName', (name_or_uuid,), {})
-
-    @staticmethod
-    def AllEntities():
-        """
-        Creates a selection of all entities in the game.
-    
-        
-        """
-        return CodeBlock.new_action('select_obj', 'AllEntities', (), {})
-
-    @staticmethod
-    def FilterDistance(location_to_compare_to: Location, selection_size: Number | None=None, ignore_yaxis: Literal["True", "False"]="False", compare_mode: Literal["Nearest", "Farthest"]="Nearest", ):
-        """
-        Filters the selection to the objects that are nearest or farthest to a location.
-    
-        :param Location location_to_compare_to: Location to compare to
-        :param Number | None selection_size: Selection size (optional) (Default = 1)
-        :param str ignore_yaxis: Ignore Y-Axis
-        :param str compare_mode: Compare Mode
-        
-        """
-        return CodeBlock.new_action('select_obj', 'FilterDistance', (location_to_compare_to, selection_size,), {'Ignore Y-Axis': ignore_yaxis, 'Compare Mode': compare_mode})
-
-    @staticmethod
-    def FilterRay(gets_the_end_or_final_hit_location: Variable | None=None, ray_origin: Location=None, ray_distance: Number=None, ray_width: Number | None=None, selection_size: Number | None=None, block_collision: Literal["All blocks", "Non-fluid blocks", "Solid blocks", "None"]="Solid blocks", ):
-        """
-        Filters the selected objects to the objects that intersect a ray.
-    
-        :param Variable | None gets_the_end_or_final_hit_location: Gets the end or final hit location (optional)
-        :param Location ray_origin: Ray origin
-        :param Number ray_distance: Ray distance
-        :param Number | None ray_width: Ray width (optional) (Default = 0.0)
-        :param Number | None selection_size: Selection size (optional) (Default = 1)
-        :param str block_collision: Block Collision
-    
-            - All blocks: Passes through air only.
-            - Non-fluid blocks: Passes through fluids (water and lava).
-            - Solid blocks: Passes through non-solid blocks such as tall grass, and through fluids.
-            - None: Passes through all blocks.
-        
-        """
-        return CodeBlock.new_action('select_obj', 'FilterRay', (gets_the_end_or_final_hit_location, ray_origin, ray_distance, ray_width, selection_size,), {'Block Collision': block_collision})
-
-    @staticmethod
-    def Reset():
-        """
-        Deactivates the selection. Code that follows will run normally with event targets.
-    
-        
-        """
-        return CodeBlock.new_action('select_obj', 'Reset', (), {})
-
-    @staticmethod
-    def EventTarget(event_target: Literal["Default", "Killer", "Damager", "Victim", "Shooter", "Projectile"]="Default", ):
-        """
-        Creates a selection using a target involved in this Event.
-    
-        :param str event_target: Event Target
-    
-            - Default: The target that triggered this event.
-            - Killer: The target that killed the victim in this event.
-            - Damager: The target that harmed the victim in this event.
-            - Victim: The target that was harmed or killed in this event.
-            - Shooter: The target that fired a projectile in this event.
-            - Projectile: The projectile in this event.
-        
-        """
-        return CodeBlock.new_action('select_obj', 'EventTarget', (), {'Event Target': event_target})
-
-    @staticmethod
-    def EntitiesCond(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
-        """
-        Creates a selection of all entities in the game that meet a condition.
-    
-        :param tuple[ArgValue, ...] args: The argument items to include.
-        :param dict[str, str] tags: The tags to include.
-        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
-        :param bool inverted: Whether the sub-action condition should be inverted.
-        """
-        return CodeBlock.new_subaction_block('select_obj', 'EntitiesCond', args, tags, sub_action, inverted) 
-
-    @staticmethod
-    def AllPlayers():
-        """
-        Creates a selection of all players in the game.
-    
-        
-        """
-        return CodeBlock.new_action('select_obj', 'AllPlayers', (), {})
-
-    @staticmethod
-    def Invert():
-        """
-        Creates a new selection by inverting the selection that is currently active.
-    
-        
-        """
-        return CodeBlock.new_action('select_obj', 'Invert', (), {})
-
-    @staticmethod
-    def FilterCondition(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
-        """
-        Filters the selection to the objects that meet a certain condition.
-    
-        :param tuple[ArgValue, ...] args: The argument items to include.
-        :param dict[str, str] tags: The tags to include.
-        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
-        :param bool inverted: Whether the sub-action condition should be inverted.
-        """
-        return CodeBlock.new_subaction_block('select_obj', 'FilterCondition', args, tags, sub_action, inverted) 
-
-    @staticmethod
-    def FilterSort(value_to_compare: ArgValue, selection_size: Number | None=None, sort_order: Literal["Ascending", "Descending"]="Ascending", ):
-        """
-        Filters the selection by sorting the value of each object in order.
-    
-        :param ArgValue value_to_compare: Value to compare
-        :param Number | None selection_size: Selection size (optional) (Default = 1)
-        :param str sort_order: Sort Order
-        
-        """
-        return CodeBlock.new_action('select_obj', 'FilterSort', (value_to_compare, selection_size,), {'Sort Order': sort_order})
-
-    @staticmethod
-    def PlayersCond(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
-        """
-        Creates a selection of all players in the game that meet a condition.
-    
-        :param tuple[ArgValue, ...] args: The argument items to include.
-        :param dict[str, str] tags: The tags to include.
-        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
-        :param bool inverted: Whether the sub-action condition should be inverted.
-        """
-        return CodeBlock.new_subaction_block('select_obj', 'PlayersCond', args, tags, sub_action, inverted) 
-
-SO = SelectObject
-class Control:
-    """
-    Used to control the execution of some or all code blocks after it.
-    """
-
-    @staticmethod
-    def StopRepeat():
-        """
-        Stops a Repeat sequence and continues to the next code block.
-    
-        
-        """
-        return CodeBlock.new_action('control', 'StopRepeat', (), {})
-
-    @staticmethod
-    def Return():
-        """
-        Skips the rest of a Function sequence and returns to the block it was called from.
-    
-        
-        """
-        return CodeBlock.new_action('control', 'Return', (), {})
-
-    @staticmethod
-    def PrintDebug(message_to_format: list[ArgValue] | ArgValue | None=None, permission: Literal["Owner", "Developer", "Builder", "Developer or builder", "Whitelisted", "All"]="Developer", text_value_merging: Literal["Add Spaces", "No Spaces"]="Add Spaces", highlighting: Literal["None", "Error", "Warning", "Other"]="None", sound: Literal["None", "Default", "Success", "Error", "Warning", "LagSlayer"]="Default", message_style: Literal["Custom", "Debug", "Error", "Warning", "Info", "LagSlayer"]="Debug", ):
-        """
-        Sends a formatted message to the specified plot staff group regardless of which mode they're currently in. Clicking on the message will teleport you to this block.
-    
-        :param list[ArgValue] | ArgValue | None message_to_format: Message to format (optional)
-        :param str permission: Permission
-    
-            - Owner: Sends to the plot owner. Works even if not on the plot.
-            - Developer: Sends to players that have dev perms.
-            - Builder: Sends to players that have build perms.
-            - Developer or builder: Sends to players that have dev or build perms.
-            - Whitelisted: Sends to players that are whitelisted on the plot.
-            - All: Sends to all players that are on the plot.
-        :param str text_value_merging: Text Value Merging
-        :param str highlighting: Highlighting
-    
-            - None: Don't highlight this code block.
-            - Error: Highlight this code block red.
-            - Warning: Highlight this code block orange.
-            - Other: Highlight this code block white.
-        :param str sound: Sound
-    
-            - None: No sound is played.
-            - Default: Plays the default sound for the message style.
-            - Success: Plays Player Level Up
-            - Error: Plays Shulker Hurt (Closed)
-            - Warning: Plays Blaze Hurt
-            - LagSlayer: Plays Iron Golem Repair
-        :param str message_style: Message Style
-    
-            - Custom: No message style is applied. Preview: Example
-            - Debug: Sends a debug message. Preview: • Example
-            - Error: Sends an error. Plays a sound by default. Preview: Error: Example
-            - Warning: Sends a warning. Plays a sound by default. Preview: [Warning] Example
-            - Info: Sends an info message. Preview: [Info] Example
-            - LagSlayer: Sends a LagSlayer message. Plays a sound by default. Preview: [LagSlayer] Example
-        
-        """
-        return CodeBlock.new_action('control', 'PrintDebug', (message_to_format,), {'Permission': permission, 'Text Value Merging': text_value_merging, 'Highlighting': highlighting, 'Sound': sound, 'Message Style': message_style})
-
-    @staticmethod
-    def Skip():
-        """
-        Skips the rest of this repeat statement's code and continues to the next repetition.
-    
-        
-        """
-        return CodeBlock.new_action('control', 'Skip', (), {})
-
-    @staticmethod
-    def End():
-        """
-        Stops the current event thread. Any code after this block will not be executed.
-    
-        
-        """
-        return CodeBlock.new_action('control', 'End', (), {})
-
-    @staticmethod
-    def EndAllThreads(end_current_thread: Literal["True", "False"]="True", ):
-        """
-        Ends all currently active threads, including active lines, loops, etc.
-    
-        :param str end_current_thread: End Current Thread
-    
-            - True: All threads including this one will be ended.
-            - False: All threads except this one will be ended.
-        
-        """
-        return CodeBlock.new_action('control', 'EndAllThreads', (), {'End Current Thread': end_current_thread})
-
-    @staticmethod
-    def Wait(wait_duration: Number | None=None, time_unit: Literal["Ticks", "Seconds", "Minutes"]="Ticks", ):
-        """
-        Pauses the current code sequence for a duration of ticks, seconds, or minutes.
-    
-        :param Number | None wait_duration: Wait duration (optional) (Default = 1)
-        :param str time_unit: Time Unit
-        
-        """
-        return CodeBlock.new_action('control', 'Wait', (wait_duration,), {'Time Unit': time_unit})
-
-class PlayerEvent:
-    """
-    Used to execute code when something is done by (or happens to) a player.
-    """
-
-    @staticmethod
-    def ClickContainerSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player clicks a slot in a container.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ClickContainerSlot', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def CloseInv(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player closes an inventory.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'CloseInv', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StartFly(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player starts flying.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StartFly', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BreakBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player breaks a block.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'BreakBlock', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StartSprint(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player starts sprinting.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StartSprint', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def MobKillPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a mob kills a player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'MobKillPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Teleport(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player is teleported.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Teleport', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def VillagerTrade(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player trades with a villager.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'VillagerTrade', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ShootBow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player fires an arrow with a bow.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ShootBow', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ChangeSign(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player changes a sign.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ChangeSign', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StopFly(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player stops flying.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StopFly', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def TameEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player tames a mob.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'TameEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LeftClick(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player left clicks.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'LeftClick', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlayerTakeDmg(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player takes damage.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlayerTakeDmg', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ProjHit(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a projectile launched by a player hits a block, an entity, or another player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ProjHit', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def KillPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player kills another player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'KillPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def VehicleJump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player presses the jump key while riding a vehicle or other entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'VehicleJump', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ClickInvSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player clicks a slot inside their inventory.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ClickInvSlot', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Respawn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player respawns.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Respawn', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def SwapHands(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player swaps an item or items between their main hand and off hand.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'SwapHands', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PackLoad(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player finishes loading a plot resource pack.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PackLoad', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def DamageEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player damages an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'DamageEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Sneak(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player sneaks.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Sneak', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlayerHeal(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player regains health from any source.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlayerHeal', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ClickPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player right clicks another player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ClickPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Consume(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player eats or drinks an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Consume', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StartGlide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player starts gliding.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StartGlide', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def MovementKey(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player presses or releases movement keys.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'MovementKey', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Death(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player dies, not as a result of another player or entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Death', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlaceBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player places a block.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlaceBlock', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Walk(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code while a player is walking.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Walk', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PickUpItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player picks up an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PickUpItem', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Dismount(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player dismounts a vehicle or other entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Dismount', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def CloudImbuePlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an area of effect cloud applies its potion effect(s) to a player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'CloudImbuePlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Leave(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player leaves the plot.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Leave', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def DropItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player drops an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'DropItem', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LeftClickPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player left clicks another player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'LeftClickPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ChangeSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player changes their hotbar slot.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ChangeSlot', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ClickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player right clicks an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ClickEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player uses their Pick Block key bind on an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PickEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def HorseJump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player causes a horse to jump.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'HorseJump', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ShootProjectile(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player throws a projectile such as snowballs or eggs.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ShootProjectile', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Move(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player moves.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Move', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Unsneak(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player stops sneaking.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Unsneak', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlayerCombust(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player catches on fire.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlayerCombust', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Chat(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player sends a chat message.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Chat', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Fish(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player fishes an entity, player, or nothing.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Fish', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BreakItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player breaks an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'BreakItem', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlayerResurrect(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player resurrects with a totem of undying.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlayerResurrect', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def RightClick(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player right clicks while looking at a block or holding an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'RightClick', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Purchase(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player purchases a plot product.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Purchase', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ClickMenuSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player clicks a slot in an inventory menu.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ClickMenuSlot', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Riptide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player throws a riptide trident.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Riptide', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StopGlide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player stops gliding.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StopGlide', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def KillMob(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player kills a mob.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'KillMob', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Join(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player joins the plot.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Join', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity damages a player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'EntityDmgPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def StopSprint(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player stops sprinting.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'StopSprint', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Jump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player jumps.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Jump', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LoadCrossbow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player loads a crossbow.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'LoadCrossbow', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ProjDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a projectile damages a player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'ProjDmgPlayer', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Command(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player types a command on the plot.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Command', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LeftClickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player left clicks an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'LeftClickEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Exhaustion(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player gains exhaustion.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'Exhaustion', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PackDecline(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player declines a plot resource pack prompt.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PackDecline', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PickBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player uses their Pick Block key bind on a block.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PickBlock', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlayerDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a player damages another player.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('event', 'PlayerDmgPlayer', ls_cancel), codeblocks, author)
-
-PE = PlayerEvent
-class EntityEvent:
-    """
-    Used to execute code when an entity does something or when something happens to an entity.
-    """
-
-    @staticmethod
-    def EntityKillEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity kills another entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityKillEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityCombust(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity catches on fire.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityCombust', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockFall(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block affected by gravity turns into a falling block.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'BlockFall', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def NaturallySpawn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity spawns into the world naturally.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'NaturallySpawn', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ProjKillEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a projectile kills an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'ProjKillEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityDmgEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity damages another entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDmgEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def FallingBlockLand(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a falling block lands on the ground.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'FallingBlockLand', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityResurrect(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity resurrects with a totem of undying.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityResurrect', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ItemMerge(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when dropped items try to merge into a stack.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'ItemMerge', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityHeal(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity regains health.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityHeal', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Teleport(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity is teleported.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'Teleport', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ShootBow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity shoots a bow.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'ShootBow', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityDmg(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity takes damage.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDmg', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ProjDmgEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a projectile damages an entity.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'ProjDmgEntity', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityExplode(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity explodes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityExplode', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def EntityDeath(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity dies by natural causes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDeath', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def VehicleDamage(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a vehicle entity (minecart or boat) is damaged.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'VehicleDamage', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Transform(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when an entity turns into another or group of others for any reason.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'Transform', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def RegrowWool(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a sheep regrows its wool.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('entity_event', 'RegrowWool', ls_cancel), codeblocks, author)
-
-EE = EntityEvent
-class GameEvent:
-    """
-    Used to execute code when something happens in the world.
-    """
-
-    @staticmethod
-    def CauldronChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a cauldron's level or contents changes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'CauldronChange', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def FurnaceBurn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a furnace consumes fuel.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'FurnaceBurn', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LeavesDecay(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when leaves decay.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'LeavesDecay', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockIgnite(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block ignites.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockIgnite', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def CrafterCraft(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a crafter crafts an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'CrafterCraft', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ChunkLoad(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a chunk is loaded.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'ChunkLoad', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockGrow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block grows naturally.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockGrow', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BeaconActivated(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a beacon is activated.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BeaconActivated', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockExplode(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block explodes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockExplode', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockDispense(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block dispenses an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockDispense', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PistonRetract(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a piston retracts.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'PistonRetract', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def VaultDisplayItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a vault displays an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'VaultDisplayItem', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def FluidLevelChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a liquid's level changes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'FluidLevelChange', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockFertilize(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block is fertilized.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockFertilize', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def SpongeAbsorb(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a sponge absorbs water.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'SpongeAbsorb', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PistonExtend(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a piston extends.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'PistonExtend', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def SculkBloom(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a sculk catalyst blooms.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'SculkBloom', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockFade(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block fades.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockFade', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def VaultChangeState(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a vault changes its state.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'VaultChangeState', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def CampfireStart(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a campfire starts cooking.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'CampfireStart', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlotShutdown(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a plot no longer has players and is shutting down.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'PlotShutdown', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def ChunkUnload(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a chunk is unloaded.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'ChunkUnload', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockSpread(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block spreads.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockSpread', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def NotePlay(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a note block plays a note.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'NotePlay', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Redstone(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a redstone current changes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'Redstone', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockMove(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block moves.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockMove', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def MoistureChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when soil moisture changes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'MoistureChange', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BellRing(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a bell is rung.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BellRing', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def LagSlayRecover(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a plot recovers from a LagSlayer halt.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'LagSlayRecover', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockBurn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block is destroyed by fire.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockBurn', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def PlotStartup(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a plot is first started.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'PlotStartup', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def TNTPrime(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when TNT is ignited.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'TNTPrime', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockForm(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block is formed, typically through natural means.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockForm', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def Brew(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when brewing completes.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'Brew', ls_cancel), codeblocks, author)
-
-    @staticmethod
-    def BlockCook(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
-        """
-        Executes code when a block cooks an item.
-    
-    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
-        :param str|None author: The author of this template.
-        """
-        return assemble_template(CodeBlock.new_event('game_event', 'BlockCook', ls_cancel), codeblocks, author)
-
-GE = GameEvent
+_CLASS_MODULES = {
+    'PlayerAction': 'player_action',
+    'PA': 'player_action',
+    'EntityAction': 'entity_action',
+    'EA': 'entity_action',
+    'GameAction': 'game_action',
+    'GA': 'game_action',
+    'SetVariable': 'set_var',
+    'SV': 'set_var',
+    'IfPlayer': 'if_player',
+    'IP': 'if_player',
+    'IfEntity': 'if_entity',
+    'IE': 'if_entity',
+    'IfGame': 'if_game',
+    'IG': 'if_game',
+    'IfVariable': 'if_var',
+    'IV': 'if_var',
+    'Repeat': 'repeat',
+    'SelectObject': 'select_obj',
+    'SO': 'select_obj',
+    'Control': 'control',
+    'PlayerEvent': 'event',
+    'PE': 'event',
+    'EntityEvent': 'entity_event',
+    'EE': 'entity_event',
+    'GameEvent': 'game_event',
+    'GE': 'game_event',
+}
+
+if TYPE_CHECKING:
+    from dfpyre.export.actions.player_action import PlayerAction, PA
+    from dfpyre.export.actions.entity_action import EntityAction, EA
+    from dfpyre.export.actions.game_action import GameAction, GA
+    from dfpyre.export.actions.set_var import SetVariable, SV
+    from dfpyre.export.actions.if_player import IfPlayer, IP
+    from dfpyre.export.actions.if_entity import IfEntity, IE
+    from dfpyre.export.actions.if_game import IfGame, IG
+    from dfpyre.export.actions.if_var import IfVariable, IV
+    from dfpyre.export.actions.repeat import Repeat
+    from dfpyre.export.actions.select_obj import SelectObject, SO
+    from dfpyre.export.actions.control import Control
+    from dfpyre.export.actions.event import PlayerEvent, PE
+    from dfpyre.export.actions.entity_event import EntityEvent, EE
+    from dfpyre.export.actions.game_event import GameEvent, GE
+
+
+def __getattr__(name: str):
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'dfpyre.export.actions.{module_name}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+"""
+Generated Codeblock action classes, one module per codeblock type.
+These are exported lazily through `dfpyre.export.action_classes`.
+"""
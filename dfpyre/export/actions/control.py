@@ -0,0 +1,114 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['Control']
+
+class Control:
+    """
+    Used to control the execution of some or all code blocks after it.
+    """
+
+    @staticmethod
+    def StopRepeat():
+        """
+        Stops a Repeat sequence and continues to the next code block.
+    
+        
+        """
+        return CodeBlock.new_action('control', 'StopRepeat', (), {})
+
+    @staticmethod
+    def Return():
+        """
+        Skips the rest of a Function sequence and returns to the block it was called from.
+    
+        
+        """
+        return CodeBlock.new_action('control', 'Return', (), {})
+
+    @staticmethod
+    def PrintDebug(message_to_format: list[ArgValue] | ArgValue | None=None, permission: Literal["Owner", "Developer", "Builder", "Developer or builder", "Whitelisted", "All"]="Developer", text_value_merging: Literal["Add Spaces", "No Spaces"]="Add Spaces", highlighting: Literal["None", "Error", "Warning", "Other"]="None", sound: Literal["None", "Default", "Success", "Error", "Warning", "LagSlayer"]="Default", message_style: Literal["Custom", "Debug", "Error", "Warning", "Info", "LagSlayer"]="Debug", ):
+        """
+        Sends a formatted message to the specified plot staff group regardless of which mode they're currently in. Clicking on the message will teleport you to this block.
+    
+        :param list[ArgValue] | ArgValue | None message_to_format: Message to format (optional)
+        :param str permission: Permission
+    
+            - Owner: Sends to the plot owner. Works even if not on the plot.
+            - Developer: Sends to players that have dev perms.
+            - Builder: Sends to players that have build perms.
+            - Developer or builder: Sends to players that have dev or build perms.
+            - Whitelisted: Sends to players that are whitelisted on the plot.
+            - All: Sends to all players that are on the plot.
+        :param str text_value_merging: Text Value Merging
+        :param str highlighting: Highlighting
+    
+            - None: Don't highlight this code block.
+            - Error: Highlight this code block red.
+            - Warning: Highlight this code block orange.
+            - Other: Highlight this code block white.
+        :param str sound: Sound
+    
+            - None: No sound is played.
+            - Default: Plays the default sound for the message style.
+            - Success: Plays Player Level Up
+            - Error: Plays Shulker Hurt (Closed)
+            - Warning: Plays Blaze Hurt
+            - LagSlayer: Plays Iron Golem Repair
+        :param str message_style: Message Style
+    
+            - Custom: No message style is applied. Preview: Example
+            - Debug: Sends a debug message. Preview: • Example
+            - Error: Sends an error. Plays a sound by default. Preview: Error: Example
+            - Warning: Sends a warning. Plays a sound by default. Preview: [Warning] Example
+            - Info: Sends an info message. Preview: [Info] Example
+            - LagSlayer: Sends a LagSlayer message. Plays a sound by default. Preview: [LagSlayer] Example
+        
+        """
+        return CodeBlock.new_action('control', 'PrintDebug', (message_to_format,), {'Permission': permission, 'Text Value Merging': text_value_merging, 'Highlighting': highlighting, 'Sound': sound, 'Message Style': message_style})
+
+    @staticmethod
+    def Skip():
+        """
+        Skips the rest of this repeat statement's code and continues to the next repetition.
+    
+        
+        """
+        return CodeBlock.new_action('control', 'Skip', (), {})
+
+    @staticmethod
+    def End():
+        """
+        Stops the current event thread. Any code after this block will not be executed.
+    
+        
+        """
+        return CodeBlock.new_action('control', 'End', (), {})
+
+    @staticmethod
+    def EndAllThreads(end_current_thread: Literal["True", "False"]="True", ):
+        """
+        Ends all currently active threads, including active lines, loops, etc.
+    
+        :param str end_current_thread: End Current Thread
+    
+            - True: All threads including this one will be ended.
+            - False: All threads except this one will be ended.
+        
+        """
+        return CodeBlock.new_action('control', 'EndAllThreads', (), {'End Current Thread': end_current_thread})
+
+    @staticmethod
+    def Wait(wait_duration: Number | None=None, time_unit: Literal["Ticks", "Seconds", "Minutes"]="Ticks", ):
+        """
+        Pauses the current code sequence for a duration of ticks, seconds, or minutes.
+    
+        :param Number | None wait_duration: Wait duration (optional) (Default = 1)
+        :param str time_unit: Time Unit
+        
+        """
+        return CodeBlock.new_action('control', 'Wait', (wait_duration,), {'Time Unit': time_unit})
+
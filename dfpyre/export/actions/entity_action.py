@@ -0,0 +1,2051 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['EntityAction', 'EA']
+
+class EntityAction:
+    """
+    Used to do something related to an entity or multiple entities.
+    """
+
+    @staticmethod
+    def DispRotationEuler(pitch: Number, yaw: Number, roll: Number | DFVector, rotation_type: Literal["Left Rotation", "Right Rotation"]="Left Rotation", target: Target=DEFAULT_TARGET):
+        """
+        Sets the left or right rotation of a display entity from 3 angles on each axis.
+    
+        :param Number pitch: Pitch (0-360)
+        :param Number yaw: Yaw (0-360)
+        :param Number | DFVector roll: Roll (0-360) OR Pitch/Yaw/Roll Vector
+        :param str rotation_type: Rotation Type
+    
+            - Left Rotation: Applies before scaling the display entity when rendering.
+            - Right Rotation: Applies after scaling the display entity when rendering.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DispRotationEuler', (pitch, yaw, roll,), {'Rotation Type': rotation_type}, target=target)
+
+    @staticmethod
+    def MannequinLayers(cape_layer: Literal["Visible", "Hidden"]="Visible", jacket_layer: Literal["Visible", "Hidden"]="Visible", left_sleeve_layer: Literal["Visible", "Hidden"]="Visible", right_sleeve_layer: Literal["Visible", "Hidden"]="Visible", left_pants_layer: Literal["Visible", "Hidden"]="Visible", right_pants_layer: Literal["Visible", "Hidden"]="Visible", hat_layer: Literal["Visible", "Hidden"]="Visible", target: Target=DEFAULT_TARGET):
+        """
+        Sets a mannequin's skin layers.
+    
+        :param str cape_layer: Cape Layer
+        :param str jacket_layer: Jacket Layer
+        :param str left_sleeve_layer: Left Sleeve Layer
+        :param str right_sleeve_layer: Right Sleeve Layer
+        :param str left_pants_layer: Left Pants Layer
+        :param str right_pants_layer: Right Pants Layer
+        :param str hat_layer: Hat Layer
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MannequinLayers', (), {'Cape Layer': cape_layer, 'Jacket Layer': jacket_layer, 'Left Sleeve Layer': left_sleeve_layer, 'Right Sleeve Layer': right_sleeve_layer, 'Left Pants Layer': left_pants_layer, 'Right Pants Layer': right_pants_layer, 'Hat Layer': hat_layer}, target=target)
+
+    @staticmethod
+    def Shear(target: Target=DEFAULT_TARGET):
+        """
+        Sets a mob in the sheared state.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Shear', (), {}, target=target)
+
+    @staticmethod
+    def SetVelocity(new_velocity: DFVector, add_to_current_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's movement velocity.
+    
+        :param DFVector new_velocity: New velocity
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVelocity', (new_velocity,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
+
+    @staticmethod
+    def SetGlowSquidDark(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the number of ticks a glow squid will stop glowing for.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGlowSquidDark', (ticks,), {}, target=target)
+
+    @staticmethod
+    def DispRotAxisAngle(axis_vector: DFVector, angle: Number, rotation_type: Literal["Left Rotation", "Right Rotation"]="Left Rotation", target: Target=DEFAULT_TARGET):
+        """
+        Sets the left or right rotation of a display entity from axis-angle rotation.
+    
+        :param DFVector axis_vector: Axis vector
+        :param Number angle: Angle (0-360)
+        :param str rotation_type: Rotation Type
+    
+            - Left Rotation: Applies before scaling the display entity when rendering.
+            - Right Rotation: Applies after scaling the display entity when rendering.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DispRotAxisAngle', (axis_vector, angle,), {'Rotation Type': rotation_type}, target=target)
+
+    @staticmethod
+    def SetFrogType(frog_type: Literal["Temperate", "Warm", "Cold"]="Temperate", target: Target=DEFAULT_TARGET):
+        """
+        :param str frog_type: Frog Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFrogType', (), {'Frog Type': frog_type}, target=target)
+
+    @staticmethod
+    def Damage(damage_to_inflict: Number, uuid_of_damager_entity: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Damages a mob.
+    
+        :param Number damage_to_inflict: Damage to inflict (❤ = 2 Health)
+        :param DFString | None uuid_of_damager_entity: UUID of damager entity (optional)
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Damage', (damage_to_inflict, uuid_of_damager_entity,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetMobSitting(is_sitting: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is sitting.
+    
+        :param str is_sitting: Is Sitting
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetMobSitting', (), {'Is Sitting': is_sitting}, target=target)
+
+    @staticmethod
+    def SendAnimation(animation_type: Literal["Hurt animation", "Crit particles", "Enchanted hit particles"]="Hurt animation", target: Target=DEFAULT_TARGET):
+        """
+        Makes a mob perform an animation.
+    
+        :param str animation_type: Animation Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SendAnimation', (), {'Animation Type': animation_type}, target=target)
+
+    @staticmethod
+    def SetWardenAnger(anger_level: Number, entity_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets the anger level of a Warden.
+    
+        :param Number anger_level: Anger level (0-150)
+        :param DFString entity_uuid: Entity UUID
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetWardenAnger', (anger_level, entity_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetHorsePattern(horse_color: Literal["White", "Buckskin", "Flaxen chestnut", "Bay", "Black", "Dapple gray", "Dark bay", "Don't change"]="Flaxen chestnut", horse_markings: Literal["No markings", "Stockings and blaze", "Paint", "Snowflake appaloosa", "Sooty", "Don't change"]="Stockings and blaze", target: Target=DEFAULT_TARGET):
+        """
+        Sets a horse's color and pattern.
+    
+        :param str horse_color: Horse Color
+        :param str horse_markings: Horse Markings
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetHorsePattern', (), {'Horse Color': horse_color, 'Horse Markings': horse_markings}, target=target)
+
+    @staticmethod
+    def Heal(amount_to_heal: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Restores a mob's health.
+    
+        :param Number | None amount_to_heal: Amount to heal OR Heals to full health) (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Heal', (amount_to_heal,), {}, target=target)
+
+    @staticmethod
+    def SetPandaSadTicks(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Makes a panda sad for the specified duration.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPandaSadTicks', (ticks,), {}, target=target)
+
+    @staticmethod
+    def SetDyeColor(dye: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="White", target: Target=DEFAULT_TARGET):
+        """
+        Sets a mob's dye color.
+    
+        :param str dye: Dye
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetDyeColor', (), {'Dye': dye}, target=target)
+
+    @staticmethod
+    def LaunchUp(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Launches an entity up or down.
+    
+        :param Number launch_power: Launch power
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'LaunchUp', (launch_power,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
+
+    @staticmethod
+    def SetAge(age: Number, age_lock: Literal["Enable", "Disable", "Don't change"]="Don't change", target: Target=DEFAULT_TARGET):
+        """
+        Sets an animal's age.
+    
+        :param Number age: Age
+        :param str age_lock: Age Lock
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAge', (age,), {'Age Lock': age_lock}, target=target)
+
+    @staticmethod
+    def SetName(custom_name: DFText | None=None, name_tag_visibility: Literal["Always", "Default", "Never", "Don't change"]="Always", target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's custom name.
+    
+        :param DFText | None custom_name: Custom name OR Removes custom name
+        :param str name_tag_visibility: Name Tag Visibility
+    
+            - Always: The custom name is always shown.
+            - Default: The custom name is shown when you are looking at the entity.
+            - Never: The custom name is always hidden.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', ' SetName ', (custom_name,), {'Name Tag Visibility': name_tag_visibility}, target=target)
+
+    @staticmethod
+    def SetArmsRaised(arms_raised: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob has its arms raised.
+    
+        :param str arms_raised: Arms Raised
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArmsRaised', (), {'Arms Raised': arms_raised}, target=target)
+
+    @staticmethod
+    def SetInvulnerable(invulnerable: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is invulnerable to damage.
+    
+        :param str invulnerable: Invulnerable
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetInvulnerable', (), {'Invulnerable': invulnerable}, target=target)
+
+    @staticmethod
+    def SetFriction(friction_type: Literal["Normal", "No Friction"]="No Friction", target: Target=DEFAULT_TARGET):
+        """
+        Changes the type of friction an entity experiences.
+    
+        :param str friction_type: Friction Type
+    
+            - Normal: The entity has normal friction.
+            - No Friction: The entity isn't slowed down by friction with the ground.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFriction', (), {'Friction Type': friction_type}, target=target)
+
+    @staticmethod
+    def SetPickupDelay(delay: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the number of ticks a dropped item cannot be picked up for.
+    
+        :param Number delay: Delay
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPickupDelay', (delay,), {}, target=target)
+
+    @staticmethod
+    def MannequinHand(main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", target: Target=DEFAULT_TARGET):
+        """
+        Sets a mannequin's main hand.
+    
+        :param str main_hand: Main Hand
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MannequinHand', (), {'Main Hand': main_hand}, target=target)
+
+    @staticmethod
+    def MiscAttribute(value: Number | None=None, attribute: Literal["Scale", "Follow range", "Zombie spawn reinforcements", "Oxygen bonus", "Burning time", "Camera distance", "Tempt range"]="Scale", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's miscellaneous attributes such as scale and burning time.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Scale: Base: 1.0 Range: 0.0625-16.0
+            - Follow range: Base: 32.0 Range: 0.0-2048.0
+            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
+            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
+            - Burning time: Base: 1.0 Range: 0.0-1024.0
+            - Camera distance: Base: 4.0 Range: 0.0-32.0
+            - Tempt range: Base: 10.0 Range: 0.0-2048.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MiscAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SetCreeperPower(power: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a creeper's explosion power. This affects the damage and area of effect.
+    
+        :param Number power: Power (0-25) (Default = 3 (6 for charged creepers))
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCreeperPower', (power,), {}, target=target)
+
+    @staticmethod
+    def SetMarker(marker: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an armor stand is a marker.
+    
+        :param str marker: Marker
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetMarker', (), {'Marker': marker}, target=target)
+
+    @staticmethod
+    def RemoveCustomTag(tag_name: DFString, target: Target=DEFAULT_TARGET):
+        """
+        Removes a custom tag from an entity.
+    
+        :param DFString tag_name: Tag name
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'RemoveCustomTag', (tag_name,), {}, target=target)
+
+    @staticmethod
+    def SetAbsorption(absorption_health: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's absorption health (golden hearts).
+    
+        :param Number absorption_health: Absorption health (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAbsorption', (absorption_health,), {}, target=target)
+
+    @staticmethod
+    def CreeperCharged(charged: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a creeper has the charged effect.
+    
+        :param str charged: Charged
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'CreeperCharged', (), {'Charged': charged}, target=target)
+
+    @staticmethod
+    def SetFireTicks(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the remaining time an entity is on fire for.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFireTicks', (ticks,), {}, target=target)
+
+    @staticmethod
+    def CombatAttribute(value: Number | None=None, attribute: Literal["Attack damage", "Attack knockback"]="Attack damage", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's combat-related attributes such as attack damage and attack speed.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Attack damage: Base: 2.0 Range: 0.0-2048.0
+            - Attack knockback: Base: 0.0 Range: 0.0-5.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'CombatAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def Jump(target: Target=DEFAULT_TARGET):
+        """
+        Causes a mob to jump.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Jump', (), {}, target=target)
+
+    @staticmethod
+    def MannequinDesc(description: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets a mannequin's description.
+    
+        :param DFText | None description: Description (optional) (Only shown if name is visible)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MannequinDesc', (description,), {}, target=target)
+
+    @staticmethod
+    def BDisplayBlock(displayed_block: Item, block_data: list[DFString] | DFString | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the displayed block of a block display.
+    
+        :param Item displayed_block: Displayed block
+        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'BDisplayBlock', (displayed_block, block_data,), {}, target=target)
+
+    @staticmethod
+    def SetFreezeTicks(ticks: Number, ticking_locked: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's current freeze ticks.
+    
+        :param Number ticks: Ticks (0-140)
+        :param str ticking_locked: Ticking Locked
+    
+            - Enable: Entity will stay frozen.
+            - Disable: Entity will slowly unfreeze over time.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFreezeTicks', (ticks,), {'Ticking Locked': ticking_locked}, target=target)
+
+    @staticmethod
+    def TDisplaySeeThru(seethrough: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a text display is visible through walls or not.
+    
+        :param str seethrough: See-through
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplaySeeThru', (), {'See-through': seethrough}, target=target)
+
+    @staticmethod
+    def SetGliding(gliding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is gliding.
+    
+        :param str gliding: Gliding
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGliding', (), {'Gliding': gliding}, target=target)
+
+    @staticmethod
+    def SetRotation(pitch: Number, yaw: Number, target: Target=DEFAULT_TARGET):
+        """
+        Changes an entity's pitch and yaw without teleporting it.
+    
+        :param Number pitch: Pitch (-90 to 90)
+        :param Number yaw: Yaw (-180 to 180)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetRotation', (pitch, yaw,), {}, target=target)
+
+    @staticmethod
+    def VillagerHeadAnim(target: Target=DEFAULT_TARGET):
+        """
+        Makes a villager perform a head shake animation.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'VillagerHeadAnim', (), {}, target=target)
+
+    @staticmethod
+    def SetPandaRolling(roll_type: Literal["Roll", "Stop Rolling"]="Roll", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a panda is rolling or not.
+    
+        :param str roll_type: Roll Type
+    
+            - Roll: Makes the panda do a single roll. Does nothing if already rolling.
+            - Stop Rolling: Makes the panda stop rolling if it's already rolling.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPandaRolling', (), {'Roll Type': roll_type}, target=target)
+
+    @staticmethod
+    def SetFishPattern(pattern_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black", "Don't change"]="White", body_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black", "Don't change"]="White", pattern: Literal["Kob", "Sunstreak", "Snooper", "Dasher", "Brinely", "Spotty", "Flopper", "Stripey", "Glitter", "Blockfish", "Betty", "Clayfish", "Don't change"]="Kob", target: Target=DEFAULT_TARGET):
+        """
+        Sets a tropical fish's color and pattern.
+    
+        :param str pattern_color: Pattern Color
+        :param str body_color: Body Color
+        :param str pattern: Pattern
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFishPattern', (), {'Pattern Color': pattern_color, 'Body Color': body_color, 'Pattern': pattern}, target=target)
+
+    @staticmethod
+    def SetTemperature(temperature_type: Literal["Cold", "Temperate", "Warm"]="Temperate", target: Target=DEFAULT_TARGET):
+        """
+        Sets a mob's temperature variant.
+    
+        :param str temperature_type: Temperature Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetTemperature', (), {'Temperature Type': temperature_type}, target=target)
+
+    @staticmethod
+    def SetWolfType(wolf_type: Literal["Ashen", "Black", "Chestnut", "Pale", "Rusty", "Snowy", "Spotted", "Striped", "Woods"]="Ashen", target: Target=DEFAULT_TARGET):
+        """
+        Sets a wolf's variant.
+    
+        :param str wolf_type: Wolf Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetWolfType', (), {'Wolf Type': wolf_type}, target=target)
+
+    @staticmethod
+    def DispInterpolation(interpolation_duration: Number | None=None, interpolation_delay: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the interpolation properties of a display entity.
+    
+        :param Number | None interpolation_duration: Interpolation duration in ticks (optional) (Default = 0)
+        :param Number | None interpolation_delay: Interpolation delay in ticks (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DispInterpolation', (interpolation_duration, interpolation_delay,), {}, target=target)
+
+    @staticmethod
+    def SetEndermanBlock(block_to_hold: Item, target: Target=DEFAULT_TARGET):
+        """
+        Set an enderman's held block.
+    
+        :param Item block_to_hold: Block to hold
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetEndermanBlock', (block_to_hold,), {}, target=target)
+
+    @staticmethod
+    def MannequinMovable(movable: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mannequin is movable.
+    
+        :param str movable: Movable
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MannequinMovable', (), {'Movable': movable}, target=target)
+
+    @staticmethod
+    def LaunchToward(launch_destination: Location, launch_power: Number | None=None, add_to_current_velocity: Literal["True", "False"]="True", ignore_distance: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Launches an entity toward or away from a location.
+    
+        :param Location launch_destination: Launch destination
+        :param Number | None launch_power: Launch power (optional)
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param str ignore_distance: Ignore Distance
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'LaunchToward', (launch_destination, launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Ignore Distance': ignore_distance}, target=target)
+
+    @staticmethod
+    def SetArmor(armor_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets a mob's armor items. Place the armor in slots 1-4 of the chest, with 1 being the helmet and 4 being the boots.
+    
+        :param list[Item] | Item armor_to_set: Armor to set
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArmor', (armor_to_set,), {}, target=target)
+
+    @staticmethod
+    def GetCustomTag(result: Variable, tag_name: DFString, target: Target=DEFAULT_TARGET):
+        """
+        Gets the value of a custom entity tag.
+    
+        :param Variable result: Variable to set
+        :param DFString tag_name: Tag name
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'GetCustomTag', (result, tag_name,), {}, target=target)
+
+    @staticmethod
+    def InteractionSize(width: Number | None=None, height: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the hitbox size of an interaction entity.
+    
+        :param Number | None width: Width (optional) (Default = 1)
+        :param Number | None height: Height (optional) (Default = 1)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'InteractionSize', (width, height,), {}, target=target)
+
+    @staticmethod
+    def FaceLocation(location_to_face: Location, face_direction: Literal["Toward location", "Away from location"]="Toward location", target: Target=DEFAULT_TARGET):
+        """
+        Rotates an entity to look toward a location without teleporting them.
+    
+        :param Location location_to_face: Location to face
+        :param str face_direction: Face Direction
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'FaceLocation', (location_to_face,), {'Face Direction': face_direction}, target=target)
+
+    @staticmethod
+    def SetCatType(skin_type: Literal["Tabby", "Tuxedo", "Red", "Siamese", "British Shorthair", "Calico", "Persian", "Ragdoll", "White", "Jellie", "Black"]="Tabby", target: Target=DEFAULT_TARGET):
+        """
+        Sets a cat's skin type.
+    
+        :param str skin_type: Skin Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCatType', (), {'Skin Type': skin_type}, target=target)
+
+    @staticmethod
+    def SetArrowDamage(base_damage: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the base damage dealt by an arrow or trident.
+    
+        :param Number base_damage: Base Damage
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArrowDamage', (base_damage,), {}, target=target)
+
+    @staticmethod
+    def DisplayScale(x_scale: Number, y_scale: Number, z_scale: Number | DFVector, target: Target=DEFAULT_TARGET):
+        """
+        Sets the scale of a display entity.
+    
+        :param Number x_scale: X scale
+        :param Number y_scale: Y scale
+        :param Number | DFVector z_scale: Z scale OR Scale vector
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayScale', (x_scale, y_scale, z_scale,), {}, target=target)
+
+    @staticmethod
+    def TDisplayAlign(text_alignment: Literal["Center", "Left", "Right"]="Center", target: Target=DEFAULT_TARGET):
+        """
+        Sets the text alignment of a text display.
+    
+        :param str text_alignment: Text Alignment
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplayAlign', (), {'Text Alignment': text_alignment}, target=target)
+
+    @staticmethod
+    def LaunchProj(projectile_to_launch: Item, launch_point: Location | None=None, projectile_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Launches a projectile from a mob.
+    
+        :param Item projectile_to_launch: Projectile to launch
+        :param Location | None launch_point: Launch point (optional)
+        :param DFText | None projectile_name: Projectile name (optional)
+        :param Number | None speed: Speed (optional)
+        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'LaunchProj', (projectile_to_launch, launch_point, projectile_name, speed, inaccuracy,), {}, target=target)
+
+    @staticmethod
+    def DisplayBillboard(billboard_type: Literal["Fixed", "Vertical", "Horizontal", "Center"]="Fixed", target: Target=DEFAULT_TARGET):
+        """
+        Sets how a display entity is rotated with a player's view.
+    
+        :param str billboard_type: Billboard Type
+    
+            - Fixed: Display entity does not rotate.
+            - Vertical: Display entity faces player around vertical axis.
+            - Horizontal: Display entity faces player around horizontal axis.
+            - Center: Display entity faces player in all axes.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayBillboard', (), {'Billboard Type': billboard_type}, target=target)
+
+    @staticmethod
+    def Tame(owner_uuid: DFString | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Tames and sets the owner of a tameable mob.
+    
+        :param DFString | None owner_uuid: Owner UUID OR Untames mob
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Tame', (owner_uuid,), {}, target=target)
+
+    @staticmethod
+    def SetGoatScreaming(screams: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a goat screams or not.
+    
+        :param str screams: Screams
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGoatScreaming', (), {'Screams': screams}, target=target)
+
+    @staticmethod
+    def SetBeeStinger(has_stinger: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a bee has its stinger.
+    
+        :param str has_stinger: Has Stinger
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetBeeStinger', (), {'Has Stinger': has_stinger}, target=target)
+
+    @staticmethod
+    def RestockTrades(target: Target=DEFAULT_TARGET):
+        """
+        Restocks all of a villager's trades.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'RestockTrades', (), {}, target=target)
+
+    @staticmethod
+    def MobDisguise(mob_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises an entity as a mob.
+    
+        :param Item mob_to_disguise_as: Mob to disguise as
+        :param DFText | None display_name: Display name (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MobDisguise', (mob_to_disguise_as, display_name,), {}, target=target)
+
+    @staticmethod
+    def SetMinecartBlock(block_to_show: Item, block_offset: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the block shown inside a minecart. This does not affect its functionality.
+    
+        :param Item block_to_show: Block to show
+        :param Number | None block_offset: Block offset (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetMinecartBlock', (block_to_show, block_offset,), {}, target=target)
+
+    @staticmethod
+    def FoxSleeping(sleeping: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Causes a fox to start or stop sleeping.
+    
+        :param str sleeping: Sleeping
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'FoxSleeping', (), {'Sleeping': sleeping}, target=target)
+
+    @staticmethod
+    def LockDisgRotation(pitch_to_lock_to: Number | None=None, yaw_to_lock_to: Number | None=None, pitch: Literal["Lock", "Unlock", "No Change"]="No Change", yaw: Literal["Lock", "Unlock", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
+        """
+        Locks a disguise's pitch or yaw values.
+    
+        :param Number | None pitch_to_lock_to: Pitch to lock to (optional) (Default = 0)
+        :param Number | None yaw_to_lock_to: Yaw to lock to (optional) (Default = 0)
+        :param str pitch: Pitch
+        :param str yaw: Yaw
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'LockDisgRotation', (pitch_to_lock_to, yaw_to_lock_to,), {'Pitch': pitch, 'Yaw': yaw}, target=target)
+
+    @staticmethod
+    def SetEquipment(item_to_set: Item | None=None, equipment_slot: Literal["Main hand", "Off hand", "Head", "Body", "Legs", "Feet", "Saddle", "Horse armor", "Decor", "Harness"]="Main hand", target: Target=DEFAULT_TARGET):
+        """
+        Sets the item in one of the equipment slots (including horse items) of an entity.
+    
+        :param Item | None item_to_set: Item to set (optional)
+        :param str equipment_slot: Equipment Slot
+    
+            - Main hand: Sets the hand item of a mob with a hand slot.
+            - Off hand: Sets the off hand item of a mob with two hand slots.
+            - Head: Sets the head armor item of a mob that can wear hats or armor.
+            - Body: Sets the chest armor item of a mob that can wear armor.
+            - Legs: Sets the legs armor item of a mob that can wear armor.
+            - Feet: Sets the feet armor item of a mob that can wear armor.
+            - Saddle: Sets the saddle item of a horse.
+            - Horse armor: Sets the armor item of a horse.
+            - Decor: Sets the decor item of a llama.
+            - Harness: Sets the harness item of a happy ghast.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetEquipment', (item_to_set,), {'Equipment Slot': equipment_slot}, target=target)
+
+    @staticmethod
+    def SetSilenced(silenced: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity will produce sound effects.
+    
+        :param str silenced: Silenced
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetSilenced', (), {'Silenced': silenced}, target=target)
+
+    @staticmethod
+    def SetBeeNectar(has_nectar: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets if a bee has nectar on its body.
+    
+        :param str has_nectar: Has Nectar
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetBeeNectar', (), {'Has Nectar': has_nectar}, target=target)
+
+    @staticmethod
+    def AttachLead(lead_holder_uuid: DFString | Location, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Attaches a lead to the target, held by an entity or lead knot.
+    
+        :param DFString | Location lead_holder_uuid: Lead holder UUID OR Lead knot location (Spawns a Leash Knot entity. Requires a fence block.)
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'AttachLead', (lead_holder_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def RemovePotion(effect_to_remove: list[Potion] | Potion, target: Target=DEFAULT_TARGET):
+        """
+        Removes one or more potion effects from an entity.
+    
+        :param list[Potion] | Potion effect_to_remove: Effect(s) to remove
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'RemovePotion', (effect_to_remove,), {}, target=target)
+
+    @staticmethod
+    def ShearSheep(target: Target=DEFAULT_TARGET):
+        """
+        Causes a sheep to be sheared.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ShearSheep', (), {}, target=target)
+
+    @staticmethod
+    def ArmorStandSlots(interactions: Literal["Take, swap or place item", "Take or swap item", "Take item", "Place item", "None"]="Take, swap or place item", equipment_slot: Literal["All", "Main hand", "Off hand", "Head", "Chest", "Legs", "Feet"]="All", target: Target=DEFAULT_TARGET):
+        """
+        Sets the possible interactions, such as adding or removing items, of an armor stand's slot(s).
+    
+        :param str interactions: Interactions
+    
+            - Take, swap or place item: Players are able to: • Remove an item from this slot • Swap their held item with this slot • Place their held item in this slot
+            - Take or swap item: Players are able to: • Remove an item from this slot • Swap their held item with this slot
+            - Take item: Players are able to: • Remove an item from this slot
+            - Place item: Players are able to: • Place their held item in this slot (if the slot is empty)
+            - None: Players are unable to interact with this slot.
+        :param str equipment_slot: Equipment Slot
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ArmorStandSlots', (), {'Interactions': interactions, 'Equipment Slot': equipment_slot}, target=target)
+
+    @staticmethod
+    def SetAllayDancing(dancing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an allay is dancing or not.
+    
+        :param str dancing: Dancing
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAllayDancing', (), {'Dancing': dancing}, target=target)
+
+    @staticmethod
+    def SetRabbitType(skin_type: Literal["Brown", "White", "Black", "Black and White", "Gold", "Salt and Pepper", "Killer"]="Brown", target: Target=DEFAULT_TARGET):
+        """
+        Sets a rabbit's skin type.
+    
+        :param str skin_type: Skin Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetRabbitType', (), {'Skin Type': skin_type}, target=target)
+
+    @staticmethod
+    def SetSize(size: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the size of an entity. This may also affect its health and strength.
+    
+        :param Number size: Size
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetSize', (size,), {}, target=target)
+
+    @staticmethod
+    def SetAngry(angry: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob is angry at players.
+    
+        :param str angry: Angry
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAngry', (), {'Angry': angry}, target=target)
+
+    @staticmethod
+    def Undisguise(target: Target=DEFAULT_TARGET):
+        """
+        Removes an entity's disguise.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Undisguise', (), {}, target=target)
+
+    @staticmethod
+    def SetDeathDrops(has_death_drops: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob drops their items when dead.
+    
+        :param str has_death_drops: Has Death Drops
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetDeathDrops', (), {'Has Death Drops': has_death_drops}, target=target)
+
+    @staticmethod
+    def SetPersistent(persistent: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an item or a falling block will never despawn.
+    
+        :param str persistent: Persistent
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPersistent', (), {'Persistent': persistent}, target=target)
+
+    @staticmethod
+    def ProjectileItem(display_item: Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets the item a projectile displays as.
+    
+        :param Item display_item: Display item
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ProjectileItem', (display_item,), {}, target=target)
+
+    @staticmethod
+    def SetNameColor(name_color: Literal["Black", "Dark blue", "Dark green", "Dark aqua", "Dark red", "Dark purple", "Gold", "Gray", "Dark gray", "Blue", "Green", "Aqua", "Red", "Light purple", "Yellow", "White", "None"]="Black", target: Target=DEFAULT_TARGET):
+        """
+        Sets the color an entity's name tag appears in.
+    
+        :param str name_color: Name Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetNameColor', (), {'Name Color': name_color}, target=target)
+
+    @staticmethod
+    def SetCarryingChest(carrying_chest: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob carries a chest, which allows its inventory to be accessed.
+    
+        :param str carrying_chest: Carrying Chest
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCarryingChest', (), {'Carrying Chest': carrying_chest}, target=target)
+
+    @staticmethod
+    def SetParrotColor(parrot_color: Literal["Red", "Blue", "Green", "Cyan", "Gray"]="Red", target: Target=DEFAULT_TARGET):
+        """
+        Sets a parrot's color.
+    
+        :param str parrot_color: Parrot Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetParrotColor', (), {'Parrot Color': parrot_color}, target=target)
+
+    @staticmethod
+    def DispTranslation(x_translation: Number, y_translation: Number, z_translation: Number | DFVector, target: Target=DEFAULT_TARGET):
+        """
+        Sets the translation values of a display entity.
+    
+        :param Number x_translation: X translation
+        :param Number y_translation: Y translation
+        :param Number | DFVector z_translation: Z translation OR Translation vector
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DispTranslation', (x_translation, y_translation, z_translation,), {}, target=target)
+
+    @staticmethod
+    def Remove(target: Target=DEFAULT_TARGET):
+        """
+        Deletes an entity.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Remove', (), {}, target=target)
+
+    @staticmethod
+    def TDispBackground(color_hexadecimal: DFString, opacity_in_percentage: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the background color and opacity of a text display.
+    
+        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
+        :param Number | None opacity_in_percentage: Opacity in percentage OR Uses the default background color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDispBackground', (color_hexadecimal, opacity_in_percentage,), {}, target=target)
+
+    @staticmethod
+    def DisplayCullingSize(width: Number | None=None, height: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the culling width and height of a display entity.
+    
+        :param Number | None width: Width (optional) (Default = 0)
+        :param Number | None height: Height (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayCullingSize', (width, height,), {}, target=target)
+
+    @staticmethod
+    def SetAxolotlColor(axolotl_color: Literal["Pink", "Brown", "Yellow", "Cyan", "Blue"]="Pink", target: Target=DEFAULT_TARGET):
+        """
+        Sets an axolotl's color.
+    
+        :param str axolotl_color: Axolotl Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAxolotlColor', (), {'Axolotl Color': axolotl_color}, target=target)
+
+    @staticmethod
+    def GetAllEntityTags(result: Variable, target: Target=DEFAULT_TARGET):
+        """
+        Gets all tags registered on an entity.
+    
+        :param Variable result: Variable to set
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'GetAllEntityTags', (result,), {}, target=target)
+
+    @staticmethod
+    def SetAI(ai: Literal["Sentient", "Insentient", "None"]="None", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is sentient and/or affected by physics.
+    
+        :param str ai: AI
+    
+            - Sentient: The entity acts normally.
+            - Insentient: The entity does not act by itself, but is affected by physics.
+            - None: The entity does not act by itself, and is unaffected by physics.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetAI', (), {'AI': ai}, target=target)
+
+    @staticmethod
+    def KBAttribute(value: Number | None=None, attribute: Literal["Knockback resistance", "Explosion knockback resistance"]="Knockback resistance", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's knockback-related attributes such as knockback resistance.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'KBAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def MovementAttribute(value: Number | None=None, attribute: Literal["Walking speed", "Flying speed", "Jump strength", "Step height", "Movement efficiency", "Water movement efficiency"]="Walking speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's movement-related attributes, such as walking speed and jump height.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Walking speed: Base: 0.2 Range: 0.0-1024.0
+            - Flying speed: Base: 0.4 Range: 0.0-1024.0
+            - Jump strength: Base: 0.42 Range: 0.0-32.0
+            - Step height: Base: 0.6 Range: 0.0-10.0
+            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MovementAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SetRiptiding(riptiding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is riptiding.
+    
+        :param str riptiding: Riptiding
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetRiptiding', (), {'Riptiding': riptiding}, target=target)
+
+    @staticmethod
+    def SetArrowNoClip(has_noclip: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an arrow will pass through blocks and through entities.
+    
+        :param str has_noclip: Has NoClip
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArrowNoClip', (), {'Has NoClip': has_noclip}, target=target)
+
+    @staticmethod
+    def FallingAttribute(value: Number | None=None, attribute: Literal["Gravity", "Safe fall distance", "Fall damage multiplier"]="Gravity", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's falling-related attributes, such as gravity and fall damage multiplier.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Gravity: Base: 0.08 Range: -1.0-1.0
+            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
+            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'FallingAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SetProjSource(shooter_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets the projectile source of a projectile (or removes it).
+    
+        :param DFString | None shooter_uuid: Shooter UUID OR Removes shooter
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetProjSource', (shooter_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetFoxLeaping(leaping: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a fox appears to be leaping.
+    
+        :param str leaping: Leaping
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFoxLeaping', (), {'Leaping': leaping}, target=target)
+
+    @staticmethod
+    def SetPandaGene(set_gene: Literal["Main gene", "Hidden gene", "Both"]="Both", gene_type: Literal["Aggressive", "Lazy", "Weak", "Worried", "Playful", "Normal", "Brown"]="Aggressive", target: Target=DEFAULT_TARGET):
+        """
+        Sets the gene of a panda. This affects their behavior and appearance.
+    
+        :param str set_gene: Set Gene
+        :param str gene_type: Gene Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPandaGene', (), {'Set Gene': set_gene, 'Gene Type': gene_type}, target=target)
+
+    @staticmethod
+    def SetMaxHealth(maximum_health: Number, heal_mob_to_max_health: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's maximum health.
+    
+        :param Number maximum_health: Maximum health
+        :param str heal_mob_to_max_health: Heal Mob to Max Health
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetMaxHealth', (maximum_health,), {'Heal Mob to Max Health': heal_mob_to_max_health}, target=target)
+
+    @staticmethod
+    def SetFishingTime(wait_time: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the time until a fish starts to approach a fishing hook.
+    
+        :param Number wait_time: Wait time (ticks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFishingTime', (wait_time,), {}, target=target)
+
+    @staticmethod
+    def ClrVillagerTrades(target: Target=DEFAULT_TARGET):
+        """
+        Removes all trades from a villager.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ClrVillagerTrades', (), {}, target=target)
+
+    @staticmethod
+    def EndCrystalBeam(target_location: Location | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the location an end crystal points its beam at.
+    
+        :param Location | None target_location: Target (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'EndCrystalBeam', (target_location,), {}, target=target)
+
+    @staticmethod
+    def FrogEat(target_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Makes a frog try to eat the specified mob or player.
+    
+        :param DFString target_uuid: Target UUID
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'FrogEat', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetSalmonType(salmon_type: Literal["Small", "Medium", "Large"]="Medium", target: Target=DEFAULT_TARGET):
+        """
+        Sets a salmon's variant.
+    
+        :param str salmon_type: Salmon Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetSalmonType', (), {'Salmon Type': salmon_type}, target=target)
+
+    @staticmethod
+    def DisplayBrightness(block_light_level: Number, sky_light_level: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the brightness of a display entity.
+    
+        :param Number block_light_level: Block light level (0-15)
+        :param Number | None sky_light_level: Sky light level (0-15) OR Uses the light level at entity's location
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayBrightness', (block_light_level, sky_light_level,), {}, target=target)
+
+    @staticmethod
+    def SetProfession(retain_trades: Literal["True", "False"]="False", profession: Literal["Unemployed", "Armorer", "Butcher", "Cartographer", "Cleric", "Farmer", "Fisherman", "Fletcher", "Leatherworker", "Librarian", "Mason", "Nitwit", "Shepherd", "Toolsmith", "Weaponsmith"]="Armorer", target: Target=DEFAULT_TARGET):
+        """
+        Sets a villager's profession.
+    
+        :param str retain_trades: Retain Trades
+        :param str profession: Profession
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetProfession', (), {'Retain Trades': retain_trades, 'Profession': profession}, target=target)
+
+    @staticmethod
+    def SetTradeUses(trade_index: Number, remaining_uses: Number | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the amount of times a trade can be made before the villager has to restock.
+    
+        :param Number trade_index: Trade index
+        :param Number | None remaining_uses: Remaining uses (optional) (Default = Infinite)
+        :param Number | None maximum_uses: Maximum uses (optional) (Default = No change)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetTradeUses', (trade_index, remaining_uses, maximum_uses,), {}, target=target)
+
+    @staticmethod
+    def ClearPotions(target: Target=DEFAULT_TARGET):
+        """
+        Removes all active potion effects from an entity.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ClearPotions', (), {}, target=target)
+
+    @staticmethod
+    def ArmorStandParts(arms: Literal["Enable", "Disable", "Don't change"]="Enable", base_plate: Literal["Enable", "Disable", "Don't change"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an armor stand has arms and a base plate.
+    
+        :param str arms: Arms
+        :param str base_plate: Base Plate
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ArmorStandParts', (), {'Arms': arms, 'Base Plate': base_plate}, target=target)
+
+    @staticmethod
+    def SetNameVisible(name_tag_visibility: Literal["Always", "Default", "Never"]="Always", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity's custom name is always displayed above them.
+    
+        :param str name_tag_visibility: Name Tag Visibility
+    
+            - Always: The custom name is always shown.
+            - Default: The custom name is shown when you are looking at the entity.
+            - Never: The custom name is always hidden.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', ' SetNameVisible ', (), {'Name Tag Visibility': name_tag_visibility}, target=target)
+
+    @staticmethod
+    def SetTarget(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Instructs a mob's AI to target a specific mob or player.
+    
+        :param list[DFString] | DFString | None target_uuid: Target UUID OR Stop targeting)
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def TDisplayShadow(text_shadow: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether the text in a text display has shadow or not.
+    
+        :param str text_shadow: Text Shadow
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplayShadow', (), {'Text Shadow': text_shadow}, target=target)
+
+    @staticmethod
+    def SetInvulTicks(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the currently remaining ticks until an entity can next be hurt.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetInvulTicks', (ticks,), {}, target=target)
+
+    @staticmethod
+    def MannequinSkin(mannequin_player_head: Item | DFString, target: Target=DEFAULT_TARGET):
+        """
+        Sets a mannequin's skin avatar.
+    
+        :param Item | DFString mannequin_player_head: Mannequin player head OR Mannequin player name or UUID
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MannequinSkin', (mannequin_player_head,), {}, target=target)
+
+    @staticmethod
+    def SetShulkerPeek(peek_percentage: Number, is_silent: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets how far a shulker should peek up to.
+    
+        :param Number peek_percentage: Peek Percentage
+        :param str is_silent: Is Silent
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetShulkerPeek', (peek_percentage,), {'Is Silent': is_silent}, target=target)
+
+    @staticmethod
+    def SetPose(pose: Literal["Standing", "Sleeping", "Swimming", "Sneaking"]="Standing", target: Target=DEFAULT_TARGET):
+        """
+        Changes the pose of an entity. This affects their animations and/or hitbox, depending on the pose and entity type.
+    
+        :param str pose: Pose
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', ' SetPose ', (), {'Pose': pose}, target=target)
+
+    @staticmethod
+    def SetRearing(rearing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a horse is standing on its hind legs.
+    
+        :param str rearing: Rearing
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetRearing', (), {'Rearing': rearing}, target=target)
+
+    @staticmethod
+    def SetCloudRadius(radius: Number, shrinking_speed: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets an area of effect cloud's radius and shrinking speed.
+    
+        :param Number radius: Radius
+        :param Number | None shrinking_speed: Shrinking speed (blocks per second) (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCloudRadius', (radius, shrinking_speed,), {}, target=target)
+
+    @staticmethod
+    def SetGravity(gravity: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is affected by gravity.
+    
+        :param str gravity: Gravity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGravity', (), {'Gravity': gravity}, target=target)
+
+    @staticmethod
+    def Mimic(target_uuid: list[DFString] | DFString, remove_original_entity: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Disguises an entity as another currently existing entity or player.
+    
+        :param list[DFString] | DFString target_uuid: UUID of target to disguise as
+        :param str remove_original_entity: Remove Original Entity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Mimic', (target_uuid,), {'Remove Original Entity': remove_original_entity}, target=target)
+
+    @staticmethod
+    def DispTPDuration(teleport_duration: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets how long a display entity takes to visually move to its destination when it teleports.
+    
+        :param Number | None teleport_duration: Teleport duration in ticks (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DispTPDuration', (teleport_duration,), {}, target=target)
+
+    @staticmethod
+    def SetWitherInvul(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the remaining ticks of invulnerability a wither has.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetWitherInvul', (ticks,), {}, target=target)
+
+    @staticmethod
+    def SetArrowPierce(targets_to_pierce: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets how many targets an arrow can pierce through. A pierce of 1 can hit up to 2 entities.
+    
+        :param Number targets_to_pierce: Targets to pierce
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArrowPierce', (targets_to_pierce,), {}, target=target)
+
+    @staticmethod
+    def DisplayShadow(shadow_radius_in_blocks: Number | None=None, shadow_opacity_in_percentage: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the shadow properties of a display entity.
+    
+        :param Number | None shadow_radius_in_blocks: Shadow radius in blocks (optional) (Default = 1)
+        :param Number | None shadow_opacity_in_percentage: Shadow opacity in percentage (optional) (Default = 100)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayShadow', (shadow_radius_in_blocks, shadow_opacity_in_percentage,), {}, target=target)
+
+    @staticmethod
+    def InteractResponse(responsive: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an interaction entity has response when interacting with it.
+    
+        :param str responsive: Responsive
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'InteractResponse', (), {'Responsive': responsive}, target=target)
+
+    @staticmethod
+    def UseItem(hand: Literal["Main Hand", "Off Hand"]="Main Hand", use_item: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Forces a mob to use held items such as bow or spyglass.
+    
+        :param str hand: Hand
+        :param str use_item: Use Item
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'UseItem', (), {'Hand': hand, 'Use Item': use_item}, target=target)
+
+    @staticmethod
+    def RideEntity(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Mounts an entity on top of another entity or player.
+    
+        :param list[DFString] | DFString | None target_uuid: Target UUID OR Dismounts entity
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'RideEntity', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def DisplayMatrix(sixteen_numbers_describing_a_rowmajor_matrix: ArgValue, target: Target=DEFAULT_TARGET):
+        """
+        Sets the affine transformation matrix of a display entity.
+    
+        :param ArgValue sixteen_numbers_describing_a_rowmajor_matrix: 16 numbers describing a row-major matrix
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayMatrix', (sixteen_numbers_describing_a_rowmajor_matrix,), {}, target=target)
+
+    @staticmethod
+    def SetWolfSoundType(wolf_sound_type: Literal["Angry", "Big", "Classic", "Cute", "Grumpy", "Puglin", "Sad"]="Angry", target: Target=DEFAULT_TARGET):
+        """
+        Sets a wolf's sound variant.
+    
+        :param str wolf_sound_type: Wolf Sound Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetWolfSoundType', (), {'Wolf Sound Type': wolf_sound_type}, target=target)
+
+    @staticmethod
+    def SnifferState(behavior: Literal["Idle", "Feeling Happy", "Scenting", "Sniffing", "Searching", "Digging"]="Idle", target: Target=DEFAULT_TARGET):
+        """
+        Forces a sniffer to perform a specific action.
+    
+        :param str behavior: Behavior
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SnifferState', (), {'Behavior': behavior}, target=target)
+
+    @staticmethod
+    def Teleport(new_position: Location, keep_current_rotation: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Teleports an entity to a specified location.
+    
+        :param Location new_position: New position
+        :param str keep_current_rotation: Keep Current Rotation
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Teleport', (new_position,), {'Keep Current Rotation': keep_current_rotation}, target=target)
+
+    @staticmethod
+    def DisplayGlowColor(color_hexadecimal: DFString | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the glowing color of a display entity.
+    
+        :param DFString | None color_hexadecimal: Color hexadecimal OR Resets glow color (Example: "#FF0000" (red))
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayGlowColor', (color_hexadecimal,), {}, target=target)
+
+    @staticmethod
+    def SetVisualFire(on_fire: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity should appear on fire.
+    
+        :param str on_fire: On Fire
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVisualFire', (), {'On Fire': on_fire}, target=target)
+
+    @staticmethod
+    def DisguiseShiftVert(yoffset: Number, target: Target=DEFAULT_TARGET):
+        """
+        Shifts the disguise of an entity up or down relative to the entity itself.
+    
+        :param Number yoffset: Y-Offset
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisguiseShiftVert', (yoffset,), {}, target=target)
+
+    @staticmethod
+    def SetSaddle(saddle: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob wears a saddle.
+    
+        :param str saddle: Saddle
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetSaddle', (), {'Saddle': saddle}, target=target)
+
+    @staticmethod
+    def SetBulletTarget(target_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Causes a shulker bullet to start targeting the provided entity.
+    
+        :param DFString | None target_uuid: Target UUID OR No Target)
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetBulletTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def TDisplayLineWidth(line_width: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the maximum line width of a text display.
+    
+        :param Number | None line_width: Line width (optional) (Default = 200)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplayLineWidth', (line_width,), {}, target=target)
+
+    @staticmethod
+    def RemVillagerTrade(trade_index: Number, target: Target=DEFAULT_TARGET):
+        """
+        Removes a trade from a villager
+    
+        :param Number trade_index: Trade index
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'RemVillagerTrade', (trade_index,), {}, target=target)
+
+    @staticmethod
+    def SetDragonPhase(phase: Literal["Flying", "Hovering", "Breath attack", "Dying"]="Flying", target: Target=DEFAULT_TARGET):
+        """
+        Sets the behavior phase of an Ender Dragon.
+    
+        :param str phase: Phase
+    
+            - Flying: The dragon will fly towards the world origin.
+            - Hovering: The dragon will not move.
+            - Breath attack: The dragon will perform a breath attack while hovering.
+            - Dying: The dragon will disappear after a 10 second death animation.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetDragonPhase', (), {'Phase': phase}, target=target)
+
+    @staticmethod
+    def SetLlamaColor(llama_color: Literal["Brown", "Creamy", "White", "Gray"]="Brown", target: Target=DEFAULT_TARGET):
+        """
+        Sets a llama's fur color.
+    
+        :param str llama_color: Llama Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetLlamaColor', (), {'Llama Color': llama_color}, target=target)
+
+    @staticmethod
+    def SetVillagerBiome(biome: Literal["Desert", "Jungle", "Plains", "Savanna", "Snow", "Swamp", "Taiga"]="Desert", target: Target=DEFAULT_TARGET):
+        """
+        Sets the biome type of a villager. This affects their appearance only.
+    
+        :param str biome: Biome
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVillagerBiome', (), {'Biome': biome}, target=target)
+
+    @staticmethod
+    def SetCreeperFuse(fuse_ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the starting amount of ticks it takes for a creeper to explode.
+    
+        :param Number fuse_ticks: Fuse ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCreeperFuse', (fuse_ticks,), {}, target=target)
+
+    @staticmethod
+    def SetBaby(baby: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is a baby (permanently).
+    
+        :param str baby: Baby
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetBaby', (), {'Baby': baby}, target=target)
+
+    @staticmethod
+    def MooshroomType(mooshroom_variant: Literal["Red", "Brown"]="Red", target: Target=DEFAULT_TARGET):
+        """
+        Sets a mooshroom's skin type.
+    
+        :param str mooshroom_variant: Mooshroom Variant
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MooshroomType', (), {'Mooshroom Variant': mooshroom_variant}, target=target)
+
+    @staticmethod
+    def SetInvisible(invisible: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether an entity is invisible.
+    
+        :param str invisible: Invisible
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetInvisible', (), {'Invisible': invisible}, target=target)
+
+    @staticmethod
+    def SheepEat(target: Target=DEFAULT_TARGET):
+        """
+        Causes a sheep to eat grass.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SheepEat', (), {}, target=target)
+
+    @staticmethod
+    def SetCatResting(resting: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a cat appears to be lying down.
+    
+        :param str resting: Resting
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCatResting', (), {'Resting': resting}, target=target)
+
+    @staticmethod
+    def GivePotion(effect_to_give: list[Potion] | Potion, overwrite_effect: Literal["True", "False"]="True", effect_particles: Literal["Regular", "Ambient", "None"]="Regular", target: Target=DEFAULT_TARGET):
+        """
+        Gives one or more potion effects to an entity.
+    
+        :param list[Potion] | Potion effect_to_give: Effect(s) to give
+        :param str overwrite_effect: Overwrite Effect
+    
+            - True: Effects of the same type will always be replaced.
+            - False: Weaker effects of the same type will be hidden.
+        :param str effect_particles: Effect Particles
+    
+            - Ambient: Ambient particles are translucent.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'GivePotion', (effect_to_give,), {'Overwrite Effect': overwrite_effect, 'Effect Particles': effect_particles}, target=target)
+
+    @staticmethod
+    def SetGoatHorns(left_horn: Literal["Show", "Hide", "No Change"]="No Change", right_horn: Literal["Show", "Hide", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
+        """
+        Sets which goat horns are shown or hidden.
+    
+        :param str left_horn: Left Horn
+        :param str right_horn: Right Horn
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGoatHorns', (), {'Left Horn': left_horn, 'Right Horn': right_horn}, target=target)
+
+    @staticmethod
+    def SetGlowing(glowing: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether this entity has a glowing outline that can be seen through blocks.
+    
+        :param str glowing: Glowing
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetGlowing', (), {'Glowing': glowing}, target=target)
+
+    @staticmethod
+    def SetPandaOnBack(on_its_back: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a panda is laying on its back or not.
+    
+        :param str on_its_back: On Its Back
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetPandaOnBack', (), {'On Its Back': on_its_back}, target=target)
+
+    @staticmethod
+    def IDisplayModelType(model_type: Literal["None", "First Person Left Hand", "First Person Right Hand", "Third Person Left Hand", "Third Person Right Hand", "Head", "GUI", "Ground", "Fixed"]="None", target: Target=DEFAULT_TARGET):
+        """
+        Sets the model type of an item display.
+    
+        :param str model_type: Model Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'IDisplayModelType', (), {'Model Type': model_type}, target=target)
+
+    @staticmethod
+    def SetHealth(current_health: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's current health.
+    
+        :param Number current_health: Current health (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetHealth', (current_health,), {}, target=target)
+
+    @staticmethod
+    def BlockDisguise(block_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises an entity as a block.
+    
+        :param Item block_to_disguise_as: Block to disguise as
+        :param DFText | None display_name: Display name (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'BlockDisguise', (block_to_disguise_as, display_name,), {}, target=target)
+
+    @staticmethod
+    def AddVillagerTrade(result_item: Item, first_ingredient: Item, second_ingredient: Item | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Adds a trade to a villager.
+    
+        :param Item result_item: Result item
+        :param Item first_ingredient: First ingredient
+        :param Item | None second_ingredient: Second ingredient (optional)
+        :param Number | None maximum_uses: Maximum uses (optional) (Negative numbers are treated as infinite)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'AddVillagerTrade', (result_item, first_ingredient, second_ingredient, maximum_uses,), {}, target=target)
+
+    @staticmethod
+    def SetCollidable(collision: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a mob is able to collide with other entities.
+    
+        :param str collision: Collision
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCollidable', (), {'Collision': collision}, target=target)
+
+    @staticmethod
+    def ArmorStandPose(direction: DFVector | Number, y_rotation: Number | None=None, z_rotation: Number | None=None, armor_stand_part: Literal["Head", "Body", "Left Arm", "Right Arm", "Left Leg", "Right Leg"]="Head", target: Target=DEFAULT_TARGET):
+        """
+        Sets the rotation of an armor stand part.
+    
+        :param DFVector | Number direction: Direction OR X Rotation (0-360) (Default = 0)
+        :param Number | None y_rotation: Y Rotation (0-360) (optional) (Default = 0)
+        :param Number | None z_rotation: Z Rotation (0-360) (optional) (Default = 0)
+        :param str armor_stand_part: Armor Stand Part
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'ArmorStandPose', (direction, y_rotation, z_rotation,), {'Armor Stand Part': armor_stand_part}, target=target)
+
+    @staticmethod
+    def LaunchFwd(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", launch_axis: Literal["Pitch and Yaw", "Yaw Only"]="Pitch and Yaw", target: Target=DEFAULT_TARGET):
+        """
+        Launches an entity forward or backward.
+    
+        :param Number launch_power: Launch power
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param str launch_axis: Launch Axis
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'LaunchFwd', (launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Launch Axis': launch_axis}, target=target)
+
+    @staticmethod
+    def SetFallDistance(fall_distance: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets an entity's fall distance, affecting fall damage upon landing.
+    
+        :param Number fall_distance: Fall distance (blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFallDistance', (fall_distance,), {}, target=target)
+
+    @staticmethod
+    def MoveToLoc(target_location: Location | None, walk_speed: Number, target: Target=DEFAULT_TARGET):
+        """
+        Instructs a mob's AI to always pathfind to a certain location at a certain speed.
+    
+        :param Location | None target_location: Target location OR Stop moving)
+        :param Number walk_speed: Walk speed
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'MoveToLoc', (target_location, walk_speed,), {}, target=target)
+
+    @staticmethod
+    def TDisplayOpacity(text_opacity: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the text opacity of a text display.
+    
+        :param Number | None text_opacity: Text opacity (optional) (Default = 100)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplayOpacity', (text_opacity,), {}, target=target)
+
+    @staticmethod
+    def IDisplayItem(displayed_item: Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets the displayed item of an item display.
+    
+        :param Item displayed_item: Displayed item
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'IDisplayItem', (displayed_item,), {}, target=target)
+
+    @staticmethod
+    def AttackAnimation(animation_arm: Literal["Swing main arm", "Swing off arm"]="Swing main arm", target: Target=DEFAULT_TARGET):
+        """
+        Makes a mob perform an attack animation.
+    
+        :param str animation_arm: Animation Arm
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'AttackAnimation', (), {'Animation Arm': animation_arm}, target=target)
+
+    @staticmethod
+    def SnowmanPumpkin(pumpkin: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a snow golem is wearing a pumpkin.
+    
+        :param str pumpkin: Pumpkin
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SnowmanPumpkin', (), {'Pumpkin': pumpkin}, target=target)
+
+    @staticmethod
+    def SetCustomTag(tag_name: DFString, tag_value: Number | DFString, target: Target=DEFAULT_TARGET):
+        """
+        Sets the value of or creates a custom tag value.
+    
+        :param DFString tag_name: Tag name
+        :param Number | DFString tag_value: Tag value OR Tag value
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCustomTag', (tag_name, tag_value,), {}, target=target)
+
+    @staticmethod
+    def DisplayViewRange(view_range_in_blocks: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the view range of a display entity.
+    
+        :param Number | None view_range_in_blocks: View range in blocks (optional) (Default = 64)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'DisplayViewRange', (view_range_in_blocks,), {}, target=target)
+
+    @staticmethod
+    def PlayerDisguise(player_name_to_disguise_as: DFText, display_skin: Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises an entity as a player.
+    
+        :param DFText player_name_to_disguise_as: Player name to disguise as
+        :param Item | None display_skin: Display skin (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'PlayerDisguise', (player_name_to_disguise_as, display_skin,), {}, target=target)
+
+    @staticmethod
+    def SetItem(new_item: Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets the item of an item entity.
+    
+        :param Item new_item: New item
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetItem', (new_item,), {}, target=target)
+
+    @staticmethod
+    def SetVillagerTrade(trade_index: Number, result_item: Item, first_ingredient: Item, second_ingredient: Item | None=None, maximum_uses: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the villager trade at an index.
+    
+        :param Number trade_index: Trade index
+        :param Item result_item: Result item
+        :param Item first_ingredient: First Ingredient
+        :param Item | None second_ingredient: Second Ingredient (optional)
+        :param Number | None maximum_uses: Maximum uses (optional) (Default = Infinite)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVillagerTrade', (trade_index, result_item, first_ingredient, second_ingredient, maximum_uses,), {}, target=target)
+
+    @staticmethod
+    def Explode(target: Target=DEFAULT_TARGET):
+        """
+        Causes an entity to explode.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Explode', (), {}, target=target)
+
+    @staticmethod
+    def SetDigging(digging_type: Literal["Emerge", "Dig Down"]="Emerge", target: Target=DEFAULT_TARGET):
+        """
+        Makes a warden emerge or dig into the ground.
+    
+        :param str digging_type: Digging Type
+    
+            - Dig Down: The warden will not despawn after digging down.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetDigging', (), {'Digging Type': digging_type}, target=target)
+
+    @staticmethod
+    def SetArrowHitSound(sound_to_play: Sound, target: Target=DEFAULT_TARGET):
+        """
+        Sets the sound an arrow plays whenever it lands.
+    
+        :param Sound sound_to_play: Sound to play
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetArrowHitSound', (sound_to_play,), {}, target=target)
+
+    @staticmethod
+    def SetVexCharging(charging: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a vex is charging or not.
+    
+        :param str charging: Charging
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVexCharging', (), {'Charging': charging}, target=target)
+
+    @staticmethod
+    def SetVillagerExp(experience: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a villager's experience points, which affects their level.
+    
+        :param Number experience: Experience
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetVillagerExp', (experience,), {}, target=target)
+
+    @staticmethod
+    def IgniteCreeper(target: Target=DEFAULT_TARGET):
+        """
+        Ignites a creeper, causing it to explode after a fuse period.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'IgniteCreeper', (), {}, target=target)
+
+    @staticmethod
+    def SetCelebrating(celebrate: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Causes a mob to start or stop celebrating.
+    
+        :param str celebrate: Celebrate
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetCelebrating', (), {'Celebrate': celebrate}, target=target)
+
+    @staticmethod
+    def TDisplayText(displayed_text: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets the displayed text of a text display.
+    
+        :param list[DFText] | DFText displayed_text: Displayed text
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'TDisplayText', (displayed_text,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
+
+    @staticmethod
+    def SetHorseJump(strength: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a horse's jump strength.
+    
+        :param Number strength: Strength (0.0 (can't jump) to 2.0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetHorseJump', (strength,), {}, target=target)
+
+    @staticmethod
+    def HealthAttribute(value: Number | None=None, attribute: Literal["Maximum health", "Maximum absorption health", "Armor", "Armor toughness"]="Maximum health", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the entity's health-related attributes such as max health and armor defense points.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Maximum health: Base: 20.0 Range: 1.0-1024.0
+            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
+            - Armor: Base: 0.0 Range: 0.0-30.0
+            - Armor toughness: Base: 0.0 Range: 0.0-20.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'HealthAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def Ram(target_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Makes a goat ram the specified mob or player.
+    
+        :param DFString target_uuid: Target UUID
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'Ram', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetFoxType(fox_type: Literal["Red", "Snow"]="Red", target: Target=DEFAULT_TARGET):
+        """
+        Sets a fox's fur type.
+    
+        :param str fox_type: Fox Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('entity_action', 'SetFoxType', (), {'Fox Type': fox_type}, target=target)
+
+EA = EntityAction
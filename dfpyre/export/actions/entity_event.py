@@ -0,0 +1,204 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['EntityEvent', 'EE']
+
+class EntityEvent:
+    """
+    Used to execute code when an entity does something or when something happens to an entity.
+    """
+
+    @staticmethod
+    def EntityKillEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity kills another entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityKillEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityCombust(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity catches on fire.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityCombust', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockFall(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block affected by gravity turns into a falling block.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'BlockFall', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def NaturallySpawn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity spawns into the world naturally.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'NaturallySpawn', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ProjKillEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a projectile kills an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'ProjKillEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityDmgEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity damages another entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDmgEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def FallingBlockLand(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a falling block lands on the ground.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'FallingBlockLand', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityResurrect(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity resurrects with a totem of undying.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityResurrect', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ItemMerge(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when dropped items try to merge into a stack.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'ItemMerge', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityHeal(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity regains health.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityHeal', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Teleport(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity is teleported.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'Teleport', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ShootBow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity shoots a bow.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'ShootBow', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityDmg(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity takes damage.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDmg', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ProjDmgEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a projectile damages an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'ProjDmgEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityExplode(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity explodes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityExplode', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityDeath(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity dies by natural causes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'EntityDeath', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def VehicleDamage(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a vehicle entity (minecart or boat) is damaged.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'VehicleDamage', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Transform(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity turns into another or group of others for any reason.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'Transform', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def RegrowWool(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a sheep regrows its wool.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('entity_event', 'RegrowWool', ls_cancel), codeblocks, author)
+
+EE = EntityEvent
@@ -0,0 +1,684 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['PlayerEvent', 'PE']
+
+class PlayerEvent:
+    """
+    Used to execute code when something is done by (or happens to) a player.
+    """
+
+    @staticmethod
+    def ClickContainerSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player clicks a slot in a container.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ClickContainerSlot', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def CloseInv(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player closes an inventory.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'CloseInv', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StartFly(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player starts flying.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StartFly', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BreakBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player breaks a block.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'BreakBlock', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StartSprint(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player starts sprinting.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StartSprint', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def MobKillPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a mob kills a player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'MobKillPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Teleport(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player is teleported.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Teleport', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def VillagerTrade(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player trades with a villager.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'VillagerTrade', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ShootBow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player fires an arrow with a bow.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ShootBow', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ChangeSign(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player changes a sign.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ChangeSign', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StopFly(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player stops flying.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StopFly', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def TameEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player tames a mob.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'TameEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LeftClick(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player left clicks.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'LeftClick', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlayerTakeDmg(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player takes damage.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlayerTakeDmg', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ProjHit(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a projectile launched by a player hits a block, an entity, or another player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ProjHit', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def KillPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player kills another player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'KillPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def VehicleJump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player presses the jump key while riding a vehicle or other entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'VehicleJump', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ClickInvSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player clicks a slot inside their inventory.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ClickInvSlot', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Respawn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player respawns.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Respawn', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def SwapHands(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player swaps an item or items between their main hand and off hand.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'SwapHands', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PackLoad(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player finishes loading a plot resource pack.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PackLoad', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def DamageEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player damages an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'DamageEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Sneak(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player sneaks.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Sneak', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlayerHeal(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player regains health from any source.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlayerHeal', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ClickPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player right clicks another player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ClickPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Consume(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player eats or drinks an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Consume', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StartGlide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player starts gliding.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StartGlide', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def MovementKey(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player presses or releases movement keys.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'MovementKey', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Death(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player dies, not as a result of another player or entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Death', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlaceBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player places a block.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlaceBlock', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Walk(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code while a player is walking.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Walk', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PickUpItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player picks up an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PickUpItem', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Dismount(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player dismounts a vehicle or other entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Dismount', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def CloudImbuePlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an area of effect cloud applies its potion effect(s) to a player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'CloudImbuePlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Leave(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player leaves the plot.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Leave', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def DropItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player drops an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'DropItem', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LeftClickPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player left clicks another player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'LeftClickPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ChangeSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player changes their hotbar slot.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ChangeSlot', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ClickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player right clicks an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ClickEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player uses their Pick Block key bind on an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PickEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def HorseJump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player causes a horse to jump.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'HorseJump', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ShootProjectile(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player throws a projectile such as snowballs or eggs.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ShootProjectile', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Move(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player moves.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Move', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Unsneak(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player stops sneaking.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Unsneak', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlayerCombust(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player catches on fire.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlayerCombust', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Chat(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player sends a chat message.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Chat', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Fish(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player fishes an entity, player, or nothing.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Fish', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BreakItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player breaks an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'BreakItem', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlayerResurrect(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player resurrects with a totem of undying.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlayerResurrect', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def RightClick(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player right clicks while looking at a block or holding an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'RightClick', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Purchase(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player purchases a plot product.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Purchase', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ClickMenuSlot(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player clicks a slot in an inventory menu.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ClickMenuSlot', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Riptide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player throws a riptide trident.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Riptide', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StopGlide(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player stops gliding.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StopGlide', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def KillMob(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player kills a mob.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'KillMob', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Join(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player joins the plot.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Join', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def EntityDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when an entity damages a player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'EntityDmgPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def StopSprint(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player stops sprinting.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'StopSprint', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Jump(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player jumps.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Jump', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LoadCrossbow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player loads a crossbow.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'LoadCrossbow', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ProjDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a projectile damages a player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'ProjDmgPlayer', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Command(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player types a command on the plot.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Command', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LeftClickEntity(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player left clicks an entity.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'LeftClickEntity', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Exhaustion(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player gains exhaustion.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'Exhaustion', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PackDecline(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player declines a plot resource pack prompt.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PackDecline', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PickBlock(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player uses their Pick Block key bind on a block.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PickBlock', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlayerDmgPlayer(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a player damages another player.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('event', 'PlayerDmgPlayer', ls_cancel), codeblocks, author)
+
+PE = PlayerEvent
@@ -0,0 +1,875 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['GameAction', 'GA']
+
+class GameAction:
+    """
+    Used to do something related to the plot and everyone playing it.
+    """
+
+    @staticmethod
+    def FillContainer(container_location: Location, item_to_fill_with: list[Item] | Item, ):
+        """
+        Fills the container at a location with items.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_fill_with: Item(s) to fill with
+        
+        """
+        return CodeBlock.new_action('game_action', 'FillContainer', (container_location, item_to_fill_with,), {})
+
+    @staticmethod
+    def BreakBlock(block_to_break: list[Location] | Location, ):
+        """
+        Breaks the block at a location as if it was broken by a player.
+    
+        :param list[Location] | Location block_to_break: Block(s) to break
+        
+        """
+        return CodeBlock.new_action('game_action', 'BreakBlock', (block_to_break,), {})
+
+    @staticmethod
+    def ChangeSign(sign_location: Location, line_number: Number, new_text: DFText | None=None, sign_side: Literal["Front", "Back"]="Front", ):
+        """
+        Changes a line of text on a sign.
+    
+        :param Location sign_location: Sign location
+        :param Number line_number: Line number
+        :param DFText | None new_text: New text (optional)
+        :param str sign_side: Sign Side
+        
+        """
+        return CodeBlock.new_action('game_action', 'ChangeSign', (sign_location, line_number, new_text,), {'Sign Side': sign_side})
+
+    @staticmethod
+    def WebRequest(url_to_request: DFString, content_body: DFString | None=None, request_method: Literal["Post", "Get", "Put", "Delete"]="Post", content_type: Literal["text/plain", "application/json"]="text/plain", ):
+        """
+        Sends a web request to a URL.
+    
+        :param DFString url_to_request: URL to request
+        :param DFString | None content_body: Content body (optional)
+        :param str request_method: Request Method
+        :param str content_type: Content Type
+        
+        """
+        return CodeBlock.new_action('game_action', 'WebRequest', (url_to_request, content_body,), {'Request Method': request_method, 'Content Type': content_type})
+
+    @staticmethod
+    def SimulationDistance(simulation_distance: Number, ):
+        """
+        Sets the simulation distance in the world.
+    
+        :param Number simulation_distance: Simulation distance (Limit: 2-32)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SimulationDistance', (simulation_distance,), {})
+
+    @staticmethod
+    def SetEventDeathMsg(new_death_message: DFText, ):
+        """
+        Sets the death message in this event.
+    
+        :param DFText new_death_message: New death message
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventDeathMsg', (new_death_message,), {})
+
+    @staticmethod
+    def WriteTransaction(block_to_set: Item, corner_1: Location, corner_2: Location, block_data: DFString | None=None, ):
+        """
+        Adds blocks to the next transaction; a method of queuing up block operations so that they can be sent simultaneously.
+    
+        :param Item block_to_set: Block to set
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param DFString | None block_data: Block data (comma separated) (optional) (Example: "facing=up,half=top")
+        
+        """
+        return CodeBlock.new_action('game_action', 'WriteTransaction', (block_to_set, corner_1, corner_2, block_data,), {})
+
+    @staticmethod
+    def SetWorldTime(daylight_ticks: Number, ):
+        """
+        Sets the time in the world.
+    
+        :param Number daylight_ticks: Daylight ticks (Day: 1000)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetWorldTime', (daylight_ticks,), {})
+
+    @staticmethod
+    def SetBlockData(location: list[Location] | Location, block_data: list[DFString] | DFString, overwrite_existing_data: Literal["True", "False"]="False", ):
+        """
+        Sets a data tag value of the block at a location.
+    
+        :param list[Location] | Location location: Location
+        :param list[DFString] | DFString block_data: Block data (Example: "facing=up")
+        :param str overwrite_existing_data: Overwrite Existing Data
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetBlockData', (location, block_data,), {'Overwrite Existing Data': overwrite_existing_data})
+
+    @staticmethod
+    def Firework(firework_rocket: Item, spawn_location: Location, instant: Literal["True", "False"]="False", movement: Literal["Upwards", "Directional"]="Upwards", ):
+        """
+        Launches a firework rocket at a location.
+    
+        :param Item firework_rocket: Firework rocket
+        :param Location spawn_location: Spawn location
+        :param str instant: Instant
+    
+            - True: Instantly explodes.
+        :param str movement: Movement
+        
+        """
+        return CodeBlock.new_action('game_action', 'Firework', (firework_rocket, spawn_location,), {'Instant': instant, 'Movement': movement})
+
+    @staticmethod
+    def SetEventDamage(new_damage_amount: Number, ):
+        """
+        Sets the damage dealt in this event.
+    
+        :param Number new_damage_amount: New damage amount (❤ = 2 Health)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventDamage', (new_damage_amount,), {})
+
+    @staticmethod
+    def AdvanceWeather(has_weather_cycle: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets if this world has a natural weather cycle.
+    
+        :param str has_weather_cycle: Has Weather Cycle
+        
+        """
+        return CodeBlock.new_action('game_action', 'AdvanceWeather', (), {'Has Weather Cycle': has_weather_cycle})
+
+    @staticmethod
+    def FireSpreadRadius(radius_in_blocks: Number, ):
+        """
+        Sets the radius fire spreads around a player.
+    
+        :param Number radius_in_blocks: Radius in blocks (Set to -1 to disable fire spreading.)
+        
+        """
+        return CodeBlock.new_action('game_action', 'FireSpreadRadius', (radius_in_blocks,), {})
+
+    @staticmethod
+    def SpawnItem(item_to_spawn: list[Item] | Item, spawn_location: Location, custom_name: DFText | None=None, apply_item_motion: Literal["True", "False"]="True", ):
+        """
+        Spawns an item at a location.
+    
+        :param list[Item] | Item item_to_spawn: Item(s) to spawn
+        :param Location spawn_location: Spawn location
+        :param DFText | None custom_name: Custom name (optional)
+        :param str apply_item_motion: Apply Item Motion
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnItem', (item_to_spawn, spawn_location, custom_name,), {'Apply Item Motion': apply_item_motion})
+
+    @staticmethod
+    def SignColor(sign_location: Location, sign_side: Literal["Front", "Back"]="Front", text_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="Black", glowing: Literal["Enable", "Disable"]="Disable", ):
+        """
+        Changes the text color of a sign.
+    
+        :param Location sign_location: Sign location
+        :param str sign_side: Sign Side
+        :param str text_color: Text Color
+        :param str glowing: Glowing
+        
+        """
+        return CodeBlock.new_action('game_action', 'SignColor', (sign_location,), {'Sign Side': sign_side, 'Text Color': text_color, 'Glowing': glowing})
+
+    @staticmethod
+    def ShulkerBullet(spawn_location: Location, ):
+        """
+        Spawns a shulker bullet at a location.
+    
+        :param Location spawn_location: Spawn Location
+        
+        """
+        return CodeBlock.new_action('game_action', 'ShulkerBullet', (spawn_location,), {})
+
+    @staticmethod
+    def MobSpawning(mob_spawning: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets if this world spawns mobs.
+    
+        :param str mob_spawning: Mob Spawning
+        
+        """
+        return CodeBlock.new_action('game_action', 'MobSpawning', (), {'Mob Spawning': mob_spawning})
+
+    @staticmethod
+    def SetContainer(container_location: Location, item_to_set: list[Item] | Item, ):
+        """
+        Sets the contents of the container at a location.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_set: Item(s) to set
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetContainer', (container_location, item_to_set,), {})
+
+    @staticmethod
+    def SpawnInteraction(spawn_location: Location, hitbox_width: Number | None=None, hitbox_height: Number | None=None, responsive: Literal["Enable", "Disable"]="Disable", ):
+        """
+        Spawns an invisible hitbox with the specified size.
+    
+        :param Location spawn_location: Spawn location
+        :param Number | None hitbox_width: Hitbox width (optional)
+        :param Number | None hitbox_height: Hitbox height (optional)
+        :param str responsive: Responsive
+    
+            - Enable: Player swings main hand and plays the attack sound.
+            - Disable: No visual or audio response.
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnInteraction', (spawn_location, hitbox_width, hitbox_height,), {'Responsive': responsive})
+
+    @staticmethod
+    def SetItemInSlot(container_location: Location, item_to_set: Item | None=None, slot: Number=None, ):
+        """
+        Sets the item in a slot of the container at a location.
+    
+        :param Location container_location: Container location
+        :param Item | None item_to_set: Item to set (optional)
+        :param Number slot: Slot
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetItemInSlot', (container_location, item_to_set, slot,), {})
+
+    @staticmethod
+    def CloneRegion(corner_1: Location, corner_2: Location, position_to_copy_from: Location, position_to_paste_to: Location, ignore_air: Literal["True", "False"]="False", clone_block_entities: Literal["True", "False"]="True", ):
+        """
+        Copies a region of blocks to another region, including air.
+    
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param Location position_to_copy_from: Position to copy from
+        :param Location position_to_paste_to: Position to paste to
+        :param str ignore_air: Ignore Air
+        :param str clone_block_entities: Clone Block Entities
+    
+            - True: Blocks such as chests will have their contents saved.  This takes up more server CPU.
+            - False: Blocks such as chests will not have their contents saved.
+        
+        """
+        return CodeBlock.new_action('game_action', 'CloneRegion', (corner_1, corner_2, position_to_copy_from, position_to_paste_to,), {'Ignore Air': ignore_air, 'Clone Block Entities': clone_block_entities})
+
+    @staticmethod
+    def UncancelEvent():
+        """
+        Uncancels the initial event that triggered this line of code.
+    
+        
+        """
+        return CodeBlock.new_action('game_action', 'UncancelEvent', (), {})
+
+    @staticmethod
+    def SetLecternBook(lectern_location: Location, book_to_put: Item | None=None, displayed_page: Number | None=None, ):
+        """
+        Sets the book and the displayed page of a Lectern.
+    
+        :param Location lectern_location: Lectern location
+        :param Item | None book_to_put: Book to put (optional)
+        :param Number | None displayed_page: Displayed page (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetLecternBook', (lectern_location, book_to_put, displayed_page,), {})
+
+    @staticmethod
+    def SpawnArmorStand(spawn_location: Location, custom_name: DFText | None=None, equipment: list[Item] | Item | None=None, visibility: Literal["Visible", "Visible (No hitbox)", "Invisible", "Invisible (No hitbox)"]="Visible", ):
+        """
+        Spawns an armor stand at a location.
+    
+        :param Location spawn_location: Spawn location
+        :param DFText | None custom_name: Custom name (optional)
+        :param list[Item] | Item | None equipment: Equipment (optional)
+        :param str visibility: Visibility
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnArmorStand', (spawn_location, custom_name, equipment,), {'Visibility': visibility})
+
+    @staticmethod
+    def SpawnBlockDisp(spawn_location: Location, displayed_block: Item, block_data: list[DFString] | DFString | None=None, ):
+        """
+        Spawns a block display entity.
+    
+        :param Location spawn_location: Spawn location
+        :param Item displayed_block: Displayed block
+        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnBlockDisp', (spawn_location, displayed_block, block_data,), {})
+
+    @staticmethod
+    def RedstoneStrength(new_current_strength: Number, ):
+        """
+        Sets the current strength in this event.
+    
+        :param Number new_current_strength: New current strength (Range: 0-15)
+        
+        """
+        return CodeBlock.new_action('game_action', 'RedstoneStrength', (new_current_strength,), {})
+
+    @staticmethod
+    def ClearContainer(container_location: Location, ):
+        """
+        Empties a container at a location.
+    
+        :param Location container_location: Container location
+        
+        """
+        return CodeBlock.new_action('game_action', 'ClearContainer', (container_location,), {})
+
+    @staticmethod
+    def TraderSpawning(trader_spawning: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets if this world spawns wandering traders.
+    
+        :param str trader_spawning: Trader Spawning
+        
+        """
+        return CodeBlock.new_action('game_action', 'TraderSpawning', (), {'Trader Spawning': trader_spawning})
+
+    @staticmethod
+    def CancelEvent():
+        """
+        Cancels the initial event that triggered this line of code.
+    
+        
+        """
+        return CodeBlock.new_action('game_action', 'CancelEvent', (), {})
+
+    @staticmethod
+    def SpawnFangs(spawn_location: Location, custom_name: DFText | None=None, ):
+        """
+        Spawns evoker fangs at a location.
+    
+        :param Location spawn_location: Spawn location
+        :param DFText | None custom_name: Custom name (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnFangs', (spawn_location, custom_name,), {})
+
+    @staticmethod
+    def SetEventSound(new_sound: Sound, ):
+        """
+        Sets the sound to play for this event, replacing the original sound.
+    
+        :param Sound new_sound: New sound
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventSound', (new_sound,), {})
+
+    @staticmethod
+    def SetEventXP(experience: Number, ):
+        """
+        Sets the amount of experience this event should drop.
+    
+        :param Number experience: Experience
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventXP', (experience,), {})
+
+    @staticmethod
+    def LockContainer(container_location: Location, lock_key: DFString | None=None, ):
+        """
+        Sets the lock key of the container at a location.
+    
+        :param Location container_location: Container location
+        :param DFString | None lock_key: Lock key OR Unlocks the container)
+        
+        """
+        return CodeBlock.new_action('game_action', 'LockContainer', (container_location, lock_key,), {})
+
+    @staticmethod
+    def SetExhaustion(new_exhaustion_amount: Number, ):
+        """
+        Sets the exhaustion  gained in this event.
+    
+        :param Number new_exhaustion_amount: New exhaustion amount
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetExhaustion', (new_exhaustion_amount,), {})
+
+    @staticmethod
+    def AdvanceTime(advance_time: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets if this world has a natural time cycle.
+    
+        :param str advance_time: Advance Time
+        
+        """
+        return CodeBlock.new_action('game_action', 'AdvanceTime', (), {'Advance Time': advance_time})
+
+    @staticmethod
+    def ClearItems(container_location: Location, item_to_clear: list[Item] | Item, ):
+        """
+        Removes all of an item from the container at a location.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_clear: Item(s) to clear
+        
+        """
+        return CodeBlock.new_action('game_action', 'ClearItems', (container_location, item_to_clear,), {})
+
+    @staticmethod
+    def SetFurnaceSpeed(furnace_location: Location, ticks: Number, ):
+        """
+        Sets the amount of ticks it takes for a furnace block to cook an item.
+    
+        :param Location furnace_location: Furnace location
+        :param Number ticks: Ticks
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetFurnaceSpeed', (furnace_location, ticks,), {})
+
+    @staticmethod
+    def BlockDropsOn():
+        """
+        Enables blocks dropping as items when broken.
+    
+        
+        """
+        return CodeBlock.new_action('game_action', 'BlockDropsOn', (), {})
+
+    @staticmethod
+    def SpawnMannequin(mannequin_player_head: Item | DFString, spawn_location: Location, description: DFText | None=None, movable: Literal["True", "False"]="True", main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", ):
+        """
+        Spawns a mannequin at a location.
+    
+        :param Item | DFString mannequin_player_head: Mannequin player head OR Mannequin player name or UUID
+        :param Location spawn_location: Spawn location
+        :param DFText | None description: Description (optional) (Only shown if name is visible)
+        :param str movable: Movable
+        :param str main_hand: Main Hand
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnMannequin', (mannequin_player_head, spawn_location, description,), {'Movable': movable, 'Main Hand': main_hand})
+
+    @staticmethod
+    def ViewDistance(view_distance: Number, ):
+        """
+        Sets the view distance in the world.
+    
+        :param Number view_distance: View distance (Limit: 2-32)
+        
+        """
+        return CodeBlock.new_action('game_action', 'ViewDistance', (view_distance,), {})
+
+    @staticmethod
+    def BoneMeal(block_to_bone_meal: list[Location] | Location, number_of_uses: Number | None=None, show_particles: Literal["True", "False"]="True", ):
+        """
+        Applies bone meal to a block.
+    
+        :param list[Location] | Location block_to_bone_meal: Block(s) to bone meal
+        :param Number | None number_of_uses: Number of uses (optional)
+        :param str show_particles: Show Particles
+        
+        """
+        return CodeBlock.new_action('game_action', 'BoneMeal', (block_to_bone_meal, number_of_uses,), {'Show Particles': show_particles})
+
+    @staticmethod
+    def FallingBlock(block_location: Location, block_material: Item | None=None, block_data: list[DFString] | DFString | None=None, hurt_hit_entities: Literal["True", "False"]="False", reform_on_impact: Literal["True", "False"]="True", ):
+        """
+        Spawns a falling block at a location.
+    
+        :param Location block_location: Block location
+        :param Item | None block_material: Block material OR Converts the block at the location to a falling block)
+        :param list[DFString] | DFString | None block_data: Block data (optional)
+        :param str hurt_hit_entities: Hurt Hit Entities
+        :param str reform_on_impact: Reform on Impact
+        
+        """
+        return CodeBlock.new_action('game_action', 'FallingBlock', (block_location, block_material, block_data,), {'Hurt Hit Entities': hurt_hit_entities, 'Reform on Impact': reform_on_impact})
+
+    @staticmethod
+    def SetDisplayedItem(item_to_display: Item, ):
+        """
+        Sets the item displayed in this event.
+    
+        :param Item item_to_display: Item to display
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetDisplayedItem', (item_to_display,), {})
+
+    @staticmethod
+    def DiscordWebhook(webhook_url: DFString, message_content: DFString, ):
+        """
+        Sends a message to a Discord webhook.
+    
+        :param DFString webhook_url: Webhook URL
+        :param DFString message_content: Message content
+        
+        """
+        return CodeBlock.new_action('game_action', 'DiscordWebhook', (webhook_url, message_content,), {})
+
+    @staticmethod
+    def TickBlock(block_to_tick: list[Location] | Location, number_of_ticks: Number | None=None, ):
+        """
+        Causes a block to get "random ticked", which could cause a block update.
+    
+        :param list[Location] | Location block_to_tick: Block(s) to tick
+        :param Number | None number_of_ticks: Number of ticks (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'TickBlock', (block_to_tick, number_of_ticks,), {})
+
+    @staticmethod
+    def ReplaceItems(container_location: Location, item_to_replace: list[Item] | Item | None=None, item_to_replace_with: Item=None, items_amount: Number | None=None, ):
+        """
+        Replaces items in the container at a location with the given item.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item | None item_to_replace: Item(s) to replace (optional)
+        :param Item item_to_replace_with: Item to replace with
+        :param Number | None items_amount: Amount of items to replace (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'ReplaceItems', (container_location, item_to_replace, item_to_replace_with, items_amount,), {})
+
+    @staticmethod
+    def SetEventProj(projectile_to_launch: Item | None=None, ):
+        """
+        Replaces the projectile fired in the Shoot Bow Event.
+    
+        :param Item | None projectile_to_launch: Projectile to launch (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventProj', (projectile_to_launch,), {})
+
+    @staticmethod
+    def RandomTickSpeed(tick_speed: Number, ):
+        """
+        Sets the random tick speed  in the world.
+    
+        :param Number tick_speed: Tick speed
+        
+        """
+        return CodeBlock.new_action('game_action', 'RandomTickSpeed', (tick_speed,), {})
+
+    @staticmethod
+    def Explosion(explosion_location: Location, explosion_power: Number | None=None, ):
+        """
+        Creates an explosion at a location.
+    
+        :param Location explosion_location: Explosion location
+        :param Number | None explosion_power: Explosion power (0-4) (optional) (Default = 4)
+        
+        """
+        return CodeBlock.new_action('game_action', 'Explosion', (explosion_location, explosion_power,), {})
+
+    @staticmethod
+    def SpawnMob(mob_type: Item, spawn_location: Location, health: Number | None=None, custom_name: DFText | None=None, effect: list[Potion] | Potion | None=None, equipment: list[Item] | Item | None=None, ):
+        """
+        Spawns a mob at a location.
+    
+        :param Item mob_type: Mob type
+        :param Location spawn_location: Spawn location
+        :param Number | None health: Health (optional)
+        :param DFText | None custom_name: Custom name (optional)
+        :param list[Potion] | Potion | None effect: Effect(s) (optional)
+        :param list[Item] | Item | None equipment: Equipment (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnMob', (mob_type, spawn_location, health, custom_name, effect, equipment,), {})
+
+    @staticmethod
+    def SetBrushableItem(block_location: Location, item: Item | None=None, ):
+        """
+        Sets the item buried in a suspicious sand or gravel.
+    
+        :param Location block_location: Block location
+        :param Item | None item: Item (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetBrushableItem', (block_location, item,), {})
+
+    @staticmethod
+    def SpawnEnderEye(location_to_spawn_at: Location, destination: Location | None=None, lifespan: Number | None=None, custom_name: DFText | None=None, end_of_lifespan: Literal["Drop item", "Shatter", "Random"]="Random", ):
+        """
+        Spawns an eye of ender at a location, which (if specified) will float towards its destination.
+    
+        :param Location location_to_spawn_at: Location to spawn at
+        :param Location | None destination: Destination (optional)
+        :param Number | None lifespan: Lifespan (ticks) (optional)
+        :param DFText | None custom_name: Custom name (optional)
+        :param str end_of_lifespan: End of Lifespan
+    
+            - Drop item: The eye always drops itself as an item.
+            - Shatter: The eye always shatters.
+            - Random: The eye has a 20% chance of shattering.
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnEnderEye', (location_to_spawn_at, destination, lifespan, custom_name,), {'End of Lifespan': end_of_lifespan})
+
+    @staticmethod
+    def SpawnPotionCloud(spawn_location: Location, effect_to_apply: list[Potion] | Potion | None=None, custom_name: DFText | None=None, radius: Number | None=None, duration: Number | None=None, ):
+        """
+        Spawns a lingering potion cloud at a location that imbues effects onto entities who enter it.
+    
+        :param Location spawn_location: Spawn location
+        :param list[Potion] | Potion | None effect_to_apply: Effect to apply (optional)
+        :param DFText | None custom_name: Custom name (optional)
+        :param Number | None radius: Radius (blocks) (optional) (Default = 3)
+        :param Number | None duration: Duration (ticks) (optional) (Default = 200)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnPotionCloud', (spawn_location, effect_to_apply, custom_name, radius, duration,), {})
+
+    @staticmethod
+    def LaunchProj(projectile_to_launch: Item, launch_point: Location, custom_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, ):
+        """
+        Launches a projectile.
+    
+        :param Item projectile_to_launch: Projectile to launch
+        :param Location launch_point: Launch point
+        :param DFText | None custom_name: Custom name (optional)
+        :param Number | None speed: Speed (optional)
+        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
+        
+        """
+        return CodeBlock.new_action('game_action', 'LaunchProj', (projectile_to_launch, launch_point, custom_name, speed, inaccuracy,), {})
+
+    @staticmethod
+    def SetBlock(block_to_set: Item, block_location: list[Location] | Location, block_data: list[DFString] | DFString | None=None, ):
+        """
+        Sets the block at a location.
+    
+        :param Item block_to_set: Block to set
+        :param list[Location] | Location block_location: Block location(s)
+        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
+        
+        """
+        return CodeBlock.new_action('game_action', ' SetBlock ', (block_to_set, block_location, block_data,), {})
+
+    @staticmethod
+    def SpawnItemDisp(spawn_location: Location, displayed_item: Item, ):
+        """
+        Spawns an item display entity.
+    
+        :param Location spawn_location: Spawn location
+        :param Item displayed_item: Displayed item
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnItemDisp', (spawn_location, displayed_item,), {})
+
+    @staticmethod
+    def SetBlockGrowth(block_location: Location, growth_stage: Number | None=None, growth_unit: Literal["Growth Stage Number", "Growth Percentage"]="Growth Stage Number", ):
+        """
+        Sets the growth stage of the block (eg. carrots) at a location.
+    
+        :param Location block_location: Block location
+        :param Number | None growth_stage: Growth stage (optional) (Default = 0)
+        :param str growth_unit: Growth Unit
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetBlockGrowth', (block_location, growth_stage,), {'Growth Unit': growth_unit})
+
+    @staticmethod
+    def SetContainerName(container_location: Location, name: DFText, ):
+        """
+        Sets the name of the container at a location.
+    
+        :param Location container_location: Container location
+        :param DFText name: Name
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetContainerName', (container_location, name,), {})
+
+    @staticmethod
+    def SetHead(head_location: Location, player_head: Item | DFString, ):
+        """
+        Sets the block at a location to a player head.
+    
+        :param Location head_location: Head location
+        :param Item | DFString player_head: Player Head OR Head owner (Player name or UUID)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetHead', (head_location, player_head,), {})
+
+    @staticmethod
+    def RemoveItems(container_location: Location, item_to_remove: list[Item] | Item, ):
+        """
+        Removes items from the container at a location.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_remove: Item(s) to remove
+        
+        """
+        return CodeBlock.new_action('game_action', 'RemoveItems', (container_location, item_to_remove,), {})
+
+    @staticmethod
+    def SetRegion(block_to_set: Item, corner_1: Location, corner_2: Location, block_data: DFString | None=None, ):
+        """
+        Fills a region with a type of block.
+    
+        :param Item block_to_set: Block to set
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param DFString | None block_data: Block data (comma separated) (optional) (Example: "facing=up,half=top")
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetRegion', (block_to_set, corner_1, corner_2, block_data,), {})
+
+    @staticmethod
+    def VineSpreading(vine_spreading: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets if this world spreads vines.
+    
+        :param str vine_spreading: Vine Spreading
+        
+        """
+        return CodeBlock.new_action('game_action', 'VineSpreading', (), {'Vine Spreading': vine_spreading})
+
+    @staticmethod
+    def SpawnTNT(spawn_location: Location, tnt_power: Number | None=None, fuse_duration: Number | None=None, custom_name: DFText | None=None, ):
+        """
+        Spawns primed TNT at a location.
+    
+        :param Location spawn_location: Spawn location
+        :param Number | None tnt_power: TNT power (0-4) (optional) (Default = 4)
+        :param Number | None fuse_duration: Fuse duration (optional) (Default = 80)
+        :param DFText | None custom_name: Custom name (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnTNT', (spawn_location, tnt_power, fuse_duration, custom_name,), {})
+
+    @staticmethod
+    def SpawnExpOrb(spawn_location: Location, experience_amount: Number | None=None, custom_name: DFText | None=None, ):
+        """
+        Spawns an experience orb at a location.
+    
+        :param Location spawn_location: Spawn location
+        :param Number | None experience_amount: Experience amount (optional)
+        :param DFText | None custom_name: Custom name (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnExpOrb', (spawn_location, experience_amount, custom_name,), {})
+
+    @staticmethod
+    def SetBiome(corner_1: Location, corner_2: Location, biome_to_set: DFString, ):
+        """
+        Sets the biome of a region.
+    
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param DFString biome_to_set: Biome to set (Example: "basalt_deltas", "plains")
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetBiome', (corner_1, corner_2, biome_to_set,), {})
+
+    @staticmethod
+    def SetEventHeal(new_healing_amount: Number, ):
+        """
+        Sets the amount of health regained in this event.
+    
+        :param Number new_healing_amount: New healing amount (❤ = 2 Health)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetEventHeal', (new_healing_amount,), {})
+
+    @staticmethod
+    def ApplyTransaction():
+        """
+        Applies the current transaction and generates a new one.
+    
+        
+        """
+        return CodeBlock.new_action('game_action', 'ApplyTransaction', (), {})
+
+    @staticmethod
+    def GenerateTree(tree_location: Location, tree_type: Literal["Oak Tree", "Big Oak Tree", "Swamp Tree", "Spruce Tree", "Slightly Taller Spruce Tree", "Big Spruce Tree", "Birch Tree", "Tall Birch Tree", "Jungle Tree", "Big Jungle Tree", "Jungle Bush", "Acacia Tree", "Dark Oak Tree", "Pale Oak Tree", "Creaking Pale Oak Tree", "Mangrove Tree", "Tall Mangrove Tree", "Cherry Tree", "Azalea Tree", "Red Mushroom", "Brown Mushroom", "Crimson Fungus", "Warped Fungus", "Chorus Plant"]="Oak Tree", ):
+        """
+        Generates a tree at a location.
+    
+        :param Location tree_location: Tree location (bottom log block)
+        :param str tree_type: Tree Type
+        
+        """
+        return CodeBlock.new_action('game_action', 'GenerateTree', (tree_location,), {'Tree Type': tree_type})
+
+    @staticmethod
+    def SpawnCrystal(spawn_location: Location, custom_name: DFText | None=None, show_bottom: Literal["True", "False"]="True", ):
+        """
+        Spawns an end crystal at a location.
+    
+        :param Location spawn_location: Spawn location
+        :param DFText | None custom_name: Custom name (optional)
+        :param str show_bottom: Show Bottom
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnCrystal', (spawn_location, custom_name,), {'Show Bottom': show_bottom})
+
+    @staticmethod
+    def SetCampfireItem(campfire_location: Location, campfire_item: Item, cooking_time: Number | None=None, campfire_slot: Literal["1", "2", "3", "4"]="1", ):
+        """
+        Sets the item being cooked in one of a campfire's slots.
+    
+        :param Location campfire_location: Campfire location
+        :param Item campfire_item: Campfire item
+        :param Number | None cooking_time: Cooking time (ticks) (optional) (Default = 600)
+        :param str campfire_slot: Campfire Slot
+    
+            - 1: Sets the item on the southwest corner of the campfire.
+            - 2: Sets the item on the northwest corner of the campfire.
+            - 3: Sets the item on the northeast corner of the campfire.
+            - 4: Sets the item on the southeast corner of the campfire.
+        
+        """
+        return CodeBlock.new_action('game_action', 'SetCampfireItem', (campfire_location, campfire_item, cooking_time,), {'Campfire Slot': campfire_slot})
+
+    @staticmethod
+    def SpawnTextDisplay(spawn_location: Location, displayed_text: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", ):
+        """
+        Spawns a text display entity.
+    
+        :param Location spawn_location: Spawn location
+        :param list[DFText] | DFText displayed_text: Displayed text
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnTextDisplay', (spawn_location, displayed_text,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles})
+
+    @staticmethod
+    def SpawnVehicle(vehicle_type: Item, spawn_location: Location, custom_name: DFText | None=None, ):
+        """
+        Spawns a vehicle at a location.
+    
+        :param Item vehicle_type: Vehicle type
+        :param Location spawn_location: Spawn location
+        :param DFText | None custom_name: Custom name (optional)
+        
+        """
+        return CodeBlock.new_action('game_action', 'SpawnVehicle', (vehicle_type, spawn_location, custom_name,), {})
+
+    @staticmethod
+    def Lightning(impact_location: Location, ):
+        """
+        Strikes lightning at a location.
+    
+        :param Location impact_location: Impact location
+        
+        """
+        return CodeBlock.new_action('game_action', 'Lightning', (impact_location,), {})
+
+    @staticmethod
+    def BlockDropsOff():
+        """
+        Disables blocks dropping as items when broken.
+    
+        
+        """
+        return CodeBlock.new_action('game_action', 'BlockDropsOff', (), {})
+
+GA = GameAction
@@ -0,0 +1,364 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['GameEvent', 'GE']
+
+class GameEvent:
+    """
+    Used to execute code when something happens in the world.
+    """
+
+    @staticmethod
+    def CauldronChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a cauldron's level or contents changes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'CauldronChange', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def FurnaceBurn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a furnace consumes fuel.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'FurnaceBurn', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LeavesDecay(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when leaves decay.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'LeavesDecay', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockIgnite(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block ignites.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockIgnite', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def CrafterCraft(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a crafter crafts an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'CrafterCraft', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ChunkLoad(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a chunk is loaded.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'ChunkLoad', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockGrow(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block grows naturally.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockGrow', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BeaconActivated(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a beacon is activated.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BeaconActivated', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockExplode(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block explodes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockExplode', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockDispense(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block dispenses an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockDispense', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PistonRetract(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a piston retracts.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'PistonRetract', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def VaultDisplayItem(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a vault displays an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'VaultDisplayItem', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def FluidLevelChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a liquid's level changes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'FluidLevelChange', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockFertilize(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block is fertilized.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockFertilize', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def SpongeAbsorb(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a sponge absorbs water.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'SpongeAbsorb', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PistonExtend(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a piston extends.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'PistonExtend', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def SculkBloom(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a sculk catalyst blooms.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'SculkBloom', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockFade(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block fades.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockFade', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def VaultChangeState(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a vault changes its state.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'VaultChangeState', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def CampfireStart(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a campfire starts cooking.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'CampfireStart', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlotShutdown(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a plot no longer has players and is shutting down.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'PlotShutdown', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def ChunkUnload(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a chunk is unloaded.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'ChunkUnload', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockSpread(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block spreads.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockSpread', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def NotePlay(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a note block plays a note.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'NotePlay', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Redstone(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a redstone current changes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'Redstone', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockMove(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block moves.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockMove', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def MoistureChange(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when soil moisture changes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'MoistureChange', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BellRing(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a bell is rung.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BellRing', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def LagSlayRecover(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a plot recovers from a LagSlayer halt.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'LagSlayRecover', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockBurn(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block is destroyed by fire.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockBurn', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def PlotStartup(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a plot is first started.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'PlotStartup', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def TNTPrime(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when TNT is ignited.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'TNTPrime', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockForm(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block is formed, typically through natural means.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockForm', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def Brew(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when brewing completes.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'Brew', ls_cancel), codeblocks, author)
+
+    @staticmethod
+    def BlockCook(codeblocks: list[CodeBlock]=[], ls_cancel: bool=False, author: str|None=None):
+        """
+        Executes code when a block cooks an item.
+    
+    :param list[CodeBlock] codeblocks: The list of codeblocks in this template.
+        :param str|None author: The author of this template.
+        """
+        return assemble_template(CodeBlock.new_event('game_event', 'BlockCook', ls_cancel), codeblocks, author)
+
+GE = GameEvent
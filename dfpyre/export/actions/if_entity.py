@@ -0,0 +1,217 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['IfEntity', 'IE']
+
+class IfEntity:
+    """
+    Used to execute the code inside it if a certain condition related to an entity or multiple entities is met.
+    """
+
+    @staticmethod
+    def IsVehicle(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is a boat or minecart.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsVehicle', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsGrounded(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is supported by a block.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsGrounded', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsType(spawn_egg_projectile_or_vehicle: list[Item] | Item, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is the given type.
+    
+        :param list[Item] | Item spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsType', (spawn_egg_projectile_or_vehicle,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsProj(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is a projectile.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsProj', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsMob(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is a mob.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsMob', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasCustomTag(tag_name: DFString, tag_value: Number | DFString | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity has a given custom tag, and (if provided) whether the tag matches the given value.
+    
+        :param DFString tag_name: Tag name
+        :param Number | DFString | None tag_value: Tag value OR Tag value (optional)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'HasCustomTag', (tag_name, tag_value,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsSheared(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a sheep is sheared.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsSheared', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsItem(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is an item.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsItem', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsRiding(spawn_egg_projectile_or_vehicle: list[Item | DFString] | Item | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is riding another entity.
+    
+        :param list[Item | DFString] | Item | DFString | None spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle OR Entity UUID OR Checks if riding any entity
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', ' IsRiding ', (spawn_egg_projectile_or_vehicle,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
+
+    @staticmethod
+    def Exists(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity still exists in the world.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'Exists', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsHitboxNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity's hitbox is within a range of a location.
+    
+        :param list[Location] | Location center_location: Center location
+        :param Number | None range: Range (optional) (Default = 5 blocks)
+        :param str shape: Shape
+    
+            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
+            - Circle: Checks if √(X²+Z²) is within the radius.
+            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
+            - Square: Checks if the distance on the X or Z axis is within the radius.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsHitboxNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is within a range of a location.
+    
+        :param list[Location] | Location center_location: Center location
+        :param Number | None range: Range (optional) (Default = 5 blocks)
+        :param str shape: Shape
+    
+            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
+            - Circle: Checks if √(X²+Z²) is within the radius.
+            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
+            - Square: Checks if the distance on the X or Z axis is within the radius.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'IsNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasPotion(effect_to_check_for: list[Potion] | Potion, check_properties: Literal["None", "Amplifier", "Duration", "Amplifier and duration"]="None", check_mode: Literal["Has any effect", "Has all effects"]="Has any effect", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity has a potion effect of a certain type active.
+    
+        :param list[Potion] | Potion effect_to_check_for: Effect(s) to check for
+        :param str check_properties: Check Properties
+    
+            - None: Checks only if the effect type matches.
+            - Amplifier: The amplifier of the entity's effect must be equal or higher.
+            - Duration: The duration of the entity's effect must be equal or higher.
+            - Amplifier and duration: The amplifier and duration of the entity's effect must be equal or higher.
+        :param str check_mode: Check Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'HasPotion', (effect_to_check_for,), {'Check Properties': check_properties, 'Check Mode': check_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def NameEquals(uuid_to_check_for: list[DFString] | DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity's name or custom name is equal to the given text.
+    
+        :param list[DFString] | DFString uuid_to_check_for: UUID to check for
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', 'NameEquals', (uuid_to_check_for,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
+
+    @staticmethod
+    def StandingOn(block_to_check_for: list[Item | Location] | Item | Location, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an entity is standing on the given block or location.
+    
+        :param list[Item | Location] | Item | Location block_to_check_for: Block to check for OR Location to check for
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_entity', ' StandingOn ', (block_to_check_for,), {}, inverted, target), codeblocks)
+
+IE = IfEntity
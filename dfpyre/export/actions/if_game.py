@@ -0,0 +1,218 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['IfGame', 'IG']
+
+class IfGame:
+    """
+    Used to execute the code inside it if a certain condition related to the plot is met.
+    """
+
+    @staticmethod
+    def HasRoomForItem(container_location: Location, item_to_check_with: Item | None=None, check_mode: Literal["Has Room for Any Item", "Has Room for All Items"]="Has Room for Any Item", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the container at a location has room for one or more items to be given.
+    
+        :param Location container_location: Container location
+        :param Item | None item_to_check_with: Item(s) to check with OR Checks for empty slot
+        :param str check_mode: Check Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'HasRoomForItem', (container_location, item_to_check_with,), {'Check Mode': check_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def EventBlockEquals(block_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the block in a block related event is the given block.
+    
+        :param list[Item] | Item block_to_check_for: Block(s) to check for
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'EventBlockEquals', (block_to_check_for,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def CommandEquals(string_to_check_for: list[DFString] | DFString, check_mode: Literal["Check entire command", "Check beginning"]="Check entire command", ignore_case: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the command entered in the Command Event is equal to the given string.
+    
+        :param list[DFString] | DFString string_to_check_for: String(s) to check for
+        :param str check_mode: Check Mode
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'CommandEquals', (string_to_check_for,), {'Check Mode': check_mode, 'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def EventItemEquals(item_to_check_for: list[Item] | Item, comparison_mode: Literal["Exactly equals", "Ignore stack size/durability", "Material only"]="Ignore stack size/durability", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the item in a item related event is the given item.
+    
+        :param list[Item] | Item item_to_check_for: Item(s) to check for
+        :param str comparison_mode: Comparison Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'EventItemEquals', (item_to_check_for,), {'Comparison Mode': comparison_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def SignHasTxt(sign_location: Location, text_to_check_for: list[DFText] | DFText, sign_line: Literal["1", "2", "3", "4", "All lines"]="All lines", sign_side: Literal["Front", "Back"]="Front", check_mode: Literal["Contains", "Equals"]="Contains", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the sign at a location has the given text.
+    
+        :param Location sign_location: Sign location
+        :param list[DFText] | DFText text_to_check_for: Text to check for (Formatting is ignored.)
+        :param str sign_line: Sign Line
+        :param str sign_side: Sign Side
+        :param str check_mode: Check Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', ' SignHasTxt ', (sign_location, text_to_check_for,), {'Sign Line': sign_line, 'Sign Side': sign_side, 'Check Mode': check_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def AttackIsCrit(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an event attack is critical.
+    
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'AttackIsCrit', (), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ContainerHas(container_location: Location, item_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the container at a location has the given item.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_check_for: Item(s) to check for
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'ContainerHas', (container_location, item_to_check_for,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def EventChunkNew(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the chunk being loaded in this event is a new chunk.
+    
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'EventChunkNew', (), {}, inverted), codeblocks)
+
+    @staticmethod
+    def BlockEquals(check_location: Location, block_to_check_for: list[Item] | Item | None=None, block_data: list[DFString] | DFString | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the block at a location is the given block.
+    
+        :param Location check_location: Check location
+        :param list[Item] | Item | None block_to_check_for: Block(s) to check for (optional)
+        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up")
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'BlockEquals', (check_location, block_to_check_for, block_data,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def InBlock(check_location: Location, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a location collides with the hitbox of the nearest block.
+    
+        :param Location check_location: Check location
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'InBlock', (check_location,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def MovementKey(movement_key: Literal["Forward (W)", "Backward (S)", "Left (A)", "Right (D)", "Jump (Space)", "Sneak (Left Shift)", "Sprint (Left Control)"]="Forward (W)", action: Literal["Just pressed", "Just released"]="Just pressed", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if specific movement keys changed state in the current event.
+    
+        :param str movement_key: Movement Key
+        :param str action: Action
+    
+            - Just pressed: The key was just pressed in this event call.
+            - Just released: The key was just released in this event call.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'MovementKey', (), {'Movement Key': movement_key, 'Action': action}, inverted), codeblocks)
+
+    @staticmethod
+    def BlockPowered(check_location: list[Location] | Location, redstone_power_mode: Literal["Direct power", "Indirect power"]="Direct power", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the block at a location is powered by redstone.
+    
+        :param list[Location] | Location check_location: Check location(s)
+        :param str redstone_power_mode: Redstone Power Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'BlockPowered', (check_location,), {'Redstone Power Mode': redstone_power_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def HasPlayer(name_or_uuid: list[DFString] | DFString, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if there is currently a player in the game with the given name or UUID.
+    
+        :param list[DFString] | DFString name_or_uuid: Name or UUID
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'HasPlayer', (name_or_uuid,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ContainerHasAll(container_location: Location, item_to_check_for: list[Item] | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the container at a location has all of the given items.
+    
+        :param Location container_location: Container location
+        :param list[Item] | Item item_to_check_for: Item(s) to check for
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'ContainerHasAll', (container_location, item_to_check_for,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def CmdArgEquals(string_to_check_for: list[DFString] | DFString, argument_number: Number, ignore_case: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a part of the command entered in the Command Event is equal to the given string.
+    
+        :param list[DFString] | DFString string_to_check_for: String(s) to check for
+        :param Number argument_number: Argument number
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'CmdArgEquals', (string_to_check_for, argument_number,), {'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def EventCancelled(inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the current event is cancelled.
+    
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'EventCancelled', (), {}, inverted), codeblocks)
+
+    @staticmethod
+    def IsChunkLoaded(location_in_chunk: Location, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the chunk at a location is currently loaded.
+    
+        :param Location location_in_chunk: Location in chunk
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_game', 'IsChunkLoaded', (location_in_chunk,), {}, inverted), codeblocks)
+
+IG = IfGame
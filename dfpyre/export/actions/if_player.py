@@ -0,0 +1,447 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['IfPlayer', 'IP']
+
+class IfPlayer:
+    """
+    Used to execute the code inside it if a certain condition related to a player is met.
+    """
+
+    @staticmethod
+    def HasRoomForItem(item_to_check_with: Item | None=None, check_mode: Literal["Has Room for Any Item", "Has Room for All Items"]="Has Room for Any Item", checked_slots: Literal["Entire inventory", "Main inventory", "Upper inventory", "Hotbar", "Armor"]="Main inventory", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's inventory has room for one or more items to be given.
+    
+        :param Item | None item_to_check_with: Item(s) to check with OR Checks for empty slot
+        :param str check_mode: Check Mode
+        :param str checked_slots: Checked Slots
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'HasRoomForItem', (item_to_check_with,), {'Check Mode': check_mode, 'Checked Slots': checked_slots}, inverted, target), codeblocks)
+
+    @staticmethod
+    def NoItemCooldown(item_type_to_check: list[Item] | Item, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player does not have a cooldown applied to an item type.
+    
+        :param list[Item] | Item item_type_to_check: Item type(s) to check
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'NoItemCooldown', (item_type_to_check,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsUsingItem(item_to_check: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is currently using an item (eg. bow).
+    
+        :param list[Item] | Item | None item_to_check: Item(s) to check (optional) (Checks material only)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsUsingItem', (item_to_check,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasItem(item_to_check_for: list[Item] | Item, check_mode: Literal["Has Any Item", "Has All Items"]="Has Any Item", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player has an item in their inventory.
+    
+        :param list[Item] | Item item_to_check_for: Item(s) to check for
+        :param str check_mode: Check Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'HasItem', (item_to_check_for,), {'Check Mode': check_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsWearing(item_to_check_for: list[Item] | Item, check_mode: Literal["Is Wearing Some", "Is Wearing All"]="Is Wearing Some", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is wearing an item.
+    
+        :param list[Item] | Item item_to_check_for: Item(s) to check for
+        :param str check_mode: Check Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsWearing', (item_to_check_for,), {'Check Mode': check_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsNear(center_location: list[Location] | Location, radius: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is within a range of a location.
+    
+        :param list[Location] | Location center_location: Center location
+        :param Number | None radius: Radius (optional) (Default = 5 blocks)
+        :param str shape: Shape
+    
+            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
+            - Circle: Checks if √(X²+Z²) is within the radius.
+            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
+            - Square: Checks if the distance on the X or Z axis is within the radius.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsNear', (center_location, radius,), {'Shape': shape}, inverted, target), codeblocks)
+
+    @staticmethod
+    def CursorItem(items_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the item that is being moved with a player's cursor is the given item.
+    
+        :param list[Item] | Item | None items_to_check_for: Items(s) to check for (optional)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'CursorItem', (items_to_check_for,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def SlotEquals(slot_id_to_check: Number, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's currently selected hotbar slot equals the given slot ID.
+    
+        :param Number slot_id_to_check: Slot ID to check (1 (left) to 9 (right))
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'SlotEquals', (slot_id_to_check,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def MenuSlotEquals(slot_to_check: list[Number] | Number, item_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's currently open inventory menu contains an item in the given slot.
+    
+        :param list[Number] | Number slot_to_check: Slot(s) to check
+        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'MenuSlotEquals', (slot_to_check, item_to_check_for,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasPermission(permission: Literal["Owner", "Developer", "Builder", "Developer or builder", "Whitelisted"]="Developer or builder", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player has a certain level of access on this plot, such as builder or owner.
+    
+        :param str permission: Permission
+    
+            - Owner: Checks if the target is the plot owner.
+            - Developer: Checks if the target has dev perms.
+            - Builder: Checks if the target has build perms.
+            - Developer or builder: Checks if the target has dev or build perms.
+            - Whitelisted: Checks if the target is whitelisted on the plot.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'HasPermission', (), {'Permission': permission}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsRiding(spawn_egg_projectile_or_vehicle: list[Item | DFString] | Item | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is riding another entity.
+    
+        :param list[Item | DFString] | Item | DFString | None spawn_egg_projectile_or_vehicle: Spawn egg, projectile, or vehicle OR Entity UUID OR Checks if riding any entity
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', ' IsRiding ', (spawn_egg_projectile_or_vehicle,), {'Ignore Formatting': ignore_formatting}, inverted, target), codeblocks)
+
+    @staticmethod
+    def MainHandEquals(main_hand: Literal["Left Hand", "Right Hand"]="Left Hand", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's main hand is their left or right hand.
+    
+        :param str main_hand: Main Hand
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'MainHandEquals', (), {'Main Hand': main_hand}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsSneaking(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is sneaking.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSneaking', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def MovementKey(forward: Literal["Pressed", "Released", "Don't check"]="Don't check", backward: Literal["Pressed", "Released", "Don't check"]="Don't check", left: Literal["Pressed", "Released", "Don't check"]="Don't check", right: Literal["Pressed", "Released", "Don't check"]="Don't check", jump: Literal["Pressed", "Released", "Don't check"]="Don't check", sneak: Literal["Pressed", "Released", "Don't check"]="Don't check", sprint: Literal["Pressed", "Released", "Don't check"]="Don't check", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is holding a specific movement key.
+    
+        :param str forward: Forward (W)
+        :param str backward: Backward (S)
+        :param str left: Left (A)
+        :param str right: Right (D)
+        :param str jump: Jump (Space)
+        :param str sneak: Sneak (Left Shift)
+        :param str sprint: Sprint (Left Control)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'MovementKey', (), {'Forward (W)': forward, 'Backward (S)': backward, 'Left (A)': left, 'Right (D)': right, 'Jump (Space)': jump, 'Sneak (Left Shift)': sneak, 'Sprint (Left Control)': sprint}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsFlying(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is flying.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsFlying', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def InvOpen(inventory_type: Literal["Any Inventory", "Plot Menu", "Crafting Table", "Chest", "Double Chest", "Ender Chest", "Shulker Box", "Barrel", "Furnace (any)", "Furnace", "Blast Furnace", "Smoker", "Dropper", "Dispenser", "Beacon", "Hopper", "Anvil", "Brewing Stand", "Cartography Table", "Smithing Table", "Loom", "Grindstone", "Stonecutter", "Enchanting Table", "Trader Menu (any)", "Villager Menu", "Wandering Trader Menu", "Horse Inventory", "Llama Inventory"]="Any Inventory", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player has a certain inventory type open.
+    
+        :param str inventory_type: Inventory Type
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'InvOpen', (), {'Inventory Type': inventory_type}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasSlotItem(slot_to_check: list[Number] | Number, item_to_check_for: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player has an item in the given inventory slot.
+    
+        :param list[Number] | Number slot_to_check: Slot(s) to check
+        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'HasSlotItem', (slot_to_check, item_to_check_for,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsSprinting(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is sprinting or using the sprint key to swim.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSprinting', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsGliding(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is gliding with elytra.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsGliding', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsLookingAt(block_to_check_for: list[Item | Location] | Item | Location | None=None, maximum_distance_from_target_blocklocation: Number | None=None, fluid_mode: Literal["Ignore fluids", "Detect fluids"]="Ignore fluids", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is looking at the given block or location.
+    
+        :param list[Item | Location] | Item | Location | None block_to_check_for: Block to check for OR Location to check for (optional)
+        :param Number | None maximum_distance_from_target_blocklocation: Maximum distance from target block/location (optional) (This is distance from the player's selected block )
+        :param str fluid_mode: Fluid Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsLookingAt', (block_to_check_for, maximum_distance_from_target_blocklocation,), {'Fluid Mode': fluid_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def InWorldBorder(location_to_check: Location | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player (or a location) is within their world border.
+    
+        :param Location | None location_to_check: Location to check OR Checks player location
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'InWorldBorder', (location_to_check,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsInGameMode(game_mode: Literal["Survival", "Creative", "Adventure", "Spectator"]="Survival", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is in a specific game mode.
+    
+        :param str game_mode: Game Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsInGameMode', (), {'Game Mode': game_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def UsingPack(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is using a plot resource pack.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'UsingPack', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsSwimming(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is in water or lava.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsSwimming', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def StandingOn(block_to_check_for: list[Item | Location] | Item | Location | None=None, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is standing on the given block or location.
+    
+        :param list[Item | Location] | Item | Location | None block_to_check_for: Block to check for OR Location to check for (optional)
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', ' StandingOn ', (block_to_check_for,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsGrounded(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is supported by a block.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsGrounded', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def OwnsProduct(product_id: DFString, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player owns a plot product or is a developer or builder.
+    
+        :param DFString product_id: Product ID
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'OwnsProduct', (product_id,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsHolding(item_to_check_for: list[Item] | Item | None=None, hand_slot: Literal["Either hand", "Main hand", "Off hand"]="Either hand", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is holding an item in their hand.
+    
+        :param list[Item] | Item | None item_to_check_for: Item(s) to check for (optional)
+        :param str hand_slot: Hand Slot
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsHolding', (item_to_check_for,), {'Hand Slot': hand_slot}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsBlocking(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player is blocking with a shield.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsBlocking', (), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def IsHitboxNear(center_location: list[Location] | Location, range: Number | None=None, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's hitbox is within a range of a location.
+    
+        :param list[Location] | Location center_location: Center location
+        :param Number | None range: Range (optional) (Default = 5 blocks)
+        :param str shape: Shape
+    
+            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
+            - Circle: Checks if √(X²+Z²) is within the radius.
+            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
+            - Square: Checks if the distance on the X or Z axis is within the radius.
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'IsHitboxNear', (center_location, range,), {'Shape': shape}, inverted, target), codeblocks)
+
+    @staticmethod
+    def HasPotion(effect_to_check_for: list[Potion] | Potion, check_properties: Literal["None", "Amplifier", "Duration", "Amplifier and duration"]="None", check_mode: Literal["Has any effect", "Has all effects"]="Has any effect", target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player has a potion effect of the given type active.
+    
+        :param list[Potion] | Potion effect_to_check_for: Effect(s) to check for
+        :param str check_properties: Check Properties
+    
+            - None: Checks only if the effect type matches.
+            - Amplifier: The amplifier of the player's effect must be equal or higher.
+            - Duration: The duration of the player's effect must be equal or higher.
+            - Amplifier and duration: The amplifier and duration of the player's effect must be equal or higher.
+        :param str check_mode: Check Mode
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'HasPotion', (effect_to_check_for,), {'Check Properties': check_properties, 'Check Mode': check_mode}, inverted, target), codeblocks)
+
+    @staticmethod
+    def NameEquals(name_to_check_for: list[DFString] | DFString, target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player's username is equal to one of the given usernames (case insensitive).
+    
+        :param list[DFString] | DFString name_to_check_for: Name(s) to check for
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'NameEquals', (name_to_check_for,), {}, inverted, target), codeblocks)
+
+    @staticmethod
+    def CanFly(target: Target=DEFAULT_TARGET, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a player can fly.
+    
+        :param Target target: The target for the condition.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_player', 'CanFly', (), {}, inverted, target), codeblocks)
+
+IP = IfPlayer
@@ -0,0 +1,373 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['IfVariable', 'IV']
+
+class IfVariable:
+    """
+    Used to execute the code inside it if a certain condition related to the value of a variable is met.
+    """
+
+    @staticmethod
+    def LessEqual(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a number value is less than or equal to another number.
+    
+        :param Number number_to_check: Number to check
+        :param Number number_to_compare_to: Number to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '<=', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ItemHasEnchant(item_to_check: Item, enchantment: DFString | None=None, level: Number | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an item has a given enchantment, or, if no enchantment is specified, checks if it has any.
+    
+        :param Item item_to_check: Item to check
+        :param DFString | None enchantment: Enchantment (optional)
+        :param Number | None level: Level (optional)
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemHasEnchant', (item_to_check, enchantment, level,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ItemIsBlock(item_to_check: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an item is able to be placed.
+    
+        :param Item item_to_check: Item to check
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemIsBlock', (item_to_check,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def DictValueEquals(dictionary_to_check: ArgValue, key_to_check: DFString, values_to_compare_with: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a dictionary's value for the given key is equal to any of the given values.
+    
+        :param ArgValue dictionary_to_check: Dictionary to check
+        :param DFString key_to_check: Key to check
+        :param list[ArgValue] | ArgValue values_to_compare_with: Values to compare with
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'DictValueEquals', (dictionary_to_check, key_to_check, values_to_compare_with,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ItemHasTag(item_to_check: Item, tag_name: DFString, tag_value: Number | DFString | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an item has a given custom tag, and (if provided) whether the tag matches the given value.
+    
+        :param Item item_to_check: Item to check
+        :param DFString tag_name: Tag name
+        :param Number | DFString | None tag_value: Tag value OR Tag value (optional)
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemHasTag', (item_to_check, tag_name, tag_value,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ListSizeEquals(list_to_check: ArgValue, size_to_compare: Number | None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a list is of a given size.
+    
+        :param ArgValue list_to_check: List to check
+        :param Number | None size_to_compare: Size to compare (optional) (Default = 0)
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ListSizeEquals', (list_to_check, size_to_compare,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def StringMatches(string_or_source_expression_to_match: DFString, string_to_compare: list[DFString] | DFString, regular_expressions: Literal["Enable", "Disable"]="Disable", ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a string value matches other values.
+    
+        :param DFString string_or_source_expression_to_match: String or source expression to match
+        :param list[DFString] | DFString string_to_compare: String to compare
+        :param str regular_expressions: Regular Expressions
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'StringMatches', (string_or_source_expression_to_match, string_to_compare,), {'Regular Expressions': regular_expressions, 'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def IsFiltered(string_to_check: DFString, link_filter: Literal["True", "False"]="True", swear_filter: Literal["True", "False"]="True", caps_filter: Literal["True", "False"]="True", character_spacing_filter: Literal["True", "False"]="True", character_drag_filter: Literal["True", "False"]="True", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the input string would be filtered by the selected chat filters.
+    
+        :param DFString string_to_check: String to check
+        :param str link_filter: Link Filter
+        :param str swear_filter: Swear Filter
+        :param str caps_filter: Caps Filter
+        :param str character_spacing_filter: Character Spacing Filter
+        :param str character_drag_filter: Character Drag Filter
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'IsFiltered', (string_to_check,), {'Link Filter': link_filter, 'Swear Filter': swear_filter, 'Caps Filter': caps_filter, 'Character Spacing Filter': character_spacing_filter, 'Character Drag Filter': character_drag_filter}, inverted), codeblocks)
+
+    @staticmethod
+    def StartsWith(string_to_check: DFString, string_to_start_with: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the first part of a string value matches a certain string.
+    
+        :param DFString string_to_check: String to check
+        :param list[DFString] | DFString string_to_start_with: String to start with
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'StartsWith', (string_to_check, string_to_start_with,), {'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def ListValueEq(list_to_check_in: ArgValue, index_to_check_at: Number, variable_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a list's value at an index is equal to a value.
+    
+        :param ArgValue list_to_check_in: List to check in
+        :param Number index_to_check_at: Index to check at
+        :param list[ArgValue] | ArgValue variable_to_compare_to: Variable to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ListValueEq', (list_to_check_in, index_to_check_at, variable_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def VarIsType(value_to_check: ArgValue, variable_type: Literal["Number", "String", "Styled Text", "Location", "Item", "List", "Potion effect", "Sound", "Particle", "Vector", "Dictionary"]="Number", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a value is of a certain type.
+    
+        :param ArgValue value_to_check: Value to check
+        :param str variable_type: Variable Type
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'VarIsType', (value_to_check,), {'Variable Type': variable_type}, inverted), codeblocks)
+
+    @staticmethod
+    def InRange(check_value: ArgValue, minimum_value: ArgValue, maximum_value: ArgValue, location_handling: Literal["Block", "Exact"]="Exact", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a number value is in between 2 other numbers or a location value is within the region of 2 other locations.
+    
+        :param ArgValue check_value: Check value
+        :param ArgValue minimum_value: Minimum value
+        :param ArgValue maximum_value: Maximum value
+        :param str location_handling: Location Handling
+    
+            - Block: Block locations are compared. Does not affect number ranges.
+            - Exact: Exact decimal locations are compared. Does not affect number ranges.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', ' InRange ', (check_value, minimum_value, maximum_value,), {'Location Handling': location_handling}, inverted), codeblocks)
+
+    @staticmethod
+    def ValueIsEmpty(string_to_check_if_empty: DFString | DFText | ArgValue | Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a value is empty.
+    
+        :param DFString | DFText | ArgValue | Item string_to_check_if_empty: String to check if empty OR Text to compare content length to 0 OR List to compare size to 0 OR Dictionary to compare size to 0 OR Item to compare to air
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ValueIsEmpty', (string_to_check_if_empty,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def VarExists(variable_to_check: Variable, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a variable exists.
+    
+        :param Variable variable_to_check: Variable to check
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'VarExists', (variable_to_check,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def DictHasKeys(dictionary_to_check: ArgValue, key_to_look_for: list[DFString] | DFString, check_mode: Literal["Has Any Key", "Has All Keys"]="Has Any Key", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a dictionary has the given keys.
+    
+        :param ArgValue dictionary_to_check: Dictionary to check
+        :param list[DFString] | DFString key_to_look_for: Key(s) to look for
+        :param str check_mode: Check Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'DictHasKeys', (dictionary_to_check, key_to_look_for,), {'Check Mode': check_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def BlockIsSolid(block_to_check_for: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a material will collide with entities.
+    
+        :param Item block_to_check_for: Block to check for
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'BlockIsSolid', (block_to_check_for,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def ItemEquals(item_to_check: Item, item_to_compare_to: list[Item] | Item | None=None, comparison_mode: Literal["Exactly equals", "Ignore stack size", "Ignore durability and stack size", "Material only"]="Exactly equals", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Works the same as Value = but has a few extra options for item comparison.
+    
+        :param Item item_to_check: Item to check
+        :param list[Item] | Item | None item_to_compare_to: Item(s) to compare to (optional)
+        :param str comparison_mode: Comparison Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemEquals', (item_to_check, item_to_compare_to,), {'Comparison Mode': comparison_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def ListContains(list_to_check_in: ArgValue, value_to_find: list[ArgValue] | ArgValue, check_mode: Literal["Has Any Value", "Has All Values"]="Has Any Value", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if any of a list's contents match the given value.
+    
+        :param ArgValue list_to_check_in: List to check in
+        :param list[ArgValue] | ArgValue value_to_find: Value to find
+        :param str check_mode: Check Mode
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ListContains', (list_to_check_in, value_to_find,), {'Check Mode': check_mode}, inverted), codeblocks)
+
+    @staticmethod
+    def LocIsNear(location_to_check: Location, location_to_compare_to: list[Location] | Location, radius: Number, shape: Literal["Sphere", "Circle", "Cube", "Square"]="Sphere", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a location is near another location.
+    
+        :param Location location_to_check: Location to check
+        :param list[Location] | Location location_to_compare_to: Location(s) to compare to
+        :param Number radius: Radius
+        :param str shape: Shape
+    
+            - Sphere: Checks if √(X²+Y²+Z²) is within the radius.
+            - Circle: Checks if √(X²+Z²) is within the radius.
+            - Cube: Checks if the distance on the X, Y or Z axis is within the radius.
+            - Square: Checks if the distance on the X or Z axis is within the radius.
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'LocIsNear', (location_to_check, location_to_compare_to, radius,), {'Shape': shape}, inverted), codeblocks)
+
+    @staticmethod
+    def ItemIsUnbreakable(item_to_check: Item, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if an item is unbreakable.
+    
+        :param Item item_to_check: Item to check
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'ItemIsUnbreakable', (item_to_check,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def Contains(string_to_check: DFString, string_to_check_for: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a string value contains another string.
+    
+        :param DFString string_to_check: String to check
+        :param list[DFString] | DFString string_to_check_for: String to check for
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'Contains', (string_to_check, string_to_check_for,), {'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def NotEqual(value_to_check: ArgValue, values_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a value does not equal another value.
+    
+        :param ArgValue value_to_check: Value to check
+        :param list[ArgValue] | ArgValue values_to_compare_to: Values to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '!=', (value_to_check, values_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def LessThan(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a number value is less than another number.
+    
+        :param Number number_to_check: Number to check
+        :param Number number_to_compare_to: Number to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '<', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def Equals(value_to_check: ArgValue, values_to_compare_to: list[ArgValue] | ArgValue, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a value is equal to one of the given values.
+    
+        :param ArgValue value_to_check: Value to check
+        :param list[ArgValue] | ArgValue values_to_compare_to: Values to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '=', (value_to_check, values_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def GreaterThan(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a number value is greater than another number.
+    
+        :param Number number_to_check: Number to check
+        :param Number number_to_compare_to: Number to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '>', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def EndsWith(string_to_check: DFString, string_to_end_with: list[DFString] | DFString, ignore_case: Literal["True", "False"]="False", inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if the last part of a string value matches a certain string.
+    
+        :param DFString string_to_check: String to check
+        :param list[DFString] | DFString string_to_end_with: String to end with
+        :param str ignore_case: Ignore Case
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'EndsWith', (string_to_check, string_to_end_with,), {'Ignore Case': ignore_case}, inverted), codeblocks)
+
+    @staticmethod
+    def GreaterEqual(number_to_check: Number, number_to_compare_to: Number, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a number value is greater than or equal to another number.
+    
+        :param Number number_to_check: Number to check
+        :param Number number_to_compare_to: Number to compare to
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', '>=', (number_to_check, number_to_compare_to,), {}, inverted), codeblocks)
+
+    @staticmethod
+    def DictHasKey(dictionary_to_check: ArgValue, key_to_look_for: DFString, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Checks if a dictionary has the given key.
+    
+        :param ArgValue dictionary_to_check: Dictionary to check
+        :param DFString key_to_look_for: Key to look for
+        :param bool inverted: Whether the condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_conditional('if_var', 'DictHasKey', (dictionary_to_check, key_to_look_for,), {}, inverted), codeblocks)
+
+IV = IfVariable
@@ -0,0 +1,1938 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['PlayerAction', 'PA']
+
+class PlayerAction:
+    """
+    Used to do something related to a player or multiple players.
+    """
+
+    @staticmethod
+    def SetHotbar(item_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets items in a player's hotbar.
+    
+        :param list[Item] | Item item_to_set: Item(s) to set (Slots 1-9)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetHotbar', (item_to_set,), {}, target=target)
+
+    @staticmethod
+    def SetReducedDebug(reduced_debug_info_enabled: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        When enabled, a player won't be able to see their coordinates, block info, or other info.
+    
+        :param str reduced_debug_info_enabled: Reduced Debug Info Enabled
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetReducedDebug', (), {'Reduced Debug Info Enabled': reduced_debug_info_enabled}, target=target)
+
+    @staticmethod
+    def CloseInv(target: Target=DEFAULT_TARGET):
+        """
+        Closes a player's inventory.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'CloseInv', (), {}, target=target)
+
+    @staticmethod
+    def GiveItems(item_to_give: list[Item] | Item, amount_to_give: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Gives a player all of the items in the chest.
+    
+        :param list[Item] | Item item_to_give: Item(s) to give
+        :param Number | None amount_to_give: Amount to give (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GiveItems', (item_to_give, amount_to_give,), {}, target=target)
+
+    @staticmethod
+    def SetHandCrafting(allow_hand_crafting: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets if a player is allowed to interact with their hand-crafting menu.
+    
+        :param str allow_hand_crafting: Allow Hand Crafting
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetHandCrafting', (), {'Allow Hand Crafting': allow_hand_crafting}, target=target)
+
+    @staticmethod
+    def ParticleSphere(effect: Particle, center_location: Location, diameter: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a sphere of particles at a location to a player.
+    
+        :param Particle effect: Effect
+        :param Location center_location: Center location
+        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleSphere', (effect, center_location, diameter,), {}, target=target)
+
+    @staticmethod
+    def SetVelocity(new_velocity: DFVector, add_to_current_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's movement velocity.
+    
+        :param DFVector new_velocity: New velocity
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetVelocity', (new_velocity,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
+
+    @staticmethod
+    def Particle(effect: list[Particle] | Particle, effect_location: Location, target: Target=DEFAULT_TARGET):
+        """
+        Displays a particle effect to a player.
+    
+        :param list[Particle] | Particle effect: Effect
+        :param Location effect_location: Effect location
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Particle', (effect, effect_location,), {}, target=target)
+
+    @staticmethod
+    def AddInvRow(items_to_display: list[Item] | Item | None=None, new_row_position: Literal["Top row", "Bottom row"]="Bottom row", target: Target=DEFAULT_TARGET):
+        """
+        Adds a row to the bottom of a player's current inventory menu.
+    
+        :param list[Item] | Item | None items_to_display: Items to display (optional)
+        :param str new_row_position: New Row Position
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'AddInvRow', (items_to_display,), {'New Row Position': new_row_position}, target=target)
+
+    @staticmethod
+    def DisplayLightning(strike_location: Location, target: Target=DEFAULT_TARGET):
+        """
+        Displays a lightning strike effect to a player.
+    
+        :param Location strike_location: Strike location
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayLightning', (strike_location,), {}, target=target)
+
+    @staticmethod
+    def Damage(damage_to_inflict: Number, uuid_of_damager_entity: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Damages a player.
+    
+        :param Number damage_to_inflict: Damage to inflict (❤ = 2 Health)
+        :param DFString | None uuid_of_damager_entity: UUID of damager entity (optional)
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Damage', (damage_to_inflict, uuid_of_damager_entity,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetInventory(item_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets items in a player's upper inventory.
+    
+        :param list[Item] | Item item_to_set: Item(s) to set
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetInventory', (item_to_set,), {}, target=target)
+
+    @staticmethod
+    def Heal(amount_to_heal: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Restores a player's health.
+    
+        :param Number | None amount_to_heal: Amount to heal OR Heals to full health (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Heal', (amount_to_heal,), {}, target=target)
+
+    @staticmethod
+    def SetSpawnPoint(the_new_spawn_location: Location | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the location a player will spawn when they die and respawn.
+    
+        :param Location | None the_new_spawn_location: The new spawn location OR Plot spawn
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSpawnPoint', (the_new_spawn_location,), {}, target=target)
+
+    @staticmethod
+    def SetInventoryKept(inventory_kept: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player's inventory is kept after death.
+    
+        :param str inventory_kept: Inventory Kept
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetInventoryKept', (), {'Inventory Kept': inventory_kept}, target=target)
+
+    @staticmethod
+    def LaunchUp(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Launches a player up or down.
+    
+        :param Number launch_power: Launch power
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LaunchUp', (launch_power,), {'Add to Current Velocity': add_to_current_velocity}, target=target)
+
+    @staticmethod
+    def ForceFlight(flight_mode: Literal["Start Flight", "Stop Flight"]="Start Flight", target: Target=DEFAULT_TARGET):
+        """
+        :param str flight_mode: Flight Mode
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ForceFlight', (), {'Flight Mode': flight_mode}, target=target)
+
+    @staticmethod
+    def LoadInv(code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", target: Target=DEFAULT_TARGET):
+        """
+        Loads a player's inventory.
+    
+        :param str code_flow: Code Flow
+    
+            - Synchronous: Waits for the inventory to be loaded before continuing.
+            - Asynchronous: Continues running code immediately.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LoadInv', (), {'Code Flow': code_flow}, target=target)
+
+    @staticmethod
+    def ChatStyle(new_chat_style: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's chat color or decoration.
+    
+        :param DFText | None new_chat_style: New chat style OR Resets chat style)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ChatStyle', (new_chat_style,), {}, target=target)
+
+    @staticmethod
+    def Kick(target: Target=DEFAULT_TARGET):
+        """
+        Kicks a player from the plot.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Kick', (), {}, target=target)
+
+    @staticmethod
+    def MiscAttribute(value: Number | None=None, attribute: Literal["Scale", "Luck", "Oxygen bonus", "Burning time", "Camera distance"]="Scale", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's miscellaneous attributes such as scale and burning time.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Scale: Base: 1.0 Range: 0.0625-16.0
+            - Luck: Base: 0.0 Range: -1024.0-1024.0
+            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
+            - Burning time: Base: 1.0 Range: 0.0-1024.0
+            - Camera distance: Base: 4.0 Range: 0.0-32.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'MiscAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SpectateTarget(target_uuid: DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Makes a player spectate another player or entity.
+    
+        :param DFString | None target_uuid: Target UUID OR Stops spectating
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SpectateTarget', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def HurtAnimation(damage_source: Location | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Makes a player perform a hurt animation.
+    
+        :param Location | None damage_source: Damage source (optional) (Affects the direction of the screen tilt effect.)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'HurtAnimation', (damage_source,), {}, target=target)
+
+    @staticmethod
+    def SurvivalMode(target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's game mode to Survival.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SurvivalMode', (), {}, target=target)
+
+    @staticmethod
+    def DisplayBellRing(block_location: Location, ring_direction: Literal["North", "South", "West", "East"]="North", target: Target=DEFAULT_TARGET):
+        """
+        Displays a bell ring animation at a location to a player.
+    
+        :param Location block_location: Block location
+        :param str ring_direction: Ring Direction
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayBellRing', (block_location,), {'Ring Direction': ring_direction}, target=target)
+
+    @staticmethod
+    def SetStatus(game_status: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the player's game status, which is used to display information about what the player is doing in the game.
+    
+        :param DFText | None game_status: Game Status OR Clears status) (Limited at 50 characters)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetStatus', (game_status,), {}, target=target)
+
+    @staticmethod
+    def SetCursorItem(item_to_set: Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the item on a player's cursor.
+    
+        :param Item | None item_to_set: Item to set OR Clears cursor item)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetCursorItem', (item_to_set,), {}, target=target)
+
+    @staticmethod
+    def SetFireTicks(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the remaining time a player is on fire for.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFireTicks', (ticks,), {}, target=target)
+
+    @staticmethod
+    def CombatAttribute(value: Number | None=None, attribute: Literal["Attack damage", "Attack speed", "Sweeping damage ratio"]="Attack damage", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's combat-related attributes such as attack damage and attack speed.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Attack damage: Base: 2.0 Range: 0.0-2048.0
+            - Attack speed: Base: 4.0 Range: 0.0-1024.0
+            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'CombatAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def RemoveInvRow(rows_to_remove: Number | None=None, row_to_remove: Literal["Top row", "Bottom row"]="Bottom row", target: Target=DEFAULT_TARGET):
+        """
+        Removes the given number of rows from the bottom of a player's current inventory menu.
+    
+        :param Number | None rows_to_remove: Rows to remove (optional)
+        :param str row_to_remove: Row to Remove
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RemoveInvRow', (rows_to_remove,), {'Row to Remove': row_to_remove}, target=target)
+
+    @staticmethod
+    def WakeUpAnimation(target: Target=DEFAULT_TARGET):
+        """
+        Displays the wake up (fade in) animation to a player.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'WakeUpAnimation', (), {}, target=target)
+
+    @staticmethod
+    def DisableBlocks(blocks_to_disallow: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Prevents a player from placing and breaking certain blocks.
+    
+        :param list[Item] | Item | None blocks_to_disallow: Blocks to disallow (optional) (If no blocks are given, disallows all blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisableBlocks', (blocks_to_disallow,), {}, target=target)
+
+    @staticmethod
+    def SetScoreObj(objective_name: DFText, target: Target=DEFAULT_TARGET):
+        """
+        Sets the objective name of the scoreboard sidebar.
+    
+        :param DFText objective_name: Objective name
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetScoreObj', (objective_name,), {}, target=target)
+
+    @staticmethod
+    def ClearInv(clear_mode: Literal["Entire inventory", "Main inventory", "Upper inventory", "Hotbar", "Armor"]="Entire inventory", clear_crafting_and_cursor: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Empties a player's inventory.
+    
+        :param str clear_mode: Clear Mode
+        :param str clear_crafting_and_cursor: Clear Crafting and Cursor
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ClearInv', (), {'Clear Mode': clear_mode, 'Clear Crafting and Cursor': clear_crafting_and_cursor}, target=target)
+
+    @staticmethod
+    def SetFreezeTicks(ticks: Number, ticking_locked: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets how long a player is frozen for.
+    
+        :param Number ticks: Ticks (0-140)
+        :param str ticking_locked: Ticking Locked
+    
+            - Enable: Player will stay frozen.
+            - Disable: Player will slowly unfreeze over time.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFreezeTicks', (ticks,), {'Ticking Locked': ticking_locked}, target=target)
+
+    @staticmethod
+    def SetGliding(gliding: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player is gliding with elytra.
+    
+        :param str gliding: Gliding
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetGliding', (), {'Gliding': gliding}, target=target)
+
+    @staticmethod
+    def SetRotation(pitch: Number, yaw: Number, target: Target=DEFAULT_TARGET):
+        """
+        Changes a player's pitch and yaw.
+    
+        :param Number pitch: Pitch (-90 to 90)
+        :param Number yaw: Yaw (-180 to 180)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetRotation', (pitch, yaw,), {}, target=target)
+
+    @staticmethod
+    def ClearItems(item_to_clear: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Removes all of an item from a player.
+    
+        :param list[Item] | Item item_to_clear: Item(s) to clear
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ClearItems', (item_to_clear,), {}, target=target)
+
+    @staticmethod
+    def OpenSign(sign_location: Location, sign_side: Literal["Front", "Back"]="Front", target: Target=DEFAULT_TARGET):
+        """
+        Opens a sign for a player. Also works with client-side signs.
+    
+        :param Location sign_location: Sign location
+        :param str sign_side: Sign Side
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'OpenSign', (sign_location,), {'Sign Side': sign_side}, target=target)
+
+    @staticmethod
+    def SetFlying(flying: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player is flying.
+    
+        :param str flying: Flying
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFlying', (), {'Flying': flying}, target=target)
+
+    @staticmethod
+    def DisplayBlockOpen(block_location: Location, container_state: Literal["Open", "Closed"]="Open", target: Target=DEFAULT_TARGET):
+        """
+        Displays a container block at a location as being open or closed to a player.
+    
+        :param Location block_location: Block location
+        :param str container_state: Container State
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayBlockOpen', (block_location,), {'Container State': container_state}, target=target)
+
+    @staticmethod
+    def SendAdvancement(advancement_name: DFText, advancement_icon: Item | None=None, toast_type: Literal["Advancement", "Goal", "Challenge"]="Advancement", target: Target=DEFAULT_TARGET):
+        """
+        Displays a custom advancement popup to a player.
+    
+        :param DFText advancement_name: Advancement name
+        :param Item | None advancement_icon: Advancement icon (optional)
+        :param str toast_type: Toast Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SendAdvancement', (advancement_name, advancement_icon,), {'Toast Type': toast_type}, target=target)
+
+    @staticmethod
+    def SetMenuItem(slot: Number, item_to_set: Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the item in a slot of a player's current inventory menu.
+    
+        :param Number slot: Slot
+        :param Item | None item_to_set: Item to set (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetMenuItem', (slot, item_to_set,), {}, target=target)
+
+    @staticmethod
+    def LaunchToward(launch_destination: Location, launch_power: Number | None=None, add_to_current_velocity: Literal["True", "False"]="True", ignore_distance: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Launches a player toward or away from a location.
+    
+        :param Location launch_destination: Launch destination
+        :param Number | None launch_power: Launch power (optional)
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param str ignore_distance: Ignore Distance
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LaunchToward', (launch_destination, launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Ignore Distance': ignore_distance}, target=target)
+
+    @staticmethod
+    def SetArmor(armor_to_set: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's armor items. Place the armor in slots 1-4 of the chest, with 1 being the helmet and 4 being the boots.
+    
+        :param list[Item] | Item armor_to_set: Armor to set
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetArmor', (armor_to_set,), {}, target=target)
+
+    @staticmethod
+    def DisplayGateway(gateway_location: Location, animation_type: Literal["Initial beam", "Periodic beam"]="Initial beam", target: Target=DEFAULT_TARGET):
+        """
+        Displays a vertical beam on an end gateway to a player.
+    
+        :param Location gateway_location: Gateway location
+        :param str animation_type: Animation Type
+    
+            - Initial beam: A magenta beam. Plays for 200 ticks.
+            - Periodic beam: A purple beam. Plays for 40 ticks.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayGateway', (gateway_location,), {'Animation Type': animation_type}, target=target)
+
+    @staticmethod
+    def GiveSaturation(saturation_to_give: Number, target: Target=DEFAULT_TARGET):
+        """
+        Adds saturation to a player.
+    
+        :param Number saturation_to_give: Saturation to give
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GiveSaturation', (saturation_to_give,), {}, target=target)
+
+    @staticmethod
+    def DisplayEquipment(entity_uuid_or_name: DFString, equipment: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Displays equipment on an entity to a player. Equipment goes from slots 2-7 in order of Helmet, Chestplate, Leggings, Boots, Main Hand, Off Hand.
+    
+        :param DFString entity_uuid_or_name: Entity UUID or name
+        :param list[Item] | Item equipment: Equipment
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayEquipment', (entity_uuid_or_name, equipment,), {}, target=target)
+
+    @staticmethod
+    def GiveExp(experience_to_give: Number, give_experience: Literal["Points", "Levels", "Level Percentage"]="Points", target: Target=DEFAULT_TARGET):
+        """
+        Adds experience points or levels to a player.
+    
+        :param Number experience_to_give: Experience to give
+        :param str give_experience: Give Experience
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GiveExp', (experience_to_give,), {'Give Experience': give_experience}, target=target)
+
+    @staticmethod
+    def FaceLocation(location_to_face: Location, target: Target=DEFAULT_TARGET):
+        """
+        Rotates a player to look toward a location without teleporting them.
+    
+        :param Location location_to_face: Location to face
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'FaceLocation', (location_to_face,), {}, target=target)
+
+    @staticmethod
+    def ClearScoreboard(target: Target=DEFAULT_TARGET):
+        """
+        Removes all scores from the scoreboard.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ClearScoreboard', (), {}, target=target)
+
+    @staticmethod
+    def ActionBar(message_to_send: list[DFText] | DFText, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Displays text directly above a player's hotbar.
+    
+        :param list[DFText] | DFText message_to_send: Message to send
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ActionBar', (message_to_send,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
+
+    @staticmethod
+    def SetChatTag(chat_tag: list[DFText] | DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's chat tag.
+    
+        :param list[DFText] | DFText | None chat_tag: Chat tag OR Resets chat tag)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetChatTag', (chat_tag,), {}, target=target)
+
+    @staticmethod
+    def ShiftWorldBorder(new_radius: Number, blocks_per_second: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Changes a player's world border size if they have one active.
+    
+        :param Number new_radius: New radius
+        :param Number | None blocks_per_second: Blocks per second (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ShiftWorldBorder', (new_radius, blocks_per_second,), {}, target=target)
+
+    @staticmethod
+    def DisplaySignText(sign_location: Location, text_line: list[DFText] | DFText | None=None, sign_side: Literal["Front", "Back"]="Front", text_color: Literal["White", "Orange", "Magenta", "Light blue", "Yellow", "Lime", "Pink", "Gray", "Light gray", "Cyan", "Purple", "Blue", "Brown", "Green", "Red", "Black"]="Black", glowing: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Displays text on a sign to a player.
+    
+        :param Location sign_location: Sign location
+        :param list[DFText] | DFText | None text_line: Text line(s) (optional)
+        :param str sign_side: Sign Side
+        :param str text_color: Text Color
+        :param str glowing: Glowing
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplaySignText', (sign_location, text_line,), {'Sign Side': sign_side, 'Text Color': text_color, 'Glowing': glowing}, target=target)
+
+    @staticmethod
+    def ExpandInv(items_to_display: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Adds 3 more rows to a player's current inventory menu using the contents of the chest.
+    
+        :param list[Item] | Item | None items_to_display: Items to display (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ExpandInv', (items_to_display,), {}, target=target)
+
+    @staticmethod
+    def LaunchProj(projectile_to_launch: Item, launch_point: Location | None=None, projectile_name: DFText | None=None, speed: Number | None=None, inaccuracy: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Launches a projectile from a player.
+    
+        :param Item projectile_to_launch: Projectile to launch
+        :param Location | None launch_point: Launch point (optional)
+        :param DFText | None projectile_name: Projectile name (optional)
+        :param Number | None speed: Speed (optional)
+        :param Number | None inaccuracy: Inaccuracy (optional) (Controls how much random motion is applied on launch)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LaunchProj', (projectile_to_launch, launch_point, projectile_name, speed, inaccuracy,), {}, target=target)
+
+    @staticmethod
+    def ParticleCuboidA(effect: Particle, corner_1: Location, corner_2: Location, effect_spacing: Number | None=None, animation_duration: Number | None=None, fill_type: Literal["Wireframe", "Hollow", "Solid"]="Wireframe", target: Target=DEFAULT_TARGET):
+        """
+        Displays an animated particle cuboid to a player.
+    
+        :param Particle effect: Effect
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
+        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
+        :param str fill_type: Fill Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleCuboidA', (effect, corner_1, corner_2, effect_spacing, animation_duration,), {'Fill Type': fill_type}, target=target)
+
+    @staticmethod
+    def PlaySound(sound_to_play: list[Sound] | Sound, playback_location: Location | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
+        """
+        Plays a sound for a player.
+    
+        :param list[Sound] | Sound sound_to_play: Sound to play
+        :param Location | None playback_location: Playback location (optional)
+        :param str sound_source: Sound Source
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'PlaySound', (sound_to_play, playback_location,), {'Sound Source': sound_source}, target=target)
+
+    @staticmethod
+    def SetCompass(new_target: Location, target: Target=DEFAULT_TARGET):
+        """
+        Sets the location compasses point to for a player.
+    
+        :param Location new_target: New Target
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetCompass', (new_target,), {}, target=target)
+
+    @staticmethod
+    def MobDisguise(mob_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises a player as a mob.
+    
+        :param Item mob_to_disguise_as: Mob to disguise as
+        :param DFText | None display_name: Display name (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'MobDisguise', (mob_to_disguise_as, display_name,), {}, target=target)
+
+    @staticmethod
+    def EnableBlocks(blocks_to_allow: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Allows a player to place and break certain blocks.
+    
+        :param list[Item] | Item | None blocks_to_allow: Blocks to allow (optional) (If no blocks are given, allows all blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'EnableBlocks', (blocks_to_allow,), {}, target=target)
+
+    @staticmethod
+    def OpenBlockInv(container_location: Location, target: Target=DEFAULT_TARGET):
+        """
+        Opens a container's inventory. Also works with crafting tables.
+    
+        :param Location container_location: Container location
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'OpenBlockInv', (container_location,), {}, target=target)
+
+    @staticmethod
+    def LockDisgRotation(pitch_to_lock_to: Number | None=None, yaw_to_lock_to: Number | None=None, pitch: Literal["Lock", "Unlock", "No Change"]="No Change", yaw: Literal["Lock", "Unlock", "No Change"]="No Change", target: Target=DEFAULT_TARGET):
+        """
+        Locks a disguise's pitch or yaw values.
+    
+        :param Number | None pitch_to_lock_to: Pitch to lock to (optional) (Default = 0)
+        :param Number | None yaw_to_lock_to: Yaw to lock to (optional) (Default = 0)
+        :param str pitch: Pitch
+        :param str yaw: Yaw
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LockDisgRotation', (pitch_to_lock_to, yaw_to_lock_to,), {'Pitch': pitch, 'Yaw': yaw}, target=target)
+
+    @staticmethod
+    def ParticleCircleA(effect: Particle, center_location: Location, diameter: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays an animated circle of particles to a player.
+    
+        :param Particle effect: Effect
+        :param Location center_location: Center location
+        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
+        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleCircleA', (effect, center_location, diameter, animation_duration,), {}, target=target)
+
+    @staticmethod
+    def SetEquipment(item_to_set: Item | None=None, equipment_slot: Literal["Main hand", "Off hand", "Head", "Chest", "Legs", "Feet"]="Main hand", target: Target=DEFAULT_TARGET):
+        """
+        Sets the item in one of the equipment slots (armor and held items) of a player.
+    
+        :param Item | None item_to_set: Item to set (optional)
+        :param str equipment_slot: Equipment Slot
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetEquipment', (item_to_set,), {'Equipment Slot': equipment_slot}, target=target)
+
+    @staticmethod
+    def SetDropsEnabled(spawn_death_drops: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player drops their items when dead.
+    
+        :param str spawn_death_drops: Spawn Death Drops
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetDropsEnabled', (), {'Spawn Death Drops': spawn_death_drops}, target=target)
+
+    @staticmethod
+    def SendToPlot(plot_handle_or_id: DFString, target: Target=DEFAULT_TARGET):
+        """
+        Sends a player to another plot.
+    
+        :param DFString plot_handle_or_id: Plot handle or ID
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SendToPlot', (plot_handle_or_id,), {}, target=target)
+
+    @staticmethod
+    def RemovePotion(effect_to_remove: list[Potion] | Potion, target: Target=DEFAULT_TARGET):
+        """
+        Removes one or more potion effects from a player.
+    
+        :param list[Potion] | Potion effect_to_remove: Effect(s) to remove
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RemovePotion', (effect_to_remove,), {}, target=target)
+
+    @staticmethod
+    def DisplayFracture(block_to_fracture: list[Location] | Location, fracture_level: Number | None=None, overwrite_previous_fracture: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Displays a block fracture effect at a location to a player.
+    
+        :param list[Location] | Location block_to_fracture: Block(s) to fracture
+        :param Number | None fracture_level: Fracture level (optional) (0-10 (default = 0))
+        :param str overwrite_previous_fracture: Overwrite Previous Fracture
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayFracture', (block_to_fracture, fracture_level,), {'Overwrite Previous Fracture': overwrite_previous_fracture}, target=target)
+
+    @staticmethod
+    def SetEntityHidden(entity_uuids: list[DFString] | DFString, hidden: Literal["Enable", "Disable"]="Enable", ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets if an entity is hidden to a target.
+    
+        :param list[DFString] | DFString entity_uuids: Entity UUIDs
+        :param str hidden: Hidden
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetEntityHidden', (entity_uuids,), {'Hidden': hidden, 'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetSidebar(sidebar: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether the scoreboard sidebar is visible to a player.
+    
+        :param str sidebar: Sidebar
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSidebar', (), {'Sidebar': sidebar}, target=target)
+
+    @staticmethod
+    def SetSlot(new_slot: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's selected hotbar slot.
+    
+        :param Number new_slot: New slot (1 (left) to 9 (right))
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSlot', (new_slot,), {}, target=target)
+
+    @staticmethod
+    def ParticleRay(effect: Particle, ray_location: Location, ray_vector: DFVector, effect_spacing: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a ray of particles to a player.
+    
+        :param Particle effect: Effect
+        :param Location ray_location: Ray location
+        :param DFVector ray_vector: Ray vector
+        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleRay', (effect, ray_location, ray_vector, effect_spacing,), {}, target=target)
+
+    @staticmethod
+    def ParticleCuboid(effect: Particle, corner_1: Location, corner_2: Location, effect_spacing: Number | None=None, fill_type: Literal["Wireframe", "Hollow", "Solid"]="Wireframe", target: Target=DEFAULT_TARGET):
+        """
+        Displays a particle cuboid as a solid, hollow or wireframe shape to a player.
+    
+        :param Particle effect: Effect
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
+        :param str fill_type: Fill Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleCuboid', (effect, corner_1, corner_2, effect_spacing,), {'Fill Type': fill_type}, target=target)
+
+    @staticmethod
+    def SendMessageSeq(messages_to_send: list[DFText] | DFText, message_delay_ticks: Number | None=None, alignment_mode: Literal["Regular", "Centered"]="Regular", target: Target=DEFAULT_TARGET):
+        """
+        Sends a series of messages in chat to a player, with a delay after each message.
+    
+        :param list[DFText] | DFText messages_to_send: Messages to send
+        :param Number | None message_delay_ticks: Message delay ticks (optional) (Default = 60)
+        :param str alignment_mode: Alignment Mode
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SendMessageSeq', (messages_to_send, message_delay_ticks,), {'Alignment Mode': alignment_mode}, target=target)
+
+    @staticmethod
+    def SetNamePrefix(prefixsuffix_text: DFText | None=None, text_type: Literal["Prefix", "Suffix"]="Prefix", target: Target=DEFAULT_TARGET):
+        """
+        Sets the prefix or suffix for the player's name.
+    
+        :param DFText | None prefixsuffix_text: Prefix/suffix text (optional)
+        :param str text_type: Text Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetNamePrefix', (prefixsuffix_text,), {'Text Type': text_type}, target=target)
+
+    @staticmethod
+    def ClearDispBlock(block_location_or_start_of_region: Location, end_of_region: Location | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays the real block at a location to a player, effectively removing any client-side blocks.
+    
+        :param Location block_location_or_start_of_region: Block location, or start of region
+        :param Location | None end_of_region: End of region (optional) (Region size limit: 500 blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ClearDispBlock', (block_location_or_start_of_region, end_of_region,), {}, target=target)
+
+    @staticmethod
+    def SetRainLevel(rain_level: Number, storm_level: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the heaviness of rain and storm visible to a player.
+    
+        :param Number rain_level: Rain level (%)
+        :param Number storm_level: Storm level (%)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetRainLevel', (rain_level, storm_level,), {}, target=target)
+
+    @staticmethod
+    def Undisguise(target: Target=DEFAULT_TARGET):
+        """
+        Removes a player's disguise.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Undisguise', (), {}, target=target)
+
+    @staticmethod
+    def ParticleSpiralA(effect: Particle, base_location: Location, length: Number | None=None, diameter: Number | None=None, effect_count: Number | None=None, rotations: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays an animated spiral of particles to a player.
+    
+        :param Particle effect: Effect
+        :param Location base_location: Base location
+        :param Number | None length: Length (optional) (Default = 10 blocks)
+        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
+        :param Number | None effect_count: Effect count (optional) (Default = 50)
+        :param Number | None rotations: Rotations (optional) (Default = 4)
+        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleSpiralA', (effect, base_location, length, diameter, effect_count, rotations, animation_duration,), {}, target=target)
+
+    @staticmethod
+    def InstantRespawn(instant_respawn: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets if a player is instantly  respawned upon dying.
+    
+        :param str instant_respawn: Instant Respawn
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'InstantRespawn', (), {'Instant Respawn': instant_respawn}, target=target)
+
+    @staticmethod
+    def SetScore(score_name: DFText, score_value: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets a score on the scoreboard.
+    
+        :param DFText score_name: Score name
+        :param Number | None score_value: Score value (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetScore', (score_name, score_value,), {}, target=target)
+
+    @staticmethod
+    def SetNameColor(name_color: Literal["Black", "Dark blue", "Dark green", "Dark aqua", "Dark red", "Dark purple", "Gold", "Gray", "Dark gray", "Blue", "Green", "Aqua", "Red", "Light purple", "Yellow", "White", "None"]="Black", target: Target=DEFAULT_TARGET):
+        """
+        Sets the color a player's name tag appears in.
+    
+        :param str name_color: Name Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetNameColor', (), {'Name Color': name_color}, target=target)
+
+    @staticmethod
+    def ReachAttribute(value: Number | None=None, attribute: Literal["Block interaction range", "Entity interaction range"]="Block interaction range", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's reach-related attributes such as block and entity interaction ranges.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Block interaction range: Base: 4.5 Range: 0.0-64.0
+            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ReachAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SetTickRate(ticks_per_second: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Changes the tick rate of a player.
+    
+        :param Number | None ticks_per_second: Ticks per second (0-20) (optional) (Default = 20)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetTickRate', (ticks_per_second,), {}, target=target)
+
+    @staticmethod
+    def PlayEntitySound(sound_to_play: list[Sound] | Sound, target_uuid: list[DFString] | DFString, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Plays a sound that follows a moving entity or player.
+    
+        :param list[Sound] | Sound sound_to_play: Sound to play
+        :param list[DFString] | DFString target_uuid: Target UUID
+        :param str sound_source: Sound Source
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'PlayEntitySound', (sound_to_play, target_uuid,), {'Sound Source': sound_source, 'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetExp(experience_to_set: Number, set_experience: Literal["Points", "Level", "Level Percentage"]="Level", target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's experience level, points or progress.
+    
+        :param Number experience_to_set: Experience to set
+        :param str set_experience: Set Experience
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetExp', (experience_to_set,), {'Set Experience': set_experience}, target=target)
+
+    @staticmethod
+    def MiningAttribute(value: Number | None=None, attribute: Literal["Block break speed", "Mining efficiency", "Submerged mining speed"]="Block break speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's mining-related attributes such as break speed and mining efficiency.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Block break speed: Base: 1.0 Range: 0.0-1024.0
+            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
+            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'MiningAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def KBAttribute(value: Number | None=None, attribute: Literal["Knockback resistance", "Explosion knockback resistance"]="Knockback resistance", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's knockback-related attributes such as knockback resistance.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'KBAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def MovementAttribute(value: Number | None=None, attribute: Literal["Walking speed", "Flying speed", "Jump strength", "Sneaking speed", "Step height", "Movement efficiency", "Water movement efficiency"]="Walking speed", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's movement-related attributes, such as walking speed and jump height.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Walking speed: Base: 0.2 Range: -1.0-1.0
+            - Flying speed: Base: 0.1 Range: -1.0-1.0
+            - Jump strength: Base: 0.42 Range: 0.0-32.0
+            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
+            - Step height: Base: 0.6 Range: 0.0-10.0
+            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'MovementAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def ParticleSpiral(effect: Particle, base_location: Location, length: Number | None=None, diameter: Number | None=None, effect_count: Number | None=None, rotations: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a spiral of particles at a location to a player.
+    
+        :param Particle effect: Effect
+        :param Location base_location: Base location
+        :param Number | None length: Length (optional) (Default = 10 blocks)
+        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
+        :param Number | None effect_count: Effect count (optional) (Default = 50)
+        :param Number | None rotations: Rotations (optional) (Default = 4)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleSpiral', (effect, base_location, length, diameter, effect_count, rotations,), {}, target=target)
+
+    @staticmethod
+    def FallingAttribute(value: Number | None=None, attribute: Literal["Gravity", "Safe fall distance", "Fall damage multiplier"]="Gravity", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's falling-related attributes, such as gravity and fall damage multiplier.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Gravity: Base: 0.08 Range: -1.0-1.0
+            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
+            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'FallingAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def SetAllowFlight(allow_flight: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player is able to enter and exit flight mode by double tapping jump.
+    
+        :param str allow_flight: Allow Flight
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetAllowFlight', (), {'Allow Flight': allow_flight}, target=target)
+
+    @staticmethod
+    def SetMaxHealth(maximum_health: Number, heal_player_to_max_health: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's maximum health.
+    
+        :param Number maximum_health: Maximum health (❤ = 2 Health)
+        :param str heal_player_to_max_health: Heal Player to Max Health
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetMaxHealth', (maximum_health,), {'Heal Player to Max Health': heal_player_to_max_health}, target=target)
+
+    @staticmethod
+    def RemoveBossBar(boss_bar_position: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Removes a boss health bar from a player's screen.
+    
+        :param Number | None boss_bar_position: Boss bar position OR Removes all boss bars
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', ' RemoveBossBar ', (boss_bar_position,), {}, target=target)
+
+    @staticmethod
+    def SetFogDistance(fog_distance_in_chunks: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets how far the fog is displayed to a player.
+    
+        :param Number | None fog_distance_in_chunks: Fog distance in chunks (2-7) OR Removes fog
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFogDistance', (fog_distance_in_chunks,), {}, target=target)
+
+    @staticmethod
+    def AdventureMode(target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's game mode to Adventure.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'AdventureMode', (), {}, target=target)
+
+    @staticmethod
+    def SpectatorMode(target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's game mode to Spectator.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SpectatorMode', (), {}, target=target)
+
+    @staticmethod
+    def DispHeadTexture(head_location: Location, player_head: Item | DFString, target: Target=DEFAULT_TARGET):
+        """
+        Changes a head's texture at a location for a player.
+    
+        :param Location head_location: Head location
+        :param Item | DFString player_head: Player Head OR Head owner (Player name, UUID, or texture)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DispHeadTexture', (head_location, player_head,), {}, target=target)
+
+    @staticmethod
+    def ClearPotions(target: Target=DEFAULT_TARGET):
+        """
+        Removes all active potion effects from a player.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ClearPotions', (), {}, target=target)
+
+    @staticmethod
+    def SetTabListInfo(headerfooter_text: list[DFText] | DFText | None=None, player_list_field: Literal["Header", "Footer"]="Header", text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sets the text to be displayed above or below a player's player list shown when pressing Tab.
+    
+        :param list[DFText] | DFText | None headerfooter_text: Header/footer text (optional)
+        :param str player_list_field: Player List Field
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetTabListInfo', (headerfooter_text,), {'Player List Field': player_list_field, 'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
+
+    @staticmethod
+    def PromptPurchase(product_id: DFString, target: Target=DEFAULT_TARGET):
+        """
+        Prompts the player to purchase a plot product.
+    
+        :param DFString product_id: Product ID
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'PromptPurchase', (product_id,), {}, target=target)
+
+    @staticmethod
+    def ScoreLineFormat(score_name: DFText, content_or_style: DFText | None=None, number_format: Literal["Fixed", "Styled", "Blank", "Reset"]="Fixed", target: Target=DEFAULT_TARGET):
+        """
+        Sets the number format of a single line in the player's scoreboard.
+    
+        :param DFText score_name: Score name
+        :param DFText | None content_or_style: Content or style OR Uses the default number format
+        :param str number_format: Number Format
+    
+            - Fixed: Displays a constant text.
+            - Styled: Displays a score number with the specified text style.
+            - Blank: Does not display anything.
+            - Reset: Uses the default number format.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ScoreLineFormat', (score_name, content_or_style,), {'Number Format': number_format}, target=target)
+
+    @staticmethod
+    def SetBossBar(title: DFText | None=None, current_health: Number | None=None, maximum_health: Number | None=None, boss_bar_position: Number | None=None, bar_style: Literal["Solid", "6 segments", "10 segments", "12 segments", "20 segments"]="Solid", sky_effect: Literal["None", "Create fog", "Darken sky", "Both"]="None", bar_color: Literal["Red", "Purple", "Pink", "Blue", "Green", "Yellow", "White"]="Purple", target: Target=DEFAULT_TARGET):
+        """
+        Creates or modifies a custom boss health bar at the top of a player's screen.
+    
+        :param DFText | None title: Title (optional)
+        :param Number | None current_health: Current health (optional)
+        :param Number | None maximum_health: Maximum health (optional) (Default = 100)
+        :param Number | None boss_bar_position: Boss bar position (optional) (Default = 1 (top))
+        :param str bar_style: Bar Style
+    
+            - Solid: The boss bar has no segments.
+            - 6 segments: Each segment covers 16.66% of the boss bar.
+            - 10 segments: Each segment covers 10% of the boss bar.
+            - 12 segments: Each segment covers 8.33% of the boss bar.
+            - 20 segments: Each segment covers 5% of the boss bar.
+        :param str sky_effect: Sky Effect
+        :param str bar_color: Bar Color
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', ' SetBossBar ', (title, current_health, maximum_health, boss_bar_position,), {'Bar Style': bar_style, 'Sky Effect': sky_effect, 'Bar Color': bar_color}, target=target)
+
+    @staticmethod
+    def SetSkin(player_head: Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the player's skin.
+    
+        :param Item | None player_head: Player head OR Clears Skin)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSkin', (player_head,), {}, target=target)
+
+    @staticmethod
+    def SpectatorCollision(spectator_collision: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Toggles whether a player collides with blocks in spectator mode.
+    
+        :param str spectator_collision: Spectator Collision
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SpectatorCollision', (), {'Spectator Collision': spectator_collision}, target=target)
+
+    @staticmethod
+    def SetNameVisible(name_tag_visible: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player's name tag is visible.
+    
+        :param str name_tag_visible: Name Tag Visible
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetNameVisible', (), {'Name Tag Visible': name_tag_visible}, target=target)
+
+    @staticmethod
+    def SetInvulTicks(ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets the currently remaining ticks until a player can next be hurt.
+    
+        :param Number ticks: Ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetInvulTicks', (ticks,), {}, target=target)
+
+    @staticmethod
+    def Mimic(target_uuid: list[DFString] | DFString, remove_original_entity: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Disguises a player as another currently existing entity or player.
+    
+        :param list[DFString] | DFString target_uuid: UUID of target to disguise as
+        :param str remove_original_entity: Remove Original Entity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Mimic', (target_uuid,), {'Remove Original Entity': remove_original_entity}, target=target)
+
+    @staticmethod
+    def SetStingsStuck(sting_count: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the amount of bee stings sticking out of a player's character model.
+    
+        :param Number | None sting_count: Sting Count (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetStingsStuck', (sting_count,), {}, target=target)
+
+    @staticmethod
+    def RemoveScore(score_name: DFText, target: Target=DEFAULT_TARGET):
+        """
+        Removes a score from the scoreboard.
+    
+        :param DFText score_name: Score name
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RemoveScore', (score_name,), {}, target=target)
+
+    @staticmethod
+    def SetExhaustion(exhaustion_level: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's exhaustion level.
+    
+        :param Number exhaustion_level: Exhaustion level (0-4)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetExhaustion', (exhaustion_level,), {}, target=target)
+
+    @staticmethod
+    def ParticleCircle(effect: Particle, center_location: Location, diameter: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a circle of particles to a player.
+    
+        :param Particle effect: Effect
+        :param Location center_location: Center location
+        :param Number | None diameter: Diameter (optional) (Default = 2 blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleCircle', (effect, center_location, diameter,), {}, target=target)
+
+    @staticmethod
+    def DisplayBlock(block_to_display: Item, block_location_or_start_of_region: Location, end_of_region: Location | None=None, block_data: list[DFString] | DFString | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a block at a location to a player.
+    
+        :param Item block_to_display: Block to display
+        :param Location block_location_or_start_of_region: Block location, or start of region
+        :param Location | None end_of_region: End of region (optional) (Region size limit: 250,000 blocks)
+        :param list[DFString] | DFString | None block_data: Block data (optional) (Example: "facing=up", "half=top")
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayBlock', (block_to_display, block_location_or_start_of_region, end_of_region, block_data,), {}, target=target)
+
+    @staticmethod
+    def RideEntity(target_uuid: list[DFString] | DFString | None=None, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Mounts a player on top of another player or entity.
+    
+        :param list[DFString] | DFString | None target_uuid: Target UUID OR Dismounts player
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RideEntity', (target_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def RmWorldBorder(target: Target=DEFAULT_TARGET):
+        """
+        Removes a player's world border.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RmWorldBorder', (), {}, target=target)
+
+    @staticmethod
+    def ResourcePack(resource_pack_url: DFString, target: Target=DEFAULT_TARGET):
+        """
+        Send a resource pack to a player.
+    
+        :param DFString resource_pack_url: Resource Pack URL (Must link directly to a .zip file.)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ResourcePack', (resource_pack_url,), {}, target=target)
+
+    @staticmethod
+    def SetInvName(inventory_name: DFText, alignment_mode: Literal["Regular", "Centered"]="Regular", target: Target=DEFAULT_TARGET):
+        """
+        Renames a player's current inventory menu.
+    
+        :param DFText inventory_name: Inventory name
+        :param str alignment_mode: Alignment Mode
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', ' SetInvName ', (inventory_name,), {'Alignment Mode': alignment_mode}, target=target)
+
+    @staticmethod
+    def GiveExhaustion(exhaustion_to_give: Number, target: Target=DEFAULT_TARGET):
+        """
+        Adds exhaustion to a player.
+    
+        :param Number exhaustion_to_give: Exhaustion to give
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GiveExhaustion', (exhaustion_to_give,), {}, target=target)
+
+    @staticmethod
+    def Teleport(new_position: Location, keep_current_rotation: Literal["True", "False"]="False", keep_velocity: Literal["True", "False"]="False", target: Target=DEFAULT_TARGET):
+        """
+        Teleports a player to a location.
+    
+        :param Location new_position: New position
+        :param str keep_current_rotation: Keep Current Rotation
+        :param str keep_velocity: Keep Velocity
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'Teleport', (new_position,), {'Keep Current Rotation': keep_current_rotation, 'Keep Velocity': keep_velocity}, target=target)
+
+    @staticmethod
+    def SetAllowPVP(pvp: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player can hurt or be hurt by other players.
+    
+        :param str pvp: PVP
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetAllowPVP', (), {'PVP': pvp}, target=target)
+
+    @staticmethod
+    def SetVisualFire(on_fire: Literal["Enable", "Disable"]="Enable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player should appear on fire.
+    
+        :param str on_fire: On Fire
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetVisualFire', (), {'On Fire': on_fire}, target=target)
+
+    @staticmethod
+    def SetDisguiseVisible(disguise_visible: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's ability to see their own disguise. It is recommended that it is almost always hidden.
+    
+        :param str disguise_visible: Disguise Visible
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetDisguiseVisible', (), {'Disguise Visible': disguise_visible}, target=target)
+
+    @staticmethod
+    def DisguiseShiftVert(yoffset: Number, target: Target=DEFAULT_TARGET):
+        """
+        Shifts the disguise of a player up or down relative to the player.
+    
+        :param Number yoffset: Y-Offset
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisguiseShiftVert', (yoffset,), {}, target=target)
+
+    @staticmethod
+    def SetArrowsStuck(arrow_count: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the amount of arrows sticking out of a player's character model.
+    
+        :param Number | None arrow_count: Arrow Count (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetArrowsStuck', (arrow_count,), {}, target=target)
+
+    @staticmethod
+    def GetItemCooldown(result: Variable, item_type_to_check: Item, target: Target=DEFAULT_TARGET):
+        """
+        Gets the remaining cooldown on an item type.
+    
+        :param Variable result: Variable to set
+        :param Item item_type_to_check: Item type to check
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GetItemCooldown', (result, item_type_to_check,), {}, target=target)
+
+    @staticmethod
+    def ReplaceItems(item_to_replace: list[Item] | Item | None=None, item_to_replace_with: Item=None, items_amount: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Replaces items in a player's inventory with the given item.
+    
+        :param list[Item] | Item | None item_to_replace: Item(s) to replace (optional)
+        :param Item item_to_replace_with: Item to replace with
+        :param Number | None items_amount: Amount of items to replace (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ReplaceItems', (item_to_replace, item_to_replace_with, items_amount,), {}, target=target)
+
+    @staticmethod
+    def SendMessage(message_to_send: list[DFText] | DFText | None=None, alignment_mode: Literal["Regular", "Centered"]="Regular", text_value_merging: Literal["Add spaces", "No spaces"]="Add spaces", inherit_styles: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Sends a chat message to a player.
+    
+        :param list[DFText] | DFText | None message_to_send: Message to send (optional)
+        :param str alignment_mode: Alignment Mode
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SendMessage', (message_to_send,), {'Alignment Mode': alignment_mode, 'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles}, target=target)
+
+    @staticmethod
+    def SetSlotItem(item_to_set: Item | None=None, slot_to_set: Number=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the item in a slot of a player's inventory.
+    
+        :param Item | None item_to_set: Item to set (optional)
+        :param Number slot_to_set: Slot to set (1-9 Hotbar)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSlotItem', (item_to_set, slot_to_set,), {}, target=target)
+
+    @staticmethod
+    def PlaySoundSeq(sounds_to_play: list[Sound] | Sound, sound_delay: Number | None=None, playback_location: Location | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
+        """
+        Plays a sequence of sounds to a player, with a delay between each sound.
+    
+        :param list[Sound] | Sound sounds_to_play: Sounds to play
+        :param Number | None sound_delay: Sound delay (ticks, default = 60) (optional)
+        :param Location | None playback_location: Playback location (optional)
+        :param str sound_source: Sound Source
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'PlaySoundSeq', (sounds_to_play, sound_delay, playback_location,), {'Sound Source': sound_source}, target=target)
+
+    @staticmethod
+    def OpenTradeMenu(villager_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Opens the trading menu of a villager.
+    
+        :param DFString villager_uuid: Villager UUID
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'OpenTradeMenu', (villager_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def ParticleLineA(effect: Particle, start_location: Location, end_location: Location, effect_spacing: Number | None=None, animation_duration: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays an animated line of particles between two locations to a player.
+    
+        :param Particle effect: Effect
+        :param Location start_location: Start location
+        :param Location end_location: End location
+        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
+        :param Number | None animation_duration: Animation duration (optional) (Default = 40 ticks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleLineA', (effect, start_location, end_location, effect_spacing, animation_duration,), {}, target=target)
+
+    @staticmethod
+    def SetItemCooldown(item_type_to_affect: Item, cooldown: Number, target: Target=DEFAULT_TARGET):
+        """
+        Applies a cooldown visual effect to an item type.
+    
+        :param Item item_type_to_affect: Item type to affect
+        :param Number cooldown: Cooldown in ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetItemCooldown', (item_type_to_affect, cooldown,), {}, target=target)
+
+    @staticmethod
+    def SetPlayerWeather(weather: Literal["Clear", "Downfall"]="Downfall", target: Target=DEFAULT_TARGET):
+        """
+        Sets the type of weather visible to a player.
+    
+        :param str weather: Weather
+    
+            - Clear: Displays sunny weather.
+            - Downfall: Displays rain, or snow (in cold biomes).
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetPlayerWeather', (), {'Weather': weather}, target=target)
+
+    @staticmethod
+    def SetShoulder(shoulder: Literal["Left", "Right"]="Left", type: Literal["Remove", "Red", "Blue", "Green", "Cyan", "Gray"]="Remove", target: Target=DEFAULT_TARGET):
+        """
+        Displays a parrot on the targets' shoulders.
+    
+        :param str shoulder: Shoulder
+        :param str type: Type
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetShoulder', (), {'Shoulder': shoulder, 'Type': type}, target=target)
+
+    @staticmethod
+    def SetAirTicks(breath_ticks: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's remaining breath ticks.
+    
+        :param Number breath_ticks: Breath ticks
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetAirTicks', (breath_ticks,), {}, target=target)
+
+    @staticmethod
+    def DisplayPickup(entity_uuid: DFString, collector_uuid: DFString, ignore_formatting: Literal["True", "False"]="True", target: Target=DEFAULT_TARGET):
+        """
+        Displays a pickup animation of one entity being collected by another entity.
+    
+        :param DFString entity_uuid: Entity UUID
+        :param DFString collector_uuid: Collector UUID
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayPickup', (entity_uuid, collector_uuid,), {'Ignore Formatting': ignore_formatting}, target=target)
+
+    @staticmethod
+    def SetWorldBorder(center_position: Location, radius_in_blocks: Number, warning_distance: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Creates a world border only visible to a player.
+    
+        :param Location center_position: Center position
+        :param Number radius_in_blocks: Radius in blocks
+        :param Number | None warning_distance: Warning distance (optional) (Default = 0)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetWorldBorder', (center_position, radius_in_blocks, warning_distance,), {}, target=target)
+
+    @staticmethod
+    def SetPlayerTime(daylight_ticks: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Sets the time of day visible to a player.
+    
+        :param Number | None daylight_ticks: Daylight ticks OR Resets player time (Day: 1000)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetPlayerTime', (daylight_ticks,), {}, target=target)
+
+    @staticmethod
+    def GiveFood(food_to_give: Number, target: Target=DEFAULT_TARGET):
+        """
+        Adds food to a player.
+    
+        :param Number food_to_give: Food to give
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GiveFood', (food_to_give,), {}, target=target)
+
+    @staticmethod
+    def GivePotion(effect_to_give: list[Potion] | Potion, show_icon: Literal["True", "False"]="True", overwrite_effect: Literal["True", "False"]="True", effect_particles: Literal["Regular", "Ambient", "None"]="Regular", target: Target=DEFAULT_TARGET):
+        """
+        Gives one or more potion effects to a player.
+    
+        :param list[Potion] | Potion effect_to_give: Effect(s) to give
+        :param str show_icon: Show Icon
+    
+            - True: Shows the effect's icon.
+            - False: Hides the effect's icon. It can still be seen in the inventory.
+        :param str overwrite_effect: Overwrite Effect
+    
+            - True: Effects of the same type will always be replaced.
+            - False: Weaker effects of the same type will be hidden.
+        :param str effect_particles: Effect Particles
+    
+            - Ambient: Ambient particles are translucent and make the icon border blue.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'GivePotion', (effect_to_give,), {'Show Icon': show_icon, 'Overwrite Effect': overwrite_effect, 'Effect Particles': effect_particles}, target=target)
+
+    @staticmethod
+    def RemoveItems(item_to_remove: list[Item] | Item, target: Target=DEFAULT_TARGET):
+        """
+        Removes items from a player.
+    
+        :param list[Item] | Item item_to_remove: Item(s) to remove
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RemoveItems', (item_to_remove,), {}, target=target)
+
+    @staticmethod
+    def BoostElytra(firework: Item, target: Target=DEFAULT_TARGET):
+        """
+        Boosts a player's elytra using a firework rocket.
+    
+        :param Item firework: Firework
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'BoostElytra', (firework,), {}, target=target)
+
+    @staticmethod
+    def SaveInv(target: Target=DEFAULT_TARGET):
+        """
+        Saves a player's inventory. It can be loaded later with 'Load Saved Inventory'.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SaveInv', (), {}, target=target)
+
+    @staticmethod
+    def OpenBook(book_item: Item, target: Target=DEFAULT_TARGET):
+        """
+        Opens a written book menu for a player.
+    
+        :param Item book_item: Book item
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'OpenBook', (book_item,), {}, target=target)
+
+    @staticmethod
+    def SetHealth(current_health: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's current health.
+    
+        :param Number current_health: Current health (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetHealth', (current_health,), {}, target=target)
+
+    @staticmethod
+    def BlockDisguise(block_to_disguise_as: Item, display_name: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises a player as a block.
+    
+        :param Item block_to_disguise_as: Block to disguise as
+        :param DFText | None display_name: Display name (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'BlockDisguise', (block_to_disguise_as, display_name,), {}, target=target)
+
+    @staticmethod
+    def RollbackBlocks(rollback_time: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Undoes the interactions with blocks by a player.
+    
+        :param Number | None rollback_time: Rollback time (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'RollbackBlocks', (rollback_time,), {}, target=target)
+
+    @staticmethod
+    def SetCollidable(collision: Literal["Enable", "Disable"]="Disable", target: Target=DEFAULT_TARGET):
+        """
+        Sets whether a player is able to collide with other entities.
+    
+        :param str collision: Collision
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetCollidable', (), {'Collision': collision}, target=target)
+
+    @staticmethod
+    def LaunchFwd(launch_power: Number, add_to_current_velocity: Literal["True", "False"]="True", launch_axis: Literal["Pitch and Yaw", "Yaw Only"]="Pitch and Yaw", target: Target=DEFAULT_TARGET):
+        """
+        Launches a player forward or backward.
+    
+        :param Number launch_power: Launch power
+        :param str add_to_current_velocity: Add to Current Velocity
+        :param str launch_axis: Launch Axis
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'LaunchFwd', (launch_power,), {'Add to Current Velocity': add_to_current_velocity, 'Launch Axis': launch_axis}, target=target)
+
+    @staticmethod
+    def SetFallDistance(fall_distance: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's fall distance, affecting fall damage upon landing.
+    
+        :param Number fall_distance: Fall distance (blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFallDistance', (fall_distance,), {}, target=target)
+
+    @staticmethod
+    def CreativeMode(target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's game mode to Creative.
+    
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'CreativeMode', (), {}, target=target)
+
+    @staticmethod
+    def AttackAnimation(animation_arm: Literal["Swing main arm", "Swing off arm"]="Swing main arm", target: Target=DEFAULT_TARGET):
+        """
+        Makes a player perform an attack animation.
+    
+        :param str animation_arm: Animation Arm
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'AttackAnimation', (), {'Animation Arm': animation_arm}, target=target)
+
+    @staticmethod
+    def DisplayHologram(display_location: Location, text_to_display: DFText | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a floating name tag at a location to a player.
+    
+        :param Location display_location: Display location
+        :param DFText | None text_to_display: Text to display OR Removes hologram
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'DisplayHologram', (display_location, text_to_display,), {}, target=target)
+
+    @staticmethod
+    def SetAbsorption(absorption_health: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's absorption health (golden hearts).
+    
+        :param Number absorption_health: Absorption health (❤ = 2 Health)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', ' SetAbsorption ', (absorption_health,), {}, target=target)
+
+    @staticmethod
+    def ShowInv(items_to_display: list[Item] | Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Opens a custom inventory for a player.
+    
+        :param list[Item] | Item | None items_to_display: Items to display (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ShowInv', (items_to_display,), {}, target=target)
+
+    @staticmethod
+    def SetFoodLevel(food_level: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's food hunger level.
+    
+        :param Number food_level: Food level (1-20)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetFoodLevel', (food_level,), {}, target=target)
+
+    @staticmethod
+    def PlayerDisguise(player_name_to_disguise_as: DFText, display_skin: Item | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Disguises a player as another player.
+    
+        :param DFText player_name_to_disguise_as: Player name to disguise as
+        :param Item | None display_skin: Display skin (optional)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'PlayerDisguise', (player_name_to_disguise_as, display_skin,), {}, target=target)
+
+    @staticmethod
+    def SetSaturation(saturation_level: Number, target: Target=DEFAULT_TARGET):
+        """
+        Sets a player's saturation level.
+    
+        :param Number saturation_level: Saturation level (1-20)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SetSaturation', (saturation_level,), {}, target=target)
+
+    @staticmethod
+    def SendTitle(title_text: DFText, subtitle_text: DFText | None=None, title_duration: Number | None=None, fade_in_length: Number | None=None, fade_out_length: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays text in the center of a player's screen.
+    
+        :param DFText title_text: Title text
+        :param DFText | None subtitle_text: Subtitle text (optional)
+        :param Number | None title_duration: Title duration (optional) (Default = 60 ticks)
+        :param Number | None fade_in_length: Fade in length (optional) (Default = 20 ticks)
+        :param Number | None fade_out_length: Fade out length (optional) (Default = 20 ticks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'SendTitle', (title_text, subtitle_text, title_duration, fade_in_length, fade_out_length,), {}, target=target)
+
+    @staticmethod
+    def ScoreDefFormat(content_or_style: DFText | None=None, number_format: Literal["Fixed", "Styled", "Blank", "Reset"]="Fixed", target: Target=DEFAULT_TARGET):
+        """
+        Sets the default number format of the player's scoreboard.
+    
+        :param DFText | None content_or_style: Content or style OR Uses the default number format
+        :param str number_format: Number Format
+    
+            - Fixed: Displays a constant text.
+            - Styled: Displays a score number with the specified text style.
+            - Blank: Does not display anything.
+            - Reset: Uses the default number format.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ScoreDefFormat', (content_or_style,), {'Number Format': number_format}, target=target)
+
+    @staticmethod
+    def StopSound(sounds_to_stop: list[Sound] | Sound | None=None, sound_source: Literal["Master", "Music", "Jukebox/Note Blocks", "Weather", "Blocks", "Hostile Creatures", "Friendly Creatures", "Players", "Ambient/Environment", "Voice/Speech", "UI"]="Master", target: Target=DEFAULT_TARGET):
+        """
+        Stops all or specific sounds for a player.
+    
+        :param list[Sound] | Sound | None sounds_to_stop: Sounds to stop (optional)
+        :param str sound_source: Sound Source
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'StopSound', (sounds_to_stop,), {'Sound Source': sound_source}, target=target)
+
+    @staticmethod
+    def HealthAttribute(value: Number | None=None, attribute: Literal["Maximum health", "Maximum absorption health", "Armor", "Armor toughness"]="Maximum health", value_type: Literal["Direct", "Percentage (Base)", "Percentage (Relative)"]="Direct", target: Target=DEFAULT_TARGET):
+        """
+        Sets one of the player's health-related attributes such as max health and armor defense points.
+    
+        :param Number | None value: Value (optional)
+        :param str attribute: Attribute
+    
+            - Maximum health: Base: 20.0 Range: 1.0-1024.0
+            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
+            - Armor: Base: 0.0 Range: 0.0-30.0
+            - Armor toughness: Base: 0.0 Range: 0.0-20.0
+        :param str value_type: Value Type
+    
+            - Percentage (Base): A percentage of the base value shown above. 100% is equal to the base value.
+            - Percentage (Relative): A percentage of what the attribute is currently set to. For example, 200% doubles the current value.
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'HealthAttribute', (value,), {'Attribute': attribute, 'Value Type': value_type}, target=target)
+
+    @staticmethod
+    def ParticleLine(effect: Particle, start_location: Location, end_location: Location, effect_spacing: Number | None=None, target: Target=DEFAULT_TARGET):
+        """
+        Displays a line of particles between two locations to a player.
+    
+        :param Particle effect: Effect
+        :param Location start_location: Start location
+        :param Location end_location: End location
+        :param Number | None effect_spacing: Effect spacing (optional) (Default = 0.5 blocks)
+        :param Target target: The target for the action.
+        """
+        return CodeBlock.new_action('player_action', 'ParticleLine', (effect, start_location, end_location, effect_spacing,), {}, target=target)
+
+PA = PlayerAction
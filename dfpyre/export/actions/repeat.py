@@ -0,0 +1,148 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['Repeat']
+
+class Repeat:
+    """
+    Used to repeat the code inside it.
+    """
+
+    @staticmethod
+    def Adjacent(block_location_var: Variable, center_block: Location, change_location_rotation: Literal["True", "False"]="False", include_origin_block: Literal["True", "False"]="False", pattern: Literal["Cardinal (4 blocks)", "Square (8 blocks)", "Adjacent (6 blocks)", "Cube (26 blocks)"]="Adjacent (6 blocks)", codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for each block adjacent to a location.
+    
+        :param Variable block_location_var: Gets the current block location each iteration
+        :param Location center_block: Center block
+        :param str change_location_rotation: Change Location Rotation
+        :param str include_origin_block: Include Origin Block
+        :param str pattern: Pattern
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Adjacent', (block_location_var, center_block,), {'Change Location Rotation': change_location_rotation, 'Include Origin Block': include_origin_block, 'Pattern': pattern}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Path(path_location_var: Variable, path_locations: list[Location] | Location, point_spacing: Number | None=None, rotate_location: Literal["True", "False"]="False", codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for each interpolated point in a path of locations.
+    
+        :param Variable path_location_var: Gets the current path location each iteration
+        :param list[Location] | Location path_locations: Path locations
+        :param Number | None point_spacing: Point spacing (optional) (Default = 0.5 blocks)
+        :param str rotate_location: Rotate Location
+    
+            - True: Sets the rotation of each returned location to face the next given path point.
+            - False: Keeps the rotation of the given path points.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Path', (path_location_var, path_locations, point_spacing,), {'Rotate Location': rotate_location}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Multiple(index_var: Variable | None=None, amount: Number=None, codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code multiple times.
+    
+        :param Variable | None index_var: Gets the current index each iteration (optional)
+        :param Number amount: Amount
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Multiple', (index_var, amount,), {}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Grid(block_location_var: Variable, start_of_region: Location, end_of_region: Location, codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for each block in a region in order: X → Z → Y. Iterates from the first to the second location.
+    
+        :param Variable block_location_var: Gets the current block location each iteration
+        :param Location start_of_region: Start of region
+        :param Location end_of_region: End of region
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Grid', (block_location_var, start_of_region, end_of_region,), {}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def DoWhile(codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code as long as a condition is true. The condition is evaluated at the end of each loop iteration.
+    
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'DoWhile', (), {}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def While(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False, codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code as long as a condition is true. The condition is evaluated before each loop iteration.
+    
+        :param tuple[ArgValue, ...] args: The argument items to include.
+        :param dict[str, str] tags: The tags to include.
+        :param str|None sub_action: The sub-action for the repeat action
+        :param bool inverted: Whether the sub-action condition should be inverted.
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'While', args, tags, sub_action, inverted), codeblocks, 'repeat')
+
+    @staticmethod
+    def ForEach(value_var: Variable, list_to_repeat_through: ArgValue, allow_list_changes: Literal["True", "False (copy list)"]="True", codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for each index of a list.
+    
+        :param Variable value_var: Gets the current value each iteration
+        :param ArgValue list_to_repeat_through: List to repeat through
+        :param str allow_list_changes: Allow List Changes
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'ForEach', (value_var, list_to_repeat_through,), {'Allow List Changes': allow_list_changes}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Sphere(sphere_location_var: Variable, sphere_center: Location, sphere_radius: Number, sphere_points: Number | None=None, point_locations_inwards: Literal["True", "False"]="False", codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for every evenly distributed sphere point.
+    
+        :param Variable sphere_location_var: Gets the current sphere location each iteration
+        :param Location sphere_center: Sphere center
+        :param Number sphere_radius: Sphere radius
+        :param Number | None sphere_points: Sphere points (optional)
+        :param str point_locations_inwards: Point Locations Inwards
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Sphere', (sphere_location_var, sphere_center, sphere_radius, sphere_points,), {'Point Locations Inwards': point_locations_inwards}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Forever(codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code indefinitely.
+    
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'Forever', (), {}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def Range(number_var: Variable | None=None, start_of_range: Number=None, end_of_range: Number=None, step: Number | None=None, codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once for each number on a number line.
+    
+        :param Variable | None number_var: Gets the current number each iteration (optional)
+        :param Number start_of_range: Start of range
+        :param Number end_of_range: End of range
+        :param Number | None step: Step (optional) (Default = 1)
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', ' Range ', (number_var, start_of_range, end_of_range, step,), {}, None, False), codeblocks, 'repeat')
+
+    @staticmethod
+    def ForEachEntry(key_var: Variable, value_var: Variable, dictionary_to_repeat_through: ArgValue, codeblocks: list[CodeBlock]=[]):
+        """
+        Repeats code once per entry in a dictionary
+    
+        :param Variable key_var: Gets the current key each iteration
+        :param Variable value_var: Gets the current value each iteration
+        :param ArgValue dictionary_to_repeat_through: Dictionary to repeat through
+        :param list[CodeBlock] codeblocks: The list of codeblocks inside the brackets.
+        """
+        return add_brackets(CodeBlock.new_subaction_block('repeat', 'ForEachEntry', (key_var, value_var, dictionary_to_repeat_through,), {}, None, False), codeblocks, 'repeat')
+
@@ -0,0 +1,211 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['SelectObject', 'SO']
+
+class SelectObject:
+    """
+    Used to change the selection on the current line of code, which will affect the targets of most code blocks.
+    """
+
+    @staticmethod
+    def RandomPlayer(selection_size: Number | None=None, ):
+        """
+        Creates a selection using one or more random players in the game.
+    
+        :param Number | None selection_size: Selection size (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('select_obj', 'RandomPlayer', (selection_size,), {})
+
+    @staticmethod
+    def LastEntity():
+        """
+        Creates a selection using the most recently spawned entity.
+    
+        
+        """
+        return CodeBlock.new_action('select_obj', 'LastEntity', (), {})
+
+    @staticmethod
+    def EntityName(uuid_to_check_for: list[DFString | DFText] | DFString | DFText, ignore_formatting: Literal["True", "False"]="True", ):
+        """
+        Creates a selection using all entities in the game whose name or UUID matches.
+    
+        :param list[DFString | DFText] | DFString | DFText uuid_to_check_for: UUID to check for OR Name to check for
+        :param str ignore_formatting: Ignore Formatting
+    
+            - True: Color codes and style tags are ignored when matching an entity by its name.
+            - False: All color codes and style tags in the entity's name must match exactly.
+        
+        """
+        return CodeBlock.new_action('select_obj', 'EntityName', (uuid_to_check_for,), {'Ignore Formatting': ignore_formatting})
+
+    @staticmethod
+    def FilterRandom(selection_size: Number | None=None, ):
+        """
+        Filters the selection by randomly picking one or more objects from it.
+    
+        :param Number | None selection_size: Selection size (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('select_obj', 'FilterRandom', (selection_size,), {})
+
+    @staticmethod
+    def EntityUUID(uuid_to_check_for: list[DFString] | DFString, ):
+        """
+        Creates a selection of all entities in the game with the given UUIDs.
+    
+        :param list[DFString] | DFString uuid_to_check_for: UUID(s) to check for
+        
+        """
+        return CodeBlock.new_action('select_obj', 'EntityUUID', (uuid_to_check_for,), {})
+
+    @staticmethod
+    def PlayerName(name_or_uuid: list[DFString] | DFString, ):
+        """
+        Creates a selection using all players in the game whose name or UUID matches.
+    
+        :param list[DFString] | DFString name_or_uuid: Name or UUID
+        
+        """
+        return CodeBlock.new_action('select_obj', 'PlayerName', (name_or_uuid,), {})
+
+    @staticmethod
+    def AllEntities():
+        """
+        Creates a selection of all entities in the game.
+    
+        
+        """
+        return CodeBlock.new_action('select_obj', 'AllEntities', (), {})
+
+    @staticmethod
+    def FilterDistance(location_to_compare_to: Location, selection_size: Number | None=None, ignore_yaxis: Literal["True", "False"]="False", compare_mode: Literal["Nearest", "Farthest"]="Nearest", ):
+        """
+        Filters the selection to the objects that are nearest or farthest to a location.
+    
+        :param Location location_to_compare_to: Location to compare to
+        :param Number | None selection_size: Selection size (optional) (Default = 1)
+        :param str ignore_yaxis: Ignore Y-Axis
+        :param str compare_mode: Compare Mode
+        
+        """
+        return CodeBlock.new_action('select_obj', 'FilterDistance', (location_to_compare_to, selection_size,), {'Ignore Y-Axis': ignore_yaxis, 'Compare Mode': compare_mode})
+
+    @staticmethod
+    def FilterRay(gets_the_end_or_final_hit_location: Variable | None=None, ray_origin: Location=None, ray_distance: Number=None, ray_width: Number | None=None, selection_size: Number | None=None, block_collision: Literal["All blocks", "Non-fluid blocks", "Solid blocks", "None"]="Solid blocks", ):
+        """
+        Filters the selected objects to the objects that intersect a ray.
+    
+        :param Variable | None gets_the_end_or_final_hit_location: Gets the end or final hit location (optional)
+        :param Location ray_origin: Ray origin
+        :param Number ray_distance: Ray distance
+        :param Number | None ray_width: Ray width (optional) (Default = 0.0)
+        :param Number | None selection_size: Selection size (optional) (Default = 1)
+        :param str block_collision: Block Collision
+    
+            - All blocks: Passes through air only.
+            - Non-fluid blocks: Passes through fluids (water and lava).
+            - Solid blocks: Passes through non-solid blocks such as tall grass, and through fluids.
+            - None: Passes through all blocks.
+        
+        """
+        return CodeBlock.new_action('select_obj', 'FilterRay', (gets_the_end_or_final_hit_location, ray_origin, ray_distance, ray_width, selection_size,), {'Block Collision': block_collision})
+
+    @staticmethod
+    def Reset():
+        """
+        Deactivates the selection. Code that follows will run normally with event targets.
+    
+        
+        """
+        return CodeBlock.new_action('select_obj', 'Reset', (), {})
+
+    @staticmethod
+    def EventTarget(event_target: Literal["Default", "Killer", "Damager", "Victim", "Shooter", "Projectile"]="Default", ):
+        """
+        Creates a selection using a target involved in this Event.
+    
+        :param str event_target: Event Target
+    
+            - Default: The target that triggered this event.
+            - Killer: The target that killed the victim in this event.
+            - Damager: The target that harmed the victim in this event.
+            - Victim: The target that was harmed or killed in this event.
+            - Shooter: The target that fired a projectile in this event.
+            - Projectile: The projectile in this event.
+        
+        """
+        return CodeBlock.new_action('select_obj', 'EventTarget', (), {'Event Target': event_target})
+
+    @staticmethod
+    def EntitiesCond(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
+        """
+        Creates a selection of all entities in the game that meet a condition.
+    
+        :param tuple[ArgValue, ...] args: The argument items to include.
+        :param dict[str, str] tags: The tags to include.
+        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
+        :param bool inverted: Whether the sub-action condition should be inverted.
+        """
+        return CodeBlock.new_subaction_block('select_obj', 'EntitiesCond', args, tags, sub_action, inverted) 
+
+    @staticmethod
+    def AllPlayers():
+        """
+        Creates a selection of all players in the game.
+    
+        
+        """
+        return CodeBlock.new_action('select_obj', 'AllPlayers', (), {})
+
+    @staticmethod
+    def Invert():
+        """
+        Creates a new selection by inverting the selection that is currently active.
+    
+        
+        """
+        return CodeBlock.new_action('select_obj', 'Invert', (), {})
+
+    @staticmethod
+    def FilterCondition(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
+        """
+        Filters the selection to the objects that meet a certain condition.
+    
+        :param tuple[ArgValue, ...] args: The argument items to include.
+        :param dict[str, str] tags: The tags to include.
+        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
+        :param bool inverted: Whether the sub-action condition should be inverted.
+        """
+        return CodeBlock.new_subaction_block('select_obj', 'FilterCondition', args, tags, sub_action, inverted) 
+
+    @staticmethod
+    def FilterSort(value_to_compare: ArgValue, selection_size: Number | None=None, sort_order: Literal["Ascending", "Descending"]="Ascending", ):
+        """
+        Filters the selection by sorting the value of each object in order.
+    
+        :param ArgValue value_to_compare: Value to compare
+        :param Number | None selection_size: Selection size (optional) (Default = 1)
+        :param str sort_order: Sort Order
+        
+        """
+        return CodeBlock.new_action('select_obj', 'FilterSort', (value_to_compare, selection_size,), {'Sort Order': sort_order})
+
+    @staticmethod
+    def PlayersCond(*args: ArgValue, tags: dict[str, str]={}, sub_action: SUBACTION|None=None, inverted: bool=False):
+        """
+        Creates a selection of all players in the game that meet a condition.
+    
+        :param tuple[ArgValue, ...] args: The argument items to include.
+        :param dict[str, str] tags: The tags to include.
+        :param str|None sub_action: The sub-action to use. (Not relevant for all actions)
+        :param bool inverted: Whether the sub-action condition should be inverted.
+        """
+        return CodeBlock.new_subaction_block('select_obj', 'PlayersCond', args, tags, sub_action, inverted) 
+
+SO = SelectObject
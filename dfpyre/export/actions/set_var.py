@@ -0,0 +1,3611 @@
+# Auto generated by pyre 2026-10-17T06:16:51.382847+00:00
+from typing import Literal
+from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET
+from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector
+from dfpyre.export.block_functions import assemble_template, add_brackets
+from dfpyre.gen.action_literals import SUBACTION
+__all__ = ['SetVariable', 'SV']
+
+class SetVariable:
+    """
+    Used to set the value of a variable.
+    """
+
+    @staticmethod
+    def SetParticlePower(result: Variable, effect_to_change: Particle | None=None, particle_power: Number=None, ):
+        """
+        Sets a particle effect's power.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_power: Particle power
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticlePower', (result, effect_to_change, particle_power,), {})
+
+    @staticmethod
+    def String(result: Variable, string_to_set_to: list[ArgValue] | ArgValue | None=None, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", ):
+        """
+        Sets a variable to a string, or combines multiple values into one string.
+    
+        :param Variable result: Variable to set
+        :param list[ArgValue] | ArgValue | None string_to_set_to: String to set to (optional)
+        :param str text_value_merging: Text Value Merging
+        
+        """
+        return CodeBlock.new_action('set_var', 'String', (result, string_to_set_to,), {'Text Value Merging': text_value_merging})
+
+    @staticmethod
+    def AllRegexGroups(result: Variable, input_string: DFString, regex_pattern: DFString, ):
+        """
+        Gets a list of all capture groups in a Regex match.
+    
+        :param Variable result: Variable to set
+        :param DFString input_string: Input string
+        :param DFString regex_pattern: Regex pattern
+        
+        """
+        return CodeBlock.new_action('set_var', 'AllRegexGroups', (result, input_string, regex_pattern,), {})
+
+    @staticmethod
+    def SetBundleItems(result: Variable, bundle: Item | None=None, contents: list[Item] | Item | None=None, ):
+        """
+        Sets the contents of a bundle.
+    
+        :param Variable result: Variable to set
+        :param Item | None bundle: Bundle (optional)
+        :param list[Item] | Item | None contents: Contents (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetBundleItems', (result, bundle, contents,), {})
+
+    @staticmethod
+    def SetParticleType(result: Variable, effect_to_change: Particle | None=None, type: DFString=None, ):
+        """
+        Sets a particle effect's type.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param DFString type: Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleType', (result, effect_to_change, type,), {})
+
+    @staticmethod
+    def ClearItemTag(result: Variable, item_to_change: Item | None=None, ):
+        """
+        Removes all item custom tags.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClearItemTag', (result, item_to_change,), {})
+
+    @staticmethod
+    def PurgeVars(name_to_match: list[DFString] | DFString, match_requirement: Literal["Entire name", "Full word(s) in name", "Any part of name"]="Full word(s) in name", ignore_case: Literal["True", "False"]="False", ):
+        """
+        Clears all variables with names that match the given text.
+    
+        :param list[DFString] | DFString name_to_match: Name to match
+        :param str match_requirement: Match Requirement
+        :param str ignore_case: Ignore Case
+        
+        """
+        return CodeBlock.new_action('set_var', 'PurgeVars', (name_to_match,), {'Match Requirement': match_requirement, 'Ignore Case': ignore_case})
+
+    @staticmethod
+    def ShiftAllAxes(result: Variable, location_to_change: Location | None=None, x_change: Number | None=None, y_change: Number | None=None, z_change: Number | None=None, ):
+        """
+        Shifts a location's coordinates on the X, Y, and Z axes.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_change: Location to change (optional)
+        :param Number | None x_change: X Change (optional)
+        :param Number | None y_change: Y Change (optional)
+        :param Number | None z_change: Z Change (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftAllAxes', (result, location_to_change, x_change, y_change, z_change,), {})
+
+    @staticmethod
+    def GetParticleMat(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle display material.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get material of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleMat', (result, effect,), {})
+
+    @staticmethod
+    def SetParticleSprd(result: Variable, effect_to_change: Particle | None=None, horizontal_spread: Number=None, vertical_spread: Number=None, ):
+        """
+        Sets a particle effect's horizontal and vertical spread.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number horizontal_spread: Horizontal spread
+        :param Number vertical_spread: Vertical spread
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleSprd', (result, effect_to_change, horizontal_spread, vertical_spread,), {})
+
+    @staticmethod
+    def AbsoluteValue(result: Variable, number_input: Number | None=None, ):
+        """
+        Makes a number positive if it is negative.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_input: Number input (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'AbsoluteValue', (result, number_input,), {})
+
+    @staticmethod
+    def RemoveItemAttrs(result: Variable, item: Item | None=None, slot: Literal["All", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="All", attribute: Literal["All", "Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="All", ):
+        """
+        Removes all attributes from an item with the given attribute type and slot.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        :param str slot: Slot
+        :param str attribute: Attribute
+    
+            - Armor: Base: 0.0 Range: 0.0-30.0
+            - Armor toughness: Base: 0.0 Range: 0.0-20.0
+            - Attack damage: Base: 2.0 Range: 0.0-2048.0
+            - Attack knockback: Base: 0.0 Range: 0.0-5.0
+            - Attack speed: Base: 4.0 Range: 0.0-1024.0
+            - Burning time: Base: 1.0 Range: 0.0-1024.0
+            - Camera distance: Base: 4.0 Range: 0.0-32.0
+            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
+            - Flying speed: Base: 0.4 Range: 0.0-1024.0
+            - Follow range: Base: 32.0 Range: 0.0-2048.0
+            - Gravity: Base: 0.08 Range: -1.0-1.0
+            - Jump strength: Base: 0.42 Range: 0.0-32.0
+            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Luck: Base: 0.0 Range: -1024.0-1024.0
+            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
+            - Maximum health: Base: 20.0 Range: 1.0-1024.0
+            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Walking speed: Base: 0.2 Range: 0.0-1024.0
+            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
+            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
+            - Scale: Base: 1.0 Range: 0.0625-16.0
+            - Step height: Base: 0.6 Range: 0.0-10.0
+            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Tempt range: Base: 10.0 Range: 0.0-2048.0
+            - Block break speed: Base: 1.0 Range: 0.0-1024.0
+            - Block interaction range: Base: 4.5 Range: 0.0-64.0
+            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
+            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
+            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
+            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
+            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
+            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveItemAttrs', (result, item,), {'Slot': slot, 'Attribute': attribute})
+
+    @staticmethod
+    def AppendValue(list_to_append_to: Variable, value_to_append: list[ArgValue] | ArgValue, ):
+        """
+        Adds a value to the end of a list variable.
+    
+        :param Variable list_to_append_to: List to append to
+        :param list[ArgValue] | ArgValue value_to_append: Value(s) to append
+        
+        """
+        return CodeBlock.new_action('set_var', 'AppendValue', (list_to_append_to, value_to_append,), {})
+
+    @staticmethod
+    def Mod(result: Variable, dividend: Number, divisor: Number, remainder_mode: Literal["Remainder", "Modulo"]="Remainder", ):
+        """
+        Sets a variable to the remainder after dividing two numbers with a whole quotient.
+    
+        :param Variable result: Variable to set
+        :param Number dividend: Dividend
+        :param Number divisor: Divisor
+        :param str remainder_mode: Remainder Mode
+    
+            - Remainder: Takes the remainder of the numbers. Remainder keeps the sign of the numerator:   -1 rem 10 = -1
+            - Modulo: Takes the modulus of the numbers. Modulus keeps the sign of the denominator:   -1 mod 10 = 9
+        
+        """
+        return CodeBlock.new_action('set_var', '%', (result, dividend, divisor,), {'Remainder Mode': remainder_mode})
+    Modulo = Mod
+    Remainder = Mod
+
+    @staticmethod
+    def ShiftOnVector(result: Variable, location_to_shift: Location | None=None, shift_vector: DFVector=None, shift_distance: Number | None=None, add_location_rotation: Literal["True", "False"]="False", ):
+        """
+        Shifts a location along a vector.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param DFVector shift_vector: Shift vector
+        :param Number | None shift_distance: Shift distance OR Adds full vector)
+        :param str add_location_rotation: Add Location Rotation
+    
+            - True: The location's rotation will be added to the vector's rotation.
+            - False: The location's rotation will not be added to the vector's rotation.
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftOnVector', (result, location_to_shift, shift_vector, shift_distance,), {'Add Location Rotation': add_location_rotation})
+
+    @staticmethod
+    def GetItemAttribute(result: Variable, item: Item, attribute: Literal["Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="Armor", active_equipment_slot: Literal["Any", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="Any", ):
+        """
+        Get an attribute's multiplier for a specific slot.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item
+        :param str attribute: Attribute
+    
+            - Armor: Base: 0.0 Range: 0.0-30.0
+            - Armor toughness: Base: 0.0 Range: 0.0-20.0
+            - Attack damage: Base: 2.0 Range: 0.0-2048.0
+            - Attack knockback: Base: 0.0 Range: 0.0-5.0
+            - Attack speed: Base: 4.0 Range: 0.0-1024.0
+            - Burning time: Base: 1.0 Range: 0.0-1024.0
+            - Camera distance: Base: 4.0 Range: 0.0-32.0
+            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
+            - Flying speed: Base: 0.4 Range: 0.0-1024.0
+            - Follow range: Base: 32.0 Range: 0.0-2048.0
+            - Gravity: Base: 0.08 Range: -1.0-1.0
+            - Jump strength: Base: 0.42 Range: 0.0-32.0
+            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Luck: Base: 0.0 Range: -1024.0-1024.0
+            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
+            - Maximum health: Base: 20.0 Range: 1.0-1024.0
+            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Walking speed: Base: 0.2 Range: 0.0-1024.0
+            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
+            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
+            - Scale: Base: 1.0 Range: 0.0625-16.0
+            - Step height: Base: 0.6 Range: 0.0-10.0
+            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Tempt range: Base: 10.0 Range: 0.0-2048.0
+            - Block break speed: Base: 1.0 Range: 0.0-1024.0
+            - Block interaction range: Base: 4.5 Range: 0.0-64.0
+            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
+            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
+            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
+            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
+            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
+            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
+        :param str active_equipment_slot: Active Equipment Slot
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemAttribute', (result, item,), {'Attribute': attribute, 'Active Equipment Slot': active_equipment_slot})
+
+    @staticmethod
+    def ClearDict(dictionary_to_clear: Variable, ):
+        """
+        Removes all entries from a dictionary.
+    
+        :param Variable dictionary_to_clear: Dictionary to clear
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClearDict', (dictionary_to_clear,), {})
+
+    @staticmethod
+    def Add(result: Variable, numbers_to_add: list[Number] | Number, ):
+        """
+        Sets a variable to the sum of the given numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number numbers_to_add: Numbers to add
+        
+        """
+        return CodeBlock.new_action('set_var', '+', (result, numbers_to_add,), {})
+
+    @staticmethod
+    def SegmentString(result: Variable, string_to_segment: DFString, segment_size: Number | None=None, ):
+        """
+        Segments a string into chunks of a specified size.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_segment: String to segment
+        :param Number | None segment_size: Segment size (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SegmentString', (result, string_to_segment, segment_size,), {})
+
+    @staticmethod
+    def ShiftRotation(result: Variable, location_to_shift: Location | None=None, rotation_amount: Number=None, rotation_axis: Literal["Pitch", "Yaw"]="Pitch", ):
+        """
+        Rotates a location by shifting its pitch (up/down) or yaw (left/right) value.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param Number rotation_amount: Rotation amount
+        :param str rotation_axis: Rotation Axis
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftRotation', (result, location_to_shift, rotation_amount,), {'Rotation Axis': rotation_axis})
+
+    @staticmethod
+    def Subtract(result: Variable, numbers_to_subtract: list[Number] | Number, ):
+        """
+        Sets a variable to the difference between the given numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number numbers_to_subtract: Numbers to subtract
+        
+        """
+        return CodeBlock.new_action('set_var', '-', (result, numbers_to_subtract,), {})
+    Minus = Subtract
+
+    @staticmethod
+    def GetItemName(result: Variable, item: Item, ):
+        """
+        Gets an item's name.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get name of
+        
+        """
+        return CodeBlock.new_action('set_var', ' GetItemName ', (result, item,), {})
+
+    @staticmethod
+    def GetItemRarity(result: Variable, item: Item, ):
+        """
+        Gets an item's rarity.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemRarity', (result, item,), {})
+
+    @staticmethod
+    def MultiplyVector(result: Variable, vector_to_multiply: DFVector | None=None, multiplier: Number=None, ):
+        """
+        Multiplies a vector's length by a number.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_multiply: Vector to multiply (optional)
+        :param Number multiplier: Multiplier
+        
+        """
+        return CodeBlock.new_action('set_var', 'MultiplyVector', (result, vector_to_multiply, multiplier,), {})
+
+    @staticmethod
+    def Divide(result: Variable, numbers_to_divide: list[Number] | Number, division_mode: Literal["Default", "Floor result"]="Default", ):
+        """
+        Sets a variable to the quotient of the given numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number numbers_to_divide: Numbers to divide
+        :param str division_mode: Division Mode
+    
+            - Floor result: Rounds down the result.
+        
+        """
+        return CodeBlock.new_action('set_var', '/', (result, numbers_to_divide,), {'Division Mode': division_mode})
+
+    @staticmethod
+    def DestructureList(list_to_destructure: ArgValue, variable_to_set: list[Variable] | Variable, ):
+        """
+        Splits a list into separate variables.
+    
+        :param ArgValue list_to_destructure: List to destructure
+        :param list[Variable] | Variable variable_to_set: Variable(s) to set
+        
+        """
+        return CodeBlock.new_action('set_var', 'DestructureList', (list_to_destructure, variable_to_set,), {})
+
+    @staticmethod
+    def Bitwise(result: Variable, operand_1: Number, operand_2: Number | None=None, operator: Literal["|", "&", "~", "^", "<<", ">>", ">>>"]="|", bit_precision: Literal["Default", "64-bit"]="Default", ):
+        """
+        Sets a variable to the result of a bitwise operation.
+    
+        :param Variable result: Variable to set
+        :param Number operand_1: Operand 1
+        :param Number | None operand_2: Operand 2 (optional)
+        :param str operator: Operator
+    
+            - |: Bitwise Or
+            - &: Bitwise And
+            - ~: Bitwise Not (no 2nd operand required)
+            - ^: Bitwise Xor
+            - <<: Bitwise Left Shift
+            - >>: Bitwise Right Shift
+            - >>>: Bitwise Unsigned Right Shift
+        :param str bit_precision: Bit Precision
+    
+            - Default: Default precision (long / 1000)
+            - 64-bit: 64-bit precision (long), numbers are "multiplied" by 1000
+        
+        """
+        return CodeBlock.new_action('set_var', 'Bitwise', (result, operand_1, operand_2,), {'Operator': operator, 'Bit Precision': bit_precision})
+
+    @staticmethod
+    def GetLecternPage(result: Variable, lectern_location: Location, ):
+        """
+        Gets the displayed page number of a Lectern.
+    
+        :param Variable result: Variable to set
+        :param Location lectern_location: Lectern location
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetLecternPage', (result, lectern_location,), {})
+
+    @staticmethod
+    def ShiftOnAxis(result: Variable, location_to_shift: Location | None=None, shift_distance: Number=None, coordinate: Literal["X", "Y", "Z"]="X", ):
+        """
+        Shifts the X, Y, or Z coordinate of a location on its axis.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param Number shift_distance: Shift distance
+        :param str coordinate: Coordinate
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftOnAxis', (result, location_to_shift, shift_distance,), {'Coordinate': coordinate})
+
+    @staticmethod
+    def VectorBetween(result: Variable, start_location: Location, end_location: Location, ):
+        """
+        Sets a variable to the vector between two locations.
+    
+        :param Variable result: Variable to set
+        :param Location start_location: Start location
+        :param Location end_location: End location
+        
+        """
+        return CodeBlock.new_action('set_var', 'VectorBetween', (result, start_location, end_location,), {})
+
+    @staticmethod
+    def SetBreakSound(result: Variable, item_to_change: Item | None=None, break_sound: Sound | None=None, ):
+        """
+        Sets which sound an item makes when it breaks.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Sound | None break_sound: Break sound OR Sets to default break sound)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetBreakSound', (result, item_to_change, break_sound,), {})
+
+    @staticmethod
+    def GetVectorComp(result: Variable, vector: DFVector, component: Literal["X", "Y", "Z"]="X", ):
+        """
+        Gets a vector's X, Y, or Z component.
+    
+        :param Variable result: Variable to set
+        :param DFVector vector: Vector to get component of
+        :param str component: Component
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetVectorComp', (result, vector,), {'Component': component})
+
+    @staticmethod
+    def Assign(result: Variable, value: ArgValue, ):
+        """
+        Sets a variable to a value.
+    
+        :param Variable result: Variable to set
+        :param ArgValue value: Value
+        
+        """
+        return CodeBlock.new_action('set_var', '=', (result, value,), {})
+    Equals = Assign
+    Set = Assign
+
+    @staticmethod
+    def AddItemAttribute(result: Variable, item: Item | None=None, modifier_amount: Number=None, attribute: Literal["Armor", "Armor toughness", "Attack damage", "Attack knockback", "Attack speed", "Burning time", "Camera distance", "Explosion knockback resistance", "Fall damage multiplier", "Flying speed", "Follow range", "Gravity", "Jump strength", "Knockback resistance", "Luck", "Maximum absorption health", "Maximum health", "Movement efficiency", "Walking speed", "Oxygen bonus", "Safe fall distance", "Scale", "Step height", "Water movement efficiency", "Tempt range", "Block break speed", "Block interaction range", "Entity interaction range", "Mining efficiency", "Sneaking speed", "Submerged mining speed", "Sweeping damage ratio", "Zombie spawn reinforcements"]="Armor", operation: Literal["Add number", "Add percentage to base", "Multiply modifier by percentage"]="Add number", active_equipment_slot: Literal["Any", "Main hand", "Off hand", "Head", "Body", "Legs", "Feet"]="Main hand", ):
+        """
+        Adds an attribute modifier to an item, which is active in a certain equipment slot.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        :param Number modifier_amount: Modifier Amount
+        :param str attribute: Attribute
+    
+            - Armor: Base: 0.0 Range: 0.0-30.0
+            - Armor toughness: Base: 0.0 Range: 0.0-20.0
+            - Attack damage: Base: 2.0 Range: 0.0-2048.0
+            - Attack knockback: Base: 0.0 Range: 0.0-5.0
+            - Attack speed: Base: 4.0 Range: 0.0-1024.0
+            - Burning time: Base: 1.0 Range: 0.0-1024.0
+            - Camera distance: Base: 4.0 Range: 0.0-32.0
+            - Explosion knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Fall damage multiplier: Base: 1.0 Range: 0.0-100.0
+            - Flying speed: Base: 0.4 Range: 0.0-1024.0
+            - Follow range: Base: 32.0 Range: 0.0-2048.0
+            - Gravity: Base: 0.08 Range: -1.0-1.0
+            - Jump strength: Base: 0.42 Range: 0.0-32.0
+            - Knockback resistance: Base: 0.0 Range: 0.0-1.0
+            - Luck: Base: 0.0 Range: -1024.0-1024.0
+            - Maximum absorption health: Base: 0.0 Range: 0.0-2048.0
+            - Maximum health: Base: 20.0 Range: 1.0-1024.0
+            - Movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Walking speed: Base: 0.2 Range: 0.0-1024.0
+            - Oxygen bonus: Base: 0.0 Range: 0.0-1024.0
+            - Safe fall distance: Base: 3.0 Range: -1024.0-1024.0
+            - Scale: Base: 1.0 Range: 0.0625-16.0
+            - Step height: Base: 0.6 Range: 0.0-10.0
+            - Water movement efficiency: Base: 0.0 Range: 0.0-1.0
+            - Tempt range: Base: 10.0 Range: 0.0-2048.0
+            - Block break speed: Base: 1.0 Range: 0.0-1024.0
+            - Block interaction range: Base: 4.5 Range: 0.0-64.0
+            - Entity interaction range: Base: 3.0 Range: 0.0-64.0
+            - Mining efficiency: Base: 0.0 Range: 0.0-1024.0
+            - Sneaking speed: Base: 0.3 Range: 0.0-1.0
+            - Submerged mining speed: Base: 0.2 Range: 0.0-20.0
+            - Sweeping damage ratio: Base: 0.0 Range: 0.0-1.0
+            - Zombie spawn reinforcements: Base: 0.0 Range: 0.0-1.0
+        :param str operation: Operation
+    
+            - Add number: Increases the attribute value by the given amount.  Equation: mod + (amount)
+            - Add percentage to base: Increases the base attribute value by the given percentage.  Equation: base * (100% + amount)
+            - Multiply modifier by percentage: Increases the attribute value by the given percentage  Equation: mod * (100% + amount)
+        :param str active_equipment_slot: Active Equipment Slot
+        
+        """
+        return CodeBlock.new_action('set_var', 'AddItemAttribute', (result, item, modifier_amount,), {'Attribute': attribute, 'Operation': operation, 'Active Equipment Slot': active_equipment_slot})
+
+    @staticmethod
+    def GetCenterLoc(result: Variable, locations_to_center: list[Location] | Location, ):
+        """
+        Finds an average position (center) of the given locations.
+    
+        :param Variable result: Variable to set
+        :param list[Location] | Location locations_to_center: Locations to center
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCenterLoc', (result, locations_to_center,), {})
+
+    @staticmethod
+    def Base64Decode(result: Variable, base64_byte_to_decode: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", ):
+        """
+        Decodes Base64-encoded bytes as a list of numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number | int] | Number | int base64_byte_to_decode: Base64 byte(s) to decode
+        :param str signed: Signed
+        
+        """
+        return CodeBlock.new_action('set_var', 'Base64Decode', (result, base64_byte_to_decode,), {'Signed': signed})
+
+    @staticmethod
+    def AlignLoc(result: Variable, location_to_align: Location | None=None, alignment_mode: Literal["Block center", "Lower block corner"]="Block center", coordinates: Literal["All coordinates", "X and Z", "Only Y"]="All coordinates", rotation: Literal["Keep rotation", "Remove rotation"]="Keep rotation", ):
+        """
+        Aligns a location to the center or corner of the block it is in.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_align: Location to align (optional)
+        :param str alignment_mode: Alignment Mode
+        :param str coordinates: Coordinates
+        :param str rotation: Rotation
+        
+        """
+        return CodeBlock.new_action('set_var', 'AlignLoc', (result, location_to_align,), {'Alignment Mode': alignment_mode, 'Coordinates': coordinates, 'Rotation': rotation})
+
+    @staticmethod
+    def GetSoundVolume(result: Variable, sound: Sound, ):
+        """
+        Gets a sound's volume.
+    
+        :param Variable result: Variable to set
+        :param Sound sound: Sound to get volume of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetSoundVolume', (result, sound,), {})
+
+    @staticmethod
+    def RandomNumber(result: Variable, minimum_number: Number, maximum_number: Number, rounding_mode: Literal["Whole number", "Decimal number"]="Whole number", ):
+        """
+        Sets a variable to a random number between two other numbers.
+    
+        :param Variable result: Variable to set
+        :param Number minimum_number: Minimum number
+        :param Number maximum_number: Maximum number
+        :param str rounding_mode: Rounding Mode
+        
+        """
+        return CodeBlock.new_action('set_var', 'RandomNumber', (result, minimum_number, maximum_number,), {'Rounding Mode': rounding_mode})
+
+    @staticmethod
+    def GetCrossbowProj(result: Variable, crossbow: Item, ):
+        """
+        Gets a crossbow's loaded projectile list.
+    
+        :param Variable result: Variable to set
+        :param Item crossbow: Crossbow
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCrossbowProj', (result, crossbow,), {})
+
+    @staticmethod
+    def GzipDecompress(result: Variable, byte_to_decompress: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", ):
+        """
+        Decompresses Gzip-compressed bytes as a list of numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number | int] | Number | int byte_to_decompress: Byte(s) to decompress
+        :param str signed: Signed
+        
+        """
+        return CodeBlock.new_action('set_var', 'GzipDecompress', (result, byte_to_decompress,), {'Signed': signed})
+
+    @staticmethod
+    def ContainerName(result: Variable, container_location: Location, ):
+        """
+        Gets a container's name at a location.
+    
+        :param Variable result: Variable to set
+        :param Location container_location: Container location
+        
+        """
+        return CodeBlock.new_action('set_var', 'ContainerName', (result, container_location,), {})
+
+    @staticmethod
+    def Raycast(result: Variable, ray_origin: Location, ray_distance: Number, entity_collision: Literal["True", "False"]="False", block_collision: Literal["All blocks", "Non-fluid blocks", "Solid blocks", "None"]="All blocks", ):
+        """
+        Raycasts from a location to the first intersection.
+    
+        :param Variable result: Variable to set
+        :param Location ray_origin: Ray origin
+        :param Number ray_distance: Ray distance
+        :param str entity_collision: Entity Collision
+    
+            - True: Collides with players and entities.
+        :param str block_collision: Block Collision
+    
+            - All blocks: Passes through air only.
+            - Non-fluid blocks: Passes through fluids (water and lava).
+            - Solid blocks: Passes through non-solid blocks such as tall grass, and through fluids.
+            - None: Passes through all blocks.
+        
+        """
+        return CodeBlock.new_action('set_var', 'Raycast', (result, ray_origin, ray_distance,), {'Entity Collision': entity_collision, 'Block Collision': block_collision})
+
+    @staticmethod
+    def RotateAroundVec(result: Variable, vector_to_rotate: DFVector | None=None, axis_vector: DFVector=None, angle: Number=None, angle_units: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Rotates a vector around another vector by an angle.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_rotate: Vector to rotate (optional)
+        :param DFVector axis_vector: Axis vector
+        :param Number angle: Angle
+        :param str angle_units: Angle Units
+        
+        """
+        return CodeBlock.new_action('set_var', 'RotateAroundVec', (result, vector_to_rotate, axis_vector, angle,), {'Angle Units': angle_units})
+
+    @staticmethod
+    def GetParticleMotion(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle motion.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get motion of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleMotion', (result, effect,), {})
+
+    @staticmethod
+    def SetTooltipStyle(result: Variable, item_to_change: Item | None=None, tooltip_key: DFString | None=None, ):
+        """
+        Sets an item's custom tooltip.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString | None tooltip_key: Tooltip key (optional) (A namespaced key ("minecraft:" by default))
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetTooltipStyle', (result, item_to_change, tooltip_key,), {})
+
+    @staticmethod
+    def SetConsumable(result: Variable, item_to_change: Item | None=None, consuming_sound: Sound | None=None, nutrition: Number | None=None, saturation: Number | None=None, use_duration: Number | None=None, can_always_eat: Literal["True", "False"]="False", show_particles: Literal["True", "False"]="True", consuming_animation: Literal["None", "Eat", "Drink", "Block", "Bow", "Trident", "Crossbow", "Spyglass", "Toot horn", "Brush", "Bundle", "Spear"]="Eat", ):
+        """
+        Adds consumable properties to an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Sound | None consuming_sound: Consuming sound (optional)
+        :param Number | None nutrition: Nutrition (optional)
+        :param Number | None saturation: Saturation (optional)
+        :param Number | None use_duration: Use duration (seconds) (optional) (Default = 1.6)
+        :param str can_always_eat: Can Always Eat
+        :param str show_particles: Show Particles
+        :param str consuming_animation: Consuming Animation
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetConsumable', (result, item_to_change, consuming_sound, nutrition, saturation, use_duration,), {'Can Always Eat': can_always_eat, 'Show Particles': show_particles, 'Consuming Animation': consuming_animation})
+
+    @staticmethod
+    def SetParticleMotion(result: Variable, effect_to_change: Particle | None=None, particle_motion: DFVector | None=None, motion_variation: Number | None=None, ):
+        """
+        Sets a particle effect's particle motion and motion variation.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param DFVector | None particle_motion: Particle motion (optional)
+        :param Number | None motion_variation: Motion variation (%) (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleMotion', (result, effect_to_change, particle_motion, motion_variation,), {})
+
+    @staticmethod
+    def Average(result: Variable, numbers_to_average: list[Number] | Number, ):
+        """
+        Sets a variable to the average of the given numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number numbers_to_average: Numbers to average
+        
+        """
+        return CodeBlock.new_action('set_var', 'Average', (result, numbers_to_average,), {})
+
+    @staticmethod
+    def ClampLoc(result: Variable, location_to_clamp: Location | None=None, corner_1: Location=None, corner_2: Location=None, coordinates: Literal["All coordinates", "X and Z"]="All coordinates", ):
+        """
+        Clamps a location to a region defined by 2 corners.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_clamp: Location to clamp (optional)
+        :param Location corner_1: Corner 1
+        :param Location corner_2: Corner 2
+        :param str coordinates: Coordinates
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClampLoc', (result, location_to_clamp, corner_1, corner_2,), {'Coordinates': coordinates})
+
+    @staticmethod
+    def SetMapTexture(result: Variable, item_to_change: Item | None=None, image_url: DFString=None, ):
+        """
+        Sets a map item's texture to the image at the given URL.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString image_url: Image URL
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetMapTexture', (result, item_to_change, image_url,), {})
+
+    @staticmethod
+    def GetBlockData(result: Variable, block_location: Location, tag_name: DFString, ):
+        """
+        Gets a block state tag value at a location.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        :param DFString tag_name: Tag name
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockData', (result, block_location, tag_name,), {})
+
+    @staticmethod
+    def SortDict(result: Variable, dictionary_to_sort: ArgValue | None=None, sorting_type: Literal["Sort by Key", "Sort by Value"]="Sort by Key", sorting_order: Literal["Ascending", "Descending"]="Ascending", ):
+        """
+        Sorts a dictionary by its keys or values.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None dictionary_to_sort: Dictionary to sort (optional)
+        :param str sorting_type: Sorting Type
+        :param str sorting_order: Sorting Order
+        
+        """
+        return CodeBlock.new_action('set_var', 'SortDict', (result, dictionary_to_sort,), {'Sorting Type': sorting_type, 'Sorting Order': sorting_order})
+
+    @staticmethod
+    def GetLecternBook(result: Variable, lectern_location: Location, ):
+        """
+        Gets the book on the Lectern at a location.
+    
+        :param Variable result: Variable to set
+        :param Location lectern_location: Lectern location
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetLecternBook', (result, lectern_location,), {})
+
+    @staticmethod
+    def GetCustomSound(result: Variable, sound: Sound, ):
+        """
+        Gets the key of a custom sound.
+    
+        :param Variable result: Variable to set
+        :param Sound sound: Sound to get key of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCustomSound', (result, sound,), {})
+
+    @staticmethod
+    def CrossProduct(result: Variable, vector_1: DFVector, vector_2: DFVector, ):
+        """
+        Sets a variable to the cross product of two vectors.
+    
+        :param Variable result: Variable to set
+        :param DFVector vector_1: Vector 1
+        :param DFVector vector_2: Vector 2
+        
+        """
+        return CodeBlock.new_action('set_var', 'CrossProduct', (result, vector_1, vector_2,), {})
+
+    @staticmethod
+    def Multiply(result: Variable, numbers_to_multiply: list[Number] | Number, ):
+        """
+        Sets a variable to the product of the given numbers.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number numbers_to_multiply: Numbers to multiply
+        
+        """
+        return CodeBlock.new_action('set_var', 'x', (result, numbers_to_multiply,), {})
+
+    @staticmethod
+    def GetParticleRoll(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's roll.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get roll of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleRoll', (result, effect,), {})
+
+    @staticmethod
+    def DotProduct(result: Variable, vector_1: DFVector, vector_2: DFVector, ):
+        """
+        Sets a variable to the dot product of two vectors.
+    
+        :param Variable result: Variable to set
+        :param DFVector vector_1: Vector 1
+        :param DFVector vector_2: Vector 2
+        
+        """
+        return CodeBlock.new_action('set_var', 'DotProduct', (result, vector_1, vector_2,), {})
+
+    @staticmethod
+    def SetArmorTrim(result: Variable, item_to_change: Item | None=None, trim_pattern: Literal["None", "Bolt", "Coast", "Dune", "Eye", "Flow", "Rib", "Sentry", "Snout", "Spire", "Tide", "Vex", "Ward", "Wayfinder", "Shaper", "Silence", "Raiser", "Host", "Wild"]="None", trim_material: Literal["Amethyst", "Copper", "Diamond", "Emerald", "Gold", "Iron", "Lapis Lazuli", "Netherite", "Quartz", "Resin", "Redstone"]="Amethyst", ):
+        """
+        Sets the trim of an armor item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param str trim_pattern: Trim Pattern
+    
+            - None: Removes the armor trim from the item.
+        :param str trim_material: Trim Material
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetArmorTrim', (result, item_to_change,), {'Trim Pattern': trim_pattern, 'Trim Material': trim_material})
+
+    @staticmethod
+    def PopListValue(result: Variable, list: ArgValue, index: Number | None=None, ):
+        """
+        Gets a list variable's value at an index and removes it.
+    
+        :param Variable result: Variable to set
+        :param ArgValue list: List to get value of
+        :param Number | None index: Index (optional) (Default = Last index)
+        
+        """
+        return CodeBlock.new_action('set_var', 'PopListValue', (result, list, index,), {})
+
+    @staticmethod
+    def SetParticleOpac(result: Variable, effect_to_change: Particle | None=None, particle_opacity: Number=None, ):
+        """
+        Sets a particle effect's opacity.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_opacity: Particle opacity
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleOpac', (result, effect_to_change, particle_opacity,), {})
+
+    @staticmethod
+    def Noise(result: Variable, noise_location: Location, frequency: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, generation_seed: Number | None=None, return_type: Literal["Simplex", "Perlin", "Voronoi", "Worley", "Value"]="Simplex", dimensions: Literal["3D", "2D"]="3D", ):
+        """
+        Gets a seeded noise value.
+    
+        :param Variable result: Variable to set
+        :param Location noise_location: Noise location
+        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
+        :param Number | None octaves: Octaves (optional) (Adds an additional layer of noise to the output. 1-16, Default = 1)
+        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
+        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None generation_seed: Generation seed (optional)
+        :param str return_type: Return Type
+    
+            - Simplex: Provides the average of a honeycomb of gradient vectors.  Using a honeycomb instead of a lattice like that used in Perlin Noise, removes directional artifacts and increases efficiency.
+            - Perlin: Provides the average of a lattice of gradient vectors.  Using vectors rather than values like those seen in Value Noise, provides more detail at the cost of lower efficiency.
+            - Voronoi: Provides the identifier of the closest cell with cellular noise.
+            - Worley: Provides the distance from the closest cell origin with cellular noise.
+            - Value: Provides the average of a lattice (grid) of random values.
+        :param str dimensions: Dimensions
+    
+            - 3D: Generates using the X, Y and Z axis.
+            - 2D: Generates using the X and Z axis only.
+        
+        """
+        return CodeBlock.new_action('set_var', 'Noise', (result, noise_location, frequency, octaves, lacunarity, gain, generation_seed,), {'Return Type': return_type, 'Dimensions': dimensions})
+
+    @staticmethod
+    def MinNumber(result: Variable, number_set_to_compare: list[Number] | Number, ):
+        """
+        Sets a variable to the lowest number in a set.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number number_set_to_compare: Number set to compare
+        
+        """
+        return CodeBlock.new_action('set_var', 'MinNumber', (result, number_set_to_compare,), {})
+
+    @staticmethod
+    def GetPotionType(result: Variable, potion: Potion, ):
+        """
+        Gets a potion effect's type.
+    
+        :param Variable result: Variable to set
+        :param Potion potion: Potion to get type of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetPotionType', (result, potion,), {})
+
+    @staticmethod
+    def ListLength(result: Variable, list_to_measure: ArgValue, ):
+        """
+        Gets the number of values a list has.
+    
+        :param Variable result: Variable to set
+        :param ArgValue list_to_measure: List to measure
+        
+        """
+        return CodeBlock.new_action('set_var', 'ListLength', (result, list_to_measure,), {})
+
+    @staticmethod
+    def Sine(result: Variable, number_input: Number, sine_variant: Literal["Sine", "Inverse sine (arcsine)", "Hyperbolic sine"]="Sine", input: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Sets a variable to the trigonometric sine function of a number.
+    
+        :param Variable result: Variable to set
+        :param Number number_input: Number input
+        :param str sine_variant: Sine Variant
+        :param str input: Input
+        
+        """
+        return CodeBlock.new_action('set_var', 'Sine', (result, number_input,), {'Sine Variant': sine_variant, 'Input': input})
+
+    @staticmethod
+    def DirectionName(result: Variable, direction: DFVector, ):
+        """
+        Sets a variable to the name of the direction of a vector.
+    
+        :param Variable result: Variable to set
+        :param DFVector direction: Direction
+        
+        """
+        return CodeBlock.new_action('set_var', 'DirectionName', (result, direction,), {})
+
+    @staticmethod
+    def RepeatString(result: Variable, string_to_repeat: DFString, times_to_repeat: Number, ):
+        """
+        Repeats a string the given number of times.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_repeat: String to repeat
+        :param Number times_to_repeat: Times to repeat
+        
+        """
+        return CodeBlock.new_action('set_var', 'RepeatString', (result, string_to_repeat, times_to_repeat,), {})
+
+    @staticmethod
+    def JoinString(result: Variable, strings_to_join: ArgValue, joining_string: DFString | None=None, final_joining_string: DFString | None=None, ):
+        """
+        Combines a list of strings.
+    
+        :param Variable result: Variable to set
+        :param ArgValue strings_to_join: Strings to join
+        :param DFString | None joining_string: Joining string (optional)
+        :param DFString | None final_joining_string: Final joining string (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'JoinString', (result, strings_to_join, joining_string, final_joining_string,), {})
+
+    @staticmethod
+    def ReverseList(result: Variable, list_to_reverse: ArgValue | None=None, ):
+        """
+        Reverses the order of a list variable's values.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_reverse: List to reverse (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ReverseList', (result, list_to_reverse,), {})
+
+    @staticmethod
+    def DedupList(result: Variable, list_to_deduplicate: ArgValue | None=None, ):
+        """
+        Removes list elements that appear more than once.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_deduplicate: List to de-duplicate (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'DedupList', (result, list_to_deduplicate,), {})
+
+    @staticmethod
+    def CreateDict(result: Variable, key_list: ArgValue | None=None, value_list: ArgValue | None=None, ):
+        """
+        Creates a dictionary with the given keys and values.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None key_list: Key list (optional)
+        :param ArgValue | None value_list: Value list (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'CreateDict', (result, key_list, value_list,), {})
+
+    @staticmethod
+    def GetItemLeftover(result: Variable, item: Item, ):
+        """
+        Gets an item's leftover item that gets replaced on use, e.g. drinking stew gives a bowl.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get remainder of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemLeftover', (result, item,), {})
+
+    @staticmethod
+    def GetBlockByMCTag(result: Variable, block_tag_id: DFString, return_value_type: Literal["Material ID (golden_apple)", "Material Name (Golden Apple)", "Item"]="Material ID (golden_apple)", ):
+        """
+        Gets a list of blocks that belongs to the specified block tag.
+    
+        :param Variable result: Variable to set
+        :param DFString block_tag_id: Block tag ID (Example: "#mineable/pickaxe")
+        :param str return_value_type: Return Value Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockByMCTag', (result, block_tag_id,), {'Return Value Type': return_value_type})
+
+    @staticmethod
+    def FaceLocation(result: Variable, location_to_change: Location | None=None, target_location: Location=None, face_direction: Literal["Toward location", "Away from location"]="Toward location", ):
+        """
+        Sets a location's rotation to face another location.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_change: Location to change (optional)
+        :param Location target_location: Target location
+        :param str face_direction: Face Direction
+        
+        """
+        return CodeBlock.new_action('set_var', 'FaceLocation', (result, location_to_change, target_location,), {'Face Direction': face_direction})
+
+    @staticmethod
+    def SetVectorLength(result: Variable, vector_to_change: DFVector | None=None, length: Number | None=None, ):
+        """
+        Sets a vector's length. This affects all components.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_change: Vector to change (optional)
+        :param Number | None length: Length (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetVectorLength', (result, vector_to_change, length,), {})
+
+    @staticmethod
+    def SetPotionDur(result: Variable, potion_to_change: Potion | None=None, duration: Number=None, ):
+        """
+        Sets a potion effect's duration.
+    
+        :param Variable result: Variable to set
+        :param Potion | None potion_to_change: Potion to change (optional)
+        :param Number duration: Duration (ticks)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetPotionDur', (result, potion_to_change, duration,), {})
+
+    @staticmethod
+    def BlockResistance(result: Variable, block_to_check: Item | Location, ):
+        """
+        Gets a block's blast resistance.
+    
+        :param Variable result: Variable to set
+        :param Item | Location block_to_check: Block to check OR Location to check
+        
+        """
+        return CodeBlock.new_action('set_var', 'BlockResistance', (result, block_to_check,), {})
+
+    @staticmethod
+    def SplitString(result: Variable, string_to_split: DFString, splitter_string: DFString | None=None, strip_spaces: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Splits a string into a list of strings.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_split: String to split
+        :param DFString | None splitter_string: Splitter string (optional) (Default = " ")
+        :param str strip_spaces: Strip Spaces
+    
+            - Enable: Leading and trailing spaces are removed from the result.
+            - Disable: Leading and trailing spaces are kept.
+        
+        """
+        return CodeBlock.new_action('set_var', 'SplitString', (result, string_to_split, splitter_string,), {'Strip Spaces': strip_spaces})
+
+    @staticmethod
+    def NormalRandom(result: Variable, μ: Number, σ: Number, distribution: Literal["Normal", "Folded normal"]="Normal", ):
+        """
+        Sets a variable to a normally distributed random number. Values closer to μ are more likely to be chosen.
+    
+        :param Variable result: Variable to set
+        :param Number μ: μ (Mean midpoint)
+        :param Number σ: σ (Standard deviation)
+        :param str distribution: Distribution
+    
+            - Normal: Values can be above or below μ.
+            - Folded normal: Values can only be above μ.
+        
+        """
+        return CodeBlock.new_action('set_var', 'NormalRandom', (result, μ, σ,), {'Distribution': distribution})
+
+    @staticmethod
+    def SetPotionType(result: Variable, potion_to_change: Potion | None=None, type: DFString=None, ):
+        """
+        Sets a potion effect's type.
+    
+        :param Variable result: Variable to set
+        :param Potion | None potion_to_change: Potion to change (optional)
+        :param DFString type: Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetPotionType', (result, potion_to_change, type,), {})
+
+    @staticmethod
+    def GetRegexGroup(result: Variable, input_string: DFString, regex_pattern: DFString, group_name: DFString | Number, ):
+        """
+        Gets the value of a specific Regex Group in a Regex match.
+    
+        :param Variable result: Variable to set
+        :param DFString input_string: Input string
+        :param DFString regex_pattern: Regex pattern
+        :param DFString | Number group_name: Group name OR Group index
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetRegexGroup', (result, input_string, regex_pattern, group_name,), {})
+
+    @staticmethod
+    def GetParticlePower(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's power.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get power of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticlePower', (result, effect,), {})
+
+    @staticmethod
+    def AlignVector(result: Variable, vector_to_align: DFVector | None=None, ):
+        """
+        Aligns a vector to the nearest axis.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_align: Vector to align (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'AlignVector', (result, vector_to_align,), {})
+
+    @staticmethod
+    def SetItemDura(result: Variable, item: Item | None=None, item_durability: Number=None, durability_type: Literal["Set Damage", "Set Damage Percentage", "Set Remaining", "Set Remaining Percentage"]="Set Damage", ):
+        """
+        Sets an item's durability.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        :param Number item_durability: Item durability
+        :param str durability_type: Durability Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemDura', (result, item, item_durability,), {'Durability Type': durability_type})
+
+    @staticmethod
+    def SetHeadTexture(result: Variable, player_head: Item | None=None, owner_name_uuid_or_texture_value: DFString=None, code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", ):
+        """
+        Sets a player head's texture using an owning player or custom texture.
+    
+        :param Variable result: Variable to set
+        :param Item | None player_head: Player head (optional)
+        :param DFString owner_name_uuid_or_texture_value: Owner name, UUID or texture value
+        :param str code_flow: Code Flow
+    
+            - Synchronous: Waits for the texture to be loaded before continuing.
+            - Asynchronous: Continues running code immediately.
+        
+        """
+        return CodeBlock.new_action('set_var', ' SetHeadTexture ', (result, player_head, owner_name_uuid_or_texture_value,), {'Code Flow': code_flow})
+
+    @staticmethod
+    def SetBreakability(result: Variable, item: Item | None=None, breakability: Literal["Breakable", "Unbreakable"]="Unbreakable", ):
+        """
+        Sets whether an item is unbreakable.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        :param str breakability: Breakability
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetBreakability', (result, item,), {'Breakability': breakability})
+
+    @staticmethod
+    def SetMaxAmount(result: Variable, item_to_change: Item | None=None, maximum_stack_size: Number | None=None, ):
+        """
+        Set an item's maximum stack size.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Number | None maximum_stack_size: Maximum stack size (1-99) (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetMaxAmount', (result, item_to_change, maximum_stack_size,), {})
+
+    @staticmethod
+    def GetSignText(result: Variable, location: Location, sign_line: Literal["1", "2", "3", "4", "All lines"]="1", sign_side: Literal["Front", "Back"]="Front", ):
+        """
+        Gets a sign's text at a location.
+    
+        :param Variable result: Variable to set
+        :param Location location: Location
+        :param str sign_line: Sign Line
+        :param str sign_side: Sign Side
+        
+        """
+        return CodeBlock.new_action('set_var', ' GetSignText ', (result, location,), {'Sign Line': sign_line, 'Sign Side': sign_side})
+
+    @staticmethod
+    def SetDictValue(dictionary_to_add_to: Variable, key: DFString, value: ArgValue, ):
+        """
+        Sets the given key to the value.
+    
+        :param Variable dictionary_to_add_to: Dictionary to add to
+        :param DFString key: Key
+        :param ArgValue value: Value
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetDictValue', (dictionary_to_add_to, key, value,), {})
+
+    @staticmethod
+    def SetAllCoords(result: Variable, location_to_change: Location | None=None, new_x: Number | None=None, new_y: Number | None=None, new_z: Number | None=None, new_pitch: Number | None=None, new_yaw: Number | None=None, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", ):
+        """
+        Sets a location's coordinates or creates a new location.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_change: Location to change (optional)
+        :param Number | None new_x: New X (optional)
+        :param Number | None new_y: New Y (optional)
+        :param Number | None new_z: New Z (optional)
+        :param Number | None new_pitch: New Pitch (optional)
+        :param Number | None new_yaw: New Yaw (optional)
+        :param str coordinate_type: Coordinate Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetAllCoords', (result, location_to_change, new_x, new_y, new_z, new_pitch, new_yaw,), {'Coordinate Type': coordinate_type})
+
+    @staticmethod
+    def GetAllItems(result: Variable, include_items: Literal["True", "False"]="True", include_blocks: Literal["True", "False"]="True", ):
+        """
+        Gets a list of every minecraft item material
+    
+        :param Variable result: Variable to set
+        :param str include_items: Include Items
+    
+            - True: Include items that can be held by a player but cannot be placed down.
+            - False: Include items that can be held by a player but cannot be placed down.
+        :param str include_blocks: Include Blocks
+    
+            - True: Include items that can be held by a player and placed down in the world.
+            - False: Include items that can be held by a player and placed down in the world.
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetAllItems', (result,), {'Include Items': include_items, 'Include Blocks': include_blocks})
+
+    @staticmethod
+    def RGBColor(result: Variable, red: Number, green: Number, blue: Number | ArgValue, ):
+        """
+        Creates a color hex based on red, green, and blue channels.
+    
+        :param Variable result: Variable to set
+        :param Number red: Red (0-255)
+        :param Number green: Green (0-255)
+        :param Number | ArgValue blue: Blue (0-255) OR R, G, B values
+        
+        """
+        return CodeBlock.new_action('set_var', 'RGBColor', (result, red, green, blue,), {})
+
+    @staticmethod
+    def SetCanDestroy(result: Variable, item_to_change: Item | None=None, breakable_blocks: list[Item] | Item=None, ):
+        """
+        Sets which blocks an item can break in Adventure Mode.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[Item] | Item breakable_blocks: Breakable blocks
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCanDestroy', (result, item_to_change, breakable_blocks,), {})
+
+    @staticmethod
+    def HSLColor(result: Variable, hue: Number, saturation: Number | None=None, lightness: Number | ArgValue | None=None, ):
+        """
+        Creates a color based on hue, saturation, and lightness.
+    
+        :param Variable result: Variable to set
+        :param Number hue: Hue (Color circle, 0-360)
+        :param Number | None saturation: Saturation (0-100) (optional) (Default = 100)
+        :param Number | ArgValue | None lightness: Lightness (0-100) OR H, S, L values (optional) (Default = 50)
+        
+        """
+        return CodeBlock.new_action('set_var', 'HSLColor', (result, hue, saturation, lightness,), {})
+
+    @staticmethod
+    def GetItemLore(result: Variable, item: Item, ):
+        """
+        Gets an item's lore list.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get lore from
+        
+        """
+        return CodeBlock.new_action('set_var', ' GetItemLore ', (result, item,), {})
+
+    @staticmethod
+    def RemoveListIndex(list_to_change: Variable, index_to_remove: list[Number] | Number, ):
+        """
+        Removes a list variable's value at an index and shifts all values after it to the left.
+    
+        :param Variable list_to_change: List to change
+        :param list[Number] | Number index_to_remove: Index to remove
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveListIndex', (list_to_change, index_to_remove,), {})
+
+    @staticmethod
+    def CellularNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, return_type: Literal["Voronoi", "Worley", "Secondary", "Additive", "Subtractive", "Divisive", "Multiplicative", "Origin"]="Voronoi", distance_calculation: Literal["Euclidean", "Manhattan", "Natural"]="Euclidean", domain_fractal: Literal["Progressive", "Independent"]="Progressive", dimensions: Literal["3D", "2D"]="3D", ):
+        """
+        Gets cellular noise: A type of noise based on distance from cell origins.
+    
+        :param Variable result: Variable to set
+        :param Location noise_location: Noise location
+        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
+        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
+        :param Number | None octaves: Octaves (optional) (Adds an additional layer of cellular noise to the output. 1-16, Default = 1)
+        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
+        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
+        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
+        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
+        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
+        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None generation_seed: Generation seed (optional)
+        :param str return_type: Return Type
+    
+            - Voronoi: Provides the identifier of the closest cell.
+            - Worley: Provides the distance from the closest cell origin.
+            - Secondary: Provides the secondary distance from the nearest cell origin.
+            - Additive: Provides the additive distance from the nearest cell origin.
+            - Subtractive: Provides the subtractive distance from the nearest cell origin.
+            - Divisive: Provides the divisive distance from the nearest cell origin.
+            - Multiplicative: Provides the multiplicative distance from the nearest cell origin.
+            - Origin: Provides a vector that points to the closest cell origin.
+        :param str distance_calculation: Distance Calculation
+    
+            - Euclidean: Determines the closest cell using regular distance.
+            - Manhattan: Determines the closest cell using distance measured orthogonally.
+            - Natural: Determines the closest cell using Euclidean and Manhattan distance.
+        :param str domain_fractal: Domain Fractal
+    
+            - Progressive: Domains are calculated on top of one another.
+            - Independent: Domains are calculated in isolation.
+        :param str dimensions: Dimensions
+    
+            - 3D: Generates using the X, Y and Z axis.
+            - 2D: Generates using the X and Z axis only.
+        
+        """
+        return CodeBlock.new_action('set_var', 'CellularNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Return Type': return_type, 'Distance Calculation': distance_calculation, 'Domain Fractal': domain_fractal, 'Dimensions': dimensions})
+
+    @staticmethod
+    def Base64Encode(result: Variable, byte_to_encode: list[Number | int] | Number | int, ):
+        """
+        Encodes bytes as a list of numbers to Base64.
+    
+        :param Variable result: Variable to set
+        :param list[Number | int] | Number | int byte_to_encode: Byte(s) to encode
+        
+        """
+        return CodeBlock.new_action('set_var', 'Base64Encode', (result, byte_to_encode,), {})
+
+    @staticmethod
+    def Logarithm(result: Variable, number_input: Number | None=None, base: Number=None, ):
+        """
+        Finds the logarithm of a number. A logarithm is the power the base must be raised to to get the given input.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_input: Number input (optional)
+        :param Number base: Base
+        
+        """
+        return CodeBlock.new_action('set_var', 'Logarithm', (result, number_input, base,), {})
+
+    @staticmethod
+    def SetItemTag(result: Variable, item_to_change: Item | None=None, tag_name: DFString=None, tag_value: Number | DFString=None, ):
+        """
+        Sets the value of or creates a custom stored tag value.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString tag_name: Tag name
+        :param Number | DFString tag_value: Tag value OR Tag value
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemTag', (result, item_to_change, tag_name, tag_value,), {})
+
+    @staticmethod
+    def TrimString(result: Variable, string_to_trim: DFString | None=None, start_character_position: Number=None, end_character_position: Number | None=None, ):
+        """
+        Trims a string, starting and ending at the given positions.
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_trim: String to trim (optional)
+        :param Number start_character_position: Start character position
+        :param Number | None end_character_position: End character position (optional) (Default = String length)
+        
+        """
+        return CodeBlock.new_action('set_var', 'TrimString', (result, string_to_trim, start_character_position, end_character_position,), {})
+
+    @staticmethod
+    def GetItemAmount(result: Variable, item: Item, ):
+        """
+        Gets an item's stack size.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get stack size of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemAmount', (result, item,), {})
+
+    @staticmethod
+    def SetPotionAmp(result: Variable, potion_to_change: Potion | None=None, amplifier: Number=None, ):
+        """
+        Sets a potion effect's amplifier.
+    
+        :param Variable result: Variable to set
+        :param Potion | None potion_to_change: Potion to change (optional)
+        :param Number amplifier: Amplifier
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetPotionAmp', (result, potion_to_change, amplifier,), {})
+
+    @staticmethod
+    def GetCanDestroy(result: Variable, item: Item, ):
+        """
+        Gets which blocks an item can break in Adventure Mode.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCanDestroy', (result, item,), {})
+
+    @staticmethod
+    def RotateAroundAxis(result: Variable, vector_to_rotate: DFVector | None=None, angle: Number=None, axis: Literal["X", "Y", "Z"]="X", angle_units: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Rotates a vector around an axis by an angle.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_rotate: Vector to rotate (optional)
+        :param Number angle: Angle
+        :param str axis: Axis
+        :param str angle_units: Angle Units
+        
+        """
+        return CodeBlock.new_action('set_var', 'RotateAroundAxis', (result, vector_to_rotate, angle,), {'Axis': axis, 'Angle Units': angle_units})
+
+    @staticmethod
+    def GetItemDura(result: Variable, item: Item, durability_type: Literal["Get Damage", "Get Damage Percentage", "Get Remaining", "Get Remaining Percentage", "Get Maximum"]="Get Damage", ):
+        """
+        Gets an item's current or maximum durability.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item
+        :param str durability_type: Durability Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemDura', (result, item,), {'Durability Type': durability_type})
+
+    @staticmethod
+    def ShiftInDirection(result: Variable, location_to_shift: Location | None=None, shift_distance: Number | None=None, direction: Literal["Forward", "Upward", "Sideways"]="Forward", ):
+        """
+        Shifts a location forward, upward, or sideways based on its rotation.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param Number | None shift_distance: Shift distance (optional) (Default = 1)
+        :param str direction: Direction
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftInDirection', (result, location_to_shift, shift_distance,), {'Direction': direction})
+
+    @staticmethod
+    def RotationVector(result: Variable, pitch: Number, yaw: Number, length: Number | None=None, ):
+        """
+        Sets a variable to a vector facing a given rotation.
+    
+        :param Variable result: Variable to set
+        :param Number pitch: Pitch
+        :param Number yaw: Yaw
+        :param Number | None length: Length (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'RotationVector', (result, pitch, yaw, length,), {})
+
+    @staticmethod
+    def JsonToValue(result: Variable, json_to_convert: DFString, ):
+        """
+        Converts JSON to a value.
+    
+        :param Variable result: Variable to set
+        :param DFString json_to_convert: JSON to convert
+        
+        """
+        return CodeBlock.new_action('set_var', 'JsonToValue', (result, json_to_convert,), {})
+
+    @staticmethod
+    def WrapNum(result: Variable, number_to_wrap: Number | None=None, lower_bound: Number=None, upper_bound: Number=None, ):
+        """
+        Checks if a number is inside the bounds and if not, wraps it around the farthest bound.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_to_wrap: Number to wrap (optional)
+        :param Number lower_bound: Lower bound (inclusive)
+        :param Number upper_bound: Upper bound (exclusive)
+        
+        """
+        return CodeBlock.new_action('set_var', 'WrapNum', (result, number_to_wrap, lower_bound, upper_bound,), {})
+
+    @staticmethod
+    def SetModelDataNums(result: Variable, item_to_change: Item | None=None, number_model_value: list[Number] | Number=None, model_value_type: Literal["Floats", "Flags", "Colors"]="Floats", ):
+        """
+        Sets the numerical model values on an item, used in resource packs.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[Number] | Number number_model_value: Number model value(s)
+        :param str model_value_type: Model Value Type
+    
+            - Floats: Sets the "floats" array of the model data Valid input: Decimal numbers
+            - Flags: Sets the "flags" array of the model data Valid input: 0 (false) or 1 (true)
+            - Colors: Sets the "colors" array of the model data Valid input: RGB integers (e.g. 16733525)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetModelDataNums', (result, item_to_change, number_model_value,), {'Model Value Type': model_value_type})
+
+    @staticmethod
+    def ReplaceString(result: Variable, string_to_change: DFString, string_part_to_replace: DFString, replacement: DFString, regular_expressions: Literal["Enable", "Disable"]="Disable", replacement_type: Literal["First occurrence", "All occurrences"]="All occurrences", ):
+        """
+        Searches for part of a string and replaces it.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_change: String to change
+        :param DFString string_part_to_replace: String part to replace
+        :param DFString replacement: Replacement
+        :param str regular_expressions: Regular Expressions
+        :param str replacement_type: Replacement Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'ReplaceString', (result, string_to_change, string_part_to_replace, replacement,), {'Regular Expressions': regular_expressions, 'Replacement Type': replacement_type})
+
+    @staticmethod
+    def SetItemGlowing(result: Variable, item_to_change: Item | None=None, glowing: Literal["Enable", "Disable", "Default"]="Enable", ):
+        """
+        Sets whether an item is glowing regardless of its enchantments.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param str glowing: Glowing
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemGlowing', (result, item_to_change,), {'Glowing': glowing})
+
+    @staticmethod
+    def SetItemName(result: Variable, item_to_change: Item | None=None, name: list[DFText] | DFText=None, ):
+        """
+        Sets an item's name.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[DFText] | DFText name: Name
+        
+        """
+        return CodeBlock.new_action('set_var', ' SetItemName ', (result, item_to_change, name,), {})
+
+    @staticmethod
+    def SetLodestoneLoc(result: Variable, item_to_change: Item | None=None, lodestone_location: Location=None, require_lodestone_at_location: Literal["True", "False"]="False", ):
+        """
+        Sets a compass's lodestone location.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Location lodestone_location: Lodestone location
+        :param str require_lodestone_at_location: Require Lodestone at Location
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetLodestoneLoc', (result, item_to_change, lodestone_location,), {'Require Lodestone at Location': require_lodestone_at_location})
+
+    @staticmethod
+    def FlattenList(result: Variable, list_to_flatten: ArgValue | None=None, ):
+        """
+        Sets a variable to a list with its sub-lists spread out into individual elements.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_flatten: List to flatten (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'FlattenList', (result, list_to_flatten,), {})
+
+    @staticmethod
+    def SetItemRarity(result: Variable, item_to_change: Item | None=None, rarity: Literal["Default for item type", "Common", "Uncommon", "Rare", "Epic"]="Default for item type", ):
+        """
+        Sets an item's rarity, affecting its default name color.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param str rarity: Rarity
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemRarity', (result, item_to_change,), {'Rarity': rarity})
+
+    @staticmethod
+    def BlockHardness(result: Variable, block_to_check: Item | Location, ):
+        """
+        Gets a block's hardness value.
+    
+        :param Variable result: Variable to set
+        :param Item | Location block_to_check: Block to check OR Location to check
+        
+        """
+        return CodeBlock.new_action('set_var', 'BlockHardness', (result, block_to_check,), {})
+
+    @staticmethod
+    def GetPotionAmp(result: Variable, potion: Potion, ):
+        """
+        Gets a potion effect's amplifier.
+    
+        :param Variable result: Variable to set
+        :param Potion potion: Potion to get amplifier of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetPotionAmp', (result, potion,), {})
+
+    @staticmethod
+    def GetBundleItems(result: Variable, bundle: Item, ):
+        """
+        Gets the contents of a bundle.
+    
+        :param Variable result: Variable to set
+        :param Item bundle: Bundle
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBundleItems', (result, bundle,), {})
+
+    @staticmethod
+    def GetParticleAmount(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle amount.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get amount of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleAmount', (result, effect,), {})
+
+    @staticmethod
+    def RandomVector(result: Variable, vector_length: Number | None=None, ):
+        """
+        Creates a random vector that lies on a sphere. Generated vectors will be uniformly distributed on its surface.
+    
+        :param Variable result: Variable to set
+        :param Number | None vector_length: Vector length (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'RandomVector', (result, vector_length,), {})
+
+    @staticmethod
+    def GetBlockShape(result: Variable, block_location: Location, ):
+        """
+        Gets a block collision shape at a location.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockShape', (result, block_location,), {})
+
+    @staticmethod
+    def GetDictSize(result: Variable, dictionary_to_measure: ArgValue, ):
+        """
+        Gets the number of entries in a dictionary.
+    
+        :param Variable result: Variable to set
+        :param ArgValue dictionary_to_measure: Dictionary to measure
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetDictSize', (result, dictionary_to_measure,), {})
+
+    @staticmethod
+    def SetItemAmount(result: Variable, item_to_change: Item | None=None, stack_size: Number=None, ):
+        """
+        Sets an item's stack size.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Number stack_size: Stack size
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemAmount', (result, item_to_change, stack_size,), {})
+
+    @staticmethod
+    def SubtractVectors(result: Variable, vectors_to_subtract: list[DFVector] | DFVector, ):
+        """
+        Sets a variable to the difference between the given vectors.
+    
+        :param Variable result: Variable to set
+        :param list[DFVector] | DFVector vectors_to_subtract: Vectors to subtract
+        
+        """
+        return CodeBlock.new_action('set_var', 'SubtractVectors', (result, vectors_to_subtract,), {})
+
+    @staticmethod
+    def AllRegexMatches(result: Variable, input_string: DFString, regex_pattern: DFString, return_type: Literal["Full Match", "All Groups", "All Named Groups"]="Full Match", ):
+        """
+        Gets a list of every Regex match in the given string.
+    
+        :param Variable result: Variable to set
+        :param DFString input_string: Input string
+        :param DFString regex_pattern: Regex pattern
+        :param str return_type: Return Type
+    
+            - Full Match: Return a list of all matches
+            - All Groups: Return a list of lists where each sub-list contains all groups of the relevant Regex match
+            - All Named Groups: Return a list of dictionaries where each dictionary contains all named groups of the relevant Regex match
+        
+        """
+        return CodeBlock.new_action('set_var', 'AllRegexMatches', (result, input_string, regex_pattern,), {'Return Type': return_type})
+
+    @staticmethod
+    def SetCase(result: Variable, string_to_change: DFString | None=None, capitalization_type: Literal["UPPERCASE", "lowercase", "Proper Case", "iNVERT CASE", "RAnDoM cASe"]="UPPERCASE", ):
+        """
+        Sets a string's capitalization (eg. to uppercase).
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_change: String to change (optional)
+        :param str capitalization_type: Capitalization Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCase', (result, string_to_change,), {'Capitalization Type': capitalization_type})
+
+    @staticmethod
+    def SwapVectorComp(result: Variable, vector_to_swap_components_of: DFVector | None=None, components_to_swap: Literal["X ⇄ Y", "X ⇄ Z", "Y ⇄ Z"]="X ⇄ Y", ):
+        """
+        Swaps two of a vector's X, Y, or Z components.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_swap_components_of: Vector to swap components of (optional)
+        :param str components_to_swap: Components to Swap
+    
+            - X ⇄ Y: Swaps the X and Y components.
+            - X ⇄ Z: Swaps the X and Z components.
+            - Y ⇄ Z: Swaps the Y and Z components.
+        
+        """
+        return CodeBlock.new_action('set_var', 'SwapVectorComp', (result, vector_to_swap_components_of,), {'Components to Swap': components_to_swap})
+
+    @staticmethod
+    def SetParticleColor(result: Variable, effect_to_change: Particle | None=None, color_hexadecimal: DFString=None, color_variation: Number | None=None, ):
+        """
+        Sets a particle effect's particle color and color variation.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
+        :param Number | None color_variation: Color variation (%) (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleColor', (result, effect_to_change, color_hexadecimal, color_variation,), {})
+
+    @staticmethod
+    def GetLight(result: Variable, light_location: Location, light_type: Literal["Combined light", "Sky light", "Block light"]="Combined light", ):
+        """
+        Gets the light level at a location.
+    
+        :param Variable result: Variable to set
+        :param Location light_location: Light location
+        :param str light_type: Light Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetLight', (result, light_location,), {'Light Type': light_type})
+
+    @staticmethod
+    def GetBookText(result: Variable, book: Item, page_number: Number | None=None, ):
+        """
+        Gets a book's text.
+    
+        :param Variable result: Variable to set
+        :param Item book: Book
+        :param Number | None page_number: Page number OR Gets list of all pages)
+        
+        """
+        return CodeBlock.new_action('set_var', ' GetBookText ', (result, book, page_number,), {})
+
+    @staticmethod
+    def GetDictValues(result: Variable, dictionary_to_pull_from: ArgValue, ):
+        """
+        Gets the list of values in this dictionary.
+    
+        :param Variable result: Variable to set
+        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetDictValues', (result, dictionary_to_pull_from,), {})
+
+    @staticmethod
+    def Vector(result: Variable, x_component: Number, y_component: Number, z_component: Number | DFString, ):
+        """
+        Sets a variable to a vector.
+    
+        :param Variable result: Variable to set
+        :param Number x_component: X component
+        :param Number y_component: Y component
+        :param Number | DFString z_component: Z component OR Direction name (One of the following: "north", "east", "south", "west",  "up", "down")
+        
+        """
+        return CodeBlock.new_action('set_var', 'Vector', (result, x_component, y_component, z_component,), {})
+
+    @staticmethod
+    def Distance(result: Variable, location_1: Location, location_2: Location, distance_type: Literal["Distance 2D (X/Z)", "Distance 3D (X/Y/Z)", "Altitude (Y)"]="Distance 3D (X/Y/Z)", ):
+        """
+        Sets a variable to the distance between two locations.
+    
+        :param Variable result: Variable to set
+        :param Location location_1: Location 1
+        :param Location location_2: Location 2
+        :param str distance_type: Distance Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'Distance', (result, location_1, location_2,), {'Distance Type': distance_type})
+
+    @staticmethod
+    def ParseMiniMessage(result: Variable, string_to_parse: DFString, allowed_tags: Literal["Style Only", "Dynamic", "Full"]="Style Only", parse_legacy_color_codes: Literal["True", "False"]="False", ):
+        """
+        Parses a MiniMessage expression from a string value into a styled text.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_parse: String to parse
+        :param str allowed_tags: Allowed Tags
+    
+            - Style Only: Resolves the following tags:  • <color>  • <gradient>  • <rainbow>  • <reset>  • <transition>  • <bold>  • <italic>  • <underline>  • <obfuscated>  • <space>  • <newline>  • <empty>
+            - Dynamic: Resolves the following tags:  • ...all tags from "Style Only"  • <font>  • <keybind>  • <translatable>
+            - Full: Resolves the following tags:  • ...all tags from "Dynamic"  • <click>  • <hover>  • <insertion>
+        :param str parse_legacy_color_codes: Parse Legacy Color Codes
+        
+        """
+        return CodeBlock.new_action('set_var', 'ParseMiniMessage', (result, string_to_parse,), {'Allowed Tags': allowed_tags, 'Parse Legacy Color Codes': parse_legacy_color_codes})
+
+    @staticmethod
+    def Root(result: Variable, number_input: Number | None=None, root_index: Number | None=None, ):
+        """
+        Takes the root of a number.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_input: Number input (optional)
+        :param Number | None root_index: Root index (optional) (Default = 2 (²√input))
+        
+        """
+        return CodeBlock.new_action('set_var', 'Root', (result, number_input, root_index,), {})
+
+    @staticmethod
+    def SetModelDataStrs(result: Variable, item_to_change: Item | None=None, string_model_value: list[DFString] | DFString=None, ):
+        """
+        Sets the model string values on an item, used in resource packs.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[DFString] | DFString string_model_value: String model value(s)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetModelDataStrs', (result, item_to_change, string_model_value,), {})
+
+    @staticmethod
+    def SetParticleAmount(result: Variable, effect_to_change: Particle | None=None, particle_amount: Number=None, ):
+        """
+        Sets a particle effect's particle amount.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_amount: Particle amount
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleAmount', (result, effect_to_change, particle_amount,), {})
+
+    @staticmethod
+    def AddItemEnchant(result: Variable, item_to_change: Item | None=None, enchantment_name: DFString=None, enchantment_level: Number=None, ):
+        """
+        Adds an enchantment to an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString enchantment_name: Enchantment name
+        :param Number enchantment_level: Enchantment level
+        
+        """
+        return CodeBlock.new_action('set_var', 'AddItemEnchant', (result, item_to_change, enchantment_name, enchantment_level,), {})
+
+    @staticmethod
+    def AddItemToolRule(result: Variable, item_to_change: Item | None=None, mining_speed: Number=None, blocks_to_apply_the_rule_for: list[Item | DFString] | Item | DFString=None, correct_tool_for_loot: Literal["True", "False"]="True", ):
+        """
+        Adds a rule for breaking blocks to a tool item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Number mining_speed: Mining speed
+        :param list[Item | DFString] | Item | DFString blocks_to_apply_the_rule_for: Blocks to apply the rule for OR Block tag ID to apply the rule for (Example: "#mineable/pickaxe")
+        :param str correct_tool_for_loot: Correct Tool for Loot
+    
+            - True: If the mined block requires certain tools for item drops, this tool will cause the items to drop and increases the mining speed.
+            - False: If the mined block requires certain tools for item drops, this tool will not cause the items to drop.
+        
+        """
+        return CodeBlock.new_action('set_var', 'AddItemToolRule', (result, item_to_change, mining_speed, blocks_to_apply_the_rule_for,), {'Correct Tool for Loot': correct_tool_for_loot})
+
+    @staticmethod
+    def GetItemType(result: Variable, item: Item, return_value_type: Literal["Item ID (golden_apple)", "Item Name (Golden Apple)", "Item"]="Item ID (golden_apple)", ):
+        """
+        Gets an item's material.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get material of
+        :param str return_value_type: Return Value Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemType', (result, item,), {'Return Value Type': return_value_type})
+
+    @staticmethod
+    def GetDirection(result: Variable, location: Location, ):
+        """
+        Gets a location's rotation (pitch and yaw) as a direction.
+    
+        :param Variable result: Variable to set
+        :param Location location: Location to get direction of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetDirection', (result, location,), {})
+
+    @staticmethod
+    def GetLoreLine(result: Variable, item: Item, lore_line: Number, ):
+        """
+        Gets a single line from an item's lore.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get lore from
+        :param Number lore_line: Lore line to get
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetLoreLine', (result, item, lore_line,), {})
+
+    @staticmethod
+    def ArcTangent2(result: Variable, y: Number, x: Number, output_type: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Sets a variable to the arc tangent of 2 numbers.
+    
+        :param Variable result: Variable to set
+        :param Number y: Y
+        :param Number x: X
+        :param str output_type: Output Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'ArcTangent2', (result, y, x,), {'Output Type': output_type})
+
+    @staticmethod
+    def GetParticleType(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's type.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get type of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleType', (result, effect,), {})
+
+    @staticmethod
+    def SetItemMaxDura(result: Variable, item: Item | None=None, maximum_durability: Number | None=None, ):
+        """
+        Sets an item's maximum durability.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        :param Number | None maximum_durability: Maximum durability (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemMaxDura', (result, item, maximum_durability,), {})
+
+    @staticmethod
+    def RemoveString(result: Variable, string_to_change: DFString | None=None, string_to_remove: list[DFString] | DFString=None, regular_expressions: Literal["Enable", "Disable"]="Disable", ):
+        """
+        Searches for part of a string and removes all instances of it.
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_change: String to change (optional)
+        :param list[DFString] | DFString string_to_remove: String to remove
+        :param str regular_expressions: Regular Expressions
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveString', (result, string_to_change, string_to_remove,), {'Regular Expressions': regular_expressions})
+
+    @staticmethod
+    def GetAllBlockData(result: Variable, block_location: Location, hide_default: Literal["True", "False"]="True", ):
+        """
+        Gets the block state tags at a location.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        :param str hide_default: Hide Default
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetAllBlockData', (result, block_location,), {'Hide Default': hide_default})
+
+    @staticmethod
+    def SetCrossbowProj(result: Variable, crossbow: Item | None=None, projectiles: list[Item] | Item | None=None, ):
+        """
+        Sets a crossbow's loaded projectiles.
+    
+        :param Variable result: Variable to set
+        :param Item | None crossbow: Crossbow (optional)
+        :param list[Item] | Item | None projectiles: Projectiles (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCrossbowProj', (result, crossbow, projectiles,), {})
+
+    @staticmethod
+    def MaxNumber(result: Variable, number_set_to_compare: list[Number] | Number, ):
+        """
+        Sets a variable to the highest number in a set.
+    
+        :param Variable result: Variable to set
+        :param list[Number] | Number number_set_to_compare: Number set to compare
+        
+        """
+        return CodeBlock.new_action('set_var', 'MaxNumber', (result, number_set_to_compare,), {})
+
+    @staticmethod
+    def GetDictKeys(result: Variable, dictionary_to_pull_from: ArgValue, ):
+        """
+        Gets the list of keys in this dictionary.
+    
+        :param Variable result: Variable to set
+        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetDictKeys', (result, dictionary_to_pull_from,), {})
+
+    @staticmethod
+    def TrimStyledText(result: Variable, text_to_trim: DFText | None=None, start_character_position: Number=None, end_character_position: Number | None=None, ):
+        """
+        Trims the content of styled text, leaving all formatting in place.
+    
+        :param Variable result: Variable to set
+        :param DFText | None text_to_trim: Text to trim (optional)
+        :param Number start_character_position: Start character position
+        :param Number | None end_character_position: End character position (optional) (Default = Text length)
+        
+        """
+        return CodeBlock.new_action('set_var', 'TrimStyledText', (result, text_to_trim, start_character_position, end_character_position,), {})
+
+    @staticmethod
+    def SetParticleMat(result: Variable, effect_to_change: Particle | None=None, particle_material: Item=None, ):
+        """
+        Sets a particle effect's particle display material.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Item particle_material: Particle material
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleMat', (result, effect_to_change, particle_material,), {})
+
+    @staticmethod
+    def GetCoord(result: Variable, location: Location, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", coordinate: Literal["X", "Y", "Z", "Pitch", "Yaw"]="X", ):
+        """
+        Gets a location's X, Y, Z, pitch, or yaw coordinate.
+    
+        :param Variable result: Variable to set
+        :param Location location: Location to get coordinate of
+        :param str coordinate_type: Coordinate Type
+        :param str coordinate: Coordinate
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCoord', (result, location,), {'Coordinate Type': coordinate_type, 'Coordinate': coordinate})
+
+    @staticmethod
+    def RemoveItemTag(result: Variable, item_to_change: Item | None=None, tag_name: DFString=None, ):
+        """
+        Removes a custom item tag.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString tag_name: Tag name
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveItemTag', (result, item_to_change, tag_name,), {})
+
+    @staticmethod
+    def GetModelDataStrs(result: Variable, item: Item, ):
+        """
+        Gets the model string values on an item, used in resource packs.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get model data from
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetModelDataStrs', (result, item,), {})
+
+    @staticmethod
+    def SetParticleSize(result: Variable, effect_to_change: Particle | None=None, particle_size: Number=None, size_variation: Number | None=None, ):
+        """
+        Sets a particle effect's particle size and size variation.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_size: Particle size
+        :param Number | None size_variation: Size variation (%) (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleSize', (result, effect_to_change, particle_size, size_variation,), {})
+
+    @staticmethod
+    def GetPotionDur(result: Variable, potion: Potion, ):
+        """
+        Gets a potion effect's duration.
+    
+        :param Variable result: Variable to set
+        :param Potion potion: Potion to get duration of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetPotionDur', (result, potion,), {})
+
+    @staticmethod
+    def RandomLoc(result: Variable, location_1: Location, location_2: Location, ):
+        """
+        Sets the variable to a random location between two locations.
+    
+        :param Variable result: Variable to set
+        :param Location location_1: Location 1
+        :param Location location_2: Location 2
+        
+        """
+        return CodeBlock.new_action('set_var', 'RandomLoc', (result, location_1, location_2,), {})
+
+    @staticmethod
+    def SetSoundType(result: Variable, sound_to_change: Sound | None=None, sound_name: DFString=None, ):
+        """
+        Sets a sound's type.
+    
+        :param Variable result: Variable to set
+        :param Sound | None sound_to_change: Sound to change (optional)
+        :param DFString sound_name: Sound name (e.g. "pling")
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetSoundType', (result, sound_to_change, sound_name,), {})
+
+    @staticmethod
+    def GetLodestoneLoc(result: Variable, compass: Item, ):
+        """
+        Gets a compass's lodestone location.
+    
+        :param Variable result: Variable to set
+        :param Item compass: Compass to get lodestone location of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetLodestoneLoc', (result, compass,), {})
+
+    @staticmethod
+    def IndexOfSubstring(result: Variable, string_to_search_in: DFString, string_to_search_for: DFString, starting_index: Number | None=None, ignore_case: Literal["True", "False"]="False", search_type: Literal["First occurrence", "Last occurrence"]="First occurrence", ):
+        """
+        Searches for a string in another string and gets the index if found.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_search_in: String to search in
+        :param DFString string_to_search_for: String to search for
+        :param Number | None starting_index: Starting index (optional) (Default = 1)
+        :param str ignore_case: Ignore Case
+        :param str search_type: Search Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'IndexOfSubstring', (result, string_to_search_in, string_to_search_for, starting_index,), {'Ignore Case': ignore_case, 'Search Type': search_type})
+
+    @staticmethod
+    def GetParticleSprd(result: Variable, effect: Particle, spread: Literal["Horizontal", "Vertical"]="Horizontal", ):
+        """
+        Gets a particle effect's horizontal or vertical spread.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get spread of
+        :param str spread: Spread
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleSprd', (result, effect,), {'Spread': spread})
+
+    @staticmethod
+    def SetItemLeftover(result: Variable, item_to_change: Item | None=None, remainder_item: Item | None=None, ):
+        """
+        Sets an item's leftover item that gets replaced on use, e.g. drinking stew gives a bowl.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Item | None remainder_item: Remainder item (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemLeftover', (result, item_to_change, remainder_item,), {})
+
+    @staticmethod
+    def ReflectVector(result: Variable, vector_to_reflect: DFVector | None=None, surface_vector: DFVector=None, ):
+        """
+        Reflects a vector off a surface defined by another vector.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_reflect: Vector to reflect (optional)
+        :param DFVector surface_vector: Surface vector
+        
+        """
+        return CodeBlock.new_action('set_var', 'ReflectVector', (result, vector_to_reflect, surface_vector,), {})
+
+    @staticmethod
+    def DecimalRGB(result: Variable, hex_code_to_convert: DFString, ):
+        """
+        Converts a hex code to a packed RGB integer.
+    
+        :param Variable result: Variable to set
+        :param DFString hex_code_to_convert: Hex code to convert
+        
+        """
+        return CodeBlock.new_action('set_var', 'DecimalRGB', (result, hex_code_to_convert,), {})
+
+    @staticmethod
+    def ClearItemAttrs(result: Variable, item: Item | None=None, ):
+        """
+        Clears all attributes from an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item: Item (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClearItemAttrs', (result, item,), {})
+
+    @staticmethod
+    def GetHeadOwner(result: Variable, head: Item, text_value: Literal["Owner Name", "Owner UUID"]="Owner Name", ):
+        """
+        Gets a player head's owner name or UUID.
+    
+        :param Variable result: Variable to set
+        :param Item head: Head to get owner of
+        :param str text_value: Text Value
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetHeadOwner', (result, head,), {'Text Value': text_value})
+
+    @staticmethod
+    def AppendDict(dictionary_to_add_to: Variable, dictionary_to_append: ArgValue, ):
+        """
+        Adds all entries from one dictionary into the other.
+    
+        :param Variable dictionary_to_add_to: Dictionary to add to
+        :param ArgValue dictionary_to_append: Dictionary to append
+        
+        """
+        return CodeBlock.new_action('set_var', 'AppendDict', (dictionary_to_add_to, dictionary_to_append,), {})
+
+    @staticmethod
+    def SetItemModel(result: Variable, item_to_change: Item | None=None, model_key: DFString | None=None, ):
+        """
+        Sets an item's model.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString | None model_key: Model key (optional) (A namespaced key ("minecraft:" by default))
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemModel', (result, item_to_change, model_key,), {})
+
+    @staticmethod
+    def GetColorChannels(result: Variable, color_hexadecimal: DFString, color_channels: Literal["RGB", "HSB", "HSL"]="RGB", ):
+        """
+        Gets a color's RGB/HSB/HSL number values as a list.
+    
+        :param Variable result: Variable to set
+        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
+        :param str color_channels: Color Channels
+    
+            - RGB: 1. Red (0 - 255) 2. Green (0 - 255) 3. Blue (0 - 255)
+            - HSB: 1. Hue (0.0 - 360.0) 2. Saturation (0.0 - 100.0) 3. Brightness (0.0 - 100.0)
+            - HSL: 1. Hue (0.0 - 360.0) 2. Saturation (0.0 - 100.0) 3. Lightness (0.0 - 100.0)
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetColorChannels', (result, color_hexadecimal,), {'Color Channels': color_channels})
+
+    @staticmethod
+    def SetDirection(result: Variable, location_to_change: Location | None=None, direction: DFVector=None, ):
+        """
+        Sets a location's rotation (pitch and yaw) to a direction.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_change: Location to change (optional)
+        :param DFVector direction: Direction
+        
+        """
+        return CodeBlock.new_action('set_var', ' SetDirection ', (result, location_to_change, direction,), {})
+
+    @staticmethod
+    def SetListValue(list_to_change: Variable, index: Number, value_to_set: ArgValue, ):
+        """
+        Sets a list variable's value at an index.
+    
+        :param Variable list_to_change: List to change
+        :param Number index: Index
+        :param ArgValue value_to_set: Value to set
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetListValue', (list_to_change, index, value_to_set,), {})
+
+    @staticmethod
+    def SetItemEnchants(result: Variable, item_to_change: Item | None=None, enchantments: ArgValue=None, ):
+        """
+        Sets an item's enchantment list.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param ArgValue enchantments: Enchantments (Key of enchantment ID)
+        
+        """
+        return CodeBlock.new_action('set_var', ' SetItemEnchants ', (result, item_to_change, enchantments,), {})
+
+    @staticmethod
+    def SetBookText(result: Variable, book: Item | None=None, pages: list[DFText] | DFText=None, page_number: Number=None, ):
+        """
+        Sets a book's text.
+    
+        :param Variable result: Variable to set
+        :param Item | None book: Book (optional)
+        :param list[DFText] | DFText pages: Pages OR Page text
+        :param Number page_number: Page number
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetBookText', (result, book, pages, page_number,), {})
+
+    @staticmethod
+    def RandomValue(result: Variable, value_set_to_choose_from: list[ArgValue] | ArgValue, ):
+        """
+        Sets a variable to a random value from a set.
+    
+        :param Variable result: Variable to set
+        :param list[ArgValue] | ArgValue value_set_to_choose_from: Value set to choose from
+        
+        """
+        return CodeBlock.new_action('set_var', 'RandomValue', (result, value_set_to_choose_from,), {})
+
+    @staticmethod
+    def SetItemType(result: Variable, item_to_change: Item | None=None, material: DFString=None, ):
+        """
+        Sets an item's material.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString material: Material
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemType', (result, item_to_change, material,), {})
+
+    @staticmethod
+    def GetSoundType(result: Variable, sound: Sound, ):
+        """
+        Gets the given sound's type.
+    
+        :param Variable result: Variable to set
+        :param Sound sound: Sound to get type of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetSoundType', (result, sound,), {})
+
+    @staticmethod
+    def ClampVector(result: Variable, vector_to_clamp: DFVector | None=None, lower_bound_vector: DFVector=None, upper_bound_vector: DFVector=None, ):
+        """
+        Clamps a vector to a region defined by 2 vectors
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_clamp: Vector to clamp (optional)
+        :param DFVector lower_bound_vector: Lower bound vector
+        :param DFVector upper_bound_vector: Upper bound vector
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClampVector', (result, vector_to_clamp, lower_bound_vector, upper_bound_vector,), {})
+
+    @staticmethod
+    def GetListValue(result: Variable, list: ArgValue, index: Number, ):
+        """
+        Gets a list variable's value at an index.
+    
+        :param Variable result: Variable to set
+        :param ArgValue list: List to get value of
+        :param Number index: Index
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetListValue', (result, list, index,), {})
+
+    @staticmethod
+    def ValueToJson(result: Variable, value_to_convert: Number | DFString | ArgValue, ):
+        """
+        Converts a value to JSON.
+    
+        :param Variable result: Variable to set
+        :param Number | DFString | ArgValue value_to_convert: Value to convert OR Value to convert OR Value to convert OR Value to convert
+        
+        """
+        return CodeBlock.new_action('set_var', 'ValueToJson', (result, value_to_convert,), {})
+
+    @staticmethod
+    def BounceNum(result: Variable, number_to_bounce: Number | None=None, lower_bound: Number=None, upper_bound: Number=None, ):
+        """
+        Checks if a number is inside the bounds and if not, bounces it towards the other bound.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_to_bounce: Number to bounce (optional)
+        :param Number lower_bound: Lower bound (inclusive)
+        :param Number upper_bound: Upper bound (exclusive)
+        
+        """
+        return CodeBlock.new_action('set_var', 'BounceNum', (result, number_to_bounce, lower_bound, upper_bound,), {})
+
+    @staticmethod
+    def Tangent(result: Variable, number_input: Number, tangent_variant: Literal["Tangent", "Inverse tangent (arctangent)", "Hyperbolic tangent"]="Tangent", input: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Sets a variable to the trigonometric tangent function of a number.
+    
+        :param Variable result: Variable to set
+        :param Number number_input: Number input
+        :param str tangent_variant: Tangent Variant
+        :param str input: Input
+        
+        """
+        return CodeBlock.new_action('set_var', 'Tangent', (result, number_input,), {'Tangent Variant': tangent_variant, 'Input': input})
+
+    @staticmethod
+    def HSBColor(result: Variable, hue: Number, saturation: Number | None=None, brightness: Number | ArgValue | None=None, ):
+        """
+        Creates a color based on hue, saturation, and brightness.
+    
+        :param Variable result: Variable to set
+        :param Number hue: Hue (Color circle, 0-360)
+        :param Number | None saturation: Saturation (0-100) (optional) (Default = 100)
+        :param Number | ArgValue | None brightness: Brightness (0-100) OR H, S, B values (optional) (Default = 100)
+        
+        """
+        return CodeBlock.new_action('set_var', 'HSBColor', (result, hue, saturation, brightness,), {})
+
+    @staticmethod
+    def Increment(variable_to_increment: Variable, number_to_increment_by: list[Number] | Number | None=None, ):
+        """
+        Increments a number variable by 1 or more other numbers.
+    
+        :param Variable variable_to_increment: Variable to increment
+        :param list[Number] | Number | None number_to_increment_by: Number(s) to increment by (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', '+=', (variable_to_increment, number_to_increment_by,), {})
+
+    @staticmethod
+    def Interpolate(result: Variable, time: Number, first_number: Number | None=None, second_number: Number | None=None, easing: Literal["Linear", "Quad", "Cubic", "Quart", "Quint", "Sine", "Expo", "Circ"]="Linear", direction: Literal["In", "Out", "In Out"]="In", ):
+        """
+        Interpolates two numbers based on a time value and an easing type.
+    
+        :param Variable result: Variable to set
+        :param Number time: Time (%)
+        :param Number | None first_number: First number (optional) (Default = 0)
+        :param Number | None second_number: Second number (optional) (Default = 1)
+        :param str easing: Easing
+        :param str direction: Direction
+        
+        """
+        return CodeBlock.new_action('set_var', 'Interpolate', (result, time, first_number, second_number,), {'Easing': easing, 'Direction': direction})
+
+    @staticmethod
+    def GetSoundVariant(result: Variable, sound: Sound, ):
+        """
+        Gets the variant of a sound.
+    
+        :param Variable result: Variable to set
+        :param Sound sound: Sound to get variant of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetSoundVariant', (result, sound,), {})
+
+    @staticmethod
+    def GetItemColor(result: Variable, item: Item, ):
+        """
+        Gets a colorable item's color.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get color of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemColor', (result, item,), {})
+
+    @staticmethod
+    def ClearFormatting(result: Variable, text_to_change: DFText | None=None, ):
+        """
+        Clears all formatting from the given styled text.
+    
+        :param Variable result: Variable to set
+        :param DFText | None text_to_change: Text to change (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClearFormatting', (result, text_to_change,), {})
+
+    @staticmethod
+    def InsertListValue(list_to_change: Variable, index: Number, value_to_insert: ArgValue, ):
+        """
+        Inserts a value into a list variable at an index, shifting all values at and after it to the right.
+    
+        :param Variable list_to_change: List to change
+        :param Number index: Index
+        :param ArgValue value_to_insert: Value to insert
+        
+        """
+        return CodeBlock.new_action('set_var', 'InsertListValue', (list_to_change, index, value_to_insert,), {})
+
+    @staticmethod
+    def GetParticleDur(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's duration.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get duration of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleDur', (result, effect,), {})
+
+    @staticmethod
+    def SetSoundVolume(result: Variable, sound_to_change: Sound | None=None, volume: Number=None, ):
+        """
+        Sets a sound's volume.
+    
+        :param Variable result: Variable to set
+        :param Sound | None sound_to_change: Sound to change (optional)
+        :param Number volume: Volume
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetSoundVolume', (result, sound_to_change, volume,), {})
+
+    @staticmethod
+    def SetCoord(result: Variable, location_to_change: Location | None=None, coordinate: Number=None, coordinate_type: Literal["Plot coordinate", "World coordinate"]="Plot coordinate", coordinate_tag: Literal["X", "Y", "Z", "Pitch", "Yaw"]="X", ):
+        """
+        Sets a location's X, Y, Z, pitch, or yaw coordinate.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_change: Location to change (optional)
+        :param Number coordinate: Coordinate
+        :param str coordinate_type: Coordinate Type
+        :param str coordinate_tag: Coordinate
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCoord', (result, location_to_change, coordinate,), {'Coordinate Type': coordinate_type, 'Coordinate': coordinate_tag})
+
+    @staticmethod
+    def AddVectors(result: Variable, vectors_to_add: list[DFVector] | DFVector, ):
+        """
+        Sets a variable to the sum of the given vectors.
+    
+        :param Variable result: Variable to set
+        :param list[DFVector] | DFVector vectors_to_add: Vectors to add
+        
+        """
+        return CodeBlock.new_action('set_var', 'AddVectors', (result, vectors_to_add,), {})
+
+    @staticmethod
+    def SanitizeTags(result: Variable, string_to_sanitize: DFString | None=None, ):
+        """
+        Sanitizes all MiniMessage tags in a string. This is useful for using user input in the Parse MiniMessage Set Variable.
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_sanitize: String to sanitize (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SanitizeTags', (result, string_to_sanitize,), {})
+
+    @staticmethod
+    def GetParticleFade(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle fade color.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get fade color of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleFade', (result, effect,), {})
+
+    @staticmethod
+    def SetItemTool(result: Variable, item_to_change: Item | None=None, default_mining_speed: Number | None=None, damage_per_block: Number | None=None, ):
+        """
+        Adds tool properties to an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Number | None default_mining_speed: Default mining speed (optional) (Default = 1)
+        :param Number | None damage_per_block: Damage per block (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemTool', (result, item_to_change, default_mining_speed, damage_per_block,), {})
+
+    @staticmethod
+    def GetTooltipStyle(result: Variable, item: Item, ):
+        """
+        Gets an item's custom tooltip.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get tooltip style of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetTooltipStyle', (result, item,), {})
+
+    @staticmethod
+    def GetItemEnchants(result: Variable, item: Item, ):
+        """
+        Gets an item's enchantments.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get enchantments from
+        
+        """
+        return CodeBlock.new_action('set_var', ' GetItemEnchants ', (result, item,), {})
+
+    @staticmethod
+    def GzipCompress(result: Variable, byte_to_compress: list[Number | int] | Number | int, ):
+        """
+        Compresses bytes as a list of numbers to Gzip.
+    
+        :param Variable result: Variable to set
+        :param list[Number | int] | Number | int byte_to_compress: Byte(s) to compress
+        
+        """
+        return CodeBlock.new_action('set_var', 'GzipCompress', (result, byte_to_compress,), {})
+
+    @staticmethod
+    def SetItemColor(result: Variable, item_to_change: Item | None=None, color_hexadecimal: DFString | None=None, ):
+        """
+        Sets a colorable item's color.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString | None color_hexadecimal: Color hexadecimal OR Removes color) (Example: "#FF0000" (red))
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemColor', (result, item_to_change, color_hexadecimal,), {})
+
+    @staticmethod
+    def GetParticleColor(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle color.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get color of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleColor', (result, effect,), {})
+
+    @staticmethod
+    def SetSoundPitch(result: Variable, sound_to_change: Sound | None=None, pitch: Number | DFString=None, ):
+        """
+        Sets a sound's pitch or note
+    
+        :param Variable result: Variable to set
+        :param Sound | None sound_to_change: Sound to change (optional)
+        :param Number | DFString pitch: Pitch OR Note
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetSoundPitch', (result, sound_to_change, pitch,), {})
+
+    @staticmethod
+    def RoundNumber(result: Variable, number_to_round: Number | None=None, round_multiple: Number | None=None, round_mode: Literal["Floor", "Nearest", "Ceiling"]="Nearest", ):
+        """
+        Rounds a number to a whole number or multiple.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_to_round: Number to round (optional)
+        :param Number | None round_multiple: Round multiple (optional) (Default = 1 (Whole number))
+        :param str round_mode: Round Mode
+    
+            - Floor: Rounds the number down.
+            - Nearest: Rounds the number to the nearest value.
+            - Ceiling: Rounds the number up.
+        
+        """
+        return CodeBlock.new_action('set_var', ' RoundNumber ', (result, number_to_round, round_multiple,), {'Round Mode': round_mode})
+
+    @staticmethod
+    def GetCanPlaceOn(result: Variable, item: Item, ):
+        """
+        Gets which blocks an item can be placed on in Adventure Mode.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetCanPlaceOn', (result, item,), {})
+
+    @staticmethod
+    def SortList(result: Variable, list_to_sort: ArgValue | None=None, sort_order: Literal["Ascending", "Descending"]="Ascending", ):
+        """
+        Sorts a list variable's values.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_sort: List to sort (optional)
+        :param str sort_order: Sort Order
+        
+        """
+        return CodeBlock.new_action('set_var', 'SortList', (result, list_to_sort,), {'Sort Order': sort_order})
+
+    @staticmethod
+    def SetCustomSound(result: Variable, sound_to_change: Sound | None=None, sound_key: DFString | None=None, ):
+        """
+        Sets the key of a custom sound.
+    
+        :param Variable result: Variable to set
+        :param Sound | None sound_to_change: Sound to change (optional)
+        :param DFString | None sound_key: Sound key (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCustomSound', (result, sound_to_change, sound_key,), {})
+
+    @staticmethod
+    def RemoveDictEntry(dictionary_to_change: Variable, key_to_remove: DFString, expected_value: list[ArgValue] | ArgValue | None=None, ):
+        """
+        Removes the dictionary entry with the given key.
+    
+        :param Variable dictionary_to_change: Dictionary to change
+        :param DFString key_to_remove: Key to remove
+        :param list[ArgValue] | ArgValue | None expected_value: Expected value(s) (optional) (When given, the entry will only be removed if the current value matches.)
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveDictEntry', (dictionary_to_change, key_to_remove, expected_value,), {})
+
+    @staticmethod
+    def FormatTime(result: Variable, time_to_format: Number, custom_format: DFString | None=None, format: Literal["Custom", "2020/08/17 17:20:54", "2020/08/17", "Mon, August 17", "Monday", "17:20:54", "5:20 PM", "17h20m54s", "54.229 seconds"]="2020/08/17 17:20:54", ):
+        """
+        Converts a numerical timestamp to a human-readable time/date text using a date format.
+    
+        :param Variable result: Variable to set
+        :param Number time_to_format: Time to format
+        :param DFString | None custom_format: Custom Format (optional) (Used only if Tag: Format is set to Custom)
+        :param str format: Format
+    
+            - Custom: Use the SimpleDateFormat online documentation.
+            - 2020/08/17 17:20:54: YYYY/MM/dd HH:mm:s
+            - 2020/08/17: YYYY/MM/dd
+            - Mon, August 17: EEE, MMMM d
+            - Monday: EEEE
+            - 17:20:54: HH:mm:ss
+            - 5:20 PM: h:mm a
+            - 17h20m54s: H'h'm'm's's'
+            - 54.229 seconds: s.S 'seconds'
+        
+        """
+        return CodeBlock.new_action('set_var', 'FormatTime', (result, time_to_format, custom_format,), {'Format': format})
+
+    @staticmethod
+    def SetParticleDur(result: Variable, effect_to_change: Particle | None=None, particle_duration: Number=None, ):
+        """
+        Sets a particle effect's duration.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_duration: Particle duration in ticks
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleDur', (result, effect_to_change, particle_duration,), {})
+
+    @staticmethod
+    def StringLength(result: Variable, string_to_measure: DFString, ):
+        """
+        Gets the number of characters a string has.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_measure: String to measure
+        
+        """
+        return CodeBlock.new_action('set_var', 'StringLength', (result, string_to_measure,), {})
+
+    @staticmethod
+    def GetItemEffects(result: Variable, item: Item, ):
+        """
+        Gets the potion effects applied by an item.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get effects from
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemEffects', (result, item,), {})
+
+    @staticmethod
+    def StyledText(result: Variable, text_to_set_to: list[ArgValue] | ArgValue | None=None, text_value_merging: Literal["Add spaces", "No spaces"]="No spaces", inherit_styles: Literal["True", "False"]="True", ):
+        """
+        Sets a variable to a styled text, or combines multiple values into one styled text.
+    
+        :param Variable result: Variable to set
+        :param list[ArgValue] | ArgValue | None text_to_set_to: Text to set to (optional)
+        :param str text_value_merging: Text Value Merging
+        :param str inherit_styles: Inherit Styles
+    
+            - True: Text style of the last value will be inherited when merging multiple values.
+            - False: Each value will have independent text style when merging multiple values.
+        
+        """
+        return CodeBlock.new_action('set_var', 'StyledText', (result, text_to_set_to,), {'Text Value Merging': text_value_merging, 'Inherit Styles': inherit_styles})
+
+    @staticmethod
+    def GetMiniMessageExpr(result: Variable, text_to_read: DFText, ):
+        """
+        Gets the MiniMessage expression for a styled text value.
+    
+        :param Variable result: Variable to set
+        :param DFText text_to_read: Text to read
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetMiniMessageExpr', (result, text_to_read,), {})
+
+    @staticmethod
+    def SetItemLore(result: Variable, item_to_change: Item | None=None, lore: list[DFText] | DFText | None=None, line_number: Number=None, ):
+        """
+        Sets an item's lore list.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[DFText] | DFText | None lore: Lore OR Clears lore) OR Lore line text
+        :param Number line_number: Line number
+        
+        """
+        return CodeBlock.new_action('set_var', ' SetItemLore ', (result, item_to_change, lore, line_number,), {})
+
+    @staticmethod
+    def SetItemEffects(result: Variable, item_to_change: Item | None=None, item_effects: list[Potion] | Potion=None, ):
+        """
+        Sets the potion effects applied by an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[Potion] | Potion item_effects: Item effects
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemEffects', (result, item_to_change, item_effects,), {})
+
+    @staticmethod
+    def Decrement(variable_to_decrement: Variable, number_to_decrement_by: list[Number] | Number | None=None, ):
+        """
+        Decrements a number variable by 1 or more other numbers.
+    
+        :param Variable variable_to_decrement: Variable to decrement
+        :param list[Number] | Number | None number_to_decrement_by: Number(s) to decrement by (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', '-=', (variable_to_decrement, number_to_decrement_by,), {})
+
+    @staticmethod
+    def GetItemTag(result: Variable, item: Item, tag_name: DFString, ):
+        """
+        Gets the value of a custom item tag.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get tag of
+        :param DFString tag_name: Tag name
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemTag', (result, item, tag_name,), {})
+
+    @staticmethod
+    def CreateList(result: Variable, value_list: list[ArgValue] | ArgValue | None=None, ):
+        """
+        Creates a list from the given values.
+    
+        :param Variable result: Variable to set
+        :param list[ArgValue] | ArgValue | None value_list: Value list (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'CreateList', (result, value_list,), {})
+
+    @staticmethod
+    def AppendList(list_to_append_to: Variable, list_to_append: list[ArgValue] | ArgValue, ):
+        """
+        Adds a list to the end of another list variable.
+    
+        :param Variable list_to_append_to: List to append to
+        :param list[ArgValue] | ArgValue list_to_append: List(s) to append
+        
+        """
+        return CodeBlock.new_action('set_var', 'AppendList', (list_to_append_to, list_to_append,), {})
+
+    @staticmethod
+    def GetContainerItems(result: Variable, container_location: Location, ignore_empty_slots: Literal["True", "False"]="False", ):
+        """
+        Gets a container's contents at a location.
+    
+        :param Variable result: Variable to set
+        :param Location container_location: Container location
+        :param str ignore_empty_slots: Ignore Empty Slots
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetContainerItems', (result, container_location,), {'Ignore Empty Slots': ignore_empty_slots})
+
+    @staticmethod
+    def GetModelDataNums(result: Variable, item: Item, model_value_type: Literal["Floats", "Flags", "Colors"]="Floats", ):
+        """
+        Gets the numerical model values on an item, used in resource packs.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get model data from
+        :param str model_value_type: Model Value Type
+    
+            - Floats: Gets the "floats" array of the model data Contents: Decimal numbers
+            - Flags: Gets the "flags" array of the model data Contents: 0 (false) or 1 (true)
+            - Colors: Gets the "colors" array of the model data Contents: RGB integers (e.g. 16733525)
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetModelDataNums', (result, item,), {'Model Value Type': model_value_type})
+
+    @staticmethod
+    def ShiftToward(result: Variable, location_to_shift: Location | None=None, target_location: Location=None, shift_distance: Number | None=None, ):
+        """
+        Shifts a location toward another location by the given distance.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param Location target_location: Target location
+        :param Number | None shift_distance: Shift distance (optional) (Default = 1)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftToward', (result, location_to_shift, target_location, shift_distance,), {})
+
+    @staticmethod
+    def TrimList(result: Variable, list_to_trim: ArgValue | None=None, start_index: Number=None, end_index: Number | None=None, ):
+        """
+        Trims a list, starting and ending at the given indices.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_trim: List to trim (optional)
+        :param Number start_index: Start index
+        :param Number | None end_index: End index (optional) (Default = List length)
+        
+        """
+        return CodeBlock.new_action('set_var', 'TrimList', (result, list_to_trim, start_index, end_index,), {})
+
+    @staticmethod
+    def GradientNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, dimensions: Literal["3D", "2D"]="3D", domain_fractal: Literal["Progressive", "Independent"]="Progressive", return_type: Literal["Simplex", "Perlin"]="Simplex", ):
+        """
+        Gets gradient noise: A type of noise based on a lattice of random gradients.
+    
+        :param Variable result: Variable to set
+        :param Location noise_location: Noise location
+        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
+        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
+        :param Number | None octaves: Octaves (optional) (Adds an additional layer of gradient noise to the output. 1-16, Default = 1)
+        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
+        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
+        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
+        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
+        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
+        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None generation_seed: Generation seed (optional)
+        :param str dimensions: Dimensions
+    
+            - 3D: Generates using the X, Y and Z axis.
+            - 2D: Generates using the X and Z axis only.
+        :param str domain_fractal: Domain Fractal
+    
+            - Progressive: Domains are calculated on top of one another.
+            - Independent: Domains are calculated in isolation.
+        :param str return_type: Return Type
+    
+            - Simplex: Provides the average of a honeycomb of gradient vectors.  Using a honeycomb instead of a lattice like that used in Perlin Noise, removes directional artifacts and increases efficiency.
+            - Perlin: Provides the average of a lattice of gradient vectors.  Using vectors rather than values like those seen in Value Noise, provides more detail at the cost of lower efficiency.
+        
+        """
+        return CodeBlock.new_action('set_var', 'GradientNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Dimensions': dimensions, 'Domain Fractal': domain_fractal, 'Return Type': return_type})
+
+    @staticmethod
+    def SetItemHideTooltip(result: Variable, item_to_change: Item | None=None, tooltip: Literal["Enable", "Disable"]="Enable", ):
+        """
+        Sets whether an item's tooltip is visible or not.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param str tooltip: Tooltip
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemHideTooltip', (result, item_to_change,), {'Tooltip': tooltip})
+
+    @staticmethod
+    def GetBlockSound(result: Variable, block: Item, sound_type: Literal["Break Sound", "Place Sound", "Hit Sound", "Fall Sound", "Step Sound"]="Break Sound", ):
+        """
+        Gets the sound for a block sound group.
+    
+        :param Variable result: Variable to set
+        :param Item block: Block to get sound from
+        :param str sound_type: Sound Type
+    
+            - Break Sound: Sound played when the block is broken.
+            - Place Sound: Sound played when the block is placed.
+            - Hit Sound: Sound played when the block is hit.
+            - Fall Sound: Sound played when something falls on the block.
+            - Step Sound: Sound played when something steps on the block.
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockSound', (result, block,), {'Sound Type': sound_type})
+
+    @staticmethod
+    def GetBlockDrops(result: Variable, location_to_check: Location, tool_to_use: Item | None=None, ):
+        """
+        Gets the items dropped by a block if mined by a given tool.
+    
+        :param Variable result: Variable to set
+        :param Location location_to_check: Location to check
+        :param Item | None tool_to_use: Tool to use (optional) (Default = Required Tool)
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockDrops', (result, location_to_check, tool_to_use,), {})
+
+    @staticmethod
+    def NamedRegexGrps(result: Variable, input_string: DFString, regex_pattern: DFString, ):
+        """
+        Gets a dictionary of all named capture groups in a Regex match.
+    
+        :param Variable result: Variable to set
+        :param DFString input_string: Input string
+        :param DFString regex_pattern: Regex pattern
+        
+        """
+        return CodeBlock.new_action('set_var', 'NamedRegexGrps', (result, input_string, regex_pattern,), {})
+
+    @staticmethod
+    def ClearEnchants(result: Variable, item_to_change: Item | None=None, ):
+        """
+        Removes enchantments from an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClearEnchants', (result, item_to_change,), {})
+
+    @staticmethod
+    def Cosine(result: Variable, number_input: Number, cosine_variant: Literal["Cosine", "Inverse cosine (arccosine)", "Hyperbolic cosine"]="Cosine", input: Literal["Degrees", "Radians"]="Degrees", ):
+        """
+        Sets a variable to the trigonometric cosine function of a number.
+    
+        :param Variable result: Variable to set
+        :param Number number_input: Number input
+        :param str cosine_variant: Cosine Variant
+        :param str input: Input
+        
+        """
+        return CodeBlock.new_action('set_var', 'Cosine', (result, number_input,), {'Cosine Variant': cosine_variant, 'Input': input})
+
+    @staticmethod
+    def GetParticleOpac(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's opacity.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get opacity of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleOpac', (result, effect,), {})
+
+    @staticmethod
+    def GetBreakSound(result: Variable, item: Item, ):
+        """
+        Gets which sound an item makes when it breaks.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get break sound from
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBreakSound', (result, item,), {})
+
+    @staticmethod
+    def GetItemByMCTag(result: Variable, item_tag_id: DFString, return_value_tyep: Literal["Material ID (golden_apple)", "Material Name (Golden Apple)", "Item"]="Material ID (golden_apple)", ):
+        """
+        Gets a list of items that belongs to the specified item tag.
+    
+        :param Variable result: Variable to set
+        :param DFString item_tag_id: Item tag ID (Example: "#enchantable/sword")
+        :param str return_value_tyep: Return Value Tyep
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemByMCTag', (result, item_tag_id,), {'Return Value Tyep': return_value_tyep})
+
+    @staticmethod
+    def SetParticleFade(result: Variable, effect_to_change: Particle | None=None, color_hexadecimal: DFString=None, ):
+        """
+        Sets a particle effect's particle fade color.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param DFString color_hexadecimal: Color hexadecimal (Example: "#FF0000" (red))
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleFade', (result, effect_to_change, color_hexadecimal,), {})
+
+    @staticmethod
+    def SetVectorComp(result: Variable, vector_to_change: DFVector | None=None, component: Number=None, component_tag: Literal["X", "Y", "Z"]="X", ):
+        """
+        Sets a vector's X, Y, or Z component.
+    
+        :param Variable result: Variable to set
+        :param DFVector | None vector_to_change: Vector to change (optional)
+        :param Number component: Component
+        :param str component_tag: Component
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetVectorComp', (result, vector_to_change, component,), {'Component': component_tag})
+
+    @staticmethod
+    def ParseNumber(result: Variable, string_to_convert: DFString | None=None, ):
+        """
+        Converts a string to a number.
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_convert: String to convert (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ParseNumber', (result, string_to_convert,), {})
+
+    @staticmethod
+    def Exponent(result: Variable, number_input: Number | None=None, exponent: Number | None=None, ):
+        """
+        Raises a number to the power of an exponent.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_input: Number input (optional)
+        :param Number | None exponent: Exponent (optional) (Default = 2 (input²))
+        
+        """
+        return CodeBlock.new_action('set_var', 'Exponent', (result, number_input, exponent,), {})
+
+    @staticmethod
+    def GetValueIndex(result: Variable, list_to_search_in: ArgValue, value_to_search: ArgValue, search_order: Literal["Ascending (first index)", "Descending (last index)"]="Ascending (first index)", ):
+        """
+        Searches for a value in a list variable and gets the index if found.
+    
+        :param Variable result: Variable to set
+        :param ArgValue list_to_search_in: List to search in
+        :param ArgValue value_to_search: Value to search
+        :param str search_order: Search Order
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetValueIndex', (result, list_to_search_in, value_to_search,), {'Search Order': search_order})
+
+    @staticmethod
+    def SetItemWeapon(result: Variable, item_to_change: Item | None=None, durability_reduction_per_attack: Number | None=None, seconds_to_disable_blocking_for: Number | None=None, ):
+        """
+        Adds weapon properties to an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param Number | None durability_reduction_per_attack: Durability reduction per attack (optional) (Default = 1)
+        :param Number | None seconds_to_disable_blocking_for: Seconds to disable blocking for (optional) (Default = 0)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetItemWeapon', (result, item_to_change, durability_reduction_per_attack, seconds_to_disable_blocking_for,), {})
+
+    @staticmethod
+    def RemItemEnchant(result: Variable, item_to_change: Item | None=None, enchantment_name: DFString=None, ):
+        """
+        Removes an enchantment from an item.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param DFString enchantment_name: Enchantment name
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemItemEnchant', (result, item_to_change, enchantment_name,), {})
+
+    @staticmethod
+    def AddItemLore(result: Variable, item_to_change: Item | None=None, lore_to_add: list[DFText] | DFText=None, ):
+        """
+        Adds lines to an item's lore.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[DFText] | DFText lore_to_add: Lore to add
+        
+        """
+        return CodeBlock.new_action('set_var', 'AddItemLore', (result, item_to_change, lore_to_add,), {})
+
+    @staticmethod
+    def GetConsumable(result: Variable, item: Item, consumable_property: Literal["Nutrition", "Saturation", "Use Duration", "Animation", "Sound"]="Nutrition", ):
+        """
+        Gets an item's consumable property.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get properties of
+        :param str consumable_property: Consumable Property
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetConsumable', (result, item,), {'Consumable Property': consumable_property})
+
+    @staticmethod
+    def SetParticleRoll(result: Variable, effect_to_change: Particle | None=None, particle_roll: Number=None, ):
+        """
+        Sets a particle effect's roll.
+    
+        :param Variable result: Variable to set
+        :param Particle | None effect_to_change: Effect to change (optional)
+        :param Number particle_roll: Particle roll
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetParticleRoll', (result, effect_to_change, particle_roll,), {})
+
+    @staticmethod
+    def SetSoundVariant(result: Variable, sound_to_change: Sound | None=None, variant_id: DFString | None=None, ):
+        """
+        Sets the variant of a sound.
+    
+        :param Variable result: Variable to set
+        :param Sound | None sound_to_change: Sound to change (optional)
+        :param DFString | None variant_id: Variant ID (e.g. "break1") (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetSoundVariant', (result, sound_to_change, variant_id,), {})
+
+    @staticmethod
+    def RandomizeList(result: Variable, list_to_randomize: ArgValue | None=None, ):
+        """
+        Randomizes the order of a list variable's values.
+    
+        :param Variable result: Variable to set
+        :param ArgValue | None list_to_randomize: List to randomize (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'RandomizeList', (result, list_to_randomize,), {})
+
+    @staticmethod
+    def HiddenComponents(result: Variable, item_to_change: Item | None=None, item_component_to_hide: list[DFString] | DFString | None=None, hiding_mode: Literal["Hide", "Show", "Hide all", "Show all", "Hide all except", "Show all except"]="Hide all", ):
+        """
+        Sets an item's components that should show up in its lore.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[DFString] | DFString | None item_component_to_hide: Item component(s) to hide (optional) (Item component keys, Example: "attribute_modifiers")
+        :param str hiding_mode: Hiding Mode
+        
+        """
+        return CodeBlock.new_action('set_var', 'HiddenComponents', (result, item_to_change, item_component_to_hide,), {'Hiding Mode': hiding_mode})
+
+    @staticmethod
+    def ClampNumber(result: Variable, number_to_clamp: Number | None=None, minimum: Number=None, maximum: Number=None, ):
+        """
+        Checks if a number is between a minimum and maximum value, and if not, sets it to the nearest.
+    
+        :param Variable result: Variable to set
+        :param Number | None number_to_clamp: Number to clamp (optional)
+        :param Number minimum: Minimum
+        :param Number maximum: Maximum
+        
+        """
+        return CodeBlock.new_action('set_var', 'ClampNumber', (result, number_to_clamp, minimum, maximum,), {})
+
+    @staticmethod
+    def GetItemModel(result: Variable, item: Item, ):
+        """
+        Gets an item's model.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get model of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemModel', (result, item,), {})
+
+    @staticmethod
+    def GetSoundPitch(result: Variable, sound: Sound, return_value_type: Literal["Pitch (number)", "Note (text)"]="Pitch (number)", ):
+        """
+        Gets a sound's pitch or note.
+    
+        :param Variable result: Variable to set
+        :param Sound sound: Sound to get pitch or note of
+        :param str return_value_type: Return Value Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetSoundPitch', (result, sound,), {'Return Value Type': return_value_type})
+
+    @staticmethod
+    def TranslateColors(result: Variable, string_to_translate: DFString | None=None, translation_type: Literal["From hex to color", "From & to color", "From color to &", "Strip color"]="From & to color", ):
+        """
+        Converts legacy color codes written in "&" or hex format to functional color codes, or vice versa.
+    
+        :param Variable result: Variable to set
+        :param DFString | None string_to_translate: String to translate (optional)
+        :param str translation_type: Translation Type
+    
+            - From hex to color: Replaces "#FF0000Example #AAFF55Text" with "Example Text"
+            - From & to color: Replaces "&9Example &3Text" with "Example Text"
+            - From color to &: Replaces "Example Text" with "&9Example &3Text"
+            - Strip color: Replaces "Example Text" with "Example Text"
+        
+        """
+        return CodeBlock.new_action('set_var', 'TranslateColors', (result, string_to_translate,), {'Translation Type': translation_type})
+
+    @staticmethod
+    def GetBlockGrowth(result: Variable, block_location: Location, growth_unit: Literal["Growth stage number", "Growth percentage"]="Growth stage number", ):
+        """
+        Gets a block's current growth at a location.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        :param str growth_unit: Growth Unit
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockGrowth', (result, block_location,), {'Growth Unit': growth_unit})
+
+    @staticmethod
+    def GetAllItemTags(result: Variable, item: Item, ):
+        """
+        Gets all tags registered on an item.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get tags of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetAllItemTags', (result, item,), {})
+
+    @staticmethod
+    def RemoveListValue(list_to_change: Variable, value_to_remove: list[ArgValue] | ArgValue, items_to_remove: Literal["All Matches", "First Match", "Last Match"]="All Matches", ):
+        """
+        Removes all matching values from a list variable.
+    
+        :param Variable list_to_change: List to change
+        :param list[ArgValue] | ArgValue value_to_remove: Value(s) to remove
+        :param str items_to_remove: Items to remove
+        
+        """
+        return CodeBlock.new_action('set_var', 'RemoveListValue', (list_to_change, value_to_remove,), {'Items to remove': items_to_remove})
+
+    @staticmethod
+    def BytesToString(result: Variable, byte_to_convert: list[Number | int] | Number | int, signed: Literal["True", "False"]="True", charset: Literal["UTF-8", "ASCII"]="UTF-8", ):
+        """
+        Converts a list of numbers representing bytes to a string.
+    
+        :param Variable result: Variable to set
+        :param list[Number | int] | Number | int byte_to_convert: Byte(s) to convert
+        :param str signed: Signed
+        :param str charset: Charset
+        
+        """
+        return CodeBlock.new_action('set_var', 'BytesToString', (result, byte_to_convert,), {'Signed': signed, 'Charset': charset})
+
+    @staticmethod
+    def ShiftAllDirections(result: Variable, location_to_shift: Location | None=None, forwards_change: Number | None=None, upwards_change: Number | None=None, sideways_change: Number | None=None, ):
+        """
+        Shifts a location in multiple directions based on its rotation.
+    
+        :param Variable result: Variable to set
+        :param Location | None location_to_shift: Location to shift (optional)
+        :param Number | None forwards_change: Forwards change (optional)
+        :param Number | None upwards_change: Upwards change (optional)
+        :param Number | None sideways_change: Sideways change (-L / +R) (optional)
+        
+        """
+        return CodeBlock.new_action('set_var', 'ShiftAllDirections', (result, location_to_shift, forwards_change, upwards_change, sideways_change,), {})
+
+    @staticmethod
+    def ValueNoise(result: Variable, noise_location: Location, frequency: Number | None=None, marbling: Number | None=None, octaves: Number | None=None, lacunarity: Number | None=None, gain: Number | None=None, warping: Number | None=None, resonance: Number | None=None, domains: Number | None=None, domain_lacunarity: Number | None=None, domain_gain: Number | None=None, generation_seed: Number | None=None, dimensions: Literal["3D", "2D"]="3D", domain_fractal: Literal["Progressive", "Independent"]="Progressive", return_type: Literal["Value", "Cubic"]="Value", ):
+        """
+        Gets value noise: A type of noise based on a lattice of random values.
+    
+        :param Variable result: Variable to set
+        :param Location noise_location: Noise location
+        :param Number | None frequency: Frequency (optional) (Modifies the scale that the noise generates at. Default = 1)
+        :param Number | None marbling: Marbling (optional) (Every 0.5 adds an additional ring to the noise output. Default = 0.5)
+        :param Number | None octaves: Octaves (optional) (Adds an additional layer of value noise to the output. 1-16, Default = 1)
+        :param Number | None lacunarity: Lacunarity (optional) (Every time a new octave is added, the frequency is multiplied by this value. Default = 1.5)
+        :param Number | None gain: Gain (optional) (Every time a new octave is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None warping: Warping (optional) (Distorts the noise output. Default = 0)
+        :param Number | None resonance: Resonance (optional) (Modifies the frequency of warping. Default = 1)
+        :param Number | None domains: Domains (optional) (Adds an additional layer of warping to the output. Default = 1)
+        :param Number | None domain_lacunarity: Domain lacunarity (optional) (Every time a new domain is added, the resonance is multiplied by this value. Default = 1.5)
+        :param Number | None domain_gain: Domain gain (optional) (Every time a new domain is added, the weight of it is multiplied by this value. Default = 0.5)
+        :param Number | None generation_seed: Generation seed (optional)
+        :param str dimensions: Dimensions
+    
+            - 3D: Generates using the X, Y and Z axis.
+            - 2D: Generates using the X and Z axis only.
+        :param str domain_fractal: Domain Fractal
+    
+            - Progressive: Domains are calculated on top of one another.
+            - Independent: Domains are calculated in isolation.
+        :param str return_type: Return Type
+    
+            - Value: Provides the average of a lattice (grid) of random values.
+            - Cubic: Provides the bicubic average of a lattice of random values.  The use of bicubic averaging produces a smoother result than the averaging used in Value Noise.
+        
+        """
+        return CodeBlock.new_action('set_var', 'ValueNoise', (result, noise_location, frequency, marbling, octaves, lacunarity, gain, warping, resonance, domains, domain_lacunarity, domain_gain, generation_seed,), {'Dimensions': dimensions, 'Domain Fractal': domain_fractal, 'Return Type': return_type})
+
+    @staticmethod
+    def WebResponse(variable_to_store_response: Variable, url_to_request: DFString, content_body: DFString | None=None, request_method: Literal["Post", "Get", "Put", "Delete"]="Post", content_type: Literal["text/plain", "application/json"]="text/plain", code_flow: Literal["Synchronous", "Asynchronous"]="Synchronous", ):
+        """
+        Gets the response from a web request.  The output dictionary has 3 keys: "status": The HTTP status code. "statusText": The HTTP status message. And "body", or "json" if the response is JSON.
+    
+        :param Variable variable_to_store_response: Variable to store response
+        :param DFString url_to_request: URL to request
+        :param DFString | None content_body: Content body (optional)
+        :param str request_method: Request Method
+        :param str content_type: Content Type
+        :param str code_flow: Code Flow
+    
+            - Synchronous: Waits for the response before continuing.
+            - Asynchronous: Continues running code immediately. Variable will be set when the response is received.
+        
+        """
+        return CodeBlock.new_action('set_var', 'WebResponse', (variable_to_store_response, url_to_request, content_body,), {'Request Method': request_method, 'Content Type': content_type, 'Code Flow': code_flow})
+
+    @staticmethod
+    def SetAllItemTags(result: Variable, item_to_change: Item | None=None, tags: ArgValue=None, ):
+        """
+        Sets custom tags on an item based on the input dictionary.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param ArgValue tags: Tags
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetAllItemTags', (result, item_to_change, tags,), {})
+
+    @staticmethod
+    def SetCanPlaceOn(result: Variable, item_to_change: Item | None=None, placeable_blocks: list[Item] | Item=None, ):
+        """
+        Sets which blocks an item can be placed on in Adventure Mode.
+    
+        :param Variable result: Variable to set
+        :param Item | None item_to_change: Item to change (optional)
+        :param list[Item] | Item placeable_blocks: Placeable blocks
+        
+        """
+        return CodeBlock.new_action('set_var', 'SetCanPlaceOn', (result, item_to_change, placeable_blocks,), {})
+
+    @staticmethod
+    def GetBlockType(result: Variable, block_location: Location, return_value_type: Literal["Block ID (oak_log)", "Block name (Oak Log)", "Item"]="Block ID (oak_log)", ):
+        """
+        Gets a block's material at a location.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        :param str return_value_type: Return Value Type
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockType', (result, block_location,), {'Return Value Type': return_value_type})
+
+    @staticmethod
+    def GetDictValue(result: Variable, dictionary_to_pull_from: ArgValue, key: DFString, ):
+        """
+        Get a dictionary variable's value for a key.
+    
+        :param Variable result: Variable to set
+        :param ArgValue dictionary_to_pull_from: Dictionary to pull from
+        :param DFString key: Key
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetDictValue', (result, dictionary_to_pull_from, key,), {})
+
+    @staticmethod
+    def ContainerLock(result: Variable, container_location: Location, ):
+        """
+        Gets a container's lock key at a location.
+    
+        :param Variable result: Variable to set
+        :param Location container_location: Container location
+        
+        """
+        return CodeBlock.new_action('set_var', 'ContainerLock', (result, container_location,), {})
+
+    @staticmethod
+    def GetItemWeapon(result: Variable, item: Item, weapon_property: Literal["Durability reduction per attack", "Seconds to disable blocking for"]="Durability reduction per attack", ):
+        """
+        Gets an item's weapon property.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get property of
+        :param str weapon_property: Weapon Property
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetItemWeapon', (result, item,), {'Weapon Property': weapon_property})
+
+    @staticmethod
+    def GetBlockPower(result: Variable, block_location: Location, ):
+        """
+        Gets a block's redstone power level.
+    
+        :param Variable result: Variable to set
+        :param Location block_location: Block location
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetBlockPower', (result, block_location,), {})
+
+    @staticmethod
+    def GetVectorLength(result: Variable, vector: DFVector, length_type: Literal["Length", "Length Squared"]="Length", ):
+        """
+        Gets a vector's length.
+    
+        :param Variable result: Variable to set
+        :param DFVector vector: Vector to get length of
+        :param str length_type: Length Type
+    
+            - Length: √(x² + y² + z²)
+            - Length Squared: x² + y² + z²
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetVectorLength', (result, vector,), {'Length Type': length_type})
+
+    @staticmethod
+    def ContentLength(result: Variable, text_to_measure: DFText, ):
+        """
+        Gets the number of characters a styled text has, ignoring all formatting tags.
+    
+        :param Variable result: Variable to set
+        :param DFText text_to_measure: Text to measure
+        
+        """
+        return CodeBlock.new_action('set_var', 'ContentLength', (result, text_to_measure,), {})
+
+    @staticmethod
+    def StringToBytes(result: Variable, string_to_convert: DFString, signed: Literal["True", "False"]="True", charset: Literal["UTF-8", "ASCII"]="UTF-8", ):
+        """
+        Converts a string to a list of numbers representing bytes.
+    
+        :param Variable result: Variable to set
+        :param DFString string_to_convert: String to convert
+        :param str signed: Signed
+        :param str charset: Charset
+        
+        """
+        return CodeBlock.new_action('set_var', 'StringToBytes', (result, string_to_convert,), {'Signed': signed, 'Charset': charset})
+
+    @staticmethod
+    def GetMaxAmount(result: Variable, item: Item, ):
+        """
+        Gets an item's maximum stack size.
+    
+        :param Variable result: Variable to set
+        :param Item item: Item to get maximum stack size of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetMaxAmount', (result, item,), {})
+
+    @staticmethod
+    def GetParticleSize(result: Variable, effect: Particle, ):
+        """
+        Gets a particle effect's particle size.
+    
+        :param Variable result: Variable to set
+        :param Particle effect: Effect to get size of
+        
+        """
+        return CodeBlock.new_action('set_var', 'GetParticleSize', (result, effect,), {})
+
+SV = SetVariable
@@ -16,6 +16,7 @@ class Particle(CodeItem):
     """
     Represents a DiamondFire particle object.
     """
+    __slots__ = ('particle_data',)
     type = 'part'
     
     def __init__(
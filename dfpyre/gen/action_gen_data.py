@@ -10,6 +10,8 @@ from dfpyre.util.util import to_valid_identifier
 
 
 OUTPUT_PATH = 'dfpyre/export/action_classes.py'
+CLASS_OUTPUT_DIR = 'dfpyre/export/actions'
+CLASS_MODULE_PACKAGE = 'dfpyre.export.actions'
 
 
 EVENT_TEMPLATE = load_data_file('method_templates/event.txt')
@@ -142,14 +144,15 @@ PARAM_NAME_REPLACEMENTS = {
 EXPORTED_NAMES = [t[0] for t in CODEBLOCK_LOOKUP.values()] + [a for aliases in CLASS_ALIASES.values() for a in aliases]
 
 
+GENERATED_HEADER = f'# Auto generated by pyre {datetime.now(timezone.utc).isoformat()}'
+
 IMPORTS = [
-    f'# Auto generated by pyre {datetime.now(timezone.utc).isoformat()}',
+    GENERATED_HEADER,
     'from typing import Literal',
     'from dfpyre.core.codeblock import CodeBlock, Target, DEFAULT_TARGET',
     'from dfpyre.core.items import ArgValue, Item, String as DFString, Text as DFText, Number, Variable, Location, Sound, Particle, Potion, Vector as DFVector',
     'from dfpyre.export.block_functions import assemble_template, add_brackets',
-    'from dfpyre.gen.action_literals import SUBACTION',
-    f"__all__ = {EXPORTED_NAMES}"
+    'from dfpyre.gen.action_literals import SUBACTION'
 ]
 
 
@@ -1,16 +1,18 @@
 """
 Generates Codeblock classes with static methods for each action.
+Each class is written to its own module so it can be imported lazily.
 """
 
+import os
 from dataclasses import dataclass
 import re
 from num2words import num2words
-from dfpyre.core.actiondump import ACTIONDUMP, ActionArgument, ActionTag, TagOption
+from dfpyre.core.actiondump import ACTIONDUMP, ActionArgument, ActionTag, TagOption, ActionDataEntry
 from dfpyre.util.util import flatten, to_valid_identifier_noparen
 from dfpyre.gen.gen_data import INDENT
 from dfpyre.gen.action_gen_data import (
-    CODEBLOCK_LOOKUP, PARAM_NAME_REPLACEMENTS, PARAM_TYPE_LOOKUP, TEMPLATE_OVERRIDES, OUTPUT_PATH, IMPORTS, CLASS_ALIASES,
-    get_method_name_and_aliases
+    CODEBLOCK_LOOKUP, PARAM_NAME_REPLACEMENTS, PARAM_TYPE_LOOKUP, TEMPLATE_OVERRIDES, OUTPUT_PATH, CLASS_OUTPUT_DIR, CLASS_MODULE_PACKAGE,
+    GENERATED_HEADER, IMPORTS, CLASS_ALIASES, EXPORTED_NAMES, get_method_name_and_aliases
 )
 
 
@@ -22,6 +24,7 @@ class ParameterData:
     notes: str
     is_optional: bool
     has_none: bool
+    can_have_default: bool = True
 
     def get_varname(self) -> str:
         if self.description == 'Variable to set':
@@ -62,7 +65,7 @@ class ParameterData:
 
     def get_param_string(self) -> str:
         param_str = f'{self.get_varname()}: {self.types}'
-        if self.has_none or self.is_optional:
+        if self.can_have_default and (self.has_none or self.is_optional):
             param_str += '=None'
         return param_str
 
@@ -124,6 +127,13 @@ def parse_parameters(action_arguments: list[tuple[ActionArgument, ...]]) -> list
             params_with_name = param_name_lookup[param.name]
             param_index = params_with_name.index(param)
             param.name += str(param_index + 1)
+    
+    # A parameter can only have a default value if every parameter after it has one too
+    required_param_follows = False
+    for param in reversed(parameter_list):
+        param.can_have_default = not required_param_follows
+        if not (param.has_none or param.is_optional):
+            required_param_follows = True
 
     return parameter_list
 
@@ -158,119 +168,171 @@ def parse_tags(action_tags: list[ActionTag]) -> list[TagData]:
     return [TagData(t.name, t.options, t.default) for t in action_tags]
 
 
-def generate_actions():
-    generated_lines: list[str] = IMPORTS.copy()
-    generated_lines += ['']
+def generate_class_lines(codeblock_type: str, actions: dict[str, ActionDataEntry]) -> list[str]:
+    generated_lines: list[str] = []
+    class_name, method_template = CODEBLOCK_LOOKUP[codeblock_type]
+
+    class_docstring = ACTIONDUMP.codeblock_data[codeblock_type].description
+    class_def_lines = [
+        f'class {class_name}:',
+        f'{INDENT}"""',
+        f'{INDENT}{class_docstring}',
+        f'{INDENT}"""',
+        ''
+    ]
+    generated_lines += class_def_lines
+
+    for action_name, action_data in actions.items():
+        if action_data.is_deprecated:
+            # Skip deprecated actions
+            continue
+        
+        # Get method name
+        method_data = get_method_name_and_aliases(codeblock_type, action_name)
+        if method_data is None:
+            continue
+        method_name, method_aliases = method_data
+
+        # Choose method template to use
+        current_method_template = method_template
+        template_overrides = TEMPLATE_OVERRIDES.get(codeblock_type)
+        if template_overrides:
+            override_template = template_overrides.get(action_name)
+            if override_template is not None:
+                current_method_template = override_template
+        
+        # Get description
+        action_description = action_data.description or ''
+        if action_description:
+            action_description = f'{INDENT}{action_description}\n\n'
+        
+        # Get parameter data
+        parameters = parse_parameters(action_data.arguments)
+
+        parameter_list = ', '.join(p.get_param_string() for p in parameters)
+        if parameter_list:
+            parameter_list += ', '
+        
+        parameter_names = ', '.join(p.get_varname() for p in parameters)
+        if parameter_names:
+            parameter_names += ','
+        
+        
+        # Get tag data
+        tags = parse_tags(action_data.tags)
+
+        param_name_set = set(p.get_varname() for p in parameters)
+        tag_parameter_list = ', '.join(t.get_param_string(param_name_set) for t in tags)
+        if tag_parameter_list:
+            tag_parameter_list = f'{tag_parameter_list}, '
+        
+        tag_values = ', '.join(f"'{t.name}': {t.get_varname(param_name_set)}" for t in tags)
+
+        # Create docstrings
+        docstring_list = [p.get_docstring() for p in parameters] + [t.get_docstring(param_name_set) for t in tags]
+        parameter_docstrings = '\n'.join(INDENT + s for s in docstring_list)
+
+        if parameter_docstrings:
+            parameter_docstrings += '\n'
+        
+        if action_description or parameter_docstrings:
+            # Fix indentation
+            parameter_docstrings += INDENT
+
+        # Assemble the method
+        method_code = current_method_template.format(
+            method_name = method_name,
+            parameter_list = parameter_list,
+            parameter_names = parameter_names,
+            parameter_docstrings = parameter_docstrings,
+            tag_parameter_list = tag_parameter_list,
+            tag_values = tag_values,
+            codeblock_type = codeblock_type,
+            action_name = action_name,
+            action_description = action_description
+        )
+
+        method_lines = [f'@staticmethod']
+        method_lines += method_code.split('\n')
+
+        # Add aliases
+        for alias in method_aliases:
+            method_lines += [f'{alias} = {method_name}']
+        
+        method_lines = [INDENT + l for l in method_lines]
+        method_lines += ['']
+        generated_lines += method_lines
+    
+    # Add class aliases (e.g. "PE", "EE", etc.)
+    class_aliases = CLASS_ALIASES.get(codeblock_type) or []
+    for alias in class_aliases:
+        alias_def = f'{alias} = {class_name}'
+        generated_lines.append(alias_def)
     
+    return generated_lines
+
+
+def generate_export_lines(class_modules: dict[str, str]) -> list[str]:
+    """
+    Generates a module that imports each action class from its own module
+    the first time it is accessed.
+    """
+    module_names: dict[str, list[str]] = {}
+    for name, module in class_modules.items():
+        module_names.setdefault(module, []).append(name)
+    type_checking_imports = [f'{INDENT}from {CLASS_MODULE_PACKAGE}.{m} import {", ".join(n)}' for m, n in module_names.items()]
+    class_module_entries = [f"{INDENT}'{n}': '{m}'," for n, m in class_modules.items()]
+    return [
+        GENERATED_HEADER,
+        'import importlib',
+        'from typing import TYPE_CHECKING',
+        f'__all__ = {EXPORTED_NAMES}',
+        '',
+        '_CLASS_MODULES = {',
+        *class_module_entries,
+        '}',
+        '',
+        'if TYPE_CHECKING:',
+        *type_checking_imports,
+        '',
+        '',
+        'def __getattr__(name: str):',
+        f'{INDENT}module_name = _CLASS_MODULES.get(name)',
+        f'{INDENT}if module_name is None:',
+        f"{INDENT*2}raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')",
+        f"{INDENT}value = getattr(importlib.import_module(f'{CLASS_MODULE_PACKAGE}.{{module_name}}'), name)",
+        f'{INDENT}globals()[name] = value',
+        f'{INDENT}return value',
+        '',
+        '',
+        'def __dir__() -> list[str]:',
+        f'{INDENT}return sorted(set(globals()) | set(__all__))'
+    ]
+
+
+def generate_actions():
+    class_modules: dict[str, str] = {}
     for codeblock_type, actions in ACTIONDUMP.action_data.items():
-        codeblock_data = CODEBLOCK_LOOKUP.get(codeblock_type)
-        if codeblock_data is None:
+        if codeblock_type not in CODEBLOCK_LOOKUP:
             continue
-            
-        class_name, method_template = codeblock_data
-
-        class_docstring = ACTIONDUMP.codeblock_data[codeblock_type].description
-        class_def_lines = [
-            f'class {class_name}:',
-            f'{INDENT}"""',
-            f'{INDENT}{class_docstring}',
-            f'{INDENT}"""',
-            ''
-        ]
-        generated_lines += class_def_lines
-
-        for action_name, action_data in actions.items():
-            if action_data.is_deprecated:
-                # Skip deprecated actions
-                continue
-            
-            # Get method name
-            method_data = get_method_name_and_aliases(codeblock_type, action_name)
-            if method_data is None:
-                continue
-            method_name, method_aliases = method_data
-
-            # Choose method template to use
-            current_method_template = method_template
-            template_overrides = TEMPLATE_OVERRIDES.get(codeblock_type)
-            if template_overrides:
-                override_template = template_overrides.get(action_name)
-                if override_template is not None:
-                    current_method_template = override_template
-            
-            # Get description
-            action_description = action_data.description or ''
-            if action_description:
-                action_description = f'{INDENT}{action_description}\n\n'
-            
-            # Get parameter data
-            parameters = parse_parameters(action_data.arguments)
-
-            parameter_list = ', '.join(p.get_param_string() for p in parameters)
-            if parameter_list:
-                parameter_list += ', '
-            
-            parameter_names = ', '.join(p.get_varname() for p in parameters)
-            if parameter_names:
-                parameter_names += ','
-            
-            
-            # Get tag data
-            tags = parse_tags(action_data.tags)
-
-            param_name_set = set(p.get_varname() for p in parameters)
-            tag_parameter_list = ', '.join(t.get_param_string(param_name_set) for t in tags)
-            if tag_parameter_list:
-                tag_parameter_list = f'{tag_parameter_list}, '
-            
-            tag_values = ', '.join(f"'{t.name}': {t.get_varname(param_name_set)}" for t in tags)
-
-            # Create docstrings
-            docstring_list = [p.get_docstring() for p in parameters] + [t.get_docstring(param_name_set) for t in tags]
-            parameter_docstrings = '\n'.join(INDENT + s for s in docstring_list)
-
-            if parameter_docstrings:
-                parameter_docstrings += '\n'
-            
-            if action_description or parameter_docstrings:
-                # Fix indentation
-                parameter_docstrings += INDENT
-
-            # Assemble the method
-            method_code = current_method_template.format(
-                method_name = method_name,
-                parameter_list = parameter_list,
-                parameter_names = parameter_names,
-                parameter_docstrings = parameter_docstrings,
-                tag_parameter_list = tag_parameter_list,
-                tag_values = tag_values,
-                codeblock_type = codeblock_type,
-                action_name = action_name,
-                action_description = action_description
-            )
-
-            method_lines = [f'@staticmethod']
-            method_lines += method_code.split('\n')
-
-            # Add aliases
-            for alias in method_aliases:
-                method_lines += [f'{alias} = {method_name}']
-            
-            method_lines = [INDENT + l for l in method_lines]
-            method_lines += ['']
-            generated_lines += method_lines
         
-        # Add class aliases (e.g. "PE", "EE", etc.)
-        class_aliases = CLASS_ALIASES.get(codeblock_type) or []
-        for alias in class_aliases:
-            alias_def = f'{alias} = {class_name}'
-            generated_lines.append(alias_def)
+        class_name = CODEBLOCK_LOOKUP[codeblock_type][0]
+        exported_names = [class_name] + (CLASS_ALIASES.get(codeblock_type) or [])
+        for name in exported_names:
+            class_modules[name] = codeblock_type
+        
+        generated_lines = IMPORTS.copy()
+        generated_lines += [f'__all__ = {exported_names}', '']
+        generated_lines += generate_class_lines(codeblock_type, actions)
 
+        class_output_path = os.path.join(CLASS_OUTPUT_DIR, f'{codeblock_type}.py')
+        with open(class_output_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(generated_lines) + '\n')
     
     with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(generated_lines) + '\n')
-        
+        f.write('\n'.join(generate_export_lines(class_modules)) + '\n')
+
 
 if __name__ == '__main__':
     generate_actions()
-    print(f'Wrote Codeblock action classes to {OUTPUT_PATH}.')
+    print(f'Wrote Codeblock action classes to {CLASS_OUTPUT_DIR} and {OUTPUT_PATH}.')
@@ -0,0 +1,109 @@
+"""
+Finds the differences between two versions of a template by comparing hashes of their built codeblocks.
+"""
+
+import hashlib
+from difflib import SequenceMatcher
+from dataclasses import dataclass
+from dfpyre.core.codeblock import CodeBlock
+
+
+BLOCK_HASH_SIZE = 16
+
+
+def get_block_hash(block_json: str) -> bytes:
+    """
+    Returns a hash of the built JSON of a codeblock.
+    """
+    return hashlib.blake2b(block_json.encode(), digest_size=BLOCK_HASH_SIZE).digest()
+
+
+def diff_block_hashes(old_hashes: list[bytes], new_hashes: list[bytes]) -> list[tuple[str, int, int, int, int]]:
+    """
+    Returns the `difflib` opcodes that turn `old_hashes` into `new_hashes`, without the `equal` opcodes.
+    """
+    # Small changes to large templates are common, so the matching start and end are skipped first
+    max_match_length = min(len(old_hashes), len(new_hashes))
+    prefix_length = 0
+    while prefix_length < max_match_length and old_hashes[prefix_length] == new_hashes[prefix_length]:
+        prefix_length += 1
+    suffix_length = 0
+    while suffix_length < max_match_length - prefix_length and old_hashes[-suffix_length-1] == new_hashes[-suffix_length-1]:
+        suffix_length += 1
+
+    old_middle = old_hashes[prefix_length:len(old_hashes)-suffix_length]
+    new_middle = new_hashes[prefix_length:len(new_hashes)-suffix_length]
+    matcher = SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    return [
+        (tag, i1+prefix_length, i2+prefix_length, j1+prefix_length, j2+prefix_length)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal'
+    ]
+
+
+@dataclass
+class TemplateDiff:
+    """
+    The codeblocks that were inserted, removed or changed between an old and a new version of a template.
+    """
+    opcodes: list[tuple[str, int, int, int, int]]  # `difflib` opcodes from the old codeblocks to the new ones
+    new_codeblocks: list[CodeBlock]
+
+    def __bool__(self) -> bool:
+        return bool(self.opcodes)
+
+
+    @property
+    def inserted(self) -> list[int]:
+        """
+        The indices of the new codeblocks that were inserted.
+        """
+        inserted = []
+        for tag, i1, i2, j1, j2 in self.opcodes:
+            if tag == 'insert':
+                inserted.extend(range(j1, j2))
+            elif tag == 'replace' and j2 - j1 > i2 - i1:
+                inserted.extend(range(j1 + i2 - i1, j2))
+        return inserted
+
+
+    @property
+    def removed(self) -> list[int]:
+        """
+        The indices of the old codeblocks that were removed.
+        """
+        removed = []
+        for tag, i1, i2, j1, j2 in self.opcodes:
+            if tag == 'delete':
+                removed.extend(range(i1, i2))
+            elif tag == 'replace' and i2 - i1 > j2 - j1:
+                removed.extend(range(i1 + j2 - j1, i2))
+        return removed
+
+
+    @property
+    def changed(self) -> list[tuple[int, int]]:
+        """
+        The indices of the old codeblocks that were changed, paired with the indices of their new versions.
+        """
+        changed = []
+        for tag, i1, i2, j1, j2 in self.opcodes:
+            if tag == 'replace':
+                changed.extend(zip(range(i1, i2), range(j1, j2)))
+        return changed
+
+
+    def apply(self, old_codeblocks: list[CodeBlock]) -> list[CodeBlock]:
+        """
+        Returns the new codeblocks, made by patching the old ones.
+        Codeblocks that did not change are reused from `old_codeblocks`.
+
+        :param list[CodeBlock] old_codeblocks: The codeblocks of the old template.
+        """
+        patched_codeblocks = []
+        old_index = 0
+        for _, i1, i2, j1, j2 in self.opcodes:
+            patched_codeblocks.extend(old_codeblocks[old_index:i1])
+            patched_codeblocks.extend(self.new_codeblocks[j1:j2])
+            old_index = i2
+        patched_codeblocks.extend(old_codeblocks[old_index:])
+        return patched_codeblocks
@@ -1,4 +1,6 @@
+import io
 import dataclasses
+from typing import Callable, TextIO
 from dfpyre.util.util import is_number, to_valid_identifier
 from dfpyre.core.items import *
 from dfpyre.core.actiondump import get_default_tags
@@ -61,8 +63,9 @@ class GeneratorFlags:
     build_and_send: bool
 
 
-def item_to_string(class_name: str, i: Item, slot_argument: str):
+def item_to_string(flags: GeneratorFlags, i: Item, class_name: str, slot_argument: str):
     i.nbt.pop('DF_NBT')
+    i.invalidate()
     stripped_id = i.get_id().replace('minecraft:', '')
     if set(i.nbt.keys()) == {'id', 'count'}:
         if i.get_count() == 1:
@@ -81,7 +84,7 @@ def str_literal(s: str) -> str:
     return "'" + escape(s) + "'"
 
 
-def particle_to_string(class_name: str, particle_item: Particle, slot_argument: str):
+def particle_to_string(flags: GeneratorFlags, particle_item: Particle, class_name: str, slot_argument: str):
     argument_list: list[str] = []
 
     def convert_color(color_int: int):
@@ -117,79 +120,108 @@ def particle_to_string(class_name: str, particle_item: Particle, slot_argument:
     return f'{class_name}.{particle_name}({argument_list_joined}{slot_argument})'
 
 
-def argument_item_to_string(flags: GeneratorFlags, arg_item: CodeItem) -> str: 
-    class_name = arg_item.__class__.__name__
-    has_slot = arg_item.slot is not None and flags.preserve_slots
-    slot_argument = f', slot={arg_item.slot}' if has_slot else ''
+def string_item_to_string(flags: GeneratorFlags, arg_item: String|Text, class_name: str, slot_argument: str) -> str:
+    literal = str_literal(arg_item.value)
+    # Only String, the default, is written as a literal, so scripts do not depend on the string conversion they were made with
+    if not slot_argument and flags.literal_shorthand and type(arg_item) is String:
+        return literal
+    return f"{class_name}({literal}{slot_argument})"
+
+
+def number_to_string(flags: GeneratorFlags, arg_item: Number, class_name: str, slot_argument: str) -> str:
+    if not is_number(str(arg_item.value)):  # Probably a math expression
+        return f"{class_name}({str_literal(arg_item.value)}{slot_argument})"
+    if not slot_argument and flags.literal_shorthand:
+        return str(arg_item.value)
+    return f'{class_name}({arg_item.value}{slot_argument})'
+
+
+def location_to_string(flags: GeneratorFlags, arg_item: Location, class_name: str, slot_argument: str) -> str:
+    loc_components = [arg_item.x, arg_item.y, arg_item.z]
+    if arg_item.pitch != 0:
+        loc_components.append(arg_item.pitch)
+    if arg_item.yaw != 0:
+        loc_components.append(arg_item.yaw)
+    return f'{class_name}({", ".join(str(c) for c in loc_components)}{slot_argument})'
+
+
+def variable_to_string(flags: GeneratorFlags, arg_item: Variable, class_name: str, slot_argument: str) -> str:
+    name = escape(arg_item.name)
+    if not slot_argument and flags.var_shorthand:
+        return f"'${VAR_SCOPE_LOOKUP[arg_item.scope]} {name}'"
+    if arg_item.scope == 'unsaved':
+        return f"{class_name}('{name}'{slot_argument})"
+    return f"{class_name}('{name}', '{arg_item.scope}'{slot_argument})"
+
+
+def sound_to_string(flags: GeneratorFlags, arg_item: Sound, class_name: str, slot_argument: str) -> str:
+    return f"{class_name}({str_literal(arg_item.name)}, {arg_item.pitch}, {arg_item.vol}{slot_argument})"
+
+
+def potion_to_string(flags: GeneratorFlags, arg_item: Potion, class_name: str, slot_argument: str) -> str:
+    return f"{class_name}({str_literal(arg_item.name)}, {arg_item.dur}, {arg_item.amp}{slot_argument})"
+
+
+def game_value_to_string(flags: GeneratorFlags, arg_item: GameValue, class_name: str, slot_argument: str) -> str:
+    name = str_literal(arg_item.name)
+    if arg_item.target == 'Default':
+        return f"{class_name}({name}{slot_argument})"
+    return f"{class_name}({name}, '{arg_item.target}'{slot_argument})"
+
+
+def parameter_to_string(flags: GeneratorFlags, arg_item: Parameter, class_name: str, slot_argument: str) -> str:
+    param_type_class_name = arg_item.param_type.__class__.__name__
+    param_args = [str_literal(arg_item.name), f'{param_type_class_name}.{arg_item.param_type.name}']
+    if arg_item.plural:
+        param_args.append('plural=True')
+    if arg_item.optional:
+        param_args.append('optional=True')
+        if arg_item.default_value is not None:
+            param_args.append(f'default_value={argument_item_to_string(flags, arg_item.default_value)}')
+    if arg_item.description:
+        param_args.append(f"description={str_literal(arg_item.description)}")
+    if arg_item.note:
+        param_args.append(f"note={str_literal(arg_item.note)}")
+    return f'{class_name}({", ".join(param_args)}{slot_argument})'
+
+
+def vector_to_string(flags: GeneratorFlags, arg_item: Vector, class_name: str, slot_argument: str) -> str:
+    return f'{class_name}({arg_item.x}, {arg_item.y}, {arg_item.z}{slot_argument})'
+
+
+# Converts each item type into the Python code that creates it
+ITEM_STRING_CONVERTERS: dict[type, Callable[[GeneratorFlags, CodeItem, str, str], str]] = {
+    Item: item_to_string,
+    String: string_item_to_string,
+    Text: string_item_to_string,
+    Number: number_to_string,
+    Location: location_to_string,
+    Variable: variable_to_string,
+    Sound: sound_to_string,
+    Particle: particle_to_string,
+    Potion: potion_to_string,
+    GameValue: game_value_to_string,
+    Parameter: parameter_to_string,
+    Vector: vector_to_string,
+}
 
-    if isinstance(arg_item, Item):
-        return item_to_string(class_name, arg_item, slot_argument)
-    
-    if isinstance(arg_item, String):
-        literal = str_literal(arg_item.value)
-        if not has_slot and flags.literal_shorthand:
-            return literal
-        return f"{class_name}({literal}{slot_argument})"
-    
-    if isinstance(arg_item, Text):
-        literal = str_literal(arg_item.value)
-        return f"{class_name}({literal}{slot_argument})"
-    
-    if isinstance(arg_item, Number):
-        if not is_number(str(arg_item.value)):  # Probably a math expression
-            return f"{class_name}({str_literal(arg_item.value)}{slot_argument})"
-        if not has_slot and flags.literal_shorthand:
-            return str(arg_item.value)
-        return f'{class_name}({arg_item.value}{slot_argument})'
-    
-    if isinstance(arg_item, Location):
-        loc_components = [arg_item.x, arg_item.y, arg_item.z]
-        if arg_item.pitch != 0:
-            loc_components.append(arg_item.pitch)
-        if arg_item.yaw != 0:
-            loc_components.append(arg_item.yaw)
-        return f'{class_name}({", ".join(str(c) for c in loc_components)}{slot_argument})'
-    
-    if isinstance(arg_item, Variable):
-        name = escape(arg_item.name)
-        if not has_slot and flags.var_shorthand:
-            return f"'${VAR_SCOPE_LOOKUP[arg_item.scope]} {name}'"
-        if arg_item.scope == 'unsaved':
-            return f"{class_name}('{name}'{slot_argument})"
-        return f"{class_name}('{name}', '{arg_item.scope}'{slot_argument})"
-    
-    if isinstance(arg_item, Sound):
-        return f"{class_name}({str_literal(arg_item.name)}, {arg_item.pitch}, {arg_item.vol}{slot_argument})"
-    
-    if isinstance(arg_item, Particle):
-        return particle_to_string(class_name, arg_item, slot_argument)
-    
-    if isinstance(arg_item, Potion):
-        return f"{class_name}({str_literal(arg_item.name)}, {arg_item.dur}, {arg_item.amp}{slot_argument})"
-    
-    if isinstance(arg_item, GameValue):
-        name = str_literal(arg_item.name)
-        if arg_item.target == 'Default':
-            return f"{class_name}({name}{slot_argument})"
-        return f"{class_name}({name}, '{arg_item.target}'{slot_argument})"
-    
-    if isinstance(arg_item, Parameter):
-        param_type_class_name = arg_item.param_type.__class__.__name__
-        param_args = [str_literal(arg_item.name), f'{param_type_class_name}.{arg_item.param_type.name}']
-        if arg_item.plural:
-            param_args.append('plural=True')
-        if arg_item.optional:
-            param_args.append('optional=True')
-            if arg_item.default_value is not None:
-                param_args.append(f'default_value={argument_item_to_string(flags, arg_item.default_value)}')
-        if arg_item.description:
-            param_args.append(f"description={str_literal(arg_item.description)}")
-        if arg_item.note:
-            param_args.append(f"note={str_literal(arg_item.note)}")
-        return f'{class_name}({", ".join(param_args)}{slot_argument})'
-    
-    if isinstance(arg_item, Vector):
-        return f'{class_name}({arg_item.x}, {arg_item.y}, {arg_item.z}{slot_argument})'
+
+def get_item_string_converter(item_type: type) -> Callable[[GeneratorFlags, CodeItem, str, str], str]|None:
+    converter = ITEM_STRING_CONVERTERS.get(item_type)
+    if converter is None:
+        # Subclasses use the converter of their closest base class
+        converter = next((ITEM_STRING_CONVERTERS[t] for t in item_type.__mro__ if t in ITEM_STRING_CONVERTERS), None)
+        if converter is not None:
+            ITEM_STRING_CONVERTERS[item_type] = converter
+    return converter
+
+
+def argument_item_to_string(flags: GeneratorFlags, arg_item: CodeItem) -> str|None:
+    converter = get_item_string_converter(type(arg_item))
+    if converter is None:
+        return None
+    slot_argument = f', slot={arg_item.slot}' if arg_item.slot is not None and flags.preserve_slots else ''
+    return converter(flags, arg_item, arg_item.__class__.__name__, slot_argument)
 
 
 def string_to_python_name(string: str) -> str:
@@ -200,24 +232,60 @@ def string_to_python_name(string: str) -> str:
     return ''.join(c if c.isalnum() else '_' for c in string)
 
 
-def add_script_line(flags: GeneratorFlags, script_lines: list[str], indent_level: int, line: str, add_comma: bool=True):
-    added_line = ' '*flags.indent_size*indent_level + line
-    if add_comma and indent_level > 0:
-        added_line += ','
-    script_lines.append(added_line)
-
-
-def generate_script(codeblocks: list[CodeBlock], flags: GeneratorFlags) -> str:
+class ScriptWriter:
+    """
+    Writes the lines of a script to a stream in a single pass.
+    The last line is held back until the next one is written, so its trailing comma
+    can be left out if it turns out to be the last item in a list.
+    """
+    def __init__(self, stream: TextIO, indent_size: int):
+        self.stream = stream
+        self.indent_size = indent_size
+        self.pending_line: str|None = None
+        self.pending_comma = False
+        self.is_first_line = True
+
+
+    def write_line(self, indent_level: int, line: str, add_comma: bool=True):
+        self.flush()
+        self.pending_line = ' '*self.indent_size*indent_level + line
+        self.pending_comma = add_comma and indent_level > 0
+
+
+    def remove_comma_from_last_line(self):
+        self.pending_comma = False
+
+
+    def flush(self, suffix: str=''):
+        if self.pending_line is None:
+            return
+        if not self.is_first_line:
+            self.stream.write('\n')
+        self.stream.write(self.pending_line)
+        if self.pending_comma:
+            self.stream.write(',')
+        self.stream.write(suffix)
+        self.pending_line = None
+        self.is_first_line = False
+
+
+def generate_script(codeblocks: list[CodeBlock], flags: GeneratorFlags, stream: TextIO|None=None) -> str|None:
+    """
+    Generates a Python script that creates the given codeblocks.
+
+    :param TextIO|None stream: If given, the script is written to this stream instead of being returned.
+    """
+    if stream is None:
+        string_stream = io.StringIO()
+        generate_script(codeblocks, flags, string_stream)
+        return string_stream.getvalue()
+    
     indent_level = 0
-    script_lines = []
+    writer = ScriptWriter(stream, flags.indent_size)
     variable_assigned = False
 
     if flags.include_import:
-        script_lines.append(IMPORT_STATEMENT + '\n')
-        
-    def remove_comma_from_last_line():
-        if script_lines[-1].endswith(','):
-            script_lines[-1] = script_lines[-1][:-1]
+        writer.write_line(0, IMPORT_STATEMENT + '\n')
     
     def get_var_assignment_snippet() -> str:
         first_block_data = codeblocks[0].data
@@ -233,9 +301,9 @@ def generate_script(codeblocks: list[CodeBlock], flags: GeneratorFlags) -> str:
         # Handle closing brackets
         if codeblock.type == 'bracket':
             if codeblock.data['direct'] == 'close':
-                remove_comma_from_last_line()
+                writer.remove_comma_from_last_line()
                 indent_level -= 1
-                add_script_line(flags, script_lines, indent_level, '])')
+                writer.write_line(indent_level, '])')
             continue
 
         # Get codeblock function and set the action method
@@ -309,18 +377,15 @@ def generate_script(codeblocks: list[CodeBlock], flags: GeneratorFlags) -> str:
             else:
                 joined_args = ', '.join(function_args) + ', ' if function_args else ''
                 line = f'{var_assignment_snippet}{function_name}({joined_args}codeblocks=['
-            add_script_line(flags, script_lines, indent_level, line, False)
+            writer.write_line(indent_level, line, False)
             indent_level += 1
         else:
             line = f'{function_name}({", ".join(function_args)})'
-            add_script_line(flags, script_lines, indent_level, line)
+            writer.write_line(indent_level, line)
     
-    remove_comma_from_last_line()
+    writer.remove_comma_from_last_line()
     indent_level -= 1
-    add_script_line(flags, script_lines, indent_level, '])')  # add final closing brackets
+    writer.write_line(indent_level, '])')  # add final closing brackets
 
     # Add `.build_and_send()` if necessary
-    if flags.build_and_send:
-        script_lines[-1] += '.build_and_send()'
-    
-    return '\n'.join(script_lines)
+    writer.flush('.build_and_send()' if flags.build_and_send else '')
@@ -1,199 +1,872 @@
+from collections import Counter, deque
 from dataclasses import dataclass
-from collections import deque
+from heapq import heappush, heappop
+from itertools import accumulate, count
+from dfpyre.util.util import PyreException, warn
 from dfpyre.core.codeblock import CodeBlock, CONDITIONAL_CODEBLOCKS, TEMPLATE_STARTERS
 from dfpyre.core.items import Variable, Parameter, ParameterType
 
 
-BRACKET_CODEBLOCKS = CONDITIONAL_CODEBLOCKS
-BRACKET_CODEBLOCKS.add('repeat')
+BRACKET_CODEBLOCKS = CONDITIONAL_CODEBLOCKS | {'repeat'}
 
+# Length of a sliced template before any chunks are added to it (the function block)
+SLICE_BASE_LENGTH = 2
 
-@dataclass
-class TemplateChunk:
-    length: int
-    start_index: int
-    end_index: int
-    contents1: list['TemplateChunk'] | None  # Inside brackets
-    contents2: list['TemplateChunk'] | None  # Inside `else` brackets
+# Length of a chunk that is a single codeblock
+SINGLE_CHUNK_LENGTH = 2
 
+# Slices of this length or shorter are no shorter than the function call that replaces them
+MIN_USEFUL_SLICE_LENGTH = SLICE_BASE_LENGTH + SINGLE_CHUNK_LENGTH
 
-def get_referenced_line_vars(codeblocks: list[CodeBlock]) -> set[str]:
-    referenced_vars = set()
-    for codeblock in codeblocks:
-        for argument in codeblock.args:
-            if isinstance(argument, Variable) and argument.scope == 'line':
-                referenced_vars.add(argument.name)
-    return referenced_vars
+# Length added by the brackets of a chunk, without and with an `else`
+BRACKET_CHUNK_LENGTH = 4
+ELSE_CHUNK_LENGTH = 8
+
+# Number of bisection steps used by `SlicePlanner` when searching for the cost of a cut
+CUT_COST_SEARCH_STEPS = 12
 
+SLICE_STRATEGIES = ('greedy', 'min_functions', 'min_parameters')
 
-def find_closing_bracket(codeblocks: list[CodeBlock], start_index: int) -> int:
+
+class TemplateChunk:
     """
-    Returns the index of the cooresponding closing bracket assuming 
-    that `start_index` is the index of the first codeblock inside the brackets.
+    A part of a template that can't be split up when slicing.
+    This is either a single codeblock, or a codeblock with brackets and everything inside of them.
     """
-    nested_level = 1
-    for i in range(start_index, len(codeblocks)):
-        codeblock = codeblocks[i]
-        if codeblock.type != 'bracket':
-            continue
+    __slots__ = ('length', 'parts', 'leading', 'start', 'end', 'parent', 'index', 'previous', 'next', 'slice_id')
+
+    def __init__(self, length: int, parts: list, leading: tuple[CodeBlock, ...], start: int, end: int):
+        self.length = length
+        self.parts: list[CodeBlock|ChunkList] = parts
+        self.leading = leading  # Codeblocks directly before this chunk that don't belong to any chunk
+        self.start = start  # Index range of this chunk's codeblocks in the original template
+        self.end = end
+        self.parent: ChunkList|None = None
+        self.index = 0  # Index of this chunk in its parent's chunks
+        self.previous: TemplateChunk|None = None  # Neighbouring chunks in the parent
+        self.next: TemplateChunk|None = None
+        self.slice_id = -1  # Id of the latest slice found ending at this chunk
+
+
+    def append_codeblocks(self, codeblocks: list[CodeBlock]):
+        for part in self.parts:
+            if isinstance(part, ChunkList):
+                part.append_codeblocks(codeblocks)
+            else:
+                codeblocks.append(part)
+
 
-        direction = codeblock.data['direct']
-        if direction == 'open':
-            nested_level += 1
-        else:  # Closed
-            nested_level -= 1
-        
-        if nested_level == 0:
-            return i
-    
-    return -1
+    def remove_contents(self):
+        """
+        Marks every chunk list inside of this chunk as no longer part of the template.
+        """
+        for part in self.parts:
+            if isinstance(part, ChunkList):
+                part.removed = True
+                for chunk in part.chunks:
+                    if chunk is not None:
+                        chunk.remove_contents()
 
 
-def get_bracket_ranges(codeblocks: list[CodeBlock], start_index: int):
-    bracket_range_end = find_closing_bracket(codeblocks, start_index)
+class ChunkList:
+    """
+    The chunks directly inside a pair of brackets, or at the top level of a template.
+
+    Each chunk is linked to its neighbours, so a run of chunks can be replaced without moving
+    the chunks after it. Replaced chunks leave empty slots in `chunks`, which keeps the index of
+    every other chunk the same.
+    """
+    __slots__ = ('chunks', 'trailing', 'owner', 'order', 'removed')
+
+    def __init__(self, chunks: list[TemplateChunk], trailing: tuple[CodeBlock, ...]):
+        self.chunks: list[TemplateChunk|None] = chunks
+        self.trailing = trailing  # Codeblocks after the last chunk that don't belong to any chunk
+        self.owner: TemplateChunk|None = None
+        self.order = 0
+        self.removed = False
+
+        previous_chunk = None
+        for i, chunk in enumerate(chunks):
+            chunk.parent = self
+            chunk.index = i
+            chunk.previous = previous_chunk
+            if previous_chunk is not None:
+                previous_chunk.next = chunk
+            previous_chunk = chunk
+
+
+    def append_codeblocks(self, codeblocks: list[CodeBlock]):
+        for chunk in self.chunks:
+            if chunk is not None:
+                codeblocks.extend(chunk.leading)
+                chunk.append_codeblocks(codeblocks)
+        codeblocks.extend(self.trailing)
+
+
+    def replace_chunks(self, first_chunk: TemplateChunk, last_chunk: TemplateChunk, new_chunk: TemplateChunk):
+        """
+        Replaces the chunks from `first_chunk` to `last_chunk` (inclusive) with `new_chunk`.
+        """
+        chunk = first_chunk.next
+        while chunk is not last_chunk.next:
+            self.chunks[chunk.index] = None
+            chunk = chunk.next
+        self.chunks[first_chunk.index] = new_chunk
+
+        new_chunk.parent = self
+        new_chunk.index = first_chunk.index
+        new_chunk.previous = first_chunk.previous
+        new_chunk.next = last_chunk.next
+        if new_chunk.previous is not None:
+            new_chunk.previous.next = new_chunk
+        if new_chunk.next is not None:
+            new_chunk.next.previous = new_chunk
+
+
+def count_line_var_references(codeblocks: list[CodeBlock]) -> Counter[str]:
+    line_var_names = []
+    for codeblock in codeblocks:
+        line_var_names += [a.name for a in codeblock.args if a.type == 'var' and a.scope == 'line']
+    return Counter(line_var_names)
+
 
-    if len(codeblocks) > bracket_range_end+1 and codeblocks[bracket_range_end+1].type == 'else':
-        else_range_start = bracket_range_end+3  # Add 3 to move inside `else` brackets
-        else_range_end = find_closing_bracket(codeblocks, else_range_start)
-        else_range = (else_range_start, else_range_end)
-    else:
-        else_range = None
+def get_line_var_uses(codeblocks: list[CodeBlock]) -> dict[str, list[int]]:
+    """
+    Returns a def-use map of the line vars in a template, which maps the name of each line var
+    to the indices of the codeblocks that set or read it.
+    """
+    line_var_uses: dict[str, list[int]] = {}
+    for i, codeblock in enumerate(codeblocks):
+        for argument in codeblock.args:
+            if argument.type == 'var' and argument.scope == 'line':
+                line_var_uses.setdefault(argument.name, []).append(i)
+    return line_var_uses
 
-    bracket_range = (start_index, bracket_range_end)
-    return (bracket_range, else_range)
+
+def get_bracket_pairs(codeblocks: list[CodeBlock]) -> dict[int, int]:
+    """
+    Returns a dict mapping the index of each opening bracket to the index of its closing bracket.
+    """
+    bracket_pairs: dict[int, int] = {}
+    open_brackets: list[int] = []
+    for i, codeblock in enumerate(codeblocks):
+        if codeblock.type != 'bracket':
+            continue
+        if codeblock.data['direct'] == 'open':
+            open_brackets.append(i)
+        elif open_brackets:
+            bracket_pairs[open_brackets.pop()] = i
+    return bracket_pairs
 
 
 def get_template_length(codeblocks: list[CodeBlock]) -> int:
     return sum(b.get_length() for b in codeblocks)
 
 
-def get_template_chunks(codeblocks: list[CodeBlock], start_index: int, end_index: int) -> list[TemplateChunk]:
+def get_closing_bracket(codeblocks: list[CodeBlock], bracket_pairs: dict[int, int], open_index: int) -> int:
+    close_index = bracket_pairs.get(open_index)
+    if close_index is None:
+        raise PyreException(f'{codeblocks[open_index-1]} at index {open_index-1} is missing its brackets.')
+    return close_index
+
+
+def get_chunk_list(codeblocks: list[CodeBlock], bracket_pairs: dict[int, int], length_sums: list[int],
+                   start_index: int, end_index: int) -> ChunkList:
+    """
+    Splits the codeblocks between `start_index` and `end_index` into chunks.
+    `length_sums[i]` is the length of the first `i` codeblocks.
+    """
     chunks: list[TemplateChunk] = []
+    leading: list[CodeBlock] = []
 
     index = start_index
     while index < end_index:
         codeblock = codeblocks[index]
         if codeblock.type == 'bracket' or codeblock.type in TEMPLATE_STARTERS:
+            leading.append(codeblock)
             index += 1
             continue
 
         if codeblock.type in BRACKET_CODEBLOCKS:
-            bracket_range, else_range = get_bracket_ranges(codeblocks, index+2)
-            inside_bracket = codeblocks[bracket_range[0]:bracket_range[1]]
-            inside_bracket_length = get_template_length(inside_bracket)
-            chunk_contents1 = get_template_chunks(codeblocks, bracket_range[0], bracket_range[1])
-            if else_range is None:
-                chunk_length = inside_bracket_length + 4
-                chunk_end_index = bracket_range[1] + 1
-                chunk_contents2 = None
-            else:
-                inside_else = codeblocks[else_range[0]:else_range[1]]
-                inside_else_length = get_template_length(inside_else)
-                chunk_length = inside_bracket_length + inside_else_length + 8
-                chunk_end_index = else_range[1] + 1
-                chunk_contents2 = get_template_chunks(codeblocks, else_range[0], else_range[1])
-            
-            chunk = TemplateChunk(length=chunk_length, start_index=index, end_index=chunk_end_index, contents1=chunk_contents1, contents2=chunk_contents2)
-            chunks.append(chunk)
-            index = chunk_end_index-1
-        
+            close_index = get_closing_bracket(codeblocks, bracket_pairs, index+1)
+            contents1 = get_chunk_list(codeblocks, bracket_pairs, length_sums, index+2, close_index)
+            parts = [codeblock, codeblocks[index+1], contents1, codeblocks[close_index]]
+            chunk_length = length_sums[close_index] - length_sums[index+2] + BRACKET_CHUNK_LENGTH
+            chunk_end_index = close_index+1
+
+            if chunk_end_index < len(codeblocks) and codeblocks[chunk_end_index].type == 'else':
+                else_close_index = get_closing_bracket(codeblocks, bracket_pairs, chunk_end_index+1)
+                contents2 = get_chunk_list(codeblocks, bracket_pairs, length_sums, chunk_end_index+2, else_close_index)
+                parts += [codeblocks[chunk_end_index], codeblocks[chunk_end_index+1], contents2, codeblocks[else_close_index]]
+                chunk_length += length_sums[else_close_index] - length_sums[chunk_end_index+2] + ELSE_CHUNK_LENGTH - BRACKET_CHUNK_LENGTH
+                chunk_end_index = else_close_index+1
+
+            chunk = TemplateChunk(chunk_length, parts, tuple(leading), index, chunk_end_index)
+            contents1.owner = chunk
+            if len(parts) > 4:
+                contents2.owner = chunk
+
         else:
-            chunk = TemplateChunk(length=2, start_index=index, end_index=index+1, contents1=None, contents2=None)
-            chunks.append(chunk)
-        
-        index += 1
-
-    return chunks
-
-
-def extract_one_template(codeblocks: list[CodeBlock], target_length: int, extracted_template_name: str) -> tuple[list[CodeBlock], list[CodeBlock]]:
-    chunks = get_template_chunks(codeblocks, 0, len(codeblocks))
-    current_slice_length = 2
-    current_slice_start = -1
-    current_slice_end = -1
-
-    slices: dict[tuple[int, int], int] = {}
-
-    chunks_to_iterate: deque[list[TemplateChunk]] = deque()
-    chunks_to_iterate.append(chunks)
-
-    def save_current_slice():
-        nonlocal current_slice_start, current_slice_end, current_slice_length, slices
-        current_slice_range = (current_slice_start, current_slice_end)
-        slices[current_slice_range] = current_slice_length
-        current_slice_length = 2
-        current_slice_start = -1
-        current_slice_end = -1
-
-    while chunks_to_iterate:
-        current_chunks = chunks_to_iterate.pop()
-        for chunk in reversed(current_chunks):
-            if chunk.contents1:
-                chunks_to_iterate.append(chunk.contents1)
-            if chunk.contents2:
-                chunks_to_iterate.append(chunk.contents2)
-            
-            if current_slice_start == -1:
-                current_slice_start = chunk.start_index
-            if current_slice_end == -1:
-                current_slice_end = chunk.end_index
-            
-            # Check if chunk is too long
-            if chunk.length > target_length - 2:
-                save_current_slice()
-                continue
-            
-            new_slice_length = current_slice_length + chunk.length
-            if new_slice_length <= target_length:
-                current_slice_length = new_slice_length
-                current_slice_start = chunk.start_index
-            else:
-                current_slice_range = (current_slice_start, current_slice_end)
-                slices[current_slice_range] = current_slice_length
-                current_slice_length = chunk.length + 2
-                current_slice_start = chunk.start_index
-                current_slice_end = chunk.end_index
-    
-        save_current_slice()
-    
-    sliced_range = max(slices.items(), key=lambda kv: kv[1])[0]  # Extract the longest slice
-    extracted_codeblocks = codeblocks[sliced_range[0]:sliced_range[1]]
-    del codeblocks[sliced_range[0]:sliced_range[1]]
-
-    original_line_vars = get_referenced_line_vars(codeblocks)
-    extracted_line_vars = get_referenced_line_vars(extracted_codeblocks)
-    param_line_vars = set.intersection(original_line_vars, extracted_line_vars)
-    function_parameters = []
-    function_call_args = []
-    for line_var in param_line_vars:
-        function_parameters.append(Parameter(line_var, ParameterType.VAR))
-        function_call_args.append(Variable(line_var, 'line'))
-    
-    function_codeblock = CodeBlock.new_data('func', extracted_template_name, tuple(function_parameters), tags={'Is Hidden': 'True'})
-    extracted_codeblocks.insert(0, function_codeblock)
-
-    call_function_codeblock = CodeBlock.new_data('call_func', extracted_template_name, tuple(function_call_args), {})
-    codeblocks.insert(sliced_range[0], call_function_codeblock)
-
-    return codeblocks, extracted_codeblocks
-
-
-def slice_template(codeblocks: list[CodeBlock], target_length: int, template_name: str) -> list[list[CodeBlock]]:
-    template_length = get_template_length(codeblocks)
-    if template_length < target_length:
-        return [codeblocks]
+            chunk = TemplateChunk(SINGLE_CHUNK_LENGTH, [codeblock], tuple(leading), index, index+1)
+            chunk_end_index = index+1
+
+        chunks.append(chunk)
+        leading = []
+        index = chunk_end_index
+
+    return ChunkList(chunks, tuple(leading))
+
+
+def get_chunk_lists(root: ChunkList) -> list[ChunkList]:
+    """
+    Returns every chunk list in the order slices are compared in when picking the longest one.
+    """
+    chunk_lists = []
+    lists_to_visit = [root]
+    while lists_to_visit:
+        chunk_list = lists_to_visit.pop()
+        chunk_lists.append(chunk_list)
+        for chunk in reversed(chunk_list.chunks):
+            for part in chunk.parts:
+                if isinstance(part, ChunkList) and part.chunks:
+                    lists_to_visit.append(part)
+    return chunk_lists
+
+
+class GreedySlicer:
+    """
+    Slices a template by repeatedly extracting the longest slice into a new function.
+
+    The longest slice ending at each chunk is kept in a heap. A cut only changes the slices that
+    can reach back to the chunk it leaves behind, so only those are found again after each cut.
+    """
+
+    def __init__(self, codeblocks: list[CodeBlock], length_sums: list[int], target_length: int, template_name: str):
+        """
+        :param list[int] length_sums: The length of the first `i` codeblocks at each index `i`.
+        """
+        self.target_length = target_length
+        self.max_chunks_length = target_length - SLICE_BASE_LENGTH
+        self.template_name = template_name
+        self.template_length = length_sums[-1]
+        self.line_var_counts = count_line_var_references(codeblocks)
+        self.extracted_templates: list[list[CodeBlock]] = []
+
+        self.root = get_chunk_list(codeblocks, get_bracket_pairs(codeblocks), length_sums, 0, len(codeblocks))
+
+        self.slice_ids = count()
+        self.slice_heap: list[tuple[int, int, int, int, TemplateChunk]] = []
+        for order, chunk_list in enumerate(get_chunk_lists(self.root)):
+            chunk_list.order = order
+            for chunk in chunk_list.chunks:
+                self.push_slice(chunk)
+
+
+    def get_slice_start(self, last_chunk: TemplateChunk) -> tuple[TemplateChunk, int]:
+        """
+        Packs chunks into a slice ending at `last_chunk` until the next one doesn't fit.
+
+        :return: The first chunk of the slice, and the length of its chunks.
+        """
+        first_chunk = last_chunk
+        chunks_length = last_chunk.length
+        previous_chunk = first_chunk.previous
+        while previous_chunk is not None and chunks_length + previous_chunk.length <= self.max_chunks_length:
+            first_chunk = previous_chunk
+            chunks_length += previous_chunk.length
+            previous_chunk = first_chunk.previous
+        return first_chunk, chunks_length
+
+
+    def push_slice(self, last_chunk: TemplateChunk):
+        """
+        Finds the longest slice ending at a chunk, replacing the one found before.
+        """
+        last_chunk.slice_id = next(self.slice_ids)
+        if last_chunk.length > self.max_chunks_length:
+            return  # Chunk is too long to be in any slice
+        slice_length = self.get_slice_start(last_chunk)[1] + SLICE_BASE_LENGTH
+        if slice_length > MIN_USEFUL_SLICE_LENGTH:
+            # Ties go to the first chunk list, then to the last slice in it
+            heappush(self.slice_heap, (-slice_length, last_chunk.parent.order, -last_chunk.start, last_chunk.slice_id, last_chunk))
+
+
+    def update_slices(self, chunk: TemplateChunk):
+        """
+        Finds the slices again that end at `chunk` or can reach back to it, after it changed.
+        """
+        following_length = 0
+        while chunk is not None and following_length <= self.max_chunks_length:
+            self.push_slice(chunk)
+            chunk = chunk.next
+            if chunk is not None:
+                following_length += chunk.length
+
+
+    def pop_best_slice(self) -> TemplateChunk|None:
+        """
+        Returns the last chunk of the longest slice in the template.
+        """
+        while self.slice_heap:
+            _, _, _, slice_id, last_chunk = heappop(self.slice_heap)
+            if slice_id == last_chunk.slice_id and not last_chunk.parent.removed:
+                return last_chunk
+        return None
+
+
+    def extract_one_template(self) -> bool:
+        """
+        Extracts the longest slice into a new function.
+
+        :return: False if no slice would make the template shorter.
+        """
+        last_chunk = self.pop_best_slice()
+        if last_chunk is None:
+            return False
+
+        chunk_list = last_chunk.parent
+        first_chunk = self.get_slice_start(last_chunk)[0]
+        extracted_codeblocks = []
+        chunk = first_chunk
+        while chunk is not last_chunk.next:
+            if chunk is not first_chunk:
+                extracted_codeblocks.extend(chunk.leading)
+            chunk.append_codeblocks(extracted_codeblocks)
+            chunk.remove_contents()
+            chunk.slice_id = -1
+            chunk = chunk.next
+
+        # Line vars used both inside and outside of the slice are passed as parameters
+        extracted_line_vars = count_line_var_references(extracted_codeblocks)
+        param_line_vars = [v for v, count in extracted_line_vars.items() if self.line_var_counts[v] > count]
+        self.line_var_counts.subtract(extracted_line_vars)
+        self.line_var_counts.update(param_line_vars)
+
+        extracted_template_name = f'{self.template_name}_{len(self.extracted_templates)+1}'
+        function_parameters = tuple(Parameter(v, ParameterType.VAR) for v in param_line_vars)
+        function_codeblock = CodeBlock.new_data('func', extracted_template_name, function_parameters, tags={'Is Hidden': 'True'}, normalized_args=True)
+        extracted_codeblocks.insert(0, function_codeblock)
+        self.extracted_templates.append(extracted_codeblocks)
+
+        function_call_args = tuple(Variable(v, 'line') for v in param_line_vars)
+        call_function_codeblock = CodeBlock.new_data('call_func', extracted_template_name, function_call_args, {}, normalized_args=True)
+        call_chunk = TemplateChunk(SINGLE_CHUNK_LENGTH, [call_function_codeblock], first_chunk.leading, first_chunk.start, last_chunk.end)
+        chunk_list.replace_chunks(first_chunk, last_chunk, call_chunk)
+        self.update_slices(call_chunk)
+
+        # Shorten every chunk that contains the slice
+        length_change = call_function_codeblock.get_length() - get_template_length(extracted_codeblocks[1:])
+        self.template_length += length_change
+        owner = chunk_list.owner
+        while owner is not None:
+            owner.length += length_change
+            self.update_slices(owner)
+            owner = owner.parent.owner
+
+        return True
+
+
+    def get_remaining_codeblocks(self) -> list[CodeBlock]:
+        codeblocks = []
+        self.root.append_codeblocks(codeblocks)
+        return codeblocks
+
+
+class PlannedFunction:
+    """
+    A function planned by `SlicePlanner`. It takes the place of the chunks it contains in their chunk list.
+    """
+    __slots__ = ('units', 'leading', 'start', 'end', 'name', 'param_line_vars', 'line_var_counts', 'call_codeblock')
+    length = SINGLE_CHUNK_LENGTH
+
+    def __init__(self, units: list, name: str):
+        self.units: list[TemplateChunk|PlannedFunction] = units
+        self.leading = units[0].leading
+        self.start = units[0].start
+        self.end = units[-1].end
+        self.name = name
+        self.param_line_vars: list[str] = []
+        self.line_var_counts: Counter[str] = Counter()  # Line var references of the original codeblocks inside of this function
+        self.call_codeblock: CodeBlock|None = None
+
 
-    codeblocks = codeblocks.copy()
+    def append_codeblocks(self, codeblocks: list[CodeBlock]):
+        codeblocks.append(self.call_codeblock)
 
-    sliced_templates: list[list[CodeBlock]] = []
 
+    def append_body(self, codeblocks: list[CodeBlock]):
+        for i, unit in enumerate(self.units):
+            if i > 0:
+                codeblocks.extend(unit.leading)
+            unit.append_codeblocks(codeblocks)
+
+
+def get_cuts(cut_starts: list[int]) -> list[tuple[int, int]]:
+    """
+    Returns the cuts chosen by a slice planning dynamic program, where `cut_starts[i]` is the start
+    of the cut ending before unit `i`, or -1 if that unit isn't cut.
+    """
+    cuts = []
+    end = len(cut_starts) - 1
+    while end > 0:
+        start = cut_starts[end]
+        if start == -1:
+            end -= 1
+        else:
+            cuts.append((start, end))
+            end = start
+    cuts.reverse()
+    return cuts
+
+
+def get_passive_length(chunk_list: ChunkList) -> int:
+    """
+    Returns the length of the codeblocks in a chunk list that don't belong to any chunk.
+    """
+    return sum(get_template_length(c.leading) for c in chunk_list.chunks) + get_template_length(chunk_list.trailing)
+
+
+class SlicePlanner:
+    """
+    Slices a template by planning cuts over its chunk tree, using as few functions as possible,
+    or as few line var parameters as possible if `minimize_parameters` is True.
+
+    Cuts are planned for every chunk list at once by a dynamic program, which finds the cuts that
+    minimize the length of the template plus a cost for each cut. The cost is searched for so the
+    template just fits, which gives the cheapest cuts. If the template can't fit even when cuts are
+    free, the fullest cuts are made first and the calls they leave behind are packed along with
+    the rest of the template.
+
+    When minimizing parameters, each cut also costs the number of line vars that cross it, which
+    are found with a def-use map of the whole template.
+    """
+
+    def __init__(self, codeblocks: list[CodeBlock], length_sums: list[int], target_length: int, template_name: str,
+                 minimize_parameters: bool=False):
+        """
+        :param list[int] length_sums: The length of the first `i` codeblocks at each index `i`.
+        :param bool minimize_parameters: If True, cuts that pass fewer line vars as parameters are preferred over cuts that make fewer functions.
+        """
+        self.target_length = target_length
+        self.max_chunks_length = target_length - SLICE_BASE_LENGTH
+        self.template_name = template_name
+        self.minimize_parameters = minimize_parameters
+        self.line_var_uses = get_line_var_uses(codeblocks)
+        self.line_var_counts = Counter({v: len(uses) for v, uses in self.line_var_uses.items()})
+        self.codeblock_line_vars: list[list[str]] = [[] for _ in codeblocks]
+        for line_var, uses in self.line_var_uses.items():
+            for codeblock_index in uses:
+                self.codeblock_line_vars[codeblock_index].append(line_var)
+        self.unit_line_vars: dict[TemplateChunk|PlannedFunction, set[str]] = {}
+        self.functions: list[PlannedFunction] = []
+        self.root = get_chunk_list(codeblocks, get_bracket_pairs(codeblocks), length_sums, 0, len(codeblocks))
+        self.passive_lengths: dict[ChunkList, int] = {}
+
+
+    def plan(self):
+        self.plan_chunk_list(self.root, self.target_length)
+
+
+    def get_passive_length(self, chunk_list: ChunkList) -> int:
+        passive_length = self.passive_lengths.get(chunk_list)
+        if passive_length is None:
+            passive_length = self.passive_lengths[chunk_list] = get_passive_length(chunk_list)
+        return passive_length
+
+
+    def get_list_length(self, chunk_list: ChunkList) -> int:
+        return self.get_passive_length(chunk_list) + sum(u.length for u in chunk_list.chunks)
+
+
+    def get_min_length(self, chunk_list: ChunkList) -> int:
+        """
+        Returns the length of a chunk list if every useful cut is made in it.
+        """
+        return self.get_passive_length(chunk_list) + self.plan_cuts([u.length for u in chunk_list.chunks], 0.0)[1]
+
+
+    def plan_chunk_list(self, chunk_list: ChunkList, max_length: int) -> int:
+        """
+        Plans the cuts in a chunk list and every chunk inside of it so the list is at most `max_length` long.
+
+        :return: The length of the chunk list after cutting.
+        """
+        for chunk in chunk_list.chunks:
+            if chunk.length > self.max_chunks_length:
+                self.shrink_chunk(chunk)
+        while self.get_min_length(chunk_list) > max_length:
+            if not self.pack_fullest_cuts(chunk_list):
+                break
+        return self.fit_chunk_lists([chunk_list], max_length)
+
+
+    def shrink_chunk(self, chunk: TemplateChunk):
+        """
+        Plans cuts inside of a chunk so it fits in a function.
+        """
+        contents = [p for p in chunk.parts if isinstance(p, ChunkList)]
+        bracket_length = chunk.length - sum(self.get_list_length(c) for c in contents)
+        max_contents_length = self.max_chunks_length - bracket_length
+        for content in contents:
+            for inner_chunk in content.chunks:
+                if inner_chunk.length > self.max_chunks_length:
+                    self.shrink_chunk(inner_chunk)
+        while sum(self.get_min_length(c) for c in contents) > max_contents_length:
+            if not self.pack_fullest_cuts(max(contents, key=self.get_list_length)):
+                break
+        chunk.length = bracket_length + self.fit_chunk_lists(contents, max_contents_length)
+
+
+    def pack_fullest_cuts(self, chunk_list: ChunkList) -> bool:
+        """
+        Cuts the fullest runs of units in a chunk list into functions.
+        This is done when the list is too long even if every useful cut is made, so the calls
+        left behind can be packed into functions along with the rest of the list.
+
+        :return: False if no cut would make the list shorter.
+        """
+        lengths = [u.length for u in chunk_list.chunks]
+        max_cut_length = 0
+        window_start = 0
+        window_length = 0
+        for length in lengths:
+            window_length += length
+            while window_length > self.max_chunks_length:
+                window_length -= lengths[window_start]
+                window_start += 1
+            max_cut_length = max(max_cut_length, window_length)
+        if max_cut_length <= SINGLE_CHUNK_LENGTH:
+            return False
+        cuts = self.plan_cuts(lengths, max_cut_length - SINGLE_CHUNK_LENGTH - 1)[0]
+        chunk_list.chunks = self.apply_cuts(chunk_list.chunks, cuts)
+        self.passive_lengths[chunk_list] = get_passive_length(chunk_list)
+        return True
+
+
+    def fit_chunk_lists(self, chunk_lists: list[ChunkList], max_length: int) -> int:
+        """
+        Makes the cheapest cuts in the chunk lists so their total length is at most `max_length`.
+        Plans that only cut the lists themselves and plans that also cut the lists inside of them are both tried.
+
+        :return: The total length of the chunk lists after cutting.
+        """
+        planned_cuts = None
+        planned_cuts_cost = 0
+        for cut_nested in (False, True):
+            # Making cuts more expensive trades remaining length for fewer functions,
+            # so search for the most expensive cut that still fits
+            cut_cost = 0.0
+            low_cost = 0.0
+            high_cost = float(self.max_chunks_length)
+            for _ in range(CUT_COST_SEARCH_STEPS+1):
+                candidate_cuts = {}
+                if sum(self.plan_tree_cuts(c, cut_cost, candidate_cuts, cut_nested) for c in chunk_lists) <= max_length:
+                    low_cost = cut_cost
+                    candidate_cuts_cost = self.get_planned_cuts_cost(candidate_cuts)
+                    if planned_cuts is None or candidate_cuts_cost < planned_cuts_cost:
+                        planned_cuts = candidate_cuts
+                        planned_cuts_cost = candidate_cuts_cost
+                elif cut_cost == 0.0:
+                    break  # Doesn't fit even if cuts are free
+                else:
+                    high_cost = cut_cost
+                cut_cost = (low_cost + high_cost) / 2
+
+        if planned_cuts is None:
+            # The lists can't fit, so make every cut that makes them shorter
+            planned_cuts = {}
+            for chunk_list in chunk_lists:
+                self.plan_tree_cuts(chunk_list, 0.0, planned_cuts)
+        return sum(self.apply_tree_cuts(c, planned_cuts) for c in chunk_lists)
+
+
+    def plan_tree_cuts(self, chunk_list: ChunkList, cut_cost: float, planned_cuts: dict[ChunkList, list[tuple[int, int]]], cut_nested: bool=True) -> int:
+        """
+        Plans the cuts of a chunk list for a cost per cut without making them, and those of every chunk list inside of it if `cut_nested` is True.
+
+        :return: The length of the chunk list after cutting.
+        """
+        lengths = []
+        for unit in chunk_list.chunks:
+            length = unit.length
+            if cut_nested and type(unit) is TemplateChunk and len(unit.parts) > 1:
+                for part in unit.parts:
+                    if isinstance(part, ChunkList):
+                        length += self.plan_tree_cuts(part, cut_cost, planned_cuts) - self.get_list_length(part)
+            lengths.append(length)
+
+        if self.minimize_parameters:
+            cuts, remaining_length = self.plan_parameter_cuts(chunk_list.chunks, lengths, cut_cost)
+        else:
+            cuts, remaining_length = self.plan_cuts(lengths, cut_cost)
+        if cuts:
+            planned_cuts[chunk_list] = cuts
+        return self.get_passive_length(chunk_list) + remaining_length
+
+
+    def apply_tree_cuts(self, chunk_list: ChunkList, planned_cuts: dict[ChunkList, list[tuple[int, int]]]) -> int:
+        """
+        Makes the cuts planned by `plan_tree_cuts`.
+
+        :return: The length of the chunk list after cutting.
+        """
+        for unit in chunk_list.chunks:
+            if type(unit) is TemplateChunk and len(unit.parts) > 1:
+                for part in unit.parts:
+                    if isinstance(part, ChunkList):
+                        unit.length -= self.get_list_length(part)
+                        unit.length += self.apply_tree_cuts(part, planned_cuts)
+
+        if chunk_list in planned_cuts:
+            chunk_list.chunks = self.apply_cuts(chunk_list.chunks, planned_cuts[chunk_list])
+            self.passive_lengths[chunk_list] = get_passive_length(chunk_list)
+        return self.get_list_length(chunk_list)
+
+
+    def plan_cuts(self, lengths: list[int], cut_cost: float) -> tuple[list[tuple[int, int]], int]:
+        """
+        Finds the cuts that minimize the remaining length plus `cut_cost` for each cut.
+
+        :return: The cuts as (start, end) index pairs, and the remaining length.
+        """
+        max_chunks_length = self.max_chunks_length
+        remaining_lengths = [0]
+        cut_counts = [0]
+        keys = [0.0]
+        cut_starts = [-1]
+
+        # Indices that a cut ending at the current unit can start at, with increasing keys
+        start_candidates: deque[int] = deque()
+        window_start = 0
+        window_length = 0
+        for i, length in enumerate(lengths):
+            while start_candidates and (keys[start_candidates[-1]], cut_counts[start_candidates[-1]]) >= (keys[i], cut_counts[i]):
+                start_candidates.pop()
+            start_candidates.append(i)
+            window_length += length
+            while window_length > max_chunks_length:
+                window_length -= lengths[window_start]
+                window_start += 1
+            while start_candidates and start_candidates[0] < window_start:
+                start_candidates.popleft()
+
+            remaining_length = remaining_lengths[i] + length
+            cut_count = cut_counts[i]
+            cut_start = -1
+            if start_candidates:
+                start = start_candidates[0]
+                cut_remaining_length = remaining_lengths[start] + SINGLE_CHUNK_LENGTH
+                cut_cut_count = cut_counts[start] + 1
+                cut_key = cut_remaining_length + cut_cost*cut_cut_count
+                if (cut_key, cut_cut_count) < (remaining_length + cut_cost*cut_count, cut_count):
+                    remaining_length = cut_remaining_length
+                    cut_count = cut_cut_count
+                    cut_start = start
+
+            remaining_lengths.append(remaining_length)
+            cut_counts.append(cut_count)
+            keys.append(remaining_length + cut_cost*cut_count)
+            cut_starts.append(cut_start)
+
+        return get_cuts(cut_starts), remaining_lengths[-1]
+
+
+    def get_unit_line_vars(self, unit: TemplateChunk|PlannedFunction) -> set[str]:
+        line_vars = self.unit_line_vars.get(unit)
+        if line_vars is None:
+            line_vars = self.unit_line_vars[unit] = set().union(*self.codeblock_line_vars[unit.start:unit.end])
+        return line_vars
+
+
+    def get_parameter_count(self, units: list, start: int, end: int) -> int:
+        """
+        Returns the number of line vars that would be passed as parameters if the units from `start` to `end` were cut.
+        """
+        start_index = units[start].start
+        end_index = units[end-1].end
+        line_vars = set().union(*(self.get_unit_line_vars(u) for u in units[start:end]))
+        return sum(1 for v in line_vars if self.line_var_uses[v][0] < start_index or self.line_var_uses[v][-1] >= end_index)
+
+
+    def get_planned_cuts_cost(self, planned_cuts: dict[ChunkList, list[tuple[int, int]]]) -> int:
+        cost = 0
+        for chunk_list, cuts in planned_cuts.items():
+            cost += len(cuts)
+            if self.minimize_parameters:
+                cost += sum(self.get_parameter_count(chunk_list.chunks, start, end) for start, end in cuts)
+        return cost
+
+
+    def plan_parameter_cuts(self, units: list, lengths: list[int], cut_cost: float) -> tuple[list[tuple[int, int]], int]:
+        """
+        Finds the cuts that minimize the remaining length plus `cut_cost` for each cut
+        and each line var it passes as a parameter.
+
+        :return: The cuts as (start, end) index pairs, and the remaining length.
+        """
+        line_var_uses = self.line_var_uses
+        unit_line_vars = [self.get_unit_line_vars(u) for u in units]
+        remaining_lengths = [0]
+        keys = [0.0]
+        cut_starts = [-1]
+
+        for i, length in enumerate(lengths):
+            remaining_length = remaining_lengths[i] + length
+            key = keys[i] + length
+            cut_start = -1
+
+            # Grow the cut ending at this unit backwards, keeping track of the line vars that cross it
+            end_index = units[i].end
+            cut_length = 0
+            cut_line_vars = set()
+            internal_line_vars = set()
+            for start in range(i, -1, -1):
+                cut_length += lengths[start]
+                if cut_length > self.max_chunks_length:
+                    break
+                start_index = units[start].start
+                for line_var in unit_line_vars[start]:
+                    cut_line_vars.add(line_var)
+                    uses = line_var_uses[line_var]
+                    if uses[0] >= start_index and uses[-1] < end_index:
+                        internal_line_vars.add(line_var)
+                cut_key = keys[start] + SINGLE_CHUNK_LENGTH + cut_cost*(1 + len(cut_line_vars) - len(internal_line_vars))
+                if cut_key < key:
+                    key = cut_key
+                    remaining_length = remaining_lengths[start] + SINGLE_CHUNK_LENGTH
+                    cut_start = start
+
+            remaining_lengths.append(remaining_length)
+            keys.append(key)
+            cut_starts.append(cut_start)
+
+        return get_cuts(cut_starts), remaining_lengths[-1]
+
+
+    def apply_cuts(self, units: list, cuts: list[tuple[int, int]]) -> list:
+        new_units = []
+        previous_end = 0
+        for start, end in cuts:
+            new_units += units[previous_end:start]
+            function = PlannedFunction(units[start:end], f'{self.template_name}_{len(self.functions)+1}')
+            self.functions.append(function)
+            new_units.append(function)
+            previous_end = end
+        return new_units + units[previous_end:]
+
+
+    def get_sliced_templates(self) -> list[list[CodeBlock]]:
+        """
+        Builds the codeblocks of the remaining template and every planned function.
+        """
+        called_functions: dict[int, PlannedFunction] = {}
+        function_templates = []
+
+        # Functions are planned after every function inside of them, so their calls are already built
+        for function in self.functions:
+            codeblocks = []
+            function.append_body(codeblocks)
+
+            used_line_vars = []
+            for codeblock in codeblocks:
+                called_function = called_functions.get(id(codeblock))
+                if called_function is None:
+                    line_var_names = [a.name for a in codeblock.args if a.type == 'var' and a.scope == 'line']
+                    function.line_var_counts.update(line_var_names)
+                    used_line_vars += line_var_names
+                else:
+                    function.line_var_counts.update(called_function.line_var_counts)
+                    used_line_vars += called_function.param_line_vars
+
+            # Line vars used both inside and outside of the function are passed as parameters
+            function.param_line_vars = [v for v in dict.fromkeys(used_line_vars) if function.line_var_counts[v] < self.line_var_counts[v]]
+            function_parameters = tuple(Parameter(v, ParameterType.VAR) for v in function.param_line_vars)
+            codeblocks.insert(0, CodeBlock.new_data('func', function.name, function_parameters, tags={'Is Hidden': 'True'}, normalized_args=True))
+            function_templates.append(codeblocks)
+
+            function_call_args = tuple(Variable(v, 'line') for v in function.param_line_vars)
+            function.call_codeblock = CodeBlock.new_data('call_func', function.name, function_call_args, {}, normalized_args=True)
+            called_functions[id(function.call_codeblock)] = function
+
+        remaining_codeblocks = []
+        self.root.append_codeblocks(remaining_codeblocks)
+        return [remaining_codeblocks] + function_templates
+
+
+@dataclass
+class SliceCost:
+    """
+    The size and runtime cost of a sliced template.
+    """
+    template_name: str
+    length: int
+    parameter_count: int  # Number of line vars passed into the template when it is called
+
+
+def get_slice_costs(sliced_templates: list[list[CodeBlock]], template_names: list[str]) -> list[SliceCost]:
+    """
+    Returns the cost of each template returned by `slice_template`.
+    """
+    slice_costs = []
+    for i, (codeblocks, template_name) in enumerate(zip(sliced_templates, template_names)):
+        parameter_count = len(codeblocks[0].args) if i > 0 else 0
+        slice_costs.append(SliceCost(template_name, get_template_length(codeblocks), parameter_count))
+    return slice_costs
+
+
+def count_parameters(sliced_templates: list[list[CodeBlock]]) -> int:
+    """
+    Returns the number of line vars passed as parameters to the functions returned by `slice_template`.
+    """
+    return sum(len(codeblocks[0].args) for codeblocks in sliced_templates[1:])
+
+
+def fits_target_length(sliced_templates: list[list[CodeBlock]], target_length: int) -> bool:
+    return all(get_template_length(t) <= target_length for t in sliced_templates)
+
+
+def slice_greedily(codeblocks: list[CodeBlock], length_sums: list[int], target_length: int, template_name: str) -> list[list[CodeBlock]]:
     # Extract single templates until the original template meets the target length
-    template_number = 1 
-    while get_template_length(codeblocks) > target_length:
-        extracted_template_name = template_name + '_' + str(template_number)
-        codeblocks, extracted_codeblocks = extract_one_template(codeblocks, target_length, extracted_template_name)
-        sliced_templates.append(extracted_codeblocks)
-        template_number += 1
-
-    sliced_templates.insert(0, codeblocks)
+    slicer = GreedySlicer(codeblocks, length_sums, target_length, template_name)
+    while slicer.template_length > target_length:
+        if not slicer.extract_one_template():
+            break
+    return [slicer.get_remaining_codeblocks()] + slicer.extracted_templates
+
+
+def plan_slices(codeblocks: list[CodeBlock], length_sums: list[int], target_length: int, template_name: str,
+                minimize_parameters: bool) -> list[list[CodeBlock]]:
+    planner = SlicePlanner(codeblocks, length_sums, target_length, template_name, minimize_parameters)
+    planner.plan()
+    return planner.get_sliced_templates()
+
+
+def slice_template(codeblocks: list[CodeBlock], target_length: int, template_name: str, strategy: str='greedy') -> list[list[CodeBlock]]:
+    """
+    Slices a template into a remaining template and functions that are each at most `target_length` long.
+
+    :param str strategy: `greedy` to repeatedly extract the longest slice, or `min_functions` or `min_parameters`
+        to plan every cut up front using as few functions or line var parameters as possible.
+        A planned strategy never returns more functions or parameters than the other strategies do.
+    """
+    if strategy not in SLICE_STRATEGIES:
+        raise PyreException(f'Unknown slice strategy "{strategy}", expected one of: {", ".join(SLICE_STRATEGIES)}')
+
+    length_sums = list(accumulate((b.get_length() for b in codeblocks), initial=0))
+    if length_sums[-1] < target_length:
+        return [codeblocks]
+
+    sliced_templates = slice_greedily(codeblocks, length_sums, target_length, template_name)
+    if strategy in {'min_functions', 'min_parameters'}:
+        # The planner searches for its cuts heuristically, so the other plans are kept if they are better
+        candidates = [plan_slices(codeblocks, length_sums, target_length, template_name, strategy == 'min_parameters'), sliced_templates]
+        if strategy == 'min_parameters':
+            candidates.insert(1, plan_slices(codeblocks, length_sums, target_length, template_name, False))
+            get_cost = lambda t: (count_parameters(t), len(t))
+        else:
+            get_cost = len
+        sliced_templates = min(candidates, key=lambda t: (not fits_target_length(t, target_length), get_cost(t)))
+
+    if not fits_target_length(sliced_templates, target_length):
+        warn(f'Template could not be sliced to a length of {target_length}.')
     return sliced_templates
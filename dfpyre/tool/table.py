@@ -0,0 +1,231 @@
+"""
+Imports tables of data into variables with as few set_var blocks as possible.
+"""
+
+import os
+import csv
+from typing import Iterable, Iterator, TextIO
+from dfpyre.util.util import PyreException, is_number
+from dfpyre.util.codeitem import CodeItem
+from dfpyre.core.items import String, Number, Variable, convert_literals
+from dfpyre.core.codeblock import CodeBlock
+from dfpyre.core.actiondump import get_default_tags
+
+
+__all__ = ['TableBlocks', 'import_table', 'import_csv']
+
+
+MAX_CODEBLOCK_ITEMS = 27
+
+# Number of blocks created at a time when iterating over a table's blocks
+DEFAULT_BATCH_SIZE = 256
+
+
+def get_value_capacity(action_name: str) -> int:
+    """
+    Returns how many values fit in a set_var block after its tags and result variable.
+    """
+    return MAX_CODEBLOCK_ITEMS - len(get_default_tags('set_var', action_name)) - 1
+
+
+def get_list_block_count(value_count: int) -> int:
+    create_capacity = get_value_capacity('CreateList')
+    if value_count <= create_capacity:
+        return 1
+    append_capacity = get_value_capacity('AppendValue')
+    return 1 + -(-(value_count - create_capacity) // append_capacity)
+
+
+def iter_list_blocks(variable: Variable, items: list[CodeItem]) -> Iterator[CodeBlock]:
+    """
+    Yields the blocks that create a list variable containing `items`.
+    """
+    create_capacity = get_value_capacity('CreateList')
+    append_capacity = get_value_capacity('AppendValue')
+    yield CodeBlock.new_action('set_var', 'CreateList', [variable] + items[:create_capacity], {}, normalized_args=True)
+    for start in range(create_capacity, len(items), append_capacity):
+        yield CodeBlock.new_action('set_var', 'AppendValue', [variable] + items[start:start+append_capacity], {}, normalized_args=True)
+
+
+def to_table_item(value) -> CodeItem:
+    # Strings in a table are data, so they are never treated as var shorthands
+    if isinstance(value, str):
+        return String(value)
+    item = convert_literals(value)
+    if not isinstance(item, CodeItem):
+        raise PyreException(f'Cannot import a value of type {type(value).__name__} into a table.')
+    return item
+
+
+def to_table_key(key) -> String:
+    # Dictionary keys in DiamondFire are always strings
+    if isinstance(key, String):
+        return key
+    if isinstance(key, (str, int, float)):
+        return String(str(key))
+    raise PyreException(f'Cannot use a value of type {type(key).__name__} as a table key.')
+
+
+def to_row_list(data) -> list:
+    """
+    Converts a sequence or array into a list, using the fast `tolist` method of arrays if it exists.
+    """
+    if hasattr(data, 'tolist'):
+        return data.tolist()
+    return list(data)
+
+
+class TableBlocks:
+    """
+    The set_var blocks that store a table in a variable.
+
+    Blocks are created lazily in batches when this object is iterated over, so the number of blocks
+    can be checked with `block_count` first. Since it is iterable, it can be put directly into the
+    `codeblocks` of a template.
+
+    Tables with more than one column are stored as one flat list, and their row length is stored in
+    `row_length_variable`, so the value in row `r` and column `c` is at index `r * row length + c + 1`.
+    """
+    def __init__(self, variable: Variable, values: list[CodeItem], keys: list[CodeItem]|None=None, row_length: int|None=None):
+        """
+        :param Variable variable: The variable to store the table in.
+        :param list[CodeItem] values: The values of the table, in row-major order.
+        :param list[CodeItem]|None keys: The keys of the table if it is a dictionary.
+        :param int|None row_length: The number of values in each row if the table has more than one column.
+        """
+        self.variable = variable
+        self.values = values
+        self.keys = keys
+        self.row_length = row_length
+
+
+    @property
+    def keys_variable(self) -> Variable:
+        return Variable(f'{self.variable.name} keys', 'line')
+
+
+    @property
+    def values_variable(self) -> Variable:
+        return Variable(f'{self.variable.name} values', 'line')
+
+
+    @property
+    def row_length_variable(self) -> Variable:
+        return Variable(f'{self.variable.name} row length', self.variable.scope)
+
+
+    @property
+    def block_count(self) -> int:
+        """
+        The number of blocks that will be created.
+        """
+        if self.keys is None:
+            row_length_block_count = 0 if self.row_length is None else 1
+            return get_list_block_count(len(self.values)) + row_length_block_count
+        return get_list_block_count(len(self.keys)) + get_list_block_count(len(self.values)) + 1
+
+
+    def __len__(self) -> int:
+        return self.block_count
+
+
+    def __iter__(self) -> Iterator[CodeBlock]:
+        for batch in self.iter_batches():
+            yield from batch
+
+
+    def __repr__(self) -> str:
+        return f'TableBlocks(variable: "{self.variable.name}", values: {len(self.values)}, blocks: {self.block_count})'
+
+
+    def iter_blocks(self) -> Iterator[CodeBlock]:
+        if self.keys is None:
+            yield from iter_list_blocks(self.variable, self.values)
+            if self.row_length is not None:
+                yield CodeBlock.new_action('set_var', '=', [self.row_length_variable, Number(self.row_length)], {}, normalized_args=True)
+            return
+
+        # Dictionaries are created from a list of keys and a list of values
+        keys_variable = self.keys_variable
+        values_variable = self.values_variable
+        yield from iter_list_blocks(keys_variable, self.keys)
+        yield from iter_list_blocks(values_variable, self.values)
+        yield CodeBlock.new_action('set_var', 'CreateDict', [self.variable, keys_variable, values_variable], {}, normalized_args=True)
+
+
+    def iter_batches(self, batch_size: int=DEFAULT_BATCH_SIZE) -> Iterator[list[CodeBlock]]:
+        """
+        Yields the blocks of this table in lists of up to `batch_size` blocks.
+
+        :param int batch_size: The maximum number of blocks in each batch.
+        """
+        batch = []
+        for codeblock in self.iter_blocks():
+            batch.append(codeblock)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def parse_number_cell(cell: str) -> int|float:
+    number = float(cell)
+    return int(number) if number.is_integer() and '.' not in cell else number
+
+
+def import_table(variable: Variable|str, data: list|tuple|dict) -> TableBlocks:
+    """
+    Creates the set_var blocks that store a table in a variable, using as few blocks as possible.
+
+    Lists are stored as a list variable, and dictionaries as a dictionary variable.
+    Tables with more than one column, such as a list of rows or a 2D NumPy array,
+    are stored as a list of their values in row-major order, and their row length is stored in
+    a variable named `<variable name> row length`.
+
+    :param Variable|str variable: The variable to store the table in.
+    :param list|tuple|dict data: The table data, or an array with a `tolist` method.
+    :return: The blocks, which are created when they are iterated over.
+    """
+    variable = convert_literals(variable)
+    if not isinstance(variable, Variable):
+        raise PyreException('Expected a Variable to import a table into.')
+
+    if isinstance(data, dict):
+        keys = list(map(to_table_key, data.keys()))
+        values = list(map(to_table_item, data.values()))
+        return TableBlocks(variable, values, keys)
+
+    rows = to_row_list(data)
+    if rows and isinstance(rows[0], (list, tuple)):
+        row_length = len(rows[0])
+        if any(len(r) != row_length for r in rows):
+            raise PyreException('Every row of a table must have the same length.')
+        values = [to_table_item(v) for r in rows for v in r]
+        return TableBlocks(variable, values, row_length=row_length)
+
+    return TableBlocks(variable, list(map(to_table_item, rows)))
+
+
+def import_csv(variable: Variable|str, csv_file: str|os.PathLike|TextIO, skip_header: bool=False, **reader_options) -> TableBlocks:
+    """
+    Creates the set_var blocks that store a CSV table in a variable.
+    Cells that contain numbers are stored as numbers.
+
+    :param Variable|str variable: The variable to store the table in.
+    :param str|PathLike|TextIO csv_file: The path of the CSV file, or an open file.
+    :param bool skip_header: If True, the first row is not imported.
+    :param reader_options: Extra options for `csv.reader`.
+    :return: The blocks, which are created when they are iterated over.
+    """
+    if isinstance(csv_file, (str, os.PathLike)):
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            return import_csv(variable, f, skip_header, **reader_options)
+
+    rows: Iterable[list[str]] = csv.reader(csv_file, **reader_options)
+    if skip_header:
+        next(rows, None)
+    table = [[Number(parse_number_cell(c)) if is_number(c) else String(c) for c in r] for r in rows if r]
+    if table and len(table[0]) == 1:
+        table = [r[0] for r in table]
+    return import_table(variable, table)
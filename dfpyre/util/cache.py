@@ -0,0 +1,171 @@
+"""
+Helpers for pyre's on-disk cache directory.
+"""
+
+import os
+import sys
+import hashlib
+import tempfile
+
+
+CACHE_DIR_ENV = 'DFPYRE_CACHE_DIR'
+NO_CACHE_ENV = 'DFPYRE_NO_CACHE'
+
+BUILD_CACHE_DIR_NAME = 'builds'
+BUILD_CACHE_SUFFIX = '.dft'
+DEFAULT_BUILD_CACHE_SIZE = 64 * 1024 * 1024
+
+
+def cache_enabled() -> bool:
+    return not os.environ.get(NO_CACHE_ENV)
+
+
+def get_cache_dir() -> str:
+    """
+    Returns the directory that pyre should store cached data in.
+    Can be overridden with the `DFPYRE_CACHE_DIR` environment variable.
+    """
+    override_dir = os.environ.get(CACHE_DIR_ENV)
+    if override_dir:
+        return override_dir
+
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~/AppData/Local')
+    elif sys.platform == 'darwin':
+        base_dir = os.path.expanduser('~/Library/Caches')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base_dir, 'dfpyre')
+
+
+def hash_files(*paths: str) -> str:
+    """
+    Returns a hex digest of the combined contents of `paths`.
+    """
+    file_hash = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            file_hash.update(f.read())
+    return file_hash.hexdigest()
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Writes `data` to `path` without leaving a partially written file behind
+    if another process reads it at the same time.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class BuildCache:
+    """
+    An on-disk cache of built template codes, keyed by template structure hash.
+
+    Each entry is stored in its own file, and reading an entry marks it as recently used.
+    When the total size of the entries goes over `max_size`, the least recently used ones are removed.
+    """
+    def __init__(self, cache_dir: str|None=None, max_size: int=DEFAULT_BUILD_CACHE_SIZE):
+        """
+        :param str|None cache_dir: The directory to store entries in. Defaults to a `builds` directory in pyre's cache directory.
+        :param int max_size: The maximum total size of the entries in bytes.
+        """
+        self.cache_dir = cache_dir or os.path.join(get_cache_dir(), BUILD_CACHE_DIR_NAME)
+        self.max_size = max_size
+        self._size = None  # Total size of the entries, counted when it is first needed
+
+
+    def __repr__(self) -> str:
+        return f'BuildCache(cache_dir: "{self.cache_dir}", max_size: {self.max_size})'
+
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}{BUILD_CACHE_SUFFIX}')
+
+
+    def _list_entries(self) -> list[os.DirEntry]:
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return [e for e in entries if e.name.endswith(BUILD_CACHE_SUFFIX) and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+
+    def get(self, key: str) -> str|None:
+        """
+        Returns the template code stored for `key`, or None if there is none.
+
+        :param str key: The key of the entry.
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, encoding='utf-8') as f:
+                template_code = f.read()
+            os.utime(entry_path)
+        except OSError:
+            return None
+        return template_code
+
+
+    def put(self, key: str, template_code: str):
+        """
+        Stores a template code for `key`, then removes the least recently used entries if the cache is too large.
+
+        :param str key: The key of the entry.
+        :param str template_code: The template code to store.
+        """
+        data = template_code.encode('utf-8')
+        if len(data) > self.max_size:
+            return
+
+        if self._size is None:
+            self._size = sum(e.stat().st_size for e in self._list_entries())
+        entry_path = self._get_entry_path(key)
+        try:
+            # An entry that is replaced no longer counts towards the size
+            self._size -= os.stat(entry_path).st_size
+        except FileNotFoundError:
+            pass
+        write_atomic(entry_path, data)
+        self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits in `max_size`.
+        """
+        entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in self._list_entries()]
+        entries.sort()
+        size = sum(s for _, s, _ in entries)
+        for _, entry_size, entry_path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue  # Already removed by another process
+            size -= entry_size
+        self._size = size
+
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        for entry in self._list_entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self._size = 0
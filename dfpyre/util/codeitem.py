@@ -3,6 +3,7 @@ from typing import Any
 
 
 class CodeItem(ABC):
+    __slots__ = ('slot',)
     type = '_codeitem'
 
     def __init__(self, slot: int|None):
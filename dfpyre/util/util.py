@@ -1,9 +1,11 @@
 import base64
+import codecs
 import gzip
+import zlib
 import re
 import warnings
 from functools import wraps
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 import keyword
 
 
@@ -14,6 +16,13 @@ COL_ERROR = '\x1b[31m'
 
 NUMBER_REGEX = re.compile(r'^-?\d*\.?\d+$')
 
+COMPRESSION_FAST = 1
+COMPRESSION_MAX = 9
+DEFAULT_COMPRESSION_LEVEL = COMPRESSION_MAX
+
+DECODE_CHUNK_SIZE = 64 * 1024
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 class PyreException(Exception):
     pass
@@ -41,11 +50,75 @@ def is_number(s: str) -> bool:
     return bool(NUMBER_REGEX.match(s))
 
 
-def df_encode(json_string: str) -> str:
+def _stdlib_gzip_compress(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level)
+
+
+def _zlib_ng_gzip_compress(data: bytes, level: int) -> bytes:
+    return gzip_ng.compress(data, compresslevel=level)
+
+
+def _isal_gzip_compress(data: bytes, level: int) -> bytes:
+    # isal only supports levels 0-3, so levels 1-9 are spread over them
+    return igzip.compress(data, compresslevel=(level*4 - 1) // 9)
+
+
+GZIP_BACKENDS = {'gzip': _stdlib_gzip_compress}
+
+try:
+    from zlib_ng import gzip_ng
+    GZIP_BACKENDS['zlib-ng'] = _zlib_ng_gzip_compress
+except ImportError:
+    pass
+
+try:
+    from isal import igzip
+    GZIP_BACKENDS['isal'] = _isal_gzip_compress
+except ImportError:
+    pass
+
+# The standard library is used unless a faster backend is chosen, so installing one doesn't change any template codes
+DEFAULT_GZIP_BACKEND = 'gzip'
+
+# The backend that `df_encode` uses when none is given
+_gzip_backend = DEFAULT_GZIP_BACKEND
+
+
+def set_gzip_backend(backend: str):
+    """
+    Sets the gzip implementation that template codes are compressed with.
+    `gzip` from the standard library is used by default.
+
+    :param str backend: `gzip`, or `zlib-ng` or `isal` if they are installed.
+    """
+    global _gzip_backend
+    if backend not in GZIP_BACKENDS:
+        raise PyreException(f'Gzip backend "{backend}" is not available. Available backends: {", ".join(GZIP_BACKENDS)}')
+    _gzip_backend = backend
+
+
+def get_gzip_backend() -> str:
+    """
+    Returns the gzip implementation that template codes are compressed with.
+    """
+    return _gzip_backend
+
+
+def df_encode(json_string: str, compression_level: int=DEFAULT_COMPRESSION_LEVEL, backend: str|None=None) -> str:
     """
     Encodes a stringified json.
+
+    :param int compression_level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+    :param str|None backend: The gzip implementation to use (`gzip`, `zlib-ng`, or `isal` if installed). Defaults to the one set with `set_gzip_backend`.
     """
-    encoded_string = gzip.compress(json_string.encode('utf-8'))
+    if not COMPRESSION_FAST <= compression_level <= COMPRESSION_MAX:
+        raise PyreException(f'Compression level must be between {COMPRESSION_FAST} and {COMPRESSION_MAX}, got {compression_level}.')
+    if backend is None:
+        backend = _gzip_backend
+    elif backend not in GZIP_BACKENDS:
+        raise PyreException(f'Gzip backend "{backend}" is not available. Available backends: {", ".join(GZIP_BACKENDS)}')
+    
+    encoded_string = GZIP_BACKENDS[backend](json_string.encode('utf-8'), compression_level)
     return base64.b64encode(encoded_string).decode('utf-8')
 
 
@@ -53,15 +126,60 @@ def df_decode(encoded_string: str) -> str:
     return gzip.decompress(base64.b64decode(encoded_string.encode('utf-8'))).decode('utf-8')
 
 
+def df_decode_chunks(encoded_string: str, chunk_size: int=DECODE_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Decodes an encoded string incrementally, yielding the decoded text in chunks.
+    """
+    chunk_size -= chunk_size % 4  # base64 must be decoded in groups of 4 characters
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    for i in range(0, len(encoded_string), chunk_size):
+        compressed_chunk = base64.b64decode(encoded_string[i:i+chunk_size])
+        decoded_chunk = text_decoder.decode(decompressor.decompress(compressed_chunk))
+        if decoded_chunk:
+            yield decoded_chunk
+    
+    decoded_chunk = text_decoder.decode(decompressor.flush(), final=True)
+    if decoded_chunk:
+        yield decoded_chunk
+
+
+# Whether values of each type are flattened, cached since checking against `Iterable` is slow
+_NESTED_TYPES: dict[type, bool] = {str: False, bytes: False}
+
+
+def _is_nested(item) -> bool:
+    item_type = type(item)
+    is_nested = _NESTED_TYPES.get(item_type)
+    if is_nested is None:
+        is_nested = _NESTED_TYPES[item_type] = issubclass(item_type, Iterable) and not issubclass(item_type, (str, bytes))
+    return is_nested
+
+
 def flatten(nested_iterable):
     """
     Flattens a nested iterable.
     """
-    for item in nested_iterable:
-        if isinstance(item, Iterable) and not isinstance(item, (str, bytes)):
-            yield from flatten(item)
-        else:
+    iterators = [iter(nested_iterable)]
+    while iterators:
+        for item in iterators[-1]:
+            if _is_nested(item):
+                iterators.append(iter(item))
+                break
             yield item
+        else:
+            iterators.pop()
+
+
+def flatten_list(nested_iterable) -> list:
+    """
+    Flattens a nested iterable into a list.
+    Much faster than `flatten` if the iterable is already flat.
+    """
+    items = list(nested_iterable)
+    if any(map(_is_nested, items)):
+        return list(flatten(items))
+    return items
 
 
 def to_valid_identifier(s: str):
@@ -0,0 +1,46 @@
+import os
+import json
+from dfpyre.core import actiondump
+
+
+def test_actiondump_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('DFPYRE_CACHE_DIR', str(tmp_path))
+    monkeypatch.delenv('DFPYRE_NO_CACHE', raising=False)
+
+    parsed = actiondump.load_actiondump()
+    cache_path = actiondump.get_actiondump_cache_path()
+    assert os.path.isfile(cache_path), 'Actiondump cache was not written.'
+
+    def fail_parse():
+        raise AssertionError('Actiondump was parsed instead of loaded from the cache.')
+    monkeypatch.setattr(actiondump, 'parse_actiondump', fail_parse)
+    cached = actiondump.load_actiondump()
+    assert cached.action_data == parsed.action_data
+    assert cached.game_values == parsed.game_values
+
+
+def test_actiondump_stale_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('DFPYRE_CACHE_DIR', str(tmp_path))
+    monkeypatch.delenv('DFPYRE_NO_CACHE', raising=False)
+    old_format_path = tmp_path / os.path.basename(actiondump.get_actiondump_cache_path(0))
+    old_format_path.write_bytes(b'not a pickle')
+    # Caches of other actiondumps may belong to other versions of pyre
+    other_paths = [tmp_path / 'actiondump-v0-other.pickle', tmp_path / f'actiondump-v{actiondump.ACTIONDUMP_CACHE_VERSION}-other.pickle']
+    for other_path in other_paths:
+        other_path.write_bytes(b'not a pickle')
+
+    actiondump.load_actiondump()
+    assert not old_format_path.exists(), 'Old actiondump cache was not removed.'
+    assert all(p.exists() for p in other_paths), 'Actiondump cache of another version was removed.'
+
+
+def test_action_data_lazy_loading():
+    with open(actiondump.ACTIONDUMP_PATH, 'r', encoding='utf-8') as f:
+        raw_actions = json.loads(f.read())['actions']
+    action_data = actiondump.parse_action_data(raw_actions)
+
+    assert 'player_action' in action_data
+    assert not action_data._loaded, 'Action data was parsed before being accessed.'
+
+    assert 'SendMessage' in action_data['player_action']
+    assert list(action_data._loaded) == ['player_action']
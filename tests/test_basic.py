@@ -1,3 +1,4 @@
+import io
 from dfpyre import *
 
 
@@ -28,6 +29,22 @@ def test_scriptgen():
     assert t.generate_script()
 
 
+def test_scriptgen_stream():
+    t = DFTemplate.from_code(TEMPLATE_CODE)
+    stream = io.StringIO()
+    assert t.generate_script(stream=stream, build_and_send=True) is None
+    assert stream.getvalue() == t.generate_script(build_and_send=True)
+
+
+def test_scriptgen_item_subclass():
+    class Score(Number):
+        pass
+
+    t = PlayerEvent.Join([PlayerAction.SendMessage([Score(5), String('hi')])])
+    script = t.generate_script(literal_shorthand=False)
+    assert "SendMessage(Score(5), String('hi'))" in script
+
+
 def test_all_codeblocks():
     PlayerEvent.Join([
         PlayerAction.SendMessage('test'),
@@ -0,0 +1,133 @@
+import sys
+from dfpyre import *
+from dfpyre.build import build_scripts, find_scripts, load_manifest, main, run_script
+from dfpyre.util.util import df_decode
+
+
+def write_scripts(scripts_dir):
+    (scripts_dir / 'sub').mkdir(parents=True)
+    (scripts_dir / 'sent.py').write_text(
+        'from dfpyre import *\n'
+        'PlayerEvent.Join([PlayerAction.SendMessage("hi")]).build_and_send()\n'
+    )
+    (scripts_dir / 'sub' / '_helper.py').write_text('MESSAGE = "helper"\n')
+    (scripts_dir / 'sub' / 'stored.py').write_text(
+        'from dfpyre import *\n'
+        'from _helper import MESSAGE\n'
+        'templates = [Function(f"f{i}", codeblocks=[PlayerAction.SendMessage(MESSAGE)]) for i in range(2)]\n'
+    )
+    (scripts_dir / 'broken.py').write_text('raise ValueError("broken script")\n')
+
+
+def test_find_scripts(tmp_path):
+    write_scripts(tmp_path)
+    assert find_scripts(str(tmp_path)) == ['broken.py', 'sent.py', 'sub/stored.py']
+
+
+def test_build_scripts(tmp_path):
+    write_scripts(tmp_path)
+    results = {r.script: r for r in build_scripts(str(tmp_path), workers=1)}
+
+    assert 'ValueError: broken script' in results['broken.py'].error
+    assert [t['name'] for t in results['sub/stored.py'].templates] == ['f0', 'f1']
+    sent_template = results['sent.py'].templates[0]
+    assert sent_template['name'] == 'event_Join'
+    assert df_decode(sent_template['code']) == df_decode(PlayerEvent.Join([PlayerAction.SendMessage('hi')]).build())
+
+
+def test_build_scripts_captures_sends(tmp_path):
+    (tmp_path / 'connection.py').write_text(
+        'import asyncio\n'
+        'from dfpyre import *\n'
+        'from dfpyre.core.codeclient import AsyncCodeClientConnection\n'
+        'templates = [Function(f"f{i}", codeblocks=[PlayerAction.SendMessage("hi")]) for i in range(5)]\n'
+        'with CodeClientConnection() as connection:\n'
+        '    connection.send_template(templates[0])\n'
+        '    connection.send_many(templates[1:3])\n'
+        'templates[3].generate_template_item().send_to_minecraft()\n'
+        'Item("stone").send_to_minecraft()\n'
+        'async def send():\n'
+        '    async with AsyncCodeClientConnection() as connection:\n'
+        '        await connection.send_many(templates[4:])\n'
+        'asyncio.run(send())\n'
+        'del templates\n'
+    )
+    result = next(build_scripts(str(tmp_path), workers=1))
+    assert result.ok
+    assert [t['name'] for t in result.templates] == ['f0', 'f1', 'f2', 'f3', 'f4']
+
+
+def test_build_scripts_crashed_worker(tmp_path):
+    write_scripts(tmp_path)
+    (tmp_path / 'crash.py').write_text('import os\nos._exit(1)\n')
+    manifest_path = str(tmp_path / 'templates.json')
+    assert main([str(tmp_path), '-m', manifest_path, '-j', '2']) == 1
+    assert 'BrokenProcessPool' in load_manifest(manifest_path)['scripts']['crash.py']['error']
+
+
+def test_build_scripts_isolated(tmp_path):
+    (tmp_path / 'changes.py').write_text(
+        'from dfpyre import *\n'
+        'set_string_conversion(Text)\n'
+        'DFTemplate.get_template_name = lambda self: "patched"\n'
+        't = Function("changed", codeblocks=[PlayerAction.SendMessage("hi")])\n'
+    )
+    (tmp_path / 'reads.py').write_text(
+        'from dfpyre import *\n'
+        't = Function("unchanged", codeblocks=[PlayerAction.SendMessage("hi")])\n'
+    )
+    results = {r.script: r for r in build_scripts(str(tmp_path), workers=1)}
+
+    # Settings and monkeypatches only apply to the script that made them
+    assert results['changes.py'].templates[0]['name'] == 'patched'
+    unchanged_template = results['reads.py'].templates[0]
+    assert unchanged_template['name'] == 'unchanged'
+    assert df_decode(unchanged_template['code']) == df_decode(Function('unchanged', codeblocks=[PlayerAction.SendMessage('hi')]).build())
+    assert get_string_conversion() is String
+
+
+def test_run_script_unloads_helpers(tmp_path):
+    site_packages = tmp_path / '.venv' / 'lib' / 'site-packages'
+    site_packages.mkdir(parents=True)
+    (site_packages / 'venv_package.py').write_text('VALUE = 1\n')
+    (tmp_path / '_run_helper.py').write_text('VALUE = 2\n')
+    (tmp_path / '_loaded_helper.py').write_text('VALUE = 3\n')
+    (tmp_path / 'script.py').write_text(
+        'import sys\n'
+        f'sys.path.insert(0, {str(site_packages)!r})\n'
+        'import venv_package, _run_helper, _loaded_helper\n'
+        'import dfpyre.tool.diff\n'
+    )
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        import _loaded_helper
+        run_script(str(tmp_path / 'script.py'))
+        # Only the helpers the script imported itself are unloaded
+        assert '_run_helper' not in sys.modules
+        assert '_loaded_helper' in sys.modules and 'venv_package' in sys.modules
+        assert 'dfpyre' in sys.modules and 'dfpyre.tool.diff' in sys.modules
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module_name in ['venv_package', '_loaded_helper']:
+            sys.modules.pop(module_name, None)
+
+
+def test_build_incremental(tmp_path, capsys):
+    scripts_dir = tmp_path / 'scripts'
+    manifest_path = str(tmp_path / 'templates.json')
+    write_scripts(scripts_dir)
+
+    for workers in ['1', '2']:
+        assert main([str(scripts_dir), '-m', manifest_path, '-j', workers, '--force']) == 1
+        manifest = load_manifest(manifest_path)
+        assert len(manifest['scripts']['sub/stored.py']['templates']) == 2
+        assert 'error' in manifest['scripts']['broken.py']
+
+    capsys.readouterr()
+    (scripts_dir / 'broken.py').write_text('from dfpyre import *\nt = Function("fixed")\n')
+    assert main([str(scripts_dir), '-m', manifest_path]) == 0
+    output = capsys.readouterr().out
+    assert 'built   broken.py' in output
+    assert 'skipped sent.py' in output and 'skipped sub/stored.py' in output
+    assert load_manifest(manifest_path)['scripts']['sent.py']['templates'] == manifest['scripts']['sent.py']['templates']
@@ -0,0 +1,168 @@
+import copy
+import pickle
+import pytest
+from dfpyre import *
+from dfpyre.core.items import convert_literals
+from dfpyre.util.util import PyreException, df_decode
+
+
+def get_tag_options(built_block: dict) -> dict[str, str]:
+    items = built_block['args']['items']
+    return {i['item']['data']['tag']: i['item']['data']['option'] for i in items if i['item']['id'] == 'bl_tag'}
+
+
+def test_tags():
+    default_block = PlayerAction.SendMessage('hi').build()
+    assert get_tag_options(default_block)['Alignment Mode'] == 'Regular'
+
+    centered_block = PlayerAction.SendMessage('hi', alignment_mode='Centered').build()
+    assert get_tag_options(centered_block)['Alignment Mode'] == 'Centered'
+
+    # Building a block must not change the tags of later blocks
+    default_block['args']['items'][-1]['item']['data']['option'] = 'changed'
+    assert PlayerAction.SendMessage('hi').build() == PlayerAction.SendMessage('hi').build()
+    assert get_tag_options(PlayerAction.SendMessage('hi').build())['Alignment Mode'] == 'Regular'
+
+
+def test_invalid_tags(capsys):
+    invalid_option_block = CodeBlock.new_action('player_action', 'SendMessage', ('hi',), {'Alignment Mode': 'Sideways'})
+    assert get_tag_options(invalid_option_block.build())['Alignment Mode'] == 'Regular'
+    assert 'does not have the option "Sideways"' in capsys.readouterr().out
+
+    invalid_tag_block = CodeBlock.new_action('player_action', 'SendMessage', ('hi',), {'Not A Tag': 'True'})
+    invalid_tag_block.build()
+    assert 'Tag "Not A Tag" does not exist' in capsys.readouterr().out
+
+
+def test_build_cache():
+    block = PlayerAction.SendMessage('hi')
+    first_build = block.build_json()
+    assert block.build_json() is first_build
+
+    block.args.append(String('there'))
+    assert '"there"' in block.build_json()
+
+    block.tags['Alignment Mode'] = 'Centered'
+    assert '"Centered"' in block.build_json()
+
+    block.target = Target.ALL_PLAYERS
+    assert '"target":"AllPlayers"' in block.build_json()
+
+    block.data['action'] = 'ActionBar'
+    assert '"action":"ActionBar"' in block.build_json()
+
+    block.args = [Number(5)]
+    assert '"there"' not in block.build_json()
+
+    # Items changed in place are noticed without an invalidate
+    block.args[0].value = 7
+    assert '"name":"7"' in block.build_json()
+    location = Location(1, 2, 3)
+    block.args.append(location)
+    block.build_json()
+    location.x = 10
+    assert '"x":10,' in block.build_json()
+
+
+def test_item_build_cache():
+    assert Item('stone').get_snbt() is Item('stone').get_snbt()
+
+    sword = Item('diamond_sword')
+    block = PlayerAction.GiveItems([sword, sword, Item('stone')])
+    first_build = block.build_json()
+    assert block.build_json() is first_build
+
+    # Changes made with item methods are found without invalidating anything
+    sword.set_name('&bShop Sword')
+    assert 'Shop Sword' in block.build_json()
+    sword.set_tag('price', 5)
+    sword.set_tag('owner', 'shop')
+    assert 'hypercube:price' in block.build_json()
+    assert sword.get_tag('price') == 5.0 and sword.get_tag('owner') == 'shop' and sword.get_tag('missing') is None
+    sword.slot = 10
+    assert '"slot":10' in block.build_json()
+
+    # Changes made to the nbt directly need an invalidate
+    sword.nbt['count'] = Item('stone', 3).nbt['count']
+    block.invalidate()
+    assert 'count:3' in block.build_json()
+    assert block.build_json() == PlayerAction.GiveItems([sword, sword, Item('stone')]).build_json()
+
+    # Invalidating the item is enough, since codeblocks check the snbt of their items
+    sword.nbt['count'] = Item('stone', 4).nbt['count']
+    sword.invalidate()
+    assert 'count:4' in sword.get_snbt()
+    assert 'count:4' in block.build_json()
+    template = PlayerEvent.Join([block])
+    assert 'count:4' in df_decode(template.build())
+    sword.nbt['count'] = Item('stone', 5).nbt['count']
+    sword.invalidate()
+    assert 'count:5' in df_decode(template.build())
+
+
+def test_interned_literals():
+    first_block = PlayerAction.SendMessage(['$i value', 1, 'text'])
+    second_block = PlayerAction.SendMessage(['$i value', 1, 'text'])
+    assert all(a is b for a, b in zip(first_block.args, second_block.args))
+
+    float_block = PlayerAction.SendMessage(['$i value', 1.0, 'text'])
+    assert float_block.args[1] is not first_block.args[1]
+    assert float_block.build() != first_block.build()
+
+    assert not any(hasattr(a, '__dict__') for a in first_block.args + [Location(1, 2, 3), Vector(1, 2, 3), GameValue('Location')])
+
+
+def test_interned_literals_are_immutable():
+    block = PlayerAction.SendMessage(['hi', 5, '$i value'])
+    for arg in block.args:
+        with pytest.raises(PyreException):
+            arg.slot = 1
+    with pytest.raises(PyreException):
+        block.args[0].value = 'changed'
+    assert PlayerAction.SendMessage('hi').args[0].value == 'hi'
+
+    assert [type(a) for a in block.args] == [String, Number, Variable]
+
+    # Decoded items are never interned
+    decoded_args = DFTemplate.from_code(PlayerEvent.Join([PlayerAction.SendMessage(['hi', 5, '$i value'])]).build(), preserve_item_slots=False).codeblocks[1].args
+    decoded_args[0].value = 'changed'
+    decoded_args[1].value = 7
+    decoded_args[2].name = 'other'
+    assert [type(a) for a in decoded_args] == [String, Number, Variable]
+
+    # Copies are regular items that can be changed
+    number_copy = copy.copy(block.args[1])
+    number_copy.value = 7
+    assert type(number_copy) is Number and block.args[1].value == 5
+    assert repr(block.args[0]) == 'String("hi")'
+    assert pickle.loads(pickle.dumps(block)).build() == block.build()
+
+
+def test_normalized_args():
+    args = [String('a'), Number(1), Variable('x', 'line')]
+    normalized_block = CodeBlock.new_action('player_action', 'SendMessage', args, {}, normalized_args=True)
+    converted_block = PlayerAction.SendMessage(['a', [1, '$i x']])
+    assert normalized_block.build() == converted_block.build()
+    assert normalized_block.args == args and normalized_block.args is not args
+
+
+def test_string_conversion():
+    assert isinstance(convert_literals('text'), String)
+    assert isinstance(convert_literals('$'), String)
+    assert isinstance(convert_literals('$x name'), String)
+    variable = convert_literals('$s saved name')
+    assert isinstance(variable, Variable) and variable.scope == 'saved' and variable.name == 'saved name'
+
+    try:
+        set_string_conversion(Text)
+        assert isinstance(convert_literals('text'), Text)
+        assert isinstance(convert_literals('$i name'), Variable)
+        # Scripts are written for the default conversion, so they give the same items wherever they are run
+        script = PlayerEvent.Join([PlayerAction.SendMessage(['text', String('plain')])]).generate_script()
+        assert "Text('text')" in script and "'plain'" in script and 'String(' not in script
+    finally:
+        set_string_conversion(String)
+    assert isinstance(convert_literals('text'), String)
+
+    with pytest.raises(PyreException):
+        set_string_conversion(Number)
@@ -0,0 +1,198 @@
+import asyncio
+import base64
+import hashlib
+import re
+import socket
+import struct
+import threading
+import time
+from dfpyre import *
+from dfpyre.util.util import df_decode
+
+
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class FakeCodeClient:
+    """
+    A minimal WebSocket server that records the text messages it receives.
+    """
+
+    def __init__(self, server_frames: list[tuple[int, bytes]]=[]):
+        """
+        :param list[tuple[int, bytes]] server_frames: The opcode and payload of frames to send after the first handshake.
+        """
+        self.server = socket.create_server(('127.0.0.1', 0))
+        self.url = f'ws://127.0.0.1:{self.server.getsockname()[1]}'
+        self.server_frames = server_frames
+        self.connection_count = 0
+        self.messages: list[str] = []
+        self.pongs: list[bytes] = []
+        self.close_count = 0
+        threading.Thread(target=self.serve, daemon=True).start()
+
+
+    def serve(self):
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            self.connection_count += 1
+            threading.Thread(target=self.handle, args=(client, self.connection_count == 1), daemon=True).start()
+
+
+    def handle(self, client: socket.socket, is_first_connection: bool):
+        with client, client.makefile('rb') as stream:
+            key = ''
+            while (line := stream.readline().decode().strip()):
+                if line.lower().startswith('sec-websocket-key:'):
+                    key = line.split(':', 1)[1].strip()
+            accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+            client.sendall((
+                'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                f'Sec-WebSocket-Accept: {accept}\r\n\r\n'
+            ).encode())
+            for opcode, payload in self.server_frames if is_first_connection else []:
+                client.sendall(bytes([0x80 | opcode, len(payload)]) + payload)
+
+            while (header := stream.read(2)) and len(header) == 2:
+                opcode = header[0] & 0x0f
+                length = header[1] & 0x7f
+                if length == 126:
+                    length = struct.unpack('>H', stream.read(2))[0]
+                elif length == 127:
+                    length = struct.unpack('>Q', stream.read(8))[0]
+                mask = stream.read(4)
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(stream.read(length)))
+                if opcode == 0x8:
+                    self.close_count += 1
+                    return
+                if opcode == 0xa:
+                    self.pongs.append(payload)
+                else:
+                    self.messages.append(payload.decode())
+
+
+    def wait_for_messages(self, count: int, timeout: float=5.0) -> list[str]:
+        end_time = time.monotonic() + timeout
+        while len(self.messages) < count and time.monotonic() < end_time:
+            time.sleep(0.01)
+        return self.messages
+
+
+    def close(self):
+        self.server.shutdown(socket.SHUT_RDWR)
+        self.server.close()
+
+
+def make_template(message: str) -> DFTemplate:
+    return PlayerEvent.Join([PlayerAction.SendMessage(message)])
+
+
+def test_send_many():
+    fake_client = FakeCodeClient()
+    try:
+        with CodeClientConnection(fake_client.url) as connection:
+            assert connection.send_many([make_template(str(i)) for i in range(20)]) == 0
+            assert make_template('last').build_and_send(connection=connection) == 0
+        messages = fake_client.wait_for_messages(21)
+        assert len(messages) == 21
+        assert all(m.startswith('give ') for m in messages)
+        assert fake_client.connection_count == 1
+    finally:
+        fake_client.close()
+
+
+def test_reconnect():
+    fake_client = FakeCodeClient()
+    try:
+        connection = CodeClientConnection(fake_client.url)
+        connection.connect()
+        connection._ws.sock.shutdown(socket.SHUT_RDWR)  # Simulate a lost connection
+        assert connection.send_many([make_template('hi')]) == 0
+        connection.close()
+        assert len(fake_client.wait_for_messages(1)) == 1
+        assert fake_client.connection_count == 2
+    finally:
+        fake_client.close()
+
+
+def test_connection_refused(capsys):
+    with socket.socket() as unused_socket:
+        unused_socket.bind(('127.0.0.1', 0))
+        url = f'ws://127.0.0.1:{unused_socket.getsockname()[1]}'
+    assert CodeClientConnection(url).send_many([make_template('hi')]) == 1
+    assert 'Could not connect to CodeClient API' in capsys.readouterr().out
+
+
+def test_async_send_many():
+    fake_client = FakeCodeClient()
+
+    async def send_templates():
+        async with AsyncCodeClientConnection(fake_client.url, max_concurrency=3) as connection:
+            assert await connection.send_many([make_template(str(i)) for i in range(20)]) == 0
+            assert await make_template('last').abuild_and_send(connection=connection) == 0
+
+    try:
+        asyncio.run(send_templates())
+        messages = fake_client.wait_for_messages(21)
+        assert len(messages) == 21
+        # Codes are compared decoded, since gzip stores the time they were built at
+        expected_codes = [df_decode(make_template(str(i)).build()) for i in range(20)] + [df_decode(make_template('last').build())]
+        sent_codes = [df_decode(re.search(r'H4sI[\w+/=]+', m).group()) for m in messages]
+        assert sent_codes == expected_codes  # Sent in order
+        assert fake_client.connection_count == 1
+    finally:
+        fake_client.close()
+
+
+def test_async_reconnect():
+    fake_client = FakeCodeClient()
+
+    async def send_after_disconnect():
+        connection = AsyncCodeClientConnection(fake_client.url)
+        await connection.connect()
+        connection._ws.sock.shutdown(socket.SHUT_RDWR)  # Simulate a lost connection
+        assert await connection.send_many([make_template('hi')]) == 0
+        await connection.close()
+
+    try:
+        asyncio.run(send_after_disconnect())
+        assert len(fake_client.wait_for_messages(1)) == 1
+        assert fake_client.connection_count == 2
+    finally:
+        fake_client.close()
+
+
+def test_async_ping_and_close():
+    fake_client = FakeCodeClient([(0x9, b'ping'), (0x8, struct.pack('!H', 1000))])
+
+    async def wait_for_close():
+        connection = AsyncCodeClientConnection(fake_client.url)
+        await connection.connect()
+        for _ in range(100):
+            if not connection.connected:
+                break
+            await asyncio.sleep(0.01)
+        # The close is noticed without sending anything
+        assert not connection.connected
+        assert await connection.send_many([make_template('hi')]) == 0
+        await connection.close()
+
+    try:
+        asyncio.run(wait_for_close())
+        assert fake_client.pongs[0] == b'ping'
+        assert fake_client.close_count >= 1
+        assert fake_client.connection_count == 2
+    finally:
+        fake_client.close()
+
+
+def test_async_timeout(capsys):
+    # The server never accepts, so the handshake is never answered
+    with socket.create_server(('127.0.0.1', 0)) as silent_server:
+        url = f'ws://127.0.0.1:{silent_server.getsockname()[1]}'
+        connection = AsyncCodeClientConnection(url, timeout=0.2, max_retries=0)
+        assert asyncio.run(connection.send_many([make_template('hi')])) == 2
+    assert 'Connection failed: Timed out.' in capsys.readouterr().out
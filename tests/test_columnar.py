@@ -0,0 +1,73 @@
+import pickle
+from dfpyre import *
+from dfpyre.util.util import df_decode
+
+
+def make_template() -> DFTemplate:
+    return Function('columnar', codeblocks=[
+        SetVariable.Assign('$i value', 1),
+        PlayerAction.SendMessage(['Hello ', '$i value', Text('&aworld')], alignment_mode='Centered', target=Target.ALL_PLAYERS),
+        IfVariable.Equals('$i value', 1, codeblocks=[
+            PlayerAction.GiveItems(Item('diamond', 2)),
+            GameAction.SetBlock(Item('stone'), Location(1, 2, 3)),
+        ]),
+        Else([PlayerAction.SendMessage('else')]),
+        Repeat.Multiple('$i j', 10, codeblocks=[Control.Wait(1)]),
+        CallFunction('other'),
+        SetVariable.Assign('$i value', 1),
+    ])
+
+
+def test_columnar_build():
+    template = make_template()
+    columnar_template = template.to_columnar()
+    assert len(columnar_template) == len(template.codeblocks)
+    assert columnar_template.get_template_name() == template.get_template_name()
+    assert df_decode(columnar_template.build()) == df_decode(template.build())
+
+    # Converting back gives the same codeblocks
+    converted_template = columnar_template.to_template()
+    assert [b.build() for b in converted_template.codeblocks] == [b.build() for b in template.codeblocks]
+    assert [b.target for b in converted_template.codeblocks] == [b.target for b in template.codeblocks]
+
+
+def test_columnar_from_code():
+    template = make_template()
+    columnar_template = ColumnarTemplate.from_code(template.build())
+    assert df_decode(columnar_template.build()) == df_decode(template.build())
+
+
+def test_columnar_insert():
+    template = make_template()
+    columnar_template = template.to_columnar()
+    new_block = PlayerAction.SendMessage('inserted')
+    template.insert(new_block, 1)
+    columnar_template.insert(new_block, 1)
+    columnar_template.insert([PlayerAction.SendMessage('last')])
+    template.insert([PlayerAction.SendMessage('last')])
+    assert df_decode(columnar_template.build()) == df_decode(template.build())
+    assert columnar_template[1].build() == new_block.build()
+
+    # A list at an index is inserted without replacing any codeblocks
+    block_count = len(template.codeblocks)
+    inserted_blocks = [PlayerAction.SendMessage('a'), [PlayerAction.SendMessage('b')]]
+    template.insert(inserted_blocks, 2)
+    columnar_template.insert(inserted_blocks, 2)
+    assert len(template.codeblocks) == len(columnar_template) == block_count + 2
+    assert [b.args[0].value for b in template.codeblocks[1:4]] == ['inserted', 'a', 'b']
+    assert df_decode(columnar_template.build()) == df_decode(template.build())
+
+    # Items are shared with the template, so changing one in place is stored
+    columnar_template.append(PlayerAction.SendMessage(Location(1, 2, 3)))
+    columnar_template[-1].args[0].x = 9
+    assert columnar_template[-1].args[0].x == 9
+
+
+def test_columnar_pickle():
+    columnar_template = make_template().to_columnar()
+    unpickled_template = pickle.loads(pickle.dumps(columnar_template))
+    assert df_decode(unpickled_template.build()) == df_decode(columnar_template.build())
+
+    # Items added after unpickling must not be confused with the old items
+    unpickled_template.append(PlayerAction.SendMessage(Location(4, 5, 6)))
+    assert unpickled_template[-1].args[0].x == 4
@@ -0,0 +1,57 @@
+import io
+import json
+from dfpyre import *
+from dfpyre.decompile import iter_decompile_jobs, main
+
+
+def make_codes() -> list[str]:
+    return [
+        PlayerEvent.Join([PlayerAction.SendMessage(f'hello {i}')]).build()
+        for i in range(3)
+    ]
+
+
+def test_decompile_jobs(tmp_path):
+    codes = make_codes()
+    (tmp_path / 'codes.txt').write_text('\n'.join(codes) + '\n\n')
+    (tmp_path / 'named.jsonl').write_text('\n'.join(json.dumps({'code': c, 'name': 'join event'}) for c in codes[:2]))
+    stdin = io.StringIO(codes[0])
+
+    jobs = list(iter_decompile_jobs([str(tmp_path), '-'], stdin))
+    assert [j.name for j in jobs] == ['codes_1', 'codes_2', 'codes_3', 'join_event', 'join_event_2', 'template']
+    assert [j.template_code for j in jobs] == codes + codes[:2] + codes[:1]
+    assert jobs[1].source.endswith('codes.txt:2')
+
+
+def test_decompile_cli(tmp_path, capsys):
+    codes = make_codes()
+    input_path = tmp_path / 'codes.txt'
+    input_path.write_text('\n'.join(codes + ['not a template code', '{"name": "missing code"}']))
+    output_dir = tmp_path / 'out'
+
+    for workers in ['1', '2']:
+        assert main([str(input_path), '-o', str(output_dir), '-j', workers]) == 1
+        for i, code in enumerate(codes, 1):
+            assert (output_dir / f'codes_{i}.py').read_text() == DFTemplate.from_code(code).generate_script()
+        assert not (output_dir / 'codes_4.py').exists()
+
+        output = capsys.readouterr().out
+        assert output.count('FAILED') == 2
+        assert 'missing_code' in output and 'Missing "code" field' in output
+        assert 'Decompiled 3/5 templates' in output
+
+
+def test_decompile_unreadable_file(tmp_path, capsys):
+    codes = make_codes()
+    input_dir = tmp_path / 'codes'
+    input_dir.mkdir()
+    (input_dir / 'codes.txt').write_text(codes[0])
+    (input_dir / 'image.png').write_bytes(b'\x89PNG\r\n\x1a\n\xff\xfe')
+
+    jobs = list(iter_decompile_jobs([str(input_dir)]))
+    assert [j.name for j in jobs] == ['codes', 'image']
+    assert jobs[1].template_code is None and 'UnicodeDecodeError' in jobs[1].error
+
+    assert main([str(input_dir), '-o', str(tmp_path / 'out'), '-j', '1']) == 1
+    output = capsys.readouterr().out
+    assert 'FAILED image' in output and 'Decompiled 1/2 templates' in output
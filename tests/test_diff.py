@@ -0,0 +1,34 @@
+from dfpyre import *
+
+
+def make_template(messages: list[str]) -> DFTemplate:
+    return PlayerEvent.Join([PlayerAction.SendMessage(m) for m in messages])
+
+
+def test_diff():
+    old_template = make_template(['a', 'b', 'c', 'd', 'e'])
+    new_template = make_template(['a', 'x', 'c', 'e', 'f', 'g'])
+    template_diff = new_template.diff(old_template)
+    assert template_diff
+    assert template_diff.changed == [(2, 2)]
+    assert template_diff.removed == [4]
+    assert template_diff.inserted == [5, 6]
+
+    patched_codeblocks = template_diff.apply(old_template.codeblocks)
+    assert [b.build() for b in patched_codeblocks] == [b.build() for b in new_template.codeblocks]
+    assert patched_codeblocks[1] is old_template.codeblocks[1]
+
+
+def test_diff_template_code():
+    old_template = make_template([str(i) for i in range(1000)])
+    template_code = old_template.build()
+    assert not make_template([str(i) for i in range(1000)]).diff(template_code)
+    assert not old_template.has_changes(template_code)
+
+    new_template = make_template([str(i) for i in range(1000) if i != 500])
+    template_diff = new_template.diff(template_code)
+    assert template_diff.removed == [501] and not template_diff.inserted and not template_diff.changed
+    assert new_template.has_changes(template_code)
+    assert new_template.has_changes(old_template)
+    assert old_template.has_changes(new_template)
+    assert new_template.to_columnar().has_changes(template_code)
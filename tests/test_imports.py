@@ -0,0 +1,28 @@
+import sys
+import subprocess
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_action_classes_lazy():
+    loaded_modules = run_python(
+        'import sys, dfpyre\n'
+        'print(sorted(m for m in sys.modules if m.startswith("dfpyre.export.actions.")))'
+    )
+    assert loaded_modules == '[]', 'Action classes were imported eagerly.'
+
+    loaded_modules = run_python(
+        'import sys\n'
+        'from dfpyre import PlayerEvent, PA\n'
+        'print(sorted(m for m in sys.modules if m.startswith("dfpyre.export.actions.")))'
+    )
+    assert loaded_modules == "['dfpyre.export.actions.event', 'dfpyre.export.actions.player_action']"
+
+
+def test_action_class_aliases():
+    import dfpyre
+    assert dfpyre.PA is dfpyre.PlayerAction
+    assert dfpyre.IV is dfpyre.IfVariable
@@ -0,0 +1,200 @@
+import random
+import pytest
+from dfpyre import *
+from dfpyre.util.util import PyreException
+from dfpyre.tool.slice import GreedySlicer, get_bracket_pairs, get_template_length
+
+
+def make_nested_template() -> DFTemplate:
+    codeblocks = []
+    for i in range(40):
+        codeblocks += [
+            SetVariable.Assign(f'$i shared{i % 3}', i),
+            IfVariable.Equals(f'$i shared{i % 3}', i, codeblocks=[
+                PlayerAction.SendMessage(f'$i local{i}'),
+                Repeat.Multiple('$i count', 3, codeblocks=[Control.Wait(1)]),
+            ]),
+            Else([PlayerAction.SendMessage('else')]),
+        ]
+    return Function('nested', codeblocks=codeblocks)
+
+
+def make_random_codeblocks(rng: random.Random, depth: int=0) -> list:
+    codeblocks = []
+    for _ in range(rng.randrange(1, 6)):
+        kind = rng.randrange(5) if depth < 3 else 0
+        if kind <= 1:
+            codeblocks.append(SetVariable.Assign(f'$i var{rng.randrange(6)}', f'$i var{rng.randrange(6)}'))
+        elif kind == 2:
+            codeblocks.append(Repeat.Multiple(f'$i var{rng.randrange(6)}', 2, codeblocks=make_random_codeblocks(rng, depth+1)))
+        else:
+            codeblocks.append(IfVariable.Equals(f'$i var{rng.randrange(6)}', 1, codeblocks=make_random_codeblocks(rng, depth+1)))
+            if kind == 4:
+                codeblocks.append(Else(make_random_codeblocks(rng, depth+1)))
+    return codeblocks
+
+
+def iter_random_slices(strategy: str):
+    """
+    Yields the templates sliced by `strategy` and greedily for random nested templates that can be sliced.
+    """
+    for seed in range(100):
+        rng = random.Random(seed)
+        template = Function('random', codeblocks=make_random_codeblocks(rng))
+        target_length = rng.choice([10, 14, 20, 30])
+        greedy_templates = template.slice(target_length)
+        if all(get_template_length(t.codeblocks) <= target_length for t in greedy_templates):
+            sliced_templates = template.slice(target_length, strategy)
+            assert all(get_template_length(t.codeblocks) <= target_length for t in sliced_templates)
+            yield sliced_templates, greedy_templates
+
+
+def test_bracket_pairs():
+    template = make_nested_template()
+    bracket_pairs = get_bracket_pairs(template.codeblocks)
+    assert len(bracket_pairs) == 40 * 3
+    for open_index, close_index in bracket_pairs.items():
+        open_bracket, close_bracket = template.codeblocks[open_index], template.codeblocks[close_index]
+        assert open_bracket.data['direct'] == 'open' and close_bracket.data['direct'] == 'close'
+        assert open_bracket.data['type'] == close_bracket.data['type']
+
+
+@pytest.mark.parametrize('strategy', ['greedy', 'min_functions', 'min_parameters'])
+def test_slice(strategy: str):
+    template = make_nested_template()
+    sliced_templates = template.slice(30, strategy)
+    assert len(sliced_templates) > 1
+
+    original_blocks = {id(b) for b in template.codeblocks}
+    sliced_blocks = []
+    function_names = set()
+    for sliced_template in sliced_templates:
+        assert get_template_length(sliced_template.codeblocks) <= 30
+        for codeblock in sliced_template.codeblocks:
+            if codeblock.type in {'func', 'call_func'} and id(codeblock) not in original_blocks:
+                function_names.add(codeblock.data['data'])
+            else:
+                sliced_blocks.append(id(codeblock))
+
+    # Every codeblock ends up in exactly one template
+    assert sorted(sliced_blocks) == sorted(original_blocks)
+    assert function_names == {t.get_template_name() for t in sliced_templates[1:]}
+
+    # Line vars used outside of a sliced function are passed as parameters
+    for sliced_template in sliced_templates[1:]:
+        function_block = sliced_template.codeblocks[0]
+        parameter_names = {p.name for p in function_block.args}
+        assert not any(name.startswith('local') for name in parameter_names)
+
+
+def check_parameter_order(sliced_templates: list[DFTemplate]) -> dict[str, list[str]]:
+    """
+    Checks that the parameters of each sliced function are in order of first use,
+    and that every call passes its variables in the same order.
+    """
+    parameter_names = {t.get_template_name(): [p.name for p in t.codeblocks[0].args] for t in sliced_templates}
+    for sliced_template in sliced_templates[1:]:
+        function_parameters = parameter_names[sliced_template.get_template_name()]
+        first_uses = dict.fromkeys(a.name for b in sliced_template.codeblocks[1:] for a in b.args if isinstance(a, Variable))
+        assert function_parameters == [n for n in first_uses if n in function_parameters]
+
+    call_blocks = [b for t in sliced_templates for b in t.codeblocks if b.type == 'call_func']
+    assert call_blocks
+    for call_block in call_blocks:
+        assert [a.name for a in call_block.args] == parameter_names[call_block.data['data']]
+    return parameter_names
+
+
+@pytest.mark.parametrize('strategy', ['greedy', 'min_functions', 'min_parameters'])
+def test_slice_parameter_order(strategy: str):
+    template = Function('ordered', codeblocks=[
+        SetVariable.Assign('$i zeta', 1),
+        SetVariable.Assign('$i alpha', 2),
+        SetVariable.Assign('$i mid', 3),
+        IfVariable.Equals('$i mid', 3, codeblocks=[PlayerAction.SendMessage(['$i zeta', '$i alpha', '$i mid']) for _ in range(8)]),
+        PlayerAction.SendMessage(['$i alpha', '$i zeta', '$i mid']),
+    ])
+    parameter_names = check_parameter_order(template.slice(12, strategy))
+    assert parameter_names['ordered_1'] == ['zeta', 'alpha', 'mid']
+    check_parameter_order(make_nested_template().slice(30, strategy))
+
+
+def test_slice_too_short(capsys):
+    template = make_nested_template()
+    template.slice(6)
+    assert 'could not be sliced' in capsys.readouterr().out
+
+
+def test_slice_cut_off_brackets():
+    # Templates cut off inside a bracket used to make the slicer loop forever
+    template = make_nested_template()
+    codeblocks = template.codeblocks
+    for end_index in [1 + 13*5 + 2, 1 + 13*5 + 3, 1 + 13*5 + 6]:
+        template.codeblocks = codeblocks[:end_index]
+        with pytest.raises(PyreException):
+            template.slice(30)
+
+
+def test_slice_scaling(monkeypatch):
+    # The longest slices are at the start, so every cut used to update the slices of the whole template after it
+    push_count = 0
+    push_slice = GreedySlicer.push_slice
+    def count_push_slice(self, last_chunk):
+        nonlocal push_count
+        push_count += 1
+        push_slice(self, last_chunk)
+    monkeypatch.setattr(GreedySlicer, 'push_slice', count_push_slice)
+
+    push_counts = []
+    for size in [500, 2000]:
+        codeblocks = [SetVariable.Assign('$i value', i) for i in range(size)]
+        codeblocks += [IfVariable.Equals('$i value', i, codeblocks=[Control.Wait(1)]*3) for i in range(size // 4)]
+        push_count = 0
+        Function('scaling', codeblocks=codeblocks).slice(51)
+        push_counts.append(push_count)
+    assert push_counts[1] <= 5 * push_counts[0]
+
+
+def test_slice_min_functions():
+    template = Function('packed', codeblocks=[
+        *[SetVariable.Assign(f'$i value{i}', i) for i in range(4)],
+        IfVariable.Equals('$i value0', 0, codeblocks=[SetVariable.Assign(f'$i other{i}', i) for i in range(3)]),
+        Else([]),
+    ])
+    greedy_templates = template.slice(12)
+    planned_templates = template.slice(12, 'min_functions')
+    assert all(get_template_length(t.codeblocks) <= 12 for t in planned_templates)
+    assert len(planned_templates) < len(greedy_templates)
+
+    for planned_templates, greedy_templates in iter_random_slices('min_functions'):
+        assert len(planned_templates) <= len(greedy_templates)
+
+
+def test_slice_min_parameters():
+    template = make_nested_template()
+    parameter_counts = {}
+    for strategy in ['greedy', 'min_functions', 'min_parameters']:
+        slice_costs = DFTemplate.get_slice_costs(template.slice(30, strategy))
+        parameter_counts[strategy] = sum(c.parameter_count for c in slice_costs)
+    assert parameter_counts['min_parameters'] <= parameter_counts['min_functions']
+    assert parameter_counts['min_parameters'] <= parameter_counts['greedy']
+
+    for planned_templates, greedy_templates in iter_random_slices('min_parameters'):
+        planned_costs, greedy_costs = DFTemplate.get_slice_costs(planned_templates), DFTemplate.get_slice_costs(greedy_templates)
+        assert sum(c.parameter_count for c in planned_costs) <= sum(c.parameter_count for c in greedy_costs)
+
+
+def test_slice_costs():
+    sliced_templates = make_nested_template().slice(30, 'min_parameters')
+    slice_costs = DFTemplate.get_slice_costs(sliced_templates)
+    assert slice_costs[0].template_name == 'nested' and slice_costs[0].parameter_count == 0
+    for sliced_template, slice_cost in zip(sliced_templates, slice_costs):
+        assert slice_cost.template_name == sliced_template.get_template_name()
+        assert slice_cost.length == get_template_length(sliced_template.codeblocks)
+    for sliced_template, slice_cost in zip(sliced_templates[1:], slice_costs[1:]):
+        assert slice_cost.parameter_count == len(sliced_template.codeblocks[0].args)
+
+
+def test_slice_unknown_strategy():
+    with pytest.raises(PyreException):
+        make_nested_template().slice(30, 'fastest')
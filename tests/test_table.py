@@ -0,0 +1,76 @@
+import io
+import pytest
+from dfpyre import *
+from dfpyre.util.util import PyreException
+
+
+def get_item_count(codeblock: CodeBlock) -> int:
+    return len(codeblock.build()['args']['items'])
+
+
+@pytest.mark.parametrize('value_count', [0, 1, 26, 27, 100, 1000])
+def test_import_list(value_count: int):
+    values = [i * 0.5 for i in range(value_count)]
+    table_blocks = import_table('$g prices', values)
+    codeblocks = list(table_blocks)
+    assert len(codeblocks) == table_blocks.block_count == max(1, -(-value_count // 26))
+    assert codeblocks[0].action_name == 'CreateList'
+    assert all(b.action_name == 'AppendValue' for b in codeblocks[1:])
+    assert all(get_item_count(b) <= 27 for b in codeblocks)
+
+    imported_values = [a.value for b in codeblocks for a in b.args[1:]]
+    assert imported_values == values
+    assert all(b.args[0].name == 'prices' and b.args[0].scope == 'unsaved' for b in codeblocks)
+
+
+def test_import_dict():
+    table_blocks = import_table(Variable('lookup', 'saved'), {f'$i key{i}': i for i in range(30)})
+    codeblocks = list(table_blocks)
+    assert len(codeblocks) == table_blocks.block_count == 5
+    assert codeblocks[-1].action_name == 'CreateDict'
+    assert all(isinstance(a, String) for a in codeblocks[0].args[1:])  # Keys are not var shorthands
+
+    codeblocks = list(import_table('$i lookup', {1: 'a', 2.5: 'b', String('c'): 'c'}))
+    assert [a.value for a in codeblocks[0].args[1:]] == ['1', '2.5', 'c']
+
+    with pytest.raises(PyreException):
+        import_table('$i lookup', {(1, 2): 'a'})
+
+
+def test_import_rows():
+    table_blocks = import_table('$i coords', [(x, 64, z) for x in range(10) for z in range(10)])
+    codeblocks = list(table_blocks)
+    assert len(codeblocks) == table_blocks.block_count
+    assert [a.value for b in codeblocks[:-1] for a in b.args[1:]][:6] == [0, 64, 0, 0, 64, 1]
+
+    # The row length is stored so rows can be indexed in DiamondFire
+    row_length_block = codeblocks[-1]
+    assert row_length_block.action_name == '='
+    assert row_length_block.args[0].name == 'coords row length' and row_length_block.args[0].scope == 'line'
+    assert row_length_block.args[1].value == 3
+
+    with pytest.raises(PyreException):
+        import_table('$i coords', [(1, 2), (3,)])
+
+
+def test_import_csv():
+    csv_file = io.StringIO('name,price\napple,1.5\nbread,3\n')
+    codeblocks = list(import_csv('$i prices', csv_file, skip_header=True))
+    assert [repr(a) for a in codeblocks[0].args[1:]] == ['String("apple")', 'Number(1.5)', 'String("bread")', 'Number(3)']
+
+
+def test_import_csv_file(tmp_path):
+    csv_path = tmp_path / 'names.csv'
+    csv_path.write_text('name\ncafé\nnaïve\n', encoding='utf-8')
+    codeblocks = list(import_csv('$i names', csv_path, skip_header=True))
+    assert [a.value for a in codeblocks[0].args[1:]] == ['café', 'naïve']
+
+
+def test_table_batches():
+    table_blocks = import_table('$i values', range(5000))
+    batches = list(table_blocks.iter_batches(50))
+    assert sum(map(len, batches)) == table_blocks.block_count
+    assert all(len(b) == 50 for b in batches[:-1])
+
+    template = Function('table', codeblocks=[table_blocks])
+    assert len(template.codeblocks) == table_blocks.block_count + 1
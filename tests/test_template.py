@@ -0,0 +1,113 @@
+import os
+import gzip
+import threading
+import pytest
+from dfpyre import *
+from dfpyre.util.util import df_decode, GZIP_BACKENDS
+
+
+def test_build_many():
+    templates = [PlayerEvent.Join([PlayerAction.SendMessage(str(i))]) for i in range(20)]
+
+    unpicklable_template = Function('unpicklable', codeblocks=[PlayerAction.SendMessage(Variable('x'))])
+    unpicklable_template.codeblocks[1].args.append(threading.Lock())
+    templates.insert(5, unpicklable_template)
+
+    results = DFTemplate.build_many(templates, workers=2)
+    assert len(results) == len(templates)
+    assert [i for i, r in enumerate(results) if not r.ok] == [5]
+    for template, result in zip(templates, results):
+        if result.ok:
+            # The gzip header has a timestamp, so only the decoded code is compared
+            assert df_decode(result.template_code) == df_decode(template.build())
+
+
+def test_build_many_serial():
+    templates = [PlayerEvent.Join([PlayerAction.SendMessage('hi')]), DFTemplate([])]
+    results = DFTemplate.build_many(templates, workers=1)
+    assert results[0].ok
+    assert isinstance(results[1].error, IndexError)
+
+
+def test_iter_blocks():
+    template = PlayerEvent.Join([
+        PlayerAction.SendMessage(f'message {i}', Item('stone'), Location(i, 0, 0)) for i in range(2000)
+    ])
+    template_code = template.build()
+
+    decoded_blocks = list(DFTemplate.iter_blocks(template_code))
+    assert [b.build() for b in decoded_blocks] == [b.build() for b in DFTemplate.from_code(template_code).codeblocks]
+
+    first_block = next(DFTemplate.iter_blocks(template_code))
+    assert first_block.type == 'event'
+
+
+def make_hash_template(message: str='hi', item_count: int=1) -> DFTemplate:
+    return PlayerEvent.Join([
+        PlayerAction.SendMessage([message, Item('stone', item_count), Parameter('p', ParameterType.NUMBER, optional=True, default_value=5)]),
+        IfVariable.Equals('$i x', 1.0, codeblocks=[EntityAction.Heal(20, target=Target.ALL_MOBS)])
+    ])
+
+
+def test_structure_hash():
+    template = make_hash_template()
+    structure_hash = template.get_structure_hash()
+    assert structure_hash == make_hash_template().get_structure_hash()
+    template_code = template.build()
+    assert DFTemplate.from_code(template_code).get_structure_hash() == DFTemplate.from_code(template_code).get_structure_hash()
+    assert structure_hash != make_hash_template('bye').get_structure_hash()
+
+    # Items are hashed again each time, since they can be changed in place
+    template.codeblocks[1].args[1].set_count(2)
+    assert template.get_structure_hash() == make_hash_template(item_count=2).get_structure_hash()
+
+    template.codeblocks[4].target = Target.ALL_PLAYERS
+    assert template.get_structure_hash() != make_hash_template(item_count=2).get_structure_hash()
+    changed_hash = template.get_structure_hash()
+    template.codeblocks[1].args.append(Number(1))
+    assert template.get_structure_hash() != changed_hash
+
+
+def test_build_cache(tmp_path, monkeypatch):
+    build_cache = BuildCache(str(tmp_path))
+    set_build_cache(build_cache)
+    try:
+        template = make_hash_template()
+        template_code = template.build()
+        assert template.build() == template_code
+        assert make_hash_template().build() == template_code
+        assert df_decode(make_hash_template('bye').build()) != df_decode(template_code)
+        assert len(list(tmp_path.iterdir())) == 2
+
+        # Items changed in place give a new entry instead of the old code
+        template.codeblocks[1].args[2].name = 'q'
+        changed_template = make_hash_template()
+        changed_template.codeblocks[1].args[2].name = 'q'
+        changed_code = template.build()
+        assert df_decode(changed_code) != df_decode(template_code)
+        assert df_decode(changed_code) == df_decode(changed_template.build())
+
+        # Codes compressed by another gzip backend get their own entries
+        monkeypatch.setitem(GZIP_BACKENDS, 'other', lambda data, level: gzip.compress(data, level, mtime=0))
+        set_gzip_backend('other')
+        entry_count = len(list(tmp_path.iterdir()))
+        assert df_decode(template.build()) == df_decode(changed_code)
+        assert len(list(tmp_path.iterdir())) == entry_count + 1
+    finally:
+        set_gzip_backend('gzip')
+        set_build_cache(None)
+
+    # The least recently used entries are removed first
+    build_cache = BuildCache(str(tmp_path), max_size=3*len(template_code))
+    build_cache.clear()
+    for i in range(3):
+        build_cache.put(f'key{i}', template_code)
+        os.utime(tmp_path / f'key{i}.dft', (i, i))
+    build_cache.get('key0')
+    build_cache.put('key3', template_code)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['key0.dft', 'key2.dft', 'key3.dft']
+
+    # Replacing an entry does not count its old size, so it does not start an eviction
+    build_cache.evict = lambda: pytest.fail('Replacing an entry started an eviction.')
+    for _ in range(3):
+        build_cache.put('key3', template_code)
@@ -0,0 +1,37 @@
+import pytest
+from dfpyre.util.util import df_encode, df_decode, flatten, flatten_list, set_gzip_backend, get_gzip_backend, GZIP_BACKENDS, PyreException
+
+
+@pytest.mark.parametrize('backend', list(GZIP_BACKENDS))
+def test_df_encode_levels(backend):
+    json_string = '{"blocks":[' + ','.join(f'{{"id":"block","value":{i}}}' for i in range(500)) + ']}'
+    for level in (1, 6, 9):
+        assert df_decode(df_encode(json_string, level, backend)) == json_string
+
+
+def test_df_encode_invalid_level():
+    for level in (0, 10):
+        with pytest.raises(PyreException):
+            df_encode('{}', level)
+
+
+def test_gzip_backend():
+    # Faster backends are only used when chosen, even if they are installed
+    assert get_gzip_backend() == 'gzip'
+    with pytest.raises(PyreException):
+        set_gzip_backend('brotli')
+    with pytest.raises(PyreException):
+        df_encode('{}', 9, 'brotli')
+
+
+def test_flatten():
+    nested = [1, 'ab', [2, (3, [4, b'cd']), []], ((5,),), 6]
+    assert list(flatten(nested)) == [1, 'ab', 2, 3, 4, b'cd', 5, 6]
+    assert flatten_list(nested) == [1, 'ab', 2, 3, 4, b'cd', 5, 6]
+    assert flatten_list((1, 'ab', 2)) == [1, 'ab', 2]
+
+    # Deep nesting must not hit the recursion limit
+    deep = [0]
+    for i in range(1, 5000):
+        deep = [deep, i]
+    assert list(flatten(deep)) == list(range(5000))